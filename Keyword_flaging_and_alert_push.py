@@ -1,231 +1,397 @@
-import csv
-import os
-import time
-import importlib
-from datetime import datetime, timedelta
-
-def load_keywords():
-    try:
-        keywords = importlib.import_module('keywords')
-        importlib.reload(keywords)
-        print("Successfully imported clarifications, keyword categories, and street data from keywords.py")
-        return keywords.clarifications, keywords.keyword_categories, keywords.street_data
-    except ImportError:
-        print("Error: keywords.py not found or not accessible. Please ensure it's in the same directory as this script.")
-        return None, None, None
-
-def extract_timestamp_from_filename(filename):
-    """Extracts and formats the timestamp from the filename."""
-    try:
-        parts = filename.split('_')
-        date_str = parts[1]
-        time_str = parts[2][:6]  # Only take the first 6 characters for HHMMSS
-        timestamp_str = f"{date_str}_{time_str}"
-        return datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-    except (IndexError, ValueError):
-        return None
-
-def process_transcription_csv(input_file, flagged_file, annotated_file, clarifications, keyword_categories, street_data):
-    with open(input_file, 'r', newline='', encoding='utf-8') as infile, \
-         open(flagged_file, 'w', newline='', encoding='utf-8') as flagged_outfile, \
-         open(annotated_file, 'w', newline='', encoding='utf-8') as annotated_outfile:
-        
-        reader = csv.reader(infile)
-        flagged_writer = csv.writer(flagged_outfile)
-        annotated_writer = csv.writer(annotated_outfile)
-        
-        # Skip the header row
-        header = next(reader)
-        
-        # Read all rows into memory
-        all_rows = list(reader)
-        
-        for index, row in enumerate(all_rows):
-            if len(row) < 4:
-                continue
-            timestamp, file_name, transcription, model = row[:4]
-            
-            flagged_categories = set()
-            flagged_keywords = set()
-            matched_coordinates = []
-            
-            # Check for street names in transcription
-            for street_name, coordinates in street_data.items():
-                if street_name.lower() in transcription.lower():
-                    matched_coordinates.append((street_name, coordinates))
-            
-            # Check for keywords in each category
-            for category, keywords in keyword_categories.items():
-                if category.lower() == "locations":
-                    continue  # Skip the "locations" category
-                for keyword in keywords:
-                    if keyword.lower() in transcription.lower():
-                        flagged_categories.add(category)
-                        flagged_keywords.add(keyword)
-            
-            # Prepare data for flagged_data.csv
-            coordinates_str = ';'.join([f"{street}: ({lon}, {lat})" for street, (lon, lat) in matched_coordinates])
-            flagged_row = [
-                timestamp,
-                file_name,
-                ", ".join(flagged_categories) if flagged_categories else "NULL",
-                ", ".join(flagged_keywords) if flagged_keywords else "NULL",
-                transcription,
-                model,
-                coordinates_str if coordinates_str else "NULL"
-            ]
-            
-            # Write to flagged_data.csv if columns 3, 4, and 7 are not all "NULL"
-            if not (flagged_row[2] == "NULL" and flagged_row[3] == "NULL" and flagged_row[6] == "NULL"):
-                flagged_writer.writerow(flagged_row)
-            
-            # Write to annotated.csv if coordinates are found
-            if matched_coordinates:
-                # Extract the timestamp from the file name
-                file_timestamp = extract_timestamp_from_filename(file_name)
-                category = ", ".join([cat for cat in flagged_categories if cat.lower() != "locations"]) or "NULL"
-                
-                # If category is NULL, search nearby transcriptions
-                if category == "NULL":
-                    current_time = extract_timestamp_from_filename(file_name)
-                    nearby_category = search_nearby_transcriptions(all_rows, index, current_time, keyword_categories)
-                    if nearby_category:
-                        category = nearby_category
-                
-                annotated_row = [
-                    ';'.join([f"{lon}, {lat}" for _, (lon, lat) in matched_coordinates]),
-                    file_timestamp.strftime("%Y%m%d_%H%M%S") if file_timestamp else "NULL",
-                    category
-                ]
-                
-                annotated_writer.writerow(annotated_row)
-
-def search_nearby_transcriptions(all_rows, current_index, current_time, keyword_categories):
-    """Searches nearby transcriptions for categories within a 3-minute window."""
-    all_nearby_categories = set()
-    
-    for i in range(max(0, current_index - 20), min(len(all_rows), current_index + 20)):
-        if i == current_index:
-            continue
-        row = all_rows[i]
-        if len(row) < 4:
-            continue
-        _, file_name, transcription, _ = row[:4]
-        row_time = extract_timestamp_from_filename(file_name)
-        
-        if row_time and abs((row_time - current_time).total_seconds()) <= 180:  # Within 3 minutes
-            # Add all categories except "locations"
-            for category, keywords in keyword_categories.items():
-                if category.lower() == "locations":
-                    continue  # Skip the "locations" category
-                for keyword in keywords:
-                    if keyword.lower() in transcription.lower():
-                        all_nearby_categories.add(category)
-    
-    return ", ".join(all_nearby_categories) if all_nearby_categories else "NULL"
-
-def process_annotated2_data(flagged_file, annotated_file, annotated2_file, street_data):
-    """Processes flagged_data.csv to create annotated2.csv for entries with categories but no coordinates."""
-    with open(flagged_file, 'r', newline='', encoding='utf-8') as infile, \
-         open(annotated_file, 'r', newline='', encoding='utf-8') as annotated_infile, \
-         open(annotated2_file, 'w', newline='', encoding='utf-8') as annotated2_outfile:
-        
-        reader = csv.reader(infile)
-        annotated_reader = csv.reader(annotated_infile)
-        annotated2_writer = csv.writer(annotated2_outfile)
-        
-        # Read all annotated rows to track used categories
-        annotated_rows = list(annotated_reader)
-        used_categories = set(row[2] for row in annotated_rows if len(row) > 2 and row[2] != "NULL")
-        
-        # Read all flagged rows
-        all_rows = list(reader)
-        
-        for index, row in enumerate(all_rows):
-            if len(row) < 7:
-                continue
-            timestamp, file_name, categories, _, transcription, _, coordinates = row[:7]
-            
-            # Check if the row has categories but no coordinates
-            if categories != "NULL" and coordinates == "NULL":
-                category_list = categories.split(", ")
-                # Exclude rows where "locations" is the only category
-                if "locations" in category_list and len(category_list) == 1:
-                    continue
-                
-                # Check if these categories have already been used
-                if not any(cat in used_categories for cat in category_list):
-                    # Search for nearby coordinates
-                    current_time = extract_timestamp_from_filename(file_name)
-                    nearby_coordinates = search_nearby_coordinates(all_rows, index, current_time, street_data)
-                    
-                    if nearby_coordinates:
-                        # Extract the timestamp from the file name
-                        file_timestamp = extract_timestamp_from_filename(file_name)
-                        formatted_timestamp = file_timestamp.strftime("%Y%m%d_%H%M%S") if file_timestamp else "NULL"
-                        
-                        # Prepare the row for annotated2.csv
-                        annotated2_row = [
-                            formatted_timestamp,
-                            ", ".join(category_list),
-                            ", ".join(nearby_coordinates.keys()),
-                            "; ".join([f"{lon}, {lat}" for lon, lat in nearby_coordinates.values()])
-                        ]
-                        
-                        annotated2_writer.writerow(annotated2_row)
-
-
-
-def search_nearby_coordinates(all_rows, current_index, current_time, street_data):
-    """Searches nearby transcriptions for coordinates within a 3-minute window."""
-    nearby_coordinates = {}
-    
-    for i in range(max(0, current_index - 20), min(len(all_rows), current_index + 20)):
-        if i == current_index:
-            continue
-        row = all_rows[i]
-        if len(row) < 7:
-            continue
-        _, file_name, _, _, transcription, _, _ = row[:7]
-        row_time = extract_timestamp_from_filename(file_name)
-        
-        if row_time and abs((row_time - current_time).total_seconds()) <= 180:  # Within 3 minutes
-            # Check for street names in transcription
-            for street_name, coordinates in street_data.items():
-                if street_name.lower() in transcription.lower():
-                    nearby_coordinates[street_name] = coordinates
-    
-    return nearby_coordinates
-
-def countdown_timer(seconds, interval):
-    for remaining in range(seconds, 0, -interval):
-        print(f"\rNext check in {remaining} seconds...", end="")
-        time.sleep(interval)
-    print("\rChecking now... ", end="\r")
-
-def main():
-    input_directory = r"D:\Police_audio_recordings"  # Change this to your input directory
-    input_file = os.path.join(input_directory, "transcriptions.csv")
-    flagged_file = os.path.join(input_directory, "flagged_data.csv")
-    annotated_file = os.path.join(input_directory, "annotated.csv")
-    annotated2_file = os.path.join(input_directory, "annotated2.csv")
-    
-    while True:
-        clarifications, keyword_categories, street_data = load_keywords()
-        if clarifications is None or keyword_categories is None or street_data is None:
-            print("Failed to load keyword data. Exiting.")
-            break
-        
-        if os.path.exists(input_file):
-            print(f"Processing transcription file: {input_file}")
-            process_transcription_csv(input_file, flagged_file, annotated_file, clarifications, keyword_categories, street_data)
-            process_annotated2_data(flagged_file, annotated_file, annotated2_file, street_data)
-            print(f"Finished processing {input_file}")
-        else:
-            print(f"Transcription file not found: {input_file}")
-        
-        countdown_timer(1200, 5)
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-if __name__ == "__main__":
-    main()
+import argparse
+import csv
+import os
+import time
+import tempfile
+import importlib
+from collections import deque
+from itertools import islice
+from segment_store import SegmentStore
+from transcription_log import read_current_rows
+from keyword_matcher import compile_keywords, diff_keywords
+from street_geometry import GEOMETRY_FILE, IntersectionTable
+from event_store import EventStore
+from incident_clusterer import IncidentClusterer
+from recording_paths import format_clip_time
+from output_publisher import OutputPublisher
+from clip_tracing import ClipTracer, read_traces, write_latency_metrics
+from process_metrics import Metrics
+from alert_dispatch import AlertDispatcher, TailWatcher, TranscriptionTail, WebhookSink, SocketSink, FileSink, DesktopSink
+
+# Where alerts are pushed besides alerts.jsonl, see alert_dispatch.py
+ALERT_WEBHOOK_URL = None  # e.g. "http://127.0.0.1:8765/alert" for tool_kit/alert_sink_server.py
+ALERT_SOCKET_ADDRESS = None  # e.g. ("127.0.0.1", 8766)
+ALERT_DESKTOP = True
+
+NEARBY_ROWS = 20  # Rows on either side searched for categories or streets
+NEARBY_SECONDS = 180  # And only those within 3 minutes
+SCAN_CHUNK_ROWS = 2000  # Rows looked up in the scan cache at a time
+METRICS_PORT = 9103  # Serves http://127.0.0.1:9103/metrics besides metrics/flagger.prom, None for the file only
+
+def load_intersections():
+    """Loads the street intersection table if tool_kit/overpass_play.py has built one, it is optional."""
+    if not os.path.exists(GEOMETRY_FILE):
+        return None
+    try:
+        return IntersectionTable.load(GEOMETRY_FILE)
+    except (OSError, ValueError) as e:
+        print(f"Could not load street intersections from {GEOMETRY_FILE}: {e}")
+        return None
+
+def load_keywords():
+    try:
+        keywords = importlib.import_module('keywords')
+        importlib.reload(keywords)
+        print("Successfully imported clarifications, keyword categories, and street data from keywords.py")
+        return keywords.clarifications, keywords.keyword_categories, keywords.street_data
+    except ImportError:
+        print("Error: keywords.py not found or not accessible. Please ensure it's in the same directory as this script.")
+        return None, None, None
+
+def format_keyword_offsets(segment_store, file_name, keywords, compiled_keywords):
+    """Formats the second of the clip each keyword was said in as "keyword@12.4", or NULL when unknown."""
+    if segment_store is None or not keywords:
+        return "NULL"
+    offsets = segment_store.keyword_offsets(file_name, keywords, compiled_keywords.clarify)
+    return "; ".join(f"{keyword.strip()}@{offset:.1f}" for keyword, offset in offsets.items()) if offsets else "NULL"
+
+def format_categories(compiled_keywords, category_mask):
+    """Formats a category bitmask as the comma separated names, or NULL when empty."""
+    return ", ".join(compiled_keywords.categories_of(category_mask)) or "NULL"
+
+def scan_rows(records, compiled_keywords, event_store=None, stats=None):
+    """Yields each TranscriptionRow with its (category_mask, keywords, streets, units, clarified transcription) scan.
+
+    With an event store, scans cached by earlier cycles are reused. Only new transcriptions and
+    those the keyword changes since the last cycle could affect are scanned again, so an edit to
+    keywords.py doesn't rescan the whole archive. Rows are looked up in the cache SCAN_CHUNK_ROWS
+    at a time, so only one chunk of scans is held in memory.
+
+    stats, a dict, gets the number of transcriptions the matcher scanned and the seconds it took
+    added to its "scanned" and "scan_seconds" once all rows are through.
+    """
+    scanned = 0
+    scan_seconds = 0.0
+    if event_store is None:
+        for record in records:
+            if not record.valid:
+                yield record, (0, set(), [], [], "")
+                continue
+            start_time = time.perf_counter()
+            row_scan = (*compiled_keywords.scan(record.transcription), compiled_keywords.clarify(record.transcription))
+            scan_seconds += time.perf_counter() - start_time
+            scanned += 1
+            yield record, row_scan
+        if stats is not None:
+            stats["scanned"] = stats.get("scanned", 0) + scanned
+            stats["scan_seconds"] = stats.get("scan_seconds", 0.0) + scan_seconds
+        return
+    
+    keyword_diff = diff_keywords(event_store.keyword_snapshot(), compiled_keywords.snapshot)
+    if keyword_diff is None:
+        print("Scanning all transcriptions")
+        event_store.clear_scans()
+    elif keyword_diff:
+        invalidated = event_store.invalidate_scans(keyword_diff)
+        print(f"Keywords changed ({keyword_diff.summary()}), rescanning {invalidated} transcriptions")
+    
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, SCAN_CHUNK_ROWS))
+        if not chunk:
+            break
+        scans = event_store.find_scans({record.transcription for record in chunk if record.valid})
+        new_scans = []
+        for record in chunk:
+            if not record.valid:
+                continue
+            transcription = record.transcription
+            if transcription not in scans:
+                start_time = time.perf_counter()
+                category_mask, keywords, streets, units = compiled_keywords.scan(transcription)
+                scans[transcription] = (compiled_keywords.categories_of(category_mask), keywords, streets, units, compiled_keywords.clarify(transcription))
+                scan_seconds += time.perf_counter() - start_time
+                scanned += 1
+                new_scans.append((transcription, *scans[transcription], compiled_keywords.index_tokens(transcription)))
+        event_store.add_scans(new_scans)
+        for record in chunk:
+            if not record.valid:
+                yield record, (0, set(), [], [], "")
+                continue
+            categories, keywords, streets, units, clarified = scans[record.transcription]
+            yield record, (compiled_keywords.category_mask(categories), keywords, streets, units, clarified)
+    event_store.set_keyword_snapshot(compiled_keywords.snapshot)
+    if stats is not None:
+        stats["scanned"] = stats.get("scanned", 0) + scanned
+        stats["scan_seconds"] = stats.get("scan_seconds", 0.0) + scan_seconds
+
+def sliding_windows(items, before=NEARBY_ROWS, after=NEARBY_ROWS - 1):
+    """Yields (window, position) for every item, where window[position] is the item.
+
+    The window holds up to `before` items before it and `after` items after it, the rows the
+    nearby searches look at. Only that many items are held at a time, so memory stays flat however
+    long the CSV grows.
+    """
+    window = deque()
+    position = 0
+    for item in items:
+        window.append(item)
+        if len(window) - position - 1 == after:
+            yield window, position
+            position += 1
+            if position > before:
+                window.popleft()
+                position -= 1
+    while position < len(window):
+        yield window, position
+        position += 1
+
+def process_transcription_csv(input_file, flagged_file, annotated_file, annotated2_file, compiled_keywords, segment_store=None, event_store=None, incident_clusterer=None, publisher=None):
+    """Writes flagged_data.csv, annotated.csv and annotated2.csv in one streaming pass over the transcriptions.
+
+    The files are published by publisher, each atomically, with whatever else the caller writes
+    through it and under one manifest generation. Without one, they are published on their own when the pass is done. Returns the
+    pass's counts of rows, flagged, annotated and annotated2 rows and its matcher stats, see scan_rows.
+    """
+    if publisher is None:
+        with OutputPublisher(os.path.dirname(os.path.abspath(flagged_file))) as publisher:
+            return process_transcription_csv(input_file, flagged_file, annotated_file, annotated2_file, compiled_keywords, segment_store, event_store, incident_clusterer, publisher)
+    
+    flagged_writer = csv.writer(publisher.open(flagged_file))
+    annotated_writer = csv.writer(publisher.open(annotated_file))
+    annotated2_writer = csv.writer(publisher.open(annotated2_file))
+    
+    # The event store is synced along with flagged_data.csv and published in one commit at the end
+    if event_store is not None:
+        event_store.begin_sync()
+    if incident_clusterer is not None:
+        incident_clusterer.begin_pass()
+    
+    # Categories of annotated rows, a category only counts as used when an annotated row had it alone
+    used_mask = 0
+    stats = {"rows": 0, "flagged": 0, "annotated": 0, "annotated2": 0, "scanned": 0, "scan_seconds": 0.0}
+    
+    def flag_rows():
+        """Writes the flagged and annotated rows, yielding (clip start, category mask, streets) for each flagged row."""
+        nonlocal used_mask
+        # Only read rows the transcriber has committed, never a half-written last line. Provisional
+        # rows only count until the final row arrives. Each row is scanned once as it streams in,
+        # the nearby-category search then only ORs the bitmasks of the rows around it in the window
+        scanned = scan_rows(read_current_rows(input_file), compiled_keywords, event_store, stats)
+        
+        for window, position in sliding_windows(scanned):
+            record, row_scan = window[position]
+            if not record.valid:
+                continue
+            timestamp, file_name, transcription, model, clip_epoch = record[:5]
+            stats["rows"] += 1
+            
+            # Street names, units and keywords of each category, found in one pass over the transcription
+            category_mask, flagged_keywords, matched_coordinates, units, clarified_transcription = row_scan
+            
+            # Prepare data for flagged_data.csv
+            coordinates_str = ';'.join([f"{street}: ({lon}, {lat})" for street, (lon, lat) in matched_coordinates])
+            flagged_row = [
+                timestamp,
+                file_name,
+                format_categories(compiled_keywords, category_mask),
+                ", ".join(sorted(flagged_keywords)) if flagged_keywords else "NULL",
+                transcription,
+                model,
+                coordinates_str if coordinates_str else "NULL",
+                "NULL",
+                clarified_transcription
+            ]
+            
+            # Write to flagged_data.csv if columns 3, 4, and 7 are not all "NULL"
+            if not (flagged_row[2] == "NULL" and flagged_row[3] == "NULL" and flagged_row[6] == "NULL"):
+                # Only rows written with keywords need the segments looked up
+                flagged_row[7] = format_keyword_offsets(segment_store, file_name, flagged_keywords, compiled_keywords)
+                flagged_writer.writerow(flagged_row)
+                stats["flagged"] += 1
+                if event_store is not None:
+                    event_store.add_event(file_name, clip_epoch, compiled_keywords.categories_of(category_mask), flagged_keywords, transcription, model, matched_coordinates)
+                yield clip_epoch, category_mask, matched_coordinates
+            
+            if units and event_store is not None:
+                event_store.add_unit_transmission(file_name, clip_epoch, units, transcription)
+            
+            # Final rows join their incident once, a provisional row waits for the final one
+            if incident_clusterer is not None and not record.provisional:
+                incident_clusterer.add(file_name, clip_epoch, compiled_keywords.categories_of(category_mask), transcription, matched_coordinates, units)
+            
+            # Write to annotated.csv if coordinates are found
+            if matched_coordinates:
+                # If the row has no category, use the categories of nearby transcriptions
+                annotated_mask = category_mask or search_nearby_transcriptions(window, position, clip_epoch)
+                
+                annotated_row = [
+                    ';'.join([f"{lon}, {lat}" for _, (lon, lat) in matched_coordinates]),
+                    format_clip_time(clip_epoch) if clip_epoch is not None else "NULL",
+                    format_categories(compiled_keywords, annotated_mask)
+                ]
+                
+                annotated_writer.writerow(annotated_row)
+                stats["annotated"] += 1
+                if not annotated_mask & (annotated_mask - 1):
+                    used_mask |= annotated_mask
+                    
+    # annotated2.csv gets the flagged rows with categories but no streets, located by the streets
+    # of the flagged rows around them. A row whose categories turn up in annotated.csv is left out,
+    # and annotated rows further down can still use them, so the rows wait in a spool file with
+    # their category masks until the pass is done
+    with tempfile.TemporaryFile('w+', newline='', encoding='utf-8') as spool:
+        spool_writer = csv.writer(spool)
+        for window, position in sliding_windows(flag_rows()):
+            current_time, category_mask, streets = window[position]
+            
+            # Exclude rows with streets, no flagged category, such as "locations" alone, or used categories
+            if streets or not category_mask or category_mask & used_mask:
+                continue
+            
+            nearby_coordinates = search_nearby_coordinates(window, position, current_time)
+            if nearby_coordinates:
+                spool_writer.writerow([
+                    category_mask,
+                    format_clip_time(current_time),
+                    format_categories(compiled_keywords, category_mask),
+                    ", ".join(nearby_coordinates.keys()),
+                    "; ".join([f"{lon}, {lat}" for lon, lat in nearby_coordinates.values()])
+                ])
+        
+        spool.seek(0)
+        for row in csv.reader(spool):
+            if not int(row[0]) & used_mask:
+                annotated2_writer.writerow(row[1:])
+                stats["annotated2"] += 1
+    
+    if event_store is not None:
+        event_store.end_sync()
+        event_store.commit()
+    return stats
+
+def search_nearby_transcriptions(window, current_position, current_time):
+    """Returns the category bitmask of the (record, scan) rows in the window within 3 minutes. Times are clip start seconds."""
+    nearby_mask = 0
+    if current_time is None:
+        return nearby_mask
+    
+    for i, (record, row_scan) in enumerate(window):
+        if i == current_position:
+            continue
+        row_time = record.epoch
+        if row_time is not None and abs(row_time - current_time) <= NEARBY_SECONDS:
+            nearby_mask |= row_scan[0]
+    
+    return nearby_mask
+
+def search_nearby_coordinates(window, current_position, current_time):
+    """Returns the streets of the (clip start, category mask, streets) flagged rows in the window within 3 minutes."""
+    nearby_coordinates = {}
+    if current_time is None:
+        return nearby_coordinates
+    
+    for i, (row_time, _, streets) in enumerate(window):
+        if i == current_position:
+            continue
+        if row_time is not None and abs(row_time - current_time) <= NEARBY_SECONDS:
+            for street_name, coordinates in streets:
+                nearby_coordinates[street_name] = coordinates
+    
+    return nearby_coordinates
+
+def countdown_timer(seconds, interval):
+    for remaining in range(seconds, 0, -interval):
+        print(f"\rNext check in {remaining} seconds...", end="")
+        time.sleep(interval)
+    print("\rChecking now... ", end="\r")
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag keywords and streets in the transcriptions every 20 minutes.")
+    parser.add_argument("--backfill", action="store_true", help="Re-flag the whole archive once across a process pool, then exit")
+    parser.add_argument("--workers", type=int, help="Worker processes for --backfill, defaults to the CPU count")
+    args = parser.parse_args()
+    
+    input_directory = r"D:\Police_audio_recordings"  # Change this to your input directory
+    if args.backfill:
+        # Imported here so the live loop doesn't need pandas
+        from batch_flagging import backfill
+        backfill(input_directory, args.workers)
+        return
+    
+    input_file = os.path.join(input_directory, "transcriptions.csv")
+    flagged_file = os.path.join(input_directory, "flagged_data.csv")
+    annotated_file = os.path.join(input_directory, "annotated.csv")
+    annotated2_file = os.path.join(input_directory, "annotated2.csv")
+    segments_file = os.path.join(input_directory, "segments.db")
+    incidents_file = os.path.join(input_directory, "incidents.csv")
+    closed_incidents_file = os.path.join(input_directory, "incidents_closed.csv")
+    latency_file = os.path.join(input_directory, "clip_latency.prom")
+    event_store = EventStore(os.path.join(input_directory, "events.db"), migrate=True)
+    
+    sinks = [FileSink(os.path.join(input_directory, "alerts.jsonl"))]
+    if ALERT_WEBHOOK_URL:
+        sinks.append(WebhookSink(ALERT_WEBHOOK_URL))
+    if ALERT_SOCKET_ADDRESS:
+        sinks.append(SocketSink(*ALERT_SOCKET_ADDRESS))
+    if ALERT_DESKTOP:
+        sinks.append(DesktopSink())
+    alert_dispatcher = AlertDispatcher(sinks, tracer=ClipTracer(input_directory, "flagger"))
+    # Rows committed from now on are checked for alerts every few seconds on their own thread, not every 20 minutes
+    transcription_tail = TranscriptionTail(input_file)
+    tail_watcher = None
+    # Incidents build up across cycles, each cycle only adds the clips transcribed since the last one
+    incident_clusterer = IncidentClusterer(closed_incidents_file)
+    metrics = Metrics("flagger")
+    metrics.gauge_function("alerts_suppressed", lambda: alert_dispatcher.suppressed, "Alerts dropped from the rate limit backlog since the start")
+    metrics.gauge_function("alerts_waiting", lambda: len(alert_dispatcher.backlog), "Alerts waiting for the rate limit")
+    metrics.gauge_function("late_clips_attached", lambda: incident_clusterer.late_attached, "Late clips added to a closed incident since the start")
+    metrics.gauge_function("late_clips_dropped", lambda: incident_clusterer.late_dropped, "Late clips no closed incident took since the start")
+    metrics.start(input_directory, METRICS_PORT)
+    
+    while True:
+        reload_start = time.perf_counter()
+        clarifications, keyword_categories, street_data = load_keywords()
+        if clarifications is None or keyword_categories is None or street_data is None:
+            print("Failed to load keyword data. Exiting.")
+            if tail_watcher is not None:
+                tail_watcher.close()
+            alert_dispatcher.close()
+            break
+        compiled_keywords = compile_keywords(clarifications, keyword_categories, street_data, load_intersections())
+        metrics.set_gauge("keyword_reload_seconds", time.perf_counter() - reload_start, "Seconds to reload keywords.py and compile the matcher")
+        if tail_watcher is None:
+            tail_watcher = TailWatcher(transcription_tail, alert_dispatcher, compiled_keywords)
+        else:
+            tail_watcher.compiled_keywords = compiled_keywords
+        
+        if os.path.exists(input_file):
+            print(f"Processing transcription file: {input_file}")
+            segment_store = SegmentStore(segments_file) if os.path.exists(segments_file) else None
+            # The cycle's files replace the old ones once all are written, then outputs.json, see output_publisher.py
+            cycle_start = time.perf_counter()
+            with OutputPublisher(input_directory) as publisher:
+                stats = process_transcription_csv(input_file, flagged_file, annotated_file, annotated2_file, compiled_keywords, segment_store, event_store, incident_clusterer, publisher)
+                incident_clusterer.prune()
+                incident_clusterer.write_csv(publisher.open(incidents_file))
+                # Latency of each stage from capture to alert, traced by all three scripts, see clip_tracing.py
+                write_latency_metrics(publisher.open(latency_file), read_traces(input_directory))
+            if segment_store is not None:
+                segment_store.close()
+            metrics.observe("cycle_seconds", time.perf_counter() - cycle_start, "Seconds a flagging cycle took")
+            metrics.set_gauge("rows_read", stats["rows"], "Transcription rows read in the last cycle")
+            metrics.set_gauge("rows_flagged", stats["flagged"], "Rows written to flagged_data.csv in the last cycle")
+            metrics.set_gauge("rows_annotated", stats["annotated"], "Rows written to annotated.csv in the last cycle")
+            metrics.set_gauge("rows_annotated2", stats["annotated2"], "Rows written to annotated2.csv in the last cycle")
+            metrics.count("rows_scanned_total", stats["scanned"], "Transcriptions run through the matcher, cached scans not included")
+            if stats["scanned"]:
+                metrics.set_gauge("matcher_seconds_per_row", stats["scan_seconds"] / stats["scanned"], "Matcher seconds per scanned transcription in the last cycle that scanned any")
+            print(f"Finished processing {input_file}")
+        else:
+            print(f"Transcription file not found: {input_file}")
+        
+        countdown_timer(1200, 5)
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+    Pushes an alert as soon as a transcription matches a high-priority category or ten-code,
+    instead of leaving it in flagged_data.csv until someone looks. A TailWatcher thread tails the
+    committed rows of transcriptions.csv every few seconds, whatever the 20-minute flagging cycle
+    is doing, and hands each new row to an AlertDispatcher, which drops repeats inside a per-category dedup window, rate limits with a
+    token bucket and delivers to every sink on that sink's own thread, so a slow or dead sink
+    never holds up flagging or the other sinks. Alerts over the rate limit wait in a short backlog
+    until tokens come back instead of being lost.
+
+    tool_kit/alert_sink_server.py is a local HTTP stand-in for testing the webhook sink.
+"""
+import csv
+import json
+import os
+import socket
+import threading
+import time
+import urllib.request
+from collections import deque
+from queue import Queue, Empty, Full
+from keyword_matcher import tokenize
+from transcription_log import read_committed_offset, read_committed_lines, parse_transcription_row
+
+ALERT_CATEGORIES = {"suicides": 600, "overdoses": 600, "medical_emergencies": 300}  # Category -> dedup window in seconds
+ALERT_TEN_CODES = {"10-33": 120}  # Emergency traffic, ten-code -> dedup window in seconds
+ALERTS_PER_MINUTE = 6  # Token bucket refill rate shared by all alerts
+ALERT_BURST = 10  # Token bucket size
+ALERT_BACKLOG = 50  # Rate-limited alerts waiting for a token, the oldest is dropped past this
+ALERT_POLL_SECONDS = 5  # How often the TailWatcher looks for new rows
+SINK_QUEUE_SIZE = 100  # Alerts a sink may fall behind by before new ones are dropped for it
+
+class WebhookSink:
+    """POSTs each alert as JSON to a URL, retrying a few times with backoff."""
+
+    def __init__(self, url, timeout=5.0, attempts=3):
+        self.name = f"webhook {url}"
+        self.url = url
+        self.timeout = timeout
+        self.attempts = attempts
+
+    def send(self, alert):
+        body = json.dumps(alert).encode('utf-8')
+        for attempt in range(self.attempts):
+            try:
+                request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"}, method="POST")
+                with urllib.request.urlopen(request, timeout=self.timeout):
+                    return
+            except OSError:
+                if attempt == self.attempts - 1:
+                    raise
+                time.sleep(2 ** attempt)
+
+class SocketSink:
+    """Writes each alert as one line of JSON to a local TCP socket, reconnecting when the listener restarts."""
+
+    def __init__(self, host, port, timeout=5.0):
+        self.name = f"socket {host}:{port}"
+        self.address = (host, port)
+        self.timeout = timeout
+        self.connection = None
+
+    def send(self, alert):
+        line = (json.dumps(alert) + "\n").encode('utf-8')
+        try:
+            if self.connection is None:
+                self.connection = socket.create_connection(self.address, timeout=self.timeout)
+            self.connection.sendall(line)
+        except OSError:
+            if self.connection is not None:
+                self.connection.close()
+            self.connection = None
+            raise
+
+class FileSink:
+    """Appends each alert as one line of JSON to a file."""
+
+    def __init__(self, path):
+        self.name = f"file {path}"
+        self.path = path
+
+    def send(self, alert):
+        with open(self.path, 'a', encoding='utf-8') as outfile:
+            outfile.write(json.dumps(alert) + "\n")
+
+class DesktopSink:
+    """Shows each alert as a desktop notification. Needs the optional plyer package."""
+
+    def __init__(self):
+        self.name = "desktop"
+        try:
+            from plyer import notification
+            self.notification = notification
+        except ImportError:
+            print("plyer is not installed (pip install plyer), desktop alerts are printed instead")
+            self.notification = None
+
+    def send(self, alert):
+        title = f"Radio alert: {', '.join(alert['reasons'])}"
+        message = alert['transcription'].strip()[:200]
+        if self.notification is None:
+            print(f"\n{title}: {message}")
+        else:
+            self.notification.notify(title=title, message=message, timeout=15)
+
+class SinkWorker:
+    """Delivers alerts to one sink on its own thread from a bounded queue."""
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.queue = Queue(maxsize=SINK_QUEUE_SIZE)
+        self.dropped = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def offer(self, alert):
+        """Queues an alert without waiting. A sink that is this far behind loses the alert."""
+        try:
+            self.queue.put_nowait(alert)
+        except Full:
+            self.dropped += 1
+            print(f"\nAlert sink {self.sink.name} is falling behind, dropped {self.dropped} alerts so far")
+
+    def run(self):
+        while True:
+            alert = self.queue.get()
+            if alert is None:
+                break
+            try:
+                self.sink.send(alert)
+            except Exception as e:
+                print(f"\nAlert sink {self.sink.name} failed: {e}")
+
+class AlertDispatcher:
+    """Decides which rows raise an alert and fans the alerts out to the sinks."""
+
+    def __init__(self, sinks, categories=ALERT_CATEGORIES, ten_codes=ALERT_TEN_CODES,
+                 per_minute=ALERTS_PER_MINUTE, burst=ALERT_BURST, tracer=None):
+        """tracer is an optional clip_tracing.ClipTracer told when a clip's alert goes out."""
+        self.categories = categories
+        self.ten_codes = ten_codes
+        self.workers = [SinkWorker(sink) for sink in sinks]
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.tokens = float(burst)
+        self.refilled = time.monotonic()
+        self.last_sent = {}  # (reason, location) -> monotonic time of the last alert handed to the sinks
+        self.backlog = deque()  # Alerts waiting for a token, oldest first
+        self.suppressed = 0
+        self.tracer = tracer
+        self.queue = Queue()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def alert_for_row(self, record, compiled_keywords):
+        """Returns the alert for a TranscriptionRow, or None when it matches nothing high-priority."""
+        if not record.valid:
+            return None
+        timestamp, file_name, transcription, model, clip_epoch = record[:5]
+        category_mask, keywords, streets, units = compiled_keywords.scan(transcription)
+        categories = compiled_keywords.categories_of(category_mask)
+        tokens = set(tokenize(transcription))
+        reasons = [category for category in categories if category in self.categories]
+        reasons += [code for code in self.ten_codes if code in tokens]
+        if not reasons:
+            return None
+        return {
+            "timestamp": timestamp,
+            "clip_id": file_name,
+            "clip_epoch": clip_epoch,
+            "reasons": reasons,
+            "categories": categories,
+            "keywords": sorted(keywords),
+            "streets": [{"name": street.strip(), "lon": lon, "lat": lat} for street, (lon, lat) in streets],
+            "units": units,
+            "transcription": transcription,
+            "model": model,
+            "provisional": record.provisional,
+        }
+
+    def submit_row(self, record, compiled_keywords):
+        """Checks a TranscriptionRow and queues its alert. Returns immediately, delivery happens on other threads."""
+        alert = self.alert_for_row(record, compiled_keywords)
+        if alert is not None:
+            self.queue.put(alert)
+
+    def take_token(self):
+        """Takes a token from the bucket, False when alerts are coming in faster than the rate limit."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.rate)
+        self.refilled = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def fresh_reasons(self, alert):
+        """Returns the reasons of the alert not sent for the same place inside their dedup window.
+
+        A provisional row and the final row of the same clip, or a unit repeating the call, count as one.
+        """
+        now = time.monotonic()
+        location = alert["streets"][0]["name"] if alert["streets"] else ""
+        fresh = []
+        for reason in alert["reasons"]:
+            window = self.categories.get(reason, self.ten_codes.get(reason, 0))
+            sent = self.last_sent.get((reason, location))
+            if sent is None or now - sent > window:
+                fresh.append((reason, location))
+        return fresh
+
+    def is_repeat(self, alert):
+        """Returns True when every reason of the alert was already sent for the same place inside its dedup window."""
+        return not self.fresh_reasons(alert)
+
+    def send(self, alert):
+        """Hands an alert to the sinks, starting the dedup window of its fresh reasons."""
+        now = time.monotonic()
+        for key in self.fresh_reasons(alert):
+            self.last_sent[key] = now
+        for worker in self.workers:
+            worker.offer(alert)
+        if self.tracer is not None:
+            self.tracer.record(alert["clip_id"], "flag_emitted")
+
+    def send_backlog(self):
+        """Sends waiting alerts while tokens last. An alert that became a repeat while it waited is dropped."""
+        while self.backlog:
+            if self.is_repeat(self.backlog[0]):
+                self.backlog.popleft()
+                continue
+            if not self.take_token():
+                return
+            self.send(self.backlog.popleft())
+
+    def run(self):
+        while True:
+            # While alerts wait for a token, wake up when the bucket has refilled one
+            timeout = 1.0 / self.rate if self.backlog else None
+            try:
+                alert = self.queue.get(timeout=timeout)
+            except Empty:
+                alert = False
+            if alert is None:
+                break
+            if alert is not False and not self.is_repeat(alert):
+                if self.backlog or not self.take_token():
+                    if len(self.backlog) >= ALERT_BACKLOG:
+                        self.backlog.popleft()
+                        self.suppressed += 1
+                        print(f"\nAlert rate limit reached, dropped {self.suppressed} waiting alerts so far")
+                    self.backlog.append(alert)
+                else:
+                    self.send(alert)
+            self.send_backlog()
+
+    def close(self, timeout=5.0):
+        """Stops the dispatcher and gives the sinks a moment to finish what is queued."""
+        self.queue.put(None)
+        self.thread.join(timeout)
+        for worker in self.workers:
+            worker.queue.put(None)
+        for worker in self.workers:
+            worker.thread.join(timeout)
+
+class TranscriptionTail:
+    """Returns the rows committed to transcriptions.csv since the last poll."""
+
+    def __init__(self, csv_file):
+        """Starts at the current end of the CSV, rows already there are handled by the regular cycle."""
+        self.csv_file = csv_file
+        self.offset = read_committed_offset(csv_file)
+        if self.offset is None:
+            self.offset = os.path.getsize(csv_file) if os.path.exists(csv_file) else 0
+        self.identity = self.file_identity()
+
+    def file_identity(self):
+        """Returns (inode, header line) of the CSV, None when it doesn't exist. Both change when the writer swaps in a rewritten copy."""
+        try:
+            with open(self.csv_file, 'rb') as infile:
+                return os.fstat(infile.fileno()).st_ino, infile.readline()
+        except OSError:
+            return None
+
+    def reanchor(self, identity):
+        """Moves the offset onto the same row of a CSV that was swapped for a rewritten copy."""
+        if self.identity is not None:
+            if identity[1] != self.identity[1] and identity[1].endswith(b"\n"):
+                # The same rows under a longer header, see TranscriptionWriter.migrate_header
+                self.offset += len(identity[1]) - len(self.identity[1])
+            else:
+                committed = read_committed_offset(self.csv_file)
+                self.offset = committed if committed is not None else os.path.getsize(self.csv_file)
+        self.identity = identity
+
+    def poll(self):
+        """Returns the new complete rows as TranscriptionRows."""
+        identity = self.file_identity()
+        if identity is not None and identity != self.identity:
+            self.reanchor(identity)
+        if identity is None or os.path.getsize(self.csv_file) < self.offset:
+            return []
+        lines = []
+        for line in read_committed_lines(self.csv_file, self.offset):
+            if not line.endswith("\n"):
+                break  # Legacy CSV without a marker, the last line may still be being written
+            lines.append(line)
+            self.offset += len(line.encode('utf-8'))
+        return [parse_transcription_row(row) for row in csv.reader(lines) if row and row[0] != "Timestamp"]
+
+class TailWatcher:
+    """Polls a TranscriptionTail on its own thread and submits the new rows to an AlertDispatcher.
+
+    A long flagging pass, like the first scan or one after a keyword change, never holds up alerts.
+    """
+
+    def __init__(self, tail, dispatcher, compiled_keywords, interval=ALERT_POLL_SECONDS):
+        self.tail = tail
+        self.dispatcher = dispatcher
+        self.compiled_keywords = compiled_keywords  # Replaced by the flagger after each keyword reload
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                for row in self.tail.poll():
+                    self.dispatcher.submit_row(row, self.compiled_keywords)
+            except Exception as e:
+                print(f"\nCould not check new transcriptions for alerts: {e}")
+
+    def close(self):
+        self.stopped.set()
+        self.thread.join()
@@ -0,0 +1,316 @@
+"""
+    Batch mode of the flagger for backfills over a whole archive of transcriptions. Rows are loaded
+    into a pandas frame, every distinct transcription is scanned once, in chunks, and the nearby-row
+    windows are computed as shifted-array operations over the whole frame instead of a Python loop
+    per row. The flagged_data.csv, annotated.csv and annotated2.csv it writes are the same as
+    Keyword_flaging_and_alert_push.py writes for the same transcriptions.
+
+    backfill() is behind `Keyword_flaging_and_alert_push.py --backfill`. It sorts the archive by
+    clip time, splits it into days, each with 3 minutes of the neighbouring days as context so the
+    nearby windows at midnight come out the same, and flags the days across a process pool.
+
+    Run directly to flag a directory once, e.g. `python batch_flagging.py --directory D:\\Police_audio_recordings`.
+"""
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from transcription_log import read_current_rows
+from keyword_matcher import compile_keywords
+from recording_paths import format_clip_time
+from Keyword_flaging_and_alert_push import (
+    NEARBY_ROWS, NEARBY_SECONDS, format_keyword_offsets, load_keywords, load_intersections,
+)
+from segment_store import SegmentStore
+from event_store import EventStore
+from output_publisher import OutputPublisher
+
+SECONDS_PER_DAY = 86400
+
+backfill_worker = {}  # The compiled keywords and segment store of a backfill worker process
+
+def read_transcription_frame(input_file):
+    """Returns the committed transcription rows as a frame with timestamp, file, transcription, model, epoch, timed and valid columns.
+
+    epoch is the clip start in seconds where timed is set. Rows too short to flag are kept, marked
+    invalid, so the nearby windows count rows the same way the row-by-row flagger does.
+    """
+    records = list(read_current_rows(input_file))
+    return pd.DataFrame({
+        "timestamp": [record.timestamp for record in records],
+        "file": [record.clip_id for record in records],
+        "transcription": [record.transcription for record in records],
+        "model": [record.model for record in records],
+        "epoch": np.array([record.epoch or 0 for record in records], dtype=np.int64),
+        "timed": np.array([record.epoch is not None for record in records], dtype=bool),
+        "valid": np.array([record.valid for record in records], dtype=bool),
+    })
+
+def nearby_or(values, seconds, timed, window=NEARBY_ROWS, max_seconds=NEARBY_SECONDS):
+    """ORs, for every row, the values of the rows from window before to window - 1 after it that are within max_seconds.
+
+    This is the window the row-by-row search uses, computed as one shifted comparison per offset.
+    The row itself is never included and rows without a time never match.
+    """
+    nearby = np.zeros_like(values)
+    count = len(values)
+    for offset in range(-window, window):
+        if offset == 0 or abs(offset) >= count:
+            continue
+        if offset > 0:
+            rows, others = slice(0, count - offset), slice(offset, count)
+        else:
+            rows, others = slice(-offset, count), slice(0, count + offset)
+        close = timed[rows] & timed[others] & (np.abs(seconds[rows] - seconds[others]) <= max_seconds)
+        nearby[rows] |= np.where(close, values[others], 0)
+    return nearby
+
+def scan_unique(compiled_keywords, texts, chunk_size, report_progress=True):
+    """Scans each distinct transcription once. Returns the category masks, keyword sets, street lists and unit lists in texts order.
+
+    The masks are int64 up to 63 categories. Past that they are held as Python ints in an object
+    array, slower but the same results.
+    """
+    masks = np.zeros(len(texts), dtype=np.int64 if len(compiled_keywords.category_names) <= 63 else object)
+    keywords = [None] * len(texts)
+    streets = [None] * len(texts)
+    units = [None] * len(texts)
+    for chunk_start in range(0, len(texts), chunk_size):
+        for index in range(chunk_start, min(chunk_start + chunk_size, len(texts))):
+            masks[index], keywords[index], streets[index], units[index] = compiled_keywords.scan(texts[index])
+        if report_progress:
+            print(f"\rScanned {min(chunk_start + chunk_size, len(texts)):,} of {len(texts):,} distinct transcriptions", end="")
+    if report_progress:
+        print()
+    return masks, keywords, streets, units
+
+def flag_frame(frame, compiled_keywords, chunk_size=10000, segment_store=None, core=None, report_progress=True):
+    """Flags the rows of a transcription frame.
+
+    Only rows in the core (start, stop) range are flagged, the rows around it are context for the
+    nearby windows. Returns (flagged_frame, events, annotated_frame, used_mask, annotated2_candidates,
+    unit_transmissions): events holds (clip start, categories, keywords, streets) per flagged row,
+    unit_transmissions (clip_id, clip start, units, transcription) per row calling out a unit,
+    used_mask the categories annotated rows had alone, and annotated2_candidates (category_mask, annotated2_row) for flagged rows with
+    categories but no street. Whether a candidate's categories were used elsewhere can only be
+    decided over the whole archive, so that filter is left to write_batch_outputs.
+    """
+    start, stop = core if core is not None else (0, len(frame))
+    in_core = np.zeros(len(frame), dtype=bool)
+    in_core[start:stop] = True
+    codes, texts = pd.factorize(frame["transcription"])
+    unique_masks, unique_keywords, unique_streets, unique_units = scan_unique(compiled_keywords, list(texts), chunk_size, report_progress)
+    masks = unique_masks[codes]
+    unique_has_streets = np.array([bool(streets) for streets in unique_streets], dtype=bool)
+    has_streets = unique_has_streets[codes]
+    valid = frame["valid"].to_numpy()
+    timed = frame["timed"].to_numpy()
+    seconds = frame["epoch"].to_numpy()
+
+    category_strings = {}
+    def categories(mask):
+        if mask not in category_strings:
+            category_strings[mask] = ", ".join(compiled_keywords.categories_of(mask)) or "NULL"
+        return category_strings[mask]
+
+    # The output columns are formatted once per distinct transcription and then picked per row
+    unique_flagged = (unique_masks != 0) | unique_has_streets
+    def unique_column(format_unique):
+        return np.array([format_unique(index) if unique_flagged[index] else None for index in range(len(texts))], dtype=object)
+    unique_keyword_strings = unique_column(lambda index: ", ".join(sorted(unique_keywords[index])) or "NULL")
+    unique_street_strings = unique_column(lambda index: ';'.join(f"{street}: ({lon}, {lat})" for street, (lon, lat) in unique_streets[index]) or "NULL")
+    unique_coordinate_strings = unique_column(lambda index: ';'.join(f"{lon}, {lat}" for _, (lon, lat) in unique_streets[index]))
+    unique_clarified = unique_column(lambda index: compiled_keywords.clarify(texts[index]))
+
+    # flagged_data.csv, every row with a category or a street
+    all_flagged = np.flatnonzero(valid & ((masks != 0) | has_streets))
+    flagged_in_core = in_core[all_flagged]
+    flagged = all_flagged[flagged_in_core]
+    flagged_codes = codes[flagged]
+    flagged_frame = pd.DataFrame({
+        "timestamp": frame["timestamp"].to_numpy()[flagged],
+        "file": frame["file"].to_numpy()[flagged],
+        "categories": [categories(int(mask)) for mask in masks[flagged]],
+        "keywords": unique_keyword_strings[flagged_codes],
+        "transcription": frame["transcription"].to_numpy()[flagged],
+        "model": frame["model"].to_numpy()[flagged],
+        "coordinates": unique_street_strings[flagged_codes],
+        "offsets": "NULL",
+        "clarified": unique_clarified[flagged_codes],
+    })
+    if segment_store is not None:
+        flagged_frame["offsets"] = [
+            format_keyword_offsets(segment_store, file_name, unique_keywords[code], compiled_keywords)
+            for file_name, code in zip(flagged_frame["file"], flagged_codes)
+        ]
+    clip_epochs = [int(seconds[index]) if timed[index] else None for index in range(len(frame))]
+    events = [(clip_epochs[index], compiled_keywords.categories_of(int(unique_masks[code])), unique_keywords[code], unique_streets[code])
+              for index, code in zip(flagged, flagged_codes)]
+    unique_has_units = np.array([bool(units) for units in unique_units], dtype=bool)
+    unit_transmissions = [
+        (frame["file"].iat[index], clip_epochs[index], unique_units[codes[index]], frame["transcription"].iat[index])
+        for index in np.flatnonzero(valid & in_core & unique_has_units[codes])
+    ]
+
+    # annotated.csv, every row with a street, taking the categories of nearby rows when it has none
+    annotated = np.flatnonzero(valid & has_streets & in_core)
+    annotated_masks = np.where(masks != 0, masks, nearby_or(masks, seconds, timed))[annotated]
+    annotated_frame = pd.DataFrame({
+        "coordinates": unique_coordinate_strings[codes[annotated]],
+        "timestamp": [format_clip_time(int(seconds[index])) if timed[index] else "NULL" for index in annotated],
+        "categories": [categories(int(mask)) for mask in annotated_masks],
+    })
+    # As in process_transcription_csv, a category only counts as used when an annotated row had that category alone
+    single = annotated_masks[(annotated_masks != 0) & ((annotated_masks & (annotated_masks - 1)) == 0)]
+    used_mask = int(np.bitwise_or.reduce(single)) if len(single) else 0
+
+    # annotated2.csv candidates, flagged rows with categories but no street, placed at the streets of nearby flagged rows
+    flagged_masks = masks[all_flagged]
+    flagged_has_streets = has_streets[all_flagged]
+    flagged_timed = timed[all_flagged]
+    flagged_seconds = seconds[all_flagged]
+    near_streets = nearby_or(flagged_has_streets.astype(np.int64), flagged_seconds, flagged_timed) != 0
+    annotated2_candidates = []
+    for index in np.flatnonzero(flagged_in_core & (flagged_masks != 0) & ~flagged_has_streets & near_streets & flagged_timed):
+        nearby_coordinates = {}
+        for other in range(max(0, index - NEARBY_ROWS), min(len(all_flagged), index + NEARBY_ROWS)):
+            if other != index and flagged_timed[other] and abs(flagged_seconds[other] - flagged_seconds[index]) <= NEARBY_SECONDS:
+                for street_name, coordinates in unique_streets[codes[all_flagged[other]]]:
+                    nearby_coordinates[street_name] = coordinates
+        annotated2_candidates.append((int(flagged_masks[index]), [
+            format_clip_time(int(flagged_seconds[index])),
+            categories(int(flagged_masks[index])),
+            ", ".join(nearby_coordinates.keys()),
+            "; ".join([f"{lon}, {lat}" for lon, lat in nearby_coordinates.values()]),
+        ]))
+    return flagged_frame, events, annotated_frame, used_mask, annotated2_candidates, unit_transmissions
+
+def write_batch_outputs(results, flagged_file, annotated_file, annotated2_file, event_store=None):
+    """Writes the flag_frame results of consecutive partitions, in order, as one set of output files.
+
+    results may be a lazy iterator. Only the annotated2 candidates are held until the end. The
+    files replace the old ones one by one once all are written, see output_publisher.py.
+    """
+    with OutputPublisher(os.path.dirname(os.path.abspath(flagged_file))) as publisher:
+        flagged_outfile = publisher.open(flagged_file)
+        annotated_outfile = publisher.open(annotated_file)
+        annotated2_outfile = publisher.open(annotated2_file)
+        if event_store is not None:
+            event_store.begin_sync()
+        used_mask = 0
+        annotated2_candidates = []
+        for flagged_frame, events, annotated_frame, partition_used_mask, partition_candidates, unit_transmissions in results:
+            flagged_frame.to_csv(flagged_outfile, header=False, index=False, lineterminator="\r\n")
+            annotated_frame.to_csv(annotated_outfile, header=False, index=False, lineterminator="\r\n")
+            if event_store is not None:
+                for row, (clip_epoch, categories, keywords, streets) in zip(flagged_frame.itertuples(index=False), events):
+                    event_store.add_event(row.file, clip_epoch, categories, keywords, row.transcription, row.model, streets)
+                for file_name, clip_epoch, units, transcription in unit_transmissions:
+                    event_store.add_unit_transmission(file_name, clip_epoch, units, transcription)
+            used_mask |= partition_used_mask
+            annotated2_candidates.extend(partition_candidates)
+        annotated2_writer = csv.writer(annotated2_outfile)
+        for category_mask, annotated2_row in annotated2_candidates:
+            if not category_mask & used_mask:
+                annotated2_writer.writerow(annotated2_row)
+        if event_store is not None:
+            event_store.end_sync()
+            event_store.commit()
+
+def flag_transcriptions_batch(input_file, flagged_file, annotated_file, annotated2_file, compiled_keywords,
+                              segment_store=None, event_store=None, chunk_size=10000):
+    """Writes flagged_data.csv, annotated.csv and annotated2.csv for a whole transcription file at once."""
+    frame = read_transcription_frame(input_file)
+    write_batch_outputs([flag_frame(frame, compiled_keywords, chunk_size, segment_store)], flagged_file, annotated_file, annotated2_file, event_store)
+    return len(frame)
+
+def day_partitions(frame):
+    """Sorts the frame by clip time and yields a (frame, core) partition per day.
+
+    Each partition frame also holds the rows within NEARBY_SECONDS before and after its day, and
+    core is the (start, stop) range of the day's own rows in it. The row windows of the nearby
+    search never reach further than NEARBY_SECONDS, so each day is flagged as if the whole
+    archive had been. Rows whose file name has no clip time come last, as one partition.
+    """
+    timed = frame["timed"].to_numpy()
+    seconds = np.where(timed, frame["epoch"].to_numpy(), np.iinfo(np.int64).max)
+    order = np.argsort(seconds, kind="stable")
+    frame = frame.iloc[order].reset_index(drop=True)
+    seconds = seconds[order]
+    timed_count = int(timed.sum())
+    timed_seconds = seconds[:timed_count]
+    days = timed_seconds // SECONDS_PER_DAY
+    day_starts = np.flatnonzero(np.diff(days)) + 1
+    for start, stop in zip(np.concatenate(([0], day_starts)), np.concatenate((day_starts, [timed_count]))):
+        if start == stop:
+            continue
+        day_start = int(days[start]) * SECONDS_PER_DAY
+        context_start = int(np.searchsorted(timed_seconds, day_start - NEARBY_SECONDS, "left"))
+        context_stop = int(np.searchsorted(timed_seconds, day_start + SECONDS_PER_DAY + NEARBY_SECONDS, "left"))
+        yield frame.iloc[context_start:context_stop], (int(start) - context_start, int(stop) - context_start)
+    if timed_count < len(frame):
+        yield frame.iloc[timed_count:], None
+
+def init_backfill_worker(segments_file):
+    """Compiles the keywords once per worker process."""
+    clarifications, keyword_categories, street_data = load_keywords()
+    backfill_worker["compiled_keywords"] = compile_keywords(clarifications, keyword_categories, street_data, load_intersections())
+    backfill_worker["segment_store"] = SegmentStore(segments_file) if os.path.exists(segments_file) else None
+
+def flag_partition(partition):
+    frame, core = partition
+    return flag_frame(frame, backfill_worker["compiled_keywords"], segment_store=backfill_worker["segment_store"], core=core, report_progress=False)
+
+def backfill(input_directory, workers=None):
+    """Re-flags the whole archive in day partitions across a process pool, writing the rows in clip time order."""
+    input_file = os.path.join(input_directory, "transcriptions.csv")
+    segments_file = os.path.join(input_directory, "segments.db")
+    start_time = time.perf_counter()
+    frame = read_transcription_frame(input_file)
+    partitions = list(day_partitions(frame))
+    print(f"Backfilling {len(frame):,} rows in {len(partitions)} day partitions")
+    event_store = EventStore(os.path.join(input_directory, "events.db"), migrate=True)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_backfill_worker, initargs=(segments_file,)) as pool:
+        write_batch_outputs(
+            pool.map(flag_partition, partitions),
+            os.path.join(input_directory, "flagged_data.csv"),
+            os.path.join(input_directory, "annotated.csv"),
+            os.path.join(input_directory, "annotated2.csv"),
+            event_store,
+        )
+    event_store.close()
+    elapsed = time.perf_counter() - start_time
+    print(f"Backfilled {len(frame):,} rows in {elapsed:.1f} s ({len(frame) / max(elapsed, 1e-9):,.0f} rows/sec)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag a whole transcription file in one batch.")
+    parser.add_argument("--directory", default=r"D:\Police_audio_recordings")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Distinct transcriptions scanned per chunk")
+    args = parser.parse_args()
+
+    clarifications, keyword_categories, street_data = load_keywords()
+    if clarifications is None:
+        return
+    compiled_keywords = compile_keywords(clarifications, keyword_categories, street_data, load_intersections())
+    segments_file = os.path.join(args.directory, "segments.db")
+    segment_store = SegmentStore(segments_file) if os.path.exists(segments_file) else None
+    event_store = EventStore(os.path.join(args.directory, "events.db"), migrate=True)
+    start_time = time.perf_counter()
+    row_count = flag_transcriptions_batch(
+        os.path.join(args.directory, "transcriptions.csv"),
+        os.path.join(args.directory, "flagged_data.csv"),
+        os.path.join(args.directory, "annotated.csv"),
+        os.path.join(args.directory, "annotated2.csv"),
+        compiled_keywords, segment_store, event_store, args.chunk_size,
+    )
+    elapsed = time.perf_counter() - start_time
+    print(f"Flagged {row_count:,} rows in {elapsed:.1f} s ({row_count / max(elapsed, 1e-9):,.0f} rows/sec)")
+    if segment_store is not None:
+        segment_store.close()
+    event_store.close()
+
+if __name__ == "__main__":
+    main()
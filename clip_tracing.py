@@ -0,0 +1,150 @@
+"""
+    End-to-end latency tracing of clips across the recorder, the transcriber and the flagger. Each
+    process notes when a clip passes one of STAGES with a ClipTracer, which appends a
+    "clip_id,stage,unix seconds" line to that process's trace file for the day in the traces folder
+    of the recordings directory. The clip file name is the id all three scripts share.
+
+    The flagger reads the last LATENCY_DAYS of traces each cycle and publishes clip_latency.prom,
+    the p50/p95/p99 latency of every stage since the stage before it and since capture start, in
+    the Prometheus text format. `python clip_tracing.py` prints the same as a table.
+"""
+import argparse
+import csv
+import math
+import os
+import threading
+import time
+from datetime import date, timedelta
+
+# The stages a clip goes through, in order
+STAGES = [
+    "capture_start",  # Recorder heard the transmission start
+    "capture_end",  # Recorder heard the silence that ends it
+    "file_written",  # The .wav is saved
+    "transcription_start",  # Transcriber picked it from its queue
+    "transcription_end",  # Whisper finished
+    "csv_commit",  # Its final row is committed to transcriptions.csv
+    "flag_emitted",  # Its alert went out to the sinks. Only clips that raise one get here, a provisional row can get here before csv_commit
+]
+TRACE_DIRECTORY_NAME = "traces"
+LATENCY_DAYS = 2  # Days of trace files the latency report covers
+QUANTILES = (0.5, 0.95, 0.99)
+
+def trace_directory(base_directory):
+    return os.path.join(base_directory, TRACE_DIRECTORY_NAME)
+
+class ClipTracer:
+    """Appends the stages clips reach in one process to that process's trace file, one file per day."""
+
+    def __init__(self, base_directory, process_name):
+        self.directory = trace_directory(base_directory)
+        self.process_name = process_name
+        self.lock = threading.Lock()  # The transcriber traces from its worker and CSV writer threads
+        self.day = None
+        self.outfile = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def record(self, clip_id, stage, at=None):
+        """Notes that a clip reached a stage, now or at the given unix time."""
+        self.record_many([clip_id], stage, at)
+
+    def record_many(self, clip_ids, stage, at=None):
+        """Notes that several clips reached a stage at once, like a batch of rows committed together."""
+        at = time.time() if at is None else at
+        lines = "".join(f"{os.path.basename(clip_id)},{stage},{at:.3f}\n" for clip_id in clip_ids)
+        if not lines:
+            return
+        with self.lock:
+            day = time.strftime("%Y%m%d", time.localtime(at))
+            if day != self.day:
+                if self.outfile is not None:
+                    self.outfile.close()
+                self.outfile = open(os.path.join(self.directory, f"{day}_{self.process_name}.csv"), 'a', encoding='utf-8')
+                self.day = day
+            self.outfile.write(lines)
+            self.outfile.flush()
+
+    def close(self):
+        with self.lock:
+            if self.outfile is not None:
+                self.outfile.close()
+                self.outfile = None
+
+def read_traces(base_directory, days=LATENCY_DAYS):
+    """Returns {clip_id: {stage: unix seconds}} from the trace files of the last days, keeping the first time of each stage."""
+    directory = trace_directory(base_directory)
+    if not os.path.isdir(directory):
+        return {}
+    first_day = (date.today() - timedelta(days=days - 1)).strftime("%Y%m%d")
+    traces = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".csv") or filename[:8] < first_day:
+            continue
+        with open(os.path.join(directory, filename), 'r', newline='', encoding='utf-8') as infile:
+            for row in csv.reader(infile):
+                if len(row) != 3:
+                    continue  # A line cut short by a crash
+                try:
+                    at = float(row[2])
+                except ValueError:
+                    continue
+                stages = traces.setdefault(row[0], {})
+                if at < stages.get(row[1], math.inf):
+                    stages[row[1]] = at
+    return traces
+
+def percentile(sorted_values, quantile):
+    """Returns the nearest-rank percentile of an ascending list."""
+    return sorted_values[max(0, math.ceil(quantile * len(sorted_values)) - 1)]
+
+def stage_latencies(traces):
+    """Returns {stage: (seconds since the previous traced stage, seconds since capture start)} as ascending lists."""
+    latencies = {stage: ([], []) for stage in STAGES[1:]}
+    for stages in traces.values():
+        previous = stages.get(STAGES[0])
+        for stage in STAGES[1:]:
+            at = stages.get(stage)
+            if at is None:
+                continue
+            if previous is not None:
+                latencies[stage][0].append(at - previous)
+            if STAGES[0] in stages:
+                latencies[stage][1].append(at - stages[STAGES[0]])
+            previous = at
+    for step, total in latencies.values():
+        step.sort()
+        total.sort()
+    return latencies
+
+def write_latency_metrics(outfile, traces):
+    """Writes the stage latency quantiles in the Prometheus text format."""
+    latencies = stage_latencies(traces)
+    for metric, index, help_text in (
+        ("clip_stage_latency_seconds", 0, "Seconds from the previous traced stage of a clip to this one"),
+        ("clip_latency_seconds", 1, "Seconds from the start of a transmission to this stage"),
+    ):
+        outfile.write(f"# HELP {metric} {help_text}\n")
+        outfile.write(f"# TYPE {metric} summary\n")
+        for stage, values in latencies.items():
+            values = values[index]
+            for quantile in QUANTILES:
+                if values:
+                    outfile.write(f'{metric}{{stage="{stage}",quantile="{quantile}"}} {percentile(values, quantile):.3f}\n')
+            outfile.write(f'{metric}_sum{{stage="{stage}"}} {sum(values):.3f}\n')
+            outfile.write(f'{metric}_count{{stage="{stage}"}} {len(values)}\n')
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the p50/p95/p99 latency of each clip stage from the trace files.")
+    parser.add_argument("--directory", default=r"D:\Police_audio_recordings")
+    parser.add_argument("--days", type=int, default=LATENCY_DAYS, help="Days of traces to include")
+    args = parser.parse_args()
+    traces = read_traces(args.directory, args.days)
+    print(f"{len(traces)} clips traced")
+    print(f"{'stage':<20} {'clips':>6} {'p50':>8} {'p95':>8} {'p99':>8}   since capture start p50 / p95 / p99")
+    for stage, (step, total) in stage_latencies(traces).items():
+        step_text = " ".join(f"{percentile(step, q):>8.1f}" for q in QUANTILES) if step else f"{'-':>8} {'-':>8} {'-':>8}"
+        total_text = " / ".join(f"{percentile(total, q):.1f}" for q in QUANTILES) if total else "-"
+        print(f"{stage:<20} {len(step):>6} {step_text}   {total_text}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+"""
+    SQLite table of flagged events with typed columns, so questions like "all overdoses in the last
+    24 hours" are an indexed lookup instead of a scan of flagged_data.csv. Each event keeps the clip
+    start as epoch seconds, its categories as a bitmask, the matched keywords and one location row
+    per matched street with lon/lat as floats. Every transmission that calls out a unit gets a row per
+    unit in unit_transmissions, so a unit's activity over a time range is one indexed lookup.
+
+    The flagger goes over every row each cycle, but event_rows keeps a signature of what each clip
+    filed last time, so only the clips whose scan changed are deleted and inserted again, and the
+    ones that dropped out are deleted when the sync ends.
+
+    It also caches the scan of every distinct transcription along with an inverted index from
+    token to transcription, so after an edit to keywords.py the flagger only rescans the
+    transcriptions the KeywordDiff could affect.
+
+    Run directly to query it, e.g. `python event_store.py --category overdoses --hours 24` or
+    `python event_store.py --unit 214 --since "2024-03-01 02:00" --until "2024-03-01 04:00"`.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from recording_paths import wall_clock_epoch
+from transcript_index import parse_time
+
+MAX_CATEGORIES = 63  # Bits available in a SQLite INTEGER, categories past these are only in event_categories
+SCHEMA_VERSION = 1  # Bump with a step in EventStore.migrate when the tables change shape
+SCAN_LOOKUP_BATCH = 500  # Transcriptions looked up per query, under SQLite's limit on query parameters
+
+def row_signature(*values):
+    """Returns a short hash of what a clip files, to tell whether it changed since the last sync."""
+    return hashlib.sha1(json.dumps(values).encode('utf-8')).hexdigest()
+
+class EventStore:
+    """Stores flagged events and answers time and category queries over them."""
+
+    def __init__(self, db_path, migrate=False):
+        """Opens (and creates if needed) the event database.
+
+        migrate brings a database from an earlier version up to date first, which throws away
+        what the next sync rebuilds. Only the flaggers pass it, readers use the database as it is.
+        """
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        if migrate:
+            self.migrate()
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS categories (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY,
+                clip_id TEXT NOT NULL,
+                epoch INTEGER,
+                category_mask INTEGER NOT NULL,
+                keywords TEXT NOT NULL,
+                transcription TEXT NOT NULL,
+                model TEXT
+            );
+            CREATE INDEX IF NOT EXISTS events_epoch ON events(epoch);
+            CREATE INDEX IF NOT EXISTS events_clip_id ON events(clip_id);
+            CREATE TABLE IF NOT EXISTS event_categories (
+                category_id INTEGER NOT NULL,
+                epoch INTEGER,
+                event_id INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS event_categories_category_epoch ON event_categories(category_id, epoch);
+            CREATE INDEX IF NOT EXISTS event_categories_event_id ON event_categories(event_id);
+            CREATE TABLE IF NOT EXISTS event_locations (
+                event_id INTEGER NOT NULL,
+                street TEXT NOT NULL,
+                lon REAL NOT NULL,
+                lat REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS event_locations_event_id ON event_locations(event_id);
+            CREATE TABLE IF NOT EXISTS unit_transmissions (
+                unit TEXT NOT NULL COLLATE NOCASE,
+                epoch INTEGER,
+                clip_id TEXT NOT NULL,
+                transcription TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS unit_transmissions_unit_epoch ON unit_transmissions(unit, epoch);
+            CREATE INDEX IF NOT EXISTS unit_transmissions_clip_id ON unit_transmissions(clip_id);
+            CREATE TABLE IF NOT EXISTS event_rows (
+                clip_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                PRIMARY KEY (clip_id, kind)
+            ) WITHOUT ROWID;
+            CREATE TEMP TABLE IF NOT EXISTS synced_rows (
+                clip_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                PRIMARY KEY (clip_id, kind)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS scans (
+                id INTEGER PRIMARY KEY,
+                transcription TEXT NOT NULL UNIQUE,
+                categories TEXT NOT NULL,
+                keywords TEXT NOT NULL,
+                streets TEXT NOT NULL,
+                units TEXT NOT NULL,
+                clarified TEXT NOT NULL,
+                tokens TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS scan_tokens (
+                token TEXT NOT NULL,
+                scan_id INTEGER NOT NULL,
+                PRIMARY KEY (token, scan_id)
+            ) WITHOUT ROWID;
+        """)
+        self.category_ids = dict(self.connection.execute("SELECT name, id FROM categories"))
+        self.category_names_by_id = {category_id: name for name, category_id in self.category_ids.items()}
+
+    def schema_version(self, tables):
+        """Returns the schema version the flagger last migrated the database to, 0 when it never did."""
+        if "meta" not in tables:
+            return 0
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def migrate(self):
+        """Drops or empties the tables an earlier version left in a shape the flagger can't sync, in one transaction.
+
+        The version is kept in meta and only set here, so a reader opening the database in between
+        doesn't hide an outstanding migration.
+        """
+        tables = {name for (name,) in self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if self.schema_version(tables) >= SCHEMA_VERSION:
+            return
+        statements = []
+        scan_columns = [column[1] for column in self.connection.execute("PRAGMA table_info(scans)")]
+        if scan_columns and "units" not in scan_columns:
+            # Scans cached before units were extracted, the next cycle scans everything again anyway
+            statements += ["DROP TABLE IF EXISTS scan_tokens", "DROP TABLE scans"]
+        # Events filed before version 1 may lack their signatures, the next sync files them all again
+        statements += [f"DELETE FROM {table}" for table in ("unit_transmissions", "event_locations", "event_categories", "events", "event_rows") if table in tables]
+        statements += [
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+            f"INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', '{SCHEMA_VERSION}')",
+        ]
+        self.connection.executescript("BEGIN; " + "; ".join(statements) + "; COMMIT;")
+
+    def category_id(self, name):
+        """Returns the small integer id of a category, assigning the next free one to a new category."""
+        category_id = self.category_ids.get(name)
+        if category_id is None:
+            category_id = len(self.category_ids)
+            if category_id == MAX_CATEGORIES:
+                print(f"More than {MAX_CATEGORIES} categories, the rest are left out of the category bitmask")
+            self.connection.execute("INSERT INTO categories (id, name) VALUES (?, ?)", (category_id, name))
+            self.category_ids[name] = category_id
+            self.category_names_by_id[category_id] = name
+        return category_id
+
+    def category_mask(self, names):
+        """Returns the bitmask of a set of category names, leaving out categories past MAX_CATEGORIES."""
+        mask = 0
+        for name in names:
+            category_id = self.category_id(name)
+            if category_id < MAX_CATEGORIES:
+                mask |= 1 << category_id
+        return mask
+
+    def category_names(self, mask, event_id=None):
+        """Returns the category names of a bitmask in id order.
+
+        With more categories than the bitmask holds, the names of an event are read from
+        event_categories instead when its id is given.
+        """
+        if event_id is not None and len(self.category_ids) > MAX_CATEGORIES:
+            rows = self.connection.execute("SELECT category_id FROM event_categories WHERE event_id = ? ORDER BY category_id", (event_id,))
+            return [self.category_names_by_id[category_id] for (category_id,) in rows]
+        return [name for category_id, name in sorted(self.category_names_by_id.items()) if mask >> category_id & 1]
+
+    def begin_sync(self):
+        """Starts going over all rows. Readers keep seeing the old events until commit().
+
+        Every add_event and add_unit_transmission until end_sync() counts as seen, whether it
+        changed anything or not.
+        """
+        self.connection.execute("DELETE FROM synced_rows")
+
+    def sync_row(self, clip_id, kind, signature):
+        """Returns True when what a clip files under kind changed since the last sync and has to be written again.
+
+        The old rows of a changed clip are deleted. A clip seen twice in one sync keeps both rows
+        and is written again next time.
+        """
+        if self.connection.execute("INSERT OR IGNORE INTO synced_rows (clip_id, kind) VALUES (?, ?)", (clip_id, kind)).rowcount == 0:
+            self.connection.execute("UPDATE event_rows SET signature = '' WHERE clip_id = ? AND kind = ?", (clip_id, kind))
+            return True
+        row = self.connection.execute("SELECT signature FROM event_rows WHERE clip_id = ? AND kind = ?", (clip_id, kind)).fetchone()
+        if row is not None and row[0] == signature:
+            return False
+        if row is not None:
+            self.delete_rows(clip_id, kind)
+        self.connection.execute("INSERT OR REPLACE INTO event_rows (clip_id, kind, signature) VALUES (?, ?, ?)", (clip_id, kind, signature))
+        return True
+
+    def delete_rows(self, clip_id, kind):
+        """Deletes the events or unit transmissions a clip filed."""
+        if kind == "units":
+            self.connection.execute("DELETE FROM unit_transmissions WHERE clip_id = ?", (clip_id,))
+            return
+        event_ids = [(event_id,) for (event_id,) in self.connection.execute("SELECT id FROM events WHERE clip_id = ?", (clip_id,))]
+        self.connection.executemany("DELETE FROM event_categories WHERE event_id = ?", event_ids)
+        self.connection.executemany("DELETE FROM event_locations WHERE event_id = ?", event_ids)
+        self.connection.execute("DELETE FROM events WHERE clip_id = ?", (clip_id,))
+
+    def end_sync(self):
+        """Deletes what the clips not seen since begin_sync() filed. Returns how many clips that was."""
+        stale = self.connection.execute("""
+            SELECT clip_id, kind FROM event_rows
+            WHERE NOT EXISTS (SELECT 1 FROM synced_rows WHERE synced_rows.clip_id = event_rows.clip_id AND synced_rows.kind = event_rows.kind)
+        """).fetchall()
+        for clip_id, kind in stale:
+            self.delete_rows(clip_id, kind)
+        self.connection.executemany("DELETE FROM event_rows WHERE clip_id = ? AND kind = ?", stale)
+        return len(stale)
+
+    def add_event(self, clip_id, epoch, categories, keywords, transcription, model, streets):
+        """Files a flagged event, unless the clip filed the same one last sync. streets is a list of (street_name, (lon, lat))."""
+        signature = row_signature(epoch, sorted(categories), sorted(keywords), transcription, model, streets)
+        if not self.sync_row(clip_id, "event", signature):
+            return
+        cursor = self.connection.execute(
+            "INSERT INTO events (clip_id, epoch, category_mask, keywords, transcription, model) VALUES (?, ?, ?, ?, ?, ?)",
+            (clip_id, epoch, self.category_mask(categories), ", ".join(sorted(keywords)), transcription, model),
+        )
+        event_id = cursor.lastrowid
+        self.connection.executemany(
+            "INSERT INTO event_categories (category_id, epoch, event_id) VALUES (?, ?, ?)",
+            [(self.category_id(name), epoch, event_id) for name in categories],
+        )
+        self.connection.executemany(
+            "INSERT INTO event_locations (event_id, street, lon, lat) VALUES (?, ?, ?, ?)",
+            [(event_id, street_name, lon, lat) for street_name, (lon, lat) in streets],
+        )
+
+    def add_unit_transmission(self, clip_id, epoch, units, transcription):
+        """Files a transmission under every unit it calls out, unless the clip filed the same last sync."""
+        if not self.sync_row(clip_id, "units", row_signature(epoch, units, transcription)):
+            return
+        self.connection.executemany(
+            "INSERT INTO unit_transmissions (unit, epoch, clip_id, transcription) VALUES (?, ?, ?, ?)",
+            [(unit, epoch, clip_id, transcription) for unit in units],
+        )
+
+    def commit(self):
+        self.connection.commit()
+
+    def keyword_snapshot(self):
+        """Returns the keyword snapshot the cached scans were made with, None if there is none."""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'keyword_snapshot'").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_keyword_snapshot(self, snapshot):
+        self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('keyword_snapshot', ?)", (json.dumps(snapshot),))
+
+    def find_scans(self, transcriptions):
+        """Returns {transcription: (category names, keywords, streets, units, clarified transcription)} of the cached scans of some transcriptions."""
+        transcriptions = list(transcriptions)
+        scans = {}
+        for start in range(0, len(transcriptions), SCAN_LOOKUP_BATCH):
+            batch = transcriptions[start:start + SCAN_LOOKUP_BATCH]
+            rows = self.connection.execute(
+                f"SELECT transcription, categories, keywords, streets, units, clarified FROM scans WHERE transcription IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            for transcription, categories, keywords, streets, units, clarified in rows:
+                scans[transcription] = (json.loads(categories), set(json.loads(keywords)), [(street, tuple(coordinates)) for street, coordinates in json.loads(streets)], json.loads(units), clarified)
+        return scans
+
+    def add_scans(self, scans):
+        """Caches (transcription, category names, keywords, streets, units, clarified transcription, index tokens) scans."""
+        for transcription, categories, keywords, streets, units, clarified, index_tokens in scans:
+            index_tokens = sorted(index_tokens)
+            cursor = self.connection.execute(
+                "INSERT INTO scans (transcription, categories, keywords, streets, units, clarified, tokens) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (transcription, json.dumps(categories), json.dumps(sorted(keywords)), json.dumps(streets), json.dumps(units), clarified, json.dumps(index_tokens)),
+            )
+            self.connection.executemany("INSERT INTO scan_tokens (token, scan_id) VALUES (?, ?)", [(token, cursor.lastrowid) for token in index_tokens])
+
+    def clear_scans(self):
+        self.connection.execute("DELETE FROM scan_tokens")
+        self.connection.execute("DELETE FROM scans")
+
+    def invalidate_scans(self, keyword_diff):
+        """Drops the cached scans a KeywordDiff could affect. Returns how many were dropped."""
+        scan_ids = set()
+        for key in keyword_diff.clarification_keys:
+            scan_ids.update(scan_id for (scan_id,) in self.connection.execute("SELECT id FROM scans WHERE instr(transcription, ?) > 0", (key,)))
+        for tokens in keyword_diff.token_queries():
+            query = " INTERSECT ".join(["SELECT scan_id FROM scan_tokens WHERE token = ?"] * len(tokens))
+            scan_ids.update(scan_id for (scan_id,) in self.connection.execute(query, tokens))
+        for scan_id in scan_ids:
+            (tokens,) = self.connection.execute("SELECT tokens FROM scans WHERE id = ?", (scan_id,)).fetchone()
+            self.connection.executemany("DELETE FROM scan_tokens WHERE token = ? AND scan_id = ?", [(token, scan_id) for token in json.loads(tokens)])
+            self.connection.execute("DELETE FROM scans WHERE id = ?", (scan_id,))
+        return len(scan_ids)
+
+    def query_events(self, categories=None, since=None, until=None):
+        """Returns (clip_id, epoch, category names, keywords, transcription, locations) tuples ordered by time.
+
+        categories limits the result to events with any of the named categories, since and until
+        to a range of clip start epochs. locations is a list of (street, lon, lat).
+        """
+        since = since if since is not None else -2**63
+        until = until if until is not None else 2**63 - 1
+        if categories:
+            category_ids = [self.category_ids[name] for name in categories if name in self.category_ids]
+            if not category_ids:
+                return []
+            rows = self.connection.execute(f"""
+                SELECT DISTINCT events.id, clip_id, events.epoch, category_mask, keywords, transcription
+                FROM event_categories JOIN events ON events.id = event_categories.event_id
+                WHERE category_id IN ({', '.join('?' * len(category_ids))}) AND event_categories.epoch BETWEEN ? AND ?
+                ORDER BY events.epoch""", (*category_ids, since, until)).fetchall()
+        else:
+            rows = self.connection.execute("""
+                SELECT id, clip_id, epoch, category_mask, keywords, transcription
+                FROM events WHERE epoch BETWEEN ? AND ? ORDER BY epoch""", (since, until)).fetchall()
+        return [
+            (clip_id, epoch, self.category_names(mask, event_id), keywords, transcription, self.locations(event_id))
+            for event_id, clip_id, epoch, mask, keywords, transcription in rows
+        ]
+
+    def unit_activity(self, unit, since=None, until=None):
+        """Returns the (clip_id, epoch, transcription) transmissions calling out a unit, ordered by time.
+
+        unit is matched without regard to case, e.g. "214" or "medic 5".
+        """
+        since = since if since is not None else -2**63
+        until = until if until is not None else 2**63 - 1
+        return self.connection.execute(
+            "SELECT clip_id, epoch, transcription FROM unit_transmissions WHERE unit = ? AND epoch BETWEEN ? AND ? ORDER BY epoch",
+            (unit, since, until),
+        ).fetchall()
+
+    def locations(self, event_id):
+        """Returns the (street, lon, lat) locations of an event."""
+        return self.connection.execute("SELECT street, lon, lat FROM event_locations WHERE event_id = ?", (event_id,)).fetchall()
+
+    def close(self):
+        self.connection.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Query flagged events.")
+    parser.add_argument("--db", default=os.path.join(r"D:\Police_audio_recordings", "events.db"))
+    parser.add_argument("--category", action="append", help="Category name, can be given more than once")
+    parser.add_argument("--unit", help="List the transmissions of a unit instead, e.g. 214 or \"Medic 5\"")
+    parser.add_argument("--hours", type=float, help="Only events from the last N hours")
+    parser.add_argument("--since", type=parse_time, help="YYYY-mm-dd[ HH:MM]")
+    parser.add_argument("--until", type=parse_time, help="YYYY-mm-dd[ HH:MM]")
+    args = parser.parse_args()
+
+    store = EventStore(args.db)
+    since = wall_clock_epoch() - args.hours * 3600 if args.hours else args.since
+    if args.unit:
+        for clip_id, _, transcription in store.unit_activity(args.unit, since, args.until):
+            print(f"{clip_id} | {transcription.strip()}")
+        store.close()
+        return
+    for clip_id, _, categories, keywords, transcription, locations in store.query_events(args.category, since, args.until):
+        places = "; ".join(f"{street}: ({lon}, {lat})" for street, lon, lat in locations) or "NULL"
+        print(f"{clip_id} | {', '.join(categories) or 'NULL'} | {keywords or 'NULL'} | {places} | {transcription.strip()}")
+    store.close()
+
+if __name__ == "__main__":
+    main()
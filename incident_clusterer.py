@@ -0,0 +1,308 @@
+"""
+    Groups transmissions into incidents as they arrive. A transmission joins an incident when it
+    shares a street, an incident ten-code or a unit number with it, heard within KEY_WINDOW_SECONDS
+    of when the incident first heard that key. The key's time isn't renewed by later mentions, so a
+    unit checking in every few minutes or a busy highway can't chain a whole shift into one
+    incident. A transmission sharing streets or ten-codes with two incidents joins them, so
+    incidents are kept in a union-find with the merged record at each root. A unit number alone
+    never merges incidents, units go from call to call. A transmission with categories but none
+    of those keys, like "subject is unresponsive", is taken to continue the incident updated last
+    if that was within CONTEXT_SECONDS, the way annotated.csv borrows categories from nearby rows.
+
+    The flagger feeds it every final row once and publishes incidents.csv, the incidents still
+    open, after each cycle. An incident nothing was heard of for KEY_WINDOW_SECONDS can't grow
+    anymore. It is appended to the archive, incidents_closed.csv, and forgotten, so memory stays
+    flat however long the flagger runs.
+
+    A clip transcribed late can start before incidents that were still open when it started have
+    closed. It joins the closed incident holding one of its keys, if that closed within the last
+    LATE_CLIP_SECONDS, and the incident is archived again. The last row of an incident in the archive
+    is the one that counts. Late clips nothing closed recently shares a key with are counted and
+    logged.
+"""
+import csv
+import os
+from collections import Counter
+from keyword_matcher import tokenize
+from recording_paths import CLIP_PREFIX, clip_start_epoch, format_clip_time
+
+KEY_WINDOW_SECONDS = 1200  # A shared key links transmissions at most this far apart
+CONTEXT_SECONDS = 180  # A keyless transmission continues an incident updated this recently
+LATE_CLIP_SECONDS = 3600  # Closed incidents still take late clips starting this long before the horizon
+
+# Ten-codes naming what is going on. Status codes like 10-4 or 10-8 are said by every unit and link nothing
+INCIDENT_TEN_CODES = {
+    "10-15", "10-16", "10-17", "10-24", "10-31", "10-33", "10-34", "10-38", "10-49", "10-50", "10-57", "10-70",
+    "10-71", "10-72", "10-73", "10-78", "10-79", "10-80", "10-89", "10-90", "10-91", "10-92", "10-93", "10-94", "10-96",
+}
+
+INCIDENTS_HEADER = ["Incident", "Start", "End", "Location", "Longitude", "Latitude", "Categories", "Ten-codes", "Units", "Clips"]
+
+def transmission_keys(transcription, streets, units):
+    """Returns the linking keys of a transmission: "street:<name>", "code:<ten-code>" and "unit:<unit>"."""
+    keys = {"street:" + street_name.strip() for street_name, _ in streets}
+    keys.update("code:" + token for token in tokenize(transcription) if token in INCIDENT_TEN_CODES)
+    keys.update("unit:" + unit for unit in units)
+    return keys
+
+class Incident:
+    """The merged record of an incident, held by its union-find root."""
+
+    __slots__ = ("incident_id", "ids", "start", "end", "categories", "street_mentions", "street_coordinates", "keys", "clips")
+
+    def __init__(self, incident_id, epoch):
+        self.incident_id = incident_id
+        self.ids = [incident_id]  # The union-find ids merged into this record
+        self.start = epoch
+        self.end = epoch
+        self.categories = set()
+        self.street_mentions = Counter()
+        self.street_coordinates = {}
+        self.keys = set()
+        self.clips = []
+
+    def add(self, clip_id, epoch, categories, streets, keys):
+        self.start = min(self.start, epoch)
+        self.end = max(self.end, epoch)
+        self.categories.update(categories)
+        for street_name, coordinates in streets:
+            self.street_mentions[street_name] += 1
+            self.street_coordinates[street_name] = coordinates
+        self.keys.update(keys)
+        self.clips.append(clip_id)
+
+    def absorb(self, other):
+        self.ids.extend(other.ids)
+        self.start = min(self.start, other.start)
+        self.end = max(self.end, other.end)
+        self.categories |= other.categories
+        self.street_mentions.update(other.street_mentions)
+        self.street_coordinates.update(other.street_coordinates)
+        self.keys |= other.keys
+        self.clips.extend(other.clips)
+
+    def location(self):
+        """Returns the most mentioned street (or intersection) and its coordinates, None when no street was heard."""
+        if not self.street_mentions:
+            return None
+        street_name = self.street_mentions.most_common(1)[0][0]
+        return street_name, self.street_coordinates[street_name]
+
+def incident_row(incident):
+    """Returns the incidents.csv row of an incident."""
+    location = incident.location()
+    street_name, (lon, lat) = location if location else ("NULL", ("NULL", "NULL"))
+    return [
+        incident.incident_id,
+        format_clip_time(incident.start),
+        format_clip_time(incident.end),
+        street_name.strip() if location else street_name,
+        lon,
+        lat,
+        ", ".join(sorted(incident.categories)) or "NULL",
+        ", ".join(sorted(key[5:] for key in incident.keys if key.startswith("code:"))) or "NULL",
+        ", ".join(sorted(key[5:] for key in incident.keys if key.startswith("unit:"))) or "NULL",
+        "; ".join(incident.clips),
+    ]
+
+class IncidentClusterer:
+    """Online clustering of transmissions into incidents with a union-find over incident ids."""
+
+    def __init__(self, archive_file=None):
+        """archive_file is the CSV closed incidents are appended to, see resume. Without one they are dropped."""
+        self.parent = {}  # Incident id -> parent id, roots point to themselves
+        self.incidents = {}  # Root incident id -> Incident
+        self.key_index = {}  # Key -> (incident id, clip start seconds the incident first heard it)
+        self.clips = set()  # Clips of the open incidents
+        self.last_incident = None  # (incident id, seconds) of the incident updated last
+        self.latest = float("-inf")  # Latest clip start seen
+        self.horizon = float("-inf")  # Clips starting before this belong to closed incidents, see add_late
+        self.resumed = float("-inf")  # Clips starting before this were archived before the restart and are ignored
+        self.closed = {}  # Incident id -> Incident closed within LATE_CLIP_SECONDS, still taking late clips
+        self.closed_keys = {}  # Key -> (closed incident id, clip start seconds the incident first heard it)
+        self.late_attached = 0  # Late clips added to a closed incident since the start
+        self.late_dropped = 0  # Late clips no closed incident took since the start
+        self.position = None  # Rows offered in the current pass, None without begin_pass
+        self.rows_offered = 0  # Most rows offered in any pass
+        self.next_id = 1
+        self.archive_file = archive_file
+        if archive_file is not None:
+            self.resume()
+
+    def resume(self):
+        """Continues after the incidents already archived, so a restart neither repeats nor renumbers them.
+
+        Clips up to the end of the last archived incident are ignored, which leaves out the part of
+        an incident still open at the restart that was heard before then.
+        """
+        if not os.path.exists(self.archive_file):
+            return
+        with open(self.archive_file, 'r', newline='', encoding='utf-8') as infile:
+            reader = csv.reader(infile)
+            next(reader, None)
+            for row in reader:
+                if len(row) < 3 or not row[0].isdigit():
+                    continue
+                self.next_id = max(self.next_id, int(row[0]) + 1)
+                end = clip_start_epoch(CLIP_PREFIX + row[2])
+                if end is not None:
+                    self.resumed = max(self.resumed, end + 1)
+        self.horizon = self.resumed
+
+    def begin_pass(self):
+        """Starts another pass over the transcriptions, whose rows up to where the last pass stopped were added before.
+
+        The transcriptions only grow at the end, so counting the rows tells a late clip from one
+        added in an earlier cycle. Without it, every clip before the horizon is taken for a late one.
+        """
+        self.position = 0
+
+    def find(self, incident_id):
+        root = incident_id
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[incident_id] != root:
+            self.parent[incident_id], incident_id = root, self.parent[incident_id]
+        return root
+
+    def union(self, first, second):
+        """Merges two incidents, the one with more clips stays the root. Returns the root."""
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return first
+        if len(self.incidents[first].clips) < len(self.incidents[second].clips):
+            first, second = second, first
+        self.parent[second] = first
+        self.incidents[first].absorb(self.incidents.pop(second))
+        return first
+
+    def add(self, clip_id, epoch, categories, transcription, streets, units):
+        """Adds a transmission, returning its incident id, or None when it has neither keys nor categories.
+
+        epoch is the clip start in seconds, see recording_paths.clip_start_epoch, and streets and
+        units come from CompiledKeywords.scan. A clip is only added once, so rows seen again in
+        the next cycle are ignored. Clips older than the horizon go to add_late.
+        """
+        if self.position is not None:
+            self.position += 1
+            if self.position <= self.rows_offered:
+                return None
+            self.rows_offered = self.position
+        if clip_id in self.clips or epoch is None or epoch < self.resumed:
+            return None
+        keys = transmission_keys(transcription, streets, units)
+        if not keys and not categories:
+            return None
+        if epoch < self.horizon:
+            return self.add_late(clip_id, epoch, categories, streets, keys)
+        self.clips.add(clip_id)
+
+        linked = set()  # Incidents sharing a street or ten-code
+        unit_linked = set()  # Incidents sharing only a unit
+        for key in keys:
+            entry = self.key_index.get(key)
+            if entry is not None and abs(epoch - entry[1]) <= KEY_WINDOW_SECONDS:
+                (unit_linked if key.startswith("unit:") else linked).add(self.find(entry[0]))
+        if not linked and unit_linked:
+            # The unit's most recent incident, without merging the others it worked
+            linked = {max(unit_linked, key=lambda incident_id: self.incidents[incident_id].end)}
+        if not keys and self.last_incident is not None and abs(epoch - self.last_incident[1]) <= CONTEXT_SECONDS:
+            linked.add(self.find(self.last_incident[0]))
+
+        if linked:
+            linked = sorted(linked)
+            root = linked[0]
+            for other in linked[1:]:
+                root = self.union(root, other)
+        else:
+            root = self.next_id
+            self.next_id += 1
+            self.parent[root] = root
+            self.incidents[root] = Incident(root, epoch)
+        self.incidents[root].add(clip_id, epoch, categories, streets, keys)
+        for key in keys:
+            # A key keeps the time its incident first heard it, later mentions don't stretch the window
+            entry = self.key_index.get(key)
+            if entry is None or self.find(entry[0]) != root or abs(epoch - entry[1]) > KEY_WINDOW_SECONDS:
+                self.key_index[key] = (root, epoch)
+        self.last_incident = (root, epoch)
+        if epoch > self.latest:
+            self.latest = epoch
+            if epoch - KEY_WINDOW_SECONDS > self.horizon + KEY_WINDOW_SECONDS:
+                self.prune()
+        return root
+
+    def add_late(self, clip_id, epoch, categories, streets, keys):
+        """Adds a clip older than the horizon to the closed incident sharing a key with it and archives the incident again.
+
+        A street or ten-code is preferred over a unit. Returns the incident id, or None after
+        counting and logging the clip when no incident closed within LATE_CLIP_SECONDS shares a
+        key heard within KEY_WINDOW_SECONDS of it.
+        """
+        for key in sorted(keys, key=lambda key: (key.startswith("unit:"), key)):
+            entry = self.closed_keys.get(key)
+            if entry is not None and abs(epoch - entry[1]) <= KEY_WINDOW_SECONDS:
+                incident = self.closed[entry[0]]
+                incident.add(clip_id, epoch, categories, streets, keys)
+                self.late_attached += 1
+                if self.archive_file is not None:
+                    self.archive([incident])
+                return incident.incident_id
+        self.late_dropped += 1
+        print(f"Late clip {clip_id} matches no recently closed incident, left out of the incidents")
+        return None
+
+    def prune(self):
+        """Closes the incidents nothing was heard of for KEY_WINDOW_SECONDS, archives and forgets them.
+
+        Keys too old to link anything the next rows could bring are dropped as well. Also runs on
+        its own as clips come in, so a first pass over a long archive doesn't hold every incident.
+        Closed incidents are kept for late clips until they are LATE_CLIP_SECONDS behind the horizon.
+        Returns how many incidents were closed.
+        """
+        horizon = self.latest - KEY_WINDOW_SECONDS
+        if horizon <= self.horizon:
+            return 0
+        self.horizon = horizon
+        closed = [incident for incident in self.incidents.values() if incident.end < horizon]
+        closed_ids = {incident.incident_id for incident in closed}
+        expired = [(key, entry) for key, entry in self.key_index.items() if entry[1] < horizon]
+        for key, (incident_id, epoch) in expired:
+            del self.key_index[key]
+            root = self.find(incident_id)
+            if root in closed_ids:
+                self.closed_keys[key] = (root, epoch)
+        for incident in closed:
+            del self.incidents[incident.incident_id]
+            for incident_id in incident.ids:
+                del self.parent[incident_id]
+            self.clips.difference_update(incident.clips)
+            self.closed[incident.incident_id] = incident
+        if self.last_incident is not None and self.last_incident[0] not in self.parent:
+            self.last_incident = None
+        forgotten = [incident_id for incident_id, incident in self.closed.items() if incident.end < horizon - LATE_CLIP_SECONDS]
+        for incident_id in forgotten:
+            del self.closed[incident_id]
+        if forgotten:
+            self.closed_keys = {key: entry for key, entry in self.closed_keys.items() if entry[0] in self.closed}
+        if closed and self.archive_file is not None:
+            self.archive(sorted(closed, key=lambda incident: (incident.start, incident.incident_id)))
+        return len(closed)
+
+    def archive(self, incidents):
+        """Appends closed incidents to the archive in one write, adding the header to a new file."""
+        new_file = not os.path.exists(self.archive_file) or os.path.getsize(self.archive_file) == 0
+        with open(self.archive_file, 'a', newline='', encoding='utf-8') as outfile:
+            writer = csv.writer(outfile)
+            rows = [INCIDENTS_HEADER] if new_file else []
+            rows.extend(incident_row(incident) for incident in incidents)
+            writer.writerows(rows)
+            outfile.flush()
+            os.fsync(outfile.fileno())
+
+    def write_csv(self, outfile):
+        """Writes one row per open incident, oldest first, to a text file opened with newline='', see OutputPublisher.open."""
+        writer = csv.writer(outfile)
+        writer.writerow(INCIDENTS_HEADER)
+        for incident in sorted(self.incidents.values(), key=lambda incident: (incident.start, incident.incident_id)):
+            writer.writerow(incident_row(incident))
@@ -0,0 +1,368 @@
+"""
+    Word-boundary aware keyword matching for the flagger. A transcription is lower-cased and
+    split into tokens once, then every keyword and street name is matched as a token sequence
+    against a trie. Punctuation and spacing no longer matter, so keywords.py doesn't need padded
+    variants like " OD " or "drive.", and "near" no longer matches inside "nearly".
+"""
+import re
+from functools import lru_cache
+from spatial_index import StreetSpatialIndex
+
+# Bump when scan() changes what it returns, so cached scans in the event store are redone
+SCAN_VERSION = 4
+
+# Words that call out a unit and the label its number is filed under, "unit 214" is 214 and "medic 5" is Medic 5
+UNIT_PREFIXES = {
+    "unit": "", "medic": "Medic ", "engine": "Engine ", "rescue": "Rescue ", "ladder": "Ladder ", "squad": "Squad ",
+    "battalion": "Battalion ",
+}
+# A unit number is a few digits with an optional letter, never a hyphenated ten-code like "10-8"
+UNIT_NUMBER_PATTERN = re.compile(r"[a-z]?[0-9]{1,4}[a-z]?")
+
+# Words with inner hyphens or apostrophes stay whole so "10-50", "9-1-1" and "i'll" are one token
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['\-][a-z0-9]+)*")
+
+def tokenize(text):
+    """Returns the lower-cased word tokens of the text with punctuation stripped."""
+    return TOKEN_PATTERN.findall(text.lower().replace('\u2019', "'"))
+
+@lru_cache(maxsize=65536)
+def token_forms(token):
+    """Returns the token followed by the base words it may be an inflection of.
+
+    Substring matching let "arrest" hit "arrested" and "horn" hit "horns". Matching a transcription
+    token against its plain -s/-es/-ed/-ing bases keeps that without matching inside other words.
+    """
+    forms = [token]
+    if len(token) > 3 and token.isalpha():
+        if token.endswith("ies"):
+            forms.append(token[:-3] + "y")
+        elif token.endswith("es"):
+            forms += [token[:-2], token[:-1]]
+        elif token.endswith("s") and not token.endswith("ss"):
+            forms.append(token[:-1])
+        elif token.endswith("ed"):
+            forms += [token[:-2], token[:-1]]
+            if token[-3] == token[-4]:
+                forms.append(token[:-3])  # stopped -> stop
+        elif token.endswith("ing") and len(token) > 5:
+            forms += [token[:-3], token[:-3] + "e"]
+            if token[-4] == token[-5]:
+                forms.append(token[:-4])  # running -> run
+    return tuple(forms)
+
+def unit_numbers(tokens, position):
+    """Returns the unit numbers called out from position on, "units 12 and 14" gives 12 and 14."""
+    numbers = []
+    while position < len(tokens) and UNIT_NUMBER_PATTERN.fullmatch(tokens[position]):
+        numbers.append(tokens[position].upper())
+        if tokens[position + 1:position + 2] != ["and"]:
+            break
+        position += 2
+    return numbers
+
+class PhraseTrie:
+    """Trie of token sequences. Each complete phrase holds the payloads registered for it."""
+
+    def __init__(self):
+        self.root = {}
+        self.phrase_count = 0
+
+    def add(self, phrase, payload):
+        """Registers a payload under the tokens of the phrase. Returns False if the phrase has no tokens."""
+        tokens = tokenize(phrase)
+        if not tokens:
+            return False
+        node = self.root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if None not in node:
+            node[None] = []
+            self.phrase_count += 1
+        node[None].append(payload)
+        return True
+
+    def find(self, tokens):
+        """Yields (start, end, payloads) for every phrase occurrence in the tokens, overlaps included.
+
+        Each token also matches the base words returned by token_forms.
+        """
+        forms = [token_forms(token) for token in tokens]
+        token_count = len(tokens)
+        for start in range(token_count):
+            stack = [(self.root, start)]
+            while stack:
+                node, end = stack.pop()
+                if end == token_count:
+                    continue
+                for form in forms[end]:
+                    child = node.get(form)
+                    if child is not None:
+                        if None in child:
+                            yield start, end + 1, child[None]
+                        stack.append((child, end + 1))
+
+class ClarificationRewriter:
+    """Rewrites ten-codes and radio abbreviations to their clarified form in a single left-to-right pass.
+
+    The clarification keys are stored in a character trie and at each position the longest key
+    wins, so "10-18X" is never rewritten as "10-18" followed by a stray "X". A key only matches on
+    word boundaries, like the keywords do, so "10-100" and "10-50s" stay as they are.
+    """
+
+    def __init__(self, clarifications):
+        self.root = {}
+        for key, replacement in clarifications.items():
+            # Several keys carry a padding space the replacement drops, keep it so words don't run together
+            if key[:1].isspace() and not replacement[:1].isspace():
+                replacement = key[0] + replacement
+            if key[-1:].isspace() and not replacement[-1:].isspace():
+                replacement = replacement + key[-1]
+            node = self.root
+            for char in key:
+                node = node.setdefault(char, {})
+            node[None] = replacement
+
+    def rewrite(self, text):
+        """Returns the text with every clarification key replaced, longest key first at each position.
+
+        A key starting or ending in a letter or digit must not run on into one in the text.
+        """
+        root = self.root
+        pieces = []
+        copied_to = 0
+        position = 0
+        length = len(text)
+        while position < length:
+            if position and text[position - 1].isalnum() and text[position].isalnum():
+                position += 1  # Inside a word
+                continue
+            node = root.get(text[position])
+            match_end = 0
+            end = position + 1
+            while node is not None:
+                if None in node and (end == length or not (text[end - 1].isalnum() and text[end].isalnum())):
+                    match_end = end
+                    replacement = node[None]
+                if end == length:
+                    break
+                node = node.get(text[end])
+                end += 1
+            if match_end:
+                pieces.append(text[copied_to:position])
+                pieces.append(replacement)
+                position = copied_to = match_end
+            else:
+                position += 1
+        pieces.append(text[copied_to:])
+        return ''.join(pieces)
+
+class CompiledKeywords:
+    """The clarifications, keyword categories and street data of keywords.py compiled for matching."""
+
+    def __init__(self, clarifications, keyword_categories, street_data, intersections=None):
+        street_data = unique_streets(street_data)
+        self.rewriter = ClarificationRewriter(clarifications)
+        self.intersections = intersections  # Optional street_geometry.IntersectionTable
+        self.snapshot = keyword_snapshot(clarifications, keyword_categories, street_data, intersections)
+        clarified_terms = {keyword for _, keyword in self.snapshot["clarified_terms"]}
+        # Imported here because the gazetteer itself tokenizes with this module
+        from street_gazetteer import StreetGazetteer
+        self.gazetteer = StreetGazetteer(street_data)
+        self.spatial_index = StreetSpatialIndex(street_data)
+        self.trie = PhraseTrie()
+        # Keywords written against the clarified text, like "EMS(Emergecy Medical Service) on scene",
+        # are matched against it. Everything else is matched against what was actually said
+        self.clarified_trie = PhraseTrie()
+        # Categories are interned to bit positions in keywords.py order, a row's categories are one int
+        self.category_names = []
+        self.category_ids = {}
+        for category, keywords in keyword_categories.items():
+            if category.lower() == "locations":
+                continue  # The "locations" category is never flagged
+            self.category_ids[category] = len(self.category_names)
+            self.category_names.append(category)
+            for keyword in keywords:
+                trie = self.clarified_trie if keyword in clarified_terms else self.trie
+                trie.add(keyword, ("category", self.category_ids[category], keyword.strip()))
+        for street_name, coordinates in street_data.items():
+            self.trie.add(street_name, ("street", street_name, coordinates))
+        # Unit prefixes share the trie, so unit numbers are picked up in the same pass as the keywords
+        for prefix, label in UNIT_PREFIXES.items():
+            self.trie.add(prefix, ("unit", label, None))
+
+    def category_mask(self, categories):
+        """Returns the bitmask of the named categories, names that aren't flagged categories are ignored."""
+        mask = 0
+        for category in categories:
+            category_id = self.category_ids.get(category)
+            if category_id is not None:
+                mask |= 1 << category_id
+        return mask
+
+    def categories_of(self, mask):
+        """Returns the category names of a bitmask in keywords.py order."""
+        return [category for category_id, category in enumerate(self.category_names) if mask >> category_id & 1]
+
+    def clarify(self, transcription):
+        """Returns the transcription with ten-codes and abbreviations expanded, e.g. "10-50(Traffic Stop*)"."""
+        return self.rewriter.rewrite(transcription)
+
+    def index_tokens(self, transcription):
+        """Returns the tokens a KeywordDiff query can match this transcription by.
+
+        These are every form of every token of the transcription and of its clarified text, which
+        is what the tries match, and "~" plus the blocking key of every token, which is how the
+        gazetteer finds candidate streets.
+        """
+        from street_gazetteer import expand_abbreviations, token_key
+        tokens = tokenize(transcription)
+        index_tokens = {form for token in tokens + tokenize(self.clarify(transcription)) for form in token_forms(token)}
+        index_tokens.update("~" + token_key(token) for token in expand_abbreviations(tokens))
+        return index_tokens
+
+    def scan(self, transcription):
+        """Returns (category_mask, keywords, streets, units) found in the transcription.
+
+        Only what was said is matched, so the text a clarification adds, like "Serving Warrant" for
+        "49", flags nothing. The few keywords written against clarified text, see clarified_terms in
+        keyword_snapshot, are matched against the clarified transcription instead.
+        category_mask is a bitmask of category ids (see categories_of), keywords a set and streets a list of (street_name, coordinates) in the
+        order they were first mentioned. Near-misses from the gazetteer are used where no street
+        matched exactly, and a mention matching several streets is narrowed down by proximity to
+        the other streets of the transcription. Two streets that cross are reported as their
+        intersection when an intersection table is loaded. units is a list of the unit numbers called
+        out after a UNIT_PREFIXES word, labelled like "214" or "Medic 5", in the order heard.
+        """
+        tokens = tokenize(transcription)
+        category_mask = 0
+        keywords = set()
+        units = {}  # Unit -> None, a dict keeps the order heard
+        mentions = {}  # (start, end) token span -> {street_name: coordinates}
+        if self.clarified_trie.phrase_count:
+            for _, _, payloads in self.clarified_trie.find(tokenize(self.clarify(transcription))):
+                for _, key, value in payloads:
+                    category_mask |= 1 << key
+                    keywords.add(value)
+        for start, end, payloads in self.trie.find(tokens):
+            for kind, key, value in payloads:
+                if kind == "category":
+                    category_mask |= 1 << key
+                    keywords.add(value)
+                elif kind == "unit":
+                    units.update((key + number, None) for number in unit_numbers(tokens, end))
+                else:
+                    mentions.setdefault((start, end), {})[key] = value
+        exact_spans = list(mentions)
+        for street_name, coordinates, _, start, end in self.gazetteer.lookup(tokens):
+            if not any(start < span_end and span_start < end for span_start, span_end in exact_spans):
+                mentions.setdefault((start, end), {})[street_name] = coordinates
+        streets = {}
+        candidates = [list(mentions[span].items()) for span in sorted(mentions)]
+        for street_name, coordinates in self.spatial_index.resolve_mentions(candidates):
+            streets.setdefault(street_name, coordinates)
+        streets = list(streets.items())
+        if self.intersections is not None and len(streets) > 1:
+            streets = self.intersections.resolve(streets)
+        return category_mask, keywords, streets, list(units)
+
+def unique_streets(street_data):
+    """Returns street_data with one entry per street as matched, keeping the first spelling.
+
+    Case and padding variants like "Champions court" or "Santa Rosa Boulevard," tokenize the same
+    and would each be reported for one mention.
+    """
+    unique = {}
+    seen = set()
+    for street_name, coordinates in street_data.items():
+        key = tuple(tokenize(street_name))
+        if key not in seen:
+            seen.add(key)
+            unique[street_name] = coordinates
+    return unique
+
+def clarified_terms(clarifications, keyword_categories):
+    """Returns the sorted [category, keyword] terms that contain a clarification's expansion, like "EMS(Emergecy Medical Service) on scene"."""
+    expansions = {replacement.strip().lower() for key, replacement in clarifications.items()
+                  if "(" in replacement and replacement.strip() != key.strip()}
+    return sorted([category, keyword] for category, keywords in keyword_categories.items()
+                  if category.lower() != "locations" for keyword in set(keywords)
+                  if any(expansion in keyword.lower() for expansion in expansions))
+
+def keyword_snapshot(clarifications, keyword_categories, street_data, intersections=None):
+    """Returns a JSON-able record of the keywords a scan depends on, to diff against the next load."""
+    return {
+        "version": SCAN_VERSION,
+        "clarifications": dict(clarifications),
+        "terms": sorted([category, keyword] for category, keywords in keyword_categories.items()
+                        if category.lower() != "locations" for keyword in set(keywords)),
+        "streets": {street_name: list(coordinates) for street_name, coordinates in street_data.items()},
+        "intersections": intersections.fingerprint() if intersections is not None else None,
+        "units": UNIT_PREFIXES,
+        "clarified_terms": clarified_terms(clarifications, keyword_categories),
+    }
+
+class KeywordDiff:
+    """What changed between two keyword snapshots, and which transcriptions that can affect."""
+
+    def __init__(self, old, new):
+        self.clarification_keys = {key for key in old["clarifications"].keys() | new["clarifications"].keys()
+                                   if old["clarifications"].get(key) != new["clarifications"].get(key)}
+        old_terms = {tuple(term) for term in old["terms"]}
+        new_terms = {tuple(term) for term in new["terms"]}
+        self.terms_added = new_terms - old_terms
+        self.terms_removed = old_terms - new_terms
+        # A street whose coordinates changed counts as removed and added
+        self.streets_added = {name for name, coordinates in new["streets"].items() if old["streets"].get(name) != coordinates}
+        self.streets_removed = {name for name, coordinates in old["streets"].items() if new["streets"].get(name) != coordinates}
+        self.categories_added = {category for category, _ in new_terms} - {category for category, _ in old_terms}
+        self.categories_removed = {category for category, _ in old_terms} - {category for category, _ in new_terms}
+
+    def __bool__(self):
+        return bool(self.clarification_keys or self.terms_added or self.terms_removed or self.streets_added or self.streets_removed)
+
+    def summary(self):
+        parts = [
+            (len(self.clarification_keys), "changed clarifications"),
+            (len(self.terms_added), "added terms"), (len(self.terms_removed), "removed terms"),
+            (len(self.streets_added), "added streets"), (len(self.streets_removed), "removed streets"),
+            (len(self.categories_added), "added categories"), (len(self.categories_removed), "removed categories"),
+        ]
+        return ", ".join(f"{count} {label}" for count, label in parts if count) or "no changes"
+
+    def token_queries(self):
+        """Returns token tuples, a transcription whose index_tokens hold all of one tuple may be affected.
+
+        A term or street is matched exactly through all of its tokens, and a street of two or more
+        words is also a gazetteer candidate for any transcription sharing its first token's key.
+        """
+        from street_gazetteer import expand_abbreviations, token_key
+        queries = set()
+        for _, keyword in self.terms_added | self.terms_removed:
+            tokens = tokenize(keyword)
+            if tokens:
+                queries.add(tuple(tokens))
+        for street_name in self.streets_added | self.streets_removed:
+            tokens = tokenize(street_name)
+            if tokens:
+                queries.add(tuple(tokens))
+            if len(tokens) >= 2:
+                queries.add(("~" + token_key(expand_abbreviations(tokens)[0]),))
+        return queries
+
+def diff_keywords(old_snapshot, new_snapshot):
+    """Returns the KeywordDiff between two snapshots, or None when everything has to be rescanned.
+
+    That is when there is no old snapshot, the scan code changed, or the intersection table, the
+    unit prefixes or the keywords matched against clarified text changed.
+    """
+    if old_snapshot is None or old_snapshot.get("version") != new_snapshot["version"] \
+            or old_snapshot.get("intersections") != new_snapshot["intersections"] \
+            or old_snapshot.get("units") != new_snapshot["units"] \
+            or old_snapshot.get("clarified_terms") != new_snapshot["clarified_terms"]:
+        return None
+    return KeywordDiff(old_snapshot, new_snapshot)
+
+def compile_keywords(clarifications, keyword_categories, street_data, intersections=None):
+    """Compiles the keywords.py data for matching. Done once per load, not per transcription."""
+    return CompiledKeywords(clarifications, keyword_categories, street_data, intersections)
@@ -1,4968 +1,4968 @@
-# keywords.py
-
-clarifications = {
-    "10-0 ": "10-0(Use Caution)",
-    "10-1 ": "10-1(Poor Reception)",
-    "10-2 ": "10-2(Good Reception)",
-    "10-3 ": "10-3(Stop Transmitting)",
-    "10-4 ": "10-4(Acknowledgement)",
-    "10-4,": "10-4(Acknowledgement),",
-    "10-4.": "10-4(Acknowledgement).",
-    "Ten four": "Ten four(Acknowledgement)",
-    "10-5 ": "10-5(Relay to ____)",
-    "10-6 ": "10-6(Busy)",
-    " 10-6.": "10-6(Busy)",
-    "10-7 ": "10-7(Out of Service)",
-    "10-7.": "10-7(Out of Service).",
-    "10-8 ": "10-8(In Service)",
-    "10-8. ": "10-8(In Service). ",
-    "10-8,": "10-8(In Service),",
-    "10-8.": "10-8(In Service).",
-    "ten-eight ": "ten-eight(In Service)",
-    "10-9 ": "10-9(Repeat)",
-    "10-10": "10-10(temporarily out of Service*)",
-    "10-11": "10-11(Talking Too Rapidly*)",
-    "10-12": "10-12(Visitor Present*)",
-    "10-13": "10-13(Weather/Road Report)",
-    "10-14": "10-14(Escort)",
-    "10-15": "10-15(Prisoner in Custody)",
-    "10-16": "10-16(Pick up/Transport Prisoner*)",
-    "10-17": "10-17(Investigation*)",
-    "10-18": "10-18(Respond w/Lights & Siren*)",
-    "10-18X": "10-18X(do not use Lights & Siren*)",
-    "10-19": "10-19(Return to Station)",
-    "10-20": "10-20(Location)",
-    "10-21": "10-21(Call Station By Telephone )",
-    "10-22": "10-22(Disregard)",
-    "10-23": "10-23(Stand-by*)",
-    "10-24": "10-24(Trouble, Send Help!*)",
-    "10-25": "10-25(Make Contact*)",
-    "10-26": "10-26(Message Received*)",
-    " 26.": " 26(Message Received*).",
-    "10-27": "10-27(Driver's License Information)",
-    " 27 ": " 27(Driver's License Information) ",
-    "10-28": "10-28(Vehicle Registration Information)",
-    "10-29": "10-29(Check for Wants/Warrants)",
-    "10-30": "10-30(Unnecessary Use of Radio)",
-    "10-31": "10-31(In Pursuit*)",
-    "10-32": "10-32(Intoxilizer Operator)",
-    "10-33": "10-33(Emergency Traffic)",
-    "1033": "1033(Emergency Traffic)",
-    "10-34": "10-34(Trouble At Jail)",
-    "10-35": "10-35(Confidential*)",
-    "10-36": "10-36(Current Time)",
-    "10-37": "10-37(Dispatcher or Operator*)",
-    "10-38": "10-38(Set Up Roadblock*)",
-    "10-39": "10-39(Message Delivered*)",
-    "10-40": "10-40(Silent Run-No Lights or Siren)",
-    "1040": "1040(Silent Run-No Lights or Siren)",
-    "10-41": "10-41(In Possession of_________*)",
-    "10-42": "10-42(Home*)",
-    "10-43": "10-43(Traffic for_________*)",
-    "10-44": "10-44(Pick up Paperwork*)",
-    "10-45": "10-45(Call by Telephone*)",
-    "10-46": "10-46(Urgent*)",
-    "10-47": "10-47(Radio Repair Needed*)",
-    "10-48": "10-48(End of Message*)",
-    "10-49": "10-49(Serving Warrant*)",
-    " 49 ": " 49(Serving Warrant*)",
-    " 49,": " 49(Serving Warrant*)",
-    " 49.": " 49(Serving Warrant*)",
-    "10-50": "10-50(Traffic Stop*)",
-    " 1050" : " 1050(Traffic Stop*) ",
-    "10-51": "10-51(En Route*)",
-    "10-52": "10-52(Estimated Time of Arrival*)",
-    "10-53": "10-53(Coming To Office)",
-    "10-54": "10-54(Negative*)",
-    "10-55": "10-55(Car Calling To Car*)",
-    "10-56": "10-56(Meet Me At____)",
-    "10-57": "10-57(Hit and Run)",
-    "10-58": "10-58(Direct Traffic)",
-    "10-59": "10-59(Convoy or Escort)",
-    "10-60": "10-60(Squad in Vicinity)",
-    "10-61": "10-61(Personnel in Area)",
-    "10-62": "10-62(Reply to Message)",
-    "10-63": "10-63(Prepare to Make Written Copy)",
-    "10-64": "10-64(Message for Local Delivery)",
-    "10-65": "10-65(Can You Copy?*)",
-    "10-66": "10-66(Message Cancellation)",
-    "1066": "1066(Message Cancellation)",
-    "10-67": "10-67(Serving*)",
-    "10-68": "10-68(Need Legal Advice*)",
-    "10-69": "10-69(Message Received)",
-    "10-70": "10-70(Send Tow Truck*)",
-    "10-71": "10-71(Send Ambulance*)",
-    "10-72": "10-72(Follow-up investigation**)",
-    "10-73": "10-73(Smoke Report)",
-    "10-74": "10-74(Negative)",
-    "10-75": "10-75(In Contact With)",
-    "10-76": "10-76(En Route)",
-    "10-77": "10-77(ETA)",
-    "10-78": "10-78(Need Assistance)",
-    "10-79": "10-79(Notify Coroner)",
-    "10-80": "10-80(Chase in Progress)",
-    "10-81": "10-81(Breathalyzer Report)",
-    "10-82": "10-82(Reserve Lodging)",
-    "10-83": "10-83(Work School Xing)",
-    "10-84": "10-84(If Meeting Advise ETA)",
-    "10-85": "10-85(Delayed Due to)",
-    "10-86": "10-86(Begin Shift*)",
-    "1086": "1086(Begin Shift*)",
-    "10-87": "10-87(End Shift*)",
-    "10-88": "10-88(Phone Number)",
-    "10-89": "10-89(Bomb Threat)",
-    "10-90": "10-90(Bank Alarm)",
-    "10-91": "10-91(Pick Up Subject)",
-    "10-92": "10-92(Improperly Parked Vehicle)",
-    "10-93": "10-93(Blockade)",
-    "10-94": "10-94(Drag Racing)",
-    "10-95": "10-95(Subject or Suspect Present*)",
-    "1095": "1095(Subject or Suspect Present*)",
-    "10-96": "10-96(Mental Subject)",
-    "10-97": "10-97(Arrived At Scene*)",
-    "10.97": "10.97(Arrived At Scene*)",
-    "1097": "1097(Arrived At Scene*)",
-    "10-98": "10-98(Completed Task*)",
-    "10 98.": "10 98(Completed Task*).",
-    " 1098 ": " 10-98(Completed Task*) ",
-    " 1098.": " 10-98(Completed Task*).",
-    "10-99": "10-99(Not Receiving Signal*)",
-    " FTA": " FTA(failure to appear)",
-    "FHP": "FHP(Florida Highway Patrol)",
-    " PX": " PX(Phone call)",
-    " FWC ": " FWC(Florida Fish and Wildlife Conservation Commission) ",
-    " CAD ": " CAD(Computer-Aided Dispatch) ",
-    " CAD,": " CAD(Computer-Aided Dispatch),",
-    " CAD.": " CAD(Computer-Aided Dispatch).",
-    " NVA ": " NVA(No Value Added-no actionable information) ",
-    " DAB ": " DAB(Death at scene aka Dead on arival) ",
-    " BOLO ": " BOLO(Be on the look out) ", 
-    " FIR ": " FIR(Field Interview Report) ",
-    "ETOH": "ETOH(Alchohol)",
-    " E2H ": " E2H(Alchohol, possible ETOH) ",
-    " MVA":" MVA(Motor Vehicle Accident)",
-    " EMS ": " EMS(Emergecy Medical Service) ",
-    " DC ": " DC(Disorderly Conduct) ",
-    " DAV ": " DAV(Disabled Abandoned Vehicle) ",
-    " PAV ": " PAV(Pedestrian Accident Victim) ",
-    " FPS ": " FPS(Federal Protective Service) ",
-    " DBS": " DBS(Dead Body Scene)",
-    " QP": " QP(Query Person)",
-}
-
-keyword_categories = {
-    "locations": [" cove ","cove,","10-20", "location", " at the ", "near", "intersection","North","South","West","Boulevard"," road ","east","west","street","island"," drive ","drive.","drive,","Drive.","Drive,","En Route","Avenue", "address", "place"],
-    "arrests": ["10-15", "arrest", "custody","Custody", "detained", "apprehend", "handcuff", "booked","attained"],
-    "overdoses": ["overdose", "narcan", "drug-related", " OD ", "fentanyl"],
-    "traffic_violations": ["speeding", "reckless driving", "DUI", "ran red light", "illegal turn", "traffic violation", "speed limit","reckless vehicle","Going into other lane","hit the curb"," junction violation "],
-    "traffic_stops": ["10-50", "traffic stop", "pulled over", "license and registration"],
-    "theft": ["burglary","burglar", "break-in", "intruder", "forced entry", "stolen", "theft","steal","took property"],
-    "destruction_of_property": ["vandalism", "graffiti", "property damage", "broken window", "destroyed", "damaged"],
-    "Noise Complaints": ["loud music","party", "construction noise", "barking dog", "car alarm", "shouting", "horn", "fireworks", "noise disturbance", "loud neighbors","noise complaint" ],
-    "suicides": ["suicide","self-harm","taking own life","kill myself","end my life","commit suicide","suicidal thoughts","suicidal ideation","attempt suicide"],
-    "domestic_violence": ["domestic violence", "domestic dispute", "family disturbance", "spousal abuse", "intimate partner violence", "domestic assault", "domestic battery", "disturbance family"],
-    "fraud": [ "fraud", "identity theft", "scam", "embezzlement", "forgery", "counterfeit", "ponzi scheme", 
-        "pyramid scheme", "phishing", "skimming", "money laundering", "wire fraud", "bank fraud", 
-        "securities fraud", "tax evasion", "fake check", "advance fee", "investment fraud", 
-        "medicare fraud", "medicaid fraud", "social security fraud", "welfare fraud", 
-        "telemarketing fraud", "charity fraud", "lottery scam", "romance scam", "tech support scam", 
-        "impersonation", "false pretenses", "confidence trick", "bait and switch", "shell company", 
-        "insider trading", "kickback", "bribery", "extortion", "blackmail", "racketeering", 
-        "identity fraud", "check kiting", "credit card skimming", "pump and dump", "boiler room"
-    ],
-    "trespassing": ["trespassing", "trespass", "unauthorized entry", "unlawful entry", "illegal entry", "no trespassing", "private property", "restricted area", "trespasser", "trespassed","Wanting her to leave","Wanting him to leave","Wanting them to leave"],
-    "car_crashes_or_damage": ["car crash", "accident", "collision", "vehicle impact", "fender bender", "hit and run", "rollover", "pile-up", "T-bone", "rear-end", "head-on", "sideswipe", "multi-vehicle", "car wreck","has damage","traffic crash"],
-    "business_alarms": ["business alarm", "store alarm", "commercial alarm", "security alarm", "silent alarm", "burglar alarm", "panic button", "hold-up alarm", "motion detector", "glass break sensor", "perimeter breach", "security breach", "alarm activation", "alarm response"],
-    "residential_alarms": ["residential alarm", "home alarm", "house alarm", "burglar alarm", "alarm system", "alarm activation", "alarm response", "alarm triggered", "motion sensor", "window sensor", "door sensor"],
-    "neighbor_altercations": ["altercation","neighbor dispute", "noise complaint", "property line dispute", "fence dispute", "parking dispute", "loud music", "barking dog", "trash dispute", "landscaping dispute", "nuisance complaint", "neighbor harassment", "threatening behavior", "civil dispute", "neighborhood disturbance"],
-    "serving_warrants": ["serving warrant", "warrant service", "arrest warrant", "search warrant", "bench warrant", "warrant execution", "warrant arrest", "warrant issued"],
-    "disabled_vehicles": ["disabled vehicle", "broken down car", "car trouble", "vehicle breakdown", "car won't start", "stranded motorist", "vehicle assistance", "tow truck needed", "vehicle malfunction", "mechanical failure"],
-    "place_change": ["location change","I'll be at","I'll be out at"],
-    "juvenile problem":["juvenile problem"],
-    "wellness_checks": ["wellness check", "welfare check", "safety check", "check on welfare", "check on wellbeing", "health and safety check", "concern for safety", "welfare concern", "safety concern","well-being"],
-    "disturbances": ["disturbance", "rowdy behavior", "unruly behavior", "disorderly conduct", "fight", "altercation", "brawl", "commotion", "uproar", "chaos", "disruption", "tumult", "fracas", "melee"],
-    "en route": ["En Route", "in route", "I'm on"], #this section should denote goint to or at a location "I'm on" has the issue of being figurative such as "I'm on the case" or "I'm on pursuit"
-    "follow up": ["follow up"],
-    "911 verification": ["911 verification","9-1-1 verification"],
-    "verification": ["verification"], #officers will say verification for licences and tags and just use verification
-    "suspicious_person": ["suspicious person", "acting suspicious", "strange behavior", "unusual activity", "prowler", "lurking", "suspicious individual"],
-    "Suspicious vehicle":["Suspicious vehicle"],
-    "alcohol_violation": ["open container", "public intoxication", "underage drinking", " DUI ", "drunk driving", "intoxicated", "alcohol possession", "alcohol consumption", "liquor law violation", "drinking in public","alcohol violation","alcohol"],
-    "racing":   [" racing "],
-    "medical_emergencies": ["medical emergency", "heart attack", "stroke", "seizure", "unresponsive", "CPR", "ambulance needed", "choking", "allergic reaction", "difficulty breathing", "injury", "bleeding", "fainting","wound", "diabetic emergency", "unconscious", "not breathing", "heart palpitations","cardiac","EMS(Emergecy Medical Service) on scene","Can we get EMS","physical trauma","EMS(Emergecy Medical Service) needed"],
-    "Boat crash": ["Boat crash"],
-    "drone": ["drone"]
-}
-
-street_data = {
-    "Mountain City Road": (-86.63842725261064, 31.000219510112917),
-    "Old Salt Road": (-86.48823956410172, 30.994007693087017),
-    " 374 ": (-86.68467733568764, 30.994590099510187),
-    "Middle Creek Road": (-86.72931095706558, 31.015238677926646),
-    "Blackwater Road": (-86.70307420877519, 31.011002008395568),
-    "Alice Chesser Spur": (-86.74762629252102, 30.9966572829094),
-    "Evergreen Circle": (-86.50000932949249, 30.3994219806613),
-    "Baggett Lane": (-86.52702301809208, 30.818400250719453),
-    "Highland Avenue": (-86.52897196550059, 30.75326438141426),
-    "Old Brown Road": (-86.64321383705374, 30.75827249696593),
-    "Grand Palms Boulevard": (-86.41006143219883, 30.38164763733865),
-    "Sunshine Drive": (-86.5501355526002, 30.784147082628994),
-    "Oaklake Cove": (-86.437783, 30.48783),
-    "Fairview Road": (-86.65273100452163, 30.443970534586967),
-    "Whitetail Circle": (-86.44407068780394, 30.492750201100694),
-    "East Danielle Court": (-86.78024500000001, 30.410969000000005),
-    "Goodwin Road": (-86.42999666120097, 30.78025723685351),
-    "Jericho Road": (-86.45926679756371, 30.75041487347033),
-    "Date Palm Circle": (-86.470809, 30.497871),
-    "Knollwood Lane": (-86.41628607916117, 30.492462618354335),
-    "Mason Cemetery Road": (-86.4541938, 30.71848265),
-    "Dock Road": (-86.49053733319633, 30.48184678018084),
-    "Hot Rod Lane": (-86.70059840525467, 30.786081146420237),
-    "Range Rd 253": (-86.77819846291067, 30.610328963349374),
-    "S130": (-86.78546003229937, 30.925401421308734),
-    "Fawn Lake Road": (-86.42280079030328, 30.777284580610743),
-    "Range Rd 230": (-86.58399188242956, 30.535601312092343),
-    "Alabama Street": (-86.56897434734068, 30.765647377970367),
-    "Range Rd 632": (-86.6155973909336, 30.513916327201716),
-    "Hurricane Lake Road": (-86.78675635216828, 30.890656750595607),
-    "Foxchase Way": (-86.61947950132434, 30.722513559588783),
-    "R53": (-86.7359020426434, 30.91388749761952),
-    "Range Rd 213": (-86.60517190629068, 30.604935761938872),
-    "Range Rd 234": (-86.599497, 30.474744700000002),
-    "R52": (-86.76272264010889, 30.918042075701486),
-    "Gibson Road": (-86.63547521091766, 30.44476391150621),
-    "Range Rd 236": (-86.69407234688192, 30.629012748785637),
-    "R54": (-86.73633437684657, 30.918228321865428),
-    "R123": (-86.66729348258743, 30.898158356370047),
-    "Range Rd 233": (-86.56502508620756, 30.528760837367884),
-    "Welannee Boulevard": (-86.5579178143563, 30.841115468129157),
-    "Physician's Drive": (-86.56903204348723, 30.733808724453883),
-    "Anderson Pond Camp": (-86.51366163700372, 30.562754150669722),
-    "Valparaiso Parkway": (-86.49468865625535, 30.510413574556146),
-    "Hurricane Lake North Entrance Road": (-86.75448967652251, 30.944699804764813),
-    "McWhorter Avenue": (-86.53591004175378, 30.646482249953674),
-    "Range Rd 235": (-86.59234713203058, 30.565394899490077),
-    "Range Rd 250": (-86.63753337085213, 30.507623558510105),
-    "Range Rd 211": (-86.79238252800972, 30.619989576216604),
-    "Range Rd 257": (-86.737314, 30.583815000000005),
-    "Helms Farm Road": (-86.52682099515427, 30.862285799930778),
-    "Range Rd 232": (-86.57542971133844, 30.563756260248535),
-    "R37": (-86.74837852938695, 30.916995712053875),
-    "R44": (-86.77121340191462, 30.913908695668958),
-    "Railroad Avenue East": (-86.56825683196381, 30.75803208703853),
-    "Mary Lane": (-86.60000485, 30.7687503),
-    "Coast Guard Access Road": (-86.52593241303533, 30.390559329733897),
-    "Meyer Street": (-86.55399279367015, 30.808695700820696),
-    "Durango Road": (-86.49982024635851, 30.387579495704976),
-    "Monique Court": (-86.49504900007497, 30.406493011727935),
-    "Lovegrass Lane": (-86.5544016594309, 30.711613411953326),
-    "Orange Blossom Place": (-86.784287, 30.7006665),
-    "Walker Circle East": (-86.54875240828909, 30.71771758533563),
-    "Ben Hogan Court": (-86.56187755419752, 30.4362691071411),
-    "Live Oak Avenue": (-86.49986087828742, 30.5007202246875),
-    "Beach Drive": (-86.45030300053175, 30.508990616340835),
-    "Marion Drive": (-86.44101529856222, 30.525408668193588),
-    "Davis Court": (-86.5481562406352, 30.447582584942513),
-    "Caymen Cove": (-86.41034691506502, 30.382776431977135),
-    "Pocahontas Avenue": (-86.61548949025394, 30.436351657940232),
-    "Cayenne Lane": (-86.58592560184861, 30.433938435588587),
-    "Danbury Court": (-86.42436677931497, 30.46442849908907),
-    "Driftwood Lane": (-86.49670119660082, 30.403958968496372),
-    "Gillis Drive": (-86.57226233556763, 30.781488921844744),
-    "B Cove": (-86.54792363446694, 30.445197582391877),
-    "Merchants Way": (-86.41646981912352, 30.487727873959148),
-    "Solar Street": (-86.7154472347602, 30.413006904541163),
-    "Four Wheel Drive": (-86.63103124208364, 30.826745726690977),
-    "Alysheba Drive": (-86.54864828888594, 30.729981099814456),
-    "Jackson Street": (-86.60719480732159, 30.444417076046847),
-    "Patriot Court": (-86.650653, 30.4604955),
-    "Brookwood Lane": (-86.47370685622575, 30.75305700510162),
-    "Laticia Drive": (-86.593369, 30.7167865),
-    "Dogwood Drive West": (-86.55864188456702, 30.818289737669133),
-    "Ivy McCormick Lane": (-86.51454935411799, 30.76059185065943),
-    "Pearl S Buck Court": (-86.42787128999737, 30.489681803647517),
-    "American Poets Drive": (-86.42903290599179, 30.490504187861156),
-    "East Ponderosa Road": (-86.63262560700875, 30.46600086246088),
-    "Eglin Parkway": (-86.52375948657111, 30.506310929846805),
-    "Hillcrest Road": (-86.53660274602593, 30.761424898372223),
-    "Chessher Court": (-86.55575032529778, 30.766649345972226),
-    "Lake Sue Drive": (-86.5205511080519, 30.750920234203594),
-    "Sloat Court Southeast": (-86.58882009999999, 30.4065288),
-    "Cobbs Point Road": (-86.48590141963328, 30.415191517348134),
-    "Pinewood Lane": (-86.54751890419921, 30.78431299373804),
-    "Roy Street": (-86.6317790229531, 30.44696745504324),
-    "Goldenrod Court": (-86.4672789459551, 30.521537541689803),
-    "Viola Drive": (-86.63639620000001, 30.44290145),
-    "Lois Court": (-86.61956486281069, 30.438514575786694),
-    "Oak Street Southeast": (-86.60017388926416, 30.406959947304813),
-    "Jewel's Lane": (-86.75994005391568, 30.69145170149561),
-    "Inez Street": (-86.6596485, 30.4271425),
-    "Vulpes Sanctuary Loop": (-86.6207642971631, 30.721072363180102),
-    "Gregory Avenue": (-86.62686656406704, 30.42167149206566),
-    "Strafford Street": (-86.6376623417007, 30.454107516265985),
-    "Crimson Heights Court": (-86.6450100786595, 30.447294560135123),
-    "Eastview Drive": (-86.5756100604452, 30.70361633731321),
-    "Hawks Run Road": (-86.57333668027802, 30.8791095506869),
-    "Parkwood Lane": (-86.41838271039765, 30.488651408200617),
-    "Windale Road": (-86.6729116580061, 30.41043736346356),
-    "Park Street": (-86.55267637729017, 30.746230224554083),
-    "Cheyenne Trace": (-86.60365637495902, 30.778565778342234),
-    "Harbor Place Southwest": (-86.63464900133168, 30.40928049104789),
-    "Kamela Court": (-86.559173, 30.770705),
-    "Barks Lane": (-86.51947012977269, 30.790827550945302),
-    "Pinedale Way": (-86.64750679397027, 30.428158636304655),
-    "Fetting Avenue Northwest": (-86.63659155821709, 30.44740943777855),
-    "Fox Valley Road": (-86.56028137766423, 30.438225294261084),
-    "Glenview Avenue": (-86.49082304139262, 30.504848333065464),
-    "Marsh Harbor Drive": (-86.74796235, 30.407675750000003),
-    "James Place": (-86.67372271035546, 30.410263350422277),
-    "Rum Still Circle": (-86.45884864266459, 30.525557641402553),
-    "Tiffot Court": (-86.54645060568123, 30.767890203378848),
-    "Ridge Drive": (-86.56537216033047, 30.77664503165663),
-    "Eastland Street": (-86.5479971427025, 30.746043990876725),
-    "Winged Foot Drive": (-86.43602613957748, 30.480256197471256),
-    "Mantero Way": (-86.39920223664319, 30.3841362812602),
-    "Bradley Drive": (-86.60201390669994, 30.430530494746282),
-    "Catmar Road": (-86.40412675178364, 30.47889700873282),
-    "Crescent Avenue": (-86.55000965837706, 30.770191480571537),
-    "Woodruff Avenue East": (-86.56846003799517, 30.759628462221077),
-    "Henderson Street": (-86.55555536730192, 30.750714852427592),
-    "Tokalon Court": (-86.62309094916849, 30.45255444901667),
-    "Bullock Boulevard": (-86.4683496779446, 30.512959672959298),
-    "Abbey Road": (-86.55402000000001, 30.7358295),
-    "Whitewater Lane": (-86.54622111516, 30.717906644754976),
-    "Preservation Path": (-86.67088016332126, 30.79659149362391),
-    "Brown Place": (-86.54793378394204, 30.715542737439492),
-    "Deana Lane": (-86.52749425540385, 30.943033729492356),
-    "Colchester Court": (-86.6344744996346, 30.43718751927563),
-    "Pinehurst Drive": (-86.55753511344102, 30.443401711975543),
-    "Lyons Place": (-86.71533108458902, 30.704705175661395),
-    "Golden Acres Circle": (-86.47809412734479, 30.813721336444186),
-    "Sam Snead Court": (-86.56219347170382, 30.435455421150074),
-    "Lovering Court": (-86.44236038386545, 30.494222699035237),
-    "Honey Cove Court Southwest": (-86.63562977269486, 30.407752401365514),
-    "Cemetery Road": (-86.65920967796237, 30.408817848430893),
-    "Walker Circle West": (-86.55110844860816, 30.717612674637014),
-    "Southside Drive": (-86.73716383071336, 30.71306985448602),
-    "Mormon Temple Road": (-86.68517466283127, 30.967674793479155),
-    "Memorial Trail": (-86.5474059, 30.458832100000002),
-    "Lin Drive": (-86.53943521096771, 30.459929947476947),
-    "Mixon Drive": (-86.65747923480596, 30.458975506708928),
-    "Tarlac Road": (-86.47074248403734, 30.767132705518822),
-    "Green Drive": (-86.76538153338547, 30.41312594419354),
-    "Hunt Club Street": (-86.66803968378093, 30.43103039931716),
-    "Trish Drive": (-86.58537461573715, 30.71574866788291),
-    "Pointed Leaf Lane": (-86.64376055679959, 30.460067925066163),
-    "Texas Street Northeast": (-86.60278578578105, 30.418533841178522),
-    "Sandpiper Cove Drive": (-86.48191704118729, 30.38639237855352),
-    "Pompano Street": (-86.41807423548335, 30.383494479566597),
-    "Glendale Avenue": (-86.5025454121204, 30.514344045427666),
-    "Chatman Road": (-86.51059213333508, 30.890747875542836),
-    "Tnt Lane": (-86.78437312816737, 30.701372581056),
-    "1st Avenue": (-86.56758642810202, 30.43541170392147),
-    "Haybarn Road": (-86.69792723262518, 30.72096253120161),
-    "Stonebridge Road": (-86.43520029372584, 30.391987999161085),
-    "East Sunset Boulevard": (-86.63306783451867, 30.432982683870918),
-    "Cruttenden Lane": (-86.4790704028254, 30.504557722905773),
-    "Twain Lane": (-86.5915155, 30.705488),
-    "Tully Street": (-86.70691950859879, 30.422748516568525),
-    "Dona Avenue": (-86.6293787365539, 30.436153277649932),
-    "Walnut Avenue": (-86.58251850598009, 30.455543708202114),
-    "Killarney Road": (-86.44571090735373, 30.51645033269789),
-    "North Sea Lane Northwest": (-86.6426025, 30.4147985),
-    "Okeechobee Cove": (-86.40260873817076, 30.393278538315272),
-    "Johnson Street": (-86.50715641254654, 30.525814440815026),
-    "Wedge Court": (-86.47876053964575, 30.405390634945046),
-    "Red Maple Way": (-86.46133432594777, 30.49289074950669),
-    "Fleetwood Drive": (-86.7547005, 30.413457999999995),
-    "Finkel Road": (-86.6804854566293, 30.926345362279164),
-    "Shire Lane": (-86.5695793889619, 30.8079903007034),
-    "Alexandra Place Southeast": (-86.59444647411648, 30.409828860744035),
-    "Stilling Circle": (-86.44406181682943, 30.400909324267417),
-    "Pine Ridge Trace": (-86.47996603440625, 30.406009116210893),
-    "Serenity Lane": (-86.53703840519952, 30.73856897671681),
-    "Gulf Breeze Court": (-86.50340287082254, 30.387355933889985),
-    "Brighton Cove": (-86.650563, 30.4582425),
-    "Powell Drive": (-86.48009562324114, 30.521231816981885),
-    "Sunset Beach Circle": (-86.43002247969605, 30.470136460849307),
-    "Sky Ranch Lane": (-86.66773181775021, 30.852552600568643),
-    "Elise Lane": (-86.48675350556495, 30.397810136271378),
-    "Haylee Lane": (-86.52773913478065, 30.80004895603158),
-    "East Timberlake Drive": (-86.74382189700094, 30.413648012781543),
-    "Forest Shores Drive": (-86.79576553045044, 30.409225509021276),
-    "Walker Lane": (-86.69112770922767, 30.767985849751955),
-    "White Blossom Lane": (-86.6428935, 30.4581725),
-    "Harlan Avenue": (-86.60690640502919, 30.447942967508496),
-    "Brittany Lane": (-86.59896505224933, 30.771164086074982),
-    "Emerald Pointe Drive": (-86.79078546941214, 30.40783562514733),
-    "North 7th Street": (-86.49598581205925, 30.47943915298788),
-    "Pahl Court": (-86.65896480002888, 30.460399984228793),
-    "Bessie Griffith Road": (-86.64016085165757, 30.750685308669144),
-    "Spencer Court": (-86.61272064604006, 30.438959842950016),
-    "Randal Blocker Boulevard": (-86.42448527633496, 30.79760888001178),
-    "Carol Rose Lane": (-86.48783422215607, 30.79941565494223),
-    "Florida Street": (-86.49682229061405, 30.52871037875745),
-    "Sailfish Drive": (-86.62205220050673, 30.399200112851734),
-    "Hands Cove Lane": (-86.58969808534967, 30.458046640387117),
-    "Falcon Way": (-86.40425102969836, 30.74899689325376),
-    "Sandhill Tower Road": (-86.66807505888332, 30.9697889909629),
-    "Slash Pine Court": (-86.65259793088426, 30.42963429531876),
-    "Napa Way": (-86.4166218485189, 30.461770611319032),
-    "Tranquility Drive": (-86.59063984726242, 30.78705275793032),
-    "Woodruff Avenue West": (-86.57249384559681, 30.756927260716505),
-    "North Street": (-86.67633483075701, 30.411104862976618),
-    "Cobb Avenue East": (-86.5636575750806, 30.75633542324411),
-    "Brett Street North": (-86.56909888536981, 30.760970562084637),
-    "Boatner Drive": (-86.55214677319853, 30.460976271710944),
-    "Emerald Court": (-86.7903335, 30.407524000000002),
-    "Bocage Lane": (-86.50322249926363, 30.385290499847287),
-    "West Pine Street": (-86.79515606982305, 30.414737455036363),
-    "Quail Lake Boulevard": (-86.46757825411092, 30.391694051601657),
-    "Baywood Court": (-86.4767374, 30.40897015),
-    "Nautilus Court": (-86.61858939489184, 30.39717182389033),
-    "Church Avenue Southeast": (-86.61124038859612, 30.40710041913369),
-    "Rue d'Etretat": (-86.50047041332307, 30.39753283767613),
-    "Seaway Street": (-86.60958224573012, 30.424654919783922),
-    "Cinderella Court": (-86.62022950064535, 30.454295962579714),
-    "County Line Road": (-86.38865698074076, 30.962556122000308),
-    "Freedom Self Storage Road": (-86.6678460485057, 30.43350231521993),
-    "Summit Drive": (-86.50275472585005, 30.396393775943167),
-    "Gloria Avenue": (-86.6247445063895, 30.454841001577265),
-    "Parsonage Lane": (-86.54606268449349, 30.807702815753387),
-    "Marshbrook Way": (-86.4290414295171, 30.39761591399613),
-    "Butler Circle": (-86.57929289166997, 30.76773034905677),
-    "McCarty Avenue": (-86.54681150036629, 30.774536976807315),
-    "Rue De Fecamp": (-86.50013050000001, 30.3971545),
-    "Schneider Drive": (-86.64475588973494, 30.460792512337353),
-    "Brett Street South": (-86.56437329578095, 30.75569166962438),
-    "Millie Way": (-86.72841515, 30.41082225),
-    "Casa Marina": (-86.73256, 30.410721000000002),
-    "Boyd Circle": (-86.4779050000637, 30.51218999194855),
-    "Jacob Drive": (-86.59034648118457, 30.794752074587088),
-    "Seminole Road": (-86.49760130944709, 30.488024675676467),
-    "Rue Des Tours": (-86.7800823, 30.414785600000002),
-    "2nd Avenue Southwest": (-86.61468627889926, 30.40693096555814),
-    "Bell Ridge Drive": (-86.58705200009125, 30.778766490720027),
-    "Dolphin Point Road": (-86.46184895017053, 30.487588806470438),
-    "Majestic Prince Court": (-86.55390104901579, 30.730077192748663),
-    "Adams Lane": (-86.74751804599948, 30.727896115648672),
-    "Coremo Drive": (-86.55901032801935, 30.745249701579837),
-    "Moonlight Lane": (-86.53086936160477, 30.832173905632928),
-    "O B Gatlin Road": (-86.40821419013783, 30.802530953774262),
-    "Luke Avenue": (-86.42244701508612, 30.3855317876033),
-    "Friendly Lane": (-86.56568092104817, 30.44403532357207),
-    "Driftwood Avenue Southwest": (-86.63331313986711, 30.409313522592473),
-    "East Juniper Avenue": (-86.57526262549467, 30.7650934787877),
-    "Nichols Road": (-86.76175023886765, 30.952981973547942),
-    "Prairie": (-86.58338937789104, 30.705788364422876),
-    "Denise Drive": (-86.61618669018416, 30.719287973388553),
-    "Saint Pierre Cove": (-86.41777126439352, 30.478270029063708),
-    "Sam O'Neal Road": (-86.64256590007734, 30.78010462635791),
-    "Viking Drive Northwest": (-86.64310087100249, 30.414285496589024),
-    "Auburn Road": (-86.61884811748233, 30.44676084625951),
-    "Gartman Road": (-86.5063188008549, 30.93834567330828),
-    "Mooney Road Northeast": (-86.60622878412188, 30.462316833211343),
-    "Pebble Beach Drive": (-86.55528568509938, 30.44417756495478),
-    "Trevor Court": (-86.5748601795218, 30.69954962367503),
-    "Cross Drive": (-86.56625218428512, 30.749431882052424),
-    "Morrisey Circle": (-86.64267542408103, 30.756853229156178),
-    "Montgomery Street": (-86.65291470085059, 30.416667152140427),
-    "Alder Avenue Southeast": (-86.60019433078226, 30.408606859221944),
-    "West Bowers Avenue": (-86.5669472077431, 30.75272977039022),
-    "Bone Creek Road": (-86.73135874248406, 30.738243622430417),
-    "Bethany Drive": (-86.53661644595012, 30.822072935083966),
-    "Virginia Avenue": (-86.49844852421217, 30.499977756341284),
-    "West Leisure Lane": (-86.74354206711425, 30.682198318361245),
-    "Wayne Avenue Northwest": (-86.64840877862773, 30.427309878878532),
-    "Aspen Drive": (-86.55982752707709, 30.45627683916526),
-    "Northview Lane": (-86.57370752359452, 30.701764065179013),
-    "Poincianna Street": (-86.48953876085287, 30.493157173967106),
-    "Kadima Circle": (-86.63648360857907, 30.441752198425142),
-    "Sandy Lane": (-86.53902902629811, 30.82374642530837),
-    "Short Street": (-86.62741548365986, 30.439696528123346),
-    "Canterbury Circle Northwest": (-86.64163959861365, 30.41659399553932),
-    "Deer Avenue": (-86.47879682484184, 30.525244995371715),
-    "Cracker Barrel Drive": (-86.57057351646066, 30.72410510171533),
-    "Sue Circle": (-86.45560888822124, 30.754553148079395),
-    "Cobb Avenue West": (-86.56811756850018, 30.75319341782683),
-    "Mesa Road": (-86.47229958074468, 30.407027468542726),
-    "Hugo Lane": (-86.56627022659818, 30.71841577849158),
-    "Polly Lane": (-86.50975993213066, 30.817373552991228),
-    "Barr Place": (-86.58581600084898, 30.77174995255748),
-    "Burleson Boulevard": (-86.52694737615055, 30.843680969895136),
-    "Aruba Way": (-86.4227094237116, 30.474854377507274),
-    "Dixie Street": (-86.57142419829377, 30.772056521786762),
-    "Stewart Street": (-86.60381713743342, 30.437768583380564),
-    "Sonny Barrow Road": (-86.62958817750001, 30.939308739196832),
-    "Sharon Avenue": (-86.54477441615062, 30.724479389971645),
-    "School Avenue": (-86.57504201857918, 30.75017932014278),
-    "Garden Grove Lane": (-86.48699403815658, 30.91700875103852),
-    "Tequesta Drive": (-86.40210649817473, 30.390533983118733),
-    "Reed Avenue East": (-86.56112260938663, 30.75276502618685),
-    "Yuchi Lane": (-86.48416348643538, 30.4774128412078),
-    "Corbin Court": (-86.46948627987716, 30.50637284352572),
-    "Alex Lane": (-86.67515868850938, 30.756173886922664),
-    "Clark Road": (-86.7055419131516, 30.41336709347815),
-    "Leslie Court": (-86.6276875, 30.4260405),
-    "Rainbird Rise Road": (-86.41323252914995, 30.823925124426655),
-    "Saltair Lane": (-86.74545585208202, 30.406909552419624),
-    "Winward Lane": (-86.56395617107499, 30.446864494897635),
-    "Osborne Drive Northeast": (-86.59015084783195, 30.417615521404617),
-    "Gulfstarr Drive": (-86.41173028071017, 30.38725216647603),
-    "L'Ombre Circle Northeast": (-86.612071076039, 30.45265584519767),
-    "8th Avenue": (-86.57394746214513, 30.443624602764956),
-    "Patio Road": (-86.6207078544098, 30.44740879103129),
-    "Woods Lane": (-86.74795897945161, 30.716089945205642),
-    "Old Ferry Road": (-86.58460949596248, 30.434687150670122),
-    "Hagen Court": (-86.42902181044991, 30.480817911929204),
-    "Stephen Avenue": (-86.78543602042495, 30.411625755893056),
-    "East Glen Avenue": (-86.49316941196238, 30.50533017523337),
-    "Sweetpea Avenue": (-86.39320418863177, 30.748562101773185),
-    "Date Palm Drive": (-86.47235384643028, 30.497373049046413),
-    "Cutter Lane": (-86.57385389528336, 30.44708351166363),
-    "A L Gilman Road": (-86.64455767246554, 30.739147364457565),
-    "Lenwood Jackson Road": (-86.64540252531204, 30.86291739469086),
-    "Southlake Court": (-86.43068503503314, 30.487105832249394),
-    "Lost Creek Drive": (-86.54198619812483, 30.72354043526392),
-    "Bay Street Northwest": (-86.66174820582773, 30.425789718132407),
-    "Green Oak Lane": (-86.46317098566603, 30.492762250932675),
-    "Gainer Avenue": (-86.64018849898115, 30.749847057575604),
-    "Chestnut Street": (-86.64229311880746, 30.752413394352757),
-    "Runnymeade Drive": (-86.558431705916, 30.741501947510724),
-    "Werk Lake Court": (-86.44029599999999, 30.5258835),
-    "Lansing Street": (-86.50778155611908, 30.517430899910263),
-    "Dates Avenue Northwest": (-86.65197344202768, 30.427144785461774),
-    "Caveman Road": (-86.56185113507512, 30.852213809817567),
-    "Normady Road": (-86.57565136569194, 30.796456939777944),
-    "Mountain Drive": (-86.49531656759893, 30.393722828184394),
-    "Cobia Street": (-86.41915680742439, 30.38401672712919),
-    "Nez Perce Trail": (-86.60728016762032, 30.77348576198627),
-    "Bender Lane": (-86.67521891781811, 30.70298779493253),
-    "Monahan Drive Northeast": (-86.60508900959482, 30.431373982758394),
-    "Mooney Road Northwest": (-86.61273802393912, 30.466419774673252),
-    "Casa Marina Street": (-86.7325415, 30.409398999999997),
-    "Emmie Circle": (-86.63477467479892, 30.792700960603145),
-    "Aunt Mary's Loop": (-86.55307387631221, 30.797531036019894),
-    "William Faulkner Drive": (-86.4299724214157, 30.49119850117824),
-    "Arapaho Trail": (-86.60766929562793, 30.76990891484842),
-    "Inverness Road": (-86.48896896894352, 30.476442035779854),
-    "Celeste Court": (-86.75449549999999, 30.412420000000004),
-    "Safe Haven": (-86.7310635, 30.410733499999996),
-    "Dorcas Road": (-86.39470577349158, 30.792580409391675),
-    "Okaloosa Foxpen Road": (-86.72010870189544, 30.73032948877351),
-    "Hiawatha Street": (-86.70741812810765, 30.69232603214687),
-    "Avenue de Fontaine Bleau": (-86.77995941780758, 30.41179908389588),
-    "Manchester Road": (-86.61023852632532, 30.441387445478302),
-    "Parsoni Loop": (-86.5772493931253, 30.70132219994126),
-    "Clearwater Avenue": (-86.50829367539598, 30.515948215151518),
-    "Reynolds Circle": (-86.78699945764369, 30.40985025842547),
-    "Creek Drive": (-86.59554011185803, 30.794425268939772),
-    "Emm Lou Lane": (-86.4843575012351, 30.399576027302672),
-    "Terri Cove": (-86.46206163358072, 30.502491975350477),
-    "Hartson Street": (-86.69767734564675, 30.412446940855073),
-    "Blue Heron View": (-86.4418925, 30.493719),
-    "Martyn Place Northwest": (-86.63167899442178, 30.427760499976937),
-    "Megan Lane": (-86.76360137807166, 30.774453764843496),
-    "Franklin Road": (-86.71873127649529, 30.972156965702354),
-    "Sea Gull Lane": (-86.48968866196257, 30.397671358549506),
-    "Pond Creek Road": (-86.42235763246488, 30.842652578092494),
-    "Skipper Avenue": (-86.60480234768706, 30.442430945690177),
-    "3rd Street": (-86.57813162507912, 30.441393300937065),
-    "Kel-Wen Circle": (-86.4174044506228, 30.38844435009823),
-    "Mississippi Avenue": (-86.49077645212417, 30.49366983942419),
-    "Deal Avenue Northwest": (-86.64504520262857, 30.415532952771112),
-    "Dorado Avenue": (-86.6142447651797, 30.397993509282507),
-    "Ginkgo Avenue": (-86.47116989137434, 30.53374096345723),
-    "Tilley Road": (-86.49402819546596, 30.833082748777358),
-    "Saint Andrews Cove North": (-86.425742, 30.479438999999996),
-    "Conyers Street": (-86.57553688566448, 30.74526049763294),
-    "Sequoia Drive": (-86.65412749999999, 30.438659),
-    "Blue Pine Lane": (-86.41237834296597, 30.488761414064967),
-    "Leah Miller Drive Northwest": (-86.63163211748639, 30.42246147079993),
-    "Woodland Street": (-86.53166328741273, 30.763176790898584),
-    "Titi Court": (-86.5748725052364, 30.4576427083075),
-    "Lagoon Drive": (-86.4910498806608, 30.387920592987697),
-    "Sandy Ridge Circle": (-86.76116325, 30.410755),
-    "Camellia Place": (-86.496365, 30.529275),
-    "Donald Ray Adams Road": (-86.767991, 30.717321),
-    "Silver Wood": (-86.6523945, 30.4413895),
-    "Winlake Court": (-86.76122647248063, 30.413458532648896),
-    "Spiller Way": (-86.63660300000001, 30.437444000000003),
-    "Southern Oaks Court": (-86.64416179807377, 30.44683144661944),
-    "Larkin Place": (-86.61254200356088, 30.423573259939136),
-    "Short Leaf Court": (-86.6592015, 30.428659),
-    "South Greenwood Cove": (-86.41195530843694, 30.47111864725028),
-    "Olympia Court": (-86.62435085035976, 30.451298787934142),
-    "East Pine Street": (-86.79012649999999, 30.4140815),
-    "Andalusia Street Northeast": (-86.6107946261196, 30.42290098948405),
-    "Cypress Street": (-86.66070458367074, 30.42606153700822),
-    "Saint Andrews Cove South": (-86.4254457900582, 30.477620952745244),
-    "Cherokee Nene": (-86.6050270430941, 30.787535735587202),
-    "West John Sims Parkway": (-86.4961723758089, 30.522924911668873),
-    "Gordon Street": (-86.57997258122602, 30.752235580937406),
-    "Shoal Creek Cove": (-86.5544546436269, 30.72151335763767),
-    "Wedgewood Lane Northeast": (-86.61051161505596, 30.46320042155299),
-    "Tupelo Avenue Southeast": (-86.60543522899962, 30.409245904076617),
-    "Moss Drive": (-86.58819483920237, 30.715403353982616),
-    "East Audrey Drive Northwest": (-86.64425826388518, 30.41977250637433),
-    "Blaylock Street": (-86.55522358167403, 30.766565326883402),
-    "Forest Breeze Court": (-86.60633200000001, 30.434798),
-    "Cooper Lane": (-86.76634347304147, 30.701353433788448),
-    "Adams Avenue": (-86.50034959019858, 30.5091668229239),
-    "Okahatchee Circle Southeast": (-86.59187167558308, 30.409728081694823),
-    "Chickasaw Way": (-86.45405891453925, 30.40122411531869),
-    "Bond Circle": (-86.45154492072116, 30.526977981848468),
-    "Cayson Avenue": (-86.59303435151776, 30.76371324513749),
-    "Red Horse Road": (-86.70000900568503, 30.427761464055347),
-    "22nd Street": (-86.46271839618161, 30.50779231627476),
-    "Jade Loop": (-86.45168166383544, 30.392041721002272),
-    "Sandalwood Drive Northwest": (-86.64213102540299, 30.414264000614416),
-    "Michael Avenue": (-86.78535750792484, 30.414552857557837),
-    "Bryant Bridge Cutoff Road": (-86.78034550236269, 30.709438577607678),
-    "Rockhill Cemetery Road": (-86.60197694684699, 30.981632472619246),
-    "Jenna Jessi Road": (-86.6277505885753, 30.44380790880713),
-    "Cedar Avenue North": (-86.47812562907461, 30.52008491662178),
-    "Paradise Road": (-86.46944789591188, 30.50777673026936),
-    "Woodcrest Ridge": (-86.63155430510155, 30.4608531159973),
-    "Laura Lane": (-86.41590011953792, 30.465987381418667),
-    "Faye Drive": (-86.75238371244802, 30.406110654916613),
-    "Dodson Road": (-86.71796220995725, 30.759303381434922),
-    "Tula Place Northwest": (-86.61827649865826, 30.42027806072785),
-    "Springdale Drive": (-86.4890368031973, 30.803165779821747),
-    "Jefferson Street": (-86.47010858354993, 30.527576277064743),
-    "Drone Street": (-86.52773419644953, 30.632613977807573),
-    "Pappa Lawrence Road": (-86.48729885209364, 30.911181796853462),
-    "Varazze Cay": (-86.40425105, 30.380726199999998),
-    "Monahan Court": (-86.61129376392982, 30.432286543104833),
-    "Meadow Lane": (-86.65696801757016, 30.457510751889448),
-    "Benarr Avenue Northwest": (-86.64506083770598, 30.42209885278236),
-    "Cathridge Trace": (-86.63140706870189, 30.462588920574134),
-    "Saint Martins Cove": (-86.41686597028092, 30.478900101059125),
-    "Cedar Avenue South": (-86.47831389195811, 30.503698309944674),
-    "Sterling Court": (-86.45720750000001, 30.404306499999997),
-    "Howard Drive": (-86.45245609273275, 30.531627747278424),
-    "Oakridge Road": (-86.63309490325481, 30.446926667800785),
-    "Kitty Lane": (-86.49074907082658, 30.755360773591075),
-    "Eccles Road": (-86.64397020048641, 30.448755315718053),
-    "Summer Hills Lane": (-86.63759590464056, 30.462698710845224),
-    "Lbj Sr Drive": (-86.637598002638, 30.46199098323509),
-    "Affirmed Court": (-86.554614, 30.731),
-    "Harielson Road": (-86.43808180044273, 30.752895319140816),
-    "Stamps Avenue": (-86.53682307756678, 30.766763755151263),
-    "Arnies Lane": (-86.75025507640868, 30.697094443819577),
-    "Rue Des Marseilles": (-86.7800955, 30.414014),
-    "Persimmon Way": (-86.46260072707948, 30.496822665153644),
-    "Marquette Place": (-86.64425049999998, 30.4359325),
-    "Kathy Avenue": (-86.6059877171102, 30.46124419738894),
-    "Cardinal Lane": (-86.48866888142221, 30.39769648092337),
-    "Highland Drive Northwest": (-86.61753632713442, 30.418654088406765),
-    "Martins Mill Road": (-86.75667419355871, 30.84000368745556),
-    "Victoria Avenue Northwest": (-86.63174519254802, 30.4183840151011),
-    "Robinson Road": (-86.40532788454247, 30.980585873622566),
-    "Anna Street": (-86.49432332584503, 30.39559690207628),
-    "Amigo Road": (-86.4857768, 30.47863525),
-    "Paula Court": (-86.66094420472075, 30.416536870604677),
-    "Newcastle Court": (-86.42119780232706, 30.46607265628662),
-    "West Park Drive": (-86.7192315, 30.41357),
-    "Georgia Avenue": (-86.5048320271065, 30.48390336362865),
-    "6th Avenue": (-86.57297491874077, 30.441308575835556),
-    "Burnette Avenue Northwest": (-86.6628919224926, 30.425799208711936),
-    "Klaus Conrad Drive": (-86.42096337323144, 30.487767381718665),
-    "Sunnyside Avenue": (-86.46309522724715, 30.960180346808748),
-    "Pacific Silver Court": (-86.6456955758275, 30.446779429867643),
-    "West Cypress Avenue": (-86.57496900735093, 30.762783339371495),
-    "Turkey Trott Road": (-86.78962688977677, 30.708077770804433),
-    "Thames Road": (-86.64705054163218, 30.980767663989628),
-    "Wise Avenue": (-86.4638196833922, 30.513953103712076),
-    "Long Street": (-86.55054650829473, 30.769343770806838),
-    "Banner Court": (-86.5595021, 30.740138549999994),
-    "Renee Court": (-86.545962, 30.716614999999997),
-    "Anchors Street": (-86.45781965646286, 30.507587151483172),
-    "Hyde Park Drive": (-86.5524394958652, 30.771091144987018),
-    "Wheeler Place": (-86.5399718963905, 30.780497140167714),
-    "Elm Avenue West": (-86.57568070018912, 30.763577342453615),
-    "Mohican Way": (-86.5572214, 30.7190808),
-    "High Bridge": (-86.66920898791908, 30.909430302535743),
-    "Carver Avenue": (-86.55810251152097, 30.77600766922707),
-    "White Tail Circle": (-86.44442691154488, 30.493259707233733),
-    "Seminole Circle": (-86.4744543793976, 30.52893739487343),
-    "Chambray Road": (-86.45894008039657, 30.80603054268659),
-    "McClelland Street": (-86.57506790725849, 30.74202185735178),
-    "Wills Way": (-86.66942738016344, 30.817874044544936),
-    "Moroni Drive": (-86.64544739182705, 30.454452091277062),
-    "Railroad Avenue West": (-86.5714301004372, 30.755995623151144),
-    "Seiffert Road": (-86.4852888513672, 30.806944696472545),
-    "Clubhouse Drive": (-86.39898198938468, 30.391091644568483),
-    "Union Street": (-86.64266975023673, 30.457392485119104),
-    "Tanglewood Court": (-86.65136279871139, 30.435967161747563),
-    "Tilden Street Northwest": (-86.65029882906238, 30.42559270374568),
-    "Minor Drive": (-86.5379758888956, 30.470891187008032),
-    "Vintage Circle": (-86.49773768171748, 30.40851974775748),
-    "Kettering Court": (-86.6325550208276, 30.44109063276459),
-    "Rosanna Street": (-86.62562316120359, 30.466530468433387),
-    "Birch River Avenue": (-86.56324482050984, 30.766838512766036),
-    "Dade Road": (-86.4964511, 30.48699945),
-    "Starfish Avenue": (-86.62413084499339, 30.39844868604426),
-    "Old Coastal Highway": (-86.47572006057558, 30.520840320710914),
-    "Lake Avenue": (-86.76132252765457, 30.412568869322044),
-    "Timberland Way": (-86.64722700454966, 30.43098651349653),
-    "Azalea Drive": (-86.50102209059342, 30.39672711222412),
-    "Barron Court": (-86.582025607043, 30.444294201159533),
-    "Lake Drive Northwest": (-86.63408887406794, 30.42314179511876),
-    "Parkwood Drive": (-86.41497835887367, 30.4882269042308),
-    "Willard Circle Northwest": (-86.622579, 30.418929),
-    "Placid Drive": (-86.5977054301266, 30.443637147973696),
-    "Poinsetta Street": (-86.55192357899068, 30.774762050387995),
-    "Overlord Drive": (-86.73753143817102, 30.62793446320725),
-    "Gilmore Road": (-86.67788485318617, 30.729530223981204),
-    "Alabama Avenue Northwest": (-86.61507657353663, 30.4201555477789),
-    "Lincoln Street North": (-86.57434855, 30.755239149999998),
-    "Aarons Reef": (-86.401485362722, 30.395128623852745),
-    "Barks Drive": (-86.63720670370333, 30.453662275255258),
-    "Heritage Road": (-86.63197149452957, 30.46644998427499),
-    "Eider Circle": (-86.40125768127335, 30.738916567727788),
-    "Jones Avenue": (-86.48525315473039, 30.519118370213167),
-    "Arthur Ashe Court": (-86.63966911155768, 30.45130029368649),
-    "Aurora Drive": (-86.54033011554523, 30.776745168754232),
-    "Martin Street": (-86.5613815, 30.764341),
-    "Juniper Street": (-86.47861120151373, 30.399464634787282),
-    "Mashourn Forks Road": (-86.73986795608782, 30.963459483900078),
-    "East Beech Avenue": (-86.57047028777319, 30.760801214692204),
-    "Shady Street": (-86.62567212513156, 30.461419379962265),
-    "Jax Rabbit Drive": (-86.43227469789397, 30.776512966340565),
-    "Dolphin Street": (-86.41580226527788, 30.383236464045357),
-    "Redwood Avenue": (-86.4590183372896, 30.508247757875914),
-    "Sunset Beach Boulevard": (-86.42842875536827, 30.47117801457656),
-    "Aaron Baker Road": (-86.67335897064441, 30.79634600676167),
-    "Choctawhatchee Road Southeast": (-86.59062752635242, 30.409738601097253),
-    "Timpochee Lane": (-86.39684004761034, 30.454757119129646),
-    "Greenwood Street": (-86.61973336138871, 30.44397044389517),
-    "Lincoln Street South": (-86.57079920524554, 30.750292759590838),
-    "Hayes Place": (-86.57545897992966, 30.746123772841763),
-    "Brooks Circle": (-86.5059775, 30.514211000000003),
-    "Golf Course Drive Northeast": (-86.61126191674613, 30.45874791048187),
-    "Forsman Circle Northwest": (-86.65437310416674, 30.4201091027647),
-    "Church Street": (-86.56086080355188, 30.749397802771067),
-    "Bear Road Northwest": (-86.62570434380594, 30.455718632975536),
-    "Emily Circle": (-86.65010276097918, 30.445378858358914),
-    "Tucker Lane": (-86.55415198470212, 30.7808706271855),
-    "Sonny Lane": (-86.5097440585238, 30.816925988289526),
-    "Victoria Place Northwest": (-86.63618752062239, 30.416624000581738),
-    "Clary Drive": (-86.46415870453086, 30.96183235060286),
-    "Anderson Drive": (-86.66814977687301, 30.411821891407442),
-    "Sparkleberry Cove": (-86.50080834064741, 30.534416804020225),
-    "Chantilly Cove": (-86.43036042907343, 30.476942163569085),
-    "Bream Avenue": (-86.60363145140033, 30.397980496731556),
-    "Norriego Drive": (-86.49527438011225, 30.3872025939443),
-    "Forest Court": (-86.60988103387064, 30.437435596631808),
-    "Ridgecrest Road": (-86.48290672948643, 30.801294243939346),
-    "Twilight Drive": (-86.53088859026771, 30.83302540648603),
-    "Chicago Avenue Southeast": (-86.60151745689338, 30.40877330108702),
-    "Bryn Mawr Boulevard": (-86.64955483474145, 30.418200912044934),
-    "Sunburst Drive": (-86.4147549415076, 30.821114096125804),
-    "Teepee Court": (-86.45152181095415, 30.40174934800582),
-    "Ezra Cook Road": (-86.70251664430701, 30.984525461636537),
-    "Memorial Parkway Northwest": (-86.63054911734675, 30.423690356628608),
-    "Amis Drive": (-86.56739350000001, 30.442081),
-    "Tanager Road": (-86.628202136927, 30.465197009026074),
-    "Jonquil Street": (-86.51595719160535, 30.821660730297133),
-    "Scottsdale Drive": (-86.67379072338042, 30.413053847364022),
-    "Yellow Bluff Road": (-86.41368405101015, 30.827819386364173),
-    "Doyle Street": (-86.60008548695147, 30.76849487241431),
-    "Charlie Day Road": (-86.6813077770434, 30.769883690466102),
-    "Willow Lane": (-86.49767327130557, 30.793085094510452),
-    "Brookmeade Drive": (-86.55936492792277, 30.742447620115822),
-    "Point Center Road": (-86.61275474346199, 30.711235002402965),
-    "Huck Finn Drive": (-86.58902532158913, 30.70644018653251),
-    "Ross Court": (-86.56243046328363, 30.711039965801312),
-    "Flora Lee Lane": (-86.54913713520993, 30.793586136637856),
-    "Patrick Drive": (-86.63679595344766, 30.45126393614514),
-    "Kylito Circle": (-86.52688780739572, 30.84437414626582),
-    "Eastview Avenue": (-86.4882769639051, 30.50624491014169),
-    "1st Street": (-86.76371610349928, 30.41173660673095),
-    "Lark Street": (-86.62840085588861, 30.4659551452473),
-    "North Rayburn Street": (-86.55965359896508, 30.759116996298967),
-    "Newman Street": (-86.52690448374767, 30.754515533211453),
-    "Harbeson Avenue Northeast": (-86.60932802984324, 30.4144977974474),
-    "Spence Circle": (-86.49964356092352, 30.51902251254785),
-    "Racoon Trail": (-86.43178054025623, 30.492250009864264),
-    "Cabana Way": (-86.57911126096803, 30.758981018642828),
-    "Stanley Lane": (-86.70116700290332, 30.763274166454362),
-    "Chickamauga Lane": (-86.4521644227425, 30.399872652839054),
-    "US Highway 90 West": (-86.40200931718257, 30.74341852072264),
-    "Medley Drive Northwest": (-86.57800647506724, 30.768919777486957),
-    "Hatchee Drive": (-86.57926961280045, 30.716258073357366),
-    "Flagler Road": (-86.48895650547685, 30.47704701396046),
-    "Shoal River Drive": (-86.55735929994829, 30.703818844739633),
-    "Canopy Lane": (-86.65086887741562, 30.442979422369394),
-    "Dunlop Lane": (-86.55948487961969, 30.705518842302205),
-    "Randolph Court": (-86.56749148472852, 30.748776807607822),
-    "Aucilla Cove": (-86.48779549934216, 30.48462137811823),
-    "Cloverdale Boulevard": (-86.64229796417588, 30.4514230345404),
-    "Via del Sol": (-86.39924427862273, 30.384437102364902),
-    "Choctaw Road": (-86.54057532092966, 30.458404567170327),
-    "Martin Luther King Jr Avenue": (-86.57221869251468, 30.754670595896993),
-    "Haskell Langley Road": (-86.52851526951086, 30.838073043375537),
-    "Escanaba Avenue": (-86.50707643738859, 30.51839056478693),
-    "Countryside Court": (-86.6389030682652, 30.458439897248372),
-    "Kathleen Court": (-86.46445669943786, 30.520646402063996),
-    "Clifford Street": (-86.63414051411459, 30.442147721910825),
-    "Oaklawn Street": (-86.62073350950025, 30.443988000242268),
-    "Walker Drive": (-86.69101914124377, 30.76219168883963),
-    "Ventura Circle Northwest": (-86.62928559241627, 30.428758008925442),
-    "Easy Street": (-86.75320989009224, 30.67291320425167),
-    "East 3rd Avenue": (-86.57140855041057, 30.767949810171537),
-    "Robinwood Drive Southwest": (-86.61861935383037, 30.4091540652422),
-    "Fairway Drive": (-86.4923604467886, 30.527344909524608),
-    "Breakwater Drive": (-86.4367055081059, 30.4065754812411),
-    "Twin Bay View": (-86.60475177053785, 30.451902674803584),
-    "Bowles Crescent": (-86.48386429368192, 30.476931446696003),
-    "Lonnie Booker Road": (-86.77857612372479, 30.95796049916942),
-    "Bayou Woods Court Northwest": (-86.62146899999999, 30.4252515),
-    "Dancing Cloud Court": (-86.45906269127278, 30.391497415736225),
-    "Coral Court": (-86.61329733392553, 30.396887099312355),
-    "Dawson Ranch Road": (-86.51799024825286, 30.85059030064639),
-    "Miracle Strip Pkwy Southwest": (-86.6150241646096, 30.40421982872147),
-    "West Miracle Strip Parkway": (-86.66533229970386, 30.409805859629756),
-    "Parkside Lane": (-86.41763299041483, 30.49474953139379),
-    "Carlyle Court Northeast": (-86.60375993070267, 30.45670065586768),
-    "Mc Griff Street Northeast": (-86.60945581254234, 30.41423027186345),
-    "Hospital Drive": (-86.63408163116658, 30.457100402948843),
-    "Border Creek Drive": (-86.5436286163918, 30.79526664997215),
-    "Hidden Trail": (-86.65277517342575, 30.463263051457027),
-    "Poplar Creek Church Road": (-86.74905574971311, 30.748551344111515),
-    "West Beech Avenue": (-86.57484979250218, 30.757873477312714),
-    "Jefferson Place Northwest": (-86.62177588416024, 30.414004993360532),
-    "Krest Drive": (-86.58807899105129, 30.714485260777177),
-    "Fir Avenue": (-86.47234280915849, 30.530860340010083),
-    "Nikki Lane": (-86.4617306794108, 30.785250643024806),
-    "Bambi Drive": (-86.48670266407687, 30.414812918184104),
-    "Verns Valley": (-86.69107045657, 30.7604309213814),
-    "Carann Place": (-86.7017576385409, 30.83751135311056),
-    "Mill Run Drive": (-86.58222002330788, 30.808010708355063),
-    "Gibbs Avenue": (-86.60822203357586, 30.461411816391248),
-    "Shangrila Road": (-86.42008043938449, 30.82876628375065),
-    "Trunberry Cove North": (-86.42393559277853, 30.479755623407517),
-    "Bridgewater Court": (-86.75609825000001, 30.409827999999997),
-    "Regatta Bay Boulevard": (-86.41655189758742, 30.39456102390052),
-    "Earl Street Northwest": (-86.65692150000001, 30.426857499999997),
-    "Monroe Street": (-86.67935846261987, 30.79715578176987),
-    "Waynel Court Southeast": (-86.59641258481766, 30.4107055251739),
-    "Annie Jo Road": (-86.75393673920894, 30.687280334581846),
-    "Shelby Lane": (-86.75173478932673, 30.704684530239653),
-    "Andy Lane": (-86.50972324590973, 30.813137503084615),
-    "Old Ebenezer Road": (-86.51787729670734, 30.9930327753296),
-    "Inverrary Drive": (-86.4047278470882, 30.389488902522032),
-    "Bluegrass Parkway": (-86.39850692105337, 30.993130605662227),
-    "Azalea Avenue": (-86.40122859528293, 30.74930892862811),
-    "Museum Drive": (-86.53830737563615, 30.47165484004552),
-    "Sussex Road": (-86.6482034975339, 30.419644606813755),
-    "Porter Lane": (-86.55999489543034, 30.787634625592116),
-    "Playground Drive": (-86.56586779023955, 30.760160517365616),
-    "Oatman Drive": (-86.52661549999999, 30.8159095),
-    "Benton Avenue": (-86.44897091216347, 30.510172029471327),
-    "Cedar Lane": (-86.52369880203163, 30.79704753566773),
-    "Fenwick Avenue": (-86.66519999372973, 30.43012513813565),
-    "Lumber Ridge Road": (-86.4038929744319, 30.836788477751867),
-    "Rankin Road Avenue": (-86.73192219571793, 30.41100165426036),
-    "Rankin Road": (-86.73185463694261, 30.409801121115475),
-    "Adams Drive": (-86.58089690356864, 30.780566685879602),
-    "Memorial Place": (-86.58023395424676, 30.771559296133077),
-    "Griffith Mill Road": (-86.70676460944553, 30.763873100112527),
-    "Seminole Trail": (-86.58126050563949, 30.771523301691545),
-    "Ibiza Cove": (-86.42738280160646, 30.48967149678562),
-    "East Trovare Street": (-86.39901870051686, 30.384628907238735),
-    "Mediterranean Circle": (-86.42776908814447, 30.490215905894942),
-    "Apache Road": (-86.59416292775309, 30.780662381473288),
-    "Palm Springs Court": (-86.5583369242012, 30.442432638735692),
-    "Clements Street Northeast": (-86.60376236112103, 30.42049665087156),
-    "Dogwood Lane": (-86.56539767018927, 30.800400272572645),
-    "Overbrook Circle": (-86.6437404923875, 30.43428849186231),
-    "Palm Drive": (-86.57805188534905, 30.434963136863352),
-    "Jasmine Avenue": (-86.48675991090083, 30.491255532454154),
-    "Jay Street": (-86.63103212033269, 30.46665725539594),
-    "Suzy Q Lane": (-86.56138770955305, 30.717390131975822),
-    "Parkview Avenue": (-86.52726084528638, 30.75953431677243),
-    "Wheeler Lane": (-86.74116331252645, 30.759734476031557),
-    "Wild Oak Avenue": (-86.4826655047434, 30.399749108827393),
-    "Goldfinch Way": (-86.40174643662077, 30.750114632499123),
-    "Northview Drive": (-86.58849322179638, 30.717340402747567),
-    "Derby Lane": (-86.43896800787056, 30.39295047779575),
-    "Wilson Lane": (-86.55972084601316, 30.707587550891212),
-    "Woodham Court": (-86.60596080833112, 30.437063202425765),
-    "John Melvin Pit Road": (-86.74433646738932, 30.752770924686164),
-    "Calumet Court": (-86.57492963078832, 30.799843690349565),
-    "Norwood Court": (-86.6420865, 30.431407),
-    "Standish Lane": (-86.62257951390788, 30.43747652412391),
-    "Sam Jordan Road": (-86.63109099224411, 30.683885992279375),
-    "Greenbrier Circle": (-86.60338687494438, 30.431187862294802),
-    "John B Cadenhead Road": (-86.49146529768599, 30.949139499710288),
-    "Hooper Drive Northwest": (-86.64855686026725, 30.422628951833456),
-    "North Brook Drive": (-86.5448194887787, 30.798695362070568),
-    "Broadview Circle": (-86.51850941730503, 30.81081123375927),
-    "Flamingo Road": (-86.50714199339487, 30.81438121729536),
-    "Wisteria Court Northwest": (-86.6148305, 30.426184000000003),
-    "Brackin Street": (-86.55958164443432, 30.76389041224685),
-    "Cape Lane": (-86.467723101205, 30.49768953024186),
-    "Mansfield Drive": (-86.57913743027935, 30.79279496566853),
-    "Windrush Cove": (-86.42639660343319, 30.469036866418747),
-    "Upia Drive": (-86.58848219957994, 30.70996811339276),
-    "Golden Court": (-86.47838365175474, 30.81371866760249),
-    "Casca Belles Street": (-86.72382818192266, 30.413642055502855),
-    "Crescent Circle Southwest": (-86.61569611749103, 30.411905476965003),
-    "Williams Court": (-86.63294343957004, 30.44292675994883),
-    "Lancaster Drive": (-86.44046316386407, 30.49734169570568),
-    "West Dogwood Drive": (-86.55799674804707, 30.810929073395652),
-    "London Avenue Northwest": (-86.624776533072, 30.42158149099112),
-    "Red Bird Lane": (-86.74857301166305, 30.696826340481838),
-    "Springhill Road": (-86.57105483546961, 30.43483503089221),
-    "Rocky Drive": (-86.45954579585927, 30.50689413892553),
-    "Nap Knob": (-86.68865396817974, 30.692294182743964),
-    "Longwood Drive": (-86.58872582116712, 30.466134294903767),
-    "Medley Drive": (-86.57807662609324, 30.767941786343172),
-    "Saint Andrews Drive": (-86.47100436014959, 30.498280781271607),
-    "Tommy Thames Circle": (-86.683540028048, 30.9926169542267),
-    "Walkedge Drive Southeast": (-86.59065799999999, 30.4067025),
-    "North Curacao Cove": (-86.42156, 30.473894),
-    "Cascade Way": (-86.58743310892059, 30.775768450131388),
-    "Kathleen Place Northwest": (-86.63639536239548, 30.41842423118597),
-    "Green Oak Drive": (-86.56251950000001, 30.724152000000004),
-    "Verb Street": (-86.62578719216596, 30.453091333468844),
-    "Westview Drive": (-86.5925168643176, 30.71400716690894),
-    "Nicole Lane": (-86.56230007193744, 30.727900623401485),
-    "McCallum Road": (-86.41592654113026, 30.802146992679926),
-    "Muskegon Avenue": (-86.50897255706406, 30.519328143177788),
-    "Roxanna Road": (-86.60668558292257, 30.452517167103856),
-    "Moreno Point Road": (-86.48915830823978, 30.38726140932844),
-    "Regatta Bay Road": (-86.4138428, 30.38855495),
-    "Glenburn Court": (-86.43909823312428, 30.496174515411944),
-    "Jake's Hill Road": (-86.41738627853779, 30.96650048440104),
-    "Stroehl Lane": (-86.48883471394984, 30.80931500791873),
-    "Enzor Road": (-86.59715583546897, 30.761873454944357),
-    "Marlowe Drive": (-86.6083220073992, 30.43848857517598),
-    "Sotir Street Northwest": (-86.62551131286493, 30.42412150032652),
-    "North Pearl Street": (-86.57477706773497, 30.773186471040777),
-    "Lewis Turner Boulevard": (-86.63097440041588, 30.460099297763012),
-    "McVicker Road": (-86.69522962694653, 30.8260792923616),
-    "Brookridge Trace": (-86.63249435346921, 30.462397925779435),
-    "Industrial Drive": (-86.56271437584304, 30.775960534264478),
-    "Stallion Drive": (-86.41286497993227, 30.758180541210496),
-    "Scirocco Loop": (-86.63478613991914, 30.46196023048775),
-    "Westview Avenue": (-86.49015996390968, 30.50384454434121),
-    "Brookside Way": (-86.66649958357944, 30.748454753552195),
-    "Lake Lane": (-86.55038948470242, 30.81542536853508),
-    "Trent Street": (-86.66451099974913, 30.42934351579989),
-    "Neptune Court Northwest": (-86.62408980131738, 30.428426931714757),
-    "Promised Land Drive": (-86.69900220486558, 30.786484525968245),
-    "Cruz Avenue": (-86.69513790552774, 30.425799164746362),
-    "Whisperwood Lane North": (-86.60615, 30.46815395),
-    "Paige Lane": (-86.56348078083388, 30.810365923284547),
-    "Sea View Drive": (-86.49240810782835, 30.394122130536203),
-    "Pryor Drive": (-86.67540571267874, 30.41176420047613),
-    "Melissa Lane": (-86.50628189612175, 30.82427663586398),
-    "Marimba Street": (-86.72485145925157, 30.412212658476463),
-    "Pioneer Road": (-86.62547348071901, 30.74618999889534),
-    "Armadillo Trail": (-86.43186830294498, 30.49284233116424),
-    "Matthew Boulevard": (-86.4305146268668, 30.385628119570626),
-    "Venice Avenue": (-86.64307215, 30.4415627),
-    "Robin Road": (-86.50513062044615, 30.813807632395903),
-    "Fenny Way": (-86.58620373442366, 30.77576227443638),
-    "Perry Smith Road": (-86.65771832654089, 30.734785532159023),
-    "Williams Avenue East": (-86.5539516197947, 30.747307349601407),
-    "Sunny Drive": (-86.79043674435307, 30.402933122834586),
-    "Blessinger Drive": (-86.65861019263704, 30.441363902704015),
-    "Robert Taylor Road": (-86.5264859504158, 30.743595545364055),
-    "Lake Amick Drive": (-86.44388779882858, 30.53170279514542),
-    "Spruce Lane": (-86.46104331405745, 30.767314834493767),
-    "Blue Springs Cove": (-86.66301574580048, 30.746434501805744),
-    "Whisperwood Lane South": (-86.60618499719415, 30.46624194995917),
-    "Crooked Creek Cove": (-86.45716451578552, 30.526605749856987),
-    "Drifting Sand Trail": (-86.45462659622913, 30.39233139179979),
-    "Gerold Street": (-86.61568849978325, 30.44439051238511),
-    "Muirfield Way": (-86.4275639136282, 30.47516275234863),
-    "Firefly Trail": (-86.77723698424315, 30.846165202277575),
-    "Scenic Court": (-86.55417475934031, 30.70325979332625),
-    "Pembroke Place Northeast": (-86.60834274327632, 30.452689723858235),
-    "Hondo Avenue": (-86.62576002075136, 30.454857377730615),
-    "Angela Lane": (-86.66309268962328, 30.419002007071303),
-    "Truxton Avenue": (-86.6159365132174, 30.447305434492407),
-    "Topaz Court": (-86.61397685, 30.437050550000002),
-    "Oakcrest Drive": (-86.49406197406434, 30.80232783518153),
-    "Stonehenge Circle": (-86.64872199999999, 30.4150855),
-    "Juanita Avenue": (-86.49750874212218, 30.40133961990417),
-    "Cherie Court Northwest": (-86.63641895382308, 30.425318909220852),
-    "Gmc Lane": (-86.62148953862554, 30.73632293511086),
-    "Nordic Lane Northwest": (-86.6426335, 30.41359),
-    "Kiwi Place Northeast": (-86.6084710001832, 30.413310491586504),
-    "Two Circle Road": (-86.45614037507526, 30.392146569606012),
-    "Panama Drive": (-86.58086815005707, 30.77275139453891),
-    "Kensington Court Northeast": (-86.60602469608519, 30.454857703407935),
-    "Rickey Avenue": (-86.60211357665887, 30.444558099719707),
-    "North Spring Street": (-86.57295930782362, 30.758567665475365),
-    "Ash Road": (-86.5231425, 30.7949655),
-    "Hummingbird Avenue Northwest": (-86.61733113529007, 30.42010927684084),
-    "Poppy Street": (-86.62737198844636, 30.4415690578173),
-    "Bellbouy Landing": (-86.44190672662312, 30.407338776705284),
-    "Fairview Drive": (-86.65177974448399, 30.443101420290656),
-    "Fairway Lakes Drive": (-86.43265541110847, 30.485342497676665),
-    "Fallin Waters Drive": (-86.7152635, 30.410585349999998),
-    "Lula Belle Lane Northwest": (-86.63533622542323, 30.414717122932718),
-    "Kingston Court": (-86.64284595993504, 30.40857934943315),
-    "Whitney Court": (-86.61231621544596, 30.7136805173393),
-    "Heron Circle": (-86.40214904213305, 30.736466729335397),
-    "Thomas Road": (-86.45556269148553, 30.981704960566816),
-    "Courtney Lane": (-86.55505808605355, 30.73598849068881),
-    "Deerfield Drive": (-86.45851300014417, 30.40457111254451),
-    "Regatta Drive": (-86.49065243973891, 30.520240671515985),
-    "Turkey Track Road": (-86.42523962871799, 30.821110873961672),
-    "Rainbow Drive Northwest": (-86.62003658115331, 30.42166314014656),
-    "Corey Road": (-86.52775820313369, 30.942938118162438),
-    "Feldon Drive": (-86.57761019755861, 30.706152978242923),
-    "Candlewood Lane": (-86.55020549263477, 30.763840741346367),
-    "Kel-Ray Lane": (-86.64000184161374, 30.748960745641316),
-    "Crawford Road": (-86.52508632776014, 30.740586766341334),
-    "Edge Street": (-86.65412780867868, 30.440641965162488),
-    "North Karick Lake Road": (-86.6404304816845, 30.908267170544192),
-    "Retreat Inlet": (-86.64632041277103, 30.73250962068928),
-    "Victory Lane": (-86.5570855966697, 30.759839180791786),
-    "Bear Creek Road": (-86.46306050720102, 30.771655354437836),
-    "Woodcliff Drive": (-86.49594900898242, 30.799582425035226),
-    "Walter Circle": (-86.63168284957605, 30.444585733202484),
-    "Saint Charles Avenue": (-86.49635616389985, 30.498491956525452),
-    "Shadyside Court": (-86.47242053297732, 30.509382329020287),
-    "Naughton Drive": (-86.58816950133446, 30.716298734548143),
-    "Hillcrest Drive": (-86.5853851208541, 30.464625154216545),
-    "Amber Lake Court": (-86.42490243265986, 30.467821558567987),
-    "Williams Avenue West": (-86.56443852625368, 30.74772729477322),
-    "Circle Drive": (-86.6158010713645, 30.437621367726774),
-    "Lost Horse Circle": (-86.43368919515902, 30.49400932260428),
-    "Wheeler Street Southeast": (-86.592007987279, 30.410348576982443),
-    "Opportunity Drive": (-86.52716591312937, 30.758191716394034),
-    "Crestview Avenue": (-86.47162277878122, 30.52757222696129),
-    "Jordan Road": (-86.64691133685581, 30.951303425361917),
-    "Sandra Drive": (-86.75576410300111, 30.406684206355003),
-    "Phillips Drive": (-86.57195329256139, 30.779419739381005),
-    "Sullivan Street Northwest": (-86.64540507039975, 30.421730118069032),
-    "Sailfish Circle": (-86.49818790558254, 30.39744013172624),
-    "North Greenwood Cove": (-86.41337288876318, 30.47369848717211),
-    "Hickory Lane": (-86.48755199996035, 30.49292350384574),
-    "Quail Circle": (-86.4686832433277, 30.393348144523717),
-    "Morrell": (-86.69200716515958, 30.700355292299268),
-    "Yorktown Circle": (-86.65250887398076, 30.467624837177397),
-    "Vine Avenue": (-86.45541026082573, 30.49624504768326),
-    "Lawrence Lane": (-86.61997826990893, 30.749451325192723),
-    "May Street": (-86.70977378123074, 30.414089467221487),
-    "Gardenia Court Northwest": (-86.61807912725442, 30.424393804999266),
-    "Grandview Drive": (-86.5469658714941, 30.446561162096796),
-    "Lee Lane": (-86.75710841881491, 30.415099846584603),
-    "Holmes Boulevard Northwest": (-86.61644153027376, 30.4193746701615),
-    "Farquar Lane": (-86.57779072436905, 30.446600158123285),
-    "Sorrel Ridge Road": (-86.57286018946171, 30.80447477922609),
-    "Rana Lane": (-86.46745614726065, 30.485816408679373),
-    "Old California Road": (-86.47934950221257, 30.93663714566965),
-    #"White Point": (-86.41411432786491, 30.482849119132737),
-    "Alconese Avenue Southeast": (-86.60095233874499, 30.403615125175904),
-    "Estival Street": (-86.63775363731395, 30.461268705761874),
-    "Holland Street": (-86.58239479676092, 30.76789241413389),
-    "Glynda Court": (-86.6295525, 30.426073000000002),
-    "Hilton Trail": (-86.65825944176181, 30.84719189302782),
-    "Country Breeze Lane": (-86.43544499984218, 30.813562507735895),
-    "Creel Street": (-86.64479329468756, 30.452275711459567),
-    "Ohio Place Northeast": (-86.59737642225255, 30.414849005243656),
-    "Maltezos Street": (-86.49685351056225, 30.398720407968778),
-    "Trenton Avenue": (-86.56220905698495, 30.729679992947037),
-    "Turnberry Court": (-86.64281677091257, 30.45278711446693),
-    "West Pine Avenue": (-86.57518251522858, 30.758899022931605),
-    "Oakdale Avenue East": (-86.56924730375908, 30.760373798464606),
-    "Springacres Cove": (-86.4184719462895, 30.472371026953976),
-    "Tradewinds Road": (-86.75702519424937, 30.40976161559731),
-    "Beverly Street": (-86.64261949313342, 30.455558499792403),
-    "Apalachicola Road": (-86.49594492370781, 30.48174290756855),
-    "Sundial Court": (-86.62507887693421, 30.397659046432118),
-    "Seminole Avenue": (-86.49240355972488, 30.505607607069496),
-    "Bay Street": (-86.56694034397333, 30.749238082675646),
-    "Woodhaven Court": (-86.46682084510486, 30.81740854850545),
-    "Madsen Circle": (-86.47934648040378, 30.937585659660147),
-    "Jet Drive Northwest": (-86.6226865252784, 30.416027216237353),
-    "Park Court": (-86.4962965, 30.4037675),
-    "Pickens Circle": (-86.65520781582626, 30.760218578439854),
-    "Tom Page Lane": (-86.69648258434488, 30.781764746661008),
-    "Tindel Drive": (-86.55008003439504, 30.717233299334293),
-    "Jesse Medley Road": (-86.46996847632782, 30.811541637484705),
-    "Ensign Court": (-86.42400449399857, 30.395441441583376),
-    "Pine Lane": (-86.4857505, 30.491767000000003),
-    "West Capri Cove": (-86.44331983765458, 30.48726765733824),
-    "Dubois Drive": (-86.6293571423105, 30.44027475793881),
-    "Barrancas Avenue": (-86.50988362426784, 30.481645197489655),
-    "Sundance Way": (-86.74460378733893, 30.683902760366678),
-    "Garnett Avenue": (-86.6090783749264, 30.421249310543338),
-    "Josh Drive": (-86.6130893282325, 30.7136480653958),
-    "Gulf Shore Drive": (-86.48967192747982, 30.38503726090602),
-    "Eagle Court": (-86.53658363075371, 30.78999980957978),
-    "East Cedar Avenue": (-86.5731293279913, 30.761529027897307),
-    "Pryor Road Southeast": (-86.58966307530976, 30.40922224510814),
-    "Sims Street": (-86.64937466856641, 30.426806973181407),
-    "Emerald Circle": (-86.64793709543332, 30.45080047867152),
-    "East Bermuda Circle": (-86.42536416581889, 30.487677167340063),
-    "Eloise Place": (-86.60804569385323, 30.77629407958057),
-    "Choctaw Lane": (-86.55464851815712, 30.434810527725624),
-    "Terrapin Trace": (-86.43995492441258, 30.401884356399496),
-    "Springate Court": (-86.75676747346327, 30.411998440792683),
-    "Trenton Street": (-86.60859050414169, 30.439877980072875),
-    "Kentucky Street": (-86.52508060022252, 30.761417728794058),
-    "Windlake Court": (-86.42573050030555, 30.472464811493293),
-    "Garden City Road": (-86.5099987565282, 30.824437177671484),
-    "Bartonwood Court": (-86.47802167546811, 30.533818011659204),
-    "Lakeside Lane": (-86.74729290754135, 30.413290254891933),
-    "Evans Road": (-86.44114997980648, 30.499884030570055),
-    "Woodfern Avenue": (-86.79355379938927, 30.414472496657506),
-    "Mary Ann Court": (-86.43993813950893, 30.520008867331658),
-    "Bowdoin Court": (-86.47434387497833, 30.53366880979563),
-    "North Lakeshore Drive": (-86.41513814984053, 30.466731253198308),
-    "Titanium Drive": (-86.61045819940956, 30.72465963036495),
-    "Sholtz Avenue": (-86.546785, 30.775541999999998),
-    "Acorn Drive": (-86.5406742, 30.7438356),
-    "Rocket Lane": (-86.57673, 30.445432500000003),
-    "Nebraska Avenue Northeast": (-86.60475285552496, 30.418764780411905),
-    "Stonehenge Drive": (-86.64807092287303, 30.41737138343103),
-    "Terry Avenue": (-86.69785992077578, 30.41716084235758),
-    "Buena Vista Lane": (-86.62143266097806, 30.455733140891184),
-    "China's Cove": (-86.65186800000001, 30.461646999999996),
-    "Miramar Drive": (-86.64472283443561, 30.41111999432547),
-    "Sellers Place Northwest": (-86.6412929805346, 30.419075499550274),
-    "Jonleen Drive": (-86.63372719324246, 30.444681320384806),
-    "Coldwater Creek Circle": (-86.45987954035166, 30.523237267042738),
-    "Pinederosa Trail": (-86.45430888855077, 30.77020628513318),
-    "Peter Court": (-86.662955, 30.428775500000004),
-    "Cayman Cove": (-86.41006894506098, 30.38376324121405),
-    "Hemlock Drive Northwest": (-86.62969902080715, 30.417625329401925),
-    "Pelican Place": (-86.50308649364656, 30.39576325574508),
-    "Country Club Court": (-86.56210649756224, 30.439986076970353),
-    "Pebble Drive": (-86.6292015, 30.442258999999996),
-    "Johnson Court": (-86.56705808799019, 30.744627240445247),
-    "Needle Avenue": (-86.40519535346841, 30.739918812136594),
-    "Holly Street": (-86.47957365041485, 30.39934842356365),
-    "Jerry Zivan Drive": (-86.41968509055147, 30.487390310591305),
-    "Beal Parkway Southwest": (-86.61309262799848, 30.40831767571485),
-    "Brentwood Lane": (-86.55780905851195, 30.77189225006051),
-    "Nan Place": (-86.60986337777483, 30.469431659873585),
-    "189 Oakdale Avenue West": (-86.57300664724957, 30.7578551392671),
-    "Dominica Way": (-86.42414467692524, 30.473085439657314),
-    "Cottonwood Court": (-86.47761498125206, 30.533096869528435),
-    "Rockport Drive": (-86.6226524494386, 30.45259060987513),
-    "Shrewsbury Road": (-86.65147106291535, 30.41674980692542),
-    "Lustan Drive": (-86.5942762578423, 30.711156870438966),
-    "Sunflower Court": (-86.50400053261777, 30.385607884076016),
-    "Okaloosa Avenue": (-86.49264726854636, 30.506399345449278),
-    "Barlow Road": (-86.63484376107074, 30.684389946389995),
-    "Donlabrook Boulevard": (-86.63122366278203, 30.453148858867827),
-    "Turnberry Cove South": (-86.4226768266653, 30.47708073298758),
-    "Parkview Lane": (-86.41850006414825, 30.49840379369202),
-    "Troy Road": (-86.64388295980436, 30.74852373616326),
-    "Willow Drive": (-86.51854860514977, 30.810808694921153),
-    "Linene Drive": (-86.56356972645641, 30.807758809631544),
-    "Kinsey Court": (-86.48724800139527, 30.487843324147555),
-    "Millers Street": (-86.45513474591297, 30.96655256404461),
-    "Nobie Medley Lane": (-86.69776069138679, 30.74709286627116),
-    "Justin Street": (-86.63036026485423, 30.43730350584742),
-    "Roserito Place": (-86.66237774543391, 30.411335974235136),
-    "Rose Marie Lane Southwest": (-86.62555713507803, 30.408589414466068),
-    "Yellow River Baptist Church Road": (-86.56608689572664, 30.926294739940992),
-    "Boulevard de l'Orleans": (-86.78121603104488, 30.412561316329985),
-    "Poplar Road": (-86.57637987999851, 30.461295134388365),
-    "Old Hickory Road": (-86.53336827847868, 30.815560167884918),
-    "Racetrack Road Northeast": (-86.6074207671329, 30.44616147136625),
-    "Windward Lane": (-86.43883489037064, 30.47982052977843),
-    "Ivey Terrace": (-86.46928407111518, 30.525789747395248),
-    "Colonial Drive": (-86.62294900005455, 30.438455997228267),
-    "Mayhaw Court": (-86.57443018694954, 30.460712000911467),
-    "Gardner Drive": (-86.58467086815652, 30.437717234891423),
-    "Wedgewood Court": (-86.61213992612636, 30.729364363640386),
-    "Forest Lake Terrace": (-86.47015085293076, 30.525086767834065),
-    "Dogwood Avenue": (-86.47637173847056, 30.506873325981065),
-    "Seminole Drive": (-86.5987829527083, 30.7919466588768),
-    "Donleen Street": (-86.629764, 30.4478425),
-    "Throwbridge Avenue": (-86.63397968472235, 30.44085698449446),
-    "West Cedar Avenue": (-86.57357272150682, 30.761232038533755),
-    "Primrose Street": (-86.54376587410825, 30.723338873935756),
-    "Golf Course Road": (-86.68342745068557, 30.434965691237835),
-    "Magnolia Avenue Southeast": (-86.59866832474127, 30.408654475168255),
-    "Camellia Drive": (-86.65162478736713, 30.41182908956358),
-    "West Lake Circle": (-86.7614125, 30.414290000000005),
-    "Giant Sycamore Lane": (-86.64597677268185, 30.82768781555925),
-    "Pinetree Road": (-86.73341331029955, 30.413877968332866),
-    "Nathey Street": (-86.49488225866709, 30.527685522677295),
-    "Wava Avenue": (-86.44462474385311, 30.521682160940646),
-    "Mattie Kennedy Road": (-86.69801684507252, 30.92324106963669),
-    "Coosa Court": (-86.450621, 30.3984995),
-    "Larkin Drive": (-86.612315, 30.423299),
-    "Stafford Circle Northeast": (-86.60377536021318, 30.455852072906815),
-    "Kyle Lane": (-86.54747499942334, 30.769685545838804),
-    "Hill Lane": (-86.5037955042075, 30.51881406145776),
-    "Godwin Road": (-86.68089281464586, 30.78984064223825),
-    "Lan Rob Lane": (-86.50427591732296, 30.399082893161193),
-    "Bressler Street": (-86.57536692505211, 30.74948103049824),
-    "North Lincoln Street": (-86.57530728307677, 30.756294531863094),
-    "West College Boulevard": (-86.48201847419405, 30.53485875685596),
-    "Efy Lane": (-86.67493817306438, 30.712934101334575),
-    "Old Bayou Trail": (-86.44613948625864, 30.40016123133243),
-    "L G Russell Road": (-86.62323063129826, 30.952955991454424),
-    "Reed Place Northwest": (-86.64228106106454, 30.41909553500739),
-    "Legion Court": (-86.4916585, 30.3971285),
-    "Sugarberry Court": (-86.4586385, 30.49307735),
-    "Doe Lane": (-86.6481755871785, 30.453938607845405),
-    "Pinedale Road": (-86.61379741681857, 30.447186283944784),
-    "Oakland Street East": (-86.55036501600837, 30.778905187139102),
-    "Dell Road": (-86.61074304746579, 30.43607419633239),
-    "Indigo Circle": (-86.47663265050514, 30.40893512874557),
-    "2nd Street": (-86.57968946597589, 30.441976747519977),
-    "Quail Trail": (-86.48720450115859, 30.49005828320305),
-    "Highway Avenue Northeast": (-86.60490915405126, 30.430964762466775),
-    "Blue Ridge Drive": (-86.64455967061268, 30.453380847117554),
-    "Dreaden Circle": (-86.63946332334163, 30.74372878503462),
-    "Willow Grove Lane": (-86.65438304010482, 30.466446702280944),
-    "Duke Drive": (-86.47461959304731, 30.530284295990985),
-    "Surf Lane": (-86.46708330096058, 30.499884993501983),
-    "Ray Street": (-86.64087772637974, 30.750035222364517),
-    "Robinson Avenue East": (-86.55871090600039, 30.748588703873093),
-    "Don Drive": (-86.61100427742497, 30.449177119029123),
-    "Magnolia Street": (-86.5067751, 30.478949650000004),
-    "White Oak Lane": (-86.56207231176727, 30.723209744055207),
-    "Lonnie Barnes Street": (-86.64840401977624, 30.7583145928888),
-    "Saint Kitts Cove": (-86.42318127525266, 30.486435892456914),
-    "Jerrells Avenue": (-86.6359271839867, 30.437408003389447),
-    "Moon Road": (-86.63930959057873, 30.683952609340235),
-    "Beech Wood Way": (-86.47864622291722, 30.53176366380953),
-    "Ralph Boyette Road": (-86.78688985439683, 30.892906743925646),
-    "Calinda Lane": (-86.4353840247246, 30.49657930019339),
-    "Brodie Lane": (-86.57795627445543, 30.701194964912375),
-    "Aplin Road": (-86.53159737148246, 30.74371433673528),
-    "North John Sims Parkway": (-86.49577119807378, 30.515693606439505),
-    "Mackenzie Road": (-86.50195893918466, 30.750847210887205),
-    "East Casa Loma Drive": (-86.74994519001284, 30.41399838775608),
-    "Winstead Road": (-86.53210584594606, 30.826290680639502),
-    "98 Palms Boulevard": (-86.48147259410158, 30.392122427310305),
-    "Willie Mack Jackson Road": (-86.70888621472537, 30.740140453621844),
-    "Jimmy Weathers Drive": (-86.41258932497941, 30.48122492630406),
-    "Clark Drive": (-86.64847758824403, 30.439647911261574),
-    "Bimini Way": (-86.41978300880903, 30.481120840988904),
-    "Barnes Road": (-86.54153375570682, 30.820095501055064),
-    "Elizabeth Lane": (-86.57722014999999, 30.44333555),
-    "Michael Court Northwest": (-86.6239445, 30.4251845),
-    "Eden Road": (-86.48263607182432, 30.81129780911938),
-    "Claudia Lane": (-86.73807585078329, 30.75594350098652),
-    "East Hickory Avenue": (-86.57120003629181, 30.764062319246094),
-    "Commerce Road": (-86.50607059877481, 30.396940764779888),
-    "Spicebush Court": (-86.4590305, 30.491686),
-    "Hidden Lake Court": (-86.43039466023697, 30.488811511794655),
-    "Glenn Place": (-86.65074150000001, 30.4395745),
-    "Racetrack Road Northwest": (-86.62272054136415, 30.44929678781217),
-    "Wilson Street North": (-86.57193341664404, 30.759097653827116),
-    "River Loop Drive": (-86.59634948772037, 30.825407917910177),
-    "Buck Tyner Road": (-86.45819101216617, 30.918648559675194),
-    "North White Point Road": (-86.41361155139654, 30.481972751407717),
-    "Batten Road": (-86.43535663800382, 30.82028855622117),
-    "Alpine Place": (-86.4783295239945, 30.5286654631823),
-    "Winfield Way": (-86.6718794666496, 30.41056404611183),
-    "Rose Court": (-86.48967084144482, 30.498547933201213),
-    "McFarlan Avenue Northwest": (-86.62779260009016, 30.45493101887568),
-    "Wilkerson Bluff Road": (-86.68722196690253, 30.698038872658504),
-    "Whitman Lane": (-86.601264, 30.446143499999998),
-    "Wyndell Circle": (-86.54056001545821, 30.76975563482408),
-    "Ashview Cove": (-86.4182495, 30.498054500000006),
-    "Campton Lane": (-86.51819391467887, 30.87263794547399),
-    "Osceola Drive": (-86.4961304812454, 30.386836181265785),
-    "Pine Moss Drive": (-86.65139636625274, 30.429406732122253),
-    "Revere Avenue": (-86.62198399035377, 30.437471019341626),
-    "Santa Rosa Street Southwest": (-86.62887101469599, 30.409760292202535),
-    "Revere Drive": (-86.61569449999999, 30.440514),
-    "Keller Court": (-86.4408284956588, 30.511196494877204),
-    "Wilson Street South": (-86.56505322956497, 30.749465753214324),
-    "Dogwood Drive": (-86.56468147385198, 30.43455953879381),
-    "Beuge Boulevard": (-86.65950724508575, 30.442842343886905),
-    "South Avenue": (-86.60973946304028, 30.43446482254668),
-    "4th Street Southeast": (-86.60464888759468, 30.41030043021874),
-    "Sibert Avenue": (-86.50755583586039, 30.39970036561878),
-    "Amhurst Circle": (-86.40437768086092, 30.389429040233328),
-    "Mimosa Street Northwest": (-86.61483895575928, 30.425098827235878),
-    "Bonaire Cay": (-86.40257362265028, 30.383145383484273),
-    "Lloyd Street": (-86.62834837894513, 30.441967194217934),
-    "Joseph Cook Road": (-86.77225509915965, 30.710516387208617),
-    "North Will Owens Road": (-86.55760893653188, 30.880060063846177),
-    "Meadow Woods Lane": (-86.41959435106183, 30.467784547355823),
-    "Middleton Road": (-86.40713370266481, 30.77701973185535),
-    "Mc David Road": (-86.5672505, 30.8005645),
-    "Handolin Lane": (-86.57573868209278, 30.437451040735244),
-    "Antiqua Way": (-86.42184957900524, 30.480959455317368),
-    "Ray Vecchino Road": (-86.73595748642326, 30.414316626111386),
-    "May Circle": (-86.54839487550068, 30.4636842995884),
-    "Rue de Palms Drive": (-86.46539200763203, 30.49500173949396),
-    "Eula Drive": (-86.476936, 30.501989000000002),
-    "Legendary Drive": (-86.4148439684491, 30.38937253485896),
-    "Barnhill Road": (-86.53338578999971, 30.823666481157932),
-    "Tislow Drive": (-86.57804022162007, 30.714192562468064),
-    "Miller Lane": (-86.47058485493024, 30.50631298674156),
-    "Scenic Highway 98": (-86.42931799227735, 30.38291520723547),
-    "Whirlaway Court": (-86.55386300049824, 30.73268744979864),
-    "Robinson Avenue West": (-86.56477755174392, 30.74868500393513),
-    "Cedar Bluff Circle": (-86.6618865160877, 30.408777427645703),
-    "Armstrong Avenue": (-86.48775098710337, 30.520085732046276),
-    "Ipswich Circle": (-86.60440224699639, 30.454689474334486),
-    "Iowa Drive Northeast": (-86.60320915920826, 30.41754523546664),
-    "Oakwood Circle": (-86.4148671674064, 30.474243025702002),
-    "Poplar Place": (-86.47731999774616, 30.53073249927016),
-    "Waldorf Lane": (-86.73679344810988, 30.410451895960357),
-    "Elks Lane": (-86.51519474426573, 30.765386068216646),
-    "Senterfitt Road": (-86.52154130510354, 30.910416783129214),
-    "Rue d'Honfleur": (-86.500127, 30.397804),
-    "Bradford Drive": (-86.62242727003654, 30.436245064520467),
-    "Vincent Circle": (-86.47556199894854, 30.51516116949449),
-    "Melanie Lane": (-86.61043278287487, 30.46563383420919),
-    "Edge Avenue": (-86.4504743365524, 30.510739933071267),
-    "Old Carriage Lane": (-86.65437350612197, 30.467096679895768),
-    "Willie Earl Sr Drive": (-86.470068, 30.9753005),
-    "Olenes Lane": (-86.63502849364693, 30.783277149739664),
-    "Hughes Street Northeast": (-86.60465845484644, 30.419668474873074),
-    "Coral Court Southwest": (-86.62726849443662, 30.407616998929637),
-    "Old Ranch Road": (-86.6467419814401, 30.45816934409629),
-    "Sandalwood Circle": (-86.41247707097055, 30.46828369584375),
-    "Benjamin Street": (-86.57243334684065, 30.746020408178047),
-    "West Lorraine Drive": (-86.67235089387188, 30.412496860798406),
-    "Castle Road": (-86.73999017379869, 30.41377395057034),
-    "Sandalwood Court": (-86.4935634002277, 30.39511438119905),
-    "Tall Pines Street": (-86.55822260388805, 30.76063458864341),
-    "Deer Springs Drive": (-86.44437332657155, 30.753520497812005),
-    "Linda Drive": (-86.75517094435781, 30.407439846496292),
-    "Creston Barrow Road": (-86.58637011914203, 30.958055376204534),
-    "Shawnee Circle": (-86.55797590489561, 30.718397471461248),
-    "Boulevard de la Parisienne": (-86.78042832298321, 30.41503741117513),
-    "Newport Drive": (-86.54798527448767, 30.757756450179407),
-    "Rosson Cove": (-86.64465458018827, 30.737176630099942),
-    "Piedmont Place": (-86.64493046487163, 30.448827599935118),
-    "Barton Road": (-86.7509100413608, 30.832854674915495),
-    "Butler Court": (-86.56269075286734, 30.705660435089705),
-    "Rita Lane": (-86.46996541805959, 30.526089417511574),
-    "Norwich Circle": (-86.42277884742818, 30.46191843241422),
-    "Ruby Circle": (-86.65832950466098, 30.419579030272015),
-    "Oak Hill Road": (-86.58377598705255, 30.809528804451524),
-    "Rock Hill Cemetery Road": (-86.41176480504691, 30.895570664598505),
-    "Lakeview Drive South": (-86.58666144711242, 30.83025489995225),
-    "Hayes Drive": (-86.51176871036455, 30.82123314916841),
-    "Lake Drive": (-86.55149125726342, 30.7474028035237),
-    "Cashen Road": (-86.5045822405818, 30.8977229973388),
-    "Camp Ground Drive": (-86.74835899898761, 30.675885755984897),
-    "Roscommon Boulevard": (-86.44374185161489, 30.517391291674922),
-    "Cutts Drive": (-86.49534649895568, 30.516179191488543),
-    "Avon Lane": (-86.6497665, 30.415354000000004),
-    "Cadillac Avenue": (-86.50631421230749, 30.518748150799905),
-    "Bayou Woods Drive Northwest": (-86.62229819096616, 30.425443397969087),
-    "Bolton Village Lane": (-86.41560742269188, 30.49987927418508),
-    "Little John Court": (-86.46946051159182, 30.521364918571877),
-    "McCanley Road": (-86.66954182911599, 30.800027722097),
-    "Ward Cove Drive": (-86.44494648438703, 30.49321365429522),
-    "Sea Oats Drive": (-86.49153789263752, 30.392491053561624),
-    "California Drive Northeast": (-86.60179374763561, 30.41664917022964),
-    "Peregrine Court": (-86.782185, 30.410947),
-    "Skyler Run": (-86.46454133461903, 30.404715689764274),
-    "Upper Karick Lake Road": (-86.64818081585346, 30.904823306563983),
-    "De Leon Road": (-86.49173137526206, 30.47877342325473),
-    "Helms Street": (-86.47986721480555, 30.5184490158726),
-    "Merioneth Court Northeast": (-86.60538152379159, 30.456899500650405),
-    "Sunrise Bay Court": (-86.5856424358055, 30.440501959371016),
-    "Lighthouse Church Road": (-86.72254562360489, 30.756467603987797),
-    "Godfrey Street": (-86.52375653433717, 30.757222033745556),
-    "Barrow Road": (-86.46214126590523, 30.780692206749123),
-    "Windemere Court Northwest": (-86.61611000019278, 30.45163898861474),
-    "Columbia Lane": (-86.58277558299476, 30.770351808811093),
-    "Tail Spin Drive": (-86.74793589999999, 30.687165399999998),
-    "47th Street": (-86.47085868837847, 30.531825130458497),
-    "Caviar Drive": (-86.60972255085409, 30.397525484891304),
-    "West Parkview Drive": (-86.46819959228843, 30.53176212395821),
-    "Cosson Circle": (-86.5365442494213, 30.83093847372791),
-    "6th Avenue East": (-86.57130851699459, 30.771047124105884),
-    "Eagle Street Northeast": (-86.61051647865688, 30.45789979090723),
-    "Lariat Lane": (-86.64761043359289, 30.463390662119185),
-    "Coronado Circle": (-86.53655177929193, 30.723412230503172),
-    "Sawgrass Way": (-86.44459562194763, 30.406158338351727),
-    "Hassell Road": (-86.62668390743086, 30.68568820508589),
-    "Almarante Place": (-86.49783199999999, 30.9443385),
-    "Bobolink Street Northeast": (-86.61014973555397, 30.415174628256977),
-    "Richpien Road": (-86.62957408924878, 30.44757707906644),
-    "Spotted Fawn Road": (-86.74217288139442, 30.694378595199883),
-    "Forest Heights Road": (-86.62778257264735, 30.46422995003307),
-    "Echo Drive": (-86.50034355963585, 30.50763560570125),
-    "Gulf Mist Court": (-86.4765855, 30.401192499999997),
-    "Boulevard of the Champions": (-86.56007606760564, 30.434427983101454),
-    "Carmillo Lane": (-86.52410817700924, 30.857214585554363),
-    "Vat Street": (-86.478331, 30.527680500000002),
-    "Crestone Cove": (-86.41807775744238, 30.496682099930744),
-    "Innsbrok Lane": (-86.6808936699134, 30.71314356722561),
-    "Silva Drive Northwest": (-86.62069040678232, 30.417409207935968),
-    "Grand Camp Terrace": (-86.73697003800552, 30.62589467368808),
-    "Essex Road": (-86.60886605677986, 30.4450186533935),
-    "Four Flags Road": (-86.50458407313926, 30.92804889972686),
-    "Motor Pool Road": (-86.4983871, 30.47805845),
-    "Windmill Drive": (-86.6402809113388, 30.454151274310775),
-    "Gold Pond Avenue": (-86.56344141026175, 30.76733421624727),
-    "South Drive": (-86.61979001107599, 30.446385000181547),
-    "Locke Lane": (-86.5367674764642, 30.83341821852863),
-    "East Sunset Cove": (-86.43714465, 30.47526315),
-    "Sunset Cove": (-86.43662845115618, 30.476181992341257),
-    "Holly Avenue": (-86.5820714657462, 30.460667985870852),
-    "Sikes Circle Northwest": (-86.63264879731938, 30.417752536680645),
-    "Cristine Court": (-86.40134796583625, 30.45698924478858),
-    "Campbell Avenue": (-86.57251321806669, 30.704691768858662),
-    "Carroll Drive": (-86.63281399398083, 30.799644573686738),
-    "Tyler Lane": (-86.46883431126018, 30.527029065948543),
-    "Warrior Street": (-86.59775870250688, 30.775478058964257),
-    "Vierville Circle": (-86.73479145550935, 30.627351593322366),
-    "Chase Drive": (-86.45327192859213, 30.532513017427238),
-    "Rattan Palm Drive": (-86.47275668938994, 30.496735874142917),
-    "Kathy Court": (-86.65957449300629, 30.419620742590464),
-    "Sweet Water Cove": (-86.43267549741913, 30.39680252091469),
-    "Windsor Lane": (-86.60419575869588, 30.45906870575569),
-    "Oregon Drive Northeast": (-86.60100453514042, 30.418174956010635),
-    "Senner Court": (-86.558799, 30.435568500000002),
-    "Melrose Avenue": (-86.50225604587108, 30.385668939239086),
-    "Merle Circle": (-86.60583773101742, 30.433580572948028),
-    "Southview Drive": (-86.57320059678534, 30.703906858073303),
-    "Schoolhouse Lane": (-86.744613, 30.71491),
-    "Treasure Cove": (-86.41612952538257, 30.471982888689563),
-    "Artie Road": (-86.6523540024994, 30.732970269243143),
-    "Osage Drive": (-86.65347550083936, 30.437668948977414),
-    "Wood Wind Drive": (-86.41546550388668, 30.386443601288104),
-    "Bonito Avenue": (-86.60619371199545, 30.398034235409472),
-    "Shane Lane": (-86.68026815394282, 30.75959137186365),
-    "Sherwood Road Northwest": (-86.61565123552995, 30.453207638939006),
-    "Main Drive": (-86.52486916259706, 30.800880778232923),
-    "East Street": (-86.56021150000001, 30.765193),
-    "48th Street": (-86.47093047348925, 30.53278197251915),
-    "Hard Times Road": (-86.72099028869023, 30.75311755284633),
-    "Mulcahy Circle": (-86.44144594098783, 30.51646338185895),
-    "Barbados Way": (-86.41683729929866, 30.481452391346174),
-    "Okaloo Lane": (-86.4852875, 30.918547500000003),
-    "Village Lane": (-86.64708409339254, 30.441801047795064),
-    "Yellow River Log Lake Road": (-86.76231827654249, 30.665664668347098),
-    "Reeves Road": (-86.69496315991248, 30.784837708409043),
-    "Cedar Point Road": (-86.55679618952652, 30.721473260681822),
-    "Hickory Drive": (-86.74002685916626, 30.684958948994854),
-    "Berger Place Northeast": (-86.59266570053288, 30.42231010651199),
-    "Air Force Street": (-86.62521906141497, 30.447493961090274),
-    "Traxx Street": (-86.61169163423165, 30.72531818863473),
-    "David Street": (-86.60220843303438, 30.445069115668016),
-    "Northern Pine Road": (-86.63553240405064, 30.464295229981598),
-    "Joe Jordan Road": (-86.66477352704278, 30.905083536140033),
-    "Hastings Court": (-86.63238651437845, 30.435941500096312),
-    "Shoal Lake Circle": (-86.55370031453543, 30.71828901917525),
-    "Old South Drive": (-86.61207228097493, 30.79119976940867),
-    "Flag Tail Lane": (-86.46027160505469, 30.75922375032042),
-    "Vita Lane": (-86.62660097668468, 30.451436820657747),
-    "Lee Drive": (-86.67154452058776, 30.412384434199065),
-    "Leila Place Northwest": (-86.6199505, 30.420735),
-    "Balmoral Drive": (-86.43127, 30.4850025),
-    "East James Lee Boulevard": (-86.57026108462424, 30.762070659120898),
-    "Theresa Court": (-86.6286205, 30.426057),
-    "John Sims Parkway": (-86.39550728993913, 30.468268376030714),
-    "East John Sims Parkway": (-86.47102726030056, 30.51703000369273),
-    "Gulf National Sea Shore Drive": (-86.58289936507052, 30.39656261014977),
-    "Spinaker Lane": (-86.57055225453469, 30.447008531988423),
-    "Buck Drive Northeast": (-86.6002770267224, 30.414069857818884),
-    "Coconut Palm Circle": (-86.47250997421014, 30.49612671384477),
-    "Harrison Drive": (-86.71001105203602, 30.41395868732635),
-    "Wolverine Avenue": (-86.51041381055454, 30.517287213682774),
-    "Indian Bayou North": (-86.45738338598842, 30.40330942106498),
-    "Short Avenue": (-86.5607354894667, 30.754914633775332),
-    "Loop Lane": (-86.45493756716476, 30.767728690816668),
-    "Griffth Mill Road": (-86.69938885425515, 30.777394495522746),
-    "Osceola Bay Avenue": (-86.45403224730303, 30.501170771935552),
-    "Lincoln Avenue": (-86.50075111614112, 30.50906163122525),
-    "Purl Adams Avenue": (-86.56039910204096, 30.759906496149544),
-    "Lilac Court": (-86.471284, 30.509379999999997),
-    "Panhandle Drive": (-86.53059864192005, 30.696475820500957),
-    "Davis Road": (-86.39418126273416, 30.983637540582677),
-    "Boothill Trail": (-86.4363049674259, 30.750998158970923),
-    "Peacock Road": (-86.60910463419387, 30.93500057011205),
-    "Clayton Place": (-86.54497465288617, 30.458377560288636),
-    "Florida Blanca Place Southeast": (-86.60199781526883, 30.403765694713886),
-    "Tom Brown Road": (-86.497512, 30.526669499999997),
-    "Evergreen Avenue": (-86.48046593909876, 30.533085343479083),
-    "Maggine Lane": (-86.65434103497688, 30.82727350491215),
-    "Brande Court": (-86.58269616985797, 30.441497715425292),
-    "Blueberry Avenue": (-86.52513693651657, 30.761084769534104),
-    "Nicholson Street Northeast": (-86.61225599206324, 30.4188597438961),
-    "King Street Northwest": (-86.64886500447946, 30.426695453033876),
-    "West Elm Street": (-86.57357806415808, 30.764963520409914),
-    "Middle Drive": (-86.59955492864964, 30.437461206690806),
-    "Hilton Road North": (-86.67379191664115, 30.765053448876568),
-    "Webster Street": (-86.61520780658392, 30.438769484522293),
-    "Juniper Court": (-86.5641165, 30.702523),
-    "Willingham Drive": (-86.479706, 30.513008499999998),
-    "Sikes Drive": (-86.54769808941495, 30.761149641905494),
-    "Todd Road": (-86.40562158603673, 30.773506759277442),
-    "Birkdale Cove": (-86.43540793003343, 30.48215711676628),
-    "Belgium Run": (-86.7108762751962, 30.702834234231858),
-    "Sabal Palm Drive": (-86.4646451454844, 30.495678785321992),
-    "Hardie Lane": (-86.62548074165308, 30.44164860452163),
-    "Vernon Taylor Road": (-86.6588633805726, 30.761449257706918),
-    "Shotgun Trail": (-86.41480110652067, 30.768068027004485),
-    "Pawnee Circle": (-86.64462245904006, 30.433064916614068),
-    "Ward Ranch Road": (-86.6006757967911, 30.7969315468633),
-    "Sugartown Loop": (-86.60583853873247, 30.700185772343946),
-    "Choctaw Drive": (-86.49132069469147, 30.386816901988386),
-    "Will Owens Road": (-86.5494793824468, 30.857816651042064),
-    "Oak Street": (-86.63784236513848, 30.429008254211244),
-    "Sheffield Road": (-86.60957578992027, 30.439894032333363),
-    "East Pine Avenue": (-86.56457236343017, 30.763805351970547),
-    "Garden Street": (-86.56163350314328, 30.78429821477444),
-    "Rawlins Court": (-86.42900160438157, 30.480972728807874),
-    "Southern Court": (-86.55541738754212, 30.7431213580813),
-    "Marler Street Northwest": (-86.65203786029778, 30.42539867173999),
-    "Lakeside Drive": (-86.43115912262776, 30.48768807167599),
-    "Jefferyscot Drive": (-86.5844973089304, 30.7229250699857),
-    "Beachview Drive Northeast": (-86.60265726186269, 30.4289216470786),
-    "Baywood Court Northwest": (-86.6242203037042, 30.41610554151411),
-    "Hilton Road South": (-86.67555576470353, 30.76049279168388),
-    "Three M C Lane": (-86.58890068555263, 30.73400189355768),
-    "Plympton Road West": (-86.49182671335454, 30.90999010337916),
-    "Starmount Drive": (-86.5797845, 30.7940755),
-    "Vista Street Southwest": (-86.6339159976067, 30.412041611795622),
-    "Ocala Court": (-86.4503395, 30.394046000000003),
-    "Marina Drive": (-86.59868560179768, 30.446369706582036),
-    "Leisure Lane": (-86.73844489285243, 30.68285088777706),
-    "Russell Boulevard": (-86.63147142482117, 30.433675847419106),
-    "Tac Court": (-86.6119535, 30.4324755),
-    "Kehlhem Road": (-86.62503807741584, 30.440957179141087),
-    "Furling Lane": (-86.4048767664683, 30.387217972669262),
-    "Billfish Avenue": (-86.606282, 30.397218000000002),
-    "Odin Lane Northwest": (-86.642587, 30.41541),
-    "Hampton Circle": (-86.41924461875587, 30.46532380478749),
-    "Shady Grove Church Road": (-86.70051258464918, 30.77527142749316),
-    "Skynight Drive": (-86.51174862033754, 30.766310848827622),
-    "Muldoon Street": (-86.54552057637532, 30.746237979175277),
-    "Priscilla Drive": (-86.62351743341577, 30.436080748549045),
-    "Kell Aire Court": (-86.48163076039354, 30.402364144363194),
-    "East Grebe Way": (-86.39745359420914, 30.73777916951673),
-    "Oley Way": (-86.53366120369692, 30.459866886089504),
-    "Saint Joseph Cove": (-86.41746535124693, 30.47584438472945),
-    "Muskogee Lane": (-86.44900164342829, 30.39685681495065),
-    "Lido Circle East": (-86.4419780691825, 30.4874497737517),
-    "Hidden Cove Way": (-86.50098373316688, 30.50440300906584),
-    "Hidden Cove Lane": (-86.50179859574166, 30.504462898431495),
-    "Hidden Cove Drive": (-86.5016087818086, 30.50426129554873),
-    "Hidden Cove": (-86.62886877508168, 30.436547750373318),
-    "Hidden Cove Court": (-86.50190813498584, 30.505266348336907),
-    "Lisette Court": (-86.6081065, 30.4376965),
-    "Jay's Road": (-86.63395381117341, 30.77888687872402),
-    "Barrington Lane": (-86.41587406793509, 30.489878108800443),
-    "White Point Court": (-86.417541, 30.4651365),
-    "Baywinds Drive": (-86.40164812304607, 30.39561672240605),
-    "Ball Terrace": (-86.524378, 30.7972955),
-    "Summerwood Court": (-86.47709396448003, 30.52974405322691),
-    "Balboa Road": (-86.53224172016029, 30.723848794185233),
-    "Palmetto Avenue": (-86.40014216950067, 30.748544494988998),
-    "Jacqueline Way": (-86.46204694775425, 30.974611948992457),
-    "Pinellas Drive": (-86.58803458568967, 30.71810887501396),
-    "25th Street": (-86.45896971579653, 30.509690026870828),
-    "South Lorraine Drive": (-86.67033355766188, 30.411265812543206),
-    "Toluka Drive": (-86.53414721057543, 30.46204602469703),
-    "Texas Parkway": (-86.56967136378492, 30.778525645914485),
-    "West Bunting Way": (-86.40569319373293, 30.741302383059107),
-    "Gavernie Court": (-86.55390680700799, 30.704844582762707),
-    "Nap Knob North": (-86.68965626693237, 30.698912963948),
-    "Crystal Lake Lane": (-86.50921578657558, 30.528101769218186),
-    "Yacht Club Drive": (-86.46464270977316, 30.486749785080104),
-    "La Brisa Beach Circle": (-86.71691145796619, 30.410505379140226),
-    "Nakina Drive": (-86.53668169931363, 30.461630535243593),
-    "Okeechobee Road": (-86.49918570144217, 30.490014059331454),
-    "Monterrey Road": (-86.53841400524185, 30.761615006461593),
-    "Maggie Lane": (-86.65395693543269, 30.828819385053706),
-    "Stacy Circle Northeast": (-86.59715743617951, 30.413246823664807),
-    "Gleneagles Drive": (-86.43086826248282, 30.480271042427717),
-    "Luverne Street Northeast": (-86.61254165703767, 30.422136750137014),
-    "Yosemite Way": (-86.65109288224532, 30.857368795146677),
-    "Randy Drive": (-86.49323869972748, 30.805053595381644),
-    "Boxer Avenue": (-86.48032709722779, 30.51380100184857),
-    "Garniers Post Road": (-86.60057734961666, 30.458603840164113),
-    "Sundew Street": (-86.51355758436755, 30.821501152084075),
-    "Pinewoods Drive": (-86.5288898927231, 30.763021103693852),
-    "Stokes Road": (-86.46138724586639, 30.97625387128324),
-    "Bennett Avenue": (-86.69312841983869, 30.422576601574413),
-    "Joe's Bayou": (-86.49164459497865, 30.41014973840491),
-    "Kensington Court": (-86.54070036805086, 30.717723991939724),
-    "Tommy Eiland Road": (-86.7368427478983, 30.770639002966114),
-    "Cades Cove": (-86.55830126547697, 30.72373431951188),
-    "Oak Harbour Lane": (-86.47662746432873, 30.41014143397265),
-    "Jack Powell Road": (-86.42565535875066, 30.800116489758256),
-    "East Chestnut Avenue": (-86.54172200618041, 30.750813586377372),
-    "Dowdy Road": (-86.67552621595739, 30.96696571837186),
-    "Apache Drive": (-86.43768199052151, 30.766338067140165),
-    "Allen Avenue": (-86.4808442110433, 30.516662667436545),
-    "Basil Drive": (-86.6338262736013, 30.79498144470301),
-    "Sleepy Oaks Lane Northwest": (-86.6134007210382, 30.427517589716324),
-    "Commons Drive East": (-86.42831262222755, 30.390325276057496),
-    "Griffith Road": (-86.74545668990079, 30.721506470587236),
-    "2nd Avenue": (-86.49225199916403, 30.406781507397493),
-    "Second Avenue": (-86.74900176543655, 30.715679503535885),
-    "Carson Drive Southeast": (-86.60770339484371, 30.409712221448977),
-    "Huntington Circle": (-86.4224958441338, 30.508021735762245),
-    "Cloverdale Court": (-86.64132599401374, 30.453642361772435),
-    "Gibbs Drive": (-86.52802486032635, 30.807331419513307),
-    "Salvadore Drive": (-86.58054540935163, 30.77481529965673),
-    "Dunwoody Place": (-86.6499292867322, 30.441600171822966),
-    "Jason Drive": (-86.44285582276102, 30.53198017315383),
-    "Mira Flores Court": (-86.39980205371003, 30.38215038965152),
-    "Hill Drive": (-86.59631899987254, 30.770974513436638),
-    "Kit Fox Valley": (-86.61732822354142, 30.724621158978106),
-    "Calle Rio": (-86.64887051199166, 30.40817484636542),
-    "High Grove Court": (-86.6435526346381, 30.444961008362426),
-    "McLaughlin Avenue": (-86.57071450594371, 30.774074327903545),
-    "Bay Drive Southeast": (-86.58833965815323, 30.409580051850707),
-    "Paraiso Boulevard": (-86.42761840432202, 30.38973355534039),
-    "Yohn Road": (-86.67659567876439, 30.75628788391947),
-    "Lane Drive": (-86.66169149999999, 30.4105299),
-    "Whitewood Way": (-86.4151268295723, 30.47706250088485),
-    "Territory Lane": (-86.62380419048881, 30.72239153318141),
-    "Millside Road": (-86.45934283540372, 30.92829068494816),
-    "Thurston Place": (-86.61000269844436, 30.77450582261056),
-    "Tarpon Road": (-86.73864085580534, 30.408703615921375),
-    "Ross Clark Road": (-86.45638959791457, 30.9194828570767),
-    "Lido Circle West": (-86.4445080165087, 30.487160683368675),
-    "Yellow Pine Court": (-86.44479200626593, 30.512795381459114),
-    "West Grebe Way": (-86.40677974982718, 30.738370754649004),
-    "26th Street": (-86.45928829905431, 30.511419521870756),
-    "Highway 4": (-86.71331486414394, 30.814448827380737),
-    "White Oak Drive": (-86.51519784365048, 30.79629789150707),
-    "Cole Lane": (-86.7606729549777, 30.71604611002413),
-    "Royal Palm Drive": (-86.4720668715458, 30.495116149516324),
-    "Greenbrier Drive Northeast": (-86.6034185800074, 30.4299836390281),
-    "Higgins Lane": (-86.59510523866912, 30.76920856760735),
-    "Combs Manor Court": (-86.6638438257951, 30.425942646949512),
-    "Mercie Lane": (-86.55913151773616, 30.77178034625595),
-    "Green Street": (-86.5661040544454, 30.764183321709275),
-    "Royal Street": (-86.54470964513257, 30.77464345841747),
-    "Fleshman Drive": (-86.49872222616142, 30.40037363897883),
-    "Kristin Circle": (-86.4467347785398, 30.521868146340385),
-    "Apachee Road": (-86.59749864415004, 30.782931819595436),
-    "Chinquapin Drive": (-86.53534116905817, 30.46248946304327),
-    "Boutwell Road": (-86.41144435927912, 30.966325870303905),
-    "Rockford Street": (-86.49584507456015, 30.507825603225672),
-    "Stephen Drive": (-86.43405729920498, 30.512426828230648),
-    "Flamingo Drive": (-86.50082348024628, 30.401330500037012),
-    "Crystal Court": (-86.40372461001039, 30.457034842597082),
-    "Norman Riley Road": (-86.79001405222076, 30.806329134434836),
-    "Carlton Street": (-86.56253598044941, 30.763277499778766),
-    "Pate Road": (-86.45420146310482, 30.916638908421096),
-    "Sienna Trace": (-86.39729, 30.392684500000005),
-    "Cecelia Drive Northwest": (-86.62968673578587, 30.41519737722499),
-    "Buddy Phelps Drive": (-86.50579845233673, 30.518197265394313),
-    "Skyline Circle": (-86.55596500633676, 30.70875409888151),
-    "Shalimar Lane": (-86.55385031716561, 30.441232065546448),
-    "Drew Court": (-86.44111191506843, 30.51263602886962),
-    "Kidd Street": (-86.61192789950282, 30.423986848169893),
-    "Old Hwy 10": (-86.5008751925414, 30.48749543199732),
-    "Wakissa Cove": (-86.40345131225766, 30.392095346265545),
-    "Meigs Drive": (-86.4807551228043, 30.503682077816094),
-    "Peachtree Way": (-86.47958764603189, 30.53282830538967),
-    "Fox Hound Lane": (-86.66123244263537, 30.757518043745318),
-    "Kent Lane": (-86.48688497111688, 30.398779001734713),
-    "Lake Way Drive": (-86.44907940441682, 30.522799615999965),
-    "Providence Way": (-86.41733575, 30.479224),
-    "Cordgrass Court": (-86.47386364243913, 30.391612679787638),
-    "Siesta Bluff": (-86.400960951012, 30.38245655410541),
-    " D Avenue": (-86.50320989471977, 30.481984584249773),
-    "Georgetown Lane": (-86.65397875897193, 30.465152768275264),
-    "Sharon Court": (-86.65954999269131, 30.420391787874255),
-    "East Parkwood Lane": (-86.41725927674152, 30.488542442627654),
-    "Paschel Street": (-86.76398531288507, 30.41132719711548),
-    "Alderwood Way": (-86.47960932751876, 30.532132259612812),
-    "29th Street": (-86.48198725545444, 30.51472172457767),
-    "Risen Star Drive": (-86.55199027725882, 30.731523773228226),
-    "Broiderick Road": (-86.71959353538882, 30.721168772564567),
-    "Santee Street": (-86.5171462080861, 30.818049506562126),
-    "McMillan Drive Street": (-86.70585212274584, 30.414350277625914),
-    "Skeeter Lane": (-86.69008457844686, 30.743299832451576),
-    "Tommy Lane": (-86.75284741456737, 30.41065838312196),
-    "Commons Drive West": (-86.44816284700656, 30.390660512133223),
-    "Bent Creek Road": (-86.56303606458621, 30.76838799070398),
-    "Mockingbird Hill Court": (-86.45965711289708, 30.819316825847643),
-    "Windsong Court": (-86.42568597476709, 30.471146386141314),
-    "Seclusion Boulevard": (-86.57742050089625, 30.759742291949852),
-    "Bayou Lane": (-86.46905503273064, 30.49909785626186),
-    "Village Way": (-86.42016009450103, 30.387893678124712),
-    "Earl Campbell Road": (-86.48987078615833, 30.960069279437768),
-    "Opp Road": (-86.60721000526213, 30.42019150048584),
-    "John Nix Road": (-86.43390374210003, 30.814251018550785),
-    "Walden Street": (-86.56265536939192, 30.748651045380118),
-    "Pelham Road": (-86.62628749999999, 30.4346575),
-    "Spring Lane": (-86.48494227527799, 30.39979629088454),
-    "Weatherly Drive": (-86.5793225, 30.715604500000005),
-    "Peaden Bridge Road": (-86.7196454961878, 30.881136385634782),
-    "Skyhawk Drive": (-86.5114993701104, 30.76589495274571),
-    "27th Street": (-86.46758108628707, 30.51251934035779),
-    "Fox Avenue": (-86.70179087808324, 30.421573175262996),
-    "Walters Drive": (-86.70894995, 30.41272865),
-    "Industrial Park Road": (-86.48067533406964, 30.39577662915869),
-    "Live Oak Lane Northwest": (-86.62926998492736, 30.427096327196704),
-    "Classic Court": (-86.64754449506673, 30.425591165088736),
-    "Chestnut Avenue East": (-86.56797743745665, 30.757068930738793),
-    "Gagnon Road": (-86.46172500000002, 30.810201999999997),
-    "Devon Court": (-86.63369599971917, 30.435681018212705),
-    "Culp Cove": (-86.64889314999999, 30.441233999999998),
-    "Kumquat Avenue": (-86.46728723331931, 30.505450362225712),
-    "Shirley Drive Northwest": (-86.65225919000991, 30.42526335021806),
-    "4th Avenue East": (-86.5706019270124, 30.76897176683857),
-    "Principal Lane": (-86.63170185737086, 30.45131256424862),
-    "Howell Drive Northwest": (-86.61904548784443, 30.426055931328865),
-    "Radiant Circle": (-86.74942755450417, 30.40466014793574),
-    "Fairway Court Northeast": (-86.61079144857585, 30.453282464719578),
-    "Edgewater Drive": (-86.43268648931975, 30.50887760895905),
-    "Staff Road": (-86.59202357453752, 30.808736141832632),
-    "Temple Avenue Southwest": (-86.63199033929698, 30.41051020544109),
-    "Madison Avenue": (-86.50152700044615, 30.5056764671733),
-    "Corbin Road": (-86.74571984436622, 30.711625815841007),
-    "Angelfish Avenue": (-86.60135869745893, 30.39679942056813),
-    "Cherokee Road": (-86.58351191839145, 30.438287488049976),
-    "Santa Rosa Court": (-86.62903692211152, 30.399117622676965),
-    "Barrow Lane": (-86.75294125680573, 30.675175419478396),
-    "Poplar Avenue": (-86.5830280081269, 30.458511650036066),
-    "Dorchester Place": (-86.56492185, 30.81080405),
-    "Kimp Road": (-86.39592633398996, 30.752705011491823),
-    "Garrett Pit Road": (-86.60652962877258, 30.7114455335706),
-    "Anchors Street Northwest": (-86.65837293758048, 30.42228336201423),
-    "Laurel Lane": (-86.51235318129638, 30.818904468241076),
-    "Kay Cove": (-86.65757878994098, 30.433910072819703),
-    "Nivana Drive": (-86.5879378836719, 30.71105832697572),
-    "Mosley Lane North": (-86.5531632, 30.796313500000004),
-    "Norman Drive": (-86.6453957363928, 30.451754876535414),
-    "Sonoma Circle": (-86.41663618487833, 30.462840232459858),
-    "Rosebud Avenue": (-86.39727815309051, 30.74659542626056),
-    "Kilcullen Drive": (-86.44634551976937, 30.518720214417424),
-    "Virginia Drive Northwest": (-86.63689918229191, 30.42245437800004),
-    "Dartmouth Way": (-86.4746035921171, 30.532215149546506),
-    "Stamford Avenue Northeast": (-86.60408385665346, 30.45995560320785),
-    "Grandview Avenue": (-86.48875619827788, 30.495000287686253),
-    "Duff Lane": (-86.50158606114343, 30.74963070073847),
-    "Antler Way": (-86.5859125, 30.7971565),
-    " Ash Drive": (-86.55712129327524, 30.458026669768664),
-    "Riverchase Boulevard": (-86.59104205750283, 30.710043772485154),
-    "Lamar Drive": (-86.7301981390297, 30.410781472369234),
-    "Spencer Place": (-86.4975595, 30.506203499999998),
-    "Lakeview Drive": (-86.58597756385429, 30.7681177737502),
-    "Cotton Creek Road": (-86.63269870312318, 30.820347030649856),
-    "Tom Sawyer Lane": (-86.5890987216367, 30.7068973717561),
-    "Kristin Cove": (-86.4011317358417, 30.394007371287966),
-    "Mosley Lane South": (-86.55316604355257, 30.795434426024617),
-    "Cross Street": (-86.49951420538841, 30.407129929289155),
-    "Barataria Lane": (-86.62696162939922, 30.43626643502955),
-    "Bunting Way": (-86.39842391919328, 30.74088381677908),
-    "Canterbury Circle": (-86.4349878301371, 30.485865726510358),
-    "Dairy Road": (-86.67575158871716, 30.807516678440372),
-    "Yaupon Lane": (-86.44990702460909, 30.758603002560502),
-    "28th Street": (-86.46682851872298, 30.51346511248071),
-    "Blair Lane": (-86.6293690122368, 30.825885549853503),
-    "Oakmont Place": (-86.43679225421683, 30.47984562756224),
-    "Marina Pointe Drive": (-86.46581476408473, 30.487712020025693),
-    "McCurley Road": (-86.53119116819354, 30.8294852143836),
-    "Jonathan Circle": (-86.50544996522049, 30.518843249691084),
-    "Chantilly Circle": (-86.43134971504956, 30.478054582798),
-    "Penney Lane": (-86.55032311987875, 30.725219167730707),
-    "East Country Club Drive": (-86.45977250023962, 30.394122498185983),
-    "Downshill Circle": (-86.4487866797584, 30.51639512077667),
-    "Pelican Drive": (-86.61882246047234, 30.39881753739721),
-    "Lantana Lane": (-86.40722169082004, 30.38603273964471),
-    "Tomahawk Court": (-86.45301742912794, 30.401829465428793),
-    "Serina Cove": (-86.40351253665418, 30.39732486483268),
-    "Sound Beach Street Southeast": (-86.61195804573327, 30.402984785844158),
-    "Tsuga Way": (-86.64946585, 30.441235900000002),
-    "Brooks Street Southeast": (-86.58925861102908, 30.40660019132381),
-    "Maple Street": (-86.52671827193572, 30.840593648283733),
-    "Kennedy Bridge Road": (-86.7608611079762, 30.927761241524824),
-    "Gary Player Lane": (-86.56040112851028, 30.432856265266885),
-    "Webb Street": (-86.56946401361347, 30.764596083912142),
-    "Shell Avenue Northeast": (-86.61249417539032, 30.416585541489358),
-    "Macy Lane": (-86.75654252170048, 30.409825616254132),
-    "Curtis Madden Road": (-86.61276268067662, 30.8963266265078),
-    "Longleaf Drive": (-86.65749468292982, 30.429037815570787),
-    "Emerald Bay Drive": (-86.40038291005351, 30.39597512711167),
-    "Paradise Point Road": (-86.59295579352595, 30.452552842750595),
-    "Lee Cook Road": (-86.62475123974738, 30.89639664915979),
-    "Taylor Circle": (-86.60696209133226, 30.437973592315664),
-    "Stingray Street": (-86.42146598476708, 30.383887197666883),
-    "Ridgewood Cove North": (-86.41573490258627, 30.47298787636981),
-    "Ann Circle": (-86.48959420587283, 30.39623184161015),
-    "Black Jack Circle": (-86.57350941342114, 30.45907723751707),
-    "Sand Dune Court": (-86.47671150946766, 30.387010977797356),
-    "Linstew Drive Northwest": (-86.62519711590761, 30.428876575760004),
-    "Prince Street": (-86.63501930862334, 30.451651690428964),
-    "Deepwater Lane": (-86.45610616311728, 30.50598980642426),
-    "Lowery Drive Northwest": (-86.65469249859068, 30.438879074598233),
-    "Jackson Circle": (-86.49856567873807, 30.51087075761416),
-    "Littles Lane": (-86.59756498174946, 30.704724827497973),
-    "Bryant Bridge Road": (-86.77769753520872, 30.71517828293899),
-    "Boone Trail": (-86.43412441796286, 30.930042856017266),
-    "Pinoak Court East": (-86.54279623540806, 30.721650932760404),
-    "Holt Lane": (-86.73008125372809, 30.690155008383236),
-    "Surrey Lane": (-86.42275301936554, 30.50857478759984),
-    "Reynolds Avenue": (-86.48236159483446, 30.520157495664172),
-    "Oaklake Lane": (-86.436689, 30.4877115),
-    "Lightning Ridge": (-86.73141159678022, 30.829570394507357),
-    "Cowrie Avenue Southwest": (-86.62197821584677, 30.40763098283783),
-    "Cavalier Drive": (-86.5220036469747, 30.756862793981412),
-    "Rhett Enzor Road": (-86.63006585827436, 30.706986277290326),
-    "Osprey Cove": (-86.41721334523511, 30.50002191412263),
-    "Ridgewood Cove South": (-86.41260938191425, 30.47029035258378),
-    "Lucile Street": (-86.61058859235494, 30.424660761885654),
-    "Cobb Street": (-86.63433493147502, 30.816432149646534),
-    "Red Barrow Road": (-86.64952485238314, 30.925280505012342),
-    "Crescent Court": (-86.7351895, 30.4105425),
-    "Augusta Cove": (-86.43442514118823, 30.39151568980789),
-    "Creekside Circle": (-86.58166809457062, 30.808507942715178),
-    "Procteride Court": (-86.63095270326217, 30.462456847824022),
-    "Ego Drive": (-86.58482836671861, 30.721598932043968),
-    "Gail la Rue": (-86.65781902589278, 30.433016920177803),
-    "Dyer Street": (-86.47607404207184, 30.513546109405148),
-    "George Avenue": (-86.52625603628624, 30.756831952262356),
-    "Fennec Fox Preserve": (-86.62337859487495, 30.722349279806313),
-    "Stowe Road": (-86.75173618591276, 30.408987032161363),
-    "Dellmont Cove": (-86.41694647433916, 30.496754207394236),
-    "Sweetgum Court": (-86.47763453244444, 30.5323850491016),
-    "Bayshore Drive": (-86.47094524713543, 30.49900917107697),
-    "Regent Road": (-86.5530975, 30.735827999999994),
-    "Ridgewood Cove West": (-86.41327553404804, 30.470051951574646),
-    "Twin Bay Lane": (-86.60634045941377, 30.45264882928139),
-    "Swift Creek Court": (-86.46774293834734, 30.49514635135383),
-    "Forest Cove Court": (-86.73218901240288, 30.413046709982275),
-    "Central Circle": (-86.48869719202759, 30.912359818638095),
-    "Davis Lane": (-86.53886838937073, 30.71980664059148),
-    "Carol Avenue Northwest": (-86.6410743360078, 30.424049681372274),
-    "Pottery Place": (-86.44498310530992, 30.40510158390031),
-    "Ferry Road Northeast": (-86.59830089776878, 30.414943692045338),
-    "Weeden Island Drive": (-86.46958354719347, 30.491283334466065),
-    "Brick Circle": (-86.64141202096572, 30.446506032261972),
-    "Water Street": (-86.63819045352328, 30.43123999553841),
-    "McEwen Drive": (-86.47326796458631, 30.515496488428),
-    "Wright Parkway Southwest": (-86.63924835978999, 30.41027848244986),
-    "Cahaba Court": (-86.44944561384071, 30.395598886708854),
-    "Ohio Avenue": (-86.4970031415617, 30.514188103259407),
-    "Main Street": (-86.48373236510957, 30.399006972214487),
-    "Wacissa Road": (-86.49726155130226, 30.481316054833172),
-    "Lands End Drive": (-86.50214687784512, 30.383801528988137),
-    "James Kennedy Road": (-86.52797399835377, 30.74002714505181),
-    "Buddys Place": (-86.67646325301394, 30.81792142241601),
-    "Seastar Vista": (-86.4069289033444, 30.385208566736548),
-    "Windsor Drive": (-86.5133097254744, 30.81429893626186),
-    "Kelly Road": (-86.5041129436216, 30.521510476057323),
-    "Sanders Avenue": (-86.55848135403667, 30.754140281994506),
-    "Rippling Creek Cove": (-86.453907, 30.5250815),
-    "Rogers Street Northwest": (-86.64310704242486, 30.417834054390998),
-    "Whipporwill Lane": (-86.4862707964215, 30.4015167339896),
-    "Mallard Avenue Northeast": (-86.6115339896194, 30.418082499716444),
-    "Bob White Drive": (-86.75975216832158, 30.41279954937683),
-    "Dead End Road": (-86.66239545583915, 30.75779989400862),
-    "Orchid Crest Drive": (-86.54779248934739, 30.78166248223684),
-    "Live Oak Church Road": (-86.56978069781158, 30.699256714046758),
-    "12th Avenue": (-86.57067836199747, 30.448154127876307),
-    "Heritage Way": (-86.65010281891772, 30.460049653260427),
-    "Warbler Way": (-86.53275244342466, 30.75460509395808),
-    "Victoria Place": (-86.57764272025139, 30.793884417372926),
-    "Okaloosa Lane": (-86.53478563887548, 30.753227875803795),
-    "Field and Stream Court": (-86.66528809762185, 30.799314615339775),
-    "Hi Tech Lane": (-86.63623341991892, 30.468254991705496),
-    "Fairway Avenue Northeast": (-86.610406464029, 30.45861362978238),
-    "Whisnand Circle": (-86.59506055948643, 30.70484120077105),
-    "Hicks Road": (-86.62816564272168, 30.682763583019714),
-    "Christobal Road": (-86.663349029211, 30.41395373552191),
-    "Dave Weaver Drive": (-86.41789125798866, 30.485316512436306),
-    "Hodges Street": (-86.70876985, 30.4119332),
-    "Nancy Ward Cove": (-86.416297, 30.501216499999998),
-    "Shell Drive": (-86.60246809112557, 30.778316057817452),
-    "Pinoak Court West": (-86.54505764492903, 30.721751184756258),
-    "Walkup Way": (-86.67609781070516, 30.43304018322013),
-    "Live Oak Terrace": (-86.57625517875631, 30.760343996871686),
-    "Rue de Le Roi Street Northeast": (-86.61130536973826, 30.46423923415817),
-    "Mollie Lane": (-86.71190017036663, 30.81610709527982),
-    "Schmauss Lane": (-86.7055644, 30.41417965),
-    "Bay Court": (-86.49545712251916, 30.410856314766423),
-    "Four Points": (-86.74084492241587, 30.697224997150943),
-    "Country Line Road": (-86.78919949961312, 30.84308907266826),
-    "Caribbean Way": (-86.41905153705271, 30.481737618493568),
-    "Harding Road": (-86.4628044903422, 30.50207604582776),
-    "James Destrito Road": (-86.66661463953545, 30.725966860136257),
-    "April Way": (-86.70013897073177, 30.723485976424186),
-    "Four Point Road": (-86.74262142826397, 30.697207335288557),
-    "Lost Trail": (-86.64964712192906, 30.46346199965174),
-    "South Bayshore Drive": (-86.49041771405443, 30.498916685397077),
-    "Henderson Beach Road": (-86.44745949009788, 30.38629965708024),
-    "Loblolly Court": (-86.65747411472631, 30.429703923469333),
-    "Leonard Road": (-86.63738885000001, 30.442932650000003),
-    "Chacato Cove": (-86.44588350000001, 30.491132),
-    "Cheshire Avenue Northwest": (-86.61530103837055, 30.451256306703506),
-    "South Booker Street": (-86.57109156792447, 30.753201451770536),
-    "Hunter Place Northeast": (-86.59384305209447, 30.417317247090203),
-    "Stillwater Cove": (-86.4407402586377, 30.405809823163356),
-    "Pine Alley Street": (-86.62691962558632, 30.460704474586606),
-    "Rendezvous Cove": (-86.40522436718435, 30.38392600091721),
-    "Whippoorwill Circle": (-86.48827005614523, 30.401395838269185),
-    "Eider Way": (-86.39387169295368, 30.737533919205347),
-    "Loop Drive": (-86.58592841709141, 30.714449686616273),
-    "Mattie's Way": (-86.44434941711492, 30.40384915810228),
-    "Patrician Way": (-86.65211680766326, 30.46030552946845),
-    "McCoy Road": (-86.76134565406312, 30.96746110932831),
-    "Dove Cove": (-86.48719649971946, 30.488930858920472),
-    "Hillwood Drive": (-86.54527267281117, 30.78546812473611),
-    "Callaway Drive": (-86.45008881705525, 30.528618883446093),
-    "East Washington Avenue": (-86.49164803910195, 30.508063913739512),
-    "Birkdale Circle East": (-86.43597204991275, 30.481734964955276),
-    "Pontevedra Lane": (-86.47176094497156, 30.504785944305883),
-    "Highlander Drive": (-86.71511526460148, 30.811616096933246),
-    "Jasmine Place": (-86.48659107980829, 30.489932183592902),
-    "Southwind Drive": (-86.42454724901174, 30.47740403980284),
-    "Shay-Lin Court": (-86.43776700000001, 30.496071),
-    "Scallop Court": (-86.62697771013272, 30.39793642988764),
-    "Hill Avenue": (-86.57369948094426, 30.748777611067613),
-    "Oakmont Circle": (-86.43378238336726, 30.476685340016317),
-    "Yellowhammer Drive": (-86.54011441545148, 30.78223890773635),
-    "Bluewater Point Road": (-86.44544194094884, 30.49885303971602),
-    "Rough Leaf Lane": (-86.74988388828186, 30.406785616095274),
-    "Rosewood Court": (-86.520098, 30.809533500000004),
-    "Scottwood Drive Southeast": (-86.60114504677497, 30.406154442315447),
-    "East Brook Drive": (-86.54492311312609, 30.795890802983628),
-    "North Booker Street": (-86.57411899547336, 30.756574148412138),
-    "Catherine Court": (-86.65166487569908, 30.433284018242198),
-    "Timberlake Court": (-86.74790147942898, 30.41384001537471),
-    "Tulip Avenue": (-86.39231453342842, 30.749594364895408),
-    "Hudson Circle": (-86.47517524125618, 30.504568628421968),
-    "Destin Drive": (-86.669010994371, 30.412309364469163),
-    "Kipling Drive": (-86.56293854147681, 30.70907322931447),
-    "Hillcrest Avenue": (-86.49573298752918, 30.505808683745464),
-    "Ranton Road": (-86.75424038352328, 30.71127671071356),
-    "Lukasik Avenue": (-86.69882128222311, 30.419212837294253),
-    "Rosewood Cove": (-86.41338995366608, 30.47626788717201),
-    "Marler Street": (-86.50515546222148, 30.39487615748477),
-    "Middle School Road": (-86.42423995402329, 30.40002847390242),
-    "Admiral Court": (-86.41016375228044, 30.400239380431575),
-    "Channel Marker Street": (-86.72857020245792, 30.411318811081717),
-    "Avenue du Commerce": (-86.78167581508502, 30.411073701001193),
-    "Stafford Boulevard": (-86.5402365396983, 30.794959971615977),
-    "East Miracle Strip Parkway": (-86.65264346787042, 30.409160953143676),
-    "Golf Course Drive": (-86.61793864277944, 30.728755169305433),
-    "Bird Drive": (-86.49058696723446, 30.808036194523634),
-    "Leaning Pines Loop": (-86.44557460626608, 30.399510995306056),
-    "Jennifer Court": (-86.66469649999999, 30.4338075),
-    "Quail Hollow Drive": (-86.75925790100005, 30.413866457916992),
-    "Heron Lane": (-86.48697800474443, 30.399749092900425),
-    "Katherine Street": (-86.60269534328854, 30.442222963278713),
-    "Beach Circle": (-86.4904869048663, 30.400288687471907),
-    "Girard Avenue Northwest": (-86.61705200844766, 30.425880370886016),
-    "Oxmore Drive": (-86.5404001559769, 30.767160174491647),
-    "Merioneth Drive Northeast": (-86.60558323248121, 30.456647009805085),
-    "Dolittle Avenue": (-86.56321616977127, 30.771046443951157),
-    "South Rosebud Avenue": (-86.39839559622568, 30.739408809862237),
-    "Vinings Way Boulevard": (-86.41033954129625, 30.388287537542492),
-    "Talman Trail": (-86.69822191673147, 30.74879592511967),
-    "Rosalie Drive": (-86.50272212598854, 30.384912413041885),
-    "Karen Avenue": (-86.60787740353842, 30.46225333903392),
-    "Woodlands Drive": (-86.41624914324207, 30.474393313057266),
-    "Oak Terrace Drive": (-86.56252205037843, 30.72421824527267),
-    "Mooring Lane": (-86.56725451574664, 30.44694147366148),
-    "Hidden Springs Drive": (-86.66632181210049, 30.749830663274125),
-    "Woodward Street": (-86.42715311987834, 30.38437935724685),
-    "Makron Drive Northwest": (-86.63682062406224, 30.41958947723387),
-    "Winners Circle": (-86.6167422171238, 30.875512951619818),
-    "Hunters Path": (-86.65308882525744, 30.46335697870806),
-    "Conifer Court": (-86.6546269626409, 30.42935955655442),
-    "Tyner Drive": (-86.54833983560155, 30.76070523135851),
-    "Southview Avenue": (-86.48873298426183, 30.503957458671664),
-    "Tarpon Lane": (-86.46787599999999, 30.4998955),
-    "De Little Lane": (-86.53644352544937, 30.94088779892579),
-    "Angler Avenue": (-86.60159886341613, 30.397528695174255),
-    "Antioch Road": (-86.58727469852498, 30.70454079615173),
-    "Fleetwing Road": (-86.73807144263601, 30.69448315908286),
-    "Fulmar Circle Northeast": (-86.59557509263298, 30.42164691222159),
-    "Jackson Trail": (-86.41856191171671, 30.56801400652442),
-    "Emerald Lane": (-86.64773169660918, 30.451044694175472),
-    "Lauren Court": (-86.4653401771886, 30.404423442792407),
-    "Trinidad Court": (-86.59803583649303, 30.776564349577168),
-    "Tall Pines Trail": (-86.567507, 30.437274000000002),
-    "Higher Ground Road": (-86.48953669199035, 30.887472632053164),
-    "20th Street": (-86.46631112396042, 30.505744552035203),
-    "Northwest Butler Drive": (-86.66850541297721, 30.427363167459035),
-    "Birkdale Circle West": (-86.43665481984544, 30.482411372258834),
-    "Forrest Avenue": (-86.52929681425037, 30.76453811243654),
-    "Covington Place Northeast": (-86.60793549969152, 30.456267016400897),
-    "Southgate Drive": (-86.56544283786404, 30.721350822246492),
-    "Saint Anne Cove": (-86.41942750085339, 30.477796174053772),
-    "Crosswinds Landing": (-86.6354155410729, 30.462878131015206),
-    "Forest Road": (-86.43908078038243, 30.52469141655894),
-    "Kendrick Lane": (-86.48192749940448, 30.515598551588738),
-    "Vucovich Drive": (-86.41512105040965, 30.483192750409394),
-    "Melvin Holly Road": (-86.78316622390388, 30.87900989834331),
-    "Sand Myrtle Trail": (-86.4436112674256, 30.40624796425837),
-    "Crestwood Street": (-86.64501351513958, 30.41233731709905),
-    "Parkwood Circle": (-86.41468427754437, 30.487665759387568),
-    "Julia Street": (-86.64122499999999, 30.4578655),
-    "Mayflower Court": (-86.61862715000001, 30.43850814965198),
-    "45th Street": (-86.46901898590517, 30.530141666249566),
-    "Cove Drive": (-86.6069206027321, 30.431742948710973),
-    "Roberts Road": (-86.56723123655453, 30.799129773589645),
-    "Paddock Circle": (-86.57034219382658, 30.807537487920968),
-    "Ross Road": (-86.61381948356252, 30.44043597130468),
-    "Gap Creek Drive": (-86.64074887414759, 30.43004701117106),
-    "Highland Hills Road": (-86.47377275785331, 30.784182083282765),
-    "Kats Court": (-86.46352372144729, 30.404427683878332),
-    "Shoffner Avenue": (-86.55367240831626, 30.745304383685408),
-    "Grove Street": (-86.5519078, 30.7973769),
-    "Vine Avenue Northeast": (-86.60204297830188, 30.413622499410582),
-    "Commerce Drive": (-86.55833825, 30.7907906),
-    "Moore Street": (-86.46040590024167, 30.505763611087527),
-    "Garnet Place": (-86.39840443101723, 30.3959437018832),
-    "Bama Lane": (-86.55195431534007, 30.799741827432488),
-    "Parkwood Square": (-86.4148983074927, 30.484697712053677),
-    "Wells Avenue": (-86.52667721532399, 30.761757529007493),
-    "Brooks Avenue": (-86.63644399162928, 30.452617275979467),
-    "Broken Arrow Court": (-86.45550090131813, 30.39221471263336),
-    "Douglass Avenue": (-86.54999587464026, 30.771106489158765),
-    "Mattie M Kelly Boulevard": (-86.47118361219906, 30.39346378393978),
-    "Zachary Lane": (-86.61011326128181, 30.450298149381183),
-    "Hasty Lane": (-86.45689223825715, 30.497740223300223),
-    "Iowa Street": (-86.50386759735484, 30.516483482712175),
-    "Phyllis Avenue": (-86.47300267295697, 30.51123918714948),
-    "Magnolia Court": (-86.56540991233997, 30.782313704510067),
-    "Blenheim Road": (-86.58889603352092, 30.46082400625104),
-    "L Adams Road": (-86.77092567972691, 30.72998912569978),
-    "Brinkley Court": (-86.60687300000001, 30.447248000000002),
-    "Welaka Court": (-86.44924, 30.3979475),
-    "Government Avenue": (-86.509781830571, 30.51457772886482),
-    "Ivy Avenue": (-86.46894934111215, 30.53334404646668),
-    "C and C Drive": (-86.52912103442442, 30.821086416322906),
-    "Boggy Bayou Court": (-86.48658000980083, 30.518008174522134),
-    "Akron Street": (-86.49883327425243, 30.514596088723764),
-    "Snook Road": (-86.75386778926223, 30.409325321889234),
-    "Bud Moulton Road": (-86.55446354823498, 30.81317258818178),
-    "Keystone Road": (-86.72178769055505, 30.413299006181376),
-    "Mainsail Drive": (-86.44262990243877, 30.495438360332937),
-    "West Dodson Road": (-86.71850893652712, 30.76620364392896),
-    "Jam Lane": (-86.54509204762789, 30.807932303486286),
-    "South Karick Road": (-86.650914498425, 30.891924294868794),
-    "Squirrel Haven Road": (-86.73925951261522, 30.413692582373244),
-    "Harris Street": (-86.73293950917925, 30.4133371855145),
-    "Steves Place": (-86.60120283700051, 30.775558735354135),
-    "Menzel Street": (-86.49771697506212, 30.510952110421165),
-    "Aurora Street": (-86.50496304669505, 30.51411288057884),
-    "Argyle Court": (-86.64988880126398, 30.415198775101647),
-    "Ed Brown Street Southwest": (-86.61724338036588, 30.41049688968866),
-    "Doyce Drive": (-86.64949698297656, 30.4594297918937),
-    "31st Street": (-86.48241934878601, 30.51606484733151),
-    "Coral Drive Southwest": (-86.62873140261215, 30.40809540621341),
-    "Pine Lake Drive": (-86.47169625521504, 30.513896750742916),
-    "Christen Court": (-86.65007779999999, 30.445385899999994),
-    "Mattie Kelly Boulevard": (-86.47572049252517, 30.389304780601776),
-    "West Choctawhatchee Drive": (-86.4048829564576, 30.456822819220783),
-    "Bayshore Court Northeast": (-86.60000002075098, 30.420758500691697),
-    "Industrial Park Lane": (-86.47823502106553, 30.3953750085415),
-    "Pembrooke Court": (-86.42345816648712, 30.46528458070407),
-    "Potomac Street": (-86.614834, 30.439112),
-    "Felecia Drive": (-86.583614, 30.7165495),
-    "Georgia Street": (-86.57023764161134, 30.772041463317283),
-    "Laws Drive": (-86.65687486280065, 30.408690099921667),
-    "Chesapeake Ridge": (-86.6309317095969, 30.463702090700487),
-    "Shipley Drive": (-86.42065893718177, 30.462390325736685),
-    "Turn Berry Way": (-86.42369786795022, 30.478588138472634),
-    "Straight Line Road": (-86.52319223772807, 30.698088707376442),
-    "Blake Avenue Northwest": (-86.66462721168773, 30.423463475611285),
-    "Anderson Street": (-86.57323713860472, 30.768477425739427),
-    "Pearl Street South": (-86.56241209406687, 30.7489025767524),
-    "Bahama Street": (-86.75248015891465, 30.6886011529867),
-    "Youngblood Road": (-86.68682445383206, 30.962396272101735),
-    "West Danielle Court": (-86.781408, 30.410965500000003),
-    "Hollywood Boulevard Northeast": (-86.595361309182, 30.412072811786086),
-    "Kissam Street": (-86.7010427122079, 30.409971300670154),
-    "46th Street": (-86.47079823895005, 30.5308576942268),
-    "Euchee Circle Southeast": (-86.5910989600963, 30.409324140957864),
-    "Postl Road": (-86.48125594183175, 30.479545667101075),
-    "Bridgeport Colony Lane": (-86.64279634136169, 30.441909763134753),
-    "Peacock's Point Drive": (-86.4952353092321, 30.412910588701017),
-    "Willow Lane North": (-86.4992617330205, 30.817261459583385),
-    "South Ferdon Boulevard": (-86.56824449999998, 30.7583529),
-    "Pinchot Road": (-86.55458042766817, 30.46466253053217),
-    "Lakota Drive": (-86.7139139592964, 30.704616077372265),
-    "Springtime Road": (-86.74759612054548, 30.720563114487213),
-    "Jennings Trace": (-86.69900464368835, 30.732342906426055),
-    "Waterway Lane": (-86.59687785057474, 30.44230329864326),
-    "Scott Lane": (-86.62278455999135, 30.444675323990325),
-    "Gospel Road": (-86.63208856766515, 30.461049378202457),
-    "Blueberry Lane": (-86.55655008703054, 30.815152687883685),
-    "Point Comfort Court": (-86.65515433831605, 30.40854245168157),
-    "Shalimar Drive": (-86.58271617015866, 30.446384881637282),
-    "Robys Drive": (-86.72202581636164, 30.41311451045351),
-    "Malone Drive": (-86.56514593110273, 30.750223380544114),
-    "Titleist Lane": (-86.55938862513901, 30.704769636205356),
-    "Bobby Drive": (-86.58419126070905, 30.71508848079569),
-    "Saint Mary Avenue Southwest": (-86.61925495880978, 30.405621627854618),
-    "Bristol Cove Road": (-86.7604115954161, 30.41015507927877),
-    "Harper Road": (-86.50590544732768, 30.93426126882662),
-    "Blakely Avenue": (-86.57067465934433, 30.74775472303791),
-    "Bentwood Lane": (-86.65425947560422, 30.46782381076936),
-    "Mills Landing": (-86.65121095, 30.44513175),
-    "Curlew Street": (-86.39314549096686, 30.740068758078642),
-    "McIntosh Court": (-86.71158062010633, 30.41002404814415),
-    "Seattle Slew Court": (-86.55437700792498, 30.733544497309676),
-    "Hare Street": (-86.52619470008966, 30.760323566080245),
-    "Dumaine Court": (-86.64423199999999, 30.436728500000005),
-    "Ray Cotton Road": (-86.77284173222377, 30.84308699930068),
-    "Echo Circle": (-86.65297630581479, 30.429078970563708),
-    "Vincent Street": (-86.6271079698892, 30.45141663583289),
-    "Wildwood Street": (-86.79277239358464, 30.412893596718902),
-    "Gardner Drive Northeast": (-86.59125164922838, 30.417404256319752),
-    "Carmel Drive": (-86.64792684196301, 30.442323063166402),
-    "Green Acres Avenue": (-86.64688319999999, 30.454436049999998),
-    "Kellie Drive": (-86.54735138975707, 30.7812950285553),
-    "Bayou Drive": (-86.43844150000001, 30.507964),
-    "Bryn Athen Boulevard": (-86.6507974227684, 30.417423289392787),
-    "Long Drive East": (-86.55854872011702, 30.767823713846273),
-    "Kaylee Lane": (-86.5392015, 30.769849),
-    "Brewer Circle": (-86.64316298866227, 30.411301154464546),
-    "Julie Street": (-86.6065091202364, 30.444065829874116),
-    "Swan Lane": (-86.64123572013163, 30.456404908530104),
-    "Milligan Avenue": (-86.64079000233481, 30.7515388192554),
-    "Cornwall Terrace": (-86.6504815, 30.418771999999993),
-    "Cobbler Lane": (-86.54442000957822, 30.80754870297562),
-    "Wadsworth Road": (-86.64142499694918, 30.752418001321136),
-    "North Lorraine Drive": (-86.67017052928286, 30.4134321583503),
-    "Turner Road": (-86.69240145153007, 30.97978241756864),
-    "Clearview Drive": (-86.46642098744168, 30.818437185659135),
-    "Skyline Drive": (-86.53220126039409, 30.76545389848775),
-    "Prospect Road": (-86.5622469783046, 30.77672019347959),
-    "Bland Street": (-86.7074822, 30.41306805),
-    "Hospital Street": (-86.47050839477457, 30.51589159165405),
-    "Piney Creek Cove": (-86.45545507998011, 30.52790374304851),
-    "Nancy's Path": (-86.65409897706733, 30.46403869442154),
-    "Hart Road": (-86.48631553666068, 30.888355284503277),
-    "Brian Circle": (-86.6625881645788, 30.417657952123868),
-    "Prescott Street": (-86.5825202494071, 30.705352516249917),
-    "4th Street": (-86.49268451919643, 30.407508207621536),
-    "Mc Arthur Street": (-86.56250275005765, 30.771214314463418),
-    "Old River Road": (-86.6335024565255, 30.78685538686011),
-    "The Masters Boulevard": (-86.55913558896661, 30.44213020380978),
-    "West Trovare Street": (-86.39951695050885, 30.384591807254477),
-    "Troy Street Northeast": (-86.6085166790613, 30.421824992389407),
-    "Sunrise Court": (-86.51710077464547, 30.81208050085826),
-    "Vara Lee Lane": (-86.47912900000001, 30.9375785),
-    "Cheyenne Circle": (-86.64772247943056, 30.43320549950958),
-    "Bally Way": (-86.44098932580914, 30.516631454781383),
-    "Hollywood Boulevard Northwest": (-86.66105272944439, 30.413588117259458),
-    "North Lakeside Drive": (-86.48010110118989, 30.404429111425614),
-    "Ballyway Drive": (-86.44622539225604, 30.518292257175464),
-    "Lonnie Jack Drive": (-86.57238096418213, 30.777418678612218),
-    "Lunaria Lane": (-86.39800730394687, 30.762732992848044),
-    "Kirkwood Run": (-86.61143703143375, 30.790521629072586),
-    "Jeff Drive": (-86.57293447135012, 30.778421161153585),
-    "Randall Roberts Road": (-86.66457913334817, 30.430734713997982),
-    "Jeffrine Drive": (-86.58375062440405, 30.716222091158645),
-    "Vermont Avenue": (-86.64736225607716, 30.434882161628064),
-    "Pete Parker Road": (-86.74886791836443, 30.715432080321957),
-    "White Oak Circle": (-86.57468524741113, 30.454856634091954),
-    "Newton Road": (-86.51773668965528, 30.9509901180075),
-    "Judith Drive": (-86.50425306110346, 30.509987259915526),
-    "Marshall Court": (-86.63845469153544, 30.42686147498509),
-    "Circle Avenue": (-86.74627093572501, 30.719276449859947),
-    "Antiqua Cove": (-86.42208701896443, 30.482351910223517),
-    "Carnathan Court": (-86.64874617100118, 30.46036585620818),
-    "Pine Cone Cove": (-86.46475967654966, 30.491235707649466),
-    "Laurel Drive": (-86.65363550131927, 30.438440437439745),
-    "Plympton Road": (-86.50919212305357, 30.910150656114276),
-    "Balou Drive": (-86.5900001432628, 30.717654970201558),
-    "Jim Green Road": (-86.53171603651911, 30.842419863763855),
-    "Benoit Lane": (-86.63871721508015, 30.7639575376601),
-    "Christopher Lane": (-86.45456079381428, 30.815019692778197),
-    "Jubilee Way": (-86.4258698126302, 30.778972951297426),
-    "Karly Lane": (-86.62443385, 30.440425949999998),
-    "Adams Street": (-86.47000575881391, 30.529375573417067),
-    "Glory Place Northwest": (-86.64806468399576, 30.42227617859427),
-    "Palmetto Court": (-86.55398294962285, 30.71073398870947),
-    "Martha Street": (-86.50538738477043, 30.521196655055014),
-    "West Ponderosa Road": (-86.63359830776145, 30.466055393925625),
-    "10th Avenue": (-86.5659970557224, 30.776226571163292),
-    "Hollywood Boulevard East": (-86.65095359524834, 30.413328249709394),
-    " 7th Street": (-86.57162133588021, 30.43838141730268),
-    "Valeria Street": (-86.6320305, 30.431189500000002),
-    "La Brook Court": (-86.63151325, 30.4511501),
-    "Virginia Oak Court": (-86.64191406444534, 30.430815375916985),
-    "Shimmering Lane": (-86.75157394208219, 30.404227073556466),
-    "Pristine Water Lane": (-86.74997681890888, 30.406389960898476),
-    "Keturah Street": (-86.46651697804938, 30.511410542327607),
-    "Kenya Circle": (-86.50731029498321, 30.894688390488366),
-    "Nelson Street": (-86.56849311751981, 30.765130738484256),
-    "Tennessee Avenue": (-86.48940422044012, 30.49265007089384),
-    "West Cane Avenue": (-86.56497067702239, 30.751578491356284),
-    "Coffeemaker Lane": (-86.7135784580005, 30.979102327503867),
-    "Cook Street": (-86.49895933728416, 30.52784652156429),
-    "Jo Anna Lane": (-86.65957032301012, 30.4197529934698),
-    "Ponce de Leon Road": (-86.54428517406849, 30.755888132146637),
-    "Heron Way": (-86.39836010609633, 30.736406606321587),
-    "Lovejoy Road Northwest": (-86.65664941657778, 30.424224967676402),
-    "Taylor Street": (-86.60911204028034, 30.436209673146028),
-    "5th Street": (-86.4634082908138, 30.96595945727626),
-    "Etta Garrett Road": (-86.6395092160093, 30.74928133106969),
-    "Evergreen Place": (-86.50043493685718, 30.400010490227302),
-    "Live Oak Drive": (-86.55685650731796, 30.810374773001584),
-    "East 1st Avenue": (-86.57252218941747, 30.765852162712374),
-    "Duggan Avenue": (-86.57098551375344, 30.74428159037548),
-    "Makron Drive": (-86.66951640644362, 30.41059207312324),
-    "Lakewood Street": (-86.66324000017875, 30.41672399241975),
-    "Kelly Lane": (-86.4842707819895, 30.491449025859424),
-    "Tuscany Drive": (-86.39930249716662, 30.38513664027459),
-    "Green Road": (-86.78596034537536, 30.901586279676728),
-    "Kemp Road": (-86.4137425839464, 30.963732954325735),
-    "Shoffner Boulevard": (-86.52825132842644, 30.76052153908536),
-    "Ridge Lake Road": (-86.58610818193188, 30.787677088984744),
-    "Perdido Circle": (-86.47271893463297, 30.499336884442016),
-    "Whiteway Circle": (-86.50391947213546, 30.515234552834126),
-    "Reeves Drive": (-86.62590891288075, 30.443801694521525),
-    "Gasparilla Road": (-86.48689862194635, 30.47775373746463),
-    "Painter Branch Road": (-86.4473663155553, 30.811854302347996),
-    "Log Cabin Lane": (-86.5363142394053, 30.809211962007605),
-    "Algonquin Place": (-86.61362720001013, 30.77879346050656),
-    "Sweet Bay Circle": (-86.57174406219923, 30.458310972924963),
-    "Thunder Ridge Road": (-86.67302103033578, 30.704900172403622),
-    "Hidden Cove Circle": (-86.50091038674567, 30.504995692901698),
-    "Kruse Drive": (-86.65820239107141, 30.45889295930867),
-    "Crystal Beach Drive": (-86.4223221694945, 30.38596078003977),
-    "Laredo Avenue": (-86.4573376936488, 30.503036844415945),
-    "Mansfield Street": (-86.49831952381783, 30.516120032374694),
-    "Landry Street": (-86.646925787228, 30.451049139961018),
-    "Olive Avenue": (-86.40328548948439, 30.73911127583535),
-    "Nun Drive": (-86.58242131892267, 30.717367570965042),
-    "Calhoun Avenue": (-86.49801801327085, 30.410645787258254),
-    "Rodney Avenue Northeast": (-86.60772353148216, 30.460493519447184),
-    "Bayshore Point": (-86.48620779876033, 30.5045550128506),
-    "Doral Drive": (-86.55690576495142, 30.44404331903442),
-    "8th Street": (-86.56989480202326, 30.4410356625781),
-    "Rue de la Savoie": (-86.7811835, 30.412495),
-    "Spring Hill Court": (-86.56609203641521, 30.746783167266656),
-    "Melton Road": (-86.71912850383482, 30.798910871143505),
-    "Todd Point": (-86.402083, 30.3939895),
-    "Patton Drive": (-86.60214024041687, 30.433230903329026),
-    "Cane Avenue East": (-86.56149863147633, 30.753626670378242),
-    "Neptune Drive": (-86.73531014067986, 30.410527301027805),
-    "Reddin Brunson Road": (-86.5070433056999, 30.40114022861289),
-    "Cahaw Circle": (-86.39968298082995, 30.740127217089718),
-    "Riley Court": (-86.54213100000001, 30.723573000000002),
-    "Airport Road": (-86.4730910859866, 30.394958489541843),
-    "Radford Court": (-86.57283632618794, 30.438083300254338),
-    "Jerry Pate Court": (-86.5622575, 30.434625),
-    "White Street": (-86.45133314703534, 30.51091491458125),
-    "Bailey Drive": (-86.46553093637417, 30.512325706293574),
-    "Andros Road": (-86.75169, 30.685042499999998),
-    "Kingston Road": (-86.58194132319413, 30.795201946860146),
-    "Twin Bay Drive": (-86.6047867954259, 30.452320626719533),
-    "Green Acres Boulevard": (-86.65105534682274, 30.45991202442624),
-    "James Street": (-86.5664115, 30.775831500000002),
-    "Chance Lane": (-86.64508533415852, 30.74286415595699),
-    "Coolwater Lane": (-86.49831112763793, 30.525464605689507),
-    "Pippin Drive": (-86.76296537662732, 30.409392568607377),
-    "Silverwood": (-86.65218455, 30.442129549999997),
-    "Jack Nicklaus Way": (-86.56024787039694, 30.432604137652636),
-    "C.B. Drive": (-86.56594626938286, 30.79585180872514),
-    "6th Street": (-86.50175089935347, 30.482334349018764),
-    "Claeven Circle": (-86.64203885, 30.442456749999998),
-    "Alonzo Court": (-86.477586, 30.527101499999997),
-    "Davis Drive": (-86.48271010640498, 30.521888842380037),
-    "Seville Circle": (-86.75525355088834, 30.41290154050978),
-    "Trudell Terrace Road": (-86.76194359816046, 30.69723804082436),
-    "Stella Lane": (-86.6413910278432, 30.42793259488493),
-    "Tate Lane": (-86.52876922478076, 30.75450949845176),
-    "Wellington Road": (-86.61272920580055, 30.43604437811232),
-    "Riverland Road": (-86.6064487012096, 30.702056990424115),
-    "Travis Court": (-86.617167, 30.7202055),
-    "Bay Cove Lane": (-86.54812213906489, 30.44582237234809),
-    "Cambridge Avenue Northeast": (-86.60609942356615, 30.456359138420794),
-    "Wiggins Road": (-86.72205723375232, 30.727343076837567),
-    "Tanglewood Lane": (-86.6048518894322, 30.759742904667853),
-    "Hopper Street": (-86.46009043667863, 30.50159366123378),
-    "Grand Oak Drive": (-86.48611855630814, 30.517665491436745),
-    "Berry Road": (-86.74517375257724, 30.714515366209717),
-    "Magnolia Lane North": (-86.46475322652414, 30.776846975073212),
-    "Saint Rose Cove": (-86.418509, 30.476848),
-    "Plumosa Palm Drive": (-86.47364325000001, 30.4952815),
-    "Brompton Court": (-86.633618, 30.461502),
-    "Loizos Drive Northwest": (-86.62333543876197, 30.417255887556497),
-    "Elmore Lane": (-86.67489284091894, 30.718304325867813),
-    "Beaver Dam Lane": (-86.46181924839979, 30.504862696636707),
-    "Phillip Road": (-86.53322776882464, 30.79647244828794),
-    "Quigley Drive": (-86.58790746241743, 30.71900237818271),
-    "Cristobal Road North": (-86.66341267014784, 30.411693961304195),
-    "Lindberg Street": (-86.58406072492814, 30.76733067862077),
-    "Irlbeck Road": (-86.624953, 30.4407775),
-    "Aster Avenue": (-86.51715999208706, 30.821564733542775),
-    "Transfer Station Road": (-86.66985720432635, 30.43482901815153),
-    "Lisa Marie Place": (-86.58829024933132, 30.457769799007778),
-    "9th Street": (-86.5680967061079, 30.446380948140156),
-    "Water Oak Lane": (-86.56334960600542, 30.723775841259645),
-    "Arrowhead Court": (-86.57491499451105, 30.45503500950637),
-    "Early Street": (-86.49714545735874, 30.525451674282646),
-    "Bramblewood Trail": (-86.51370190257859, 30.887955109708823),
-    "Muskogee Trail": (-86.6090955, 30.7706525),
-    "Dawes Road": (-86.62752315, 30.44716185),
-    "Cristobal Road South": (-86.66350631491771, 30.408974311320687),
-    "Lynn Street": (-86.6163284914776, 30.444932499751022),
-    "Falcon Place": (-86.61217750661234, 30.447603029344144),
-    "McVay Road": (-86.78453378075983, 30.861898188147844),
-    "Vista Bluffs": (-86.40906821117922, 30.38302872686381),
-    "Dan Barnes Road": (-86.67351055484855, 30.847318900011093),
-    "Linda Lane Northwest": (-86.63585700296264, 30.41521158298031),
-    "Canal Place": (-86.50123866654974, 30.387567391032164),
-    "Walter Avenue": (-86.57185511288607, 30.775938068859343),
-    "Redbud Trail": (-86.41579989199617, 30.49541424440301),
-    "North Park Boulevard": (-86.65444300894657, 30.45747884575799),
-    "Cactus Road": (-86.75464625119561, 30.409331304470488),
-    "Amelia Street": (-86.63098052620498, 30.43200884249859),
-    "Havenmist Lane": (-86.57475126793852, 30.80776912600841),
-    "Jackson Road": (-86.4902512823893, 30.47836111368501),
-    "Dabney Court": (-86.55523249999999, 30.7356765),
-    "Fuller Road": (-86.4041657347312, 30.769210952127246),
-    "Lake Silver Road": (-86.59170417534645, 30.828210936575527),
-    "Ranger Road": (-86.72655060444187, 30.413460092936646),
-    "Baggett Place Southwest": (-86.62347439682007, 30.407750211717502),
-    "Mayhair Road": (-86.53174074125583, 30.814027738814456),
-    "Meadowbrook Court": (-86.41135446524268, 30.48342779835848),
-    "Cinderella Lane Northwest": (-86.62101152023322, 30.454011579452228),
-    "Lawton Court": (-86.64728496682059, 30.445013441739302),
-    "Parkside Circle": (-86.41796481500411, 30.494519573708974),
-    "Shoal Lake Drive": (-86.55266334597033, 30.717785606587725),
-    "Chelsie Henry Road": (-86.7162053342961, 30.772060959196796),
-    "Bella Vista Road": (-86.61335187425856, 30.433903890867786),
-    "Earl Kennedy Road": (-86.53226441207279, 30.73959464223802),
-    "Elliott Road": (-86.66174831569, 30.415563489826074),
-    "Blackwater Run": (-86.45435894582008, 30.525003312539003),
-    "Long Court Northeast": (-86.59734696198369, 30.42212048418367),
-    "Simpson Avenue": (-86.70329636871578, 30.42025641510286),
-    "Barracuda Street": (-86.42033183662193, 30.383756551178198),
-    "Chesterfield Road": (-86.42542231814095, 30.75827608679059),
-    "Avalon Lane": (-86.58352527599408, 30.448050392281285),
-    "Myrtlewood Lane": (-86.41676442085729, 30.491059633135077),
-    "Rose Marie Court Southwest": (-86.6259575, 30.408443499999997),
-    "Cooper Street": (-86.75261424987477, 30.716805093617456),
-    "Etta Garrett": (-86.63944766341677, 30.75082766175783),
-    "Wilks Street": (-86.58483054999999, 30.704746099999998),
-    "Shockley Springs Road": (-86.63954334441779, 30.872215310408073),
-    "Clark-Moore Lane": (-86.7131593544035, 30.81279267671117),
-    "Chateaugay Street Northwest": (-86.6286525, 30.4250125),
-    "West North Avenue": (-86.58224782788368, 30.76973723774806),
-    "Carl Brandt Drive": (-86.58175320193855, 30.449121411255838),
-    "Magnolia Avenue": (-86.407081, 30.736376999999997),
-    "Beehive Lane": (-86.49342831812842, 30.796486012067867),
-    "Lindley Road": (-86.61064253637016, 30.786072677611152),
-    "Corduroy Road": (-86.77096423746755, 30.81664026504941),
-    "Pfitzer Circle": (-86.57789553973868, 30.70326721334966),
-    "Emmett Drive": (-86.46242035975128, 30.495445809144954),
-    "Parkwood Lane East": (-86.41784505804088, 30.488364761424577),
-    "Fairchild Road": (-86.51449897797033, 30.763069027647845),
-    "Fawn Lane": (-86.57082507289269, 30.437338348109726),
-    "South Lloyd Street": (-86.57646979159738, 30.752418169401277),
-    "Jay Bird Lane": (-86.67190152176086, 30.784122296207688),
-    "Harbor Lane": (-86.4861353549182, 30.409354661709905),
-    "Trista Terrace Court": (-86.4017975, 30.384729499999995),
-    "Ferguson Drive": (-86.63540435, 30.442876),
-    "Pleasant Terrace": (-86.51947312298739, 30.797604714452735),
-    "Edenfield Drive": (-86.6566335297881, 30.458960465628508),
-    "Matthew Street": (-86.46530354582093, 30.520983826174234),
-    "Baker Street Northwest": (-86.65377206067458, 30.425190653784515),
-    "Swan Circle": (-86.48853205263575, 30.400555434347343),
-    "Staghorn Road": (-86.43944480902007, 30.760177698972413),
-    "Autumn Avenue": (-86.74533715000001, 30.7195124),
-    "Palmetta Avenue": (-86.5448374030461, 30.723103492591452),
-    "Henderson Road": (-86.48962454724128, 30.905492698999222),
-    "Canoe Court": (-86.45627967693942, 30.401168959585345),
-    "Key Place": (-86.61138966826545, 30.469870658331494),
-    "Long Point Drive": (-86.79238947113951, 30.40781552347126),
-    "College Cove": (-86.47472570871258, 30.5346067992824),
-    "Browning Court": (-86.56138649497225, 30.712494573829314),
-    "Kennedy Drive": (-86.58506075999746, 30.770849330325888),
-    "Hospital Drive Northeast": (-86.60107900025994, 30.414496261234657),
-    "Acha Drive": (-86.7095719458526, 30.41457703299945),
-    "East Cypress Avenue": (-86.57235275032095, 30.764536533551574),
-    "South Nordberg Avenue": (-86.502377, 30.5056435),
-    "Griffith Avenue East": (-86.56535346893084, 30.75630806566953),
-    "Marion Court": (-86.43984481178134, 30.51390401991796),
-    "Serendipity Pointe": (-86.40408574403574, 30.38221237575241),
-    "Cardinal Street": (-86.62809751407237, 30.4671796013855),
-    "Riley Barnhill Road": (-86.70128801701448, 30.86490781633062),
-    "Scout Trail": (-86.65034462347631, 30.46341108593054),
-    "Spencer Drive": (-86.61463119920556, 30.43958920215861),
-    "Olin Cotton Road": (-86.6275763120316, 30.967956026129777),
-    "Averitt Place": (-86.56237568864104, 30.745887614815935),
-    "Quince Avenue": (-86.4606240903744, 30.510595942887086),
-    "Lakeview Road Northwest": (-86.61833844376767, 30.454864619013854),
-    "Mc Farland Avenue": (-86.62763523794162, 30.4512048056897),
-    "Kiowa Pass": (-86.614964, 30.775947999999996),
-    "Schooner Lane": (-86.5722034625715, 30.447044498966374),
-    "Knollwood Way": (-86.64513403365115, 30.429188370475497),
-    "Grady Baggett Road": (-86.62299905404922, 30.936912883181677),
-    "Maine Avenue": (-86.64610464423093, 30.43678555447544),
-    "Tarpon Drive": (-86.62799485718132, 30.39976586824359),
-    "Beaver Creek Road": (-86.7844808712066, 30.906321891991997),
-    "Country Club Road": (-86.55883031045674, 30.43837204678898),
-    "Oakmont Drive": (-86.43246355788988, 30.48033777716792),
-    "Johnson Road": (-86.5970322750522, 30.96824133755123),
-    "Ram Lane": (-86.55956737859624, 30.706219217830053),
-    "Carr Road": (-86.67488354293774, 30.689010883372777),
-    "Baywood Drive": (-86.45606653530562, 30.507797196142405),
-    "Mathis Lane": (-86.64907268636469, 30.451206003681822),
-    "Misty Court": (-86.47533067968756, 30.398937902245088),
-    "9th Avenue": (-86.57725780780325, 30.44484974649503),
-    "Lido Cove": (-86.44373335, 30.4855757),
-    "Rolling Lane": (-86.68565920273207, 30.720362800029555),
-    "Garfield Drive": (-86.64177138731166, 30.429098235165167),
-    "Short Bud Road": (-86.752516, 30.714824000000004),
-    "Roanoke Court": (-86.64773128203423, 30.441451399940913),
-    "Blackjack Plantation Road": (-86.66021472469689, 30.78838345191856),
-    "Tick Haven Lane": (-86.41437917650732, 30.83493337885787),
-    "Opal Court": (-86.61400605, 30.43561415),
-    "Wimico Circle": (-86.40452885646692, 30.397538540310155),
-    "Vicki Leigh Road": (-86.64569407805158, 30.444221242432494),
-    "Rocky Wood Way": (-86.44417275820167, 30.513845814888693),
-    "Waterloo Way": (-86.7819715413598, 30.40982572008976),
-    "Canidae Crossing": (-86.61980794814941, 30.721529227925803),
-    "White Circle": (-86.47713370272011, 30.515508001408516),
-    "Hillside Drive": (-86.4441245181549, 30.514965141369622),
-    "Roundabend Road": (-86.57216700095698, 30.434972574270578),
-    "Darlington Court": (-86.63445905903778, 30.438028362464678),
-    "Galvan Street": (-86.7075164, 30.413852900000006),
-    "Regions Way": (-86.42046523953682, 30.388296748011076),
-    "Parkwood Lane West": (-86.41914356707582, 30.48881374095094),
-    "North Windsor Lane": (-86.6542742323027, 30.465779040780244),
-    "Oakhill Avenue": (-86.63644432320132, 30.436729866171508),
-    "Marler Avenue": (-86.59653133677048, 30.399640651242564),
-    "Lilaberry Lane": (-86.41603186609059, 30.49859511538496),
-    "Snug Harbour Drive": (-86.58598655026495, 30.43448201865598),
-    "Teresa Court": (-86.43835387505038, 30.50991545131552),
-    "Sea Rover Lane Northwest": (-86.642618, 30.414194000000002),
-    "Allen Road": (-86.48862654510295, 30.90781537808192),
-    "Grimes Road": (-86.39691685634094, 30.972186937627846),
-    "Dee Street": (-86.64992113735752, 30.443488356640625),
-    "Summer Lane": (-86.629802, 30.44668),
-    "Beulah Street": (-86.63228501136368, 30.432030260553404),
-    "Boulder Street": (-86.58425016581052, 30.7060736381948),
-    "Diane Street": (-86.44395702284021, 30.533375142380443),
-    "North Bayshore Drive": (-86.49033776646625, 30.50292848750775),
-    "Louise Drive": (-86.59204650156882, 30.71312800216531),
-    "Forsman Drive Northwest": (-86.65409675551125, 30.421434297652034),
-    "Jeffery Avenue": (-86.65811600012972, 30.431937493752702),
-    "Mistral Lane East": (-86.6350631043825, 30.463512071773756),
-    "Flite Road": (-86.70125156094052, 30.782791930187717),
-    "North Ridgewood Cove": (-86.41595053986642, 30.473399348429563),
-    "Tamarack Avenue": (-86.45664214552377, 30.512551164739957),
-    "Fulmar Court Northeast": (-86.596011, 30.4226335),
-    "The Crossings": (-86.41197007744192, 30.482964288324954),
-    "Buena Vista Lane Northwest": (-86.622569794072, 30.454889343765576),
-    "Pinehurst Cove": (-86.43315588176311, 30.477041956264657),
-    "Whitbeck Street": (-86.70315453423821, 30.4092782592117),
-    "Crickett Lane": (-86.5724770113073, 30.823996790947515),
-    "Wild Horse Drive": (-86.59001834628562, 30.710168340325303),
-    "Auk Loop": (-86.40197542245726, 30.741901681140316),
-    "Griffith Avenue West": (-86.57149224556105, 30.75295186663015),
-    "Rachel Drive": (-86.62875726324958, 30.45400165039966),
-    "Mayo Street": (-86.47933918300839, 30.521509801196647),
-    "North Bristol Court": (-86.4193669933021, 30.462557390670042),
-    "Michelle Court": (-86.56144299939436, 30.714419101984166),
-    "Fleet Street Northwest": (-86.65497799980488, 30.420280008041168),
-    "Mariners Lane": (-86.73382839257197, 30.409907686395492),
-    "Becky Thatcher Court": (-86.589517, 30.7072445),
-    "Diviney Court": (-86.42123752554801, 30.50967002215663),
-    "Tala Way": (-86.46433705412005, 30.487964441403115),
-    "Turnberry Place": (-86.41939440083583, 30.474959079440342),
-    "Miramar Street": (-86.7496056, 30.687712650000005),
-    "Byron Court": (-86.5631655, 30.708510500000006),
-    "Garden Oak Way": (-86.42622076640258, 30.48829475946429),
-    "Palmer Drive": (-86.58661502262778, 30.721933776868074),
-    "Steele Road": (-86.71992796432588, 30.77056137000435),
-    "Muirfield Cove East": (-86.42556442823316, 30.475434761672854),
-    "Palermo Drive": (-86.62668299746055, 30.45275122944612),
-    "Powell Drive Northeast": (-86.60930379347032, 30.45885571188472),
-    "Park Place": (-86.53492279699265, 30.781947028276075),
-    "Seneca Trail": (-86.61084480984876, 30.76914795227842),
-    "Lake Emerald Drive": (-86.66701707188207, 30.72141815035796),
-    "Wallman Lane": (-86.75333073591935, 30.745833136289914),
-    "Faulk Ferry Road": (-86.62416975170994, 30.844327415281366),
-    "Sandridge Drive": (-86.490480698664, 30.80539724999762),
-    "Greendale Avenue": (-86.64792014402936, 30.45769941323736),
-    "Lowell Mason Road": (-86.48898899822046, 30.763217862632406),
-    "West Audrey Drive Northwest": (-86.64603850569614, 30.417466307512484),
-    "Dodo Circle": (-86.4007508900919, 30.739748746936094),
-    "Susan Drive": (-86.59537352462323, 30.77008657101741),
-    "Wimbledon Way": (-86.59283707667214, 30.454331816894623),
-    "Chapperal Street": (-86.54584503065489, 30.724377791409893),
-    "Bracewell Street": (-86.58140687703053, 30.76786923524772),
-    "Pine Avenue West": (-86.57365159400537, 30.759932011708386),
-    "Harrington Street": (-86.51435000438613, 30.81606654775096),
-    "Waterway Drive": (-86.66284386058058, 30.74775535512248),
-    "Mc Arthur Avenue Northwest": (-86.62676340959192, 30.425673991776232),
-    "John Avenue": (-86.43001135067087, 30.384522135387385),
-    "Post Oak Path": (-86.65055787663384, 30.46309962804722),
-    "Willow Street": (-86.50511606174487, 30.40282236856834),
-    "Woodbriar Court": (-86.60698718973656, 30.46746738043309),
-    "Lembeck Road": (-86.5189375294285, 30.830713926417115),
-    "Andros Way": (-86.42024989991137, 30.479725993253687),
-    "Ranger Street Southwest": (-86.61595367499841, 30.408550731819904),
-    "Sod Drive": (-86.644469, 30.453022),
-    "Sharilyn Drive": (-86.58579173611824, 30.465698608595233),
-    "Oakwood Way": (-86.41504499999999, 30.473054500000003),
-    "Adriaan Court": (-86.57544200000001, 30.439493),
-    "Hudson Drive": (-86.59895201354861, 30.445645331132415),
-    "Railroad Street": (-86.46251913097498, 30.96389895095394),
-    "High Ridge Road": (-86.46599213971625, 30.820865141607975),
-    "Pahokee Lane": (-86.45172299999999, 30.398215500000003),
-    "Lewis Lane": (-86.70757231943458, 30.410218604142383),
-    "Pompano Avenue": (-86.61949371681588, 30.398143539028503),
-    "Seagull Circle": (-86.48967086826777, 30.39881049722659),
-    "Long Alley": (-86.56732674989382, 30.769434467835634),
-    "Seminole Street": (-86.65295500023262, 30.43983048791116),
-    "Market Avenue": (-86.4947512436656, 30.50943724012138),
-    "Lanman Road": (-86.45779746495393, 30.489825820885624),
-    "Conch Cay": (-86.40355650953377, 30.380666001469706),
-    "East Lake Drive": (-86.55478140577726, 30.435659130037134),
-    "East Park Avenue": (-86.47997373195878, 30.525185436691018),
-    "Boca Drive": (-86.41724859778469, 30.48692109279653),
-    "Crazy Times Lane": (-86.40480817238993, 30.853152091117785),
-    "Richbourg Avenue": (-86.58153385752964, 30.448336461610857),
-    "Mistral Lane West": (-86.63611619943437, 30.463564496214783),
-    "Florida Place Southeast": (-86.60616236922695, 30.404211151149546),
-    "Kate Court": (-86.41343644819544, 30.487159730579883),
-    "Cimmoran Road": (-86.43366440002616, 30.761021000493454),
-    "Caswell Place": (-86.56504850517624, 30.758369890037855),
-    "Quail Ridge Drive": (-86.46823265113942, 30.390852219523964),
-    "Dixie Road": (-86.48346475616377, 30.48004115311095),
-    "Porpoise Avenue": (-86.61839146183557, 30.3983264348986),
-    "Coleman Street": (-86.57946658498726, 30.766549237353924),
-    "Stewart Road": (-86.57061334431003, 30.99119001264288),
-    "Summit Court": (-86.41174423507006, 30.487334946943875),
-    "Jamaica Way": (-86.42376479706161, 30.483168463561988),
-    "Sandalwood Way": (-86.41224566552775, 30.469395800993325),
-    "Pinehaven Drive": (-86.78605799995098, 30.41342600495001),
-    "Muscogee Trail": (-86.60912594922003, 30.769703989543885),
-    "Brenda Lane": (-86.75781695677398, 30.41327247495167),
-    "Rush Park Circle": (-86.71923725413397, 30.41357729783006),
-    "Japonica Lane": (-86.58174699741788, 30.45356236616695),
-    "Adam Street Northwest": (-86.64414403640875, 30.41626127328035),
-    "Young Road": (-86.53731418153916, 30.724778894291745),
-    "Bullard Church Road": (-86.75652420629537, 30.950945520555592),
-    "Honeytree Lane Southwest": (-86.63612004074702, 30.407644975627225),
-    "Ed Street": (-86.6157115, 30.4433555),
-    "Eldredge Road": (-86.60053494339809, 30.462402090293846),
-    "Yacht Club Court Northeast": (-86.60444749950727, 30.421262520326923),
-    "Elkwood Court": (-86.56155973075543, 30.437831958331188),
-    "Palm Boulevard North": (-86.47374580166586, 30.521192895661056),
-    "Independence Road": (-86.68660692120554, 30.414465069624196),
-    "Nassau Drive": (-86.41855474322304, 30.479798597847456),
-    "Malcolm Tucker Avenue": (-86.59394279963308, 30.767053395692454),
-    "Starfish Road": (-86.73939727998439, 30.408730315001122),
-    "Autumn Lane": (-86.64809600000001, 30.443151),
-    "Bahia Vista Drive": (-86.45602991090719, 30.494096833143722),
-    "Muirfield Cove West": (-86.429892, 30.475182),
-    "Zadie Lane": (-86.53126678412185, 30.828528048346808),
-    "Meadow Lane North": (-86.49654647422373, 30.817612940572612),
-    "Rhonda Kay Court": (-86.62462385037482, 30.45236628144428),
-    "Hollywood Boulevard": (-86.6250519948364, 30.412776713286156),
-    "Mississippi Avenue Northwest": (-86.61618740925093, 30.420179536460616),
-    "Bear Grass Court": (-86.57364999983548, 30.458967006406038),
-    "Tara Court": (-86.56588965851361, 30.704705745051644),
-    "Tupelo Street": (-86.52508971791455, 30.814717526069582),
-    "Roxy Lane": (-86.72700877607708, 30.693459391325145),
-    "Palm Boulevard South": (-86.4741081458531, 30.505233048650073),
-    "7th Avenue": (-86.57146403765897, 30.442418083931496),
-    "Madison Street": (-86.47208487034777, 30.52789456390044),
-    "Monette Avenue": (-86.50114127007129, 30.52812831602494),
-    "Tew Avenue": (-86.5367753970496, 30.767771924889246),
-    "Memorial Parkway Southwest": (-86.63090566044647, 30.409562476336017),
-    "Pop Cole Road": (-86.62861716361621, 30.45138141527212),
-    "Middle Brook Road": (-86.70770614161309, 30.718410767938963),
-    "Forrest Court": (-86.55019250000001, 30.764729500000005),
-    "Pandora Drive": (-86.58519399344502, 30.774898017123686),
-    "Saint Lucia Cove": (-86.42370531923294, 30.487634716134348),
-    "Woodland Avenue": (-86.7873109369897, 30.41248451100653),
-    "Shalimar Point Drive": (-86.55201004712733, 30.442380906315375),
-    "Killcrease Road": (-86.7009471451716, 30.84149299847068),
-    "Old Bethel Road": (-86.5877097682433, 30.79026972079255),
-    "Oakview Cove": (-86.41879662332211, 30.49812703356837),
-    "Tee Street": (-86.47898571515526, 30.50300299408977),
-    "Christopher Drive": (-86.59266121896815, 30.714903950128438),
-    "Mary Esther Cut Off": (-86.64444545713617, 30.425204041839162),
-    "Malibu Street": (-86.56901793308802, 30.728809398821916),
-    "Harbeson Avenue Southeast": (-86.60985551331825, 30.406102500450423),
-    "Eglin Drive": (-86.5618478112825, 30.447849067546475),
-    "Blackstone Road": (-86.649656, 30.4187515),
-    "Bradford Place Northwest": (-86.64307525025887, 30.447549495524044),
-    "Cedar Street": (-86.48151380819164, 30.399293612836274),
-    "Aspen Court": (-86.65405652725448, 30.458286047053544),
-    "Glensu Lane": (-86.52490618288296, 30.754255363174746),
-    "Hogan Lane": (-86.55987709720803, 30.70972890317741),
-    "Mary Esther Drive": (-86.67809208347894, 30.412766108853337),
-    "West Hampton Court": (-86.42071395458657, 30.464864704431733),
-    "Moriarty Street Northwest": (-86.62301948172345, 30.42317896791008),
-    "Dunedin Street": (-86.54404050072195, 30.746024476352094),
-    "Will Henry Lane": (-86.68497402724135, 30.79398827817041),
-    "Race Way": (-86.63331186120624, 30.93533440474232),
-    "Santa Rosa Boulevard": (-86.59650775545391, 30.39870491883572),
-    "Santa Rosa Boulevard,": (-86.59650775545391, 30.39870491883572),
-    "Terrance Court": (-86.64979024099425, 30.461181489559007),
-    "Marquette Street": (-86.508905209592, 30.520294371114126),
-    "Boundary Lane": (-86.73509353797324, 30.689990188117328),
-    "Ten Point Drive": (-86.46060039103426, 30.76165371555255),
-    "Linwood Road Northwest": (-86.61546499233226, 30.45493484021452),
-    "Vincent Avenue": (-86.63001197691828, 30.435445479509163),
-    "Boyce Drive": (-86.56825096906947, 30.434854937677237),
-    "Corsica Cove": (-86.42691772759713, 30.489674248121997),
-    "Casper Drive": (-86.63511056653559, 30.433677112758684),
-    "Bobcat Cove": (-86.43486601814625, 30.490698660815802),
-    "Graham Circle": (-86.57727689777889, 30.76720372599298),
-    "Star Drive": (-86.60835095110241, 30.467877435186193),
-    "Canary Circle": (-86.40366698282959, 30.746494595901915),
-    "Mark Twain Court": (-86.43108294285673, 30.489900079383744),
-    "North Ferdon Boulevard": (-86.55827111218687, 30.791243293819065),
-    "Cherrywood Court": (-86.47711251120602, 30.529022694161124),
-    "Idlewild Court Northwest": (-86.61488623528551, 30.454906259478292),
-    "Poquito Road North": (-86.57084955000002, 30.47514805),
-    "Geronimo Drive": (-86.55661267423199, 30.7195738844129),
-    "Murray Lane": (-86.55214345269398, 30.797833736749926),
-    "Costaki Court Northwest": (-86.6180551721511, 30.426158769475986),
-    "Parker Lane": (-86.64734570529367, 30.747274507280913),
-    "Merritt Drive": (-86.65975399999999, 30.760858),
-    "Little John Road": (-86.7378009377488, 30.413774020260217),
-    "Loping Deer": (-86.74013051701911, 30.6951025264308),
-    "Grenada Way": (-86.41932369306969, 30.48028780978479),
-    "Elderberry Lane": (-86.47705794547134, 30.52522493372309),
-    "A-21 Road": (-86.77000806761545, 30.416688471307715),
-    "Natchez Trace": (-86.55840034502089, 30.718649752972347),
-    "Wild Boar Run": (-86.43257147685377, 30.49254203905777),
-    "Gordon Road": (-86.5138172813421, 30.93271253223246),
-    "Monahan Drive": (-86.61024833141224, 30.432679350025737),
-    "Highland Street": (-86.49837074846988, 30.506578554274874),
-    "Whippoorwill Drive": (-86.75497612894812, 30.67408957551416),
-    "Cypress Road": (-86.49191593748796, 30.479535354893642),
-    "Hudson Drive Northwest": (-86.62570755026043, 30.42386342448574),
-    "Mulry Drive": (-86.45014822677088, 30.517180905665796),
-    "Bradford Street": (-86.64427117457835, 30.447877346913703),
-    "Eadie Cotton Road": (-86.74518863131858, 30.906914594956778),
-    "Primrose Circle": (-86.50195936630975, 30.398806210343253),
-    "Shannon Court Northwest": (-86.63716831109488, 30.424688265282054),
-    "Moonstone Drive": (-86.59045650029249, 30.779377187003576),
-    "Wynnhaven Court": (-86.7882378311474, 30.408080998748094),
-    "Cove Circle": (-86.46896348454717, 30.500212180520023),
-    "East Cane Avenue": (-86.5635192424466, 30.752528987884716),
-    "Parrot Street": (-86.735706, 30.6844255),
-    "Elaine Avenue Northwest": (-86.65309866132321, 30.426215447335245),
-    "Dewey Madden Circle": (-86.59925816371982, 30.882632813722957),
-    "Oakland Circle Northwest": (-86.63496297110314, 30.414994457416498),
-    "Sara Drive": (-86.5852990287155, 30.44756089436505),
-    "Audrey Drive": (-86.52831831784911, 30.826182299529332),
-    "Asaro Court": (-86.599017, 30.446465500000002),
-    "Creek Court": (-86.46239396246214, 30.401436732212048),
-    "Higdon Court Northwest": (-86.61615972398735, 30.45243733971401),
-    "Newcastle Drive": (-86.61115316218329, 30.441320086304668),
-    "Earls Court Northeast": (-86.60223250006297, 30.45891449976991),
-    "Irwin Avenue Northeast": (-86.61124581220106, 30.422258408460845),
-    "3rd Avenue Southwest": (-86.6158643384101, 30.40698645746573),
-    "Burned Out Bridge Road": (-86.78522959792872, 30.93238533021678),
-    "Sailboat Drive": (-86.44304343206812, 30.50077877531233),
-    "Henderson Beach Drive": (-86.44736977562782, 30.389434610392815),
-    "Pansy Avenue": (-86.55097015, 30.77557425),
-    "Hutchinson Street": (-86.42599276354814, 30.38577628377588),
-    "Woodrow Street Northeast": (-86.62075747842381, 30.442421176197506),
-    "Collins Lane": (-86.678032, 30.7793385),
-    "Talquin Cove": (-86.40266085901916, 30.389155841301285),
-    "Dawn Lane": (-86.6615973609765, 30.418966029681595),
-    "Connie Drive": (-86.58681151477606, 30.468943647411447),
-    "32nd Street": (-86.4807498009187, 30.517123690263887),
-    "Rebecca Road": (-86.4319555567868, 30.809659588104587),
-    "Jamie Court": (-86.55919, 30.7698755),
-    "Mark Street": (-86.4294433400271, 30.38447919697551),
-    "Buckward Road": (-86.66483620344425, 30.78681445052458),
-    "Redith Court": (-86.6582292959388, 30.43277312158192),
-    "Ariel Court": (-86.63579446083357, 30.460435952472597),
-    "Oak Street Northwest": (-86.65921987814194, 30.42604309988587),
-    "Colt Drive": (-86.40851436238357, 30.753762726784696),
-    "Elm Avenue Southeast": (-86.59739242534633, 30.408792808416727),
-    "Wekiva Cove": (-86.40024472877602, 30.388546330781057),
-    "Court Drive": (-86.47391126366927, 30.39720245397842),
-    "Sowell Drive": (-86.5388060251043, 30.69527512576143),
-    "Park Lane": (-86.56328264841139, 30.781044061581234),
-    "Marker Cove": (-86.72917448973872, 30.411161932502083),
-    "Country Living Road": (-86.69812875360314, 30.736208513844424),
-    "Lake Street": (-86.55130431054893, 30.764764823025033),
-    "Hilltop Road": (-86.73487702684037, 30.413709069223696),
-    "West 1st Street": (-86.58616197748854, 30.766180476099745),
-    "Tanglewood Drive": (-86.65287188363182, 30.435692495785208),
-    "Comanche Drive": (-86.65534421966107, 30.44254879422683),
-    "Josey Road": (-86.56328989710188, 30.864560752974214),
-    "Mara Drive": (-86.59156243874499, 30.715948733124666),
-    "Jonquil Circle": (-86.64813947705436, 30.43147148508073),
-    "Putter Drive": (-86.4326825, 30.486342),
-    "Utah Place Northeast": (-86.59928776214095, 30.41658814609205),
-    "Pinnacle Point Drive": (-86.55857812178607, 30.703690129771683),
-    "Henley Lane": (-86.68492852103161, 30.787361301324154),
-    "Bayview Drive": (-86.58721397001223, 30.466306228283987),
-    "Emory Street": (-86.6623954752165, 30.41755448938911),
-    "South Ridgewood Cove": (-86.41202902391683, 30.470070585029497),
-    "Kildare Circle": (-86.45263594036427, 30.51817561221609),
-    "Oleander Avenue": (-86.50195500000957, 30.39863600708451),
-    "Aztec Court": (-86.6076484456035, 30.78964054032413),
-    "Spruce Street": (-86.7895250676056, 30.41098691636488),
-    "Cahaw Way": (-86.39399293305762, 30.740191618977775),
-    "Henderson Lane": (-86.68317183242593, 30.776013021248275),
-    "Andalusia Street": (-86.66199290832066, 30.410186522028866),
-    "Carey Avenue Southwest": (-86.61764261044205, 30.41198188133395),
-    "Eagle Way": (-86.39314007371884, 30.749084479184376),
-    "Olde Post Road": (-86.42393402879448, 30.462294493541645),
-    "Baycrest Cove": (-86.43576030338387, 30.40612409953414),
-    "Georgia Place Northeast": (-86.60405077390327, 30.417709498580322),
-    "Price Road": (-86.69972291874032, 30.80578488105777),
-    "Marc Smith Boulevard": (-86.47238021410466, 30.518355724419102),
-    "Sunsail Circle": (-86.41157200900606, 30.385635921547138),
-    "Pine Cone Trail": (-86.45377240668309, 30.766194307850785),
-    "Kayla Court": (-86.41703399174935, 30.386905071777196),
-    "Acadia Cove": (-86.417649, 30.493706000000003),
-    "Woodbine Drive": (-86.58957954401225, 30.789335460219213),
-    "Restaurant Row": (-86.45665887840427, 30.385823308359093),
-    "Evergreen Parkway": (-86.46820723565578, 30.814713880520248),
-    "Ries Road": (-86.52754137474271, 30.93739100622656),
-    "Windham Avenue Southeast": (-86.6065649419259, 30.409575110223624),
-    "Kepner Drive Northeast": (-86.59381634189863, 30.413979615438176),
-    "Treeline Court": (-86.6410625, 30.435767499999994),
-    "Capri Cove East": (-86.44093385593989, 30.48738781256),
-    "Summerbrooke Park Road": (-86.644494493472, 30.440287999890607),
-    "Kelly Avenue Northeast": (-86.61171001821695, 30.420343609759648),
-    "Morris Street": (-86.5292772726741, 30.7538704154699),
-    "Sean Lane": (-86.47083950000001, 30.5121715),
-    "Cyndi Street": (-86.60604509898364, 30.443688779071426),
-    "Blue Gill Way": (-86.53769945894054, 30.78180888642599),
-    "Camellia Avenue": (-86.40428485656457, 30.74683983968477),
-    "Kervin Road": (-86.4038628136662, 30.76434433944289),
-    "Smith Drive Northeast": (-86.5951265931197, 30.4168510831274),
-    "Johnson Lane": (-86.52490009781533, 30.8210829596422),
-    "New Market Road": (-86.42026878302697, 30.51199647260093),
-    "Overview Drive": (-86.53854158298864, 30.788323940859808),
-    "Lacey Lane": (-86.62437632681221, 30.734427652783697),
-    "South Central Drive": (-86.61977499500077, 30.447232739456656),
-    "Sandpiper Circle": (-86.490376359783, 30.399414883692554),
-    "Homestead Road": (-86.65771720113104, 30.820231835778152),
-    "Bucking Up Road": (-86.4993953630281, 30.962840434533824),
-    "Murphy Lane": (-86.71890696212878, 30.870067557764806),
-    "Laurelwood Drive": (-86.5162375, 30.794607),
-    "Jillian Drive": (-86.59112209880305, 30.717704020223344),
-    "West Sunset Boulevard": (-86.63375528111379, 30.43716840285495),
-    "Berrywood Trail": (-86.5141175, 30.885207000000005),
-    "Cailin Street": (-86.607815, 30.444087500000002),
-    "Richman Road": (-86.76140240905403, 30.696228953496213),
-    "Boyette Boulevard": (-86.4672016222927, 30.957048872697907),
-    "Planet Drive": (-86.48251290026492, 30.41047824480263),
-    "Piper Lane": (-86.69303568915272, 30.745465965898074),
-    "Amos Street": (-86.56241678265471, 30.755137750351928),
-    "Mill Stone Cove": (-86.55554460374127, 30.723281016606652),
-    "Sugartown Road": (-86.60560146487227, 30.705425470913738),
-    "Lesters Lane": (-86.50579261618213, 30.88358103402479),
-    "Hume Drive": (-86.70233589065221, 30.410451283325894),
-    "Corvet Street": (-86.62574335855908, 30.453997812746007),
-    "West Fern Dell Avenue": (-86.49068710304047, 30.49621600263971),
-    "Choctawatcee Avenue": (-86.50644395128363, 30.48539760994431),
-    "Bermuda Cove": (-86.42697939094789, 30.486748265574718),
-    "Iona Lane": (-86.69429556029316, 30.802927162403613),
-    "Forest Drive": (-86.61078038130474, 30.436766967777626),
-    "East 2nd Avenue": (-86.57065249560554, 30.766914660936866),
-    "Penecost Way": (-86.62290347843937, 30.440186509545036),
-    "Tupelo Circle": (-86.70702037093416, 30.418090100788508),
-    "Roberts Drive": (-86.44357677797466, 30.509652112854017),
-    "Sonora Road": (-86.47394806479258, 30.407236173279227),
-    "Wingard Street": (-86.55754287334281, 30.7532151722704),
-    "Windsor Circle": (-86.54151529146421, 30.717538208175096),
-    "Navy Street": (-86.62672455816464, 30.442020051962846),
-    "Atoka Trail": (-86.55663362170438, 30.7158100562277),
-    "Shortwell Avenue": (-86.55767608280111, 30.746593349972898),
-    "Osceola Circle": (-86.53317513565172, 30.457130131962586),
-    "Warwick Drive": (-86.5934761385356, 30.45740518304033),
-    "Mimosa Avenue": (-86.49266781698037, 30.403634216392163),
-    "South Rayburn Street": (-86.55971789776574, 30.74909672731467),
-    "Wedgewood Lane": (-86.58910044962464, 30.780377537765748),
-    "Florence Avenue": (-86.66422714263791, 30.434774594661548),
-    "Jelly Lane": (-86.544960738329, 30.808481751013545),
-    "Poulton Drive Northwest": (-86.64472069300417, 30.415129658246542),
-    "Indigo Loop North": (-86.39729333274809, 30.390821219050082),
-    "Sara Avenue": (-86.76280065810793, 30.413636424772534),
-    "Seigler Street": (-86.74632133716479, 30.714265950984352),
-    "Dolphin Road": (-86.7401252361292, 30.408662148319525),
-    "Lake Ella Road": (-86.42008181105493, 30.802838071135007),
-    "Tisa Lane": (-86.70519455, 30.693662599999996),
-    "Joan Avenue": (-86.60191499999999, 30.447125),
-    "Ruckel Drive": (-86.43988788805979, 30.521172234990157),
-    "Woodlawn Avenue": (-86.64899445488226, 30.458459779089345),
-    "Jon Street": (-86.66430750016853, 30.41960899471596),
-    "Courthouse Terrace": (-86.57140931627235, 30.76070428745922),
-    "James Peaden Road": (-86.59830287204726, 30.913029729930923),
-    "Guildford Court": (-86.64944786496491, 30.463854800520945),
-    "Enda Lane": (-86.757155, 30.4132995),
-    "Greenwood Road": (-86.66842863826265, 30.777265153113525),
-    "Kit Drive": (-86.59020237143392, 30.76377998153042),
-    "Ponderosa Lane": (-86.39756041231546, 30.768101228569808),
-    "Kathleen Drive": (-86.75303854978586, 30.40931933779711),
-    "Hickory Street": (-86.41022812810874, 30.484197195590298),
-    "Keats Drive": (-86.56302520906232, 30.710778170914303),
-    "North Audrey Circle Northwest": (-86.64496618882283, 30.423034858628164),
-    "Bridlewood Path": (-86.6505884658497, 30.463766316435787),
-    "Kris Avenue Northeast": (-86.60698257899053, 30.46153339893343),
-    "Belah Drive": (-86.65664607402371, 30.757878875885943),
-    "Rhonda Drive": (-86.46556991942442, 30.520206949379176),
-    "Ready Avenue Northwest": (-86.67033891847944, 30.419281917774853),
-    "Orlene Road": (-86.75965124631534, 30.409679278976732),
-    "Lowery Place Southeast": (-86.60625208356862, 30.40617576692249),
-    "Lee Street": (-86.62881953014428, 30.463223174805737),
-    "South Partin Drive": (-86.48300176135061, 30.51786978555573),
-    "Coldwater Creek Circle East": (-86.4564466653948, 30.52695032395095),
-    "Ocala Road": (-86.49641866371698, 30.48599202356223),
-    "Sweetbriar Station": (-86.64439094147124, 30.45773836637364),
-    "Driftwood Court": (-86.497446, 30.4032935),
-    "Coral Drive": (-86.46872050936418, 30.499864829428613),
-    "Greentree Court": (-86.654894, 30.4582925),
-    "Northridge Road": (-86.4152005540046, 30.495783032065482),
-    "Capri Cove West": (-86.44252009787567, 30.48717614767222),
-    "Vine Street": (-86.49168003802143, 30.49773050834887),
-    "Tallokas Road": (-86.59546833216945, 30.787556928565245),
-    "Rattlesnake Bluff Road": (-86.71287523015212, 30.65633314817385),
-    "East Redstone Avenue": (-86.56291564181645, 30.736962940682798),
-    "Squirrel Path": (-86.65373932232295, 30.46293209077646),
-    "Chatelaine Circle Southeast": (-86.61073992718802, 30.40923249039145),
-    "Hibiscus Avenue": (-86.40856809210301, 30.747030184658193),
-    "Darlington Oak Drive": (-86.4631670340758, 30.493297183725485),
-    "Bridges Lane": (-86.51639966927743, 30.877907382091554),
-    "Kissimmee Road": (-86.48943428310197, 30.478960713172082),
-    "Camellot Court": (-86.55659545611618, 30.763275205094242),
-    "East Walnut Avenue": (-86.56372503600538, 30.756789134475724),
-    "Indian Oaks Drive": (-86.48719558196467, 30.395893538142037),
-    "Northview Park Drive": (-86.58835983891215, 30.721296997102392),
-    "Petit Court": (-86.58137496162756, 30.438124246076026),
-    "Ashley Lane": (-86.62850687501692, 30.453888879818045),
-    "Bakke Street": (-86.70589488781404, 30.41854080317929),
-    "Post Oak Place": (-86.57544, 30.440903499999997),
-    "North Partin Drive": (-86.47712401592396, 30.522205475635865),
-    "Hialeah Road": (-86.4921561201546, 30.47698255427207),
-    "Evergreen Drive": (-86.49971776530408, 30.401119372890623),
-    "Circle Drive Northwest": (-86.63755737936357, 30.43006372916715),
-    "Holbrook Circle": (-86.63066518211042, 30.453997991881533),
-    "Parkwood Court": (-86.41590479187637, 30.488515023409168),
-    "Alden Drive": (-86.62224675403444, 30.434593894081708),
-    "Springtime Drive": (-86.74338280148173, 30.720497254709496),
-    "Hg Lane": (-86.64223327945142, 30.754826487631767),
-    "Parkway Place Southwest": (-86.63454350056594, 30.411175472939963),
-    "Parkwood Cove": (-86.4166601794931, 30.48693709527702),
-    "Frank Campbell Road": (-86.52247115063463, 30.944260835301982),
-    "Overstreet Drive": (-86.49709095526056, 30.40002599996438),
-    "Union Avenue": (-86.45626121772698, 30.50064508358957),
-    "Camborne Avenue Northeast": (-86.60839617548032, 30.45576113251717),
-    "Laguna Street": (-86.60852070937308, 30.42421217766899),
-    "Anchors Place": (-86.48011778505634, 30.515538367462096),
-    "Arbor Glen": (-86.46498079672766, 30.533399668514328),
-    "Olin Merritt Street": (-86.65761425010413, 30.76354217902133),
-    "Cedar Ridge Way": (-86.47948885545544, 30.531431905510015),
-    "Red Oak Drive": (-86.54011160951352, 30.792129084937567),
-    "Saint Croix Cove": (-86.41861445230201, 30.48391149269969),
-    "Bob Sikes Boulevard": (-86.62711485567189, 30.44567383776159),
-    "Pine Street": (-86.50401027749493, 30.40077096206854),
-    "College Boulevard": (-86.50136215004754, 30.53347808638306),
-    "Eunice Lane": (-86.65803, 30.756644),
-    "Bethany Bay": (-86.40140395503089, 30.39644580625335),
-    "Holton Avenue": (-86.6267735, 30.4548755),
-    "Rose Lane": (-86.50295631192392, 30.820546615649384),
-    "Oakdale Road Northwest": (-86.61814794121034, 30.453822600826086),
-    "Morningbird Court": (-86.46712204644302, 30.52310050728265),
-    "Pine Avenue": (-86.46155133371454, 30.505784637544778),
-    "Springwood Circle": (-86.59930496366438, 30.77116648043399),
-    "Ida Coon Circle": (-86.43782056375849, 30.49540877311741),
-    "Larry Lane": (-86.50368195302244, 30.930615439929237),
-    "Bishop Avenue Northwest": (-86.62857469536964, 30.41738018117519),
-    "West Sunset Cove": (-86.4375615, 30.475671999999996),
-    "Sexton Drive": (-86.68189222067551, 30.841007436380043),
-    "Fowler Road": (-86.40227052158829, 30.752227444463834),
-    "Captains Circle": (-86.41509633687323, 30.40121060992571),
-    "Ibis Way": (-86.64589240000001, 30.444672949999998),
-    "Greenwood Cove East": (-86.41205375073667, 30.471790790146013),
-    "Preston Posey Road": (-86.62219308876871, 30.873704506857464),
-    "Bishop Road": (-86.63457542519673, 30.464872177826727),
-    "Carriage Lane": (-86.43938878220357, 30.391468113747816),
-    "Spring Street South": (-86.56957021878351, 30.754784617145603),
-    "Parish Boulevard": (-86.74804080098527, 30.411236974470057),
-    "Coldwater Creek Circle West": (-86.45790230304634, 30.527422480396687),
-    "Selvage Lane": (-86.49331060862403, 30.811389891215125),
-    "Vardon Way": (-86.42856143193191, 30.48097665488507),
-    "Page Bacon Road": (-86.65762757614391, 30.41906616476967),
-    "Turtle Crossing": (-86.4359802464809, 30.4904617373974),
-    "Wilder Street": (-86.4292872836363, 30.51178571688652),
-    "5th Avenue": (-86.57565398719663, 30.440194782448767),
-    "Branch Hill Park": (-86.44193242885088, 30.515317134784592),
-    "Wicker Circle": (-86.49498589578393, 30.48786580465631),
-    "Walton Court Northeast": (-86.59893637895105, 30.421407715921795),
-    "Dilmore Road": (-86.6952770387426, 30.927250622154887),
-    "Scottsdale Court": (-86.67331132796107, 30.41174944707345),
-    "Tray Drive": (-86.64309399999999, 30.445027500000002),
-    "Silver Street": (-86.58790143750223, 30.83478229353446),
-    "Hester Church Road": (-86.66684299925633, 30.84005341962627),
-    "Tanglewood Circle": (-86.64975256764518, 30.43643590277757),
-    "Sly Drive": (-86.6738792001835, 30.758548195858562),
-    "Forest Grove Place": (-86.64472949236587, 30.428103602101032),
-    "Cord Place": (-86.47929744162442, 30.40555778765841),
-    "Northern Dancer Drive": (-86.5507105480679, 30.731446230239126),
-    "Ketch Court": (-86.40546555045252, 30.39224899459141),
-    "Indian Trail": (-86.47093229002645, 30.408539594742525),
-    "Fall Street": (-86.48281117300351, 30.514870168974024),
-    "Greenwood Cove North": (-86.41306066595934, 30.47364165688978),
-    "Twin Lakes Lane": (-86.47457890752655, 30.394749379253575),
-    "Hosanna Way": (-86.4562597378245, 30.760438502262215),
-    "Wildwood Court": (-86.59050786733322, 30.79169335383302),
-    "Windrush Drive": (-86.42714001872741, 30.468419854330623),
-    "Peeble Drive": (-86.51026048598399, 30.821108911102378),
-    "Shaw Avenue": (-86.59178299050367, 30.779027500026874),
-    "Deville Drive": (-86.75391170022385, 30.413856096518217),
-    "Crete Cove": (-86.427593, 30.490879),
-    "Macs Road": (-86.40977931165284, 30.776568441824367),
-    "Gilley Road": (-86.52454351266412, 30.868190239167532),
-    "Quail Path": (-86.65222300887861, 30.46351340357562),
-    "Fairway Court": (-86.61772921120055, 30.73121439264869),
-    "Buckskin Court": (-86.57314552073666, 30.79860399138774),
-    "Judson Drive": (-86.6491490202435, 30.449723879958686),
-    "Shoreline Drive": (-86.79236706267781, 30.405759164835562),
-    "Audubon Drive": (-86.6434298401381, 30.43610805111282),
-    "Greenwood Cove South": (-86.41222850000001, 30.471333),
-    "Orlimar Street": (-86.61275734244991, 30.725082603447664),
-    "Marilyn Avenue Northwest": (-86.64321027145105, 30.421694475496746),
-    "Wicker Road": (-86.49570978363754, 30.488446126843495),
-    "Apple Drive": (-86.58798656666201, 30.709031610917815),
-    "Witshire Court": (-86.63308061329249, 30.461558714054004),
-    "Friar Tuck Drive": (-86.47155452378648, 30.521206000482227),
-    "Edgewood Place": (-86.56470398445514, 30.768414438498706),
-    "Amberjack Drive": (-86.60086626251565, 30.397529808957067),
-    "Jenkins Road": (-86.63779723971194, 30.684058098352185),
-    "Culp Avenue": (-86.64861650058994, 30.441460963084584),
-    "West Hymes Road": (-86.49726329156293, 30.486626685505303),
-    "Bretton Cove": (-86.41860201395423, 30.49582030585155),
-    "Barracuda Avenue": (-86.60386260127494, 30.396958688271475),
-    "Egan Drive": (-86.6148342760765, 30.726685601436856),
-    "Apache Street": (-86.65349452107637, 30.44150238674955),
-    "Broken D Lane": (-86.44324225, 30.8056653),
-    "Valparaiso Boulevard": (-86.46718167511325, 30.50087422076299),
-    "Gaffney Road": (-86.54593860790827, 30.466854516110534),
-    "F Avenue": (-86.5051191162616, 30.479160637674273),
-    "Northridge Place": (-86.41581195073884, 30.494475072010125),
-    "Canal Drive": (-86.44735978989236, 30.509962870392968),
-    "Shirah Street": (-86.42830564222233, 30.384428934786776),
-    "Cardinal Circle": (-86.48871349999999, 30.3985885),
-    "Palmetto Palm Circle": (-86.47350280542567, 30.49667074992877),
-    "Sparrow Drive": (-86.75513702575002, 30.671638486559228),
-    "Palm Harbor Drive": (-86.59848145763682, 30.44744397157102),
-    "Woodbridge Road": (-86.42024452601491, 30.51040935560325),
-    "Abbott Circle": (-86.47594184618077, 30.513912122124),
-    "McDonald Street": (-86.5732513463548, 30.748980348949594),
-    "South John Sims Parkway": (-86.49389926798682, 30.511611560655886),
-    "Skylark Road": (-86.73738431764546, 30.412622948568515),
-    "Hampton Court": (-86.64377281961015, 30.408796250710072),
-    "Winchester Way": (-86.544101, 30.791984),
-    "Hampton Court South": (-86.4189248684732, 30.464006201251497),
-    "Pollen Court": (-86.65527850000001, 30.428485000000002),
-    "Horne Hollow Road": (-86.4936435061206, 30.81583630508002),
-    "Cedar Avenue Southwest": (-86.62498912268398, 30.407877337962855),
-    "Brackin Road": (-86.78530753544794, 30.99155791608215),
-    "Westfall Circle": (-86.70015742618614, 30.420573030554262),
-    "Troon Way": (-86.42858843909538, 30.479846944594488),
-    "Mayo Trail": (-86.59096813377218, 30.762455554551728),
-    "Peggy Drive": (-86.58244060672985, 30.712462490053344),
-    "Sea Hero Lane North": (-86.5522445, 30.734122499999994),
-    "Calatrava Court": (-86.39968700399969, 30.38245799372785),
-    "John Jones Road": (-86.71598939102144, 30.754050679124376),
-    "Blue Lake Cove": (-86.42560138369741, 30.467358637408505),
-    "Phil Tyner Road": (-86.56090981287905, 30.80291721562878),
-    "Carlin Road": (-86.63339926163309, 30.68339752507294),
-    "Shoshone Pass": (-86.60693701043807, 30.77018674139823),
-    "Whelk Court": (-86.63086838388472, 30.398198310186757),
-    "Wagonwheel Road": (-86.60258206728432, 30.454534192636995),
-    "Benning Drive": (-86.49593979390163, 30.392378948210393),
-    "White Oak Street": (-86.549439832182, 30.784026554662148),
-    "Hunter Drive": (-86.54495204109381, 30.791919200746484),
-    "Burton Drive": (-86.63102692004287, 30.6889026362414),
-    "Marnan Drive Northeast": (-86.60943587839213, 30.470152609985398),
-    "Riva Ridge Drive": (-86.54944781480188, 30.73160047612351),
-    "Linden Avenue": (-86.46636001830842, 30.500109538798124),
-    "Meadows Circle": (-86.64382077158308, 30.42912690649482),
-    "Crane Lane": (-86.59736637091741, 30.70333409923067),
-    "Empty Promise Lane": (-86.63428431822669, 30.835573752014543),
-    "Desota Court": (-86.48206769999999, 30.478682149999997),
-    "Elm Street": (-86.48135422863791, 30.51996293824408),
-    "Lindsey Lane": (-86.45309608974766, 30.52833597830762),
-    "Chestnut Avenue Southeast": (-86.60279426854478, 30.410919851175027),
-    "Lucky Lane": (-86.75711297267571, 30.41388472350133),
-    "Clear Lake Cove": (-86.42644250000001, 30.4668255),
-    "Gracie Lane": (-86.46590368921316, 30.53376543041153),
-    "Sieger Road": (-86.74823639544384, 30.71895828107881),
-    "Tamara Cove": (-86.46614421536749, 30.489933640223054),
-    "Hoover Lane": (-86.46774196541999, 30.526106805587883),
-    "Forest Avenue": (-86.60068600097148, 30.463366786791394),
-    "Rue de Palms West": (-86.4659799678042, 30.4961008453105),
-    "Hernando Road": (-86.4818433, 30.480522450000002),
-    "East North Avenue": (-86.57654848081849, 30.769631870686958),
-    "Greenwood Circle": (-86.64637166657661, 30.430038802543265),
-    "Terrill Drive": (-86.57759635808699, 30.770125855563574),
-    "Oxford Court": (-86.65700364040275, 30.4191689347429),
-    "Steeplechase Drive": (-86.55531896589436, 30.732545987961448),
-    "Riverview Loop": (-86.63375262548577, 30.68730317941962),
-    "Waverly Circle": (-86.5017920991556, 30.38630201291478),
-    "J V Woolley Road": (-86.46902392001797, 30.78422764722547),
-    "Ironwood Drive": (-86.65331353427624, 30.436897198069026),
-    "Palm Shores Drive": (-86.58451037567947, 30.4462290311805),
-    "Trail Court": (-86.48068159211753, 30.407411315806314),
-    "Friertuck Road": (-86.73853114601906, 30.413748473423777),
-    "Windward Circle": (-86.44083139896473, 30.481784267335716),
-    "Polly Court": (-86.51037160011087, 30.817189746645404),
-    "Newcastle Circle": (-86.6205482141511, 30.440894584073565),
-    "Tennessee Williams Drive": (-86.42637338337583, 30.489810551442574),
-    "Aleta Avenue": (-86.763531, 30.413657999999998),
-    "Pineforest Drive": (-86.49626499428261, 30.80187648301122),
-    "Florosa Court": (-86.72554887184722, 30.41238914166165),
-    "Sunset Lane": (-86.58382809659786, 30.467615290399042),
-    "Overbrook Drive": (-86.65059596726203, 30.433929499423794),
-    "Sea Gull Circle": (-86.489712, 30.398574),
-    "East Mariah Way": (-86.63513942643553, 30.46106334336258),
-    "Ridgewood Way": (-86.41434177792368, 30.47168069671984),
-    "Gilmore Court Southeast": (-86.59167716279995, 30.405033213640046),
-    "Larkspur Court": (-86.46603167910119, 30.52167931685328),
-    "Oak Street North": (-86.53507321575874, 30.821310670259656),
-    "Yuchi Court": (-86.46733039905824, 30.49258039281338),
-    "Auk Way": (-86.40055057118634, 30.742281408181686),
-    "Mar Walt Drive": (-86.6321832, 30.449447050000003),
-    "Adrienne Court": (-86.56173899884422, 30.7131248251634),
-    "Creola Lane": (-86.74754935050977, 30.724888707186505),
-    "O'Neill Avenue": (-86.70001433196198, 30.413384973372526),
-    "Lighthouse Road": (-86.59257479401947, 30.4414941943936),
-    "Brighton Court Northeast": (-86.60261955923414, 30.459099204181626),
-    "Isle of Capri": (-86.57748573581387, 30.792402718818607),
-    "West Timberlake Drive": (-86.74728319972736, 30.412223050754644),
-    "Sandprint Circle": (-86.47705337808664, 30.384748191471513),
-    "Lonesome Pine Street": (-86.70307324383283, 30.69086731486726),
-    "Parker Drive": (-86.44183619065468, 30.509766239038516),
-    "Lincoln Drive": (-86.64187460741917, 30.437270768456894),
-    "Miller Street": (-86.60265834699429, 30.43986178834913),
-    "Raimund Herden Drive": (-86.4157830435451, 30.482476693514243),
-    "Tropic Avenue": (-86.62772069134516, 30.399375555923655),
-    "Ace Road": (-86.48057781640969, 30.936024011812094),
-    "Biscayne Road": (-86.49427604356362, 30.480660571611022),
-    "Sapphire Court": (-86.61398205, 30.436334199999997),
-    "Westminster Road": (-86.60881352334955, 30.442100013779054),
-    "Comet Street Southwest": (-86.61530085543342, 30.411227937177085),
-    "Little Crescent Street": (-86.65231489334961, 30.46313642006144),
-    "Mars Street": (-86.48197862748071, 30.409970058381116),
-    "Sunfish Street": (-86.41470629877993, 30.382888490668005),
-    "Pear Orchard Boulevard": (-86.55205208166366, 30.796459068800367),
-    "Choctawhatchee Road Northeast": (-86.59067157736905, 30.413032096258984),
-    "Rainmaker Drive": (-86.52612021740165, 30.855600425168078),
-    "Atkins Road": (-86.74924377256548, 30.78690246442337),
-    "Ford Street": (-86.52407590717098, 30.760734046367176),
-    "Holley Drive": (-86.53328952153876, 30.742840140478688),
-    "Whisper Lane": (-86.50067373031062, 30.752600293224027),
-    "Okaloosa Road Northeast": (-86.59412130160977, 30.41460638946447),
-    "North Savage Street": (-86.57351358281944, 30.757530908835015),
-    "Silverhill Road": (-86.55440896378302, 30.816472854586884),
-    "Rhodes Cove": (-86.42785836699632, 30.490493000679038),
-    "Arizona Drive Northeast": (-86.60130845095999, 30.418491378536267),
-    "Whitehead Drive": (-86.70554723900824, 30.726727524625026),
-    "Marina Cove Drive": (-86.44605528301669, 30.491990070203865),
-    "3rd Avenue": (-86.49383220080564, 30.405074874855526),
-    "Baker Avenue Northwest": (-86.6227217736588, 30.42357021369888),
-    "Heron Loop": (-86.40705731613684, 30.73714165266166),
-    "Nathan Lane": (-86.58054324469443, 30.95063037940664),
-    "Scranton Street": (-86.6001644729612, 30.445852870351125),
-    "James Court": (-86.6272795, 30.438862999999998),
-    "Boundry Lane": (-86.73465679942187, 30.68781871696135),
-    "Beckwood Lane": (-86.67588675010592, 30.712516857045763),
-    "Ansley Drive": (-86.43932908926386, 30.502031171185145),
-    "Anastasia Drive Southeast": (-86.59576924671615, 30.4115060452884),
-    "James Street North": (-86.56633926170959, 30.77771614271184),
-    "Williams Street Northwest": (-86.61548495418917, 30.420975779360827),
-    "Wildflower Court": (-86.47042864571935, 30.509525521197727),
-    "Leyland Lane": (-86.60999041983088, 30.72597520406161),
-    "Tikell Drive": (-86.61528382703297, 30.71652643659432),
-    "Saint Vincent Cove": (-86.42119300194706, 30.48575893424649),
-    "Sadler Court": (-86.48061660935227, 30.502714726447685),
-    "Quail Run": ( -86.46929894186843,30.39424283081651),
-    "Washington Avenue": (-86.68563433041456, 30.796096292536117),
-    "Savage Street South": (-86.57008166486887, 30.753702272551518),
-    "Calusa Boulevard": (-86.40543409959213, 30.389231646858295),
-    "Canterbury Cove East": (-86.43548388265603, 30.485915119741776),
-    "Shrewsbury Way": (-86.58947985309875, 30.463206311479805),
-    "Goldsbys Way": (-86.49999291480886, 30.395618804834275),
-    "Oriole Place": (-86.5348435303423, 30.78696576788897),
-    "Sunset Pointe": (-86.41185405380824, 30.382947354144815),
-    "Poverty Creek Road": (-86.45794288173308, 30.807703214041958),
-    "Latham Road": (-86.43516750624335, 30.83322433454737),
-    "Sioux Circle": (-86.6055742180417, 30.785945173114126),
-    "Nutmeg Avenue": (-86.46393162155594, 30.506236361115562),
-    "Lakeview Street": (-86.52619310956206, 30.760401711704386),
-    "Davenport Court": (-86.60559955, 30.43572305),
-    "Raintree Boulevard": (-86.42050390483355, 30.466734502535513),
-    "Thomas Street": (-86.46089958325545, 30.501584954776277),
-    "Dove Field Road": (-86.64668179784618, 30.469377751751864),
-    "Kimbrough Road": (-86.65450885483746, 30.408356630172513),
-    "Suwanee Lane": (-86.6264165, 30.4419445),
-    "Teakwood Place": (-86.62716700013087, 30.428964492814192),
-    "Brock Avenue": (-86.55866464597855, 30.74958066711576),
-    "Magnolia Shores Drive": (-86.47733387678034, 30.500217782953627),
-    "Somerset Drive": (-86.6323618193662, 30.44088866713286),
-    "Summer Creek Cove": (-86.55005378847434, 30.72256280227502),
-    "Jackson Avenue": (-86.50928904902568, 30.517676608690092),
-    "Tuxedo Drive": (-86.61274693498909, 30.44451302756487),
-    "Camelia Drive": (-86.65056751978177, 30.437844817575286),
-    "Chip Lane": (-86.47175949999999, 30.512194),
-    "Stillwell Boulevard": (-86.55171129123977, 30.77293513544973),
-    "Mill Pond Cove": (-86.55758425711794, 30.724605046836377),
-    "Isle of Palms Boulevard": (-86.40313915, 30.38112785),
-    "Mount Olive Road": (-86.46194712481898, 30.777303152037916),
-    "Quailwood Drive": (-86.4682066, 30.391650849999998),
-    "Park Drive": (-86.63151423527067, 30.399327597853144),
-    "Falcon Ridge Lane": (-86.61927850000001, 30.441833),
-    "Clinton Street": (-86.5042255, 30.5160345),
-    "Childrens Lane": (-86.49864438706831, 30.835451967343264),
-    "Rocky Bayou Drive": (-86.44875511821856, 30.512471626562675),
-    "Robinwood Drive Northwest": (-86.61952114763011, 30.41805578040805),
-    "Fire Lane Road": (-86.76168177090548, 30.742011202477194),
-    "Lance Lane": (-86.73945709976375, 30.72047216019701),
-    "Sumac Court": (-86.5741292249362, 30.457891420154166),
-    "Fleming Drive": (-86.54992198420668, 30.778473053177354),
-    "Navajo Trace": (-86.61081286863812, 30.77717836006904),
-    "Vintage Court": (-86.49797620000001, 30.40886415),
-    "Jimmy Street": (-86.635530618355, 30.445713019203808),
-    "Dipolo Street": (-86.53711393173887, 30.74908288618772),
-    "Sunningdale Cove": (-86.43500167166448, 30.479790958630687),
-    "Yacht Club Drive Northeast": (-86.59895393119082, 30.42286196266874),
-    "Dorthy Lane": (-86.7212025, 30.7575795),
-    "Pineview Court": (-86.652054588183, 30.40841429766522),
-    "Ridgewood Avenue": (-86.79106630427032, 30.414797564922868),
-    "Valencia Drive": (-86.6184360002273, 30.44042098376791),
-    "Hamby Place": (-86.69772871174665, 30.424728047033337),
-    "Oakmont Way": (-86.43614642246602, 30.47994382741491),
-    "Seahorse Avenue": (-86.62304357140205, 30.39838701649206),
-    "Holland Road": (-86.71978674745053, 30.725715282880415),
-    "Shady Lane": (-86.65617799702191, 30.408272596592763),
-    "Wolftrack Ridge": (-86.41402598765126, 30.831446232182337),
-    "Karick Lake Lower Road": (-86.64456176882896, 30.893894505404802),
-    "Bob Brooks Road": (-86.74114994132403, 30.78508705657251),
-    "Central Avenue": (-86.62934534102365, 30.453925370565134),
-    "Greenwood Lane": (-86.4127625, 30.471079999999997),
-    "Windlake Drive": (-86.42522002631891, 30.47117113982419),
-    "Foster Drive": (-86.54034222913918, 30.46639123162879),
-    "Rue Dianne": (-86.77831899567282, 30.411990740929365),
-    "Nanas Road": (-86.63916405419506, 30.91924427561914),
-    "Henderson Drive": (-86.5501853926779, 30.761124279931337),
-    "Sixteenth Green Cove": (-86.4519215, 30.5201285),
-    "Oak Shores Drive": (-86.4432936536017, 30.498736872984587),
-    "Bermuda Circle": (-86.42676688973604, 30.487783582996453),
-    "West Casa Loma Drive": (-86.75252887675772, 30.41331604208393),
-    "Brian Drive": (-86.5786741563284, 30.704730477094312),
-    "Windward Cove East": (-86.4375737750082, 30.484146993218573),
-    "Ruth Lane": (-86.50945418103105, 30.695562185512763),
-    "Amie's Lane": (-86.76057956141388, 30.77123102240826),
-    "Gladys Street": (-86.60307853285623, 30.441566712449703),
-    "Staff Drive Northeast": (-86.6021682810504, 30.415485937256683),
-    "Top Flight Drive": (-86.55926968958663, 30.70684118971379),
-    "Bayou View Drive": (-86.64071894347049, 30.436015510170925),
-    "Hood Avenue Southeast": (-86.59288710048388, 30.40591198413586),
-    "Winter Park Court": (-86.626428, 30.441582500000003),
-    "Canterbury Cove West": (-86.43629884846175, 30.485282603050933),
-    "Windy Lane": (-86.66452648460665, 30.40919658503284),
-    "Jace Drive": (-86.46249738836804, 30.7524346708157),
-    "Wright Drive": (-86.41142077873478, 30.47877699206407),
-    "Possum Ridge Road": (-86.50284251083792, 30.833037615455936),
-    "Lark Lane": (-86.53021625178954, 30.754409122194062),
-    "Mulberry Court": (-86.46091378536445, 30.492266074649642),
-    "Yellow River Lane": (-86.7513225, 30.6747335),
-    "Thames Place Northwest": (-86.62371999999999, 30.422018),
-    "Hilary Street": (-86.53736924127362, 30.795501036550533),
-    "Swift Fox Run": (-86.61965629102274, 30.720303636228667),
-    "Dove Road": (-86.62880524263163, 30.46226560734869),
-    "Springcreek Drive": (-86.51323348725863, 30.88633977570055),
-    "Kelly Mill Road": (-86.77493175573085, 30.729771664483277),
-    "Register Lane": (-86.52311365446427, 30.756285626429207),
-    "East Bunting Way": (-86.39381249693602, 30.740709520964163),
-    "Friendship Road": (-86.737063449966, 30.413923545394756),
-    "Crosslake Cove": (-86.63214874108965, 30.438858225070852),
-    "Country Club Drive": (-86.4909463656966, 30.522434133266522),
-    "Spanish Moss Trail": (-86.48128835844331, 30.39881039326499),
-    "Carr Drive": (-86.44671168417099, 30.532462014518753),
-    "Maxwell Drive": (-86.69061486683323, 30.739987301224367),
-    "Meadow Court": (-86.65150582887868, 30.457880879545815),
-    "Cottonwood Drive": (-86.5299551589146, 30.81640656015127),
-    "Splinter Lane": (-86.71125907599381, 30.81153837372784),
-    "Keyser Mill Road": (-86.68171764497535, 30.750651262250148),
-    "Amellia Place": (-86.55589693383997, 30.76482199217541),
-    "Phillips Court": (-86.4990458122168, 30.505997115235143),
-    "Aqua Drive": (-86.5891474372824, 30.7098584884568),
-    "Windward Cove North": (-86.43983850000001, 30.4847),
-    "Papaya Park": (-86.40409069174855, 30.385264684363037),
-    "Galway Drive": (-86.44409958664502, 30.51597099153792),
-    "Prestwick Cove Road": (-86.42637024942749, 30.484982094408693),
-    "Patch Avenue": (-86.54997890041085, 30.772009253247887),
-    "Juniper Avenue": (-86.46868478964109, 30.52199380574647),
-    "Winton Court": (-86.500876, 30.4037715),
-    "Smith Street": (-86.56108289185453, 30.767529673843963),
-    "Ultra Lane": (-86.55966708079114, 30.70690145537385),
-    "Stephanie Road": (-86.4600046230211, 30.805768121001545),
-    "Hawkins Road": (-86.64198715748795, 30.447782826601262),
-    "Cape Drive Northwest": (-86.64026157475332, 30.417375427260616),
-    "Old Place Road": (-86.5239197261545, 30.98188271225863),
-    "Little Silver Road": (-86.5189472118932, 30.696055744826825),
-    "Colonel Greg Malloy Road": (-86.51299620359922, 30.694644393778542),
-    "Karen Court": (-86.47540891150744, 30.510707932474514),
-    "Skymaster Court": (-86.5116828823299, 30.768282158640833),
-    "Lincolnshire Drive": (-86.46963081990967, 30.520842926377256),
-    "Cardinal Court": (-86.54130603941823, 30.784835092758648),
-    "Saddle Creek Drive": (-86.64798448259482, 30.463289439855128),
-    "Sand Hill Road": (-86.45991774059048, 30.80977714406101),
-    "Indian Hills Drive": (-86.48843294644882, 30.396091572813717),
-    "Kensington Lane": (-86.54055305084277, 30.716880887895904),
-    "Gallant Fox Lane": (-86.55189230693384, 30.73147200709467),
-    "Ella Ruth Drive": (-86.66431900036783, 30.43088047769219),
-    "Allen Drive": (-86.62470350252993, 30.441269955663525),
-    "Louise Circle": (-86.46566144866098, 30.404884453697967),
-    "Windward Cove South": (-86.43916100686324, 30.483415662903422),
-    "Forrest Parkway": (-86.54501953393554, 30.7848474657101),
-    "Melvin Street": (-86.49930512208718, 30.394595308756323),
-    "Beaver Creek Tower Road": (-86.76033435609783, 30.840855851083795),
-    "Log Place": (-86.48019746282313, 30.406998869919278),
-    "Papa Lawrence Drive": (-86.48701894664012, 30.912487082924542),
-    "Burdeshaw Drive": (-86.47459104767047, 30.516143651140023),
-    "Wexford Drive": (-86.44268894914738, 30.518203477190806),
-    "May Fair": (-86.60903334410015, 30.433720960750694),
-    "Weaver Avenue": (-86.70563765480242, 30.412597746135827),
-    "Dunn Court": (-86.44426118828386, 30.508432664825385),
-    "North Drive": (-86.58547994467116, 30.470133843723755),
-    "Pamela Ann Drive": (-86.60505245981936, 30.468156885316),
-    "Desota Circle": (-86.47963795373614, 30.481368293219525),
-    "Siebert Drive": (-86.59687713925888, 30.39941435520203),
-    "Sharon Point Circle": (-86.60812449256204, 30.450002519596122),
-    "Laffitte Crescent": (-86.62440248345227, 30.434084443514816),
-    "Evans Street": (-86.49826852487004, 30.524894025049903),
-    "Drewson Drive": (-86.5792130556413, 30.706674996825466),
-    "Holly Road": (-86.55559667079652, 30.7349532069556),
-    "Asa Marie Court": (-86.7615202, 30.413405200000003),
-    "Windward Cove West": (-86.4400521601838, 30.483173291540723),
-    "Candy Lane": (-86.59081392451522, 30.70354311690996),
-    "Parkwood Court West": (-86.4160535, 30.4887225),
-    "North Lloyd Street": (-86.57596547693254, 30.781268578754034),
-    "South Street Northeast": (-86.60108253672844, 30.434318445675313),
-    "Marleborough Road": (-86.59143498509756, 30.458881521332863),
-    "G I Trail": (-86.5261944849302, 30.79549376127365),
-    "Kelly Plantation Drive": (-86.43504579002534, 30.38811106469603),
-    "Gipson Place Northeast": (-86.60694648249209, 30.41323499949033),
-    "Legion Drive": (-86.49293412875753, 30.39723753253047),
-    "Hathaway Street North": (-86.56368850428159, 30.76225889172494),
-    "Oak Avenue": (-86.4043018279399, 30.739312778919313),
-    "Green Acres Road": (-86.64577859701213, 30.456037404454104),
-    "Silver Creek Cove": (-86.454881, 30.526564),
-    "Byrne Street": (-86.47949441612597, 30.511593552060553),
-    "Skywagon Drive": (-86.51119254188528, 30.766976260327194),
-    "Pocahontas Drive": (-86.61894500720202, 30.432197610728178),
-    "Chipola Cove": (-86.4005761820073, 30.392195290076423),
-    "Nautical Court": (-86.40975066452603, 30.398430347758598),
-    "Sherwood Drive": (-86.5899865086206, 30.458698379269073),
-    " King Street": (-86.55349912619235, 30.750764283212323),
-    "4th Avenue Southwest": (-86.6169990216313, 30.407041000646785),
-    "Avenue de la Dauphine": (-86.78116243700397, 30.414412983296153),
-    "Kingslynn Road": (-86.42092033810454, 30.510001194008183),
-    "Edna Drive": (-86.57939223359394, 30.707642052268092),
-    "Ridge Wood Circle": (-86.50403492865043, 30.398943271127095),
-    "Butler Road North": (-86.53492147640516, 30.822525723799853),
-    "Destiny Way": (-86.41029196483566, 30.381543303030146),
-    "Chippewa Trail": (-86.60877967932468, 30.770774158519686),
-    "Jessie Jones Road": (-86.74673175469832, 30.69047772610875),
-    "Newman Avenue North": (-86.52727497918927, 30.75816738432202),
-    "Maurice Avenue Northwest": (-86.62942787300172, 30.422174624386482),
-    "Sherman Kennedy Road North": (-86.72409116567073, 30.84512946448429),
-    "Hathaway Street South": (-86.56395575902592, 30.758990342749627),
-    "Heartland Drive": (-86.65404497477907, 30.46072115835609),
-    "Ashley Drive": (-86.58290161152797, 30.709518601527396),
-    "Bobolink Loop": (-86.39417401884387, 30.74501129551377),
-    "Eglin Parkway Southeast": (-86.60403665004881, 30.41136065518519),
-    "Bayshore Street Northeast": (-86.60013205708171, 30.420422077129388),
-    "Irene Court": (-86.44697350000001, 30.533237),
-    "Hurlburt Road": (-86.64917635370185, 30.449465268524346),
-    "Iva Place Southwest": (-86.6345756008457, 30.410137349383202),
-    "Palamino Trail": (-86.57374699423383, 30.804004519931656),
-    "Crystal Lane": (-86.47117613318066, 30.499176832824624),
-    "Terra Cotta Way": (-86.40003774794181, 30.381860928227038),
-    "Ashford Court": (-86.66284505610659, 30.418440082971077),
-    "Park Place Southeast": (-86.611468, 30.411441),
-    "Bear Branch Road": (-86.46168896811652, 30.774427714049814),
-    "Hickory Avenue": (-86.47007638241675, 30.532762429239376),
-    "Hardy Adams Road": (-86.7694006081272, 30.72277921195709),
-    "Dana Court": (-86.58271508973375, 30.445165156879828),
-    "Olivia Court": (-86.6643375, 30.432007),
-    "Ernest Hemingway Drive": (-86.43194471967642, 30.49035172182122),
-    "Jefferson Avenue": (-86.5359199380823, 30.760050756697392),
-    "Sherman Kennedy Road South": (-86.69515974730236, 30.89554316897656),
-    "Oglesby Avenue": (-86.58240203509814, 30.75256284880779),
-    "Industrial Street Northwest": (-86.6164885436438, 30.41591262345412),
-    "Stokes Avenue Northwest": (-86.67175846383091, 30.42548348264921),
-    "Craig Terrace": (-86.53740909549587, 30.776285884705274),
-    "Doodle Avenue": (-86.60330928784302, 30.446073428424942),
-    "Dove Way": (-86.3955753658564, 30.746908004262256),
-    "Saint John Cove": (-86.42028703231982, 30.485137279137934),
-    "Forest Glen Place": (-86.73126518455906, 30.413947462563552),
-    "Sherman Kennedy Road West": (-86.69646825140492, 30.898271814003344),
-    "Twin Oak Drive": (-86.56427271472968, 30.798524240861727),
-    "Arabian Court": (-86.56784175017584, 30.806819493033892),
-    "Rockport Court": (-86.6383268, 30.4314983),
-    "Coventry Court": (-86.608707975412, 30.444810058799217),
-    "Regan Drive": (-86.63435308796517, 30.682227859971107),
-    "Medcrest Drive": (-86.56951624346566, 30.73646946757605),
-    "Port Drive": (-86.58323098521328, 30.43493553690249),
-    "Woodland Park Circle": (-86.71670555941604, 30.413405592635915),
-    "Rosewood Way": (-86.41376882013286, 30.477508074024957),
-    "Bay Circle": (-86.468862, 30.4978115),
-    "Hollow Cove": (-86.55815661973539, 30.7228756551276),
-    "Bowen Road": (-86.63272007731834, 30.973011317375693),
-    "Rasberry Road": (-86.59164423048736, 30.723953574370007),
-    "Willow Court": (-86.65332600324456, 30.435852499915597),
-    "Minger Street": (-86.4883228485809, 30.520578249401325),
-    "Kazmira Court": (-86.46029626502737, 30.511732973415967),
-    "Carlton Court Northwest": (-86.62237096252261, 30.416925844281543),
-    "Cinco Terrace Lane": (-86.6303155272288, 30.433301227791993),
-    "Francis Street": (-86.74081636060744, 30.413346396125323),
-    "Birmingham Street": (-86.6855987771973, 30.796621675884133),
-    "Martisa Road Northwest": (-86.6270624117351, 30.41930478177911),
-    "Currie Road": (-86.57118785262251, 30.813103455219167),
-    "Colonial Court": (-86.52014556322332, 30.8121934947906),
-    "Tyner Street": (-86.62172195010344, 30.443510895670446),
-    "Bay Oaks Drive": (-86.77775640965088, 30.41124024544837),
-    "Barbara Lane Northwest": (-86.63800943703679, 30.422674343784095),
-    "Fairoaks Drive": (-86.55916557872975, 30.759303799812297),
-    "Kelly Way": (-86.509306560296, 30.530008380187816),
-    "Citation Drive": (-86.579002, 30.439927499999996),
-    "Sandprint Drive": (-86.47628436437365, 30.386096339968084),
-    "Roberts Boulevard": (-86.62475793734049, 30.47210851398783),
-    "Edwards Lane Northeast": (-86.59137779578937, 30.42249969579979),
-    "Laurie Drive Northeast": (-86.59484891295823, 30.416248139538677),
-    "Kokomo Row": (-86.41411536070075, 30.3828317319495),
-    "Saratoga Drive": (-86.57378462421448, 30.802541899998406),
-    "Virginia Street": (-86.63259801540832, 30.433725696218723),
-    "Jamescross Court": (-86.63235869473151, 30.462641911955494),
-    "Scarlet Drive East": (-86.5620363592961, 30.705836821126404),
-    "Eden Square": (-86.48252149518933, 30.813533903366633),
-    "Morgan Lane": (-86.78472550000001, 30.412781500000005),
-    "Olde Plantation Place": (-86.44790822077678, 30.403838789839273),
-    "State Line Road": (-86.68109932602415, 30.993049767591618),
-    "Cowrie Street Southwest": (-86.62195041132418, 30.40872687161578),
-    "L Ombre Court Northeast": (-86.61197694336302, 30.453604629068245),
-    "Maritime Court": (-86.40735581163723, 30.398052842748925),
-    "Brian Way": (-86.47412549996395, 30.751994518615916),
-    "Sugarman Road": (-86.75259197349597, 30.686282170501247),
-    "Fers Road": (-86.39912461420157, 30.761317408538062),
-    "Southfolk Road": (-86.75378891301224, 30.69444399275402),
-    "Saint Barts Bay": (-86.40095758136758, 30.381212220517693),
-    "Ellis Road": (-86.63045048449476, 30.7488189470366),
-    "Point Comfort Road": (-86.65511818022784, 30.408341446973854),
-    "Meadowlark Road Northwest": (-86.619583, 30.422698),
-    "Arena Road": (-86.59704636620036, 30.736225003206215),
-    "Waterford Ridge Road": (-86.63093682338456, 30.46308232117712),
-    "Troon Drive East": (-86.42746132226259, 30.477616081610428),
-    "Pineview Boulevard": (-86.64618491172651, 30.452165823883927),
-    "Beacons Bend Road": (-86.5810100239722, 30.799336757440233),
-    "Vaughn Street Northwest": (-86.63147699408765, 30.428245963159217),
-    "Andrew Drive": (-86.5054465649326, 30.507473669135585),
-    "Carousel Lane": (-86.46911540046551, 30.755527362760393),
-    "Edney Avenue East": (-86.56276448088224, 30.751237127101636),
-    "Williams Way": (-86.61360513281306, 30.72989214119592),
-    "Preserve Place": (-86.44056738273501, 30.40131191508583),
-    "Purl Jr Run": (-86.5260179283129, 30.73926125070113),
-    "Sandalwood Drive": (-86.49236295175318, 30.395651597672085),
-    "Hathaway Johnson Road": (-86.63599990941445, 30.763244032170203),
-    "McLain Drive": (-86.51021644089865, 30.822671481089134),
-    "Camp Pinchot Road": (-86.5959082804463, 30.473662252691632),
-    "Horseshoe Lane": (-86.68805691945987, 30.696044424829953),
-    "Mastel Lane": (-86.52710769576512, 30.820450766873755),
-    "Denton Boulevard Northwest": (-86.62394362714141, 30.44150664034245),
-    "Judith Avenue": (-86.48003545712373, 30.507637075843988),
-    "Marysa Drive": (-86.4401414306517, 30.520073002206423),
-    "La Salle Court": (-86.53576728896101, 30.723834907187214),
-    "Golf Villa": (-86.4308676673654, 30.48179836574259),
-    "Diamond Cove": (-86.4523096711724, 30.392477446597788),
-    "Harbor Wind Court": (-86.47605330037322, 30.40043951105352),
-    "Berringer Drive": (-86.41698457949038, 30.462155158757675),
-    "Field Avenue East": (-86.56167157705852, 30.755024372791233),
-    "East Field Avenue": (-86.56447471477499, 30.753118240464804),
-    "Mike Circle": (-86.603696, 30.4405765),
-    "Woodland Drive": (-86.549865737677, 30.780826107849787),
-    "Ken's Cove Road": (-86.75635, 30.674987),
-    "Northwood Road": (-86.43596314999999, 30.766146949999996),
-    "Cloverview Drive": (-86.5881045, 30.717205),
-    "Bay Court Northeast": (-86.58929409045327, 30.41320245592336),
-    "Primrose Place": (-86.50195550004541, 30.39932301631641),
-    "Rosewood Avenue": (-86.5662725, 30.801098500000002),
-    "Rosemont Street": (-86.61871166750134, 30.44457305029539),
-    "Biscayne Lane": (-86.471293, 30.5029805),
-    "Sardinia Cove": (-86.42643228378662, 30.48965649926459),
-    "Gil Ava Avenue": (-86.56871655306979, 30.78098621686553),
-    "Grady Lane": (-86.5024242185533, 30.823330964482928),
-    "West Ridgewood Cove": (-86.41433514820498, 30.470102440428175),
-    "Osceola Court": (-86.46874918247558, 30.491701335858423),
-    "Fisherman Lane": (-86.53914990050225, 30.85206638897039),
-    "Cypress Drive": (-86.47995884521167, 30.522018933145784),
-    "Manring Drive": (-86.64147310390372, 30.433498871879067),
-    "Misty Way": (-86.47574373491129, 30.39992728554359),
-    "Shannon Sound": (-86.4025035, 30.398511),
-    "Dogwood Court": (-86.65244150000001, 30.4358635),
-    "Katherine Place Northwest": (-86.62813700000001, 30.4225085),
-    "Charles Street Northwest": (-86.63549294493387, 30.42374827037657),
-    "Troon Drive West": (-86.42852278342131, 30.477353683899093),
-    "Peaden Drive": (-86.510752, 30.8214205),
-    "Crest Place": (-86.47826744843174, 30.404694163227937),
-    "Alford Street": (-86.58223887694841, 30.75258902704162),
-    "Leitemann Road": (-86.68056315491778, 30.743880311569047),
-    "Dominica Circle East": (-86.42307949144319, 30.47042325850972),
-    "Donald Guy Road": (-86.47294128895723, 30.813408778433345),
-    "Edney Avenue West": (-86.5824006906004, 30.751607097547634),
-    "Collinsworth Cutoff Road": (-86.69479676975963, 30.96566933965654),
-    "Grandmas Place": (-86.70903597015233, 30.75985038263252),
-    "War Eagle Drive": (-86.54780256216829, 30.75014824134189),
-    "Creekwood Road": (-86.735609647087, 30.413919888938864),
-    "Walthall Road": (-86.48860580249965, 30.80131885190354),
-    "Jr's Way": (-86.76831417122257, 30.707180412864822),
-    "Jeremy Court": (-86.55275749845751, 30.772029203228556),
-    "Beasley Road": (-86.55229639396742, 30.818227627362223),
-    "Nelson Point Road": (-86.44305349602979, 30.499895267282923),
-    "Sunset Drive": (-86.58204271061547, 30.792887563300983),
-    "Shadow Lane": (-86.62718434120947, 30.46112338128272),
-    "West Campbell Drive": (-86.65911553953455, 30.458954566676795),
-    "White Oak Avenue": (-86.5662895376441, 30.800074096570725),
-    "Robinwood Court": (-86.5889894623789, 30.789609182526256),
-    "Bass Avenue Southwest": (-86.61401359208978, 30.40892948749227),
-    "Dewitt Lane": (-86.41746474591785, 30.845951615831527),
-    "Lang Road": (-86.63465253346482, 30.43618456639285),
-    "Eglin Boulevard": (-86.56486051856405, 30.461110140354776),
-    "Robbins Road": (-86.47183758667055, 30.979328805500852),
-    "Claire Drive": (-86.57877893147321, 30.70569485999851),
-    "Turpentine Steel Road": (-86.51940950545233, 30.89051118404249),
-    "East College Boulevard": (-86.45678905037946, 30.534412216962114),
-    "Sailmaker Lane": (-86.40871156503678, 30.392776632129497),
-    "Bluefish Drive": (-86.60496702497456, 30.397775229294133),
-    "Walton Drive Northeast": (-86.59815755978482, 30.421810585149917),
-    "Field Avenue West": (-86.56597038186044, 30.752107569991058),
-    "Sicily Cove": (-86.42580352117689, 30.489734142883282),
-    "Cahaba Lane": (-86.44960741621188, 30.395152621287046),
-    "Alligator Point": (-86.43731662739346, 30.491679615544072),
-    "Terry Lane": (-86.53257785108286, 30.80923482449461),
-    "Ester Terrace": (-86.53057704163041, 30.79640906140417),
-    "Apopka Cove": (-86.40251653205118, 30.3896419974797),
-    "Range Rd 207": (-86.4082054036385, 30.70653174559561),
-    "Armstead Road": (-86.74742434130802, 30.69456687698388),
-    "Pinecone Court": (-86.74425465067837, 30.41339323512768),
-    "John King Road": (-86.55159506670753, 30.72068278407368),
-    "Joy Drive": (-86.63801255303794, 30.44550298963113),
-    "Burgundy Lane": (-86.64501897212679, 30.43648612560177),
-    "Watson Drive Northwest": (-86.63253022967167, 30.421914955832655),
-    "John Wayne Circle": (-86.64518464055105, 30.44533800216662),
-    "Brookhaven Way": (-86.41920684755391, 30.46992021234715),
-    "Whits Manor Road": (-86.61384094971561, 30.44961802179683),
-    "West Beech Street": (-86.57394049999999, 30.759107999999998),
-    "Shamrock Drive": (-86.67492379999999, 30.4105896),
-    "Nancy Ward Lane": (-86.41603491645186, 30.50109728352378),
-    "Cunnard Avenue": (-86.495195, 30.500238500000002),
-    "Richbourg Lane": (-86.55696306702124, 30.78009730410091),
-    "Linda Court": (-86.44772536500824, 30.510407279296953),
-    "Astor Court": (-86.57530241492746, 30.458442183913572),
-    "Kidd Street Northeast": (-86.61139074918067, 30.425275205451616),
-    "Liberty Road": (-86.74583095426854, 30.719731144102706),
-    "Flora Cove": (-86.55417779933946, 30.743126803591633),
-    "Maples Street Northwest": (-86.61649804762162, 30.417644771514574),
-    "Honeysuckle Lane": (-86.45618747898935, 30.930556619883514),
-    "Sky Lane": (-86.74761830425109, 30.685472787239934),
-    "Dominica Circle South": (-86.42357975781321, 30.46895848398256),
-    "Anchors Drive": (-86.50874052059147, 30.821200699895893),
-    "Parlange Court": (-86.5022845582059, 30.38518845019331),
-    "Linda Cove": (-86.6569755564014, 30.432732142056857),
-    "Del Cerro Camino": (-86.54708510978037, 30.755681542205465),
-    "Woolmac Drive": (-86.45408560008657, 30.77537121492236),
-    "Winding Waters Way": (-86.45658116565411, 30.52843349454169),
-    "Long Drive": (-86.56308774888227, 30.769391256994957),
-    "Beal Parkway Northwest": (-86.61889535211277, 30.422936027719338),
-    "Cone Drive": (-86.54575858362563, 30.773715534348717),
-    "Valley Road": (-86.54905064343419, 30.76640700392856),
-    "Barrow Street": (-86.60867838183687, 30.448080904482524),
-    "Perry Avenue Southeast": (-86.60309442442872, 30.40946042905838),
-    "Coach Lane": (-86.44177396922623, 30.39161444494167),
-    "Combs Manor Court Northwest": (-86.66394249974161, 30.425590009818556),
-    "Randi Road": (-86.45229312287097, 30.754813199859512),
-    "Gilda Place Northwest": (-86.6281515, 30.421686),
-    "Bay Oaks": (-86.5053740956904, 30.404588758169826),
-    "Finck Road": (-86.47696821515224, 30.50415172298901),
-    "Pilgrim Avenue": (-86.61850903491424, 30.432810288137215),
-    "Devmor Court": (-86.62728819360173, 30.397960483192197),
-    "Dominica Circle West": (-86.4240883603725, 30.47026903956841),
-    "Willwall Street Northeast": (-86.61211267149204, 30.4694422083977),
-    "Parkside Cove West": (-86.41763550310054, 30.497937494912414),
-    "Dale Place": (-86.6496985, 30.439586499999997),
-    "Riley Road": (-86.47308332594704, 30.50583711126262),
-    "Nordberg Avenue": (-86.50233162901237, 30.50820430975284),
-    "Tasha Street": (-86.76245687540413, 30.41349081886147),
-    "Scrub Oak Lane": (-86.46820070807522, 30.768547557293648),
-    "Lake Court": (-86.47362300062781, 30.51379498196624),
-    "Lake Shore Drive": (-86.5582585902444, 30.436927070891684),
-    "J B Lane": (-86.68074770801842, 30.691826980019453),
-    "Dove Lane": (-86.63100894403964, 30.773715247397014),
-    "Manning Creek Cove": (-86.45615039957106, 30.525278564671723),
-    "Kelly Mill Lane": (-86.77508936242221, 30.717370616794977),
-    "Grassy Cove": (-86.43950719766758, 30.40185966400204),
-    "Nautica Way": (-86.4877857776164, 30.396265485662994),
-    "Massachusetts Avenue": (-86.6483675, 30.436887),
-    "Venus Court": (-86.62868465614639, 30.398081532875658),
-    "Melissa Court": (-86.6512178359422, 30.434334092289667),
-    "Wynnehaven Beach Road": (-86.7866350612095, 30.40867847962122),
-    "Friendship Lane": (-86.55786423046673, 30.796761208405538),
-    "Junior Drive": (-86.56404864440265, 30.44342654653056),
-    "East Choctawhatchee Drive": (-86.40048575300716, 30.455037203636945),
-    "Houston Lane": (-86.55083337584219, 30.801005180279923),
-    "John Road": (-86.7591202800617, 30.71367920450804),
-    "East Road": (-86.67755022142467, 30.423805396788342),
-    "Spruce Court": (-86.65320835711191, 30.458274819880632),
-    "Hope Drive": (-86.5834425486657, 30.708776112521395),
-    "Windward Lane Cove": (-86.43878271116996, 30.479362406159684),
-    "Melissa Cove": (-86.54026179833072, 30.720188755212217),
-    "Working Horse Lane": (-86.68803140144696, 30.75957549402907),
-    "Branum Circle": (-86.69610743813041, 30.988763870464158),
-    "Jonquil Avenue Northwest": (-86.64702952280588, 30.418798991868144),
-    "Kohler Drive": (-86.67755507285847, 30.41254115657504),
-    "Live Oak Street": (-86.40610397671429, 30.47862977292008),
-    "Adkinson Drive": (-86.58087700498791, 30.772357203442255),
-    "Stahlman Avenue": (-86.49656034362457, 30.40532747382712),
-    "Bear Head Road": (-86.46725263474373, 30.768119733938224),
-    "T E Rogers Road": (-86.48078761121343, 30.985177588126994),
-    "Skinner Circle": (-86.6083803319718, 30.43554296581642),
-    "Harvest Hills Lane": (-86.5160925, 30.811813),
-    "Cabela Lane": (-86.53108, 30.825666),
-    "Terrace Lane": (-86.55231436909031, 30.81539444343437),
-    "Lucy Lane": (-86.54558349635134, 30.74952537306138),
-    "Old Pass Court": (-86.50382627949033, 30.388064136781725),
-    "Cox Lane": (-86.52926538078843, 30.762103263702457),
-    "Van Buren Street": (-86.63106260528816, 30.431653029725208),
-    "Trawick Creek Road": (-86.72294645654117, 30.69745882052253),
-    "Lancaster Circle": (-86.53995303905498, 30.796974759158772),
-    "Walton Avenue": (-86.49954207944637, 30.52715256516189),
-    "Martin Drive": (-86.4338934703227, 30.50990998565622),
-    "Juniper Drive": (-86.58777234749644, 30.713570478566826),
-    "Washington Street": (-86.56957539576331, 30.750133617722415),
-    "Arrow Point Cove": (-86.48581807980632, 30.485322801438656),
-    "Summertime Drive": (-86.7410308170505, 30.711975656034635),
-    "Chickasaw Circle": (-86.64675286481909, 30.433060144826776),
-    "Honeysuckle Way": (-86.46940486006828, 30.52320712959916),
-    "Hilton Lane South": (-86.67337944243269, 30.758767166611623),
-    "Towery Court": (-86.607388, 30.447516999999998),
-    "Crossland Street": (-86.55762127467077, 30.748885421537295),
-    "Sundance Way South": (-86.74076335282562, 30.68921862044104),
-    "Wilderness Path": (-86.65502323107125, 30.464055750370225),
-    "Harris Boulevard": (-86.60325217699786, 30.44787631214565),
-    "Loosa Drive": (-86.39919286011775, 30.71212662768977),
-    "Greystone Lane": (-86.641536, 30.4475755),
-    "Holly Lane": (-86.44355918853753, 30.7601345766322),
-    "Reeves Street": (-86.46293762197766, 30.510623570168864),
-    "Lake Circle": (-86.75154726092646, 30.412147158945206),
-    "East Plympton Road": (-86.48800481045905, 30.90996039889915),
-    "Pine Ridge Lane": (-86.46235, 30.817161),
-    "Kolima Court": (-86.55303847591351, 30.70568278577614),
-    "Four Lake Drive": (-86.49208780876437, 30.756927688187645),
-    "Surrey Street": (-86.60725599968197, 30.439395518772578),
-    "Bear Spring Lane": (-86.46077925629818, 30.77248802939282),
-    "Twisted Oak Trail": (-86.56422620498415, 30.43742187791118),
-    "Leisure Avenue": (-86.73675408134147, 30.682050639945587),
-    "Calypso Cay": (-86.4028635, 30.380591500000005),
-    "Caswell Circle": (-86.65367816537936, 30.41192860039341),
-    "Sam Carver Road": (-86.61574066329202, 30.776888390983828),
-    "Thomas Court Northwest": (-86.63769031502878, 30.42556392178015),
-    "Manor Court Northwest": (-86.6212975, 30.4538965),
-    "Patton Street": (-86.56375062017477, 30.771222857193298),
-    "Cypressus Lane Northwest": (-86.63896384445626, 30.417984095702025),
-    "Woodham Avenue": (-86.6049544015522, 30.434804639829373),
-    "Dory Avenue": (-86.61298091504369, 30.39810881663584),
-    "Wisteria Avenue": (-86.5509328981226, 30.77786071040476),
-    "Hill Avenue Northwest": (-86.66742729561837, 30.421114661162363),
-    "June Court": (-86.5547415, 30.766575999999997),
-    "Carolyn Street": (-86.50417824020393, 30.52082067722916),
-    "Kell Aire Drive": (-86.47859697066292, 30.39983029686075),
-    "Madelons Path": (-86.65272332105167, 30.462405694387428),
-    "Whitehurst Lane": (-86.61634085926423, 30.71333934063136),
-    "Gilly Lane": (-86.5224216671504, 30.87030776082377),
-    "1st Street Southeast": (-86.61153168919473, 30.405326648947174),
-    "Parkview Road Northwest": (-86.62454088953072, 30.45663610180472),
-    "Starboard Drive": (-86.58503990142934, 30.43443547210458),
-    "West Mariah Way": (-86.63658467076232, 30.460801028659063),
-    " B Street": (-86.59511147405367, 30.761287638374426),
-    "Primrose Lane": (-86.5019623060627, 30.400690069232528),
-    "Osage Court": (-86.448021, 30.3935205),
-    "Mistral Lane": (-86.6345797959081, 30.463464358780417),
-    "North Beal Extended": (-86.63828258190385, 30.46375852502346),
-    "Gulf Terrace Drive": (-86.46799076459865, 30.38885509353469),
-    "Hacienda Lane": (-86.56634964197818, 30.810154413413862),
-    "Moss Oak Lane": (-86.46452463679954, 30.492219196148227),
-    "West Glen Avenue": (-86.49559813081285, 30.505267554171272),
-    "Clifford Drive": (-86.58522444565983, 30.439152402248773),
-    "Hurricane Lake South Entrance Road": (-86.7494948844694, 30.93582943580262),
-    "R30": (-86.7577396896561, 30.93392028146378),
-    "Deermont Drive": (-86.50654055468495, 30.797815823236757),
-    "Fairwind Court": (-86.41718043541469, 30.401831740927317),
-    "Buchanan Court Southwest": (-86.61750310804108, 30.409804002458703),
-    "Curacro Way": (-86.41963123772953, 30.47422031911893),
-    "Wakulla Road": (-86.53562154539127, 30.46228835736573),
-    "Underwood Lane": (-86.48013992546836, 30.531207885718732),
-    "Rockhill Road": (-86.60403195250255, 30.97576276021506),
-    "Hemphill Road": (-86.53782090888512, 30.822733575026405),
-    "Aloma Court": (-86.4408885, 30.507993),
-    "Olde Cypress Circle Northwest": (-86.63848492071902, 30.417981132687782),
-    "Capri Court": (-86.55315534993102, 30.706499318423603),
-    "Heritage Court": (-86.6498, 30.460395),
-    "12th Street": (-86.56327580316106, 30.44163372142019),
-    "Eley Road": (-86.54598490703484, 30.464620452762055),
-    "Stephens Lane": (-86.51524515038888, 30.812669792188885),
-    "Lois Street": (-86.60802029137069, 30.44803724223455),
-    "Savannah Lane": (-86.56393001251949, 30.70360137180742),
-    "Anzui Lane": (-86.62677938161178, 30.45114410493825),
-    "Shell Avenue Southeast": (-86.61223314901818, 30.4089225979339),
-    "Griffith Cemetery Road": (-86.6420865077033, 30.789569497072257),
-    "Campbell Drive": (-86.47527795049615, 30.526117073135147),
-    "Grimm Lane": (-86.70563135, 30.4126395),
-    "Poquito Road": (-86.5826887161737, 30.455510680675218),
-    "Connor Drive": (-86.54679576431187, 30.718021136771107),
-    "Ridgelake Drive": (-86.66318116881781, 30.415817890774868),
-    "Colonial Circle": (-86.53693080063772, 30.769949995536248),
-    "Sunburst Drive West": (-86.41976192234529, 30.81962587292683),
-    "M A Couch Way": (-86.5582315, 30.774456),
-    "37th Street": (-86.46976123745293, 30.522214176606713),
-    "Magnolia Lane": (-86.48513650000001, 30.491539000000007),
-    "Koon Street": (-86.6365383971809, 30.445507018129053),
-    "Marcia Circle": (-86.64650350042147, 30.411491479329236),
-    "Pauls Way": (-86.60502447257228, 30.701533296789865),
-    "Aza Place": (-86.5537915, 30.765068499999998),
-    "Opp Boulevard Northeast": (-86.6065239611338, 30.42140105992146),
-    "Winthrop Street": (-86.6059023012034, 30.439837507366256),
-    "Duval Street": (-86.60639776317345, 30.444468154105127),
-    "West James Lee Boulevard": (-86.57363761669481, 30.76180965355094),
-    "Robby Lane": (-86.50848927677723, 30.815017088786064),
-    "Patti Cove": (-86.46312412696675, 30.50250603466731),
-    "Monarch Circle": (-86.47643935279466, 30.503098556554413),
-    "Range Road": (-86.39881919714318, 30.49133099840214),
-    "Jackson Street Northeast": (-86.6117964772106, 30.417413835470157),
-    "Waynel Circle Southeast": (-86.5950704015384, 30.409167222533068),
-    "Otahite Trail": (-86.731454806323, 30.883606492803295),
-    "Ellis Avenue": (-86.47899217487058, 30.517751125303988),
-    "East Fern Dell Avenue": (-86.48967830336304, 30.49469530678614),
-    "Born Road": (-86.63689549423255, 30.684063927889714),
-    "Miracle Strip Parkway Southeast": (-86.61243440777936, 30.40405466395225),
-    "Country Club Avenue Northeast": (-86.61258217253656, 30.460544989396627),
-    "Port Dixie Boulevard": (-86.573971, 30.443046000000002),
-    "Misty Water Lane": (-86.65048507215225, 30.408019994163382),
-    "Brook Court": (-86.41852034280183, 30.467440255859945),
-    "Abalone Court": (-86.60964972140798, 30.396510552220924),
-    "Tiffany Court Southeast": (-86.5977005, 30.407494499999995),
-    "Bluebird Lane": (-86.50226126265305, 30.813984490571773),
-    "Specialty Farms Road": (-86.54532577603865, 30.84892246446716),
-    "1st Street Southwest": (-86.61566725744137, 30.40541854155835),
-    "Mary Esther Boulevard": (-86.65521866129691, 30.41159851295452),
-    "Sudduth Court Northeast": (-86.59489418743455, 30.419569088596578),
-    "Lombard Circle": (-86.64813699114758, 30.439348720917174),
-    "Cunningham Court": (-86.47155595120242, 30.515320296821656),
-    "Lido Road": (-86.48713543725562, 30.479005916265876),
-    "Pine Court": (-86.47357399997803, 30.51479848537739),
-    "Harrelson Drive": (-86.59858745607217, 30.44306433773314),
-    "Crewilla Drive Northwest": (-86.61529661547974, 30.426243966567498),
-    "Swan Avenue": (-86.50398138293758, 30.81667382181201),
-    "Suzanne Circle": (-86.68401791869051, 30.71728509028336),
-    "Hillview Circle": (-86.57346271963203, 30.701372770678635),
-    "Ashley Maria Court": (-86.56121481600628, 30.71337533430564),
-    "Choctaw Court": (-86.541998360105, 30.72314604396387),
-    "Plantation Point": (-86.44854722494875, 30.404354057068517),
-    "Dock's Place": (-86.63463501740831, 30.458087925124012),
-    "Garrett Mill Road": (-86.65082483179708, 30.762911170031213),
-    "Ferry Road Southeast": (-86.6013429811485, 30.409947977497968),
-    "South Whitewood Way": (-86.4158309535963, 30.47504830338046),
-    "Lee Trevino Court": (-86.56170434897489, 30.434020984664528),
-    "Lakeside Court": (-86.59288072242512, 30.418758234118155),
-    "Shumpert Street Northwest": (-86.62961901471142, 30.417434330467334),
-    "Richard Road": (-86.66382929084058, 30.761659648449868),
-    "Jefferyscot Court": (-86.58193102363794, 30.720703392946188),
-    "Horsecreek Road": (-86.61914420828361, 30.964190436592098),
-    "Samana Way": (-86.41496168416727, 30.479181896575415),
-    "Glen Lake Circle": (-86.4271767283209, 30.482383349130686),
-    "Bent Arrow Circle": (-86.48626347593931, 30.39536390945578),
-    "Hazel Drive": (-86.63445505, 30.44284665),
-    "13th Street": (-86.46077364859389, 30.497806830557366),
-    "Choctaw Cove": (-86.48740919746402, 30.4862631516115),
-    "Ping Lane": (-86.5597515, 30.708297999999996),
-    "Pentecost Lane": (-86.623194, 30.4402955),
-    "Jamestown Avenue": (-86.61945126544212, 30.43357187656389),
-    "Jerry Lane": (-86.62347142490363, 30.733626230070023),
-    "Villacrest Drive": (-86.58351262861221, 30.716465761224544),
-    "Vernon Jeffers Road": (-86.71185959568643, 30.974107811879012),
-    "Azalea Circle": (-86.4871686783918, 30.491144414265865),
-    "Dodo Way": (-86.39411143909166, 30.738870578240867),
-    "Jupiter Street": (-86.48313928754067, 30.41080815501944),
-    "James Avenue": (-86.50535197005358, 30.508675636384954),
-    "Noble Circle": (-86.5575383863281, 30.740907587654412),
-    "Ardmore Court": (-86.42511367190107, 30.461136043525805),
-    "Sharon Drive": (-86.44166849603852, 30.5228772002379),
-    "Bradley Road": (-86.5264748226762, 30.852211478450478),
-    "Jeni Mae Court": (-86.6440978, 30.45939295),
-    "Ocean View Drive": (-86.42581349968667, 30.383520006231613),
-    "Choctaw Circle": (-86.59639899855134, 30.783834460779396),
-    "Julia Avenue": (-86.47499301038667, 30.514643646993253),
-    "Elzie Road": (-86.69104929033931, 30.777484263417207),
-    "Indian Mound Road": (-86.46044998350851, 30.811701700825537),
-    "Safe Harbor Cove": (-86.48491301410492, 30.48417868277412),
-    "Woodlawn Drive": (-86.56445960467543, 30.77659922803772),
-    "Louisiana Avenue": (-86.49565850755585, 30.49072857154195),
-    "Edrehi Avenue": (-86.45600254686804, 30.510951603242606),
-    "Regatta Circle": (-86.49203813521453, 30.52046678352644),
-    "Atwell Road": (-86.53898308232537, 30.74769657886335),
-    "Gulf Winds Court": (-86.50402951617055, 30.38750791327654),
-    "Stewart Circle": (-86.60321953402423, 30.44036951257202),
-    "Paradise Isles": (-86.41157037616514, 30.383814484345315),
-    "Marcel Street": (-86.64738250018982, 30.457847477489963),
-    "Eglin Air Force Base": (-86.79687256957267, 30.54267489461262),
-    "Bennetts End": (-86.65216975376458, 30.463835542934447),
-    "Southminister Circle": (-86.42560265608155, 30.462701475959168),
-    "Pleasant Street Northwest": (-86.62864253153516, 30.42584214164981),
-    "Zion Boulevard": (-86.64674325093823, 30.454179071329914),
-    "Concord Court": (-86.62051241676393, 30.438540664315333),
-    "Softwood Drive": (-86.6534301969168, 30.429054073657753),
-    "Carlos Drive": (-86.62608540281404, 30.451370987220916),
-    "Bayberry Drive": (-86.44473254479229, 30.51324133560389),
-    "Tarpon Street": (-86.41693589823728, 30.383363830579558),
-    "Troy Circle Northeast": (-86.60313421020265, 30.45343947078385),
-    "Chappie James Street": (-86.58483043478206, 30.752485309287433),
-    "Oak Place": (-86.561722, 30.724175000000002),
-    "Fox Lane": (-86.74131436616466, 30.685069779671473),
-    "Lauderhill Lane": (-86.64529735233141, 30.448771549986933),
-    "Dolphin Estates Court": (-86.49921752050874, 30.39729350000567),
-    "Lightwood Court": (-86.44027249999999, 30.496277999999997),
-    "Park Circle Southeast": (-86.61093731377741, 30.41097483470713),
-    "Muirfield Drive": (-86.42532017235544, 30.47476153312583),
-    "Sleepy Hollow Road": (-86.65292452693272, 30.408425114819533),
-    "Greenway Cove": (-86.4520299583423, 30.52482496519289),
-    "Parrish Cove": (-86.76070767069321, 30.40831498910445),
-    "Reinke Drive": (-86.54548092353274, 30.789687043319454),
-    "Ossippee Way": (-86.533768, 30.4625545),
-    "Ludlum Road": (-86.43474048540571, 30.948195093342324),
-    "14th Street": (-86.6812572894547, 30.793608530790276),
-    "Knots Place": (-86.48034241796326, 30.405346027551957),
-    "Gabrielle Drive": (-86.58510759482036, 30.72316385923704),
-    "Jenee Court": (-86.54213243626646, 30.769542999546534),
-    "South Bristol Court": (-86.41937200000001, 30.461498500000005),
-    "Walnut Avenue West": (-86.57186759871179, 30.753790699626123),
-    "Burton Avenue Northeast": (-86.60501846591498, 30.460783624094937),
-    "Bedford Place Northeast": (-86.60325836320551, 30.45968165245417),
-    "Windjammer Court": (-86.40863969381269, 30.397739689651953),
-    "Ocean Boulevard": (-86.40395364219667, 30.380268377809927),
-    "Big Buck Trail": (-86.45900984065214, 30.762783780818925),
-    "Niceville Avenue": (-86.49514811501054, 30.52793037352784),
-    "Fulmer Way": (-86.3948635789352, 30.737126726648007),
-    "Destin Drive Northwest": (-86.63385131359613, 30.421865549927592),
-    "Illinois Avenue": (-86.49903683293024, 30.513875087756023),
-    "Island Lane": (-86.47076973565551, 30.4997568807622),
-    "Yancey Street": (-86.63540876271263, 30.44358854785791),
-    "Lynn Bridge East": (-86.552614, 30.703927),
-    "Pennington Road": (-86.47109075070705, 30.782961870716647),
-    "Tipperary Way": (-86.44473661434229, 30.517111281215296),
-    "Bluewater Boulevard": (-86.43089355597934, 30.4824122078711),
-    "Macgregor Lane": (-86.55979458338678, 30.709018187936707),
-    "Bay Ridge Drive": (-86.53084351567693, 30.812809639803255),
-    "Sherman Kennedy Road": (-86.70960994215483, 30.83747475792586),
-    "Dogwood Acres": (-86.55652915316695, 30.80011630863579),
-    "Kimberly Lane": (-86.45142524378413, 30.818786932486347),
-    "Boatner Road": (-86.54954074450973, 30.457549243005257),
-    "Creek Circle": (-86.64909909356768, 30.434357632443408),
-    "Grimes Avenue": (-86.58618432134769, 30.753370459868762),
-    "Tiger Pointe Drive": (-86.45527865191441, 30.50588711263375),
-    "Royal Palm Court": (-86.6456747964272, 30.409110249882982),
-    "Saw Mill Road": (-86.63500338258322, 30.747494906866237),
-    "Ratliff Street": (-86.56886972455305, 30.748900798545773),
-    "Janet Lane": (-86.66278100196968, 30.432381885534667),
-    "Hanover Port Lane": (-86.64535852384398, 30.439871000399226),
-    "Henry Road": (-86.4041860161253, 30.764951966058877),
-    "Old Milligan Road": (-86.59082822193818, 30.765588660710076),
-    "Wildcat Court": (-86.48777147712326, 30.39468899843728),
-    "Al Hammett Road": (-86.73414992202129, 30.41379086446755),
-    "Saddle Horse Lane": (-86.570614, 30.807520000000004),
-    "Wittmer Ranch Road": (-86.50625848780257, 30.91136997508463),
-    "Greyfox Circle": (-86.61824748454279, 30.723549999725684),
-    "Elizabeth Court": (-86.62956249975372, 30.439846024565465),
-    "Marcia Drive": (-86.64665218666411, 30.411240675022913),
-    "Dana Pointe": (-86.46477307435107, 30.489109591064533),
-    "Marie Circle Northwest": (-86.63688136632233, 30.41784493546996),
-    "Meggs Drive Northeast": (-86.59540379859182, 30.421468161678305),
-    "Huntington Road": (-86.42241260522204, 30.51024180629734),
-    "Chavis Avenue": (-86.57713018262248, 30.768078558948876),
-    "Rush Road": (-86.71958923828001, 30.411942049592284),
-    "Wren Way": (-86.44379678887819, 30.492015806538365),
-    "Pelham Street": (-86.60723649979502, 30.44031901286245),
-    "Drakes Landing": (-86.71689699999999, 30.4137395),
-    "Rocky Shores Drive": (-86.43874512115964, 30.511742391128248),
-    "Canyon Trail": (-86.68621960208975, 30.750045735969188),
-    "Laurel Oaks Court": (-86.64227150154309, 30.449174435443613),
-    "Camp Nebo Road": (-86.76448391695966, 30.778114723594026),
-    "Sierra Drive": (-86.55672530904488, 30.44546596432202),
-    "Pearl Sand Drive": (-86.75031036887239, 30.40751432899409),
-    "Palermo Street": (-86.6277405, 30.4527465),
-    "Magnolia Plantation Boulevard": (-86.4307241642865, 30.49227045215724),
-    "Hughes Road": (-86.70838844882105, 30.966893367839095),
-    "Briarwood Circle Northwest": (-86.62715673578029, 30.42942183381185),
-    "15th Street": (-86.45685650657714, 30.49966247911559),
-    "Harmony Lane": (-86.65376608230366, 30.758943691992876),
-    "Travers Court": (-86.42984880623841, 30.481086885685343),
-    "Sea Hills Drive": (-86.49636060776778, 30.394542444795015),
-    "Mimosa Street": (-86.55005159619834, 30.774743334618837),
-    "Canary Way": (-86.40643555553999, 30.746516013734546),
-    "Happiness Road": (-86.73634999591819, 30.413325274953774),
-    "Division Street": (-86.61276595679774, 30.445416225957974),
-    "Elba Cove": (-86.4272575, 30.489926999999998),
-    "John Givens Road": (-86.52574332896917, 30.770574475770236),
-    "Greenleaf Place": (-86.61857585682458, 30.753748718520026),
-    "Pinecrest Road": (-86.51794754645832, 30.796121382846348),
-    "Blackberry Road": (-86.54324640752567, 30.80966109303072),
-    "Walther Street": (-86.67846419020994, 30.795534666435593),
-    "Harbor Boulevard": (-86.46199339109457, 30.385176769848176),
-    "Plew Avenue": (-86.58205395845741, 30.44334443242178),
-    "Liberty Lane": (-86.53659552451138, 30.771654935341385),
-    "Revell Street": (-86.4588380600395, 30.515117107163036),
-    "John Melvin Road": (-86.7553302133336, 30.748538214906716),
-    "Espanola Road": (-86.48269980690053, 30.479600686253846),
-    "Victorious Life Place": (-86.55283785, 30.80672435),
-    "Gray Place": (-86.56645574133636, 30.77271468626806),
-    "Balsam Drive": (-86.47971063745513, 30.533433468429394),
-    "Scott Street": (-86.66108080901576, 30.434238509776616),
-    "Hudson Street": (-86.5865124311174, 30.763770174125444),
-    "Pinewood Terrace": (-86.64962619756291, 30.430203965985356),
-    "Hidden Lakes Drive": (-86.43090739463238, 30.489084230774292),
-    "Flatwoods Drive": (-86.59012551618315, 30.7774203503088),
-    "Lynn Bridge West": (-86.5544853172515, 30.704201245992856),
-    "Weeks Road": (-86.62865700112079, 30.450191256243556),
-    "Retta Lane": (-86.58534595848481, 30.729907438887974),
-    "Prestwick Drive": (-86.4266179632198, 30.485198235907436),
-    "Cotton Tree Court": (-86.6415515507365, 30.4483540002754),
-    "Clover Street": (-86.51580297077115, 30.81812180690966),
-    "Mohawk Trail": (-86.6087871078809, 30.771604121194645),
-    "Bill Lundy Road": (-86.5558409419595, 30.861182283371836),
-    "Moores Mill Creek Road": (-86.56425368030831, 30.98633799254878),
-    "Clipper Cove": (-86.42423735732557, 30.384840278056036),
-    "Maple Road": (-86.5237382253663, 30.840578347718385),
-    "Corinthian Place": (-86.42312250522531, 30.395332690951204),
-    "Burning Tree Drive": (-86.4587737752258, 30.404432844550122),
-    "18th Street": (-86.4656515, 30.503791999999997),
-    "Big O's Green Acres Drive": (-86.53167683462266, 30.838159587440312),
-    "Mare Creek Drive": (-86.42535851986247, 30.7516229998976),
-    "Green Palm Circle": (-86.47277945, 30.498121500000003),
-    "Quail Ridge Street": (-86.53819274134145, 30.790503979424674),
-    "Pointer Lane": (-86.56220996545697, 30.801440072024334),
-    "Hannah Branch Road": (-86.41146588583985, 30.764998864008952),
-    "Tecumseh Lane": (-86.74197134763278, 30.40747656862978),
-    "Celeste Street": (-86.75472054110263, 30.412715685780576),
-    "Austin Court": (-86.78382719079838, 30.415520664213997),
-    "Windstarr Drive": (-86.41133454261933, 30.38610520464079),
-    "Catamaran Lane": (-86.57550362135332, 30.447113493304887),
-    "Rainbow Lane": (-86.54257421716333, 30.774903473678673),
-    "Snellgrove Road": (-86.41525388015079, 30.966824597254615),
-    "Marten Lane": (-86.75642836653225, 30.685007793453284),
-    "2nd Street Southeast": (-86.60823801358138, 30.406859165896513),
-    "Scenic Hwy 98": (-86.45938369910212, 30.38453200893911),
-    "Hunting Meadows Drive": (-86.57342286666783, 30.801268060783283),
-    "Mc Clean Street": (-86.6964932818757, 30.416315285685922),
-    "16th Street": (-86.68022082970693, 30.79569972227306),
-    "Timber Court": (-86.4803344635476, 30.405829620247815),
-    "Holloway Road": (-86.64972278412017, 30.843817985085604),
-    "Daniel Johnson Road": (-86.7817250881772, 30.871828914793472),
-    "Lee Avenue": (-86.55702246669611, 30.7505434463499),
-    "Hunt Drive": (-86.54462486289894, 30.466041419395715),
-    "R J Stabler Road": (-86.5913285396365, 30.947134527966284),
-    "Fairview Avenue": (-86.5192765, 30.795551999999997),
-    "Bill's Road": (-86.601444676321, 30.92192743072906),
-    "Kirkley Court": (-86.60635350000001, 30.446979),
-    "Cobb Road": (-86.65333200217141, 30.824924216651496),
-    "Calvin Green Road": (-86.68059571741514, 30.687826733799618),
-    "Pinecone Trail": (-86.45616189733902, 30.767324054609695),
-    "Alan A Dale Drive": (-86.47066468609867, 30.52119547074035),
-    "Sweetwater Run": (-86.4585014660357, 30.52502035585074),
-    "Pinoak Circle": (-86.46446881591777, 30.491152465115672),
-    "Ingrid Court": (-86.44346550949834, 30.49637124455322),
-    "Dowdell Street Southwest": (-86.61795654339699, 30.40933551840981),
-    "Natures Trail Court Northwest": (-86.62881380170386, 30.42843953641952),
-    "McNair Drive": (-86.55639803453722, 30.772592217762714),
-    "Huckleberry Lane": (-86.49688846905264, 30.814388690084208),
-    "Pecan Lane": (-86.74705001210386, 30.707509418786728),
-    "Sudduth Circle Northeast": (-86.59187591118369, 30.422254281122335),
-    "Brentom Court": (-86.6269317, 30.4650093),
-    "Mullet Creek Run": (-86.45520192255506, 30.53046784410456),
-    "Laurel Oak Terrace": (-86.57620009621073, 30.75969756995588),
-    "Vinson Ray Road": (-86.65743706300465, 30.85356377699566),
-    "Cedar Avenue": (-86.47817818840885, 30.51748851517444),
-    "Sandmore Shores Drive": (-86.776825, 30.411782),
-    "Beverly Drive": (-86.47618543691061, 30.508770862123626),
-    "New Ebenezer Road": (-86.49053701902757, 30.977515491520954),
-    "Bay Drive": (-86.4452365, 30.493217),
-    "Fliva Avenue Northwest": (-86.62479326383645, 30.425638502724947),
-    "Laramie Boulevard": (-86.58339590411589, 30.70462647889746),
-    "30th Street": (-86.46688154375316, 30.515216387148005),
-    "Eglin Street": (-86.60264671356255, 30.43794012326387),
-    "Quail Drive": (-86.75911310410993, 30.681774623054817),
-    "19th Street": (-86.45955356140038, 30.50503588763792),
-    "Baywind Drive": (-86.43333604615516, 30.473070440339733),
-    "Detroit Avenue": (-86.50951843028389, 30.515907549497815),
-    "Pinto Lane": (-86.57376761265157, 30.80297281263632),
-    "Appaloosa Way": (-86.5714725044223, 30.806902995151045),
-    "Clinton Court": (-86.47755045191829, 30.508688853002106),
-    "Loblolly Drive": (-86.5736711714601, 30.458537538041274),
-    "Oleander Parkway": (-86.65131742002882, 30.409379037631144),
-    "Norma Court": (-86.756208, 30.407559499999998),
-    "Guan Way": (-86.39812277153042, 30.737030897722605),
-    "New York Street": (-86.68698476161585, 30.797090239229675),
-    "Courington Court": (-86.47575973364447, 30.511498991215447),
-    "Josie Road": (-86.72098092169064, 30.41313444301967),
-    "Buckeye Court": (-86.46224950000001, 30.496008999999997),
-    "Knoll Road": (-86.50006351990466, 30.750876191249386),
-    "Tine Court": (-86.64169829820784, 30.44919348848776),
-    "Longleaf Court": (-86.47757048926965, 30.53165588078178),
-    "Samos Cove": (-86.427145, 30.490593),
-    "Jet Court Northwest": (-86.62656298758257, 30.4177031382467),
-    "West Old Mill Way": (-86.55791710266229, 30.72340729106019),
-    "Grand Oaks Way": (-86.50349498997261, 30.403062509734642),
-    "Hammock Lane": (-86.56129706250248, 30.782222188794037),
-    "Carter Lane": (-86.50223661339706, 30.404841373781615),
-    "17th Street": (-86.45571311473425, 30.50160075394435),
-    "2nd Street Southwest": (-86.61359148237261, 30.4070964665953),
-    "Garden Lane": (-86.47647999921882, 30.533729534651386),
-    "Oak Lane": (-86.56497212965435, 30.783142275338847),
-    "Mande Court": (-86.58349062584509, 30.441293372762),
-    "Pasco Broxson Circle": (-86.72491948282205, 30.745200258484033),
-    "3rd Street Southeast": (-86.60529774065333, 30.408632924598376),
-    "Carson Drive Northeast": (-86.6088906515514, 30.416168504540458),
-    "Mc Farr Street": (-86.47753478362404, 30.503475461137608),
-    "Wright Circle": (-86.41191286041023, 30.477274503848367),
-    "Coleman Point": (-86.4414682444429, 30.407494100035695),
-    "Rosewood Drive": (-86.79786732927057, 30.417979119413342),
-    "Country Club Drive East": (-86.45174026171696, 30.396000820869425),
-    "Okeechoee Court": (-86.46135100000001, 30.4010165),
-    "Shady Oaks Lane": (-86.57229719839559, 30.435745690291174),
-    "Kelly Street": (-86.49437573458466, 30.402584035625384),
-    "Lariat Court": (-86.6475102, 30.463552499999995),
-    "Bay Drive Northeast": (-86.5890658896639, 30.41524420616422),
-    "Villa Avenue": (-86.4609371, 30.96098355),
-    "Oakview Place": (-86.56471913836751, 30.767536948526086),
-    "Sunshine Lane": (-86.47830200006375, 30.529763496429716),
-    "Bent Arrow Drive": (-86.48875315177465, 30.39489763511377),
-    "Montana Avenue": (-86.49315386847695, 30.498791739981357),
-    "Grant's Pass": (-86.612664, 30.775922000000005),
-    "Commodore Point": (-86.41324183994087, 30.399174707523343),
-    "Aloma Faye Lane": (-86.66005654702977, 30.43397358257652),
-    "Yow Road": (-86.77868078277335, 30.76046780117265),
-    "Londonderry Cove": (-86.646453, 30.439914999999996),
-    "Crowder Court": (-86.63605678277055, 30.433914142873096),
-    "Golf Villa Court": (-86.41118326141174, 30.395557355312565),
-    "Weekewatchee Circle": (-86.46001667940172, 30.400088410508847),
-    "Howell Road": (-86.50296730212459, 30.51973271947377),
-    "Upper Karrick Lake Road": (-86.64122803326235, 30.896932104077468),
-    "Riverside Drive": (-86.64492513456791, 30.435134032749264),
-    "O Hara Court": (-86.56156948729257, 30.70703842581668),
-    "Holly Drive": (-86.5556336420622, 30.81001918984814),
-    "Fox Den Court": (-86.45962349999999, 30.404235999999997),
-    "Maracel Loop": (-86.61546688942754, 30.72073573503255),
-    "Cedar Springs Farm Road": (-86.78798092835534, 30.70441531407044),
-    "Log Lake Road": (-86.75059734340512, 30.70594531751547),
-    "Indian Bayou Drive": (-86.45120526363802, 30.39842960807527),
-    "Aunt Polly Place": (-86.58815335, 30.707340899999995),
-    "Buckhorn Drive": (-86.51054938406689, 30.804820758111415),
-    "East F Sanford Road": (-86.6691346349012, 30.883651905938862),
-    "Ashnick Lane": (-86.48533200634445, 30.94812887599815),
-    "Florida Avenue": (-86.48966422055258, 30.4966982576982),
-    "Tom Hanks Drive": (-86.41155202907453, 30.480396656512553),
-    "Bobolink Way": (-86.40436948702656, 30.745521765065575),
-    "Justice Johnson Road": (-86.69403944646359, 30.832339289944475),
-    "Park Avenue": (-86.4620023961308, 30.962224000137443),
-    "Caicos Cay": (-86.40217247962585, 30.380502825274764),
-    "Chelsea Drive Northwest": (-86.61602084562732, 30.450361838603925),
-    "Esmond Court": (-86.47760700524263, 30.526139865501136),
-    "Jones Road": (-86.56528116740886, 30.783959697774076),
-    "John Steinbeck Drive": (-86.4284708526035, 30.490948808011513),
-    "Hawthorne Circle": (-86.6111818701609, 30.433749741677417),
-    "Timberline Drive": (-86.55567453058869, 30.707657250012087),
-    "Windsor Court": (-86.5424731480493, 30.717400378888765),
-    "Terry Circle": (-86.66950800092474, 30.41043436756521),
-    "Joe Martin Circle": (-86.57559330171102, 30.448891810003484),
-    "Ajax Drive Northwest": (-86.66812328872179, 30.426019727495564),
-    "Bob White Court": (-86.76042770461356, 30.41242293474933),
-    "Van Matre Avenue": (-86.50581654165453, 30.483130644258647),
-    "Patmos Cove": (-86.42672483919303, 30.49038141370303),
-    "Spring Brook Lane": (-86.73220831649547, 30.41411825158126),
-    "Limestone Creek Cove": (-86.4606583948412, 30.526515208925318),
-    "Carl Place": (-86.56142700000001, 30.759522),
-    "Markella Road Northwest": (-86.62194007445675, 30.41759012312763),
-    "Grand Prix Drive": (-86.58095961778128, 30.709295178381012),
-    "Spring Lake Drive": (-86.48854883428491, 30.39982799729234),
-    "Charles Booker Road": (-86.73867059047372, 30.989185723617478),
-    "Misty Lane": (-86.50214967075388, 30.829052394694415),
-    "Lawson Lane": (-86.66333672971227, 30.97222103865117),
-    "Warren Bridge Road": (-86.5521032, 30.795924699999997),
-    "Howard Road": (-86.64119282370021, 30.68420573678754),
-    "Smokey Branch Road": (-86.47596329219897, 30.783665172035384),
-    "Glenwood Court": (-86.45903663413416, 30.50016653610318),
-    "Cartier Place": (-86.64410545000001, 30.4398375),
-    "Redman Court": (-86.47102809347273, 30.513533005023213),
-    "Tonass Way": (-86.60715115807392, 30.43212712742882),
-    "Evans Court": (-86.44025767476691, 30.501640763784298),
-    "3rd Street Southwest": (-86.61353854291802, 30.408902262022107),
-    "Village Court": (-86.64266849955611, 30.41742952114194),
-    "Lacy Lane": (-86.6273955, 30.440651499999998),
-    "Kotsa Lane": (-86.40401498433167, 30.3965115030105),
-    "Sycamore Avenue": (-86.45851194025036, 30.4997723748416),
-    "McCaskill Street": (-86.5709543961076, 30.764642488230468),
-    "1st Avenue East": (-86.56074347736356, 30.765536335814836),
-    "Ccs Street": (-86.63645168612032, 30.435298821437442),
-    "Whispering Oaks Lane": (-86.64479506319186, 30.459354119778205),
-    "Country Club Drive West": (-86.45630404286912, 30.40053668928936),
-    "Covell Road": (-86.55798440836554, 30.734985778359253),
-    "Duncan Drive": (-86.44454676074089, 30.509137812610287),
-    "Tranquility Lane": (-86.40543664872084, 30.38513599711653),
-    "Edge Perry Road": (-86.43557927927694, 30.815854006296984),
-    "Ridge Lane": (-86.41205609729444, 30.48453731200555),
-    "Ray Avenue": (-86.57368306628408, 30.70322386263886),
-    "Carolina Avenue": (-86.49498291139777, 30.491468348388715),
-    "Chardee Road": (-86.45653052527727, 30.80690430915868),
-    "Bayview Street": (-86.48474955026747, 30.40485231004802),
-    "Miracle Drive": (-86.72746099334304, 30.41339578192098),
-    "Knollwood Road": (-86.41606893539645, 30.49364308789417),
-    "Old Jones Road": (-86.56745537043537, 30.78777799843353),
-    "Willow Bend Court": (-86.56500151545829, 30.70601090299751),
-    "East Bowers Avenue": (-86.56277733867863, 30.75568438307278),
-    "Frances Street": (-86.5392157905546, 30.795898962199285),
-    "Stacy Lane": (-86.59874036267786, 30.79764658354873),
-    "Magnolia Drive": (-86.73615739547694, 30.683023529461448),
-    "Riverwood Drive": (-86.57220354497717, 30.71533433094358),
-    "Greenwood Way": (-86.41284033761495, 30.473244579839573),
-    "Michael Court": (-86.78604381628543, 30.4152691182583),
-    "Livingston Street": (-86.56051257009177, 30.7772924808046),
-    "Hillbrook Court": (-86.56876049696261, 30.438662113252338),
-    "West Folk Drive": (-86.70897442358104, 30.731171488557706),
-    "Springwood Way": (-86.47849992655226, 30.530624722171876),
-    "Southwind Court": (-86.4286005110261, 30.473854695899252),
-    "Sheldon Court": (-86.56156344915478, 30.708311961094402),
-    "Leroy Martin Lane": (-86.63380472340434, 30.7946344456272),
-    "Landfall Court": (-86.41208044704346, 30.401342435663082),
-    "Dusty Trail": (-86.77620060402843, 30.873562949438163),
-    "Carver Lane": (-86.65161398873676, 30.748092679598166),
-    "Valastics Avenue": (-86.50843551313402, 30.51079750331744),
-    "Gerald Brooks Road": (-86.7407508527522, 30.792213349852855),
-    "Nomad Way": (-86.56219354999999, 30.483307099999998),
-    "Paddle Wheel Cove": (-86.58918001432201, 30.704103659993496),
-    "Tapoco Drive": (-86.53342345894949, 30.457231163525265),
-    "23rd Street": (-86.4637368763493, 30.508524893870362),
-    "Homewood Drive": (-86.64550430713733, 30.430529836582103),
-    "Wildhorse Drive": (-86.5902725, 30.708800000000004),
-    "Charles Drive": (-86.50445825392707, 30.507737144811813),
-    "Whitrock Lane": (-86.6138081033156, 30.43647452570856),
-    "West Redstone Avenue": (-86.56744437357392, 30.73564370196355),
-    "Lexie Drive": (-86.58626624956423, 30.72301078409969),
-    "Harley Lane": (-86.74967944715992, 30.705131819647775),
-    "West Washington Avenue": (-86.49611664508686, 30.507579824607635),
-    "Sutton Place": (-86.66422299686897, 30.431649190536668),
-    "Liberator Lane": (-86.77393531368185, 30.84266899858927),
-    "Canterbury Court Northwest": (-86.64267900029809, 30.416809483597007),
-    "Woodfern Path": (-86.65458627087935, 30.462796197393754),
-    "Scarlet Drive": (-86.56522584959272, 30.70502002275545),
-    "Reed Avenue": (-86.5567979624314, 30.751908413138086),
-    "Northampton Circle": (-86.64327, 30.453816),
-    "Joellen Lane": (-86.65448349151745, 30.46153250098609),
-    "Forest Street": (-86.50747358495033, 30.399987310685454),
-    "Adam Thomas Lane": (-86.70376530240738, 30.755696400337868),
-    "Finch Avenue": (-86.50625526423357, 30.81274897582103),
-    "Patricia Lane": (-86.65683447687775, 30.432016999325256),
-    "Shoalwood Drive": (-86.54996250179617, 30.719350000019674),
-    "Willsey Trail": (-86.491077, 30.8111845),
-    "Dahlquist Drive": (-86.55632986269218, 30.772243114579055),
-    "11th Avenue": (-86.57097730014965, 30.447028343375678),
-    "1st Avenue West": (-86.58132060079443, 30.766020049502693),
-    "Castlewood Lane": (-86.41621667088013, 30.491553534716644),
-    "Thornhill Road": (-86.61139750000001, 30.434693),
-    "Columbus Street": (-86.4989921783537, 30.51646735334709),
-    "Nechako Court": (-86.55331977455036, 30.707312704157232),
-    "Steel Mill Creek Road": (-86.410033492365, 30.91660812358401),
-    "Van Dyke Drive": (-86.57901667618613, 30.4384097731873),
-    "Ashland Court": (-86.5724030063324, 30.439774189643796),
-    "Lillie Street": (-86.54123156050163, 30.797567729710156),
-    "James Lee Road": (-86.61763022473549, 30.439516631355932),
-    "Birch Avenue": (-86.58282549631087, 30.456532816975045),
-    "Garden Oaks Cove": (-86.426774, 30.488719),
-    "Westlake Court": (-86.43248096010828, 30.48793884655177),
-    "Basin Creek Cove": (-86.45926769578512, 30.527152749758447),
-    "Jamaica Cove": (-86.42144213193703, 30.48209259677114),
-    "Wenona Way": (-86.53820949743027, 30.455147755483413),
-    "Binnacle Lane": (-86.56890234607395, 30.446974538222417),
-    "Astro Drive": (-86.53621655471916, 30.777228449472986),
-    "Tooke Street": (-86.60710248086772, 30.43616248338866),
-    "David Trimm Drive": (-86.41604355573115, 30.483884755538526),
-    "Curacro Cove": (-86.42104235653359, 30.47382670692011),
-    "Timpoochee Lane": (-86.39476516524833, 30.456479927108184),
-    "Lake Lorraine Circle": (-86.55790626780211, 30.44336299560914),
-    "Atwater Court": (-86.78285614272534, 30.40973539105881),
-    "Clary Road": (-86.52361318985933, 30.93420966682262),
-    "Defiance Drive": (-86.47354888899025, 30.392120341110267),
-    "Dolphin Avenue": (-86.61561617207441, 30.39826688070625),
-    "Anglin Lane": (-86.48302933398803, 30.80571195403525),
-    "Ryan Road": (-86.46278464621486, 30.78712902778654),
-    "Tansey Lane": (-86.5142744235197, 30.8179480367698),
-    "Lola Circle": (-86.48955897677911, 30.392950288146945),
-    "Commerce Avenue Southwest": (-86.62741251551483, 30.41127700046265),
-    "Lajolla Lane": (-86.74788586064759, 30.409215674901287),
-    "Frontier Drive": (-86.58866160209534, 30.77741682434274),
-    "Crossen Street": (-86.57094759997771, 30.72992692151048),
-    "Sandbur Court": (-86.57464520118369, 30.460077557855254),
-    "Scenic Oak Lane": (-86.64655481774547, 30.4487844622382),
-    "Dove Run Road": (-86.75895415853647, 30.67455342147474),
-    "Catawba Road": (-86.53600466774996, 30.459826771986542),
-    "Kenneth Avenue": (-86.57479369602653, 30.775149448951336),
-    "Winstead Cove": (-86.53119622192425, 30.823058946578254),
-    "Rosebud Avenue South": (-86.40034953139482, 30.738640355839028),
-    "West Cahaw Way": (-86.40789875084509, 30.740586075398827),
-    "Seventeenth Tee Cove": (-86.45304823132173, 30.52040640735702),
-    "Colony Court": (-86.62362250000001, 30.436499499999996),
-    "Shore Drive Southeast": (-86.5890765, 30.4096635),
-    "Charlotte Court": (-86.62960580981124, 30.43898194185371),
-    "Brand Road": (-86.64688203714044, 30.787591839998445),
-    "Lea Place": (-86.554843, 30.765073500000003),
-    "Cahokia Run": (-86.5588052245897, 30.71638209832221),
-    "Cobia Avenue": (-86.60831016900447, 30.397773416239186),
-    "Hatchee Road": (-86.54467456280857, 30.462836438132403),
-    "Romana Lane": (-86.75722760602612, 30.414500448425873),
-    "Otterlake Cove": (-86.4363979235156, 30.489960375280695),
-    "Midland Court": (-86.41174775929089, 30.486095144777313),
-    "Evergreen Street": (-86.582536010148, 30.456535000025546),
-    "Broxson Road": (-86.7395417543321, 30.698213614723606),
-    "Maple Avenue": (-86.46519560333209, 30.49940591813477),
-    "Liriope Loop": (-86.47471671824965, 30.39309003808608),
-    "Pinecrest Lane": (-86.634862, 30.448017999999998),
-    "Stonegate Court": (-86.60643116387307, 30.435832637594007),
-    "Sunrise Drive": (-86.55714952745787, 30.437568627946245),
-    "Krivik Court": (-86.61038690000001, 30.46804785),
-    "Indian Bayou Trail": (-86.45998053891208, 30.39087793781358),
-    "Kilcrease Road": (-86.697507997777, 30.83396422885431),
-    "Wildwood Road": (-86.59056740914652, 30.792037926998958),
-    "Ray Lawson Drive": (-86.73021349999999, 30.881735999999997),
-    "Doolittle Boulevard": (-86.66475853287541, 30.411509154879028),
-    "Jim Strickland Road": (-86.45561598905279, 30.953904453131667),
-    "Pine Cone Drive": (-86.65040336938767, 30.42940170356469),
-    "Bess Avenue": (-86.57187831340235, 30.7454916617454),
-    "Walker Road": (-86.52124207900518, 30.99066675023211),
-    "Zerbe Street": (-86.51127810536897, 30.396510315857093),
-    "Camden Pass Lane": (-86.64618275208632, 30.439904004166884),
-    "Kelvin Court": (-86.57339738963304, 30.744916889365125),
-    "Malta Cove": (-86.42773349999999, 30.4899345),
-    "Sherry Circle Northwest": (-86.63966398257952, 30.42465624173408),
-    "Marshall Drive": (-86.76065970780375, 30.70836965302476),
-    "Winoka Way": (-86.55651885087161, 30.7163412490373),
-    "Everglade Drive": (-86.4676441108753, 30.497533111255827),
-    "Island Drive": (-86.58703856639454, 30.71265612617117),
-    "Snapper Drive": (-86.49641350445, 30.397221000004276),
-    "Berwick Circle": (-86.56574106242131, 30.44261166407279),
-    "Garnett Avenue Northeast": (-86.61178367848639, 30.421313055976512),
-    "Wright Parkway Northwest": (-86.63914980971393, 30.423811470133913),
-    "Willard Road Northwest": (-86.62427692322235, 30.419174699239836),
-    "Pine Lake Court": (-86.54130649999999, 30.7783955),
-    "Glenlake Circle": (-86.429026, 30.483464),
-    "Poplar Avenue Northwest": (-86.65595160843372, 30.425762848500142),
-    "Saint Thomas Cove": (-86.41943606248734, 30.48448277174442),
-    "Barley Port Lane": (-86.64446601719789, 30.439352454055253),
-    "Flamenco Street": (-86.72554203521581, 30.41368317008115),
-    "Palmetto Drive": (-86.54644408067367, 30.76204064567901),
-    "Westwood Drive": (-86.64961203414737, 30.437947304294802),
-    "William Gary Johnson Road": (-86.68578564597662, 30.836239899037746),
-    "Bambi Road": (-86.45739562383137, 30.80424987107522),
-    "Clint Mason Road": (-86.48765015264284, 30.760827152962303),
-    "Terrance Lane": (-86.76185549057126, 30.41396754964466),
-    "Christy Drive": (-86.48031606180997, 30.50764335792554),
-    "Commercial Drive": (-86.41232055040267, 30.481455254251316),
-    "Titan Court": (-86.63302919899547, 30.45053202814835),
-    "Arnold Palmer Court": (-86.56167266541189, 30.437023448729104),
-    "Willow Bend Boulevard": (-86.65289997640012, 30.465839020217732),
-    "Mill Brook Lane": (-86.54433100667649, 30.79529700010289),
-    "Brett Street": (-86.56792866783407, 30.759694188068952),
-    "Parsonage Road": (-86.68332308384262, 30.781650575076064),
-    "Sunset Beach Drive": (-86.43135160624306, 30.4675385792013),
-    "Canoe Lake Road": (-86.75365776573746, 30.673887429262916),
-    "Windward Way": (-86.43909918077463, 30.484061618737154),
-    "Brunson Street": (-86.61367193554872, 30.719011986027123),
-    "Old Mill Way": (-86.54935102125424, 30.723922325316664),
-    "McCallum Avenue": (-86.57749805001276, 30.760288799978156),
-    "Panther Court": (-86.48850149185708, 30.394849497903863),
-    "Shalimar Court": (-86.552603, 30.4410895),
-    "Brookwood Boulevard": (-86.75828719187598, 30.409386640308288),
-    "Playground Road": (-86.62170821534067, 30.447427188555885),
-    "Poplar Head Church Road": (-86.7496861123163, 30.722803822581803),
-    "Kent Court": (-86.43439396101029, 30.510327408833035),
-    "Cornbread Lane": (-86.53692746954682, 30.85599340769304),
-    "10th Street": (-86.56657172617908, 30.441728235200166),
-    "Cadle Drive": (-86.59660710348851, 30.711107563305486),
-    "South Main Street": (-86.56661385833296, 30.754821946160884),
-    "Chicago Avenue": (-86.46120946619322, 30.95687131802492),
-    "Currant Trace": (-86.7494795, 30.405953),
-    "Islandview Drive": (-86.64833741329629, 30.408186672466908),
-    "Egret Court": (-86.50267233310649, 30.395385474400577),
-    "Shalimar Cove": (-86.5524545, 30.4409155),
-    "Clear Creek Road": (-86.46258196333056, 30.814203352030386),
-    "Sleepy Oaks Road Northwest": (-86.61366537847289, 30.4250654611291),
-    "Gingers Place": (-86.69678074522535, 30.717815139440695),
-    "North Campbell Drive": (-86.65729825339216, 30.4604116968595),
-    "Parkwood Place": (-86.41468200471067, 30.48595767722849),
-    "Hart Street": (-86.49664322676215, 30.53139501217604),
-    "Landview Drive": (-86.64901898230684, 30.462037384587326),
-    "Cardinal Avenue": (-86.61099852805194, 30.397978922010246),
-    "Quasar Drive": (-86.5375496786441, 30.778092748142793),
-    "Woodlow Road": (-86.46566553935152, 30.522546768299158),
-    "Waldo Road": (-86.4082249773801, 30.776975805873434),
-    "Annabelle Drive": (-86.66984755023903, 30.412335353981227),
-    "Adams Road": (-86.397332652978, 30.938033057198695),
-    "Hannah Circle": (-86.49504850036703, 30.40717001191538),
-    "Turley Lane": (-86.44803777032335, 30.757805283107874),
-    "Haney Drive": (-86.61433, 30.446479),
-    "Martinique Cove": (-86.42302084807756, 30.483951049268256),
-    "West Kelly Road": (-86.60212749860038, 30.955922647485085),
-    "West Cat Mar Road": (-86.40884148197947, 30.483417101737803),
-    "Charrington Place": (-86.6422052103914, 30.453053016003967),
-    "Truman Street": (-86.60633399044968, 30.446842140021793),
-    "Dyer Lane": (-86.50280699999999, 30.753860500000005),
-    "Ferretti Avenue": (-86.62795038135089, 30.4375890077438),
-    "Trout Creek Cove": (-86.45815344293784, 30.52796159571713),
-    "Ewing Court Northwest": (-86.63559789778175, 30.42808710330957),
-    "Desota Road": (-86.48252763824792, 30.47929755222234),
-    "Als Drive": (-86.47787114636677, 30.50255525826147),
-    "F I M Boulevard": (-86.6452704237623, 30.466470499704037),
-    "East Greenwood Cove": (-86.4118307159677, 30.47231989117305),
-    "Shantina Avenue": (-86.44118002922102, 30.815899623339643),
-    "Haburn Street": (-86.55102434269963, 30.771094914237736),
-    "Williams Street": (-86.63093549999999, 30.432965000000003),
-    "Judson Street": (-86.650402506729, 30.451444790336687),
-    "Fairfield Drive": (-86.60564022535755, 30.75991944886389),
-    "Chadwick Lane": (-86.41586793424227, 30.4896338492245),
-    "La Porte Road": (-86.52878214986505, 30.795760616171098),
-    "Peter Kuth Drive": (-86.4188719336139, 30.486035864524307),
-    "Sasser Street": (-86.4665594114507, 30.510494594928566),
-    "Lewis Street": (-86.63442706606972, 30.4393665773896),
-    "Home at Last Lane": (-86.43194220693829, 30.829492980563007),
-    "Carie Way": (-86.50905574345691, 30.528414015863266),
-    "Calypso Street": (-86.7250672298668, 30.41265482542258),
-    "Regency Park Drive": (-86.64472608810738, 30.40900804989818),
-    "Galaxy Drive": (-86.53610295744787, 30.77698684747523),
-    "Taylor Road": (-86.58367853034164, 30.820880774700328),
-    "Oddfellow Road": (-86.6298179134684, 30.46292535659443),
-    "Southminister Court": (-86.42774538972607, 30.463010937435783),
-    "Deluna Road Southwest": (-86.62922660553416, 30.410928837725855),
-    "Fairwood Drive": (-86.47224245191, 30.509539511738456),
-    "Egan Street": (-86.61274549999999, 30.7183865),
-    "Ramonde Court": (-86.4371561109713, 30.511178374785853),
-    "Martin Luther King Jr Boulevard": (-86.66058639443371, 30.441352578742467),
-    "Twin Cities Boulevard": (-86.49392696839257, 30.5332907530295),
-    "Ewing Street": (-86.75138555298854, 30.716475530624304),
-    "Hydac Road": (-86.63065049562292, 30.44729841040407),
-    "Davenport Avenue": (-86.5046871282953, 30.515438905177795),
-    "Old Mill Court": (-86.54794964865484, 30.722732246928558),
-    "Kelley Road": (-86.50669333015942, 30.523365943294134),
-    "McKinney Street": (-86.48104540886001, 30.51779915219102),
-    "Ariel Lane": (-86.6351235708442, 30.460361447602953),
-    "Elliott Road Southeast": (-86.59303974876916, 30.407172863115097),
-    "Tommie Steele Road": (-86.70455769159237, 30.967763862300618),
-    "Sea View Circle": (-86.49381842366493, 30.393067872057834),
-    "Oregon Court Northeast": (-86.60171087580962, 30.42059430430806),
-    "Letourneau Circle": (-86.70401465944657, 30.41652152825575),
-    "Cody Avenue": (-86.69410545070912, 30.423540598495105),
-    "21st Street": (-86.47450587931532, 30.506835492647348),
-    "Alonzo Drive": (-86.592584, 30.715741),
-    "11th Street": (-86.45669068509578, 30.495813742202913),
-    "Looney Road": (-86.71995905697277, 30.974063363980544),
-    "Charleston Circle": (-86.65266385836041, 30.465818971086094),
-    "Plymouth Avenue": (-86.61913124259051, 30.43215887384651),
-    "Marty Lane": (-86.64546131555967, 30.45402690479702),
-    "Hickory Avenue West": (-86.5759120070282, 30.7612295859157),
-    "Club Place Northeast": (-86.61184100003366, 30.461678998169443),
-    "Managua Way": (-86.72323896389327, 30.413641885361784),
-    "Woods Road": (-86.50283080387507, 30.970649859315294),
-    "McKinley Street": (-86.47732250001806, 30.52806049575361),
-    "Birch Street Southeast": (-86.61144858696977, 30.407954523248513),
-    "Bens Lane": (-86.54218608514945, 30.456741939046687),
-    "Mary Avenue": (-86.61384498957975, 30.443856516782414),
-    "Wynoka Way": (-86.55775443784715, 30.716891455292235),
-    "Par Court": (-86.61585492815392, 30.728951031217175),
-    "Fairway Place": (-86.5191309772482, 30.79653601408308),
-    "Farmers Street": (-86.55297657191825, 30.780463699790406),
-    "Anthony Drive": (-86.62758448132882, 30.452119484965664),
-    "Woodbine Circle": (-86.64476384834177, 30.42936782563074),
-    "Center Street": (-86.63668932825615, 30.435811374869317),
-    "Erwin Fleet Road": (-86.58184194435202, 30.44499513685459),
-    "Jenny Lane": (-86.54921126083838, 30.809933673432525),
-    "Whittle Lane": (-86.51851070675639, 30.875068633404467),
-    "Messick Road": (-86.6645802766872, 30.82547852540627),
-    "Sarah Drive": (-86.70843553729956, 30.801191024038662),
-    "Yaupon Court": (-86.57431000933616, 30.45537349751061),
-    "Blossom Drive": (-86.64943400000001, 30.437856),
-    "Freeport Court": (-86.74541853127121, 30.409958299061557),
-    "Vera Cruz Drive": (-86.49650943248886, 30.385654934992314),
-    "Constitution Road": (-86.53515779528493, 30.762574814625648),
-    "Romi Circle": (-86.40221711556092, 30.85232566157743),
-    "Hard Knock Road": (-86.4687234109911, 30.960780960578422),
-    "Noblat Drive": (-86.789089, 30.415376000000006),
-    "Cougar Circle": (-86.44075439823226, 30.48997359551594),
-    "Austin Avenue": (-86.78348738983323, 30.413557970550926),
-    "Lovers Lane": (-86.64728080124459, 30.45386597633569),
-    "Panagra Lane": (-86.57905928291201, 30.77474315937085),
-    "Bermuda Way": (-86.42764516059721, 30.48698080363439),
-    "Silver Oaks Lane": (-86.56597145857258, 30.80781216010217),
-    "Live Oak Court": (-86.56550155469917, 30.70240817758435),
-    "T W Drive": (-86.63354644884295, 30.806944617942616),
-    "Grady Johnson Road": (-86.48890447852335, 30.75349633481031),
-    "East Dogwood Drive": (-86.50255865102919, 30.79520525429928),
-    "Jack Road": (-86.53053417044315, 30.894833488719545),
-    "Gregory Drive": (-86.67069225037406, 30.41235996852931),
-    "Jack Stokes Road": (-86.69053008688999, 30.80914069994396),
-    "Davenport Road": (-86.6070253997727, 30.43618221997591),
-    "Bush Road": (-86.69506743337699, 30.802235611815153),
-    "Riverview Drive": (-86.6339640965338, 30.686811707664642),
-    "Dads Road": (-86.65102640006492, 30.748571882606974),
-    "Andros Street": (-86.74954799787217, 30.685002956008802),
-    "Meadow Lake Drive": (-86.56675259374929, 30.71222843643428),
-    "Chris Lane": (-86.78606204503929, 30.412307573666332),
-    "Montrose Drive": (-86.45695334032995, 30.509923151756897),
-    "Thomason Drive": (-86.65578863818824, 30.45894491623318),
-    "Oakdale Avenue": (-86.78836940056345, 30.412993211017547),
-    "Goodwin Avenue": (-86.56208957918722, 30.74048024974644),
-    "Osprey Landing": (-86.417984, 30.500645),
-    "Oelschlager Street": (-86.70727504999999, 30.412299400000002),
-    "Kenneth Street": (-86.63266997886284, 30.445077999756876),
-    "Sugarmill Lane": (-86.49356267664231, 30.993930183403975),
-    "Grebe Way": (-86.40455514184106, 30.738282629487838),
-    "Edwards Circle": (-86.50377095704361, 30.50736523967725),
-    "Opa-Locka Lane": (-86.40073307285493, 30.386870041771633),
-    "Bluewater Boulevard North": (-86.41699041618189, 30.496271017305183),
-    "Strawbridge Drive": (-86.55434233504387, 30.768513789616474),
-    "Tobago Court": (-86.59666902200763, 30.775230912471205),
-    "Birch Street Southwest": (-86.6135659999866, 30.40800950042969),
-    "Anzio Lane": (-86.62658910698345, 30.45184216345158),
-    "Graham Court Northeast": (-86.60270447283052, 30.42043913764328),
-    "Normandy Road": (-86.57574543493986, 30.79291015598224),
-    "4th Avenue": (-86.57153505539084, 30.43895545275318),
-    "Buckingham Way": (-86.590145, 30.4609696),
-    "Kanuha Drive": (-86.65854077080445, 30.4413296083445),
-    "Tree Point Drive": (-86.60206700720272, 30.455430599655916),
-    "Mid-Bay Bridge Road": (-86.42685114916084, 30.391232406533604),
-    "S141": (-86.7876961971934, 30.897703145245256),
-    "Calle De Castelar": (-86.80111724413648, 30.41353636966254),
-    "Johnny Parker Road": (-86.81153934040971, 30.692142042083763),
-    "Garner Landing Road": (-86.7989285576433, 30.653690817397962),
-    "West Highway 98": (-86.799087, 30.409832799999997),
-    "Shammah Road": (-86.79510167376306, 30.719850450323232),
-    "Indigo Loop": (-86.39283746047919, 30.388735986016094),
-    "Rosebud": (-86.39009361845606, 30.742159624625227),
-    "County Line Road 17": (-86.39437592198509, 30.456196696588375),
-    "Bob Sikes Road": (-86.39011471156621, 30.662237158648846),
-    "Anice Lane": (-86.38780001235126, 30.942290990429456),
-    "Miracle Strip Parkway": (-86.60146585105173, 30.402242163693725),
-    "Roger J Clary Highway": (-86.52939402061482, 30.561928830042863),
-    "Booker Street": (-86.56843041550141, 30.758585199594805),
-    "Freedom way": (-86.671046793986, 30.428623652415826),
-    "Blossom Creek Run": (-86.45699892137836, 30.522256865031405),
-    "Timber Lake Trails": (-86.60454078559611, 30.484859037273594),
-    "Timber Lake Trail": (-86.6112246917102, 30.483692713982126),
-    "Wal-Mart Road": (-86.5676819, 30.729064100000002),
-    "Mid-Bay Bridge": (-86.42491871771499, 30.404988886578707),
-    "White Point Road": (-86.41756401148741, 30.46227919743192),
-    "Emerald Coast Parkway": (-86.41656942896536, 30.388985263450717),
-    "Eglin Parkway North": (-86.58073133894504, 30.442507474484078),
-    "Eglin Parkway Northeast": (-86.6078597, 30.4265917),
-    "Florida Trail": (-86.55949253804047, 30.68780226054468),
-    "Walter Francis Spence Parkway": (-86.41501306861791, 30.46238106789715),
-    "State Highway 85": (-86.37978934225296, 30.970948764913846),
-    "State Highway 189": (-86.66510779246987, 30.86915097661494),
-    "77th Special Forces Way": (-86.56969677694967, 30.63754371466868),
-    "Crown Creek Circle": (-86.54423417716903, 30.800640898067154),
-    "2nd Avenue Northeast": (-86.5493811680679, 30.776561161508617),
-    "January Court": (-86.55406958090781, 30.766959207644756),
-    "Wild Egret Lane": (-86.62201983617888, 30.718482344636342),
-    "Red Fern Road": (-86.62048852122393, 30.717127632340564),
-    "Traverse Lane": (-86.62420048183834, 30.715692412600074),
-    "Terrier Trail": (-86.63045840004564, 30.72137511031749),
-    "Leonine Hollow": (-86.62721775964935, 30.72129794327387),
-    "Silver Tip Trail": (-86.62568374891033, 30.722704777891483),
-    "Pinque Coat Court": (-86.62575567567185, 30.722209780790077),
-    "Vale Loop": (-86.62875524080974, 30.72242480895569),
-    "Scenic Highway 98 Trail": (-86.38791109387296, 30.37865474897169),
-    "Tooksolong Lane": (-86.7790366513068, 30.71395438587016),
-    "Galiver Cutoff": (-86.69658007887915, 30.75433714831093),
-    "Frazier Street": (-86.6951664850249, 30.426269812347357),
-    "Ladue Drive": (-86.5636850517452, 30.731061672003204),
-    "Mirage Avenue": (-86.57178078611348, 30.728735175719148),
-    "Creve Cove Drive": (-86.56299985950834, 30.731495617680807),
-    "Price-Gregory Way": (-86.5700612754529, 30.731488053216697),
-    "Ruby Lane": (-86.5623638626791, 30.729589149229064),
-    "Pheasant Trail": (-86.62042576872336, 30.716582197429087),
-    "Solimar Way": (-86.74155209109367, 30.410784996780016),
-    "Miranda Court": (-86.7408741, 30.41012225),
-    "Gen Robert W. Bond Boulevard": (-86.56248466207965, 30.48827907766513),
-    "Range Rd 643": (-86.60785101499502, 30.482228798421435),
-    "Eleases Crossing": (-86.54640671598332, 30.770502447848344),
-    "Lear Court": (-86.55620185000001, 30.771089099999998),
-    "Serene Court": (-86.545559, 30.771255049999997),
-    "Split Creek Drive": (-86.55493830449896, 30.770330551924),
-    "Haislip Drive": (-86.5575939, 30.769225499999997),
-    "Eisenhower Drive": (-86.55672630213502, 30.770341178486913),
-    "Bolte Court": (-86.55691239632284, 30.76852001801986),
-    "Grand Ridge Drive": (-86.5458576328268, 30.771558751397837),
-    "Trailwood Lane": (-86.54705854620576, 30.77170440376504),
-    "Wainwright Drive": (-86.55687509442, 30.768776738780716),
-    "Mayflower Avenue": (-86.62400766908297, 30.438327599306415),
-    "Roosevelt Avenue": (-86.68573163046328, 30.797073144393927),
-    "Range Rd 221": (-86.5859175141176, 30.60845426168661),
-    "Military Road 257": (-86.73593838093238, 30.583475319067304),
-    "Winddrift Court": (-86.58307209461968, 30.75736238367766),
-    "Songbird Way": (-86.5805695, 30.7583475),
-    "Wych Circle": (-86.59951334650775, 30.718165773346655),
-    "Amanda Court": (-86.53583717974487, 30.842812125654664),
-    "Chanteuse Parkway": (-86.54488997519304, 30.712809563774357),
-    "Barbaree Drive": (-86.59392868296877, 30.828190067976326),
-    "Lime Lane": (-86.59529331379947, 30.719783047851138),
-    "Scotch Pine Lane": (-86.59854313963875, 30.71587722234927),
-    "Crooked Pine Trail": (-86.5475333569489, 30.734856463431342),
-    "Zach Avenue": (-86.5357015691002, 30.844734521196727),
-    "Lee Farm Boulevard": (-86.60263222567612, 30.76767052357624),
-    "Swaying Pine Court": (-86.54787491394248, 30.73393235005858),
-    "Moore Loop": (-86.6028613490596, 30.770345854839302),
-    "Airmen's Memorial Road": (-86.55151570827178, 30.714147261278836),
-    "Sidewinder Loop": (-86.57971399725182, 30.72156346398238),
-    "Bronze Circle": (-86.55275795863598, 30.738414019424987),
-    "Chancery Lane": (-86.5521552030893, 30.711996308283837),
-    "Antigone Circle": (-86.53995585880661, 30.843584651521827),
-    "Chanson Crossing": (-86.54923291993333, 30.713787702706917),
-    "Alicia Drive": (-86.57849624503176, 30.718373869630103),
-    "Evan Circle": (-86.5894628461214, 30.826083807143437),
-    "Equine Drive": (-86.57039135, 30.8264572),
-    "Sessile Circle": (-86.59795120000001, 30.71856135),
-    "Marlea Court": (-86.60186, 30.7653472),
-    "Arthur Boulevard": (-86.53115460395342, 30.844500743750633),
-    "Rowan Circle": (-86.597001, 30.7190338),
-    "Forge Drive": (-86.54992665000002, 30.7389277),
-    "Ana Noel Drive": (-86.59099795, 30.826286449999998),
-    "Hummingbird Lane": (-86.57816758020671, 30.8226116997488),
-    "Shield Drive": (-86.54783785000001, 30.738141249999998),
-    "Secretariat Drive": (-86.55329579980082, 30.734387917422293),
-    "Bullet Drive": (-86.57222395, 30.82659765),
-    "Agerton Street": (-86.59365685, 30.828195100000002),
-    "Dragonfly Way": (-86.57979150013624, 30.82262940000235),
-    "Magik Drive": (-86.56855085, 30.82568175),
-    "Yew Circle": (-86.59484309999999, 30.720154850000004),
-    "Gauntlet Drive": (-86.5542441, 30.738066499999995),
-    "Conquest Avenue": (-86.59458260841251, 30.777288441010256),
-    "Hagood Loop": (-86.60171122714063, 30.767271110028613),
-    "Crab Apple Avenue": (-86.59876624964853, 30.716274488044323),
-    "Citadel Lane": (-86.54922137626168, 30.738336753525427),
-    "Limestone Circle": (-86.54993471164165, 30.73486237366121),
-    "Chanan Drive": (-86.54912216084715, 30.71203333878093),
-    "Plate Drive": (-86.54694273302114, 30.738369203944092),
-    "Chantry Circle": (-86.54955411545824, 30.711993973938633),
-    "Chantey Street": (-86.55114741618696, 30.71134090422321),
-    "Sunesta Court": (-86.5959217516471, 30.779857216785548),
-    "Chancel Avenue": (-86.5503988643236, 30.711744137618563),
-    "Chancellor Court": (-86.54873781987467, 30.71216637115376),
-    "Iron Horse Drive East": (-86.54737725883585, 30.73714243985414),
-    "Rapto Drive": (-86.57887084868706, 30.721749933307837),
-    "Genevieve Way": (-86.59625596219507, 30.830271526243003),
-    "Corner Creek Road": (-86.57057197126768, 30.82604324751179),
-    "Butterfly Alley": (-86.5789230500315, 30.82115389650547),
-    "Chantrelle Cove": (-86.55269713831156, 30.710802179187652),
-    "Conrad Court": (-86.53355872896448, 30.846089739543974),
-    "Flash Lane": (-86.57409965644594, 30.8273928983592),
-    "Triton Street": (-86.5942309479516, 30.777783837132876),
-    "Sandstone Trail": (-86.5511741461605, 30.735277484591645),
-    "Doris Street": (-86.53656901128443, 30.84371307769814),
-    "Silverton Loop": (-86.59468501017813, 30.777403026525594),
-    "Adora Teal Way": (-86.52995971767443, 30.78331501229104),
-    "Destin Jet Way": (-86.47112309758373, 30.39591023764268),
-    "Howie Walters Road": (-86.6804362546176, 30.416720161371796),
-    "Kerwood Road": (-86.68224175586234, 30.413255226567337),
-    "Hermosa Road": (-86.56746883724136, 30.704570381901636),
-    "Mirada Way": (-86.5676908426766, 30.703871342406305),
-    "Beth Circle": (-86.56922212718527, 30.699107281180133),
-    "Annabelle Lane": (-86.56684404813085, 30.701576380994762),
-    "Phil Dirt Road": (-86.57648280000001, 30.79806225),
-    "Cameo Circle": (-86.50914563021522, 30.88362915268639),
-    "Lexington Court": (-86.5540392, 30.8075234),
-    "Wingspan Way": (-86.59290678016885, 30.70802624750492),
-    "Majestic Drive": (-86.594016177416, 30.706873316497916),
-    "Button Bush Way": (-86.4607975, 30.496107950000003),
-    "1 Mile Foot Path": (-86.59884296145874, 30.418626811191693),
-    "Apple Blossom Court": (-86.577103, 30.438626499999998),
-    "Red Plum Court": (-86.57711975000001, 30.438001900000003),
-    "Five Oaks Lane": (-86.57714535, 30.437403649999997),
-    "Sugar Plum Lane": (-86.57747131293637, 30.437926650277564),
-    "Carter Oaks Circle": (-86.63682761462076, 30.45816838527481),
-    "Cumberland Way": (-86.57564929932606, 30.81496444367248),
-    "Halfmoon Lane": (-86.57740545, 30.814946499999994),
-    "Plum Orchard Way": (-86.58090944998389, 30.814980453114273),
-    "Burbank Court": (-86.58194833615083, 30.813983163218722),
-    "Brickhill Court": (-86.58191423550146, 30.815989608156322),
-    "Aubrey Lee Lane": (-86.48514781941786, 30.81082289049978),
-    "Autumn Woods Drive": (-86.50098875482377, 30.8184535106047),
-    "Carina Road": (-86.49338111893232, 30.807436547800442),
-    "Fiori Drive": (-86.49298727301316, 30.806539098916595),
-    "Hidden Valley Road": (-86.48823725312167, 30.811272315367628),
-    "Kittrel Lane": (-86.4844514847451, 30.812492292964205),
-    "Ranch Drive": (-86.48804849481638, 30.810818711122163),
-    "Shirey Court": (-86.49862826884635, 30.811118460314944),
-    "Spence trail": (-86.5152982826503, 30.564229059241335),
-    "Addison Place": (-86.60749180756521, 30.715782103856345),
-    "Desoto Road": (-86.5446202, 30.7572135),
-    "Brown Stone Road": (-86.51307425294205, 30.82679960389551),
-    "Citrine Circle": (-86.51338016145982, 30.824711808920746),
-    "Lapis Lane": (-86.51121529949666, 30.825353343117214),
-    "Sparco Drive": (-86.50529631845583, 30.82754937798456),
-    "Maloy Drive": (-86.50636816719796, 30.826974095495213),
-    "R29": (-86.76859673603754, 30.93161741451373),
-    "R27": (-86.77499477978976, 30.933590207696177),
-    "R25": (-86.77522220320931, 30.939679835986798),
-    "R81": (-86.74743270350712, 30.854297542925515),
-    "R78": (-86.74272216332966, 30.866154215577154),
-    "R84": (-86.73796768957111, 30.857019101340406),
-    "R85": (-86.73409700596189, 30.85816447375805),
-    "R83": (-86.73854476655042, 30.84970255154129),
-    "R74": (-86.74894926833824, 30.86892213371021),
-    "B28": (-86.75299824584333, 30.828536679738516),
-    "B35": (-86.75650824999998, 30.829903),
-    "B31": (-86.75434498497357, 30.824468750679024),
-    "B32": (-86.7471945965091, 30.820751168965387),
-    "B33": (-86.75799576326744, 30.818129618947026),
-    "R57": (-86.72554598426925, 30.89269855403145),
-    "R59": (-86.73413737367679, 30.904147889066234),
-    "R58": (-86.73311586892505, 30.89946976097305),
-    "R47": (-86.76907756243757, 30.903716089703998),
-    "R51": (-86.7766583997067, 30.901024641883815),
-    "R48": (-86.77116604836, 30.904886857539164),
-    "S166": (-86.77425449127422, 30.86108750576095),
-    "B38": (-86.77765608894384, 30.802765248650804),
-    "B39": (-86.78248567771254, 30.798517943896297),
-    "B40": (-86.78567608843392, 30.795032094088036),
-    "B42": (-86.78400513069236, 30.78914881752932),
-    "B41": (-86.78938201422862, 30.790248844482914),
-    "B43": (-86.79265499474482, 30.78370850337931),
-    "R87": (-86.70457540742107, 30.84807599639457),
-    "R89": (-86.70678943553341, 30.847657314540843),
-    "R88": (-86.71217831770365, 30.8501107339041),
-    "R97": (-86.71202367598917, 30.855013214316884),
-    "R96": (-86.7158808124274, 30.85531433248415),
-    "R98": (-86.71273304617145, 30.859240004582826),
-    "R104": (-86.69697263317276, 30.87044283089388),
-    "R106": (-86.69317729498229, 30.87610869707825),
-    "R107": (-86.68265100102565, 30.88427007581749),
-    "R121": (-86.67325724850377, 30.8921406541245),
-    "R122": (-86.66466736205402, 30.893229640517763),
-    "R120": (-86.6741733357704, 30.894930149786898),
-    "R124": (-86.66442485769576, 30.908715785798293),
-    "R115": (-86.70443426713528, 30.908005335371385),
-    "R116": (-86.70250313986553, 30.9117284815617),
-    "R117": (-86.7057295568959, 30.913682437761924),
-    "R118": (-86.70174129237198, 30.91972760503075),
-    "R137": (-86.68616432406937, 30.917549349015953),
-    "R138": (-86.6899415089826, 30.91895840817304),
-    "R139": (-86.6889960282144, 30.92328573492175),
-    "R143": (-86.6947243625676, 30.930375372028024),
-    "R144": (-86.69222743659667, 30.930744260438644),
-    "R146": (-86.70038073770013, 30.931879047812398),
-    "R169": (-86.70562911682407, 30.936605473974826),
-    "R150": (-86.71581869021107, 30.937198003111),
-    "R151": (-86.71153232804333, 30.936384763958355),
-    "R147": (-86.70848365453142, 30.934164612849216),
-    "R141": (-86.67342203016443, 30.92001359360289),
-    "R140": (-86.67565531498529, 30.920419138381874),
-    "R142": (-86.66661643516963, 30.921178077262454),
-    "R128": (-86.6614502583484, 30.91185611942228),
-    "R127": (-86.6569533619332, 30.908606386769556),
-    "H30": (-86.6477764297096, 30.908414085327525),
-    "H32": (-86.6505367455771, 30.900154424634277),
-    "H33": (-86.65508569608343, 30.900140463881456),
-    "H34": (-86.65764170316123, 30.89347465893137),
-    "H35": (-86.65401464260225, 30.89556824482324),
-    "H39": (-86.64837772990646, 30.886335714815726),
-    "H41": (-86.6502126003084, 30.87762397979941),
-    "H38": (-86.65643655746554, 30.882151237637313),
-    "H43": (-86.66251291119885, 30.86494843452675),
-    "H52": (-86.63566189625702, 30.860637935111754),
-    "H50": (-86.63690255, 30.86482),
-    "H49": (-86.63752103642892, 30.86868837303959),
-    "H48": (-86.63070492213006, 30.8708148063768),
-    "H54": (-86.62584765736715, 30.858282786440473),
-    "R93": (-86.69029480184899, 30.85792829814804),
-    "R94": (-86.68227609302225, 30.860442978430918),
-    "R95": (-86.68386435056202, 30.86345421257675),
-    "S140": (-86.79105406230342, 30.91509131300994),
-    "S132": (-86.78875471627818, 30.938581831788827),
-    "R23": (-86.78030188830441, 30.94685791069219),
-    "R24": (-86.77733123278924, 30.944819597421134),
-    "R28": (-86.77749057703546, 30.9261248370301),
-    "R25A": (-86.77243202524375, 30.941728325938552),
-    "F60": (-86.79358148541803, 30.806646083061352),
-    "Penny Creek Road": (-86.76918573776577, 30.771021589865157),
-    "Red Oak Court": (-86.56393768065898, 30.45354613833891),
-    "Water Oak Court": (-86.56406681636255, 30.454893819725502),
-    "Chapman Oak Court": (-86.56554115353144, 30.45412590456742),
-    "Bluf Oak Court": (-86.5653599, 30.45385465),
-    "Shumard Oak Court": (-86.56596189795071, 30.45501773112076),
-    "Pin Oak Court": (-86.56611055, 30.455316799999995),
-    "Turkey Oak Court": (-86.56438418839225, 30.456666075561962),
-    "Laurel Oak Court": (-86.56594568005008, 30.456917237487428),
-    "Lone Oak Court": (-86.56608410000001, 30.456646250000002),
-    "Champions Court": (-86.43932735238182, 30.39827522474046),
-    "Champions court": (-86.43863395651492, 30.396711679441992),
-    "Biscaynne Bay": (-86.41985445169463, 30.38688618420622),
-    "Tahitian Way": (-86.42063235208892, 30.387000756870336),
-    "grand Key East Loop": (-86.41978917207192, 30.38711594419544),
-    "Kono Way": (-86.41908454732855, 30.387259670566785),
-    "Emerald Coast Dragway": (-86.7879752, 30.687156700000003),
-    "Alaqua Creek Cove": (-86.4627442721817, 30.52439959714329),
-    "Big Creek Cove": (-86.46435608279405, 30.52743779175671),
-    "Birdsong Creek Circle": (-86.45456067448501, 30.523140532144474),
-    "Canopy Creek Cove": (-86.45605187426835, 30.52236685309452),
-    "Echo Creek Cove": (-86.46173834938129, 30.522944195857427),
-    "Fox Head Brach Trail": (-86.45797798690329, 30.52019668049216),
-    "Gum Creek Cove": (-86.46337907644433, 30.526221031343933),
-    "Harvest Creek Trail": (-86.45881095499348, 30.52288610741641),
-    "Narrow Creek Cove": (-86.46345678382896, 30.52515453195002),
-    "Rushing River Way": (-86.45642820985294, 30.519111079741485),
-    "Sterling River Way": (-86.45558806148377, 30.522436750692552),
-    "Stony Creek Cove": (-86.46011584238641, 30.522281122566884),
-    "Sugarcane Creek Run": (-86.45933413877795, 30.52359780718077),
-    "Town Center Boulevard": (-86.4184595732654, 30.522446718168123),
-    "Falcon Trail": (-86.5023222341635, 30.53273784499186),
-    "Zephyr Drive": (-86.3988985744349, 30.381456554422705),
-    "Marquette Alternate": (-86.50571236145457, 30.519700363048113),
-    "Berkshireplace Street": (-86.40011820935729, 30.390937735385936),
-    "Hayley Marie Court": (-86.64298919999999, 30.437489550000002),
-    "Sago Palm Way": (-86.59822299999999, 30.774124999999998),
-    "Paradise Palm Circle": (-86.59976201470553, 30.77508477623181),
-    "Pendo Place": (-86.5998692, 30.775656849999997),
-    "Sabal Drive": (-86.59896789999999, 30.776398399999998),
-    "Windmill Way": (-86.5997367, 30.77477845),
-    "Peoria Boulevard": (-86.5831839300099, 30.706318076621088),
-    "Anniston Court": (-86.611954, 30.422464849999997),
-    "Kailyn Court": (-86.47763560019186, 30.509684686301124),
-    "Arrowhead Way": (-86.49409199100195, 30.529451737808206),
-    "Big Oaks Lane": (-86.50049947014807, 30.52707339905425),
-    "Key Lime Place": (-86.57741320926401, 30.71002696340157),
-    "Bel Aire Drive": (-86.60949878961408, 30.71794986641701),
-    "Petal Place": (-86.62186238093648, 30.73460350737428),
-    "Soundview Court": (-86.64736249984763, 30.407937267549553),
-    "Soundside Cove": (-86.65094050601212, 30.40834045021526),
-    "Mitchell Road": (-86.69999939855651, 30.416110454829134),
-    "Lovejoy Road": (-86.67419006210109, 30.42453310369632),
-    "Bentley Circle": (-86.66894056576913, 30.430144310727577),
-    "Mc Carthy Avenue": (-86.49456545572096, 30.48930591587997),
-    "Biltmore Way": (-86.4643110702882, 30.528672981159573),
-    "Maggie Valley Cove": (-86.46467707132157, 30.52925710982426),
-    "Grove Park Drive": (-86.46428437396494, 30.531014031188487),
-    "Chimney Rock Circle": (-86.46290793507812, 30.532187366861724),
-    "Black Bear Circle": (-86.45943695074031, 30.532845649919476),
-    "Marvis Way": (-86.4082933815763, 30.474061278223893),
-    "Town Lane": (-86.64929196670148, 30.41039696816567),
-    "2nd Southwest Avenue": (-86.61420824039517, 30.404764882163793),
-    "Derby Downs Circle": (-86.43927922637232, 30.51820472785448),
-    "Front Porch Circle": (-86.46097139750347, 30.529470103378404),
-    "Tadpole Avenue": (-86.47369699799154, 30.50036206973311),
-    "Fallin Branch Court": (-86.47529381105709, 30.49815098248852),
-    "Woods Drive": (-86.47555971202719, 30.49791194273654),
-    "Flowering Path": (-86.47591012006005, 30.49722303233413),
-    "Heritage Plantation Boulevard": (-86.53053009608743, 30.870359519869577),
-    "Arcadia Bluffs Avenue": (-86.53141707139649, 30.87055200274572),
-    "Brandon Dunes Lane": (-86.53041946211171, 30.86752812379586),
-    "Finnegan Way": (-86.47050524876039, 30.4944198136331),
-    "Patfore Lane": (-86.46976636900584, 30.494713450209087),
-    "Bass Angler Lane": (-86.54348806230178, 30.82558241926149),
-    "Okaloosa County Rest Area Westbound": (-86.50805067557907, 30.72805830400571),
-    "Okaloosa County Rest Area Eastbound": (-86.50681047930527, 30.725968037217037),
-    "Majestic Oaks Vineyard Boulevard": (-86.53625838125335, 30.834691955153744),
-    "Pinot Way": (-86.5368157088617, 30.835361888240993),
-    "Lielmanis Avenue": (-86.68131558250252, 30.418774248116613),
-    "Farmer Street": (-86.5529186029975, 30.79141369027285),
-    "Champaign Street": (-86.70211602383574, 30.40986133706293),
-    "Foy Shaw Parkway": (-86.52198795000001, 30.754905199999996),
-    "Blue Bell Lane": (-86.5033913999718, 30.790959361792215),
-    "Begonia Avenue": (-86.50432817429795, 30.79121090004206),
-    "Marigold Loop": (-86.50264112875018, 30.793017640252557),
-    "Periwinkle Lane": (-86.504079110089, 30.7932144568697),
-    "Wayne Rogers Road": (-86.51049164158658, 30.792138953540174),
-    "Seven Ducks Lanes": (-86.5317572, 30.7967872),
-    "Edelstein Drive": (-86.53130669999999, 30.797961100000002),
-    "Tulip Tree Way": (-86.47530473726215, 30.495200119391626),
-    "Longsword Drive": (-86.55365797350157, 30.737483050606297),
-    "Mossy Cove Court": (-86.44320812817476, 30.49399207802982),
-    "Skipjack Cove": (-86.4414991028839, 30.494367207081126),
-    "Observatory Access Road": (-86.48030566768125, 30.541616148172753),
-    "Deer Moss Loop": (-86.42292409668268, 30.512779644448823),
-    "Elderflower Drive": (-86.42050430075602, 30.51341797846574),
-    "Cassia Cove": (-86.41951496365307, 30.51334044320748),
-    "Coriander Lane": (-86.42086629430374, 30.513785854943688),
-    "Clarysage Lane": (-86.42109369671206, 30.513634402963504),
-    "Angelica Place": (-86.42198369617564, 30.513372534513138),
-    "Verbena Place": (-86.42007277836383, 30.514193921873034),
-    "Oak Drive": (-86.55458788716133, 30.45322643269395),
-    "Twisted Oak Drive": (-86.55288196507306, 30.450684133118482),
-    "River Oak Drive": (-86.55347957931872, 30.451096406056212),
-    "Maple Drive": (-86.55479445607791, 30.45331791073696),
-    "Splash Drive": (-86.55444556204762, 30.452617027904232),
-    "Mangrove Drive": (-86.55981706058871, 30.451803663072585),
-    "Cortese Road": (-86.4989510949127, 30.47914342609038),
-    "Chapelwood Drive": (-86.5233930360031, 30.819196238670834),
-    "Trestle Street": (-86.56024222932332, 30.810715934276434),
-    "Claybourne Cove": (-86.56542555, 30.8084578),
-    "Wild Hare Lane": (-86.53137232714339, 30.747287576740984),
-    "Rabbit Run": (-86.53186007860226, 30.748169660664797),
-    "Blackfoot Trail": (-86.61087375331002, 30.76794678519074),
-    "Onida Trail": (-86.6118107136838, 30.77030396169527),
-    "Huron Trail": (-86.60528916089618, 30.768658809783165),
-    "Plover Drive": (-86.53701363359804, 30.711011924395024),
-    "Partidge Drive": (-86.53791945050128, 30.71359735421212),
-    "Raven Lane": (-86.538422, 30.7133413),
-    "Kingbird Lane": (-86.54069086864357, 30.7360074747512),
-    "Merlin Court": (-86.53588899839818, 30.73307098925808),
-    "Chickadee Street": (-86.53854578674948, 30.734116593158184),
-    "Merganser Way": (-86.53774797381243, 30.73055915971399),
-    "Gadwell Street": (-86.5387793704848, 30.733170986937253),
-    "Teal Street": (-86.53971532768233, 30.73132957041226),
-    "Widgen Way": (-86.53875520839773, 30.730915631777613),
-    "Brims Road": (-86.67935180079105, 30.425299558162056),
-    "Wyatt Way": (-86.6269289177598, 30.463874964739762),
-    "Vaccari Court": (-86.52792985, 30.8385741),
-    "Henderson Beach Nature Trail": (-86.4498594000186, 30.38565744203877),
-    "South Street": (-86.42506966838255, 30.390361947436293),
-    "Pier Road": (-86.59294025, 30.395555549999997),
-    "Colleen Cove": (-86.42616854447093, 30.509105846213426),
-    "Gianna Way": (-86.42582393125585, 30.508342304467696),
-    "Spanish Trail": (-86.56197989756024, 30.77464676759704),
-    "Wind Trace Road": (-86.57013939652886, 30.797703389735688),
-    "Squall Lane": (-86.56783974999999, 30.79819265),
-    "Chinook Drive": (-86.57003999674973, 30.79756668003798),
-    "Williwaw Court": (-86.5702173, 30.79734305),
-    "Walter Martin Road Northeast": (-86.61085838474298, 30.41638173502773),
-    "Hampton Drive": (-86.54811772573089, 30.762678436465805),
-    "Judge Maney Way": (-86.61906621126401, 30.46611365955265),
-    "Michigan Avenue": (-86.49526304212354, 30.498964152119523),
-    "Ellison Way": (-86.60988334985869, 30.44570695909657),
-    "Cummings Drive": (-86.61029789950052, 30.445352474478682),
-    "Brooker Street": (-86.57166787586766, 30.756282871671775),
-    "Mapoles Street": (-86.57670143832998, 30.766101345662435),
-    "Premier Drive": (-86.56872326308188, 30.76138458894644),
-    "Strike Eagle Drive": (-86.58039242580348, 30.721698664603064),
-    "Bur Oak Circle": (-86.60007922810698, 30.715211588085516),
-    "Broadsword Lane": (-86.54844833695255, 30.737312916433137),
-    "Patriot Lane": (-86.55686145264004, 30.742230200052962),
-    "Machinery Circle": (-86.746785929833, 30.69843685014676),
-    "Woodpecker Lane": (-86.75476701827019, 30.682870598937374),
-    "Ashton Circle": (-86.6015948309668, 30.709089701986084),
-    "Kls Ranch Road": (-86.43045659322907, 30.773211445204474),
-    "Avery Drive": (-86.5068130145086, 30.52844804679248),
-    "Sunset Beach Place": (-86.43294431766358, 30.469705842846064),
-    "Beaver Run Road": (-86.47708295000001, 30.502979600000003),
-    "Palmetto Street": (-86.50735238427393, 30.39632226465871),
-    "Dolphin St. Beach Access Path": (-86.41609996139384, 30.382797771036337),
-    "Raihope Drive": (-86.47765392574584, 30.497947390815554),
-    "Belcourt Drive": (-86.45374755, 30.405420550000002),
-    "Filly Lane": (-86.44055856390882, 30.39335597273817),
-    "Turnberry Harbour Drive": (-86.42606380000001, 30.39598085),
-    "Moonlit Way": (-86.40652719705861, 30.396211388235347),
-    "Lantern Lane": (-86.40614086576437, 30.396836544455528),
-    "Walk Along way": (-86.56245551567508, 30.80972417325636),
-    "Walk along way": (-86.56270306793175, 30.809699476589433),
-    "Pomegranate Court": (-86.6275141, 30.46285945),
-    "Chimera Lane": (-86.62636115000001, 30.4656519),
-    "Lukes Way": (-86.64763755, 30.4490594),
-    "Kenzie Lane": (-86.6465561, 30.442657600000004),
-    "Joyner Drive": (-86.65310480209244, 30.44559470968384),
-    "Patriots' Trail": (-86.60310083977886, 30.416717560733826),
-    "Methodist Avenue Southeast": (-86.60872657111446, 30.406079901759295),
-    "Ridgon Court Northwest": (-86.62602013730832, 30.42787991273791),
-    "Expedition Trail": (-86.5945000002517, 30.394459150032155),
-    "Little Gem Court": (-86.4752572, 30.4947024),
-    "Ella Lane": (-86.44280300134284, 30.491869565957057),
-    "Mill Creek Drive": (-86.67494396237487, 30.775077288792012),
-    "Blackberry Circle": (-86.70463833893746, 30.740111951665508),
-    "Cleo Lane": (-86.60259780000001, 30.7667288),
-    "Cassidy Lane": (-86.56270701868056, 30.716424371874933),
-    "Scooter Cove": (-86.5634941252145, 30.715601174709956),
-    "Pintail Way": (-86.53884381363753, 30.73444456458909),
-    "Moorhen Way": (-86.53870497979975, 30.73012663746569),
-    "Dottie Street": (-86.66710320000001, 30.7651629),
-    "Lena Street": (-86.66473407278737, 30.76664651386978),
-    "Kais Street": (-86.66328718361721, 30.76453565558041),
-    "Timberland Ridge Drive": (-86.50395558409038, 30.83313830386522),
-    "Malus Court": (-86.50209189411005, 30.832426723947567),
-    "Export Road": (-86.56877009244582, 30.717314831849205),
-    "Pine Crest Heights": (-86.4747579, 30.510250900000003),
-    "Brannon Court": (-86.5598586940502, 30.770881262400803),
-    "Price Plantation Road": (-86.67366825047277, 30.787464412825926),
-    "Grandson's Way": (-86.67288923510186, 30.788122656412053),
-    "Arbor Lake Drive": (-86.57626148935505, 30.770677184081944),
-    "Trotter Way": (-86.65856278933259, 30.753543376505615),
-    "Lady Lane": (-86.65816985000001, 30.757916400000003),
-    "Dunford Place": (-86.65818851663326, 30.754643717891856),
-    "Candleglow Lane": (-86.66056047274908, 30.754443855327278),
-    "Long Needle Court": (-86.6770779, 30.788212700000003),
-    "Ruby Ridge": (-86.5738709747407, 30.821248072877168),
-    "Nanterre Cove": (-86.5951924, 30.8309062),
-    "Oakdale Court": (-86.55374775, 30.78000415),
-    "Pedestrian walkway": (-86.67118092183266, 30.767949452637975),
-    "Access Road": (-86.67145609336364, 30.767663866441172),
-    "Firefighter Lane": (-86.583789, 30.73367085),
-    "Sanford Place": (-86.57661655466049, 30.746065511443213),
-    "Virginia Court": (-86.57830578618898, 30.760471607925226),
-    "Capocci Court": (-86.53987190000001, 30.728347049999996),
-    "Muscovy Court": (-86.53591700000001, 30.7283885),
-    "Limpkin Street": (-86.53815701169155, 30.72855549225868),
-    "Cedar Avenue East": (-86.5693385541489, 30.764063543562493),
-    "Soles Lane": (-86.5537923, 30.778894949999998),
-    "Peaches Lane": (-86.54372076756617, 30.81035921769395),
-    "Deer Moss Trail": (-86.42127557375161, 30.51513644595582),
-    "Portagul Cove": (-86.48593558012647, 30.48777698316184),
-    "Medfords Way": (-86.44681776402152, 30.809269267252994),
-    "Cazadores Street": (-86.60786935835722, 30.65833195080085),
-    "el Salvadore Way": (-86.61174483530677, 30.653466019359477),
-    "Skull Lane": (-86.61071164981675, 30.654862158646413),
-    "Lancero Loop": (-86.60758929351594, 30.653793992381534),
-    "Just Cause Loop": (-86.60508417656712, 30.650848729217163),
-    "Soto Cano Loop": (-86.60499830921584, 30.64750615105797),
-    "Cottage Court": (-86.46343920509197, 30.51222048015227),
-    "Raiders Trail": (-86.50864306640096, 30.521700699777746),
-    "Hornet Lane": (-86.50837857108078, 30.521741515086745),
-    "Doolittle Circle": (-86.50830284087799, 30.521948616706545),
-    "Chamomile Court": (-86.42371773893458, 30.51665800961784),
-    "Sweet Basil Lane": (-86.42290657582012, 30.517053477917685),
-    "Red Cedar Trail": (-86.43321358927048, 30.498578066904404),
-    "Family Track": (-86.46317683284565, 30.385805965539),
-    "Rookie Track": (-86.46303397435479, 30.38577772410909),
-    "Kiddie Karts": (-86.46236945638478, 30.385925854813166),
-    "The Wild Woody": (-86.46081523014047, 30.3862784199017),
-    "Slick Track": (-86.46082796026243, 30.38588823620219),
-    "Lemongrass Lane": (-86.4221538979592, 30.517874946813137),
-    "Sweetgrass Lane": (-86.42173719268126, 30.517383979331385),
-    "Caraway Drive": (-86.42289633553018, 30.51710627607011),
-    "Safflower Lane": (-86.42101067201126, 30.518231564435816),
-    "Abner Way": (-86.47000318053726, 30.519273654654942),
-    "Reindeer Road": (-86.43762490689721, 30.531572777112327),
-    "Yearling Court": (-86.43834422445659, 30.53346972052428),
-    "Red Deer Run": (-86.43742959314311, 30.533034913374006),
-    "Gazelle Court": (-86.4375148606502, 30.53226315739729),
-    "Marsh Deer Run": (-86.43663856908532, 30.531923398322544),
-    "Caribou Court": (-86.43681178401945, 30.53075251519537),
-    "Mule Deer Run": (-86.43645865644228, 30.529986119432703),
-    "Patriots Rdg Drive": (-86.55025905948789, 30.708377746235172),
-    "Honor Guard Way": (-86.55055351180575, 30.709510414167255),
-    "Reveille Way": (-86.55002495, 30.70951685),
-    "Alley Lane": (-86.46934294856466, 30.518440944496298),
-    "Southcrest Drive": (-86.56700754541367, 30.723414990894245),
-    "Rochelle Lane": (-86.45563937339595, 30.81795082621414),
-    "Luke Lane": (-86.51693265802004, 30.874498853894064),
-    "Jackson Red Ground Trail": (-86.76953080735946, 30.856646877481104),
-    "Wiregrass Trail": (-86.71858581605167, 30.91622269073322),
-    "Southwest Crestview Bypass": (-86.60183523563461, 30.73210361696669),
-    "Navarre Parkway": (-86.80550675038957, 30.40967917571339),
-    "Ivy Louise Lane": (-86.46362902932674, 30.509088115031854),
-    "Hudson Boyd Court": (-86.4639837548759, 30.509476759483167),
-    "Addie Drive": (-86.4337272644092, 30.481712272652143),
-    "Valor Walk": (-86.55401103097265, 30.709022592157027),
-    "P J Adams Parkway": (-86.59352314943119, 30.711993615851195),
-    "Fallen Heroes Way": (-86.56908574327151, 30.733205969431506),
-    "Driveway": (-86.6046076242487, 30.464326815446533),
-    "McLaren Circle": (-86.64586799289489, 30.455608666609862),
-    "Chisk Road": (-86.48398276236442, 30.47746614830033),
-    "Crestlake drive": (-86.56029850038797, 30.807938431599307),
-    "Prominence lane": (-86.56098464232244, 30.80660271488887),
-    "Rocky Bayou Trail": (-86.42347478830318, 30.49898364770068),
-    "Sand Pine Trail": (-86.42546636397158, 30.494535166076336),
-    "Mattie Kelley Visual Arts Gallery": (-86.4721111,30.5373342),
-    "Jr. Walton Pond": (-86.4709963,30.6945083),
-    "Pearl Creek": (-86.5593322,30.6874883),
-    "Ramada Plaza": (-86.58881,30.3944782),
-    "Dockside Watersports": (-86.5022005,30.3927614),
-    "ZPU23-4": (-86.6814889,30.4203386),
-    "Red Horse Statue": (-86.6765819,30.4236964),
-    "823d Bulldozer": (-86.675754,30.4236681),
-    "Shoreline Theater": (-86.5943243,30.3941713),
-    "Pinguin Preserve": (-86.5939225,30.3940103),
-    "Tortoise Hideaway": (-86.5945759,30.3945098),
-    "The Fishin’ Hole": (-86.5943401,30.3939888),
-    "Bird & Reptile Sanctuary": (-86.5944264,30.3941894),
-    "Shark Moat": (-86.5940943,30.3940053),
-    "Fort Gator": (-86.5946443,30.3945319),
-    "Otter Den": (-86.5941858,30.3942208),
-    "The Bayou": (-86.5945626,30.3946838),
-    "Tide Pool": (-86.5944642,30.3940485),
-    "the track recreation center": (-86.4634112,30.3856486),
-    "Grater RV Hideaway Cove": (-86.7569197,30.4131753),
-    "Lake Clyde": (-86.5811232,30.4358136),
-    "Martin Lakes": (-86.5885643,30.7590772),
-    "Metts Bluff": (-86.7277338,30.6682472),
-    "Rattlesnake Bluff": (-86.6435653,30.6849132),
-    "Tucker Bluff": (-86.583564,30.8690737),
-    "Lake Vivian": (-86.5757433,30.4341869),
-    "Wilkinson Bluff": (-86.6743992,30.6885242),
-    "Yellow Bluff": (-86.4207823,30.8271304),
-    "Boggy Bayou": (-86.4805053,30.492698),
-    "Cinco Bayou": (-86.6102307,30.4288102),
-    "Copeland Bay": (-86.4688392,30.8160196),
-    "Destin Harbor": (-86.5007835,30.3902005),
-    "Dons Bayou": (-86.6080085,30.4510319),
-    "East Bay Swamp": (-86.7535676,30.4438092),
-    "Garmier Bayou": (-86.5975941,30.4586327),
-    "Hand Cove": (-86.5885635,30.4551986),
-    "Joes Bayou": (-86.48995,30.4113111),
-    "Jones Bayou": (-86.4393931,30.4076998),
-    "McCloud Bay": (-86.4193934,30.8196306),
-    "Marler Bayou": (-86.5007835,30.4063112),
-    "Pennywinkle Bay": (-86.3968928,30.8149086),
-    "Rocky Bayou": (-86.4377264,30.5051974),
-    "Pirate Cove": (-86.6582874,30.3999218),
-    "Poquito Bayou": (-86.5766188,30.4538098),
-    "Shirk Bayou": (-86.4694859,30.4894336),
-    "Weekley Bayou": (-86.484672,30.4821427),
-    "Watson Bay": (-86.4402269,30.9810142),
-    "Ward Cove": (-86.4455044,30.4963088),
-    "Tyner Bay": (-86.4646721,30.9318492),
-    "Toms Bayou": (-86.4970791,30.5025869),
-    "Sunset Cove": (-86.4674193,30.4872496),
-    "Eglin Blue Spring": (-86.4518429,30.6460597),
-    "Princess Beach": (-86.5393626,30.3899317),
-    "Crab Island": (-86.5209859840899,30.395755008062256), 
-    "Mid Bay Bridge Toll Plaza":( -86.4156057673287,30.456815297870968),
-    "Coast Guard Station":( -86.52607517977414,30.391345171947215),
-    "Destin on the Gulf":( -86.49449234492674,30.383902979245455),
-    "Sea Glass Apartments":(-86.44504776683148,30.38925620279096 ),
-    "azure condos": (-86.60210010114103,30.395438368872057 ),
-    "Eglin Beach Park": (-86.5257739876467,30.388836510866735),
-    "McGuire": (-86.51189082448172,30.396056056469405 ),
-    "Blue Water Behavioral Health":(-86.42115010387094,30.487898175118293),
-    "Coyote Ugly Saloon": (-86.50984272686519,30.39458736745443),
-    "Big Kahuna":( -86.47200456285017,30.387768408781497),
-    "Destin Elementary School":(-86.49184144514672, 30.40140392148354),
-    "Dustin Elementary School":(-86.49184144514672, 30.40140392148354),
-    "Harry T":(-86.51245228303975,30.394144163573223),
-    "Crystal Sands":(-86.4178259850826,30.381498563800307),
-    "Mid Bay Bridge":( -86.41893095457297,30.42967356165132),
-    " Highway 20 ":(-86.40660992886313,30.476287503522773),
-    " Eglin's East Gate":( -86.49425266202644,30.48946599897436),
-    " Eglin's West Gate":(-86.55459907466198,30.465607080539147),
-    " Beasley Park": (-86.58400046279559,30.393902078101902),
-    " emerald grand": ( -86.51197665672073,30.39486377581226),
-    " Duke Field": ( -86.530612110942,30.648930241887317),
-    " Henderson Park Inn": (-86.43229089550299,30.382769036500626),
-    " Oceans Church":(-86.48028450516664,30.387454640299282),
-    " Island Princess":( -86.61116652446158,30.39645973185496),
-    "Henderson Beach State Park": (-86.44331714661716,30.384248636439548),
-    " Destin Bridge":(-86.51803761808124,30.393625586182093)
-}
-
+# keywords.py
+
+clarifications = {
+    "10-0 ": "10-0(Use Caution)",
+    "10-1 ": "10-1(Poor Reception)",
+    "10-2 ": "10-2(Good Reception)",
+    "10-3 ": "10-3(Stop Transmitting)",
+    "10-4 ": "10-4(Acknowledgement)",
+    "10-4,": "10-4(Acknowledgement),",
+    "10-4.": "10-4(Acknowledgement).",
+    "Ten four": "Ten four(Acknowledgement)",
+    "10-5 ": "10-5(Relay to ____)",
+    "10-6 ": "10-6(Busy)",
+    " 10-6.": "10-6(Busy)",
+    "10-7 ": "10-7(Out of Service)",
+    "10-7.": "10-7(Out of Service).",
+    "10-8 ": "10-8(In Service)",
+    "10-8. ": "10-8(In Service). ",
+    "10-8,": "10-8(In Service),",
+    "10-8.": "10-8(In Service).",
+    "ten-eight ": "ten-eight(In Service)",
+    "10-9 ": "10-9(Repeat)",
+    "10-10": "10-10(temporarily out of Service*)",
+    "10-11": "10-11(Talking Too Rapidly*)",
+    "10-12": "10-12(Visitor Present*)",
+    "10-13": "10-13(Weather/Road Report)",
+    "10-14": "10-14(Escort)",
+    "10-15": "10-15(Prisoner in Custody)",
+    "10-16": "10-16(Pick up/Transport Prisoner*)",
+    "10-17": "10-17(Investigation*)",
+    "10-18": "10-18(Respond w/Lights & Siren*)",
+    "10-18X": "10-18X(do not use Lights & Siren*)",
+    "10-19": "10-19(Return to Station)",
+    "10-20": "10-20(Location)",
+    "10-21": "10-21(Call Station By Telephone )",
+    "10-22": "10-22(Disregard)",
+    "10-23": "10-23(Stand-by*)",
+    "10-24": "10-24(Trouble, Send Help!*)",
+    "10-25": "10-25(Make Contact*)",
+    "10-26": "10-26(Message Received*)",
+    " 26.": " 26(Message Received*).",
+    "10-27": "10-27(Driver's License Information)",
+    " 27 ": " 27(Driver's License Information) ",
+    "10-28": "10-28(Vehicle Registration Information)",
+    "10-29": "10-29(Check for Wants/Warrants)",
+    "10-30": "10-30(Unnecessary Use of Radio)",
+    "10-31": "10-31(In Pursuit*)",
+    "10-32": "10-32(Intoxilizer Operator)",
+    "10-33": "10-33(Emergency Traffic)",
+    "1033": "1033(Emergency Traffic)",
+    "10-34": "10-34(Trouble At Jail)",
+    "10-35": "10-35(Confidential*)",
+    "10-36": "10-36(Current Time)",
+    "10-37": "10-37(Dispatcher or Operator*)",
+    "10-38": "10-38(Set Up Roadblock*)",
+    "10-39": "10-39(Message Delivered*)",
+    "10-40": "10-40(Silent Run-No Lights or Siren)",
+    "1040": "1040(Silent Run-No Lights or Siren)",
+    "10-41": "10-41(In Possession of_________*)",
+    "10-42": "10-42(Home*)",
+    "10-43": "10-43(Traffic for_________*)",
+    "10-44": "10-44(Pick up Paperwork*)",
+    "10-45": "10-45(Call by Telephone*)",
+    "10-46": "10-46(Urgent*)",
+    "10-47": "10-47(Radio Repair Needed*)",
+    "10-48": "10-48(End of Message*)",
+    "10-49": "10-49(Serving Warrant*)",
+    " 49 ": " 49(Serving Warrant*)",
+    " 49,": " 49(Serving Warrant*)",
+    " 49.": " 49(Serving Warrant*)",
+    "10-50": "10-50(Traffic Stop*)",
+    " 1050" : " 1050(Traffic Stop*) ",
+    "10-51": "10-51(En Route*)",
+    "10-52": "10-52(Estimated Time of Arrival*)",
+    "10-53": "10-53(Coming To Office)",
+    "10-54": "10-54(Negative*)",
+    "10-55": "10-55(Car Calling To Car*)",
+    "10-56": "10-56(Meet Me At____)",
+    "10-57": "10-57(Hit and Run)",
+    "10-58": "10-58(Direct Traffic)",
+    "10-59": "10-59(Convoy or Escort)",
+    "10-60": "10-60(Squad in Vicinity)",
+    "10-61": "10-61(Personnel in Area)",
+    "10-62": "10-62(Reply to Message)",
+    "10-63": "10-63(Prepare to Make Written Copy)",
+    "10-64": "10-64(Message for Local Delivery)",
+    "10-65": "10-65(Can You Copy?*)",
+    "10-66": "10-66(Message Cancellation)",
+    "1066": "1066(Message Cancellation)",
+    "10-67": "10-67(Serving*)",
+    "10-68": "10-68(Need Legal Advice*)",
+    "10-69": "10-69(Message Received)",
+    "10-70": "10-70(Send Tow Truck*)",
+    "10-71": "10-71(Send Ambulance*)",
+    "10-72": "10-72(Follow-up investigation**)",
+    "10-73": "10-73(Smoke Report)",
+    "10-74": "10-74(Negative)",
+    "10-75": "10-75(In Contact With)",
+    "10-76": "10-76(En Route)",
+    "10-77": "10-77(ETA)",
+    "10-78": "10-78(Need Assistance)",
+    "10-79": "10-79(Notify Coroner)",
+    "10-80": "10-80(Chase in Progress)",
+    "10-81": "10-81(Breathalyzer Report)",
+    "10-82": "10-82(Reserve Lodging)",
+    "10-83": "10-83(Work School Xing)",
+    "10-84": "10-84(If Meeting Advise ETA)",
+    "10-85": "10-85(Delayed Due to)",
+    "10-86": "10-86(Begin Shift*)",
+    "1086": "1086(Begin Shift*)",
+    "10-87": "10-87(End Shift*)",
+    "10-88": "10-88(Phone Number)",
+    "10-89": "10-89(Bomb Threat)",
+    "10-90": "10-90(Bank Alarm)",
+    "10-91": "10-91(Pick Up Subject)",
+    "10-92": "10-92(Improperly Parked Vehicle)",
+    "10-93": "10-93(Blockade)",
+    "10-94": "10-94(Drag Racing)",
+    "10-95": "10-95(Subject or Suspect Present*)",
+    "1095": "1095(Subject or Suspect Present*)",
+    "10-96": "10-96(Mental Subject)",
+    "10-97": "10-97(Arrived At Scene*)",
+    "10.97": "10.97(Arrived At Scene*)",
+    "1097": "1097(Arrived At Scene*)",
+    "10-98": "10-98(Completed Task*)",
+    "10 98.": "10 98(Completed Task*).",
+    " 1098 ": " 10-98(Completed Task*) ",
+    " 1098.": " 10-98(Completed Task*).",
+    "10-99": "10-99(Not Receiving Signal*)",
+    " FTA": " FTA(failure to appear)",
+    "FHP": "FHP(Florida Highway Patrol)",
+    " PX": " PX(Phone call)",
+    " FWC ": " FWC(Florida Fish and Wildlife Conservation Commission) ",
+    " CAD ": " CAD(Computer-Aided Dispatch) ",
+    " CAD,": " CAD(Computer-Aided Dispatch),",
+    " CAD.": " CAD(Computer-Aided Dispatch).",
+    " NVA ": " NVA(No Value Added-no actionable information) ",
+    " DAB ": " DAB(Death at scene aka Dead on arival) ",
+    " BOLO ": " BOLO(Be on the look out) ", 
+    " FIR ": " FIR(Field Interview Report) ",
+    "ETOH": "ETOH(Alchohol)",
+    " E2H ": " E2H(Alchohol, possible ETOH) ",
+    " MVA":" MVA(Motor Vehicle Accident)",
+    " EMS ": " EMS(Emergecy Medical Service) ",
+    " DC ": " DC(Disorderly Conduct) ",
+    " DAV ": " DAV(Disabled Abandoned Vehicle) ",
+    " PAV ": " PAV(Pedestrian Accident Victim) ",
+    " FPS ": " FPS(Federal Protective Service) ",
+    " DBS": " DBS(Dead Body Scene)",
+    " QP": " QP(Query Person)",
+}
+
+keyword_categories = {
+    "locations": [" cove ","cove,","10-20", "location", " at the ", "near", "intersection","North","South","West","Boulevard"," road ","east","west","street","island"," drive ","drive.","drive,","Drive.","Drive,","En Route","Avenue", "address", "place"],
+    "arrests": ["10-15", "arrest", "custody","Custody", "detained", "apprehend", "handcuff", "booked","attained"],
+    "overdoses": ["overdose", "narcan", "drug-related", " OD ", "fentanyl"],
+    "traffic_violations": ["speeding", "reckless driving", "DUI", "ran red light", "illegal turn", "traffic violation", "speed limit","reckless vehicle","Going into other lane","hit the curb"," junction violation "],
+    "traffic_stops": ["10-50", "traffic stop", "pulled over", "license and registration"],
+    "theft": ["burglary","burglar", "break-in", "intruder", "forced entry", "stolen", "theft","steal","took property"],
+    "destruction_of_property": ["vandalism", "graffiti", "property damage", "broken window", "destroyed", "damaged"],
+    "Noise Complaints": ["loud music","party", "construction noise", "barking dog", "car alarm", "shouting", "horn", "fireworks", "noise disturbance", "loud neighbors","noise complaint" ],
+    "suicides": ["suicide","self-harm","taking own life","kill myself","end my life","commit suicide","suicidal thoughts","suicidal ideation","attempt suicide"],
+    "domestic_violence": ["domestic violence", "domestic dispute", "family disturbance", "spousal abuse", "intimate partner violence", "domestic assault", "domestic battery", "disturbance family"],
+    "fraud": [ "fraud", "identity theft", "scam", "embezzlement", "forgery", "counterfeit", "ponzi scheme", 
+        "pyramid scheme", "phishing", "skimming", "money laundering", "wire fraud", "bank fraud", 
+        "securities fraud", "tax evasion", "fake check", "advance fee", "investment fraud", 
+        "medicare fraud", "medicaid fraud", "social security fraud", "welfare fraud", 
+        "telemarketing fraud", "charity fraud", "lottery scam", "romance scam", "tech support scam", 
+        "impersonation", "false pretenses", "confidence trick", "bait and switch", "shell company", 
+        "insider trading", "kickback", "bribery", "extortion", "blackmail", "racketeering", 
+        "identity fraud", "check kiting", "credit card skimming", "pump and dump", "boiler room"
+    ],
+    "trespassing": ["trespassing", "trespass", "unauthorized entry", "unlawful entry", "illegal entry", "no trespassing", "private property", "restricted area", "trespasser", "trespassed","Wanting her to leave","Wanting him to leave","Wanting them to leave"],
+    "car_crashes_or_damage": ["car crash", "accident", "collision", "vehicle impact", "fender bender", "hit and run", "rollover", "pile-up", "T-bone", "rear-end", "head-on", "sideswipe", "multi-vehicle", "car wreck","has damage","traffic crash"],
+    "business_alarms": ["business alarm", "store alarm", "commercial alarm", "security alarm", "silent alarm", "burglar alarm", "panic button", "hold-up alarm", "motion detector", "glass break sensor", "perimeter breach", "security breach", "alarm activation", "alarm response"],
+    "residential_alarms": ["residential alarm", "home alarm", "house alarm", "burglar alarm", "alarm system", "alarm activation", "alarm response", "alarm triggered", "motion sensor", "window sensor", "door sensor"],
+    "neighbor_altercations": ["altercation","neighbor dispute", "noise complaint", "property line dispute", "fence dispute", "parking dispute", "loud music", "barking dog", "trash dispute", "landscaping dispute", "nuisance complaint", "neighbor harassment", "threatening behavior", "civil dispute", "neighborhood disturbance"],
+    "serving_warrants": ["serving warrant", "warrant service", "arrest warrant", "search warrant", "bench warrant", "warrant execution", "warrant arrest", "warrant issued"],
+    "disabled_vehicles": ["disabled vehicle", "broken down car", "car trouble", "vehicle breakdown", "car won't start", "stranded motorist", "vehicle assistance", "tow truck needed", "vehicle malfunction", "mechanical failure"],
+    "place_change": ["location change","I'll be at","I'll be out at"],
+    "juvenile problem":["juvenile problem"],
+    "wellness_checks": ["wellness check", "welfare check", "safety check", "check on welfare", "check on wellbeing", "health and safety check", "concern for safety", "welfare concern", "safety concern","well-being"],
+    "disturbances": ["disturbance", "rowdy behavior", "unruly behavior", "disorderly conduct", "fight", "altercation", "brawl", "commotion", "uproar", "chaos", "disruption", "tumult", "fracas", "melee"],
+    "en route": ["En Route", "in route", "I'm on"], #this section should denote goint to or at a location "I'm on" has the issue of being figurative such as "I'm on the case" or "I'm on pursuit"
+    "follow up": ["follow up"],
+    "911 verification": ["911 verification","9-1-1 verification"],
+    "verification": ["verification"], #officers will say verification for licences and tags and just use verification
+    "suspicious_person": ["suspicious person", "acting suspicious", "strange behavior", "unusual activity", "prowler", "lurking", "suspicious individual"],
+    "Suspicious vehicle":["Suspicious vehicle"],
+    "alcohol_violation": ["open container", "public intoxication", "underage drinking", " DUI ", "drunk driving", "intoxicated", "alcohol possession", "alcohol consumption", "liquor law violation", "drinking in public","alcohol violation","alcohol"],
+    "racing":   [" racing "],
+    "medical_emergencies": ["medical emergency", "heart attack", "stroke", "seizure", "unresponsive", "CPR", "ambulance needed", "choking", "allergic reaction", "difficulty breathing", "injury", "bleeding", "fainting","wound", "diabetic emergency", "unconscious", "not breathing", "heart palpitations","cardiac","EMS(Emergecy Medical Service) on scene","Can we get EMS","physical trauma","EMS(Emergecy Medical Service) needed"],
+    "Boat crash": ["Boat crash"],
+    "drone": ["drone"]
+}
+
+street_data = {
+    "Mountain City Road": (-86.63842725261064, 31.000219510112917),
+    "Old Salt Road": (-86.48823956410172, 30.994007693087017),
+    " 374 ": (-86.68467733568764, 30.994590099510187),
+    "Middle Creek Road": (-86.72931095706558, 31.015238677926646),
+    "Blackwater Road": (-86.70307420877519, 31.011002008395568),
+    "Alice Chesser Spur": (-86.74762629252102, 30.9966572829094),
+    "Evergreen Circle": (-86.50000932949249, 30.3994219806613),
+    "Baggett Lane": (-86.52702301809208, 30.818400250719453),
+    "Highland Avenue": (-86.52897196550059, 30.75326438141426),
+    "Old Brown Road": (-86.64321383705374, 30.75827249696593),
+    "Grand Palms Boulevard": (-86.41006143219883, 30.38164763733865),
+    "Sunshine Drive": (-86.5501355526002, 30.784147082628994),
+    "Oaklake Cove": (-86.437783, 30.48783),
+    "Fairview Road": (-86.65273100452163, 30.443970534586967),
+    "Whitetail Circle": (-86.44407068780394, 30.492750201100694),
+    "East Danielle Court": (-86.78024500000001, 30.410969000000005),
+    "Goodwin Road": (-86.42999666120097, 30.78025723685351),
+    "Jericho Road": (-86.45926679756371, 30.75041487347033),
+    "Date Palm Circle": (-86.470809, 30.497871),
+    "Knollwood Lane": (-86.41628607916117, 30.492462618354335),
+    "Mason Cemetery Road": (-86.4541938, 30.71848265),
+    "Dock Road": (-86.49053733319633, 30.48184678018084),
+    "Hot Rod Lane": (-86.70059840525467, 30.786081146420237),
+    "Range Rd 253": (-86.77819846291067, 30.610328963349374),
+    "S130": (-86.78546003229937, 30.925401421308734),
+    "Fawn Lake Road": (-86.42280079030328, 30.777284580610743),
+    "Range Rd 230": (-86.58399188242956, 30.535601312092343),
+    "Alabama Street": (-86.56897434734068, 30.765647377970367),
+    "Range Rd 632": (-86.6155973909336, 30.513916327201716),
+    "Hurricane Lake Road": (-86.78675635216828, 30.890656750595607),
+    "Foxchase Way": (-86.61947950132434, 30.722513559588783),
+    "R53": (-86.7359020426434, 30.91388749761952),
+    "Range Rd 213": (-86.60517190629068, 30.604935761938872),
+    "Range Rd 234": (-86.599497, 30.474744700000002),
+    "R52": (-86.76272264010889, 30.918042075701486),
+    "Gibson Road": (-86.63547521091766, 30.44476391150621),
+    "Range Rd 236": (-86.69407234688192, 30.629012748785637),
+    "R54": (-86.73633437684657, 30.918228321865428),
+    "R123": (-86.66729348258743, 30.898158356370047),
+    "Range Rd 233": (-86.56502508620756, 30.528760837367884),
+    "Welannee Boulevard": (-86.5579178143563, 30.841115468129157),
+    "Physician's Drive": (-86.56903204348723, 30.733808724453883),
+    "Anderson Pond Camp": (-86.51366163700372, 30.562754150669722),
+    "Valparaiso Parkway": (-86.49468865625535, 30.510413574556146),
+    "Hurricane Lake North Entrance Road": (-86.75448967652251, 30.944699804764813),
+    "McWhorter Avenue": (-86.53591004175378, 30.646482249953674),
+    "Range Rd 235": (-86.59234713203058, 30.565394899490077),
+    "Range Rd 250": (-86.63753337085213, 30.507623558510105),
+    "Range Rd 211": (-86.79238252800972, 30.619989576216604),
+    "Range Rd 257": (-86.737314, 30.583815000000005),
+    "Helms Farm Road": (-86.52682099515427, 30.862285799930778),
+    "Range Rd 232": (-86.57542971133844, 30.563756260248535),
+    "R37": (-86.74837852938695, 30.916995712053875),
+    "R44": (-86.77121340191462, 30.913908695668958),
+    "Railroad Avenue East": (-86.56825683196381, 30.75803208703853),
+    "Mary Lane": (-86.60000485, 30.7687503),
+    "Coast Guard Access Road": (-86.52593241303533, 30.390559329733897),
+    "Meyer Street": (-86.55399279367015, 30.808695700820696),
+    "Durango Road": (-86.49982024635851, 30.387579495704976),
+    "Monique Court": (-86.49504900007497, 30.406493011727935),
+    "Lovegrass Lane": (-86.5544016594309, 30.711613411953326),
+    "Orange Blossom Place": (-86.784287, 30.7006665),
+    "Walker Circle East": (-86.54875240828909, 30.71771758533563),
+    "Ben Hogan Court": (-86.56187755419752, 30.4362691071411),
+    "Live Oak Avenue": (-86.49986087828742, 30.5007202246875),
+    "Beach Drive": (-86.45030300053175, 30.508990616340835),
+    "Marion Drive": (-86.44101529856222, 30.525408668193588),
+    "Davis Court": (-86.5481562406352, 30.447582584942513),
+    "Caymen Cove": (-86.41034691506502, 30.382776431977135),
+    "Pocahontas Avenue": (-86.61548949025394, 30.436351657940232),
+    "Cayenne Lane": (-86.58592560184861, 30.433938435588587),
+    "Danbury Court": (-86.42436677931497, 30.46442849908907),
+    "Driftwood Lane": (-86.49670119660082, 30.403958968496372),
+    "Gillis Drive": (-86.57226233556763, 30.781488921844744),
+    "B Cove": (-86.54792363446694, 30.445197582391877),
+    "Merchants Way": (-86.41646981912352, 30.487727873959148),
+    "Solar Street": (-86.7154472347602, 30.413006904541163),
+    "Four Wheel Drive": (-86.63103124208364, 30.826745726690977),
+    "Alysheba Drive": (-86.54864828888594, 30.729981099814456),
+    "Jackson Street": (-86.60719480732159, 30.444417076046847),
+    "Patriot Court": (-86.650653, 30.4604955),
+    "Brookwood Lane": (-86.47370685622575, 30.75305700510162),
+    "Laticia Drive": (-86.593369, 30.7167865),
+    "Dogwood Drive West": (-86.55864188456702, 30.818289737669133),
+    "Ivy McCormick Lane": (-86.51454935411799, 30.76059185065943),
+    "Pearl S Buck Court": (-86.42787128999737, 30.489681803647517),
+    "American Poets Drive": (-86.42903290599179, 30.490504187861156),
+    "East Ponderosa Road": (-86.63262560700875, 30.46600086246088),
+    "Eglin Parkway": (-86.52375948657111, 30.506310929846805),
+    "Hillcrest Road": (-86.53660274602593, 30.761424898372223),
+    "Chessher Court": (-86.55575032529778, 30.766649345972226),
+    "Lake Sue Drive": (-86.5205511080519, 30.750920234203594),
+    "Sloat Court Southeast": (-86.58882009999999, 30.4065288),
+    "Cobbs Point Road": (-86.48590141963328, 30.415191517348134),
+    "Pinewood Lane": (-86.54751890419921, 30.78431299373804),
+    "Roy Street": (-86.6317790229531, 30.44696745504324),
+    "Goldenrod Court": (-86.4672789459551, 30.521537541689803),
+    "Viola Drive": (-86.63639620000001, 30.44290145),
+    "Lois Court": (-86.61956486281069, 30.438514575786694),
+    "Oak Street Southeast": (-86.60017388926416, 30.406959947304813),
+    "Jewel's Lane": (-86.75994005391568, 30.69145170149561),
+    "Inez Street": (-86.6596485, 30.4271425),
+    "Vulpes Sanctuary Loop": (-86.6207642971631, 30.721072363180102),
+    "Gregory Avenue": (-86.62686656406704, 30.42167149206566),
+    "Strafford Street": (-86.6376623417007, 30.454107516265985),
+    "Crimson Heights Court": (-86.6450100786595, 30.447294560135123),
+    "Eastview Drive": (-86.5756100604452, 30.70361633731321),
+    "Hawks Run Road": (-86.57333668027802, 30.8791095506869),
+    "Parkwood Lane": (-86.41838271039765, 30.488651408200617),
+    "Windale Road": (-86.6729116580061, 30.41043736346356),
+    "Park Street": (-86.55267637729017, 30.746230224554083),
+    "Cheyenne Trace": (-86.60365637495902, 30.778565778342234),
+    "Harbor Place Southwest": (-86.63464900133168, 30.40928049104789),
+    "Kamela Court": (-86.559173, 30.770705),
+    "Barks Lane": (-86.51947012977269, 30.790827550945302),
+    "Pinedale Way": (-86.64750679397027, 30.428158636304655),
+    "Fetting Avenue Northwest": (-86.63659155821709, 30.44740943777855),
+    "Fox Valley Road": (-86.56028137766423, 30.438225294261084),
+    "Glenview Avenue": (-86.49082304139262, 30.504848333065464),
+    "Marsh Harbor Drive": (-86.74796235, 30.407675750000003),
+    "James Place": (-86.67372271035546, 30.410263350422277),
+    "Rum Still Circle": (-86.45884864266459, 30.525557641402553),
+    "Tiffot Court": (-86.54645060568123, 30.767890203378848),
+    "Ridge Drive": (-86.56537216033047, 30.77664503165663),
+    "Eastland Street": (-86.5479971427025, 30.746043990876725),
+    "Winged Foot Drive": (-86.43602613957748, 30.480256197471256),
+    "Mantero Way": (-86.39920223664319, 30.3841362812602),
+    "Bradley Drive": (-86.60201390669994, 30.430530494746282),
+    "Catmar Road": (-86.40412675178364, 30.47889700873282),
+    "Crescent Avenue": (-86.55000965837706, 30.770191480571537),
+    "Woodruff Avenue East": (-86.56846003799517, 30.759628462221077),
+    "Henderson Street": (-86.55555536730192, 30.750714852427592),
+    "Tokalon Court": (-86.62309094916849, 30.45255444901667),
+    "Bullock Boulevard": (-86.4683496779446, 30.512959672959298),
+    "Abbey Road": (-86.55402000000001, 30.7358295),
+    "Whitewater Lane": (-86.54622111516, 30.717906644754976),
+    "Preservation Path": (-86.67088016332126, 30.79659149362391),
+    "Brown Place": (-86.54793378394204, 30.715542737439492),
+    "Deana Lane": (-86.52749425540385, 30.943033729492356),
+    "Colchester Court": (-86.6344744996346, 30.43718751927563),
+    "Pinehurst Drive": (-86.55753511344102, 30.443401711975543),
+    "Lyons Place": (-86.71533108458902, 30.704705175661395),
+    "Golden Acres Circle": (-86.47809412734479, 30.813721336444186),
+    "Sam Snead Court": (-86.56219347170382, 30.435455421150074),
+    "Lovering Court": (-86.44236038386545, 30.494222699035237),
+    "Honey Cove Court Southwest": (-86.63562977269486, 30.407752401365514),
+    "Cemetery Road": (-86.65920967796237, 30.408817848430893),
+    "Walker Circle West": (-86.55110844860816, 30.717612674637014),
+    "Southside Drive": (-86.73716383071336, 30.71306985448602),
+    "Mormon Temple Road": (-86.68517466283127, 30.967674793479155),
+    "Memorial Trail": (-86.5474059, 30.458832100000002),
+    "Lin Drive": (-86.53943521096771, 30.459929947476947),
+    "Mixon Drive": (-86.65747923480596, 30.458975506708928),
+    "Tarlac Road": (-86.47074248403734, 30.767132705518822),
+    "Green Drive": (-86.76538153338547, 30.41312594419354),
+    "Hunt Club Street": (-86.66803968378093, 30.43103039931716),
+    "Trish Drive": (-86.58537461573715, 30.71574866788291),
+    "Pointed Leaf Lane": (-86.64376055679959, 30.460067925066163),
+    "Texas Street Northeast": (-86.60278578578105, 30.418533841178522),
+    "Sandpiper Cove Drive": (-86.48191704118729, 30.38639237855352),
+    "Pompano Street": (-86.41807423548335, 30.383494479566597),
+    "Glendale Avenue": (-86.5025454121204, 30.514344045427666),
+    "Chatman Road": (-86.51059213333508, 30.890747875542836),
+    "Tnt Lane": (-86.78437312816737, 30.701372581056),
+    "1st Avenue": (-86.56758642810202, 30.43541170392147),
+    "Haybarn Road": (-86.69792723262518, 30.72096253120161),
+    "Stonebridge Road": (-86.43520029372584, 30.391987999161085),
+    "East Sunset Boulevard": (-86.63306783451867, 30.432982683870918),
+    "Cruttenden Lane": (-86.4790704028254, 30.504557722905773),
+    "Twain Lane": (-86.5915155, 30.705488),
+    "Tully Street": (-86.70691950859879, 30.422748516568525),
+    "Dona Avenue": (-86.6293787365539, 30.436153277649932),
+    "Walnut Avenue": (-86.58251850598009, 30.455543708202114),
+    "Killarney Road": (-86.44571090735373, 30.51645033269789),
+    "North Sea Lane Northwest": (-86.6426025, 30.4147985),
+    "Okeechobee Cove": (-86.40260873817076, 30.393278538315272),
+    "Johnson Street": (-86.50715641254654, 30.525814440815026),
+    "Wedge Court": (-86.47876053964575, 30.405390634945046),
+    "Red Maple Way": (-86.46133432594777, 30.49289074950669),
+    "Fleetwood Drive": (-86.7547005, 30.413457999999995),
+    "Finkel Road": (-86.6804854566293, 30.926345362279164),
+    "Shire Lane": (-86.5695793889619, 30.8079903007034),
+    "Alexandra Place Southeast": (-86.59444647411648, 30.409828860744035),
+    "Stilling Circle": (-86.44406181682943, 30.400909324267417),
+    "Pine Ridge Trace": (-86.47996603440625, 30.406009116210893),
+    "Serenity Lane": (-86.53703840519952, 30.73856897671681),
+    "Gulf Breeze Court": (-86.50340287082254, 30.387355933889985),
+    "Brighton Cove": (-86.650563, 30.4582425),
+    "Powell Drive": (-86.48009562324114, 30.521231816981885),
+    "Sunset Beach Circle": (-86.43002247969605, 30.470136460849307),
+    "Sky Ranch Lane": (-86.66773181775021, 30.852552600568643),
+    "Elise Lane": (-86.48675350556495, 30.397810136271378),
+    "Haylee Lane": (-86.52773913478065, 30.80004895603158),
+    "East Timberlake Drive": (-86.74382189700094, 30.413648012781543),
+    "Forest Shores Drive": (-86.79576553045044, 30.409225509021276),
+    "Walker Lane": (-86.69112770922767, 30.767985849751955),
+    "White Blossom Lane": (-86.6428935, 30.4581725),
+    "Harlan Avenue": (-86.60690640502919, 30.447942967508496),
+    "Brittany Lane": (-86.59896505224933, 30.771164086074982),
+    "Emerald Pointe Drive": (-86.79078546941214, 30.40783562514733),
+    "North 7th Street": (-86.49598581205925, 30.47943915298788),
+    "Pahl Court": (-86.65896480002888, 30.460399984228793),
+    "Bessie Griffith Road": (-86.64016085165757, 30.750685308669144),
+    "Spencer Court": (-86.61272064604006, 30.438959842950016),
+    "Randal Blocker Boulevard": (-86.42448527633496, 30.79760888001178),
+    "Carol Rose Lane": (-86.48783422215607, 30.79941565494223),
+    "Florida Street": (-86.49682229061405, 30.52871037875745),
+    "Sailfish Drive": (-86.62205220050673, 30.399200112851734),
+    "Hands Cove Lane": (-86.58969808534967, 30.458046640387117),
+    "Falcon Way": (-86.40425102969836, 30.74899689325376),
+    "Sandhill Tower Road": (-86.66807505888332, 30.9697889909629),
+    "Slash Pine Court": (-86.65259793088426, 30.42963429531876),
+    "Napa Way": (-86.4166218485189, 30.461770611319032),
+    "Tranquility Drive": (-86.59063984726242, 30.78705275793032),
+    "Woodruff Avenue West": (-86.57249384559681, 30.756927260716505),
+    "North Street": (-86.67633483075701, 30.411104862976618),
+    "Cobb Avenue East": (-86.5636575750806, 30.75633542324411),
+    "Brett Street North": (-86.56909888536981, 30.760970562084637),
+    "Boatner Drive": (-86.55214677319853, 30.460976271710944),
+    "Emerald Court": (-86.7903335, 30.407524000000002),
+    "Bocage Lane": (-86.50322249926363, 30.385290499847287),
+    "West Pine Street": (-86.79515606982305, 30.414737455036363),
+    "Quail Lake Boulevard": (-86.46757825411092, 30.391694051601657),
+    "Baywood Court": (-86.4767374, 30.40897015),
+    "Nautilus Court": (-86.61858939489184, 30.39717182389033),
+    "Church Avenue Southeast": (-86.61124038859612, 30.40710041913369),
+    "Rue d'Etretat": (-86.50047041332307, 30.39753283767613),
+    "Seaway Street": (-86.60958224573012, 30.424654919783922),
+    "Cinderella Court": (-86.62022950064535, 30.454295962579714),
+    "County Line Road": (-86.38865698074076, 30.962556122000308),
+    "Freedom Self Storage Road": (-86.6678460485057, 30.43350231521993),
+    "Summit Drive": (-86.50275472585005, 30.396393775943167),
+    "Gloria Avenue": (-86.6247445063895, 30.454841001577265),
+    "Parsonage Lane": (-86.54606268449349, 30.807702815753387),
+    "Marshbrook Way": (-86.4290414295171, 30.39761591399613),
+    "Butler Circle": (-86.57929289166997, 30.76773034905677),
+    "McCarty Avenue": (-86.54681150036629, 30.774536976807315),
+    "Rue De Fecamp": (-86.50013050000001, 30.3971545),
+    "Schneider Drive": (-86.64475588973494, 30.460792512337353),
+    "Brett Street South": (-86.56437329578095, 30.75569166962438),
+    "Millie Way": (-86.72841515, 30.41082225),
+    "Casa Marina": (-86.73256, 30.410721000000002),
+    "Boyd Circle": (-86.4779050000637, 30.51218999194855),
+    "Jacob Drive": (-86.59034648118457, 30.794752074587088),
+    "Seminole Road": (-86.49760130944709, 30.488024675676467),
+    "Rue Des Tours": (-86.7800823, 30.414785600000002),
+    "2nd Avenue Southwest": (-86.61468627889926, 30.40693096555814),
+    "Bell Ridge Drive": (-86.58705200009125, 30.778766490720027),
+    "Dolphin Point Road": (-86.46184895017053, 30.487588806470438),
+    "Majestic Prince Court": (-86.55390104901579, 30.730077192748663),
+    "Adams Lane": (-86.74751804599948, 30.727896115648672),
+    "Coremo Drive": (-86.55901032801935, 30.745249701579837),
+    "Moonlight Lane": (-86.53086936160477, 30.832173905632928),
+    "O B Gatlin Road": (-86.40821419013783, 30.802530953774262),
+    "Luke Avenue": (-86.42244701508612, 30.3855317876033),
+    "Friendly Lane": (-86.56568092104817, 30.44403532357207),
+    "Driftwood Avenue Southwest": (-86.63331313986711, 30.409313522592473),
+    "East Juniper Avenue": (-86.57526262549467, 30.7650934787877),
+    "Nichols Road": (-86.76175023886765, 30.952981973547942),
+    "Prairie": (-86.58338937789104, 30.705788364422876),
+    "Denise Drive": (-86.61618669018416, 30.719287973388553),
+    "Saint Pierre Cove": (-86.41777126439352, 30.478270029063708),
+    "Sam O'Neal Road": (-86.64256590007734, 30.78010462635791),
+    "Viking Drive Northwest": (-86.64310087100249, 30.414285496589024),
+    "Auburn Road": (-86.61884811748233, 30.44676084625951),
+    "Gartman Road": (-86.5063188008549, 30.93834567330828),
+    "Mooney Road Northeast": (-86.60622878412188, 30.462316833211343),
+    "Pebble Beach Drive": (-86.55528568509938, 30.44417756495478),
+    "Trevor Court": (-86.5748601795218, 30.69954962367503),
+    "Cross Drive": (-86.56625218428512, 30.749431882052424),
+    "Morrisey Circle": (-86.64267542408103, 30.756853229156178),
+    "Montgomery Street": (-86.65291470085059, 30.416667152140427),
+    "Alder Avenue Southeast": (-86.60019433078226, 30.408606859221944),
+    "West Bowers Avenue": (-86.5669472077431, 30.75272977039022),
+    "Bone Creek Road": (-86.73135874248406, 30.738243622430417),
+    "Bethany Drive": (-86.53661644595012, 30.822072935083966),
+    "Virginia Avenue": (-86.49844852421217, 30.499977756341284),
+    "West Leisure Lane": (-86.74354206711425, 30.682198318361245),
+    "Wayne Avenue Northwest": (-86.64840877862773, 30.427309878878532),
+    "Aspen Drive": (-86.55982752707709, 30.45627683916526),
+    "Northview Lane": (-86.57370752359452, 30.701764065179013),
+    "Poincianna Street": (-86.48953876085287, 30.493157173967106),
+    "Kadima Circle": (-86.63648360857907, 30.441752198425142),
+    "Sandy Lane": (-86.53902902629811, 30.82374642530837),
+    "Short Street": (-86.62741548365986, 30.439696528123346),
+    "Canterbury Circle Northwest": (-86.64163959861365, 30.41659399553932),
+    "Deer Avenue": (-86.47879682484184, 30.525244995371715),
+    "Cracker Barrel Drive": (-86.57057351646066, 30.72410510171533),
+    "Sue Circle": (-86.45560888822124, 30.754553148079395),
+    "Cobb Avenue West": (-86.56811756850018, 30.75319341782683),
+    "Mesa Road": (-86.47229958074468, 30.407027468542726),
+    "Hugo Lane": (-86.56627022659818, 30.71841577849158),
+    "Polly Lane": (-86.50975993213066, 30.817373552991228),
+    "Barr Place": (-86.58581600084898, 30.77174995255748),
+    "Burleson Boulevard": (-86.52694737615055, 30.843680969895136),
+    "Aruba Way": (-86.4227094237116, 30.474854377507274),
+    "Dixie Street": (-86.57142419829377, 30.772056521786762),
+    "Stewart Street": (-86.60381713743342, 30.437768583380564),
+    "Sonny Barrow Road": (-86.62958817750001, 30.939308739196832),
+    "Sharon Avenue": (-86.54477441615062, 30.724479389971645),
+    "School Avenue": (-86.57504201857918, 30.75017932014278),
+    "Garden Grove Lane": (-86.48699403815658, 30.91700875103852),
+    "Tequesta Drive": (-86.40210649817473, 30.390533983118733),
+    "Reed Avenue East": (-86.56112260938663, 30.75276502618685),
+    "Yuchi Lane": (-86.48416348643538, 30.4774128412078),
+    "Corbin Court": (-86.46948627987716, 30.50637284352572),
+    "Alex Lane": (-86.67515868850938, 30.756173886922664),
+    "Clark Road": (-86.7055419131516, 30.41336709347815),
+    "Leslie Court": (-86.6276875, 30.4260405),
+    "Rainbird Rise Road": (-86.41323252914995, 30.823925124426655),
+    "Saltair Lane": (-86.74545585208202, 30.406909552419624),
+    "Winward Lane": (-86.56395617107499, 30.446864494897635),
+    "Osborne Drive Northeast": (-86.59015084783195, 30.417615521404617),
+    "Gulfstarr Drive": (-86.41173028071017, 30.38725216647603),
+    "L'Ombre Circle Northeast": (-86.612071076039, 30.45265584519767),
+    "8th Avenue": (-86.57394746214513, 30.443624602764956),
+    "Patio Road": (-86.6207078544098, 30.44740879103129),
+    "Woods Lane": (-86.74795897945161, 30.716089945205642),
+    "Old Ferry Road": (-86.58460949596248, 30.434687150670122),
+    "Hagen Court": (-86.42902181044991, 30.480817911929204),
+    "Stephen Avenue": (-86.78543602042495, 30.411625755893056),
+    "East Glen Avenue": (-86.49316941196238, 30.50533017523337),
+    "Sweetpea Avenue": (-86.39320418863177, 30.748562101773185),
+    "Date Palm Drive": (-86.47235384643028, 30.497373049046413),
+    "Cutter Lane": (-86.57385389528336, 30.44708351166363),
+    "A L Gilman Road": (-86.64455767246554, 30.739147364457565),
+    "Lenwood Jackson Road": (-86.64540252531204, 30.86291739469086),
+    "Southlake Court": (-86.43068503503314, 30.487105832249394),
+    "Lost Creek Drive": (-86.54198619812483, 30.72354043526392),
+    "Bay Street Northwest": (-86.66174820582773, 30.425789718132407),
+    "Green Oak Lane": (-86.46317098566603, 30.492762250932675),
+    "Gainer Avenue": (-86.64018849898115, 30.749847057575604),
+    "Chestnut Street": (-86.64229311880746, 30.752413394352757),
+    "Runnymeade Drive": (-86.558431705916, 30.741501947510724),
+    "Werk Lake Court": (-86.44029599999999, 30.5258835),
+    "Lansing Street": (-86.50778155611908, 30.517430899910263),
+    "Dates Avenue Northwest": (-86.65197344202768, 30.427144785461774),
+    "Caveman Road": (-86.56185113507512, 30.852213809817567),
+    "Normady Road": (-86.57565136569194, 30.796456939777944),
+    "Mountain Drive": (-86.49531656759893, 30.393722828184394),
+    "Cobia Street": (-86.41915680742439, 30.38401672712919),
+    "Nez Perce Trail": (-86.60728016762032, 30.77348576198627),
+    "Bender Lane": (-86.67521891781811, 30.70298779493253),
+    "Monahan Drive Northeast": (-86.60508900959482, 30.431373982758394),
+    "Mooney Road Northwest": (-86.61273802393912, 30.466419774673252),
+    "Casa Marina Street": (-86.7325415, 30.409398999999997),
+    "Emmie Circle": (-86.63477467479892, 30.792700960603145),
+    "Aunt Mary's Loop": (-86.55307387631221, 30.797531036019894),
+    "William Faulkner Drive": (-86.4299724214157, 30.49119850117824),
+    "Arapaho Trail": (-86.60766929562793, 30.76990891484842),
+    "Inverness Road": (-86.48896896894352, 30.476442035779854),
+    "Celeste Court": (-86.75449549999999, 30.412420000000004),
+    "Safe Haven": (-86.7310635, 30.410733499999996),
+    "Dorcas Road": (-86.39470577349158, 30.792580409391675),
+    "Okaloosa Foxpen Road": (-86.72010870189544, 30.73032948877351),
+    "Hiawatha Street": (-86.70741812810765, 30.69232603214687),
+    "Avenue de Fontaine Bleau": (-86.77995941780758, 30.41179908389588),
+    "Manchester Road": (-86.61023852632532, 30.441387445478302),
+    "Parsoni Loop": (-86.5772493931253, 30.70132219994126),
+    "Clearwater Avenue": (-86.50829367539598, 30.515948215151518),
+    "Reynolds Circle": (-86.78699945764369, 30.40985025842547),
+    "Creek Drive": (-86.59554011185803, 30.794425268939772),
+    "Emm Lou Lane": (-86.4843575012351, 30.399576027302672),
+    "Terri Cove": (-86.46206163358072, 30.502491975350477),
+    "Hartson Street": (-86.69767734564675, 30.412446940855073),
+    "Blue Heron View": (-86.4418925, 30.493719),
+    "Martyn Place Northwest": (-86.63167899442178, 30.427760499976937),
+    "Megan Lane": (-86.76360137807166, 30.774453764843496),
+    "Franklin Road": (-86.71873127649529, 30.972156965702354),
+    "Sea Gull Lane": (-86.48968866196257, 30.397671358549506),
+    "Pond Creek Road": (-86.42235763246488, 30.842652578092494),
+    "Skipper Avenue": (-86.60480234768706, 30.442430945690177),
+    "3rd Street": (-86.57813162507912, 30.441393300937065),
+    "Kel-Wen Circle": (-86.4174044506228, 30.38844435009823),
+    "Mississippi Avenue": (-86.49077645212417, 30.49366983942419),
+    "Deal Avenue Northwest": (-86.64504520262857, 30.415532952771112),
+    "Dorado Avenue": (-86.6142447651797, 30.397993509282507),
+    "Ginkgo Avenue": (-86.47116989137434, 30.53374096345723),
+    "Tilley Road": (-86.49402819546596, 30.833082748777358),
+    "Saint Andrews Cove North": (-86.425742, 30.479438999999996),
+    "Conyers Street": (-86.57553688566448, 30.74526049763294),
+    "Sequoia Drive": (-86.65412749999999, 30.438659),
+    "Blue Pine Lane": (-86.41237834296597, 30.488761414064967),
+    "Leah Miller Drive Northwest": (-86.63163211748639, 30.42246147079993),
+    "Woodland Street": (-86.53166328741273, 30.763176790898584),
+    "Titi Court": (-86.5748725052364, 30.4576427083075),
+    "Lagoon Drive": (-86.4910498806608, 30.387920592987697),
+    "Sandy Ridge Circle": (-86.76116325, 30.410755),
+    "Camellia Place": (-86.496365, 30.529275),
+    "Donald Ray Adams Road": (-86.767991, 30.717321),
+    "Silver Wood": (-86.6523945, 30.4413895),
+    "Winlake Court": (-86.76122647248063, 30.413458532648896),
+    "Spiller Way": (-86.63660300000001, 30.437444000000003),
+    "Southern Oaks Court": (-86.64416179807377, 30.44683144661944),
+    "Larkin Place": (-86.61254200356088, 30.423573259939136),
+    "Short Leaf Court": (-86.6592015, 30.428659),
+    "South Greenwood Cove": (-86.41195530843694, 30.47111864725028),
+    "Olympia Court": (-86.62435085035976, 30.451298787934142),
+    "East Pine Street": (-86.79012649999999, 30.4140815),
+    "Andalusia Street Northeast": (-86.6107946261196, 30.42290098948405),
+    "Cypress Street": (-86.66070458367074, 30.42606153700822),
+    "Saint Andrews Cove South": (-86.4254457900582, 30.477620952745244),
+    "Cherokee Nene": (-86.6050270430941, 30.787535735587202),
+    "West John Sims Parkway": (-86.4961723758089, 30.522924911668873),
+    "Gordon Street": (-86.57997258122602, 30.752235580937406),
+    "Shoal Creek Cove": (-86.5544546436269, 30.72151335763767),
+    "Wedgewood Lane Northeast": (-86.61051161505596, 30.46320042155299),
+    "Tupelo Avenue Southeast": (-86.60543522899962, 30.409245904076617),
+    "Moss Drive": (-86.58819483920237, 30.715403353982616),
+    "East Audrey Drive Northwest": (-86.64425826388518, 30.41977250637433),
+    "Blaylock Street": (-86.55522358167403, 30.766565326883402),
+    "Forest Breeze Court": (-86.60633200000001, 30.434798),
+    "Cooper Lane": (-86.76634347304147, 30.701353433788448),
+    "Adams Avenue": (-86.50034959019858, 30.5091668229239),
+    "Okahatchee Circle Southeast": (-86.59187167558308, 30.409728081694823),
+    "Chickasaw Way": (-86.45405891453925, 30.40122411531869),
+    "Bond Circle": (-86.45154492072116, 30.526977981848468),
+    "Cayson Avenue": (-86.59303435151776, 30.76371324513749),
+    "Red Horse Road": (-86.70000900568503, 30.427761464055347),
+    "22nd Street": (-86.46271839618161, 30.50779231627476),
+    "Jade Loop": (-86.45168166383544, 30.392041721002272),
+    "Sandalwood Drive Northwest": (-86.64213102540299, 30.414264000614416),
+    "Michael Avenue": (-86.78535750792484, 30.414552857557837),
+    "Bryant Bridge Cutoff Road": (-86.78034550236269, 30.709438577607678),
+    "Rockhill Cemetery Road": (-86.60197694684699, 30.981632472619246),
+    "Jenna Jessi Road": (-86.6277505885753, 30.44380790880713),
+    "Cedar Avenue North": (-86.47812562907461, 30.52008491662178),
+    "Paradise Road": (-86.46944789591188, 30.50777673026936),
+    "Woodcrest Ridge": (-86.63155430510155, 30.4608531159973),
+    "Laura Lane": (-86.41590011953792, 30.465987381418667),
+    "Faye Drive": (-86.75238371244802, 30.406110654916613),
+    "Dodson Road": (-86.71796220995725, 30.759303381434922),
+    "Tula Place Northwest": (-86.61827649865826, 30.42027806072785),
+    "Springdale Drive": (-86.4890368031973, 30.803165779821747),
+    "Jefferson Street": (-86.47010858354993, 30.527576277064743),
+    "Drone Street": (-86.52773419644953, 30.632613977807573),
+    "Pappa Lawrence Road": (-86.48729885209364, 30.911181796853462),
+    "Varazze Cay": (-86.40425105, 30.380726199999998),
+    "Monahan Court": (-86.61129376392982, 30.432286543104833),
+    "Meadow Lane": (-86.65696801757016, 30.457510751889448),
+    "Benarr Avenue Northwest": (-86.64506083770598, 30.42209885278236),
+    "Cathridge Trace": (-86.63140706870189, 30.462588920574134),
+    "Saint Martins Cove": (-86.41686597028092, 30.478900101059125),
+    "Cedar Avenue South": (-86.47831389195811, 30.503698309944674),
+    "Sterling Court": (-86.45720750000001, 30.404306499999997),
+    "Howard Drive": (-86.45245609273275, 30.531627747278424),
+    "Oakridge Road": (-86.63309490325481, 30.446926667800785),
+    "Kitty Lane": (-86.49074907082658, 30.755360773591075),
+    "Eccles Road": (-86.64397020048641, 30.448755315718053),
+    "Summer Hills Lane": (-86.63759590464056, 30.462698710845224),
+    "Lbj Sr Drive": (-86.637598002638, 30.46199098323509),
+    "Affirmed Court": (-86.554614, 30.731),
+    "Harielson Road": (-86.43808180044273, 30.752895319140816),
+    "Stamps Avenue": (-86.53682307756678, 30.766763755151263),
+    "Arnies Lane": (-86.75025507640868, 30.697094443819577),
+    "Rue Des Marseilles": (-86.7800955, 30.414014),
+    "Persimmon Way": (-86.46260072707948, 30.496822665153644),
+    "Marquette Place": (-86.64425049999998, 30.4359325),
+    "Kathy Avenue": (-86.6059877171102, 30.46124419738894),
+    "Cardinal Lane": (-86.48866888142221, 30.39769648092337),
+    "Highland Drive Northwest": (-86.61753632713442, 30.418654088406765),
+    "Martins Mill Road": (-86.75667419355871, 30.84000368745556),
+    "Victoria Avenue Northwest": (-86.63174519254802, 30.4183840151011),
+    "Robinson Road": (-86.40532788454247, 30.980585873622566),
+    "Anna Street": (-86.49432332584503, 30.39559690207628),
+    "Amigo Road": (-86.4857768, 30.47863525),
+    "Paula Court": (-86.66094420472075, 30.416536870604677),
+    "Newcastle Court": (-86.42119780232706, 30.46607265628662),
+    "West Park Drive": (-86.7192315, 30.41357),
+    "Georgia Avenue": (-86.5048320271065, 30.48390336362865),
+    "6th Avenue": (-86.57297491874077, 30.441308575835556),
+    "Burnette Avenue Northwest": (-86.6628919224926, 30.425799208711936),
+    "Klaus Conrad Drive": (-86.42096337323144, 30.487767381718665),
+    "Sunnyside Avenue": (-86.46309522724715, 30.960180346808748),
+    "Pacific Silver Court": (-86.6456955758275, 30.446779429867643),
+    "West Cypress Avenue": (-86.57496900735093, 30.762783339371495),
+    "Turkey Trott Road": (-86.78962688977677, 30.708077770804433),
+    "Thames Road": (-86.64705054163218, 30.980767663989628),
+    "Wise Avenue": (-86.4638196833922, 30.513953103712076),
+    "Long Street": (-86.55054650829473, 30.769343770806838),
+    "Banner Court": (-86.5595021, 30.740138549999994),
+    "Renee Court": (-86.545962, 30.716614999999997),
+    "Anchors Street": (-86.45781965646286, 30.507587151483172),
+    "Hyde Park Drive": (-86.5524394958652, 30.771091144987018),
+    "Wheeler Place": (-86.5399718963905, 30.780497140167714),
+    "Elm Avenue West": (-86.57568070018912, 30.763577342453615),
+    "Mohican Way": (-86.5572214, 30.7190808),
+    "High Bridge": (-86.66920898791908, 30.909430302535743),
+    "Carver Avenue": (-86.55810251152097, 30.77600766922707),
+    "White Tail Circle": (-86.44442691154488, 30.493259707233733),
+    "Seminole Circle": (-86.4744543793976, 30.52893739487343),
+    "Chambray Road": (-86.45894008039657, 30.80603054268659),
+    "McClelland Street": (-86.57506790725849, 30.74202185735178),
+    "Wills Way": (-86.66942738016344, 30.817874044544936),
+    "Moroni Drive": (-86.64544739182705, 30.454452091277062),
+    "Railroad Avenue West": (-86.5714301004372, 30.755995623151144),
+    "Seiffert Road": (-86.4852888513672, 30.806944696472545),
+    "Clubhouse Drive": (-86.39898198938468, 30.391091644568483),
+    "Union Street": (-86.64266975023673, 30.457392485119104),
+    "Tanglewood Court": (-86.65136279871139, 30.435967161747563),
+    "Tilden Street Northwest": (-86.65029882906238, 30.42559270374568),
+    "Minor Drive": (-86.5379758888956, 30.470891187008032),
+    "Vintage Circle": (-86.49773768171748, 30.40851974775748),
+    "Kettering Court": (-86.6325550208276, 30.44109063276459),
+    "Rosanna Street": (-86.62562316120359, 30.466530468433387),
+    "Birch River Avenue": (-86.56324482050984, 30.766838512766036),
+    "Dade Road": (-86.4964511, 30.48699945),
+    "Starfish Avenue": (-86.62413084499339, 30.39844868604426),
+    "Old Coastal Highway": (-86.47572006057558, 30.520840320710914),
+    "Lake Avenue": (-86.76132252765457, 30.412568869322044),
+    "Timberland Way": (-86.64722700454966, 30.43098651349653),
+    "Azalea Drive": (-86.50102209059342, 30.39672711222412),
+    "Barron Court": (-86.582025607043, 30.444294201159533),
+    "Lake Drive Northwest": (-86.63408887406794, 30.42314179511876),
+    "Parkwood Drive": (-86.41497835887367, 30.4882269042308),
+    "Willard Circle Northwest": (-86.622579, 30.418929),
+    "Placid Drive": (-86.5977054301266, 30.443637147973696),
+    "Poinsetta Street": (-86.55192357899068, 30.774762050387995),
+    "Overlord Drive": (-86.73753143817102, 30.62793446320725),
+    "Gilmore Road": (-86.67788485318617, 30.729530223981204),
+    "Alabama Avenue Northwest": (-86.61507657353663, 30.4201555477789),
+    "Lincoln Street North": (-86.57434855, 30.755239149999998),
+    "Aarons Reef": (-86.401485362722, 30.395128623852745),
+    "Barks Drive": (-86.63720670370333, 30.453662275255258),
+    "Heritage Road": (-86.63197149452957, 30.46644998427499),
+    "Eider Circle": (-86.40125768127335, 30.738916567727788),
+    "Jones Avenue": (-86.48525315473039, 30.519118370213167),
+    "Arthur Ashe Court": (-86.63966911155768, 30.45130029368649),
+    "Aurora Drive": (-86.54033011554523, 30.776745168754232),
+    "Martin Street": (-86.5613815, 30.764341),
+    "Juniper Street": (-86.47861120151373, 30.399464634787282),
+    "Mashourn Forks Road": (-86.73986795608782, 30.963459483900078),
+    "East Beech Avenue": (-86.57047028777319, 30.760801214692204),
+    "Shady Street": (-86.62567212513156, 30.461419379962265),
+    "Jax Rabbit Drive": (-86.43227469789397, 30.776512966340565),
+    "Dolphin Street": (-86.41580226527788, 30.383236464045357),
+    "Redwood Avenue": (-86.4590183372896, 30.508247757875914),
+    "Sunset Beach Boulevard": (-86.42842875536827, 30.47117801457656),
+    "Aaron Baker Road": (-86.67335897064441, 30.79634600676167),
+    "Choctawhatchee Road Southeast": (-86.59062752635242, 30.409738601097253),
+    "Timpochee Lane": (-86.39684004761034, 30.454757119129646),
+    "Greenwood Street": (-86.61973336138871, 30.44397044389517),
+    "Lincoln Street South": (-86.57079920524554, 30.750292759590838),
+    "Hayes Place": (-86.57545897992966, 30.746123772841763),
+    "Brooks Circle": (-86.5059775, 30.514211000000003),
+    "Golf Course Drive Northeast": (-86.61126191674613, 30.45874791048187),
+    "Forsman Circle Northwest": (-86.65437310416674, 30.4201091027647),
+    "Church Street": (-86.56086080355188, 30.749397802771067),
+    "Bear Road Northwest": (-86.62570434380594, 30.455718632975536),
+    "Emily Circle": (-86.65010276097918, 30.445378858358914),
+    "Tucker Lane": (-86.55415198470212, 30.7808706271855),
+    "Sonny Lane": (-86.5097440585238, 30.816925988289526),
+    "Victoria Place Northwest": (-86.63618752062239, 30.416624000581738),
+    "Clary Drive": (-86.46415870453086, 30.96183235060286),
+    "Anderson Drive": (-86.66814977687301, 30.411821891407442),
+    "Sparkleberry Cove": (-86.50080834064741, 30.534416804020225),
+    "Chantilly Cove": (-86.43036042907343, 30.476942163569085),
+    "Bream Avenue": (-86.60363145140033, 30.397980496731556),
+    "Norriego Drive": (-86.49527438011225, 30.3872025939443),
+    "Forest Court": (-86.60988103387064, 30.437435596631808),
+    "Ridgecrest Road": (-86.48290672948643, 30.801294243939346),
+    "Twilight Drive": (-86.53088859026771, 30.83302540648603),
+    "Chicago Avenue Southeast": (-86.60151745689338, 30.40877330108702),
+    "Bryn Mawr Boulevard": (-86.64955483474145, 30.418200912044934),
+    "Sunburst Drive": (-86.4147549415076, 30.821114096125804),
+    "Teepee Court": (-86.45152181095415, 30.40174934800582),
+    "Ezra Cook Road": (-86.70251664430701, 30.984525461636537),
+    "Memorial Parkway Northwest": (-86.63054911734675, 30.423690356628608),
+    "Amis Drive": (-86.56739350000001, 30.442081),
+    "Tanager Road": (-86.628202136927, 30.465197009026074),
+    "Jonquil Street": (-86.51595719160535, 30.821660730297133),
+    "Scottsdale Drive": (-86.67379072338042, 30.413053847364022),
+    "Yellow Bluff Road": (-86.41368405101015, 30.827819386364173),
+    "Doyle Street": (-86.60008548695147, 30.76849487241431),
+    "Charlie Day Road": (-86.6813077770434, 30.769883690466102),
+    "Willow Lane": (-86.49767327130557, 30.793085094510452),
+    "Brookmeade Drive": (-86.55936492792277, 30.742447620115822),
+    "Point Center Road": (-86.61275474346199, 30.711235002402965),
+    "Huck Finn Drive": (-86.58902532158913, 30.70644018653251),
+    "Ross Court": (-86.56243046328363, 30.711039965801312),
+    "Flora Lee Lane": (-86.54913713520993, 30.793586136637856),
+    "Patrick Drive": (-86.63679595344766, 30.45126393614514),
+    "Kylito Circle": (-86.52688780739572, 30.84437414626582),
+    "Eastview Avenue": (-86.4882769639051, 30.50624491014169),
+    "1st Street": (-86.76371610349928, 30.41173660673095),
+    "Lark Street": (-86.62840085588861, 30.4659551452473),
+    "North Rayburn Street": (-86.55965359896508, 30.759116996298967),
+    "Newman Street": (-86.52690448374767, 30.754515533211453),
+    "Harbeson Avenue Northeast": (-86.60932802984324, 30.4144977974474),
+    "Spence Circle": (-86.49964356092352, 30.51902251254785),
+    "Racoon Trail": (-86.43178054025623, 30.492250009864264),
+    "Cabana Way": (-86.57911126096803, 30.758981018642828),
+    "Stanley Lane": (-86.70116700290332, 30.763274166454362),
+    "Chickamauga Lane": (-86.4521644227425, 30.399872652839054),
+    "US Highway 90 West": (-86.40200931718257, 30.74341852072264),
+    "Medley Drive Northwest": (-86.57800647506724, 30.768919777486957),
+    "Hatchee Drive": (-86.57926961280045, 30.716258073357366),
+    "Flagler Road": (-86.48895650547685, 30.47704701396046),
+    "Shoal River Drive": (-86.55735929994829, 30.703818844739633),
+    "Canopy Lane": (-86.65086887741562, 30.442979422369394),
+    "Dunlop Lane": (-86.55948487961969, 30.705518842302205),
+    "Randolph Court": (-86.56749148472852, 30.748776807607822),
+    "Aucilla Cove": (-86.48779549934216, 30.48462137811823),
+    "Cloverdale Boulevard": (-86.64229796417588, 30.4514230345404),
+    "Via del Sol": (-86.39924427862273, 30.384437102364902),
+    "Choctaw Road": (-86.54057532092966, 30.458404567170327),
+    "Martin Luther King Jr Avenue": (-86.57221869251468, 30.754670595896993),
+    "Haskell Langley Road": (-86.52851526951086, 30.838073043375537),
+    "Escanaba Avenue": (-86.50707643738859, 30.51839056478693),
+    "Countryside Court": (-86.6389030682652, 30.458439897248372),
+    "Kathleen Court": (-86.46445669943786, 30.520646402063996),
+    "Clifford Street": (-86.63414051411459, 30.442147721910825),
+    "Oaklawn Street": (-86.62073350950025, 30.443988000242268),
+    "Walker Drive": (-86.69101914124377, 30.76219168883963),
+    "Ventura Circle Northwest": (-86.62928559241627, 30.428758008925442),
+    "Easy Street": (-86.75320989009224, 30.67291320425167),
+    "East 3rd Avenue": (-86.57140855041057, 30.767949810171537),
+    "Robinwood Drive Southwest": (-86.61861935383037, 30.4091540652422),
+    "Fairway Drive": (-86.4923604467886, 30.527344909524608),
+    "Breakwater Drive": (-86.4367055081059, 30.4065754812411),
+    "Twin Bay View": (-86.60475177053785, 30.451902674803584),
+    "Bowles Crescent": (-86.48386429368192, 30.476931446696003),
+    "Lonnie Booker Road": (-86.77857612372479, 30.95796049916942),
+    "Bayou Woods Court Northwest": (-86.62146899999999, 30.4252515),
+    "Dancing Cloud Court": (-86.45906269127278, 30.391497415736225),
+    "Coral Court": (-86.61329733392553, 30.396887099312355),
+    "Dawson Ranch Road": (-86.51799024825286, 30.85059030064639),
+    "Miracle Strip Pkwy Southwest": (-86.6150241646096, 30.40421982872147),
+    "West Miracle Strip Parkway": (-86.66533229970386, 30.409805859629756),
+    "Parkside Lane": (-86.41763299041483, 30.49474953139379),
+    "Carlyle Court Northeast": (-86.60375993070267, 30.45670065586768),
+    "Mc Griff Street Northeast": (-86.60945581254234, 30.41423027186345),
+    "Hospital Drive": (-86.63408163116658, 30.457100402948843),
+    "Border Creek Drive": (-86.5436286163918, 30.79526664997215),
+    "Hidden Trail": (-86.65277517342575, 30.463263051457027),
+    "Poplar Creek Church Road": (-86.74905574971311, 30.748551344111515),
+    "West Beech Avenue": (-86.57484979250218, 30.757873477312714),
+    "Jefferson Place Northwest": (-86.62177588416024, 30.414004993360532),
+    "Krest Drive": (-86.58807899105129, 30.714485260777177),
+    "Fir Avenue": (-86.47234280915849, 30.530860340010083),
+    "Nikki Lane": (-86.4617306794108, 30.785250643024806),
+    "Bambi Drive": (-86.48670266407687, 30.414812918184104),
+    "Verns Valley": (-86.69107045657, 30.7604309213814),
+    "Carann Place": (-86.7017576385409, 30.83751135311056),
+    "Mill Run Drive": (-86.58222002330788, 30.808010708355063),
+    "Gibbs Avenue": (-86.60822203357586, 30.461411816391248),
+    "Shangrila Road": (-86.42008043938449, 30.82876628375065),
+    "Trunberry Cove North": (-86.42393559277853, 30.479755623407517),
+    "Bridgewater Court": (-86.75609825000001, 30.409827999999997),
+    "Regatta Bay Boulevard": (-86.41655189758742, 30.39456102390052),
+    "Earl Street Northwest": (-86.65692150000001, 30.426857499999997),
+    "Monroe Street": (-86.67935846261987, 30.79715578176987),
+    "Waynel Court Southeast": (-86.59641258481766, 30.4107055251739),
+    "Annie Jo Road": (-86.75393673920894, 30.687280334581846),
+    "Shelby Lane": (-86.75173478932673, 30.704684530239653),
+    "Andy Lane": (-86.50972324590973, 30.813137503084615),
+    "Old Ebenezer Road": (-86.51787729670734, 30.9930327753296),
+    "Inverrary Drive": (-86.4047278470882, 30.389488902522032),
+    "Bluegrass Parkway": (-86.39850692105337, 30.993130605662227),
+    "Azalea Avenue": (-86.40122859528293, 30.74930892862811),
+    "Museum Drive": (-86.53830737563615, 30.47165484004552),
+    "Sussex Road": (-86.6482034975339, 30.419644606813755),
+    "Porter Lane": (-86.55999489543034, 30.787634625592116),
+    "Playground Drive": (-86.56586779023955, 30.760160517365616),
+    "Oatman Drive": (-86.52661549999999, 30.8159095),
+    "Benton Avenue": (-86.44897091216347, 30.510172029471327),
+    "Cedar Lane": (-86.52369880203163, 30.79704753566773),
+    "Fenwick Avenue": (-86.66519999372973, 30.43012513813565),
+    "Lumber Ridge Road": (-86.4038929744319, 30.836788477751867),
+    "Rankin Road Avenue": (-86.73192219571793, 30.41100165426036),
+    "Rankin Road": (-86.73185463694261, 30.409801121115475),
+    "Adams Drive": (-86.58089690356864, 30.780566685879602),
+    "Memorial Place": (-86.58023395424676, 30.771559296133077),
+    "Griffith Mill Road": (-86.70676460944553, 30.763873100112527),
+    "Seminole Trail": (-86.58126050563949, 30.771523301691545),
+    "Ibiza Cove": (-86.42738280160646, 30.48967149678562),
+    "East Trovare Street": (-86.39901870051686, 30.384628907238735),
+    "Mediterranean Circle": (-86.42776908814447, 30.490215905894942),
+    "Apache Road": (-86.59416292775309, 30.780662381473288),
+    "Palm Springs Court": (-86.5583369242012, 30.442432638735692),
+    "Clements Street Northeast": (-86.60376236112103, 30.42049665087156),
+    "Dogwood Lane": (-86.56539767018927, 30.800400272572645),
+    "Overbrook Circle": (-86.6437404923875, 30.43428849186231),
+    "Palm Drive": (-86.57805188534905, 30.434963136863352),
+    "Jasmine Avenue": (-86.48675991090083, 30.491255532454154),
+    "Jay Street": (-86.63103212033269, 30.46665725539594),
+    "Suzy Q Lane": (-86.56138770955305, 30.717390131975822),
+    "Parkview Avenue": (-86.52726084528638, 30.75953431677243),
+    "Wheeler Lane": (-86.74116331252645, 30.759734476031557),
+    "Wild Oak Avenue": (-86.4826655047434, 30.399749108827393),
+    "Goldfinch Way": (-86.40174643662077, 30.750114632499123),
+    "Northview Drive": (-86.58849322179638, 30.717340402747567),
+    "Derby Lane": (-86.43896800787056, 30.39295047779575),
+    "Wilson Lane": (-86.55972084601316, 30.707587550891212),
+    "Woodham Court": (-86.60596080833112, 30.437063202425765),
+    "John Melvin Pit Road": (-86.74433646738932, 30.752770924686164),
+    "Calumet Court": (-86.57492963078832, 30.799843690349565),
+    "Norwood Court": (-86.6420865, 30.431407),
+    "Standish Lane": (-86.62257951390788, 30.43747652412391),
+    "Sam Jordan Road": (-86.63109099224411, 30.683885992279375),
+    "Greenbrier Circle": (-86.60338687494438, 30.431187862294802),
+    "John B Cadenhead Road": (-86.49146529768599, 30.949139499710288),
+    "Hooper Drive Northwest": (-86.64855686026725, 30.422628951833456),
+    "North Brook Drive": (-86.5448194887787, 30.798695362070568),
+    "Broadview Circle": (-86.51850941730503, 30.81081123375927),
+    "Flamingo Road": (-86.50714199339487, 30.81438121729536),
+    "Wisteria Court Northwest": (-86.6148305, 30.426184000000003),
+    "Brackin Street": (-86.55958164443432, 30.76389041224685),
+    "Cape Lane": (-86.467723101205, 30.49768953024186),
+    "Mansfield Drive": (-86.57913743027935, 30.79279496566853),
+    "Windrush Cove": (-86.42639660343319, 30.469036866418747),
+    "Upia Drive": (-86.58848219957994, 30.70996811339276),
+    "Golden Court": (-86.47838365175474, 30.81371866760249),
+    "Casca Belles Street": (-86.72382818192266, 30.413642055502855),
+    "Crescent Circle Southwest": (-86.61569611749103, 30.411905476965003),
+    "Williams Court": (-86.63294343957004, 30.44292675994883),
+    "Lancaster Drive": (-86.44046316386407, 30.49734169570568),
+    "West Dogwood Drive": (-86.55799674804707, 30.810929073395652),
+    "London Avenue Northwest": (-86.624776533072, 30.42158149099112),
+    "Red Bird Lane": (-86.74857301166305, 30.696826340481838),
+    "Springhill Road": (-86.57105483546961, 30.43483503089221),
+    "Rocky Drive": (-86.45954579585927, 30.50689413892553),
+    "Nap Knob": (-86.68865396817974, 30.692294182743964),
+    "Longwood Drive": (-86.58872582116712, 30.466134294903767),
+    "Medley Drive": (-86.57807662609324, 30.767941786343172),
+    "Saint Andrews Drive": (-86.47100436014959, 30.498280781271607),
+    "Tommy Thames Circle": (-86.683540028048, 30.9926169542267),
+    "Walkedge Drive Southeast": (-86.59065799999999, 30.4067025),
+    "North Curacao Cove": (-86.42156, 30.473894),
+    "Cascade Way": (-86.58743310892059, 30.775768450131388),
+    "Kathleen Place Northwest": (-86.63639536239548, 30.41842423118597),
+    "Green Oak Drive": (-86.56251950000001, 30.724152000000004),
+    "Verb Street": (-86.62578719216596, 30.453091333468844),
+    "Westview Drive": (-86.5925168643176, 30.71400716690894),
+    "Nicole Lane": (-86.56230007193744, 30.727900623401485),
+    "McCallum Road": (-86.41592654113026, 30.802146992679926),
+    "Muskegon Avenue": (-86.50897255706406, 30.519328143177788),
+    "Roxanna Road": (-86.60668558292257, 30.452517167103856),
+    "Moreno Point Road": (-86.48915830823978, 30.38726140932844),
+    "Regatta Bay Road": (-86.4138428, 30.38855495),
+    "Glenburn Court": (-86.43909823312428, 30.496174515411944),
+    "Jake's Hill Road": (-86.41738627853779, 30.96650048440104),
+    "Stroehl Lane": (-86.48883471394984, 30.80931500791873),
+    "Enzor Road": (-86.59715583546897, 30.761873454944357),
+    "Marlowe Drive": (-86.6083220073992, 30.43848857517598),
+    "Sotir Street Northwest": (-86.62551131286493, 30.42412150032652),
+    "North Pearl Street": (-86.57477706773497, 30.773186471040777),
+    "Lewis Turner Boulevard": (-86.63097440041588, 30.460099297763012),
+    "McVicker Road": (-86.69522962694653, 30.8260792923616),
+    "Brookridge Trace": (-86.63249435346921, 30.462397925779435),
+    "Industrial Drive": (-86.56271437584304, 30.775960534264478),
+    "Stallion Drive": (-86.41286497993227, 30.758180541210496),
+    "Scirocco Loop": (-86.63478613991914, 30.46196023048775),
+    "Westview Avenue": (-86.49015996390968, 30.50384454434121),
+    "Brookside Way": (-86.66649958357944, 30.748454753552195),
+    "Lake Lane": (-86.55038948470242, 30.81542536853508),
+    "Trent Street": (-86.66451099974913, 30.42934351579989),
+    "Neptune Court Northwest": (-86.62408980131738, 30.428426931714757),
+    "Promised Land Drive": (-86.69900220486558, 30.786484525968245),
+    "Cruz Avenue": (-86.69513790552774, 30.425799164746362),
+    "Whisperwood Lane North": (-86.60615, 30.46815395),
+    "Paige Lane": (-86.56348078083388, 30.810365923284547),
+    "Sea View Drive": (-86.49240810782835, 30.394122130536203),
+    "Pryor Drive": (-86.67540571267874, 30.41176420047613),
+    "Melissa Lane": (-86.50628189612175, 30.82427663586398),
+    "Marimba Street": (-86.72485145925157, 30.412212658476463),
+    "Pioneer Road": (-86.62547348071901, 30.74618999889534),
+    "Armadillo Trail": (-86.43186830294498, 30.49284233116424),
+    "Matthew Boulevard": (-86.4305146268668, 30.385628119570626),
+    "Venice Avenue": (-86.64307215, 30.4415627),
+    "Robin Road": (-86.50513062044615, 30.813807632395903),
+    "Fenny Way": (-86.58620373442366, 30.77576227443638),
+    "Perry Smith Road": (-86.65771832654089, 30.734785532159023),
+    "Williams Avenue East": (-86.5539516197947, 30.747307349601407),
+    "Sunny Drive": (-86.79043674435307, 30.402933122834586),
+    "Blessinger Drive": (-86.65861019263704, 30.441363902704015),
+    "Robert Taylor Road": (-86.5264859504158, 30.743595545364055),
+    "Lake Amick Drive": (-86.44388779882858, 30.53170279514542),
+    "Spruce Lane": (-86.46104331405745, 30.767314834493767),
+    "Blue Springs Cove": (-86.66301574580048, 30.746434501805744),
+    "Whisperwood Lane South": (-86.60618499719415, 30.46624194995917),
+    "Crooked Creek Cove": (-86.45716451578552, 30.526605749856987),
+    "Drifting Sand Trail": (-86.45462659622913, 30.39233139179979),
+    "Gerold Street": (-86.61568849978325, 30.44439051238511),
+    "Muirfield Way": (-86.4275639136282, 30.47516275234863),
+    "Firefly Trail": (-86.77723698424315, 30.846165202277575),
+    "Scenic Court": (-86.55417475934031, 30.70325979332625),
+    "Pembroke Place Northeast": (-86.60834274327632, 30.452689723858235),
+    "Hondo Avenue": (-86.62576002075136, 30.454857377730615),
+    "Angela Lane": (-86.66309268962328, 30.419002007071303),
+    "Truxton Avenue": (-86.6159365132174, 30.447305434492407),
+    "Topaz Court": (-86.61397685, 30.437050550000002),
+    "Oakcrest Drive": (-86.49406197406434, 30.80232783518153),
+    "Stonehenge Circle": (-86.64872199999999, 30.4150855),
+    "Juanita Avenue": (-86.49750874212218, 30.40133961990417),
+    "Cherie Court Northwest": (-86.63641895382308, 30.425318909220852),
+    "Gmc Lane": (-86.62148953862554, 30.73632293511086),
+    "Nordic Lane Northwest": (-86.6426335, 30.41359),
+    "Kiwi Place Northeast": (-86.6084710001832, 30.413310491586504),
+    "Two Circle Road": (-86.45614037507526, 30.392146569606012),
+    "Panama Drive": (-86.58086815005707, 30.77275139453891),
+    "Kensington Court Northeast": (-86.60602469608519, 30.454857703407935),
+    "Rickey Avenue": (-86.60211357665887, 30.444558099719707),
+    "North Spring Street": (-86.57295930782362, 30.758567665475365),
+    "Ash Road": (-86.5231425, 30.7949655),
+    "Hummingbird Avenue Northwest": (-86.61733113529007, 30.42010927684084),
+    "Poppy Street": (-86.62737198844636, 30.4415690578173),
+    "Bellbouy Landing": (-86.44190672662312, 30.407338776705284),
+    "Fairview Drive": (-86.65177974448399, 30.443101420290656),
+    "Fairway Lakes Drive": (-86.43265541110847, 30.485342497676665),
+    "Fallin Waters Drive": (-86.7152635, 30.410585349999998),
+    "Lula Belle Lane Northwest": (-86.63533622542323, 30.414717122932718),
+    "Kingston Court": (-86.64284595993504, 30.40857934943315),
+    "Whitney Court": (-86.61231621544596, 30.7136805173393),
+    "Heron Circle": (-86.40214904213305, 30.736466729335397),
+    "Thomas Road": (-86.45556269148553, 30.981704960566816),
+    "Courtney Lane": (-86.55505808605355, 30.73598849068881),
+    "Deerfield Drive": (-86.45851300014417, 30.40457111254451),
+    "Regatta Drive": (-86.49065243973891, 30.520240671515985),
+    "Turkey Track Road": (-86.42523962871799, 30.821110873961672),
+    "Rainbow Drive Northwest": (-86.62003658115331, 30.42166314014656),
+    "Corey Road": (-86.52775820313369, 30.942938118162438),
+    "Feldon Drive": (-86.57761019755861, 30.706152978242923),
+    "Candlewood Lane": (-86.55020549263477, 30.763840741346367),
+    "Kel-Ray Lane": (-86.64000184161374, 30.748960745641316),
+    "Crawford Road": (-86.52508632776014, 30.740586766341334),
+    "Edge Street": (-86.65412780867868, 30.440641965162488),
+    "North Karick Lake Road": (-86.6404304816845, 30.908267170544192),
+    "Retreat Inlet": (-86.64632041277103, 30.73250962068928),
+    "Victory Lane": (-86.5570855966697, 30.759839180791786),
+    "Bear Creek Road": (-86.46306050720102, 30.771655354437836),
+    "Woodcliff Drive": (-86.49594900898242, 30.799582425035226),
+    "Walter Circle": (-86.63168284957605, 30.444585733202484),
+    "Saint Charles Avenue": (-86.49635616389985, 30.498491956525452),
+    "Shadyside Court": (-86.47242053297732, 30.509382329020287),
+    "Naughton Drive": (-86.58816950133446, 30.716298734548143),
+    "Hillcrest Drive": (-86.5853851208541, 30.464625154216545),
+    "Amber Lake Court": (-86.42490243265986, 30.467821558567987),
+    "Williams Avenue West": (-86.56443852625368, 30.74772729477322),
+    "Circle Drive": (-86.6158010713645, 30.437621367726774),
+    "Lost Horse Circle": (-86.43368919515902, 30.49400932260428),
+    "Wheeler Street Southeast": (-86.592007987279, 30.410348576982443),
+    "Opportunity Drive": (-86.52716591312937, 30.758191716394034),
+    "Crestview Avenue": (-86.47162277878122, 30.52757222696129),
+    "Jordan Road": (-86.64691133685581, 30.951303425361917),
+    "Sandra Drive": (-86.75576410300111, 30.406684206355003),
+    "Phillips Drive": (-86.57195329256139, 30.779419739381005),
+    "Sullivan Street Northwest": (-86.64540507039975, 30.421730118069032),
+    "Sailfish Circle": (-86.49818790558254, 30.39744013172624),
+    "North Greenwood Cove": (-86.41337288876318, 30.47369848717211),
+    "Hickory Lane": (-86.48755199996035, 30.49292350384574),
+    "Quail Circle": (-86.4686832433277, 30.393348144523717),
+    "Morrell": (-86.69200716515958, 30.700355292299268),
+    "Yorktown Circle": (-86.65250887398076, 30.467624837177397),
+    "Vine Avenue": (-86.45541026082573, 30.49624504768326),
+    "Lawrence Lane": (-86.61997826990893, 30.749451325192723),
+    "May Street": (-86.70977378123074, 30.414089467221487),
+    "Gardenia Court Northwest": (-86.61807912725442, 30.424393804999266),
+    "Grandview Drive": (-86.5469658714941, 30.446561162096796),
+    "Lee Lane": (-86.75710841881491, 30.415099846584603),
+    "Holmes Boulevard Northwest": (-86.61644153027376, 30.4193746701615),
+    "Farquar Lane": (-86.57779072436905, 30.446600158123285),
+    "Sorrel Ridge Road": (-86.57286018946171, 30.80447477922609),
+    "Rana Lane": (-86.46745614726065, 30.485816408679373),
+    "Old California Road": (-86.47934950221257, 30.93663714566965),
+    #"White Point": (-86.41411432786491, 30.482849119132737),
+    "Alconese Avenue Southeast": (-86.60095233874499, 30.403615125175904),
+    "Estival Street": (-86.63775363731395, 30.461268705761874),
+    "Holland Street": (-86.58239479676092, 30.76789241413389),
+    "Glynda Court": (-86.6295525, 30.426073000000002),
+    "Hilton Trail": (-86.65825944176181, 30.84719189302782),
+    "Country Breeze Lane": (-86.43544499984218, 30.813562507735895),
+    "Creel Street": (-86.64479329468756, 30.452275711459567),
+    "Ohio Place Northeast": (-86.59737642225255, 30.414849005243656),
+    "Maltezos Street": (-86.49685351056225, 30.398720407968778),
+    "Trenton Avenue": (-86.56220905698495, 30.729679992947037),
+    "Turnberry Court": (-86.64281677091257, 30.45278711446693),
+    "West Pine Avenue": (-86.57518251522858, 30.758899022931605),
+    "Oakdale Avenue East": (-86.56924730375908, 30.760373798464606),
+    "Springacres Cove": (-86.4184719462895, 30.472371026953976),
+    "Tradewinds Road": (-86.75702519424937, 30.40976161559731),
+    "Beverly Street": (-86.64261949313342, 30.455558499792403),
+    "Apalachicola Road": (-86.49594492370781, 30.48174290756855),
+    "Sundial Court": (-86.62507887693421, 30.397659046432118),
+    "Seminole Avenue": (-86.49240355972488, 30.505607607069496),
+    "Bay Street": (-86.56694034397333, 30.749238082675646),
+    "Woodhaven Court": (-86.46682084510486, 30.81740854850545),
+    "Madsen Circle": (-86.47934648040378, 30.937585659660147),
+    "Jet Drive Northwest": (-86.6226865252784, 30.416027216237353),
+    "Park Court": (-86.4962965, 30.4037675),
+    "Pickens Circle": (-86.65520781582626, 30.760218578439854),
+    "Tom Page Lane": (-86.69648258434488, 30.781764746661008),
+    "Tindel Drive": (-86.55008003439504, 30.717233299334293),
+    "Jesse Medley Road": (-86.46996847632782, 30.811541637484705),
+    "Ensign Court": (-86.42400449399857, 30.395441441583376),
+    "Pine Lane": (-86.4857505, 30.491767000000003),
+    "West Capri Cove": (-86.44331983765458, 30.48726765733824),
+    "Dubois Drive": (-86.6293571423105, 30.44027475793881),
+    "Barrancas Avenue": (-86.50988362426784, 30.481645197489655),
+    "Sundance Way": (-86.74460378733893, 30.683902760366678),
+    "Garnett Avenue": (-86.6090783749264, 30.421249310543338),
+    "Josh Drive": (-86.6130893282325, 30.7136480653958),
+    "Gulf Shore Drive": (-86.48967192747982, 30.38503726090602),
+    "Eagle Court": (-86.53658363075371, 30.78999980957978),
+    "East Cedar Avenue": (-86.5731293279913, 30.761529027897307),
+    "Pryor Road Southeast": (-86.58966307530976, 30.40922224510814),
+    "Sims Street": (-86.64937466856641, 30.426806973181407),
+    "Emerald Circle": (-86.64793709543332, 30.45080047867152),
+    "East Bermuda Circle": (-86.42536416581889, 30.487677167340063),
+    "Eloise Place": (-86.60804569385323, 30.77629407958057),
+    "Choctaw Lane": (-86.55464851815712, 30.434810527725624),
+    "Terrapin Trace": (-86.43995492441258, 30.401884356399496),
+    "Springate Court": (-86.75676747346327, 30.411998440792683),
+    "Trenton Street": (-86.60859050414169, 30.439877980072875),
+    "Kentucky Street": (-86.52508060022252, 30.761417728794058),
+    "Windlake Court": (-86.42573050030555, 30.472464811493293),
+    "Garden City Road": (-86.5099987565282, 30.824437177671484),
+    "Bartonwood Court": (-86.47802167546811, 30.533818011659204),
+    "Lakeside Lane": (-86.74729290754135, 30.413290254891933),
+    "Evans Road": (-86.44114997980648, 30.499884030570055),
+    "Woodfern Avenue": (-86.79355379938927, 30.414472496657506),
+    "Mary Ann Court": (-86.43993813950893, 30.520008867331658),
+    "Bowdoin Court": (-86.47434387497833, 30.53366880979563),
+    "North Lakeshore Drive": (-86.41513814984053, 30.466731253198308),
+    "Titanium Drive": (-86.61045819940956, 30.72465963036495),
+    "Sholtz Avenue": (-86.546785, 30.775541999999998),
+    "Acorn Drive": (-86.5406742, 30.7438356),
+    "Rocket Lane": (-86.57673, 30.445432500000003),
+    "Nebraska Avenue Northeast": (-86.60475285552496, 30.418764780411905),
+    "Stonehenge Drive": (-86.64807092287303, 30.41737138343103),
+    "Terry Avenue": (-86.69785992077578, 30.41716084235758),
+    "Buena Vista Lane": (-86.62143266097806, 30.455733140891184),
+    "China's Cove": (-86.65186800000001, 30.461646999999996),
+    "Miramar Drive": (-86.64472283443561, 30.41111999432547),
+    "Sellers Place Northwest": (-86.6412929805346, 30.419075499550274),
+    "Jonleen Drive": (-86.63372719324246, 30.444681320384806),
+    "Coldwater Creek Circle": (-86.45987954035166, 30.523237267042738),
+    "Pinederosa Trail": (-86.45430888855077, 30.77020628513318),
+    "Peter Court": (-86.662955, 30.428775500000004),
+    "Cayman Cove": (-86.41006894506098, 30.38376324121405),
+    "Hemlock Drive Northwest": (-86.62969902080715, 30.417625329401925),
+    "Pelican Place": (-86.50308649364656, 30.39576325574508),
+    "Country Club Court": (-86.56210649756224, 30.439986076970353),
+    "Pebble Drive": (-86.6292015, 30.442258999999996),
+    "Johnson Court": (-86.56705808799019, 30.744627240445247),
+    "Needle Avenue": (-86.40519535346841, 30.739918812136594),
+    "Holly Street": (-86.47957365041485, 30.39934842356365),
+    "Jerry Zivan Drive": (-86.41968509055147, 30.487390310591305),
+    "Beal Parkway Southwest": (-86.61309262799848, 30.40831767571485),
+    "Brentwood Lane": (-86.55780905851195, 30.77189225006051),
+    "Nan Place": (-86.60986337777483, 30.469431659873585),
+    "189 Oakdale Avenue West": (-86.57300664724957, 30.7578551392671),
+    "Dominica Way": (-86.42414467692524, 30.473085439657314),
+    "Cottonwood Court": (-86.47761498125206, 30.533096869528435),
+    "Rockport Drive": (-86.6226524494386, 30.45259060987513),
+    "Shrewsbury Road": (-86.65147106291535, 30.41674980692542),
+    "Lustan Drive": (-86.5942762578423, 30.711156870438966),
+    "Sunflower Court": (-86.50400053261777, 30.385607884076016),
+    "Okaloosa Avenue": (-86.49264726854636, 30.506399345449278),
+    "Barlow Road": (-86.63484376107074, 30.684389946389995),
+    "Donlabrook Boulevard": (-86.63122366278203, 30.453148858867827),
+    "Turnberry Cove South": (-86.4226768266653, 30.47708073298758),
+    "Parkview Lane": (-86.41850006414825, 30.49840379369202),
+    "Troy Road": (-86.64388295980436, 30.74852373616326),
+    "Willow Drive": (-86.51854860514977, 30.810808694921153),
+    "Linene Drive": (-86.56356972645641, 30.807758809631544),
+    "Kinsey Court": (-86.48724800139527, 30.487843324147555),
+    "Millers Street": (-86.45513474591297, 30.96655256404461),
+    "Nobie Medley Lane": (-86.69776069138679, 30.74709286627116),
+    "Justin Street": (-86.63036026485423, 30.43730350584742),
+    "Roserito Place": (-86.66237774543391, 30.411335974235136),
+    "Rose Marie Lane Southwest": (-86.62555713507803, 30.408589414466068),
+    "Yellow River Baptist Church Road": (-86.56608689572664, 30.926294739940992),
+    "Boulevard de l'Orleans": (-86.78121603104488, 30.412561316329985),
+    "Poplar Road": (-86.57637987999851, 30.461295134388365),
+    "Old Hickory Road": (-86.53336827847868, 30.815560167884918),
+    "Racetrack Road Northeast": (-86.6074207671329, 30.44616147136625),
+    "Windward Lane": (-86.43883489037064, 30.47982052977843),
+    "Ivey Terrace": (-86.46928407111518, 30.525789747395248),
+    "Colonial Drive": (-86.62294900005455, 30.438455997228267),
+    "Mayhaw Court": (-86.57443018694954, 30.460712000911467),
+    "Gardner Drive": (-86.58467086815652, 30.437717234891423),
+    "Wedgewood Court": (-86.61213992612636, 30.729364363640386),
+    "Forest Lake Terrace": (-86.47015085293076, 30.525086767834065),
+    "Dogwood Avenue": (-86.47637173847056, 30.506873325981065),
+    "Seminole Drive": (-86.5987829527083, 30.7919466588768),
+    "Donleen Street": (-86.629764, 30.4478425),
+    "Throwbridge Avenue": (-86.63397968472235, 30.44085698449446),
+    "West Cedar Avenue": (-86.57357272150682, 30.761232038533755),
+    "Primrose Street": (-86.54376587410825, 30.723338873935756),
+    "Golf Course Road": (-86.68342745068557, 30.434965691237835),
+    "Magnolia Avenue Southeast": (-86.59866832474127, 30.408654475168255),
+    "Camellia Drive": (-86.65162478736713, 30.41182908956358),
+    "West Lake Circle": (-86.7614125, 30.414290000000005),
+    "Giant Sycamore Lane": (-86.64597677268185, 30.82768781555925),
+    "Pinetree Road": (-86.73341331029955, 30.413877968332866),
+    "Nathey Street": (-86.49488225866709, 30.527685522677295),
+    "Wava Avenue": (-86.44462474385311, 30.521682160940646),
+    "Mattie Kennedy Road": (-86.69801684507252, 30.92324106963669),
+    "Coosa Court": (-86.450621, 30.3984995),
+    "Larkin Drive": (-86.612315, 30.423299),
+    "Stafford Circle Northeast": (-86.60377536021318, 30.455852072906815),
+    "Kyle Lane": (-86.54747499942334, 30.769685545838804),
+    "Hill Lane": (-86.5037955042075, 30.51881406145776),
+    "Godwin Road": (-86.68089281464586, 30.78984064223825),
+    "Lan Rob Lane": (-86.50427591732296, 30.399082893161193),
+    "Bressler Street": (-86.57536692505211, 30.74948103049824),
+    "North Lincoln Street": (-86.57530728307677, 30.756294531863094),
+    "West College Boulevard": (-86.48201847419405, 30.53485875685596),
+    "Efy Lane": (-86.67493817306438, 30.712934101334575),
+    "Old Bayou Trail": (-86.44613948625864, 30.40016123133243),
+    "L G Russell Road": (-86.62323063129826, 30.952955991454424),
+    "Reed Place Northwest": (-86.64228106106454, 30.41909553500739),
+    "Legion Court": (-86.4916585, 30.3971285),
+    "Sugarberry Court": (-86.4586385, 30.49307735),
+    "Doe Lane": (-86.6481755871785, 30.453938607845405),
+    "Pinedale Road": (-86.61379741681857, 30.447186283944784),
+    "Oakland Street East": (-86.55036501600837, 30.778905187139102),
+    "Dell Road": (-86.61074304746579, 30.43607419633239),
+    "Indigo Circle": (-86.47663265050514, 30.40893512874557),
+    "2nd Street": (-86.57968946597589, 30.441976747519977),
+    "Quail Trail": (-86.48720450115859, 30.49005828320305),
+    "Highway Avenue Northeast": (-86.60490915405126, 30.430964762466775),
+    "Blue Ridge Drive": (-86.64455967061268, 30.453380847117554),
+    "Dreaden Circle": (-86.63946332334163, 30.74372878503462),
+    "Willow Grove Lane": (-86.65438304010482, 30.466446702280944),
+    "Duke Drive": (-86.47461959304731, 30.530284295990985),
+    "Surf Lane": (-86.46708330096058, 30.499884993501983),
+    "Ray Street": (-86.64087772637974, 30.750035222364517),
+    "Robinson Avenue East": (-86.55871090600039, 30.748588703873093),
+    "Don Drive": (-86.61100427742497, 30.449177119029123),
+    "Magnolia Street": (-86.5067751, 30.478949650000004),
+    "White Oak Lane": (-86.56207231176727, 30.723209744055207),
+    "Lonnie Barnes Street": (-86.64840401977624, 30.7583145928888),
+    "Saint Kitts Cove": (-86.42318127525266, 30.486435892456914),
+    "Jerrells Avenue": (-86.6359271839867, 30.437408003389447),
+    "Moon Road": (-86.63930959057873, 30.683952609340235),
+    "Beech Wood Way": (-86.47864622291722, 30.53176366380953),
+    "Ralph Boyette Road": (-86.78688985439683, 30.892906743925646),
+    "Calinda Lane": (-86.4353840247246, 30.49657930019339),
+    "Brodie Lane": (-86.57795627445543, 30.701194964912375),
+    "Aplin Road": (-86.53159737148246, 30.74371433673528),
+    "North John Sims Parkway": (-86.49577119807378, 30.515693606439505),
+    "Mackenzie Road": (-86.50195893918466, 30.750847210887205),
+    "East Casa Loma Drive": (-86.74994519001284, 30.41399838775608),
+    "Winstead Road": (-86.53210584594606, 30.826290680639502),
+    "98 Palms Boulevard": (-86.48147259410158, 30.392122427310305),
+    "Willie Mack Jackson Road": (-86.70888621472537, 30.740140453621844),
+    "Jimmy Weathers Drive": (-86.41258932497941, 30.48122492630406),
+    "Clark Drive": (-86.64847758824403, 30.439647911261574),
+    "Bimini Way": (-86.41978300880903, 30.481120840988904),
+    "Barnes Road": (-86.54153375570682, 30.820095501055064),
+    "Elizabeth Lane": (-86.57722014999999, 30.44333555),
+    "Michael Court Northwest": (-86.6239445, 30.4251845),
+    "Eden Road": (-86.48263607182432, 30.81129780911938),
+    "Claudia Lane": (-86.73807585078329, 30.75594350098652),
+    "East Hickory Avenue": (-86.57120003629181, 30.764062319246094),
+    "Commerce Road": (-86.50607059877481, 30.396940764779888),
+    "Spicebush Court": (-86.4590305, 30.491686),
+    "Hidden Lake Court": (-86.43039466023697, 30.488811511794655),
+    "Glenn Place": (-86.65074150000001, 30.4395745),
+    "Racetrack Road Northwest": (-86.62272054136415, 30.44929678781217),
+    "Wilson Street North": (-86.57193341664404, 30.759097653827116),
+    "River Loop Drive": (-86.59634948772037, 30.825407917910177),
+    "Buck Tyner Road": (-86.45819101216617, 30.918648559675194),
+    "North White Point Road": (-86.41361155139654, 30.481972751407717),
+    "Batten Road": (-86.43535663800382, 30.82028855622117),
+    "Alpine Place": (-86.4783295239945, 30.5286654631823),
+    "Winfield Way": (-86.6718794666496, 30.41056404611183),
+    "Rose Court": (-86.48967084144482, 30.498547933201213),
+    "McFarlan Avenue Northwest": (-86.62779260009016, 30.45493101887568),
+    "Wilkerson Bluff Road": (-86.68722196690253, 30.698038872658504),
+    "Whitman Lane": (-86.601264, 30.446143499999998),
+    "Wyndell Circle": (-86.54056001545821, 30.76975563482408),
+    "Ashview Cove": (-86.4182495, 30.498054500000006),
+    "Campton Lane": (-86.51819391467887, 30.87263794547399),
+    "Osceola Drive": (-86.4961304812454, 30.386836181265785),
+    "Pine Moss Drive": (-86.65139636625274, 30.429406732122253),
+    "Revere Avenue": (-86.62198399035377, 30.437471019341626),
+    "Santa Rosa Street Southwest": (-86.62887101469599, 30.409760292202535),
+    "Revere Drive": (-86.61569449999999, 30.440514),
+    "Keller Court": (-86.4408284956588, 30.511196494877204),
+    "Wilson Street South": (-86.56505322956497, 30.749465753214324),
+    "Dogwood Drive": (-86.56468147385198, 30.43455953879381),
+    "Beuge Boulevard": (-86.65950724508575, 30.442842343886905),
+    "South Avenue": (-86.60973946304028, 30.43446482254668),
+    "4th Street Southeast": (-86.60464888759468, 30.41030043021874),
+    "Sibert Avenue": (-86.50755583586039, 30.39970036561878),
+    "Amhurst Circle": (-86.40437768086092, 30.389429040233328),
+    "Mimosa Street Northwest": (-86.61483895575928, 30.425098827235878),
+    "Bonaire Cay": (-86.40257362265028, 30.383145383484273),
+    "Lloyd Street": (-86.62834837894513, 30.441967194217934),
+    "Joseph Cook Road": (-86.77225509915965, 30.710516387208617),
+    "North Will Owens Road": (-86.55760893653188, 30.880060063846177),
+    "Meadow Woods Lane": (-86.41959435106183, 30.467784547355823),
+    "Middleton Road": (-86.40713370266481, 30.77701973185535),
+    "Mc David Road": (-86.5672505, 30.8005645),
+    "Handolin Lane": (-86.57573868209278, 30.437451040735244),
+    "Antiqua Way": (-86.42184957900524, 30.480959455317368),
+    "Ray Vecchino Road": (-86.73595748642326, 30.414316626111386),
+    "May Circle": (-86.54839487550068, 30.4636842995884),
+    "Rue de Palms Drive": (-86.46539200763203, 30.49500173949396),
+    "Eula Drive": (-86.476936, 30.501989000000002),
+    "Legendary Drive": (-86.4148439684491, 30.38937253485896),
+    "Barnhill Road": (-86.53338578999971, 30.823666481157932),
+    "Tislow Drive": (-86.57804022162007, 30.714192562468064),
+    "Miller Lane": (-86.47058485493024, 30.50631298674156),
+    "Scenic Highway 98": (-86.42931799227735, 30.38291520723547),
+    "Whirlaway Court": (-86.55386300049824, 30.73268744979864),
+    "Robinson Avenue West": (-86.56477755174392, 30.74868500393513),
+    "Cedar Bluff Circle": (-86.6618865160877, 30.408777427645703),
+    "Armstrong Avenue": (-86.48775098710337, 30.520085732046276),
+    "Ipswich Circle": (-86.60440224699639, 30.454689474334486),
+    "Iowa Drive Northeast": (-86.60320915920826, 30.41754523546664),
+    "Oakwood Circle": (-86.4148671674064, 30.474243025702002),
+    "Poplar Place": (-86.47731999774616, 30.53073249927016),
+    "Waldorf Lane": (-86.73679344810988, 30.410451895960357),
+    "Elks Lane": (-86.51519474426573, 30.765386068216646),
+    "Senterfitt Road": (-86.52154130510354, 30.910416783129214),
+    "Rue d'Honfleur": (-86.500127, 30.397804),
+    "Bradford Drive": (-86.62242727003654, 30.436245064520467),
+    "Vincent Circle": (-86.47556199894854, 30.51516116949449),
+    "Melanie Lane": (-86.61043278287487, 30.46563383420919),
+    "Edge Avenue": (-86.4504743365524, 30.510739933071267),
+    "Old Carriage Lane": (-86.65437350612197, 30.467096679895768),
+    "Willie Earl Sr Drive": (-86.470068, 30.9753005),
+    "Olenes Lane": (-86.63502849364693, 30.783277149739664),
+    "Hughes Street Northeast": (-86.60465845484644, 30.419668474873074),
+    "Coral Court Southwest": (-86.62726849443662, 30.407616998929637),
+    "Old Ranch Road": (-86.6467419814401, 30.45816934409629),
+    "Sandalwood Circle": (-86.41247707097055, 30.46828369584375),
+    "Benjamin Street": (-86.57243334684065, 30.746020408178047),
+    "West Lorraine Drive": (-86.67235089387188, 30.412496860798406),
+    "Castle Road": (-86.73999017379869, 30.41377395057034),
+    "Sandalwood Court": (-86.4935634002277, 30.39511438119905),
+    "Tall Pines Street": (-86.55822260388805, 30.76063458864341),
+    "Deer Springs Drive": (-86.44437332657155, 30.753520497812005),
+    "Linda Drive": (-86.75517094435781, 30.407439846496292),
+    "Creston Barrow Road": (-86.58637011914203, 30.958055376204534),
+    "Shawnee Circle": (-86.55797590489561, 30.718397471461248),
+    "Boulevard de la Parisienne": (-86.78042832298321, 30.41503741117513),
+    "Newport Drive": (-86.54798527448767, 30.757756450179407),
+    "Rosson Cove": (-86.64465458018827, 30.737176630099942),
+    "Piedmont Place": (-86.64493046487163, 30.448827599935118),
+    "Barton Road": (-86.7509100413608, 30.832854674915495),
+    "Butler Court": (-86.56269075286734, 30.705660435089705),
+    "Rita Lane": (-86.46996541805959, 30.526089417511574),
+    "Norwich Circle": (-86.42277884742818, 30.46191843241422),
+    "Ruby Circle": (-86.65832950466098, 30.419579030272015),
+    "Oak Hill Road": (-86.58377598705255, 30.809528804451524),
+    "Rock Hill Cemetery Road": (-86.41176480504691, 30.895570664598505),
+    "Lakeview Drive South": (-86.58666144711242, 30.83025489995225),
+    "Hayes Drive": (-86.51176871036455, 30.82123314916841),
+    "Lake Drive": (-86.55149125726342, 30.7474028035237),
+    "Cashen Road": (-86.5045822405818, 30.8977229973388),
+    "Camp Ground Drive": (-86.74835899898761, 30.675885755984897),
+    "Roscommon Boulevard": (-86.44374185161489, 30.517391291674922),
+    "Cutts Drive": (-86.49534649895568, 30.516179191488543),
+    "Avon Lane": (-86.6497665, 30.415354000000004),
+    "Cadillac Avenue": (-86.50631421230749, 30.518748150799905),
+    "Bayou Woods Drive Northwest": (-86.62229819096616, 30.425443397969087),
+    "Bolton Village Lane": (-86.41560742269188, 30.49987927418508),
+    "Little John Court": (-86.46946051159182, 30.521364918571877),
+    "McCanley Road": (-86.66954182911599, 30.800027722097),
+    "Ward Cove Drive": (-86.44494648438703, 30.49321365429522),
+    "Sea Oats Drive": (-86.49153789263752, 30.392491053561624),
+    "California Drive Northeast": (-86.60179374763561, 30.41664917022964),
+    "Peregrine Court": (-86.782185, 30.410947),
+    "Skyler Run": (-86.46454133461903, 30.404715689764274),
+    "Upper Karick Lake Road": (-86.64818081585346, 30.904823306563983),
+    "De Leon Road": (-86.49173137526206, 30.47877342325473),
+    "Helms Street": (-86.47986721480555, 30.5184490158726),
+    "Merioneth Court Northeast": (-86.60538152379159, 30.456899500650405),
+    "Sunrise Bay Court": (-86.5856424358055, 30.440501959371016),
+    "Lighthouse Church Road": (-86.72254562360489, 30.756467603987797),
+    "Godfrey Street": (-86.52375653433717, 30.757222033745556),
+    "Barrow Road": (-86.46214126590523, 30.780692206749123),
+    "Windemere Court Northwest": (-86.61611000019278, 30.45163898861474),
+    "Columbia Lane": (-86.58277558299476, 30.770351808811093),
+    "Tail Spin Drive": (-86.74793589999999, 30.687165399999998),
+    "47th Street": (-86.47085868837847, 30.531825130458497),
+    "Caviar Drive": (-86.60972255085409, 30.397525484891304),
+    "West Parkview Drive": (-86.46819959228843, 30.53176212395821),
+    "Cosson Circle": (-86.5365442494213, 30.83093847372791),
+    "6th Avenue East": (-86.57130851699459, 30.771047124105884),
+    "Eagle Street Northeast": (-86.61051647865688, 30.45789979090723),
+    "Lariat Lane": (-86.64761043359289, 30.463390662119185),
+    "Coronado Circle": (-86.53655177929193, 30.723412230503172),
+    "Sawgrass Way": (-86.44459562194763, 30.406158338351727),
+    "Hassell Road": (-86.62668390743086, 30.68568820508589),
+    "Almarante Place": (-86.49783199999999, 30.9443385),
+    "Bobolink Street Northeast": (-86.61014973555397, 30.415174628256977),
+    "Richpien Road": (-86.62957408924878, 30.44757707906644),
+    "Spotted Fawn Road": (-86.74217288139442, 30.694378595199883),
+    "Forest Heights Road": (-86.62778257264735, 30.46422995003307),
+    "Echo Drive": (-86.50034355963585, 30.50763560570125),
+    "Gulf Mist Court": (-86.4765855, 30.401192499999997),
+    "Boulevard of the Champions": (-86.56007606760564, 30.434427983101454),
+    "Carmillo Lane": (-86.52410817700924, 30.857214585554363),
+    "Vat Street": (-86.478331, 30.527680500000002),
+    "Crestone Cove": (-86.41807775744238, 30.496682099930744),
+    "Innsbrok Lane": (-86.6808936699134, 30.71314356722561),
+    "Silva Drive Northwest": (-86.62069040678232, 30.417409207935968),
+    "Grand Camp Terrace": (-86.73697003800552, 30.62589467368808),
+    "Essex Road": (-86.60886605677986, 30.4450186533935),
+    "Four Flags Road": (-86.50458407313926, 30.92804889972686),
+    "Motor Pool Road": (-86.4983871, 30.47805845),
+    "Windmill Drive": (-86.6402809113388, 30.454151274310775),
+    "Gold Pond Avenue": (-86.56344141026175, 30.76733421624727),
+    "South Drive": (-86.61979001107599, 30.446385000181547),
+    "Locke Lane": (-86.5367674764642, 30.83341821852863),
+    "East Sunset Cove": (-86.43714465, 30.47526315),
+    "Sunset Cove": (-86.43662845115618, 30.476181992341257),
+    "Holly Avenue": (-86.5820714657462, 30.460667985870852),
+    "Sikes Circle Northwest": (-86.63264879731938, 30.417752536680645),
+    "Cristine Court": (-86.40134796583625, 30.45698924478858),
+    "Campbell Avenue": (-86.57251321806669, 30.704691768858662),
+    "Carroll Drive": (-86.63281399398083, 30.799644573686738),
+    "Tyler Lane": (-86.46883431126018, 30.527029065948543),
+    "Warrior Street": (-86.59775870250688, 30.775478058964257),
+    "Vierville Circle": (-86.73479145550935, 30.627351593322366),
+    "Chase Drive": (-86.45327192859213, 30.532513017427238),
+    "Rattan Palm Drive": (-86.47275668938994, 30.496735874142917),
+    "Kathy Court": (-86.65957449300629, 30.419620742590464),
+    "Sweet Water Cove": (-86.43267549741913, 30.39680252091469),
+    "Windsor Lane": (-86.60419575869588, 30.45906870575569),
+    "Oregon Drive Northeast": (-86.60100453514042, 30.418174956010635),
+    "Senner Court": (-86.558799, 30.435568500000002),
+    "Melrose Avenue": (-86.50225604587108, 30.385668939239086),
+    "Merle Circle": (-86.60583773101742, 30.433580572948028),
+    "Southview Drive": (-86.57320059678534, 30.703906858073303),
+    "Schoolhouse Lane": (-86.744613, 30.71491),
+    "Treasure Cove": (-86.41612952538257, 30.471982888689563),
+    "Artie Road": (-86.6523540024994, 30.732970269243143),
+    "Osage Drive": (-86.65347550083936, 30.437668948977414),
+    "Wood Wind Drive": (-86.41546550388668, 30.386443601288104),
+    "Bonito Avenue": (-86.60619371199545, 30.398034235409472),
+    "Shane Lane": (-86.68026815394282, 30.75959137186365),
+    "Sherwood Road Northwest": (-86.61565123552995, 30.453207638939006),
+    "Main Drive": (-86.52486916259706, 30.800880778232923),
+    "East Street": (-86.56021150000001, 30.765193),
+    "48th Street": (-86.47093047348925, 30.53278197251915),
+    "Hard Times Road": (-86.72099028869023, 30.75311755284633),
+    "Mulcahy Circle": (-86.44144594098783, 30.51646338185895),
+    "Barbados Way": (-86.41683729929866, 30.481452391346174),
+    "Okaloo Lane": (-86.4852875, 30.918547500000003),
+    "Village Lane": (-86.64708409339254, 30.441801047795064),
+    "Yellow River Log Lake Road": (-86.76231827654249, 30.665664668347098),
+    "Reeves Road": (-86.69496315991248, 30.784837708409043),
+    "Cedar Point Road": (-86.55679618952652, 30.721473260681822),
+    "Hickory Drive": (-86.74002685916626, 30.684958948994854),
+    "Berger Place Northeast": (-86.59266570053288, 30.42231010651199),
+    "Air Force Street": (-86.62521906141497, 30.447493961090274),
+    "Traxx Street": (-86.61169163423165, 30.72531818863473),
+    "David Street": (-86.60220843303438, 30.445069115668016),
+    "Northern Pine Road": (-86.63553240405064, 30.464295229981598),
+    "Joe Jordan Road": (-86.66477352704278, 30.905083536140033),
+    "Hastings Court": (-86.63238651437845, 30.435941500096312),
+    "Shoal Lake Circle": (-86.55370031453543, 30.71828901917525),
+    "Old South Drive": (-86.61207228097493, 30.79119976940867),
+    "Flag Tail Lane": (-86.46027160505469, 30.75922375032042),
+    "Vita Lane": (-86.62660097668468, 30.451436820657747),
+    "Lee Drive": (-86.67154452058776, 30.412384434199065),
+    "Leila Place Northwest": (-86.6199505, 30.420735),
+    "Balmoral Drive": (-86.43127, 30.4850025),
+    "East James Lee Boulevard": (-86.57026108462424, 30.762070659120898),
+    "Theresa Court": (-86.6286205, 30.426057),
+    "John Sims Parkway": (-86.39550728993913, 30.468268376030714),
+    "East John Sims Parkway": (-86.47102726030056, 30.51703000369273),
+    "Gulf National Sea Shore Drive": (-86.58289936507052, 30.39656261014977),
+    "Spinaker Lane": (-86.57055225453469, 30.447008531988423),
+    "Buck Drive Northeast": (-86.6002770267224, 30.414069857818884),
+    "Coconut Palm Circle": (-86.47250997421014, 30.49612671384477),
+    "Harrison Drive": (-86.71001105203602, 30.41395868732635),
+    "Wolverine Avenue": (-86.51041381055454, 30.517287213682774),
+    "Indian Bayou North": (-86.45738338598842, 30.40330942106498),
+    "Short Avenue": (-86.5607354894667, 30.754914633775332),
+    "Loop Lane": (-86.45493756716476, 30.767728690816668),
+    "Griffth Mill Road": (-86.69938885425515, 30.777394495522746),
+    "Osceola Bay Avenue": (-86.45403224730303, 30.501170771935552),
+    "Lincoln Avenue": (-86.50075111614112, 30.50906163122525),
+    "Purl Adams Avenue": (-86.56039910204096, 30.759906496149544),
+    "Lilac Court": (-86.471284, 30.509379999999997),
+    "Panhandle Drive": (-86.53059864192005, 30.696475820500957),
+    "Davis Road": (-86.39418126273416, 30.983637540582677),
+    "Boothill Trail": (-86.4363049674259, 30.750998158970923),
+    "Peacock Road": (-86.60910463419387, 30.93500057011205),
+    "Clayton Place": (-86.54497465288617, 30.458377560288636),
+    "Florida Blanca Place Southeast": (-86.60199781526883, 30.403765694713886),
+    "Tom Brown Road": (-86.497512, 30.526669499999997),
+    "Evergreen Avenue": (-86.48046593909876, 30.533085343479083),
+    "Maggine Lane": (-86.65434103497688, 30.82727350491215),
+    "Brande Court": (-86.58269616985797, 30.441497715425292),
+    "Blueberry Avenue": (-86.52513693651657, 30.761084769534104),
+    "Nicholson Street Northeast": (-86.61225599206324, 30.4188597438961),
+    "King Street Northwest": (-86.64886500447946, 30.426695453033876),
+    "West Elm Street": (-86.57357806415808, 30.764963520409914),
+    "Middle Drive": (-86.59955492864964, 30.437461206690806),
+    "Hilton Road North": (-86.67379191664115, 30.765053448876568),
+    "Webster Street": (-86.61520780658392, 30.438769484522293),
+    "Juniper Court": (-86.5641165, 30.702523),
+    "Willingham Drive": (-86.479706, 30.513008499999998),
+    "Sikes Drive": (-86.54769808941495, 30.761149641905494),
+    "Todd Road": (-86.40562158603673, 30.773506759277442),
+    "Birkdale Cove": (-86.43540793003343, 30.48215711676628),
+    "Belgium Run": (-86.7108762751962, 30.702834234231858),
+    "Sabal Palm Drive": (-86.4646451454844, 30.495678785321992),
+    "Hardie Lane": (-86.62548074165308, 30.44164860452163),
+    "Vernon Taylor Road": (-86.6588633805726, 30.761449257706918),
+    "Shotgun Trail": (-86.41480110652067, 30.768068027004485),
+    "Pawnee Circle": (-86.64462245904006, 30.433064916614068),
+    "Ward Ranch Road": (-86.6006757967911, 30.7969315468633),
+    "Sugartown Loop": (-86.60583853873247, 30.700185772343946),
+    "Choctaw Drive": (-86.49132069469147, 30.386816901988386),
+    "Will Owens Road": (-86.5494793824468, 30.857816651042064),
+    "Oak Street": (-86.63784236513848, 30.429008254211244),
+    "Sheffield Road": (-86.60957578992027, 30.439894032333363),
+    "East Pine Avenue": (-86.56457236343017, 30.763805351970547),
+    "Garden Street": (-86.56163350314328, 30.78429821477444),
+    "Rawlins Court": (-86.42900160438157, 30.480972728807874),
+    "Southern Court": (-86.55541738754212, 30.7431213580813),
+    "Marler Street Northwest": (-86.65203786029778, 30.42539867173999),
+    "Lakeside Drive": (-86.43115912262776, 30.48768807167599),
+    "Jefferyscot Drive": (-86.5844973089304, 30.7229250699857),
+    "Beachview Drive Northeast": (-86.60265726186269, 30.4289216470786),
+    "Baywood Court Northwest": (-86.6242203037042, 30.41610554151411),
+    "Hilton Road South": (-86.67555576470353, 30.76049279168388),
+    "Three M C Lane": (-86.58890068555263, 30.73400189355768),
+    "Plympton Road West": (-86.49182671335454, 30.90999010337916),
+    "Starmount Drive": (-86.5797845, 30.7940755),
+    "Vista Street Southwest": (-86.6339159976067, 30.412041611795622),
+    "Ocala Court": (-86.4503395, 30.394046000000003),
+    "Marina Drive": (-86.59868560179768, 30.446369706582036),
+    "Leisure Lane": (-86.73844489285243, 30.68285088777706),
+    "Russell Boulevard": (-86.63147142482117, 30.433675847419106),
+    "Tac Court": (-86.6119535, 30.4324755),
+    "Kehlhem Road": (-86.62503807741584, 30.440957179141087),
+    "Furling Lane": (-86.4048767664683, 30.387217972669262),
+    "Billfish Avenue": (-86.606282, 30.397218000000002),
+    "Odin Lane Northwest": (-86.642587, 30.41541),
+    "Hampton Circle": (-86.41924461875587, 30.46532380478749),
+    "Shady Grove Church Road": (-86.70051258464918, 30.77527142749316),
+    "Skynight Drive": (-86.51174862033754, 30.766310848827622),
+    "Muldoon Street": (-86.54552057637532, 30.746237979175277),
+    "Priscilla Drive": (-86.62351743341577, 30.436080748549045),
+    "Kell Aire Court": (-86.48163076039354, 30.402364144363194),
+    "East Grebe Way": (-86.39745359420914, 30.73777916951673),
+    "Oley Way": (-86.53366120369692, 30.459866886089504),
+    "Saint Joseph Cove": (-86.41746535124693, 30.47584438472945),
+    "Muskogee Lane": (-86.44900164342829, 30.39685681495065),
+    "Lido Circle East": (-86.4419780691825, 30.4874497737517),
+    "Hidden Cove Way": (-86.50098373316688, 30.50440300906584),
+    "Hidden Cove Lane": (-86.50179859574166, 30.504462898431495),
+    "Hidden Cove Drive": (-86.5016087818086, 30.50426129554873),
+    "Hidden Cove": (-86.62886877508168, 30.436547750373318),
+    "Hidden Cove Court": (-86.50190813498584, 30.505266348336907),
+    "Lisette Court": (-86.6081065, 30.4376965),
+    "Jay's Road": (-86.63395381117341, 30.77888687872402),
+    "Barrington Lane": (-86.41587406793509, 30.489878108800443),
+    "White Point Court": (-86.417541, 30.4651365),
+    "Baywinds Drive": (-86.40164812304607, 30.39561672240605),
+    "Ball Terrace": (-86.524378, 30.7972955),
+    "Summerwood Court": (-86.47709396448003, 30.52974405322691),
+    "Balboa Road": (-86.53224172016029, 30.723848794185233),
+    "Palmetto Avenue": (-86.40014216950067, 30.748544494988998),
+    "Jacqueline Way": (-86.46204694775425, 30.974611948992457),
+    "Pinellas Drive": (-86.58803458568967, 30.71810887501396),
+    "25th Street": (-86.45896971579653, 30.509690026870828),
+    "South Lorraine Drive": (-86.67033355766188, 30.411265812543206),
+    "Toluka Drive": (-86.53414721057543, 30.46204602469703),
+    "Texas Parkway": (-86.56967136378492, 30.778525645914485),
+    "West Bunting Way": (-86.40569319373293, 30.741302383059107),
+    "Gavernie Court": (-86.55390680700799, 30.704844582762707),
+    "Nap Knob North": (-86.68965626693237, 30.698912963948),
+    "Crystal Lake Lane": (-86.50921578657558, 30.528101769218186),
+    "Yacht Club Drive": (-86.46464270977316, 30.486749785080104),
+    "La Brisa Beach Circle": (-86.71691145796619, 30.410505379140226),
+    "Nakina Drive": (-86.53668169931363, 30.461630535243593),
+    "Okeechobee Road": (-86.49918570144217, 30.490014059331454),
+    "Monterrey Road": (-86.53841400524185, 30.761615006461593),
+    "Maggie Lane": (-86.65395693543269, 30.828819385053706),
+    "Stacy Circle Northeast": (-86.59715743617951, 30.413246823664807),
+    "Gleneagles Drive": (-86.43086826248282, 30.480271042427717),
+    "Luverne Street Northeast": (-86.61254165703767, 30.422136750137014),
+    "Yosemite Way": (-86.65109288224532, 30.857368795146677),
+    "Randy Drive": (-86.49323869972748, 30.805053595381644),
+    "Boxer Avenue": (-86.48032709722779, 30.51380100184857),
+    "Garniers Post Road": (-86.60057734961666, 30.458603840164113),
+    "Sundew Street": (-86.51355758436755, 30.821501152084075),
+    "Pinewoods Drive": (-86.5288898927231, 30.763021103693852),
+    "Stokes Road": (-86.46138724586639, 30.97625387128324),
+    "Bennett Avenue": (-86.69312841983869, 30.422576601574413),
+    "Joe's Bayou": (-86.49164459497865, 30.41014973840491),
+    "Kensington Court": (-86.54070036805086, 30.717723991939724),
+    "Tommy Eiland Road": (-86.7368427478983, 30.770639002966114),
+    "Cades Cove": (-86.55830126547697, 30.72373431951188),
+    "Oak Harbour Lane": (-86.47662746432873, 30.41014143397265),
+    "Jack Powell Road": (-86.42565535875066, 30.800116489758256),
+    "East Chestnut Avenue": (-86.54172200618041, 30.750813586377372),
+    "Dowdy Road": (-86.67552621595739, 30.96696571837186),
+    "Apache Drive": (-86.43768199052151, 30.766338067140165),
+    "Allen Avenue": (-86.4808442110433, 30.516662667436545),
+    "Basil Drive": (-86.6338262736013, 30.79498144470301),
+    "Sleepy Oaks Lane Northwest": (-86.6134007210382, 30.427517589716324),
+    "Commons Drive East": (-86.42831262222755, 30.390325276057496),
+    "Griffith Road": (-86.74545668990079, 30.721506470587236),
+    "2nd Avenue": (-86.49225199916403, 30.406781507397493),
+    "Second Avenue": (-86.74900176543655, 30.715679503535885),
+    "Carson Drive Southeast": (-86.60770339484371, 30.409712221448977),
+    "Huntington Circle": (-86.4224958441338, 30.508021735762245),
+    "Cloverdale Court": (-86.64132599401374, 30.453642361772435),
+    "Gibbs Drive": (-86.52802486032635, 30.807331419513307),
+    "Salvadore Drive": (-86.58054540935163, 30.77481529965673),
+    "Dunwoody Place": (-86.6499292867322, 30.441600171822966),
+    "Jason Drive": (-86.44285582276102, 30.53198017315383),
+    "Mira Flores Court": (-86.39980205371003, 30.38215038965152),
+    "Hill Drive": (-86.59631899987254, 30.770974513436638),
+    "Kit Fox Valley": (-86.61732822354142, 30.724621158978106),
+    "Calle Rio": (-86.64887051199166, 30.40817484636542),
+    "High Grove Court": (-86.6435526346381, 30.444961008362426),
+    "McLaughlin Avenue": (-86.57071450594371, 30.774074327903545),
+    "Bay Drive Southeast": (-86.58833965815323, 30.409580051850707),
+    "Paraiso Boulevard": (-86.42761840432202, 30.38973355534039),
+    "Yohn Road": (-86.67659567876439, 30.75628788391947),
+    "Lane Drive": (-86.66169149999999, 30.4105299),
+    "Whitewood Way": (-86.4151268295723, 30.47706250088485),
+    "Territory Lane": (-86.62380419048881, 30.72239153318141),
+    "Millside Road": (-86.45934283540372, 30.92829068494816),
+    "Thurston Place": (-86.61000269844436, 30.77450582261056),
+    "Tarpon Road": (-86.73864085580534, 30.408703615921375),
+    "Ross Clark Road": (-86.45638959791457, 30.9194828570767),
+    "Lido Circle West": (-86.4445080165087, 30.487160683368675),
+    "Yellow Pine Court": (-86.44479200626593, 30.512795381459114),
+    "West Grebe Way": (-86.40677974982718, 30.738370754649004),
+    "26th Street": (-86.45928829905431, 30.511419521870756),
+    "Highway 4": (-86.71331486414394, 30.814448827380737),
+    "White Oak Drive": (-86.51519784365048, 30.79629789150707),
+    "Cole Lane": (-86.7606729549777, 30.71604611002413),
+    "Royal Palm Drive": (-86.4720668715458, 30.495116149516324),
+    "Greenbrier Drive Northeast": (-86.6034185800074, 30.4299836390281),
+    "Higgins Lane": (-86.59510523866912, 30.76920856760735),
+    "Combs Manor Court": (-86.6638438257951, 30.425942646949512),
+    "Mercie Lane": (-86.55913151773616, 30.77178034625595),
+    "Green Street": (-86.5661040544454, 30.764183321709275),
+    "Royal Street": (-86.54470964513257, 30.77464345841747),
+    "Fleshman Drive": (-86.49872222616142, 30.40037363897883),
+    "Kristin Circle": (-86.4467347785398, 30.521868146340385),
+    "Apachee Road": (-86.59749864415004, 30.782931819595436),
+    "Chinquapin Drive": (-86.53534116905817, 30.46248946304327),
+    "Boutwell Road": (-86.41144435927912, 30.966325870303905),
+    "Rockford Street": (-86.49584507456015, 30.507825603225672),
+    "Stephen Drive": (-86.43405729920498, 30.512426828230648),
+    "Flamingo Drive": (-86.50082348024628, 30.401330500037012),
+    "Crystal Court": (-86.40372461001039, 30.457034842597082),
+    "Norman Riley Road": (-86.79001405222076, 30.806329134434836),
+    "Carlton Street": (-86.56253598044941, 30.763277499778766),
+    "Pate Road": (-86.45420146310482, 30.916638908421096),
+    "Sienna Trace": (-86.39729, 30.392684500000005),
+    "Cecelia Drive Northwest": (-86.62968673578587, 30.41519737722499),
+    "Buddy Phelps Drive": (-86.50579845233673, 30.518197265394313),
+    "Skyline Circle": (-86.55596500633676, 30.70875409888151),
+    "Shalimar Lane": (-86.55385031716561, 30.441232065546448),
+    "Drew Court": (-86.44111191506843, 30.51263602886962),
+    "Kidd Street": (-86.61192789950282, 30.423986848169893),
+    "Old Hwy 10": (-86.5008751925414, 30.48749543199732),
+    "Wakissa Cove": (-86.40345131225766, 30.392095346265545),
+    "Meigs Drive": (-86.4807551228043, 30.503682077816094),
+    "Peachtree Way": (-86.47958764603189, 30.53282830538967),
+    "Fox Hound Lane": (-86.66123244263537, 30.757518043745318),
+    "Kent Lane": (-86.48688497111688, 30.398779001734713),
+    "Lake Way Drive": (-86.44907940441682, 30.522799615999965),
+    "Providence Way": (-86.41733575, 30.479224),
+    "Cordgrass Court": (-86.47386364243913, 30.391612679787638),
+    "Siesta Bluff": (-86.400960951012, 30.38245655410541),
+    " D Avenue": (-86.50320989471977, 30.481984584249773),
+    "Georgetown Lane": (-86.65397875897193, 30.465152768275264),
+    "Sharon Court": (-86.65954999269131, 30.420391787874255),
+    "East Parkwood Lane": (-86.41725927674152, 30.488542442627654),
+    "Paschel Street": (-86.76398531288507, 30.41132719711548),
+    "Alderwood Way": (-86.47960932751876, 30.532132259612812),
+    "29th Street": (-86.48198725545444, 30.51472172457767),
+    "Risen Star Drive": (-86.55199027725882, 30.731523773228226),
+    "Broiderick Road": (-86.71959353538882, 30.721168772564567),
+    "Santee Street": (-86.5171462080861, 30.818049506562126),
+    "McMillan Drive Street": (-86.70585212274584, 30.414350277625914),
+    "Skeeter Lane": (-86.69008457844686, 30.743299832451576),
+    "Tommy Lane": (-86.75284741456737, 30.41065838312196),
+    "Commons Drive West": (-86.44816284700656, 30.390660512133223),
+    "Bent Creek Road": (-86.56303606458621, 30.76838799070398),
+    "Mockingbird Hill Court": (-86.45965711289708, 30.819316825847643),
+    "Windsong Court": (-86.42568597476709, 30.471146386141314),
+    "Seclusion Boulevard": (-86.57742050089625, 30.759742291949852),
+    "Bayou Lane": (-86.46905503273064, 30.49909785626186),
+    "Village Way": (-86.42016009450103, 30.387893678124712),
+    "Earl Campbell Road": (-86.48987078615833, 30.960069279437768),
+    "Opp Road": (-86.60721000526213, 30.42019150048584),
+    "John Nix Road": (-86.43390374210003, 30.814251018550785),
+    "Walden Street": (-86.56265536939192, 30.748651045380118),
+    "Pelham Road": (-86.62628749999999, 30.4346575),
+    "Spring Lane": (-86.48494227527799, 30.39979629088454),
+    "Weatherly Drive": (-86.5793225, 30.715604500000005),
+    "Peaden Bridge Road": (-86.7196454961878, 30.881136385634782),
+    "Skyhawk Drive": (-86.5114993701104, 30.76589495274571),
+    "27th Street": (-86.46758108628707, 30.51251934035779),
+    "Fox Avenue": (-86.70179087808324, 30.421573175262996),
+    "Walters Drive": (-86.70894995, 30.41272865),
+    "Industrial Park Road": (-86.48067533406964, 30.39577662915869),
+    "Live Oak Lane Northwest": (-86.62926998492736, 30.427096327196704),
+    "Classic Court": (-86.64754449506673, 30.425591165088736),
+    "Chestnut Avenue East": (-86.56797743745665, 30.757068930738793),
+    "Gagnon Road": (-86.46172500000002, 30.810201999999997),
+    "Devon Court": (-86.63369599971917, 30.435681018212705),
+    "Culp Cove": (-86.64889314999999, 30.441233999999998),
+    "Kumquat Avenue": (-86.46728723331931, 30.505450362225712),
+    "Shirley Drive Northwest": (-86.65225919000991, 30.42526335021806),
+    "4th Avenue East": (-86.5706019270124, 30.76897176683857),
+    "Principal Lane": (-86.63170185737086, 30.45131256424862),
+    "Howell Drive Northwest": (-86.61904548784443, 30.426055931328865),
+    "Radiant Circle": (-86.74942755450417, 30.40466014793574),
+    "Fairway Court Northeast": (-86.61079144857585, 30.453282464719578),
+    "Edgewater Drive": (-86.43268648931975, 30.50887760895905),
+    "Staff Road": (-86.59202357453752, 30.808736141832632),
+    "Temple Avenue Southwest": (-86.63199033929698, 30.41051020544109),
+    "Madison Avenue": (-86.50152700044615, 30.5056764671733),
+    "Corbin Road": (-86.74571984436622, 30.711625815841007),
+    "Angelfish Avenue": (-86.60135869745893, 30.39679942056813),
+    "Cherokee Road": (-86.58351191839145, 30.438287488049976),
+    "Santa Rosa Court": (-86.62903692211152, 30.399117622676965),
+    "Barrow Lane": (-86.75294125680573, 30.675175419478396),
+    "Poplar Avenue": (-86.5830280081269, 30.458511650036066),
+    "Dorchester Place": (-86.56492185, 30.81080405),
+    "Kimp Road": (-86.39592633398996, 30.752705011491823),
+    "Garrett Pit Road": (-86.60652962877258, 30.7114455335706),
+    "Anchors Street Northwest": (-86.65837293758048, 30.42228336201423),
+    "Laurel Lane": (-86.51235318129638, 30.818904468241076),
+    "Kay Cove": (-86.65757878994098, 30.433910072819703),
+    "Nivana Drive": (-86.5879378836719, 30.71105832697572),
+    "Mosley Lane North": (-86.5531632, 30.796313500000004),
+    "Norman Drive": (-86.6453957363928, 30.451754876535414),
+    "Sonoma Circle": (-86.41663618487833, 30.462840232459858),
+    "Rosebud Avenue": (-86.39727815309051, 30.74659542626056),
+    "Kilcullen Drive": (-86.44634551976937, 30.518720214417424),
+    "Virginia Drive Northwest": (-86.63689918229191, 30.42245437800004),
+    "Dartmouth Way": (-86.4746035921171, 30.532215149546506),
+    "Stamford Avenue Northeast": (-86.60408385665346, 30.45995560320785),
+    "Grandview Avenue": (-86.48875619827788, 30.495000287686253),
+    "Duff Lane": (-86.50158606114343, 30.74963070073847),
+    "Antler Way": (-86.5859125, 30.7971565),
+    " Ash Drive": (-86.55712129327524, 30.458026669768664),
+    "Riverchase Boulevard": (-86.59104205750283, 30.710043772485154),
+    "Lamar Drive": (-86.7301981390297, 30.410781472369234),
+    "Spencer Place": (-86.4975595, 30.506203499999998),
+    "Lakeview Drive": (-86.58597756385429, 30.7681177737502),
+    "Cotton Creek Road": (-86.63269870312318, 30.820347030649856),
+    "Tom Sawyer Lane": (-86.5890987216367, 30.7068973717561),
+    "Kristin Cove": (-86.4011317358417, 30.394007371287966),
+    "Mosley Lane South": (-86.55316604355257, 30.795434426024617),
+    "Cross Street": (-86.49951420538841, 30.407129929289155),
+    "Barataria Lane": (-86.62696162939922, 30.43626643502955),
+    "Bunting Way": (-86.39842391919328, 30.74088381677908),
+    "Canterbury Circle": (-86.4349878301371, 30.485865726510358),
+    "Dairy Road": (-86.67575158871716, 30.807516678440372),
+    "Yaupon Lane": (-86.44990702460909, 30.758603002560502),
+    "28th Street": (-86.46682851872298, 30.51346511248071),
+    "Blair Lane": (-86.6293690122368, 30.825885549853503),
+    "Oakmont Place": (-86.43679225421683, 30.47984562756224),
+    "Marina Pointe Drive": (-86.46581476408473, 30.487712020025693),
+    "McCurley Road": (-86.53119116819354, 30.8294852143836),
+    "Jonathan Circle": (-86.50544996522049, 30.518843249691084),
+    "Chantilly Circle": (-86.43134971504956, 30.478054582798),
+    "Penney Lane": (-86.55032311987875, 30.725219167730707),
+    "East Country Club Drive": (-86.45977250023962, 30.394122498185983),
+    "Downshill Circle": (-86.4487866797584, 30.51639512077667),
+    "Pelican Drive": (-86.61882246047234, 30.39881753739721),
+    "Lantana Lane": (-86.40722169082004, 30.38603273964471),
+    "Tomahawk Court": (-86.45301742912794, 30.401829465428793),
+    "Serina Cove": (-86.40351253665418, 30.39732486483268),
+    "Sound Beach Street Southeast": (-86.61195804573327, 30.402984785844158),
+    "Tsuga Way": (-86.64946585, 30.441235900000002),
+    "Brooks Street Southeast": (-86.58925861102908, 30.40660019132381),
+    "Maple Street": (-86.52671827193572, 30.840593648283733),
+    "Kennedy Bridge Road": (-86.7608611079762, 30.927761241524824),
+    "Gary Player Lane": (-86.56040112851028, 30.432856265266885),
+    "Webb Street": (-86.56946401361347, 30.764596083912142),
+    "Shell Avenue Northeast": (-86.61249417539032, 30.416585541489358),
+    "Macy Lane": (-86.75654252170048, 30.409825616254132),
+    "Curtis Madden Road": (-86.61276268067662, 30.8963266265078),
+    "Longleaf Drive": (-86.65749468292982, 30.429037815570787),
+    "Emerald Bay Drive": (-86.40038291005351, 30.39597512711167),
+    "Paradise Point Road": (-86.59295579352595, 30.452552842750595),
+    "Lee Cook Road": (-86.62475123974738, 30.89639664915979),
+    "Taylor Circle": (-86.60696209133226, 30.437973592315664),
+    "Stingray Street": (-86.42146598476708, 30.383887197666883),
+    "Ridgewood Cove North": (-86.41573490258627, 30.47298787636981),
+    "Ann Circle": (-86.48959420587283, 30.39623184161015),
+    "Black Jack Circle": (-86.57350941342114, 30.45907723751707),
+    "Sand Dune Court": (-86.47671150946766, 30.387010977797356),
+    "Linstew Drive Northwest": (-86.62519711590761, 30.428876575760004),
+    "Prince Street": (-86.63501930862334, 30.451651690428964),
+    "Deepwater Lane": (-86.45610616311728, 30.50598980642426),
+    "Lowery Drive Northwest": (-86.65469249859068, 30.438879074598233),
+    "Jackson Circle": (-86.49856567873807, 30.51087075761416),
+    "Littles Lane": (-86.59756498174946, 30.704724827497973),
+    "Bryant Bridge Road": (-86.77769753520872, 30.71517828293899),
+    "Boone Trail": (-86.43412441796286, 30.930042856017266),
+    "Pinoak Court East": (-86.54279623540806, 30.721650932760404),
+    "Holt Lane": (-86.73008125372809, 30.690155008383236),
+    "Surrey Lane": (-86.42275301936554, 30.50857478759984),
+    "Reynolds Avenue": (-86.48236159483446, 30.520157495664172),
+    "Oaklake Lane": (-86.436689, 30.4877115),
+    "Lightning Ridge": (-86.73141159678022, 30.829570394507357),
+    "Cowrie Avenue Southwest": (-86.62197821584677, 30.40763098283783),
+    "Cavalier Drive": (-86.5220036469747, 30.756862793981412),
+    "Rhett Enzor Road": (-86.63006585827436, 30.706986277290326),
+    "Osprey Cove": (-86.41721334523511, 30.50002191412263),
+    "Ridgewood Cove South": (-86.41260938191425, 30.47029035258378),
+    "Lucile Street": (-86.61058859235494, 30.424660761885654),
+    "Cobb Street": (-86.63433493147502, 30.816432149646534),
+    "Red Barrow Road": (-86.64952485238314, 30.925280505012342),
+    "Crescent Court": (-86.7351895, 30.4105425),
+    "Augusta Cove": (-86.43442514118823, 30.39151568980789),
+    "Creekside Circle": (-86.58166809457062, 30.808507942715178),
+    "Procteride Court": (-86.63095270326217, 30.462456847824022),
+    "Ego Drive": (-86.58482836671861, 30.721598932043968),
+    "Gail la Rue": (-86.65781902589278, 30.433016920177803),
+    "Dyer Street": (-86.47607404207184, 30.513546109405148),
+    "George Avenue": (-86.52625603628624, 30.756831952262356),
+    "Fennec Fox Preserve": (-86.62337859487495, 30.722349279806313),
+    "Stowe Road": (-86.75173618591276, 30.408987032161363),
+    "Dellmont Cove": (-86.41694647433916, 30.496754207394236),
+    "Sweetgum Court": (-86.47763453244444, 30.5323850491016),
+    "Bayshore Drive": (-86.47094524713543, 30.49900917107697),
+    "Regent Road": (-86.5530975, 30.735827999999994),
+    "Ridgewood Cove West": (-86.41327553404804, 30.470051951574646),
+    "Twin Bay Lane": (-86.60634045941377, 30.45264882928139),
+    "Swift Creek Court": (-86.46774293834734, 30.49514635135383),
+    "Forest Cove Court": (-86.73218901240288, 30.413046709982275),
+    "Central Circle": (-86.48869719202759, 30.912359818638095),
+    "Davis Lane": (-86.53886838937073, 30.71980664059148),
+    "Carol Avenue Northwest": (-86.6410743360078, 30.424049681372274),
+    "Pottery Place": (-86.44498310530992, 30.40510158390031),
+    "Ferry Road Northeast": (-86.59830089776878, 30.414943692045338),
+    "Weeden Island Drive": (-86.46958354719347, 30.491283334466065),
+    "Brick Circle": (-86.64141202096572, 30.446506032261972),
+    "Water Street": (-86.63819045352328, 30.43123999553841),
+    "McEwen Drive": (-86.47326796458631, 30.515496488428),
+    "Wright Parkway Southwest": (-86.63924835978999, 30.41027848244986),
+    "Cahaba Court": (-86.44944561384071, 30.395598886708854),
+    "Ohio Avenue": (-86.4970031415617, 30.514188103259407),
+    "Main Street": (-86.48373236510957, 30.399006972214487),
+    "Wacissa Road": (-86.49726155130226, 30.481316054833172),
+    "Lands End Drive": (-86.50214687784512, 30.383801528988137),
+    "James Kennedy Road": (-86.52797399835377, 30.74002714505181),
+    "Buddys Place": (-86.67646325301394, 30.81792142241601),
+    "Seastar Vista": (-86.4069289033444, 30.385208566736548),
+    "Windsor Drive": (-86.5133097254744, 30.81429893626186),
+    "Kelly Road": (-86.5041129436216, 30.521510476057323),
+    "Sanders Avenue": (-86.55848135403667, 30.754140281994506),
+    "Rippling Creek Cove": (-86.453907, 30.5250815),
+    "Rogers Street Northwest": (-86.64310704242486, 30.417834054390998),
+    "Whipporwill Lane": (-86.4862707964215, 30.4015167339896),
+    "Mallard Avenue Northeast": (-86.6115339896194, 30.418082499716444),
+    "Bob White Drive": (-86.75975216832158, 30.41279954937683),
+    "Dead End Road": (-86.66239545583915, 30.75779989400862),
+    "Orchid Crest Drive": (-86.54779248934739, 30.78166248223684),
+    "Live Oak Church Road": (-86.56978069781158, 30.699256714046758),
+    "12th Avenue": (-86.57067836199747, 30.448154127876307),
+    "Heritage Way": (-86.65010281891772, 30.460049653260427),
+    "Warbler Way": (-86.53275244342466, 30.75460509395808),
+    "Victoria Place": (-86.57764272025139, 30.793884417372926),
+    "Okaloosa Lane": (-86.53478563887548, 30.753227875803795),
+    "Field and Stream Court": (-86.66528809762185, 30.799314615339775),
+    "Hi Tech Lane": (-86.63623341991892, 30.468254991705496),
+    "Fairway Avenue Northeast": (-86.610406464029, 30.45861362978238),
+    "Whisnand Circle": (-86.59506055948643, 30.70484120077105),
+    "Hicks Road": (-86.62816564272168, 30.682763583019714),
+    "Christobal Road": (-86.663349029211, 30.41395373552191),
+    "Dave Weaver Drive": (-86.41789125798866, 30.485316512436306),
+    "Hodges Street": (-86.70876985, 30.4119332),
+    "Nancy Ward Cove": (-86.416297, 30.501216499999998),
+    "Shell Drive": (-86.60246809112557, 30.778316057817452),
+    "Pinoak Court West": (-86.54505764492903, 30.721751184756258),
+    "Walkup Way": (-86.67609781070516, 30.43304018322013),
+    "Live Oak Terrace": (-86.57625517875631, 30.760343996871686),
+    "Rue de Le Roi Street Northeast": (-86.61130536973826, 30.46423923415817),
+    "Mollie Lane": (-86.71190017036663, 30.81610709527982),
+    "Schmauss Lane": (-86.7055644, 30.41417965),
+    "Bay Court": (-86.49545712251916, 30.410856314766423),
+    "Four Points": (-86.74084492241587, 30.697224997150943),
+    "Country Line Road": (-86.78919949961312, 30.84308907266826),
+    "Caribbean Way": (-86.41905153705271, 30.481737618493568),
+    "Harding Road": (-86.4628044903422, 30.50207604582776),
+    "James Destrito Road": (-86.66661463953545, 30.725966860136257),
+    "April Way": (-86.70013897073177, 30.723485976424186),
+    "Four Point Road": (-86.74262142826397, 30.697207335288557),
+    "Lost Trail": (-86.64964712192906, 30.46346199965174),
+    "South Bayshore Drive": (-86.49041771405443, 30.498916685397077),
+    "Henderson Beach Road": (-86.44745949009788, 30.38629965708024),
+    "Loblolly Court": (-86.65747411472631, 30.429703923469333),
+    "Leonard Road": (-86.63738885000001, 30.442932650000003),
+    "Chacato Cove": (-86.44588350000001, 30.491132),
+    "Cheshire Avenue Northwest": (-86.61530103837055, 30.451256306703506),
+    "South Booker Street": (-86.57109156792447, 30.753201451770536),
+    "Hunter Place Northeast": (-86.59384305209447, 30.417317247090203),
+    "Stillwater Cove": (-86.4407402586377, 30.405809823163356),
+    "Pine Alley Street": (-86.62691962558632, 30.460704474586606),
+    "Rendezvous Cove": (-86.40522436718435, 30.38392600091721),
+    "Whippoorwill Circle": (-86.48827005614523, 30.401395838269185),
+    "Eider Way": (-86.39387169295368, 30.737533919205347),
+    "Loop Drive": (-86.58592841709141, 30.714449686616273),
+    "Mattie's Way": (-86.44434941711492, 30.40384915810228),
+    "Patrician Way": (-86.65211680766326, 30.46030552946845),
+    "McCoy Road": (-86.76134565406312, 30.96746110932831),
+    "Dove Cove": (-86.48719649971946, 30.488930858920472),
+    "Hillwood Drive": (-86.54527267281117, 30.78546812473611),
+    "Callaway Drive": (-86.45008881705525, 30.528618883446093),
+    "East Washington Avenue": (-86.49164803910195, 30.508063913739512),
+    "Birkdale Circle East": (-86.43597204991275, 30.481734964955276),
+    "Pontevedra Lane": (-86.47176094497156, 30.504785944305883),
+    "Highlander Drive": (-86.71511526460148, 30.811616096933246),
+    "Jasmine Place": (-86.48659107980829, 30.489932183592902),
+    "Southwind Drive": (-86.42454724901174, 30.47740403980284),
+    "Shay-Lin Court": (-86.43776700000001, 30.496071),
+    "Scallop Court": (-86.62697771013272, 30.39793642988764),
+    "Hill Avenue": (-86.57369948094426, 30.748777611067613),
+    "Oakmont Circle": (-86.43378238336726, 30.476685340016317),
+    "Yellowhammer Drive": (-86.54011441545148, 30.78223890773635),
+    "Bluewater Point Road": (-86.44544194094884, 30.49885303971602),
+    "Rough Leaf Lane": (-86.74988388828186, 30.406785616095274),
+    "Rosewood Court": (-86.520098, 30.809533500000004),
+    "Scottwood Drive Southeast": (-86.60114504677497, 30.406154442315447),
+    "East Brook Drive": (-86.54492311312609, 30.795890802983628),
+    "North Booker Street": (-86.57411899547336, 30.756574148412138),
+    "Catherine Court": (-86.65166487569908, 30.433284018242198),
+    "Timberlake Court": (-86.74790147942898, 30.41384001537471),
+    "Tulip Avenue": (-86.39231453342842, 30.749594364895408),
+    "Hudson Circle": (-86.47517524125618, 30.504568628421968),
+    "Destin Drive": (-86.669010994371, 30.412309364469163),
+    "Kipling Drive": (-86.56293854147681, 30.70907322931447),
+    "Hillcrest Avenue": (-86.49573298752918, 30.505808683745464),
+    "Ranton Road": (-86.75424038352328, 30.71127671071356),
+    "Lukasik Avenue": (-86.69882128222311, 30.419212837294253),
+    "Rosewood Cove": (-86.41338995366608, 30.47626788717201),
+    "Marler Street": (-86.50515546222148, 30.39487615748477),
+    "Middle School Road": (-86.42423995402329, 30.40002847390242),
+    "Admiral Court": (-86.41016375228044, 30.400239380431575),
+    "Channel Marker Street": (-86.72857020245792, 30.411318811081717),
+    "Avenue du Commerce": (-86.78167581508502, 30.411073701001193),
+    "Stafford Boulevard": (-86.5402365396983, 30.794959971615977),
+    "East Miracle Strip Parkway": (-86.65264346787042, 30.409160953143676),
+    "Golf Course Drive": (-86.61793864277944, 30.728755169305433),
+    "Bird Drive": (-86.49058696723446, 30.808036194523634),
+    "Leaning Pines Loop": (-86.44557460626608, 30.399510995306056),
+    "Jennifer Court": (-86.66469649999999, 30.4338075),
+    "Quail Hollow Drive": (-86.75925790100005, 30.413866457916992),
+    "Heron Lane": (-86.48697800474443, 30.399749092900425),
+    "Katherine Street": (-86.60269534328854, 30.442222963278713),
+    "Beach Circle": (-86.4904869048663, 30.400288687471907),
+    "Girard Avenue Northwest": (-86.61705200844766, 30.425880370886016),
+    "Oxmore Drive": (-86.5404001559769, 30.767160174491647),
+    "Merioneth Drive Northeast": (-86.60558323248121, 30.456647009805085),
+    "Dolittle Avenue": (-86.56321616977127, 30.771046443951157),
+    "South Rosebud Avenue": (-86.39839559622568, 30.739408809862237),
+    "Vinings Way Boulevard": (-86.41033954129625, 30.388287537542492),
+    "Talman Trail": (-86.69822191673147, 30.74879592511967),
+    "Rosalie Drive": (-86.50272212598854, 30.384912413041885),
+    "Karen Avenue": (-86.60787740353842, 30.46225333903392),
+    "Woodlands Drive": (-86.41624914324207, 30.474393313057266),
+    "Oak Terrace Drive": (-86.56252205037843, 30.72421824527267),
+    "Mooring Lane": (-86.56725451574664, 30.44694147366148),
+    "Hidden Springs Drive": (-86.66632181210049, 30.749830663274125),
+    "Woodward Street": (-86.42715311987834, 30.38437935724685),
+    "Makron Drive Northwest": (-86.63682062406224, 30.41958947723387),
+    "Winners Circle": (-86.6167422171238, 30.875512951619818),
+    "Hunters Path": (-86.65308882525744, 30.46335697870806),
+    "Conifer Court": (-86.6546269626409, 30.42935955655442),
+    "Tyner Drive": (-86.54833983560155, 30.76070523135851),
+    "Southview Avenue": (-86.48873298426183, 30.503957458671664),
+    "Tarpon Lane": (-86.46787599999999, 30.4998955),
+    "De Little Lane": (-86.53644352544937, 30.94088779892579),
+    "Angler Avenue": (-86.60159886341613, 30.397528695174255),
+    "Antioch Road": (-86.58727469852498, 30.70454079615173),
+    "Fleetwing Road": (-86.73807144263601, 30.69448315908286),
+    "Fulmar Circle Northeast": (-86.59557509263298, 30.42164691222159),
+    "Jackson Trail": (-86.41856191171671, 30.56801400652442),
+    "Emerald Lane": (-86.64773169660918, 30.451044694175472),
+    "Lauren Court": (-86.4653401771886, 30.404423442792407),
+    "Trinidad Court": (-86.59803583649303, 30.776564349577168),
+    "Tall Pines Trail": (-86.567507, 30.437274000000002),
+    "Higher Ground Road": (-86.48953669199035, 30.887472632053164),
+    "20th Street": (-86.46631112396042, 30.505744552035203),
+    "Northwest Butler Drive": (-86.66850541297721, 30.427363167459035),
+    "Birkdale Circle West": (-86.43665481984544, 30.482411372258834),
+    "Forrest Avenue": (-86.52929681425037, 30.76453811243654),
+    "Covington Place Northeast": (-86.60793549969152, 30.456267016400897),
+    "Southgate Drive": (-86.56544283786404, 30.721350822246492),
+    "Saint Anne Cove": (-86.41942750085339, 30.477796174053772),
+    "Crosswinds Landing": (-86.6354155410729, 30.462878131015206),
+    "Forest Road": (-86.43908078038243, 30.52469141655894),
+    "Kendrick Lane": (-86.48192749940448, 30.515598551588738),
+    "Vucovich Drive": (-86.41512105040965, 30.483192750409394),
+    "Melvin Holly Road": (-86.78316622390388, 30.87900989834331),
+    "Sand Myrtle Trail": (-86.4436112674256, 30.40624796425837),
+    "Crestwood Street": (-86.64501351513958, 30.41233731709905),
+    "Parkwood Circle": (-86.41468427754437, 30.487665759387568),
+    "Julia Street": (-86.64122499999999, 30.4578655),
+    "Mayflower Court": (-86.61862715000001, 30.43850814965198),
+    "45th Street": (-86.46901898590517, 30.530141666249566),
+    "Cove Drive": (-86.6069206027321, 30.431742948710973),
+    "Roberts Road": (-86.56723123655453, 30.799129773589645),
+    "Paddock Circle": (-86.57034219382658, 30.807537487920968),
+    "Ross Road": (-86.61381948356252, 30.44043597130468),
+    "Gap Creek Drive": (-86.64074887414759, 30.43004701117106),
+    "Highland Hills Road": (-86.47377275785331, 30.784182083282765),
+    "Kats Court": (-86.46352372144729, 30.404427683878332),
+    "Shoffner Avenue": (-86.55367240831626, 30.745304383685408),
+    "Grove Street": (-86.5519078, 30.7973769),
+    "Vine Avenue Northeast": (-86.60204297830188, 30.413622499410582),
+    "Commerce Drive": (-86.55833825, 30.7907906),
+    "Moore Street": (-86.46040590024167, 30.505763611087527),
+    "Garnet Place": (-86.39840443101723, 30.3959437018832),
+    "Bama Lane": (-86.55195431534007, 30.799741827432488),
+    "Parkwood Square": (-86.4148983074927, 30.484697712053677),
+    "Wells Avenue": (-86.52667721532399, 30.761757529007493),
+    "Brooks Avenue": (-86.63644399162928, 30.452617275979467),
+    "Broken Arrow Court": (-86.45550090131813, 30.39221471263336),
+    "Douglass Avenue": (-86.54999587464026, 30.771106489158765),
+    "Mattie M Kelly Boulevard": (-86.47118361219906, 30.39346378393978),
+    "Zachary Lane": (-86.61011326128181, 30.450298149381183),
+    "Hasty Lane": (-86.45689223825715, 30.497740223300223),
+    "Iowa Street": (-86.50386759735484, 30.516483482712175),
+    "Phyllis Avenue": (-86.47300267295697, 30.51123918714948),
+    "Magnolia Court": (-86.56540991233997, 30.782313704510067),
+    "Blenheim Road": (-86.58889603352092, 30.46082400625104),
+    "L Adams Road": (-86.77092567972691, 30.72998912569978),
+    "Brinkley Court": (-86.60687300000001, 30.447248000000002),
+    "Welaka Court": (-86.44924, 30.3979475),
+    "Government Avenue": (-86.509781830571, 30.51457772886482),
+    "Ivy Avenue": (-86.46894934111215, 30.53334404646668),
+    "C and C Drive": (-86.52912103442442, 30.821086416322906),
+    "Boggy Bayou Court": (-86.48658000980083, 30.518008174522134),
+    "Akron Street": (-86.49883327425243, 30.514596088723764),
+    "Snook Road": (-86.75386778926223, 30.409325321889234),
+    "Bud Moulton Road": (-86.55446354823498, 30.81317258818178),
+    "Keystone Road": (-86.72178769055505, 30.413299006181376),
+    "Mainsail Drive": (-86.44262990243877, 30.495438360332937),
+    "West Dodson Road": (-86.71850893652712, 30.76620364392896),
+    "Jam Lane": (-86.54509204762789, 30.807932303486286),
+    "South Karick Road": (-86.650914498425, 30.891924294868794),
+    "Squirrel Haven Road": (-86.73925951261522, 30.413692582373244),
+    "Harris Street": (-86.73293950917925, 30.4133371855145),
+    "Steves Place": (-86.60120283700051, 30.775558735354135),
+    "Menzel Street": (-86.49771697506212, 30.510952110421165),
+    "Aurora Street": (-86.50496304669505, 30.51411288057884),
+    "Argyle Court": (-86.64988880126398, 30.415198775101647),
+    "Ed Brown Street Southwest": (-86.61724338036588, 30.41049688968866),
+    "Doyce Drive": (-86.64949698297656, 30.4594297918937),
+    "31st Street": (-86.48241934878601, 30.51606484733151),
+    "Coral Drive Southwest": (-86.62873140261215, 30.40809540621341),
+    "Pine Lake Drive": (-86.47169625521504, 30.513896750742916),
+    "Christen Court": (-86.65007779999999, 30.445385899999994),
+    "Mattie Kelly Boulevard": (-86.47572049252517, 30.389304780601776),
+    "West Choctawhatchee Drive": (-86.4048829564576, 30.456822819220783),
+    "Bayshore Court Northeast": (-86.60000002075098, 30.420758500691697),
+    "Industrial Park Lane": (-86.47823502106553, 30.3953750085415),
+    "Pembrooke Court": (-86.42345816648712, 30.46528458070407),
+    "Potomac Street": (-86.614834, 30.439112),
+    "Felecia Drive": (-86.583614, 30.7165495),
+    "Georgia Street": (-86.57023764161134, 30.772041463317283),
+    "Laws Drive": (-86.65687486280065, 30.408690099921667),
+    "Chesapeake Ridge": (-86.6309317095969, 30.463702090700487),
+    "Shipley Drive": (-86.42065893718177, 30.462390325736685),
+    "Turn Berry Way": (-86.42369786795022, 30.478588138472634),
+    "Straight Line Road": (-86.52319223772807, 30.698088707376442),
+    "Blake Avenue Northwest": (-86.66462721168773, 30.423463475611285),
+    "Anderson Street": (-86.57323713860472, 30.768477425739427),
+    "Pearl Street South": (-86.56241209406687, 30.7489025767524),
+    "Bahama Street": (-86.75248015891465, 30.6886011529867),
+    "Youngblood Road": (-86.68682445383206, 30.962396272101735),
+    "West Danielle Court": (-86.781408, 30.410965500000003),
+    "Hollywood Boulevard Northeast": (-86.595361309182, 30.412072811786086),
+    "Kissam Street": (-86.7010427122079, 30.409971300670154),
+    "46th Street": (-86.47079823895005, 30.5308576942268),
+    "Euchee Circle Southeast": (-86.5910989600963, 30.409324140957864),
+    "Postl Road": (-86.48125594183175, 30.479545667101075),
+    "Bridgeport Colony Lane": (-86.64279634136169, 30.441909763134753),
+    "Peacock's Point Drive": (-86.4952353092321, 30.412910588701017),
+    "Willow Lane North": (-86.4992617330205, 30.817261459583385),
+    "South Ferdon Boulevard": (-86.56824449999998, 30.7583529),
+    "Pinchot Road": (-86.55458042766817, 30.46466253053217),
+    "Lakota Drive": (-86.7139139592964, 30.704616077372265),
+    "Springtime Road": (-86.74759612054548, 30.720563114487213),
+    "Jennings Trace": (-86.69900464368835, 30.732342906426055),
+    "Waterway Lane": (-86.59687785057474, 30.44230329864326),
+    "Scott Lane": (-86.62278455999135, 30.444675323990325),
+    "Gospel Road": (-86.63208856766515, 30.461049378202457),
+    "Blueberry Lane": (-86.55655008703054, 30.815152687883685),
+    "Point Comfort Court": (-86.65515433831605, 30.40854245168157),
+    "Shalimar Drive": (-86.58271617015866, 30.446384881637282),
+    "Robys Drive": (-86.72202581636164, 30.41311451045351),
+    "Malone Drive": (-86.56514593110273, 30.750223380544114),
+    "Titleist Lane": (-86.55938862513901, 30.704769636205356),
+    "Bobby Drive": (-86.58419126070905, 30.71508848079569),
+    "Saint Mary Avenue Southwest": (-86.61925495880978, 30.405621627854618),
+    "Bristol Cove Road": (-86.7604115954161, 30.41015507927877),
+    "Harper Road": (-86.50590544732768, 30.93426126882662),
+    "Blakely Avenue": (-86.57067465934433, 30.74775472303791),
+    "Bentwood Lane": (-86.65425947560422, 30.46782381076936),
+    "Mills Landing": (-86.65121095, 30.44513175),
+    "Curlew Street": (-86.39314549096686, 30.740068758078642),
+    "McIntosh Court": (-86.71158062010633, 30.41002404814415),
+    "Seattle Slew Court": (-86.55437700792498, 30.733544497309676),
+    "Hare Street": (-86.52619470008966, 30.760323566080245),
+    "Dumaine Court": (-86.64423199999999, 30.436728500000005),
+    "Ray Cotton Road": (-86.77284173222377, 30.84308699930068),
+    "Echo Circle": (-86.65297630581479, 30.429078970563708),
+    "Vincent Street": (-86.6271079698892, 30.45141663583289),
+    "Wildwood Street": (-86.79277239358464, 30.412893596718902),
+    "Gardner Drive Northeast": (-86.59125164922838, 30.417404256319752),
+    "Carmel Drive": (-86.64792684196301, 30.442323063166402),
+    "Green Acres Avenue": (-86.64688319999999, 30.454436049999998),
+    "Kellie Drive": (-86.54735138975707, 30.7812950285553),
+    "Bayou Drive": (-86.43844150000001, 30.507964),
+    "Bryn Athen Boulevard": (-86.6507974227684, 30.417423289392787),
+    "Long Drive East": (-86.55854872011702, 30.767823713846273),
+    "Kaylee Lane": (-86.5392015, 30.769849),
+    "Brewer Circle": (-86.64316298866227, 30.411301154464546),
+    "Julie Street": (-86.6065091202364, 30.444065829874116),
+    "Swan Lane": (-86.64123572013163, 30.456404908530104),
+    "Milligan Avenue": (-86.64079000233481, 30.7515388192554),
+    "Cornwall Terrace": (-86.6504815, 30.418771999999993),
+    "Cobbler Lane": (-86.54442000957822, 30.80754870297562),
+    "Wadsworth Road": (-86.64142499694918, 30.752418001321136),
+    "North Lorraine Drive": (-86.67017052928286, 30.4134321583503),
+    "Turner Road": (-86.69240145153007, 30.97978241756864),
+    "Clearview Drive": (-86.46642098744168, 30.818437185659135),
+    "Skyline Drive": (-86.53220126039409, 30.76545389848775),
+    "Prospect Road": (-86.5622469783046, 30.77672019347959),
+    "Bland Street": (-86.7074822, 30.41306805),
+    "Hospital Street": (-86.47050839477457, 30.51589159165405),
+    "Piney Creek Cove": (-86.45545507998011, 30.52790374304851),
+    "Nancy's Path": (-86.65409897706733, 30.46403869442154),
+    "Hart Road": (-86.48631553666068, 30.888355284503277),
+    "Brian Circle": (-86.6625881645788, 30.417657952123868),
+    "Prescott Street": (-86.5825202494071, 30.705352516249917),
+    "4th Street": (-86.49268451919643, 30.407508207621536),
+    "Mc Arthur Street": (-86.56250275005765, 30.771214314463418),
+    "Old River Road": (-86.6335024565255, 30.78685538686011),
+    "The Masters Boulevard": (-86.55913558896661, 30.44213020380978),
+    "West Trovare Street": (-86.39951695050885, 30.384591807254477),
+    "Troy Street Northeast": (-86.6085166790613, 30.421824992389407),
+    "Sunrise Court": (-86.51710077464547, 30.81208050085826),
+    "Vara Lee Lane": (-86.47912900000001, 30.9375785),
+    "Cheyenne Circle": (-86.64772247943056, 30.43320549950958),
+    "Bally Way": (-86.44098932580914, 30.516631454781383),
+    "Hollywood Boulevard Northwest": (-86.66105272944439, 30.413588117259458),
+    "North Lakeside Drive": (-86.48010110118989, 30.404429111425614),
+    "Ballyway Drive": (-86.44622539225604, 30.518292257175464),
+    "Lonnie Jack Drive": (-86.57238096418213, 30.777418678612218),
+    "Lunaria Lane": (-86.39800730394687, 30.762732992848044),
+    "Kirkwood Run": (-86.61143703143375, 30.790521629072586),
+    "Jeff Drive": (-86.57293447135012, 30.778421161153585),
+    "Randall Roberts Road": (-86.66457913334817, 30.430734713997982),
+    "Jeffrine Drive": (-86.58375062440405, 30.716222091158645),
+    "Vermont Avenue": (-86.64736225607716, 30.434882161628064),
+    "Pete Parker Road": (-86.74886791836443, 30.715432080321957),
+    "White Oak Circle": (-86.57468524741113, 30.454856634091954),
+    "Newton Road": (-86.51773668965528, 30.9509901180075),
+    "Judith Drive": (-86.50425306110346, 30.509987259915526),
+    "Marshall Court": (-86.63845469153544, 30.42686147498509),
+    "Circle Avenue": (-86.74627093572501, 30.719276449859947),
+    "Antiqua Cove": (-86.42208701896443, 30.482351910223517),
+    "Carnathan Court": (-86.64874617100118, 30.46036585620818),
+    "Pine Cone Cove": (-86.46475967654966, 30.491235707649466),
+    "Laurel Drive": (-86.65363550131927, 30.438440437439745),
+    "Plympton Road": (-86.50919212305357, 30.910150656114276),
+    "Balou Drive": (-86.5900001432628, 30.717654970201558),
+    "Jim Green Road": (-86.53171603651911, 30.842419863763855),
+    "Benoit Lane": (-86.63871721508015, 30.7639575376601),
+    "Christopher Lane": (-86.45456079381428, 30.815019692778197),
+    "Jubilee Way": (-86.4258698126302, 30.778972951297426),
+    "Karly Lane": (-86.62443385, 30.440425949999998),
+    "Adams Street": (-86.47000575881391, 30.529375573417067),
+    "Glory Place Northwest": (-86.64806468399576, 30.42227617859427),
+    "Palmetto Court": (-86.55398294962285, 30.71073398870947),
+    "Martha Street": (-86.50538738477043, 30.521196655055014),
+    "West Ponderosa Road": (-86.63359830776145, 30.466055393925625),
+    "10th Avenue": (-86.5659970557224, 30.776226571163292),
+    "Hollywood Boulevard East": (-86.65095359524834, 30.413328249709394),
+    " 7th Street": (-86.57162133588021, 30.43838141730268),
+    "Valeria Street": (-86.6320305, 30.431189500000002),
+    "La Brook Court": (-86.63151325, 30.4511501),
+    "Virginia Oak Court": (-86.64191406444534, 30.430815375916985),
+    "Shimmering Lane": (-86.75157394208219, 30.404227073556466),
+    "Pristine Water Lane": (-86.74997681890888, 30.406389960898476),
+    "Keturah Street": (-86.46651697804938, 30.511410542327607),
+    "Kenya Circle": (-86.50731029498321, 30.894688390488366),
+    "Nelson Street": (-86.56849311751981, 30.765130738484256),
+    "Tennessee Avenue": (-86.48940422044012, 30.49265007089384),
+    "West Cane Avenue": (-86.56497067702239, 30.751578491356284),
+    "Coffeemaker Lane": (-86.7135784580005, 30.979102327503867),
+    "Cook Street": (-86.49895933728416, 30.52784652156429),
+    "Jo Anna Lane": (-86.65957032301012, 30.4197529934698),
+    "Ponce de Leon Road": (-86.54428517406849, 30.755888132146637),
+    "Heron Way": (-86.39836010609633, 30.736406606321587),
+    "Lovejoy Road Northwest": (-86.65664941657778, 30.424224967676402),
+    "Taylor Street": (-86.60911204028034, 30.436209673146028),
+    "5th Street": (-86.4634082908138, 30.96595945727626),
+    "Etta Garrett Road": (-86.6395092160093, 30.74928133106969),
+    "Evergreen Place": (-86.50043493685718, 30.400010490227302),
+    "Live Oak Drive": (-86.55685650731796, 30.810374773001584),
+    "East 1st Avenue": (-86.57252218941747, 30.765852162712374),
+    "Duggan Avenue": (-86.57098551375344, 30.74428159037548),
+    "Makron Drive": (-86.66951640644362, 30.41059207312324),
+    "Lakewood Street": (-86.66324000017875, 30.41672399241975),
+    "Kelly Lane": (-86.4842707819895, 30.491449025859424),
+    "Tuscany Drive": (-86.39930249716662, 30.38513664027459),
+    "Green Road": (-86.78596034537536, 30.901586279676728),
+    "Kemp Road": (-86.4137425839464, 30.963732954325735),
+    "Shoffner Boulevard": (-86.52825132842644, 30.76052153908536),
+    "Ridge Lake Road": (-86.58610818193188, 30.787677088984744),
+    "Perdido Circle": (-86.47271893463297, 30.499336884442016),
+    "Whiteway Circle": (-86.50391947213546, 30.515234552834126),
+    "Reeves Drive": (-86.62590891288075, 30.443801694521525),
+    "Gasparilla Road": (-86.48689862194635, 30.47775373746463),
+    "Painter Branch Road": (-86.4473663155553, 30.811854302347996),
+    "Log Cabin Lane": (-86.5363142394053, 30.809211962007605),
+    "Algonquin Place": (-86.61362720001013, 30.77879346050656),
+    "Sweet Bay Circle": (-86.57174406219923, 30.458310972924963),
+    "Thunder Ridge Road": (-86.67302103033578, 30.704900172403622),
+    "Hidden Cove Circle": (-86.50091038674567, 30.504995692901698),
+    "Kruse Drive": (-86.65820239107141, 30.45889295930867),
+    "Crystal Beach Drive": (-86.4223221694945, 30.38596078003977),
+    "Laredo Avenue": (-86.4573376936488, 30.503036844415945),
+    "Mansfield Street": (-86.49831952381783, 30.516120032374694),
+    "Landry Street": (-86.646925787228, 30.451049139961018),
+    "Olive Avenue": (-86.40328548948439, 30.73911127583535),
+    "Nun Drive": (-86.58242131892267, 30.717367570965042),
+    "Calhoun Avenue": (-86.49801801327085, 30.410645787258254),
+    "Rodney Avenue Northeast": (-86.60772353148216, 30.460493519447184),
+    "Bayshore Point": (-86.48620779876033, 30.5045550128506),
+    "Doral Drive": (-86.55690576495142, 30.44404331903442),
+    "8th Street": (-86.56989480202326, 30.4410356625781),
+    "Rue de la Savoie": (-86.7811835, 30.412495),
+    "Spring Hill Court": (-86.56609203641521, 30.746783167266656),
+    "Melton Road": (-86.71912850383482, 30.798910871143505),
+    "Todd Point": (-86.402083, 30.3939895),
+    "Patton Drive": (-86.60214024041687, 30.433230903329026),
+    "Cane Avenue East": (-86.56149863147633, 30.753626670378242),
+    "Neptune Drive": (-86.73531014067986, 30.410527301027805),
+    "Reddin Brunson Road": (-86.5070433056999, 30.40114022861289),
+    "Cahaw Circle": (-86.39968298082995, 30.740127217089718),
+    "Riley Court": (-86.54213100000001, 30.723573000000002),
+    "Airport Road": (-86.4730910859866, 30.394958489541843),
+    "Radford Court": (-86.57283632618794, 30.438083300254338),
+    "Jerry Pate Court": (-86.5622575, 30.434625),
+    "White Street": (-86.45133314703534, 30.51091491458125),
+    "Bailey Drive": (-86.46553093637417, 30.512325706293574),
+    "Andros Road": (-86.75169, 30.685042499999998),
+    "Kingston Road": (-86.58194132319413, 30.795201946860146),
+    "Twin Bay Drive": (-86.6047867954259, 30.452320626719533),
+    "Green Acres Boulevard": (-86.65105534682274, 30.45991202442624),
+    "James Street": (-86.5664115, 30.775831500000002),
+    "Chance Lane": (-86.64508533415852, 30.74286415595699),
+    "Coolwater Lane": (-86.49831112763793, 30.525464605689507),
+    "Pippin Drive": (-86.76296537662732, 30.409392568607377),
+    "Silverwood": (-86.65218455, 30.442129549999997),
+    "Jack Nicklaus Way": (-86.56024787039694, 30.432604137652636),
+    "C.B. Drive": (-86.56594626938286, 30.79585180872514),
+    "6th Street": (-86.50175089935347, 30.482334349018764),
+    "Claeven Circle": (-86.64203885, 30.442456749999998),
+    "Alonzo Court": (-86.477586, 30.527101499999997),
+    "Davis Drive": (-86.48271010640498, 30.521888842380037),
+    "Seville Circle": (-86.75525355088834, 30.41290154050978),
+    "Trudell Terrace Road": (-86.76194359816046, 30.69723804082436),
+    "Stella Lane": (-86.6413910278432, 30.42793259488493),
+    "Tate Lane": (-86.52876922478076, 30.75450949845176),
+    "Wellington Road": (-86.61272920580055, 30.43604437811232),
+    "Riverland Road": (-86.6064487012096, 30.702056990424115),
+    "Travis Court": (-86.617167, 30.7202055),
+    "Bay Cove Lane": (-86.54812213906489, 30.44582237234809),
+    "Cambridge Avenue Northeast": (-86.60609942356615, 30.456359138420794),
+    "Wiggins Road": (-86.72205723375232, 30.727343076837567),
+    "Tanglewood Lane": (-86.6048518894322, 30.759742904667853),
+    "Hopper Street": (-86.46009043667863, 30.50159366123378),
+    "Grand Oak Drive": (-86.48611855630814, 30.517665491436745),
+    "Berry Road": (-86.74517375257724, 30.714515366209717),
+    "Magnolia Lane North": (-86.46475322652414, 30.776846975073212),
+    "Saint Rose Cove": (-86.418509, 30.476848),
+    "Plumosa Palm Drive": (-86.47364325000001, 30.4952815),
+    "Brompton Court": (-86.633618, 30.461502),
+    "Loizos Drive Northwest": (-86.62333543876197, 30.417255887556497),
+    "Elmore Lane": (-86.67489284091894, 30.718304325867813),
+    "Beaver Dam Lane": (-86.46181924839979, 30.504862696636707),
+    "Phillip Road": (-86.53322776882464, 30.79647244828794),
+    "Quigley Drive": (-86.58790746241743, 30.71900237818271),
+    "Cristobal Road North": (-86.66341267014784, 30.411693961304195),
+    "Lindberg Street": (-86.58406072492814, 30.76733067862077),
+    "Irlbeck Road": (-86.624953, 30.4407775),
+    "Aster Avenue": (-86.51715999208706, 30.821564733542775),
+    "Transfer Station Road": (-86.66985720432635, 30.43482901815153),
+    "Lisa Marie Place": (-86.58829024933132, 30.457769799007778),
+    "9th Street": (-86.5680967061079, 30.446380948140156),
+    "Water Oak Lane": (-86.56334960600542, 30.723775841259645),
+    "Arrowhead Court": (-86.57491499451105, 30.45503500950637),
+    "Early Street": (-86.49714545735874, 30.525451674282646),
+    "Bramblewood Trail": (-86.51370190257859, 30.887955109708823),
+    "Muskogee Trail": (-86.6090955, 30.7706525),
+    "Dawes Road": (-86.62752315, 30.44716185),
+    "Cristobal Road South": (-86.66350631491771, 30.408974311320687),
+    "Lynn Street": (-86.6163284914776, 30.444932499751022),
+    "Falcon Place": (-86.61217750661234, 30.447603029344144),
+    "McVay Road": (-86.78453378075983, 30.861898188147844),
+    "Vista Bluffs": (-86.40906821117922, 30.38302872686381),
+    "Dan Barnes Road": (-86.67351055484855, 30.847318900011093),
+    "Linda Lane Northwest": (-86.63585700296264, 30.41521158298031),
+    "Canal Place": (-86.50123866654974, 30.387567391032164),
+    "Walter Avenue": (-86.57185511288607, 30.775938068859343),
+    "Redbud Trail": (-86.41579989199617, 30.49541424440301),
+    "North Park Boulevard": (-86.65444300894657, 30.45747884575799),
+    "Cactus Road": (-86.75464625119561, 30.409331304470488),
+    "Amelia Street": (-86.63098052620498, 30.43200884249859),
+    "Havenmist Lane": (-86.57475126793852, 30.80776912600841),
+    "Jackson Road": (-86.4902512823893, 30.47836111368501),
+    "Dabney Court": (-86.55523249999999, 30.7356765),
+    "Fuller Road": (-86.4041657347312, 30.769210952127246),
+    "Lake Silver Road": (-86.59170417534645, 30.828210936575527),
+    "Ranger Road": (-86.72655060444187, 30.413460092936646),
+    "Baggett Place Southwest": (-86.62347439682007, 30.407750211717502),
+    "Mayhair Road": (-86.53174074125583, 30.814027738814456),
+    "Meadowbrook Court": (-86.41135446524268, 30.48342779835848),
+    "Cinderella Lane Northwest": (-86.62101152023322, 30.454011579452228),
+    "Lawton Court": (-86.64728496682059, 30.445013441739302),
+    "Parkside Circle": (-86.41796481500411, 30.494519573708974),
+    "Shoal Lake Drive": (-86.55266334597033, 30.717785606587725),
+    "Chelsie Henry Road": (-86.7162053342961, 30.772060959196796),
+    "Bella Vista Road": (-86.61335187425856, 30.433903890867786),
+    "Earl Kennedy Road": (-86.53226441207279, 30.73959464223802),
+    "Elliott Road": (-86.66174831569, 30.415563489826074),
+    "Blackwater Run": (-86.45435894582008, 30.525003312539003),
+    "Long Court Northeast": (-86.59734696198369, 30.42212048418367),
+    "Simpson Avenue": (-86.70329636871578, 30.42025641510286),
+    "Barracuda Street": (-86.42033183662193, 30.383756551178198),
+    "Chesterfield Road": (-86.42542231814095, 30.75827608679059),
+    "Avalon Lane": (-86.58352527599408, 30.448050392281285),
+    "Myrtlewood Lane": (-86.41676442085729, 30.491059633135077),
+    "Rose Marie Court Southwest": (-86.6259575, 30.408443499999997),
+    "Cooper Street": (-86.75261424987477, 30.716805093617456),
+    "Etta Garrett": (-86.63944766341677, 30.75082766175783),
+    "Wilks Street": (-86.58483054999999, 30.704746099999998),
+    "Shockley Springs Road": (-86.63954334441779, 30.872215310408073),
+    "Clark-Moore Lane": (-86.7131593544035, 30.81279267671117),
+    "Chateaugay Street Northwest": (-86.6286525, 30.4250125),
+    "West North Avenue": (-86.58224782788368, 30.76973723774806),
+    "Carl Brandt Drive": (-86.58175320193855, 30.449121411255838),
+    "Magnolia Avenue": (-86.407081, 30.736376999999997),
+    "Beehive Lane": (-86.49342831812842, 30.796486012067867),
+    "Lindley Road": (-86.61064253637016, 30.786072677611152),
+    "Corduroy Road": (-86.77096423746755, 30.81664026504941),
+    "Pfitzer Circle": (-86.57789553973868, 30.70326721334966),
+    "Emmett Drive": (-86.46242035975128, 30.495445809144954),
+    "Parkwood Lane East": (-86.41784505804088, 30.488364761424577),
+    "Fairchild Road": (-86.51449897797033, 30.763069027647845),
+    "Fawn Lane": (-86.57082507289269, 30.437338348109726),
+    "South Lloyd Street": (-86.57646979159738, 30.752418169401277),
+    "Jay Bird Lane": (-86.67190152176086, 30.784122296207688),
+    "Harbor Lane": (-86.4861353549182, 30.409354661709905),
+    "Trista Terrace Court": (-86.4017975, 30.384729499999995),
+    "Ferguson Drive": (-86.63540435, 30.442876),
+    "Pleasant Terrace": (-86.51947312298739, 30.797604714452735),
+    "Edenfield Drive": (-86.6566335297881, 30.458960465628508),
+    "Matthew Street": (-86.46530354582093, 30.520983826174234),
+    "Baker Street Northwest": (-86.65377206067458, 30.425190653784515),
+    "Swan Circle": (-86.48853205263575, 30.400555434347343),
+    "Staghorn Road": (-86.43944480902007, 30.760177698972413),
+    "Autumn Avenue": (-86.74533715000001, 30.7195124),
+    "Palmetta Avenue": (-86.5448374030461, 30.723103492591452),
+    "Henderson Road": (-86.48962454724128, 30.905492698999222),
+    "Canoe Court": (-86.45627967693942, 30.401168959585345),
+    "Key Place": (-86.61138966826545, 30.469870658331494),
+    "Long Point Drive": (-86.79238947113951, 30.40781552347126),
+    "College Cove": (-86.47472570871258, 30.5346067992824),
+    "Browning Court": (-86.56138649497225, 30.712494573829314),
+    "Kennedy Drive": (-86.58506075999746, 30.770849330325888),
+    "Hospital Drive Northeast": (-86.60107900025994, 30.414496261234657),
+    "Acha Drive": (-86.7095719458526, 30.41457703299945),
+    "East Cypress Avenue": (-86.57235275032095, 30.764536533551574),
+    "South Nordberg Avenue": (-86.502377, 30.5056435),
+    "Griffith Avenue East": (-86.56535346893084, 30.75630806566953),
+    "Marion Court": (-86.43984481178134, 30.51390401991796),
+    "Serendipity Pointe": (-86.40408574403574, 30.38221237575241),
+    "Cardinal Street": (-86.62809751407237, 30.4671796013855),
+    "Riley Barnhill Road": (-86.70128801701448, 30.86490781633062),
+    "Scout Trail": (-86.65034462347631, 30.46341108593054),
+    "Spencer Drive": (-86.61463119920556, 30.43958920215861),
+    "Olin Cotton Road": (-86.6275763120316, 30.967956026129777),
+    "Averitt Place": (-86.56237568864104, 30.745887614815935),
+    "Quince Avenue": (-86.4606240903744, 30.510595942887086),
+    "Lakeview Road Northwest": (-86.61833844376767, 30.454864619013854),
+    "Mc Farland Avenue": (-86.62763523794162, 30.4512048056897),
+    "Kiowa Pass": (-86.614964, 30.775947999999996),
+    "Schooner Lane": (-86.5722034625715, 30.447044498966374),
+    "Knollwood Way": (-86.64513403365115, 30.429188370475497),
+    "Grady Baggett Road": (-86.62299905404922, 30.936912883181677),
+    "Maine Avenue": (-86.64610464423093, 30.43678555447544),
+    "Tarpon Drive": (-86.62799485718132, 30.39976586824359),
+    "Beaver Creek Road": (-86.7844808712066, 30.906321891991997),
+    "Country Club Road": (-86.55883031045674, 30.43837204678898),
+    "Oakmont Drive": (-86.43246355788988, 30.48033777716792),
+    "Johnson Road": (-86.5970322750522, 30.96824133755123),
+    "Ram Lane": (-86.55956737859624, 30.706219217830053),
+    "Carr Road": (-86.67488354293774, 30.689010883372777),
+    "Baywood Drive": (-86.45606653530562, 30.507797196142405),
+    "Mathis Lane": (-86.64907268636469, 30.451206003681822),
+    "Misty Court": (-86.47533067968756, 30.398937902245088),
+    "9th Avenue": (-86.57725780780325, 30.44484974649503),
+    "Lido Cove": (-86.44373335, 30.4855757),
+    "Rolling Lane": (-86.68565920273207, 30.720362800029555),
+    "Garfield Drive": (-86.64177138731166, 30.429098235165167),
+    "Short Bud Road": (-86.752516, 30.714824000000004),
+    "Roanoke Court": (-86.64773128203423, 30.441451399940913),
+    "Blackjack Plantation Road": (-86.66021472469689, 30.78838345191856),
+    "Tick Haven Lane": (-86.41437917650732, 30.83493337885787),
+    "Opal Court": (-86.61400605, 30.43561415),
+    "Wimico Circle": (-86.40452885646692, 30.397538540310155),
+    "Vicki Leigh Road": (-86.64569407805158, 30.444221242432494),
+    "Rocky Wood Way": (-86.44417275820167, 30.513845814888693),
+    "Waterloo Way": (-86.7819715413598, 30.40982572008976),
+    "Canidae Crossing": (-86.61980794814941, 30.721529227925803),
+    "White Circle": (-86.47713370272011, 30.515508001408516),
+    "Hillside Drive": (-86.4441245181549, 30.514965141369622),
+    "Roundabend Road": (-86.57216700095698, 30.434972574270578),
+    "Darlington Court": (-86.63445905903778, 30.438028362464678),
+    "Galvan Street": (-86.7075164, 30.413852900000006),
+    "Regions Way": (-86.42046523953682, 30.388296748011076),
+    "Parkwood Lane West": (-86.41914356707582, 30.48881374095094),
+    "North Windsor Lane": (-86.6542742323027, 30.465779040780244),
+    "Oakhill Avenue": (-86.63644432320132, 30.436729866171508),
+    "Marler Avenue": (-86.59653133677048, 30.399640651242564),
+    "Lilaberry Lane": (-86.41603186609059, 30.49859511538496),
+    "Snug Harbour Drive": (-86.58598655026495, 30.43448201865598),
+    "Teresa Court": (-86.43835387505038, 30.50991545131552),
+    "Sea Rover Lane Northwest": (-86.642618, 30.414194000000002),
+    "Allen Road": (-86.48862654510295, 30.90781537808192),
+    "Grimes Road": (-86.39691685634094, 30.972186937627846),
+    "Dee Street": (-86.64992113735752, 30.443488356640625),
+    "Summer Lane": (-86.629802, 30.44668),
+    "Beulah Street": (-86.63228501136368, 30.432030260553404),
+    "Boulder Street": (-86.58425016581052, 30.7060736381948),
+    "Diane Street": (-86.44395702284021, 30.533375142380443),
+    "North Bayshore Drive": (-86.49033776646625, 30.50292848750775),
+    "Louise Drive": (-86.59204650156882, 30.71312800216531),
+    "Forsman Drive Northwest": (-86.65409675551125, 30.421434297652034),
+    "Jeffery Avenue": (-86.65811600012972, 30.431937493752702),
+    "Mistral Lane East": (-86.6350631043825, 30.463512071773756),
+    "Flite Road": (-86.70125156094052, 30.782791930187717),
+    "North Ridgewood Cove": (-86.41595053986642, 30.473399348429563),
+    "Tamarack Avenue": (-86.45664214552377, 30.512551164739957),
+    "Fulmar Court Northeast": (-86.596011, 30.4226335),
+    "The Crossings": (-86.41197007744192, 30.482964288324954),
+    "Buena Vista Lane Northwest": (-86.622569794072, 30.454889343765576),
+    "Pinehurst Cove": (-86.43315588176311, 30.477041956264657),
+    "Whitbeck Street": (-86.70315453423821, 30.4092782592117),
+    "Crickett Lane": (-86.5724770113073, 30.823996790947515),
+    "Wild Horse Drive": (-86.59001834628562, 30.710168340325303),
+    "Auk Loop": (-86.40197542245726, 30.741901681140316),
+    "Griffith Avenue West": (-86.57149224556105, 30.75295186663015),
+    "Rachel Drive": (-86.62875726324958, 30.45400165039966),
+    "Mayo Street": (-86.47933918300839, 30.521509801196647),
+    "North Bristol Court": (-86.4193669933021, 30.462557390670042),
+    "Michelle Court": (-86.56144299939436, 30.714419101984166),
+    "Fleet Street Northwest": (-86.65497799980488, 30.420280008041168),
+    "Mariners Lane": (-86.73382839257197, 30.409907686395492),
+    "Becky Thatcher Court": (-86.589517, 30.7072445),
+    "Diviney Court": (-86.42123752554801, 30.50967002215663),
+    "Tala Way": (-86.46433705412005, 30.487964441403115),
+    "Turnberry Place": (-86.41939440083583, 30.474959079440342),
+    "Miramar Street": (-86.7496056, 30.687712650000005),
+    "Byron Court": (-86.5631655, 30.708510500000006),
+    "Garden Oak Way": (-86.42622076640258, 30.48829475946429),
+    "Palmer Drive": (-86.58661502262778, 30.721933776868074),
+    "Steele Road": (-86.71992796432588, 30.77056137000435),
+    "Muirfield Cove East": (-86.42556442823316, 30.475434761672854),
+    "Palermo Drive": (-86.62668299746055, 30.45275122944612),
+    "Powell Drive Northeast": (-86.60930379347032, 30.45885571188472),
+    "Park Place": (-86.53492279699265, 30.781947028276075),
+    "Seneca Trail": (-86.61084480984876, 30.76914795227842),
+    "Lake Emerald Drive": (-86.66701707188207, 30.72141815035796),
+    "Wallman Lane": (-86.75333073591935, 30.745833136289914),
+    "Faulk Ferry Road": (-86.62416975170994, 30.844327415281366),
+    "Sandridge Drive": (-86.490480698664, 30.80539724999762),
+    "Greendale Avenue": (-86.64792014402936, 30.45769941323736),
+    "Lowell Mason Road": (-86.48898899822046, 30.763217862632406),
+    "West Audrey Drive Northwest": (-86.64603850569614, 30.417466307512484),
+    "Dodo Circle": (-86.4007508900919, 30.739748746936094),
+    "Susan Drive": (-86.59537352462323, 30.77008657101741),
+    "Wimbledon Way": (-86.59283707667214, 30.454331816894623),
+    "Chapperal Street": (-86.54584503065489, 30.724377791409893),
+    "Bracewell Street": (-86.58140687703053, 30.76786923524772),
+    "Pine Avenue West": (-86.57365159400537, 30.759932011708386),
+    "Harrington Street": (-86.51435000438613, 30.81606654775096),
+    "Waterway Drive": (-86.66284386058058, 30.74775535512248),
+    "Mc Arthur Avenue Northwest": (-86.62676340959192, 30.425673991776232),
+    "John Avenue": (-86.43001135067087, 30.384522135387385),
+    "Post Oak Path": (-86.65055787663384, 30.46309962804722),
+    "Willow Street": (-86.50511606174487, 30.40282236856834),
+    "Woodbriar Court": (-86.60698718973656, 30.46746738043309),
+    "Lembeck Road": (-86.5189375294285, 30.830713926417115),
+    "Andros Way": (-86.42024989991137, 30.479725993253687),
+    "Ranger Street Southwest": (-86.61595367499841, 30.408550731819904),
+    "Sod Drive": (-86.644469, 30.453022),
+    "Sharilyn Drive": (-86.58579173611824, 30.465698608595233),
+    "Oakwood Way": (-86.41504499999999, 30.473054500000003),
+    "Adriaan Court": (-86.57544200000001, 30.439493),
+    "Hudson Drive": (-86.59895201354861, 30.445645331132415),
+    "Railroad Street": (-86.46251913097498, 30.96389895095394),
+    "High Ridge Road": (-86.46599213971625, 30.820865141607975),
+    "Pahokee Lane": (-86.45172299999999, 30.398215500000003),
+    "Lewis Lane": (-86.70757231943458, 30.410218604142383),
+    "Pompano Avenue": (-86.61949371681588, 30.398143539028503),
+    "Seagull Circle": (-86.48967086826777, 30.39881049722659),
+    "Long Alley": (-86.56732674989382, 30.769434467835634),
+    "Seminole Street": (-86.65295500023262, 30.43983048791116),
+    "Market Avenue": (-86.4947512436656, 30.50943724012138),
+    "Lanman Road": (-86.45779746495393, 30.489825820885624),
+    "Conch Cay": (-86.40355650953377, 30.380666001469706),
+    "East Lake Drive": (-86.55478140577726, 30.435659130037134),
+    "East Park Avenue": (-86.47997373195878, 30.525185436691018),
+    "Boca Drive": (-86.41724859778469, 30.48692109279653),
+    "Crazy Times Lane": (-86.40480817238993, 30.853152091117785),
+    "Richbourg Avenue": (-86.58153385752964, 30.448336461610857),
+    "Mistral Lane West": (-86.63611619943437, 30.463564496214783),
+    "Florida Place Southeast": (-86.60616236922695, 30.404211151149546),
+    "Kate Court": (-86.41343644819544, 30.487159730579883),
+    "Cimmoran Road": (-86.43366440002616, 30.761021000493454),
+    "Caswell Place": (-86.56504850517624, 30.758369890037855),
+    "Quail Ridge Drive": (-86.46823265113942, 30.390852219523964),
+    "Dixie Road": (-86.48346475616377, 30.48004115311095),
+    "Porpoise Avenue": (-86.61839146183557, 30.3983264348986),
+    "Coleman Street": (-86.57946658498726, 30.766549237353924),
+    "Stewart Road": (-86.57061334431003, 30.99119001264288),
+    "Summit Court": (-86.41174423507006, 30.487334946943875),
+    "Jamaica Way": (-86.42376479706161, 30.483168463561988),
+    "Sandalwood Way": (-86.41224566552775, 30.469395800993325),
+    "Pinehaven Drive": (-86.78605799995098, 30.41342600495001),
+    "Muscogee Trail": (-86.60912594922003, 30.769703989543885),
+    "Brenda Lane": (-86.75781695677398, 30.41327247495167),
+    "Rush Park Circle": (-86.71923725413397, 30.41357729783006),
+    "Japonica Lane": (-86.58174699741788, 30.45356236616695),
+    "Adam Street Northwest": (-86.64414403640875, 30.41626127328035),
+    "Young Road": (-86.53731418153916, 30.724778894291745),
+    "Bullard Church Road": (-86.75652420629537, 30.950945520555592),
+    "Honeytree Lane Southwest": (-86.63612004074702, 30.407644975627225),
+    "Ed Street": (-86.6157115, 30.4433555),
+    "Eldredge Road": (-86.60053494339809, 30.462402090293846),
+    "Yacht Club Court Northeast": (-86.60444749950727, 30.421262520326923),
+    "Elkwood Court": (-86.56155973075543, 30.437831958331188),
+    "Palm Boulevard North": (-86.47374580166586, 30.521192895661056),
+    "Independence Road": (-86.68660692120554, 30.414465069624196),
+    "Nassau Drive": (-86.41855474322304, 30.479798597847456),
+    "Malcolm Tucker Avenue": (-86.59394279963308, 30.767053395692454),
+    "Starfish Road": (-86.73939727998439, 30.408730315001122),
+    "Autumn Lane": (-86.64809600000001, 30.443151),
+    "Bahia Vista Drive": (-86.45602991090719, 30.494096833143722),
+    "Muirfield Cove West": (-86.429892, 30.475182),
+    "Zadie Lane": (-86.53126678412185, 30.828528048346808),
+    "Meadow Lane North": (-86.49654647422373, 30.817612940572612),
+    "Rhonda Kay Court": (-86.62462385037482, 30.45236628144428),
+    "Hollywood Boulevard": (-86.6250519948364, 30.412776713286156),
+    "Mississippi Avenue Northwest": (-86.61618740925093, 30.420179536460616),
+    "Bear Grass Court": (-86.57364999983548, 30.458967006406038),
+    "Tara Court": (-86.56588965851361, 30.704705745051644),
+    "Tupelo Street": (-86.52508971791455, 30.814717526069582),
+    "Roxy Lane": (-86.72700877607708, 30.693459391325145),
+    "Palm Boulevard South": (-86.4741081458531, 30.505233048650073),
+    "7th Avenue": (-86.57146403765897, 30.442418083931496),
+    "Madison Street": (-86.47208487034777, 30.52789456390044),
+    "Monette Avenue": (-86.50114127007129, 30.52812831602494),
+    "Tew Avenue": (-86.5367753970496, 30.767771924889246),
+    "Memorial Parkway Southwest": (-86.63090566044647, 30.409562476336017),
+    "Pop Cole Road": (-86.62861716361621, 30.45138141527212),
+    "Middle Brook Road": (-86.70770614161309, 30.718410767938963),
+    "Forrest Court": (-86.55019250000001, 30.764729500000005),
+    "Pandora Drive": (-86.58519399344502, 30.774898017123686),
+    "Saint Lucia Cove": (-86.42370531923294, 30.487634716134348),
+    "Woodland Avenue": (-86.7873109369897, 30.41248451100653),
+    "Shalimar Point Drive": (-86.55201004712733, 30.442380906315375),
+    "Killcrease Road": (-86.7009471451716, 30.84149299847068),
+    "Old Bethel Road": (-86.5877097682433, 30.79026972079255),
+    "Oakview Cove": (-86.41879662332211, 30.49812703356837),
+    "Tee Street": (-86.47898571515526, 30.50300299408977),
+    "Christopher Drive": (-86.59266121896815, 30.714903950128438),
+    "Mary Esther Cut Off": (-86.64444545713617, 30.425204041839162),
+    "Malibu Street": (-86.56901793308802, 30.728809398821916),
+    "Harbeson Avenue Southeast": (-86.60985551331825, 30.406102500450423),
+    "Eglin Drive": (-86.5618478112825, 30.447849067546475),
+    "Blackstone Road": (-86.649656, 30.4187515),
+    "Bradford Place Northwest": (-86.64307525025887, 30.447549495524044),
+    "Cedar Street": (-86.48151380819164, 30.399293612836274),
+    "Aspen Court": (-86.65405652725448, 30.458286047053544),
+    "Glensu Lane": (-86.52490618288296, 30.754255363174746),
+    "Hogan Lane": (-86.55987709720803, 30.70972890317741),
+    "Mary Esther Drive": (-86.67809208347894, 30.412766108853337),
+    "West Hampton Court": (-86.42071395458657, 30.464864704431733),
+    "Moriarty Street Northwest": (-86.62301948172345, 30.42317896791008),
+    "Dunedin Street": (-86.54404050072195, 30.746024476352094),
+    "Will Henry Lane": (-86.68497402724135, 30.79398827817041),
+    "Race Way": (-86.63331186120624, 30.93533440474232),
+    "Santa Rosa Boulevard": (-86.59650775545391, 30.39870491883572),
+    "Santa Rosa Boulevard,": (-86.59650775545391, 30.39870491883572),
+    "Terrance Court": (-86.64979024099425, 30.461181489559007),
+    "Marquette Street": (-86.508905209592, 30.520294371114126),
+    "Boundary Lane": (-86.73509353797324, 30.689990188117328),
+    "Ten Point Drive": (-86.46060039103426, 30.76165371555255),
+    "Linwood Road Northwest": (-86.61546499233226, 30.45493484021452),
+    "Vincent Avenue": (-86.63001197691828, 30.435445479509163),
+    "Boyce Drive": (-86.56825096906947, 30.434854937677237),
+    "Corsica Cove": (-86.42691772759713, 30.489674248121997),
+    "Casper Drive": (-86.63511056653559, 30.433677112758684),
+    "Bobcat Cove": (-86.43486601814625, 30.490698660815802),
+    "Graham Circle": (-86.57727689777889, 30.76720372599298),
+    "Star Drive": (-86.60835095110241, 30.467877435186193),
+    "Canary Circle": (-86.40366698282959, 30.746494595901915),
+    "Mark Twain Court": (-86.43108294285673, 30.489900079383744),
+    "North Ferdon Boulevard": (-86.55827111218687, 30.791243293819065),
+    "Cherrywood Court": (-86.47711251120602, 30.529022694161124),
+    "Idlewild Court Northwest": (-86.61488623528551, 30.454906259478292),
+    "Poquito Road North": (-86.57084955000002, 30.47514805),
+    "Geronimo Drive": (-86.55661267423199, 30.7195738844129),
+    "Murray Lane": (-86.55214345269398, 30.797833736749926),
+    "Costaki Court Northwest": (-86.6180551721511, 30.426158769475986),
+    "Parker Lane": (-86.64734570529367, 30.747274507280913),
+    "Merritt Drive": (-86.65975399999999, 30.760858),
+    "Little John Road": (-86.7378009377488, 30.413774020260217),
+    "Loping Deer": (-86.74013051701911, 30.6951025264308),
+    "Grenada Way": (-86.41932369306969, 30.48028780978479),
+    "Elderberry Lane": (-86.47705794547134, 30.52522493372309),
+    "A-21 Road": (-86.77000806761545, 30.416688471307715),
+    "Natchez Trace": (-86.55840034502089, 30.718649752972347),
+    "Wild Boar Run": (-86.43257147685377, 30.49254203905777),
+    "Gordon Road": (-86.5138172813421, 30.93271253223246),
+    "Monahan Drive": (-86.61024833141224, 30.432679350025737),
+    "Highland Street": (-86.49837074846988, 30.506578554274874),
+    "Whippoorwill Drive": (-86.75497612894812, 30.67408957551416),
+    "Cypress Road": (-86.49191593748796, 30.479535354893642),
+    "Hudson Drive Northwest": (-86.62570755026043, 30.42386342448574),
+    "Mulry Drive": (-86.45014822677088, 30.517180905665796),
+    "Bradford Street": (-86.64427117457835, 30.447877346913703),
+    "Eadie Cotton Road": (-86.74518863131858, 30.906914594956778),
+    "Primrose Circle": (-86.50195936630975, 30.398806210343253),
+    "Shannon Court Northwest": (-86.63716831109488, 30.424688265282054),
+    "Moonstone Drive": (-86.59045650029249, 30.779377187003576),
+    "Wynnhaven Court": (-86.7882378311474, 30.408080998748094),
+    "Cove Circle": (-86.46896348454717, 30.500212180520023),
+    "East Cane Avenue": (-86.5635192424466, 30.752528987884716),
+    "Parrot Street": (-86.735706, 30.6844255),
+    "Elaine Avenue Northwest": (-86.65309866132321, 30.426215447335245),
+    "Dewey Madden Circle": (-86.59925816371982, 30.882632813722957),
+    "Oakland Circle Northwest": (-86.63496297110314, 30.414994457416498),
+    "Sara Drive": (-86.5852990287155, 30.44756089436505),
+    "Audrey Drive": (-86.52831831784911, 30.826182299529332),
+    "Asaro Court": (-86.599017, 30.446465500000002),
+    "Creek Court": (-86.46239396246214, 30.401436732212048),
+    "Higdon Court Northwest": (-86.61615972398735, 30.45243733971401),
+    "Newcastle Drive": (-86.61115316218329, 30.441320086304668),
+    "Earls Court Northeast": (-86.60223250006297, 30.45891449976991),
+    "Irwin Avenue Northeast": (-86.61124581220106, 30.422258408460845),
+    "3rd Avenue Southwest": (-86.6158643384101, 30.40698645746573),
+    "Burned Out Bridge Road": (-86.78522959792872, 30.93238533021678),
+    "Sailboat Drive": (-86.44304343206812, 30.50077877531233),
+    "Henderson Beach Drive": (-86.44736977562782, 30.389434610392815),
+    "Pansy Avenue": (-86.55097015, 30.77557425),
+    "Hutchinson Street": (-86.42599276354814, 30.38577628377588),
+    "Woodrow Street Northeast": (-86.62075747842381, 30.442421176197506),
+    "Collins Lane": (-86.678032, 30.7793385),
+    "Talquin Cove": (-86.40266085901916, 30.389155841301285),
+    "Dawn Lane": (-86.6615973609765, 30.418966029681595),
+    "Connie Drive": (-86.58681151477606, 30.468943647411447),
+    "32nd Street": (-86.4807498009187, 30.517123690263887),
+    "Rebecca Road": (-86.4319555567868, 30.809659588104587),
+    "Jamie Court": (-86.55919, 30.7698755),
+    "Mark Street": (-86.4294433400271, 30.38447919697551),
+    "Buckward Road": (-86.66483620344425, 30.78681445052458),
+    "Redith Court": (-86.6582292959388, 30.43277312158192),
+    "Ariel Court": (-86.63579446083357, 30.460435952472597),
+    "Oak Street Northwest": (-86.65921987814194, 30.42604309988587),
+    "Colt Drive": (-86.40851436238357, 30.753762726784696),
+    "Elm Avenue Southeast": (-86.59739242534633, 30.408792808416727),
+    "Wekiva Cove": (-86.40024472877602, 30.388546330781057),
+    "Court Drive": (-86.47391126366927, 30.39720245397842),
+    "Sowell Drive": (-86.5388060251043, 30.69527512576143),
+    "Park Lane": (-86.56328264841139, 30.781044061581234),
+    "Marker Cove": (-86.72917448973872, 30.411161932502083),
+    "Country Living Road": (-86.69812875360314, 30.736208513844424),
+    "Lake Street": (-86.55130431054893, 30.764764823025033),
+    "Hilltop Road": (-86.73487702684037, 30.413709069223696),
+    "West 1st Street": (-86.58616197748854, 30.766180476099745),
+    "Tanglewood Drive": (-86.65287188363182, 30.435692495785208),
+    "Comanche Drive": (-86.65534421966107, 30.44254879422683),
+    "Josey Road": (-86.56328989710188, 30.864560752974214),
+    "Mara Drive": (-86.59156243874499, 30.715948733124666),
+    "Jonquil Circle": (-86.64813947705436, 30.43147148508073),
+    "Putter Drive": (-86.4326825, 30.486342),
+    "Utah Place Northeast": (-86.59928776214095, 30.41658814609205),
+    "Pinnacle Point Drive": (-86.55857812178607, 30.703690129771683),
+    "Henley Lane": (-86.68492852103161, 30.787361301324154),
+    "Bayview Drive": (-86.58721397001223, 30.466306228283987),
+    "Emory Street": (-86.6623954752165, 30.41755448938911),
+    "South Ridgewood Cove": (-86.41202902391683, 30.470070585029497),
+    "Kildare Circle": (-86.45263594036427, 30.51817561221609),
+    "Oleander Avenue": (-86.50195500000957, 30.39863600708451),
+    "Aztec Court": (-86.6076484456035, 30.78964054032413),
+    "Spruce Street": (-86.7895250676056, 30.41098691636488),
+    "Cahaw Way": (-86.39399293305762, 30.740191618977775),
+    "Henderson Lane": (-86.68317183242593, 30.776013021248275),
+    "Andalusia Street": (-86.66199290832066, 30.410186522028866),
+    "Carey Avenue Southwest": (-86.61764261044205, 30.41198188133395),
+    "Eagle Way": (-86.39314007371884, 30.749084479184376),
+    "Olde Post Road": (-86.42393402879448, 30.462294493541645),
+    "Baycrest Cove": (-86.43576030338387, 30.40612409953414),
+    "Georgia Place Northeast": (-86.60405077390327, 30.417709498580322),
+    "Price Road": (-86.69972291874032, 30.80578488105777),
+    "Marc Smith Boulevard": (-86.47238021410466, 30.518355724419102),
+    "Sunsail Circle": (-86.41157200900606, 30.385635921547138),
+    "Pine Cone Trail": (-86.45377240668309, 30.766194307850785),
+    "Kayla Court": (-86.41703399174935, 30.386905071777196),
+    "Acadia Cove": (-86.417649, 30.493706000000003),
+    "Woodbine Drive": (-86.58957954401225, 30.789335460219213),
+    "Restaurant Row": (-86.45665887840427, 30.385823308359093),
+    "Evergreen Parkway": (-86.46820723565578, 30.814713880520248),
+    "Ries Road": (-86.52754137474271, 30.93739100622656),
+    "Windham Avenue Southeast": (-86.6065649419259, 30.409575110223624),
+    "Kepner Drive Northeast": (-86.59381634189863, 30.413979615438176),
+    "Treeline Court": (-86.6410625, 30.435767499999994),
+    "Capri Cove East": (-86.44093385593989, 30.48738781256),
+    "Summerbrooke Park Road": (-86.644494493472, 30.440287999890607),
+    "Kelly Avenue Northeast": (-86.61171001821695, 30.420343609759648),
+    "Morris Street": (-86.5292772726741, 30.7538704154699),
+    "Sean Lane": (-86.47083950000001, 30.5121715),
+    "Cyndi Street": (-86.60604509898364, 30.443688779071426),
+    "Blue Gill Way": (-86.53769945894054, 30.78180888642599),
+    "Camellia Avenue": (-86.40428485656457, 30.74683983968477),
+    "Kervin Road": (-86.4038628136662, 30.76434433944289),
+    "Smith Drive Northeast": (-86.5951265931197, 30.4168510831274),
+    "Johnson Lane": (-86.52490009781533, 30.8210829596422),
+    "New Market Road": (-86.42026878302697, 30.51199647260093),
+    "Overview Drive": (-86.53854158298864, 30.788323940859808),
+    "Lacey Lane": (-86.62437632681221, 30.734427652783697),
+    "South Central Drive": (-86.61977499500077, 30.447232739456656),
+    "Sandpiper Circle": (-86.490376359783, 30.399414883692554),
+    "Homestead Road": (-86.65771720113104, 30.820231835778152),
+    "Bucking Up Road": (-86.4993953630281, 30.962840434533824),
+    "Murphy Lane": (-86.71890696212878, 30.870067557764806),
+    "Laurelwood Drive": (-86.5162375, 30.794607),
+    "Jillian Drive": (-86.59112209880305, 30.717704020223344),
+    "West Sunset Boulevard": (-86.63375528111379, 30.43716840285495),
+    "Berrywood Trail": (-86.5141175, 30.885207000000005),
+    "Cailin Street": (-86.607815, 30.444087500000002),
+    "Richman Road": (-86.76140240905403, 30.696228953496213),
+    "Boyette Boulevard": (-86.4672016222927, 30.957048872697907),
+    "Planet Drive": (-86.48251290026492, 30.41047824480263),
+    "Piper Lane": (-86.69303568915272, 30.745465965898074),
+    "Amos Street": (-86.56241678265471, 30.755137750351928),
+    "Mill Stone Cove": (-86.55554460374127, 30.723281016606652),
+    "Sugartown Road": (-86.60560146487227, 30.705425470913738),
+    "Lesters Lane": (-86.50579261618213, 30.88358103402479),
+    "Hume Drive": (-86.70233589065221, 30.410451283325894),
+    "Corvet Street": (-86.62574335855908, 30.453997812746007),
+    "West Fern Dell Avenue": (-86.49068710304047, 30.49621600263971),
+    "Choctawatcee Avenue": (-86.50644395128363, 30.48539760994431),
+    "Bermuda Cove": (-86.42697939094789, 30.486748265574718),
+    "Iona Lane": (-86.69429556029316, 30.802927162403613),
+    "Forest Drive": (-86.61078038130474, 30.436766967777626),
+    "East 2nd Avenue": (-86.57065249560554, 30.766914660936866),
+    "Penecost Way": (-86.62290347843937, 30.440186509545036),
+    "Tupelo Circle": (-86.70702037093416, 30.418090100788508),
+    "Roberts Drive": (-86.44357677797466, 30.509652112854017),
+    "Sonora Road": (-86.47394806479258, 30.407236173279227),
+    "Wingard Street": (-86.55754287334281, 30.7532151722704),
+    "Windsor Circle": (-86.54151529146421, 30.717538208175096),
+    "Navy Street": (-86.62672455816464, 30.442020051962846),
+    "Atoka Trail": (-86.55663362170438, 30.7158100562277),
+    "Shortwell Avenue": (-86.55767608280111, 30.746593349972898),
+    "Osceola Circle": (-86.53317513565172, 30.457130131962586),
+    "Warwick Drive": (-86.5934761385356, 30.45740518304033),
+    "Mimosa Avenue": (-86.49266781698037, 30.403634216392163),
+    "South Rayburn Street": (-86.55971789776574, 30.74909672731467),
+    "Wedgewood Lane": (-86.58910044962464, 30.780377537765748),
+    "Florence Avenue": (-86.66422714263791, 30.434774594661548),
+    "Jelly Lane": (-86.544960738329, 30.808481751013545),
+    "Poulton Drive Northwest": (-86.64472069300417, 30.415129658246542),
+    "Indigo Loop North": (-86.39729333274809, 30.390821219050082),
+    "Sara Avenue": (-86.76280065810793, 30.413636424772534),
+    "Seigler Street": (-86.74632133716479, 30.714265950984352),
+    "Dolphin Road": (-86.7401252361292, 30.408662148319525),
+    "Lake Ella Road": (-86.42008181105493, 30.802838071135007),
+    "Tisa Lane": (-86.70519455, 30.693662599999996),
+    "Joan Avenue": (-86.60191499999999, 30.447125),
+    "Ruckel Drive": (-86.43988788805979, 30.521172234990157),
+    "Woodlawn Avenue": (-86.64899445488226, 30.458459779089345),
+    "Jon Street": (-86.66430750016853, 30.41960899471596),
+    "Courthouse Terrace": (-86.57140931627235, 30.76070428745922),
+    "James Peaden Road": (-86.59830287204726, 30.913029729930923),
+    "Guildford Court": (-86.64944786496491, 30.463854800520945),
+    "Enda Lane": (-86.757155, 30.4132995),
+    "Greenwood Road": (-86.66842863826265, 30.777265153113525),
+    "Kit Drive": (-86.59020237143392, 30.76377998153042),
+    "Ponderosa Lane": (-86.39756041231546, 30.768101228569808),
+    "Kathleen Drive": (-86.75303854978586, 30.40931933779711),
+    "Hickory Street": (-86.41022812810874, 30.484197195590298),
+    "Keats Drive": (-86.56302520906232, 30.710778170914303),
+    "North Audrey Circle Northwest": (-86.64496618882283, 30.423034858628164),
+    "Bridlewood Path": (-86.6505884658497, 30.463766316435787),
+    "Kris Avenue Northeast": (-86.60698257899053, 30.46153339893343),
+    "Belah Drive": (-86.65664607402371, 30.757878875885943),
+    "Rhonda Drive": (-86.46556991942442, 30.520206949379176),
+    "Ready Avenue Northwest": (-86.67033891847944, 30.419281917774853),
+    "Orlene Road": (-86.75965124631534, 30.409679278976732),
+    "Lowery Place Southeast": (-86.60625208356862, 30.40617576692249),
+    "Lee Street": (-86.62881953014428, 30.463223174805737),
+    "South Partin Drive": (-86.48300176135061, 30.51786978555573),
+    "Coldwater Creek Circle East": (-86.4564466653948, 30.52695032395095),
+    "Ocala Road": (-86.49641866371698, 30.48599202356223),
+    "Sweetbriar Station": (-86.64439094147124, 30.45773836637364),
+    "Driftwood Court": (-86.497446, 30.4032935),
+    "Coral Drive": (-86.46872050936418, 30.499864829428613),
+    "Greentree Court": (-86.654894, 30.4582925),
+    "Northridge Road": (-86.4152005540046, 30.495783032065482),
+    "Capri Cove West": (-86.44252009787567, 30.48717614767222),
+    "Vine Street": (-86.49168003802143, 30.49773050834887),
+    "Tallokas Road": (-86.59546833216945, 30.787556928565245),
+    "Rattlesnake Bluff Road": (-86.71287523015212, 30.65633314817385),
+    "East Redstone Avenue": (-86.56291564181645, 30.736962940682798),
+    "Squirrel Path": (-86.65373932232295, 30.46293209077646),
+    "Chatelaine Circle Southeast": (-86.61073992718802, 30.40923249039145),
+    "Hibiscus Avenue": (-86.40856809210301, 30.747030184658193),
+    "Darlington Oak Drive": (-86.4631670340758, 30.493297183725485),
+    "Bridges Lane": (-86.51639966927743, 30.877907382091554),
+    "Kissimmee Road": (-86.48943428310197, 30.478960713172082),
+    "Camellot Court": (-86.55659545611618, 30.763275205094242),
+    "East Walnut Avenue": (-86.56372503600538, 30.756789134475724),
+    "Indian Oaks Drive": (-86.48719558196467, 30.395893538142037),
+    "Northview Park Drive": (-86.58835983891215, 30.721296997102392),
+    "Petit Court": (-86.58137496162756, 30.438124246076026),
+    "Ashley Lane": (-86.62850687501692, 30.453888879818045),
+    "Bakke Street": (-86.70589488781404, 30.41854080317929),
+    "Post Oak Place": (-86.57544, 30.440903499999997),
+    "North Partin Drive": (-86.47712401592396, 30.522205475635865),
+    "Hialeah Road": (-86.4921561201546, 30.47698255427207),
+    "Evergreen Drive": (-86.49971776530408, 30.401119372890623),
+    "Circle Drive Northwest": (-86.63755737936357, 30.43006372916715),
+    "Holbrook Circle": (-86.63066518211042, 30.453997991881533),
+    "Parkwood Court": (-86.41590479187637, 30.488515023409168),
+    "Alden Drive": (-86.62224675403444, 30.434593894081708),
+    "Springtime Drive": (-86.74338280148173, 30.720497254709496),
+    "Hg Lane": (-86.64223327945142, 30.754826487631767),
+    "Parkway Place Southwest": (-86.63454350056594, 30.411175472939963),
+    "Parkwood Cove": (-86.4166601794931, 30.48693709527702),
+    "Frank Campbell Road": (-86.52247115063463, 30.944260835301982),
+    "Overstreet Drive": (-86.49709095526056, 30.40002599996438),
+    "Union Avenue": (-86.45626121772698, 30.50064508358957),
+    "Camborne Avenue Northeast": (-86.60839617548032, 30.45576113251717),
+    "Laguna Street": (-86.60852070937308, 30.42421217766899),
+    "Anchors Place": (-86.48011778505634, 30.515538367462096),
+    "Arbor Glen": (-86.46498079672766, 30.533399668514328),
+    "Olin Merritt Street": (-86.65761425010413, 30.76354217902133),
+    "Cedar Ridge Way": (-86.47948885545544, 30.531431905510015),
+    "Red Oak Drive": (-86.54011160951352, 30.792129084937567),
+    "Saint Croix Cove": (-86.41861445230201, 30.48391149269969),
+    "Bob Sikes Boulevard": (-86.62711485567189, 30.44567383776159),
+    "Pine Street": (-86.50401027749493, 30.40077096206854),
+    "College Boulevard": (-86.50136215004754, 30.53347808638306),
+    "Eunice Lane": (-86.65803, 30.756644),
+    "Bethany Bay": (-86.40140395503089, 30.39644580625335),
+    "Holton Avenue": (-86.6267735, 30.4548755),
+    "Rose Lane": (-86.50295631192392, 30.820546615649384),
+    "Oakdale Road Northwest": (-86.61814794121034, 30.453822600826086),
+    "Morningbird Court": (-86.46712204644302, 30.52310050728265),
+    "Pine Avenue": (-86.46155133371454, 30.505784637544778),
+    "Springwood Circle": (-86.59930496366438, 30.77116648043399),
+    "Ida Coon Circle": (-86.43782056375849, 30.49540877311741),
+    "Larry Lane": (-86.50368195302244, 30.930615439929237),
+    "Bishop Avenue Northwest": (-86.62857469536964, 30.41738018117519),
+    "West Sunset Cove": (-86.4375615, 30.475671999999996),
+    "Sexton Drive": (-86.68189222067551, 30.841007436380043),
+    "Fowler Road": (-86.40227052158829, 30.752227444463834),
+    "Captains Circle": (-86.41509633687323, 30.40121060992571),
+    "Ibis Way": (-86.64589240000001, 30.444672949999998),
+    "Greenwood Cove East": (-86.41205375073667, 30.471790790146013),
+    "Preston Posey Road": (-86.62219308876871, 30.873704506857464),
+    "Bishop Road": (-86.63457542519673, 30.464872177826727),
+    "Carriage Lane": (-86.43938878220357, 30.391468113747816),
+    "Spring Street South": (-86.56957021878351, 30.754784617145603),
+    "Parish Boulevard": (-86.74804080098527, 30.411236974470057),
+    "Coldwater Creek Circle West": (-86.45790230304634, 30.527422480396687),
+    "Selvage Lane": (-86.49331060862403, 30.811389891215125),
+    "Vardon Way": (-86.42856143193191, 30.48097665488507),
+    "Page Bacon Road": (-86.65762757614391, 30.41906616476967),
+    "Turtle Crossing": (-86.4359802464809, 30.4904617373974),
+    "Wilder Street": (-86.4292872836363, 30.51178571688652),
+    "5th Avenue": (-86.57565398719663, 30.440194782448767),
+    "Branch Hill Park": (-86.44193242885088, 30.515317134784592),
+    "Wicker Circle": (-86.49498589578393, 30.48786580465631),
+    "Walton Court Northeast": (-86.59893637895105, 30.421407715921795),
+    "Dilmore Road": (-86.6952770387426, 30.927250622154887),
+    "Scottsdale Court": (-86.67331132796107, 30.41174944707345),
+    "Tray Drive": (-86.64309399999999, 30.445027500000002),
+    "Silver Street": (-86.58790143750223, 30.83478229353446),
+    "Hester Church Road": (-86.66684299925633, 30.84005341962627),
+    "Tanglewood Circle": (-86.64975256764518, 30.43643590277757),
+    "Sly Drive": (-86.6738792001835, 30.758548195858562),
+    "Forest Grove Place": (-86.64472949236587, 30.428103602101032),
+    "Cord Place": (-86.47929744162442, 30.40555778765841),
+    "Northern Dancer Drive": (-86.5507105480679, 30.731446230239126),
+    "Ketch Court": (-86.40546555045252, 30.39224899459141),
+    "Indian Trail": (-86.47093229002645, 30.408539594742525),
+    "Fall Street": (-86.48281117300351, 30.514870168974024),
+    "Greenwood Cove North": (-86.41306066595934, 30.47364165688978),
+    "Twin Lakes Lane": (-86.47457890752655, 30.394749379253575),
+    "Hosanna Way": (-86.4562597378245, 30.760438502262215),
+    "Wildwood Court": (-86.59050786733322, 30.79169335383302),
+    "Windrush Drive": (-86.42714001872741, 30.468419854330623),
+    "Peeble Drive": (-86.51026048598399, 30.821108911102378),
+    "Shaw Avenue": (-86.59178299050367, 30.779027500026874),
+    "Deville Drive": (-86.75391170022385, 30.413856096518217),
+    "Crete Cove": (-86.427593, 30.490879),
+    "Macs Road": (-86.40977931165284, 30.776568441824367),
+    "Gilley Road": (-86.52454351266412, 30.868190239167532),
+    "Quail Path": (-86.65222300887861, 30.46351340357562),
+    "Fairway Court": (-86.61772921120055, 30.73121439264869),
+    "Buckskin Court": (-86.57314552073666, 30.79860399138774),
+    "Judson Drive": (-86.6491490202435, 30.449723879958686),
+    "Shoreline Drive": (-86.79236706267781, 30.405759164835562),
+    "Audubon Drive": (-86.6434298401381, 30.43610805111282),
+    "Greenwood Cove South": (-86.41222850000001, 30.471333),
+    "Orlimar Street": (-86.61275734244991, 30.725082603447664),
+    "Marilyn Avenue Northwest": (-86.64321027145105, 30.421694475496746),
+    "Wicker Road": (-86.49570978363754, 30.488446126843495),
+    "Apple Drive": (-86.58798656666201, 30.709031610917815),
+    "Witshire Court": (-86.63308061329249, 30.461558714054004),
+    "Friar Tuck Drive": (-86.47155452378648, 30.521206000482227),
+    "Edgewood Place": (-86.56470398445514, 30.768414438498706),
+    "Amberjack Drive": (-86.60086626251565, 30.397529808957067),
+    "Jenkins Road": (-86.63779723971194, 30.684058098352185),
+    "Culp Avenue": (-86.64861650058994, 30.441460963084584),
+    "West Hymes Road": (-86.49726329156293, 30.486626685505303),
+    "Bretton Cove": (-86.41860201395423, 30.49582030585155),
+    "Barracuda Avenue": (-86.60386260127494, 30.396958688271475),
+    "Egan Drive": (-86.6148342760765, 30.726685601436856),
+    "Apache Street": (-86.65349452107637, 30.44150238674955),
+    "Broken D Lane": (-86.44324225, 30.8056653),
+    "Valparaiso Boulevard": (-86.46718167511325, 30.50087422076299),
+    "Gaffney Road": (-86.54593860790827, 30.466854516110534),
+    "F Avenue": (-86.5051191162616, 30.479160637674273),
+    "Northridge Place": (-86.41581195073884, 30.494475072010125),
+    "Canal Drive": (-86.44735978989236, 30.509962870392968),
+    "Shirah Street": (-86.42830564222233, 30.384428934786776),
+    "Cardinal Circle": (-86.48871349999999, 30.3985885),
+    "Palmetto Palm Circle": (-86.47350280542567, 30.49667074992877),
+    "Sparrow Drive": (-86.75513702575002, 30.671638486559228),
+    "Palm Harbor Drive": (-86.59848145763682, 30.44744397157102),
+    "Woodbridge Road": (-86.42024452601491, 30.51040935560325),
+    "Abbott Circle": (-86.47594184618077, 30.513912122124),
+    "McDonald Street": (-86.5732513463548, 30.748980348949594),
+    "South John Sims Parkway": (-86.49389926798682, 30.511611560655886),
+    "Skylark Road": (-86.73738431764546, 30.412622948568515),
+    "Hampton Court": (-86.64377281961015, 30.408796250710072),
+    "Winchester Way": (-86.544101, 30.791984),
+    "Hampton Court South": (-86.4189248684732, 30.464006201251497),
+    "Pollen Court": (-86.65527850000001, 30.428485000000002),
+    "Horne Hollow Road": (-86.4936435061206, 30.81583630508002),
+    "Cedar Avenue Southwest": (-86.62498912268398, 30.407877337962855),
+    "Brackin Road": (-86.78530753544794, 30.99155791608215),
+    "Westfall Circle": (-86.70015742618614, 30.420573030554262),
+    "Troon Way": (-86.42858843909538, 30.479846944594488),
+    "Mayo Trail": (-86.59096813377218, 30.762455554551728),
+    "Peggy Drive": (-86.58244060672985, 30.712462490053344),
+    "Sea Hero Lane North": (-86.5522445, 30.734122499999994),
+    "Calatrava Court": (-86.39968700399969, 30.38245799372785),
+    "John Jones Road": (-86.71598939102144, 30.754050679124376),
+    "Blue Lake Cove": (-86.42560138369741, 30.467358637408505),
+    "Phil Tyner Road": (-86.56090981287905, 30.80291721562878),
+    "Carlin Road": (-86.63339926163309, 30.68339752507294),
+    "Shoshone Pass": (-86.60693701043807, 30.77018674139823),
+    "Whelk Court": (-86.63086838388472, 30.398198310186757),
+    "Wagonwheel Road": (-86.60258206728432, 30.454534192636995),
+    "Benning Drive": (-86.49593979390163, 30.392378948210393),
+    "White Oak Street": (-86.549439832182, 30.784026554662148),
+    "Hunter Drive": (-86.54495204109381, 30.791919200746484),
+    "Burton Drive": (-86.63102692004287, 30.6889026362414),
+    "Marnan Drive Northeast": (-86.60943587839213, 30.470152609985398),
+    "Riva Ridge Drive": (-86.54944781480188, 30.73160047612351),
+    "Linden Avenue": (-86.46636001830842, 30.500109538798124),
+    "Meadows Circle": (-86.64382077158308, 30.42912690649482),
+    "Crane Lane": (-86.59736637091741, 30.70333409923067),
+    "Empty Promise Lane": (-86.63428431822669, 30.835573752014543),
+    "Desota Court": (-86.48206769999999, 30.478682149999997),
+    "Elm Street": (-86.48135422863791, 30.51996293824408),
+    "Lindsey Lane": (-86.45309608974766, 30.52833597830762),
+    "Chestnut Avenue Southeast": (-86.60279426854478, 30.410919851175027),
+    "Lucky Lane": (-86.75711297267571, 30.41388472350133),
+    "Clear Lake Cove": (-86.42644250000001, 30.4668255),
+    "Gracie Lane": (-86.46590368921316, 30.53376543041153),
+    "Sieger Road": (-86.74823639544384, 30.71895828107881),
+    "Tamara Cove": (-86.46614421536749, 30.489933640223054),
+    "Hoover Lane": (-86.46774196541999, 30.526106805587883),
+    "Forest Avenue": (-86.60068600097148, 30.463366786791394),
+    "Rue de Palms West": (-86.4659799678042, 30.4961008453105),
+    "Hernando Road": (-86.4818433, 30.480522450000002),
+    "East North Avenue": (-86.57654848081849, 30.769631870686958),
+    "Greenwood Circle": (-86.64637166657661, 30.430038802543265),
+    "Terrill Drive": (-86.57759635808699, 30.770125855563574),
+    "Oxford Court": (-86.65700364040275, 30.4191689347429),
+    "Steeplechase Drive": (-86.55531896589436, 30.732545987961448),
+    "Riverview Loop": (-86.63375262548577, 30.68730317941962),
+    "Waverly Circle": (-86.5017920991556, 30.38630201291478),
+    "J V Woolley Road": (-86.46902392001797, 30.78422764722547),
+    "Ironwood Drive": (-86.65331353427624, 30.436897198069026),
+    "Palm Shores Drive": (-86.58451037567947, 30.4462290311805),
+    "Trail Court": (-86.48068159211753, 30.407411315806314),
+    "Friertuck Road": (-86.73853114601906, 30.413748473423777),
+    "Windward Circle": (-86.44083139896473, 30.481784267335716),
+    "Polly Court": (-86.51037160011087, 30.817189746645404),
+    "Newcastle Circle": (-86.6205482141511, 30.440894584073565),
+    "Tennessee Williams Drive": (-86.42637338337583, 30.489810551442574),
+    "Aleta Avenue": (-86.763531, 30.413657999999998),
+    "Pineforest Drive": (-86.49626499428261, 30.80187648301122),
+    "Florosa Court": (-86.72554887184722, 30.41238914166165),
+    "Sunset Lane": (-86.58382809659786, 30.467615290399042),
+    "Overbrook Drive": (-86.65059596726203, 30.433929499423794),
+    "Sea Gull Circle": (-86.489712, 30.398574),
+    "East Mariah Way": (-86.63513942643553, 30.46106334336258),
+    "Ridgewood Way": (-86.41434177792368, 30.47168069671984),
+    "Gilmore Court Southeast": (-86.59167716279995, 30.405033213640046),
+    "Larkspur Court": (-86.46603167910119, 30.52167931685328),
+    "Oak Street North": (-86.53507321575874, 30.821310670259656),
+    "Yuchi Court": (-86.46733039905824, 30.49258039281338),
+    "Auk Way": (-86.40055057118634, 30.742281408181686),
+    "Mar Walt Drive": (-86.6321832, 30.449447050000003),
+    "Adrienne Court": (-86.56173899884422, 30.7131248251634),
+    "Creola Lane": (-86.74754935050977, 30.724888707186505),
+    "O'Neill Avenue": (-86.70001433196198, 30.413384973372526),
+    "Lighthouse Road": (-86.59257479401947, 30.4414941943936),
+    "Brighton Court Northeast": (-86.60261955923414, 30.459099204181626),
+    "Isle of Capri": (-86.57748573581387, 30.792402718818607),
+    "West Timberlake Drive": (-86.74728319972736, 30.412223050754644),
+    "Sandprint Circle": (-86.47705337808664, 30.384748191471513),
+    "Lonesome Pine Street": (-86.70307324383283, 30.69086731486726),
+    "Parker Drive": (-86.44183619065468, 30.509766239038516),
+    "Lincoln Drive": (-86.64187460741917, 30.437270768456894),
+    "Miller Street": (-86.60265834699429, 30.43986178834913),
+    "Raimund Herden Drive": (-86.4157830435451, 30.482476693514243),
+    "Tropic Avenue": (-86.62772069134516, 30.399375555923655),
+    "Ace Road": (-86.48057781640969, 30.936024011812094),
+    "Biscayne Road": (-86.49427604356362, 30.480660571611022),
+    "Sapphire Court": (-86.61398205, 30.436334199999997),
+    "Westminster Road": (-86.60881352334955, 30.442100013779054),
+    "Comet Street Southwest": (-86.61530085543342, 30.411227937177085),
+    "Little Crescent Street": (-86.65231489334961, 30.46313642006144),
+    "Mars Street": (-86.48197862748071, 30.409970058381116),
+    "Sunfish Street": (-86.41470629877993, 30.382888490668005),
+    "Pear Orchard Boulevard": (-86.55205208166366, 30.796459068800367),
+    "Choctawhatchee Road Northeast": (-86.59067157736905, 30.413032096258984),
+    "Rainmaker Drive": (-86.52612021740165, 30.855600425168078),
+    "Atkins Road": (-86.74924377256548, 30.78690246442337),
+    "Ford Street": (-86.52407590717098, 30.760734046367176),
+    "Holley Drive": (-86.53328952153876, 30.742840140478688),
+    "Whisper Lane": (-86.50067373031062, 30.752600293224027),
+    "Okaloosa Road Northeast": (-86.59412130160977, 30.41460638946447),
+    "North Savage Street": (-86.57351358281944, 30.757530908835015),
+    "Silverhill Road": (-86.55440896378302, 30.816472854586884),
+    "Rhodes Cove": (-86.42785836699632, 30.490493000679038),
+    "Arizona Drive Northeast": (-86.60130845095999, 30.418491378536267),
+    "Whitehead Drive": (-86.70554723900824, 30.726727524625026),
+    "Marina Cove Drive": (-86.44605528301669, 30.491990070203865),
+    "3rd Avenue": (-86.49383220080564, 30.405074874855526),
+    "Baker Avenue Northwest": (-86.6227217736588, 30.42357021369888),
+    "Heron Loop": (-86.40705731613684, 30.73714165266166),
+    "Nathan Lane": (-86.58054324469443, 30.95063037940664),
+    "Scranton Street": (-86.6001644729612, 30.445852870351125),
+    "James Court": (-86.6272795, 30.438862999999998),
+    "Boundry Lane": (-86.73465679942187, 30.68781871696135),
+    "Beckwood Lane": (-86.67588675010592, 30.712516857045763),
+    "Ansley Drive": (-86.43932908926386, 30.502031171185145),
+    "Anastasia Drive Southeast": (-86.59576924671615, 30.4115060452884),
+    "James Street North": (-86.56633926170959, 30.77771614271184),
+    "Williams Street Northwest": (-86.61548495418917, 30.420975779360827),
+    "Wildflower Court": (-86.47042864571935, 30.509525521197727),
+    "Leyland Lane": (-86.60999041983088, 30.72597520406161),
+    "Tikell Drive": (-86.61528382703297, 30.71652643659432),
+    "Saint Vincent Cove": (-86.42119300194706, 30.48575893424649),
+    "Sadler Court": (-86.48061660935227, 30.502714726447685),
+    "Quail Run": ( -86.46929894186843,30.39424283081651),
+    "Washington Avenue": (-86.68563433041456, 30.796096292536117),
+    "Savage Street South": (-86.57008166486887, 30.753702272551518),
+    "Calusa Boulevard": (-86.40543409959213, 30.389231646858295),
+    "Canterbury Cove East": (-86.43548388265603, 30.485915119741776),
+    "Shrewsbury Way": (-86.58947985309875, 30.463206311479805),
+    "Goldsbys Way": (-86.49999291480886, 30.395618804834275),
+    "Oriole Place": (-86.5348435303423, 30.78696576788897),
+    "Sunset Pointe": (-86.41185405380824, 30.382947354144815),
+    "Poverty Creek Road": (-86.45794288173308, 30.807703214041958),
+    "Latham Road": (-86.43516750624335, 30.83322433454737),
+    "Sioux Circle": (-86.6055742180417, 30.785945173114126),
+    "Nutmeg Avenue": (-86.46393162155594, 30.506236361115562),
+    "Lakeview Street": (-86.52619310956206, 30.760401711704386),
+    "Davenport Court": (-86.60559955, 30.43572305),
+    "Raintree Boulevard": (-86.42050390483355, 30.466734502535513),
+    "Thomas Street": (-86.46089958325545, 30.501584954776277),
+    "Dove Field Road": (-86.64668179784618, 30.469377751751864),
+    "Kimbrough Road": (-86.65450885483746, 30.408356630172513),
+    "Suwanee Lane": (-86.6264165, 30.4419445),
+    "Teakwood Place": (-86.62716700013087, 30.428964492814192),
+    "Brock Avenue": (-86.55866464597855, 30.74958066711576),
+    "Magnolia Shores Drive": (-86.47733387678034, 30.500217782953627),
+    "Somerset Drive": (-86.6323618193662, 30.44088866713286),
+    "Summer Creek Cove": (-86.55005378847434, 30.72256280227502),
+    "Jackson Avenue": (-86.50928904902568, 30.517676608690092),
+    "Tuxedo Drive": (-86.61274693498909, 30.44451302756487),
+    "Camelia Drive": (-86.65056751978177, 30.437844817575286),
+    "Chip Lane": (-86.47175949999999, 30.512194),
+    "Stillwell Boulevard": (-86.55171129123977, 30.77293513544973),
+    "Mill Pond Cove": (-86.55758425711794, 30.724605046836377),
+    "Isle of Palms Boulevard": (-86.40313915, 30.38112785),
+    "Mount Olive Road": (-86.46194712481898, 30.777303152037916),
+    "Quailwood Drive": (-86.4682066, 30.391650849999998),
+    "Park Drive": (-86.63151423527067, 30.399327597853144),
+    "Falcon Ridge Lane": (-86.61927850000001, 30.441833),
+    "Clinton Street": (-86.5042255, 30.5160345),
+    "Childrens Lane": (-86.49864438706831, 30.835451967343264),
+    "Rocky Bayou Drive": (-86.44875511821856, 30.512471626562675),
+    "Robinwood Drive Northwest": (-86.61952114763011, 30.41805578040805),
+    "Fire Lane Road": (-86.76168177090548, 30.742011202477194),
+    "Lance Lane": (-86.73945709976375, 30.72047216019701),
+    "Sumac Court": (-86.5741292249362, 30.457891420154166),
+    "Fleming Drive": (-86.54992198420668, 30.778473053177354),
+    "Navajo Trace": (-86.61081286863812, 30.77717836006904),
+    "Vintage Court": (-86.49797620000001, 30.40886415),
+    "Jimmy Street": (-86.635530618355, 30.445713019203808),
+    "Dipolo Street": (-86.53711393173887, 30.74908288618772),
+    "Sunningdale Cove": (-86.43500167166448, 30.479790958630687),
+    "Yacht Club Drive Northeast": (-86.59895393119082, 30.42286196266874),
+    "Dorthy Lane": (-86.7212025, 30.7575795),
+    "Pineview Court": (-86.652054588183, 30.40841429766522),
+    "Ridgewood Avenue": (-86.79106630427032, 30.414797564922868),
+    "Valencia Drive": (-86.6184360002273, 30.44042098376791),
+    "Hamby Place": (-86.69772871174665, 30.424728047033337),
+    "Oakmont Way": (-86.43614642246602, 30.47994382741491),
+    "Seahorse Avenue": (-86.62304357140205, 30.39838701649206),
+    "Holland Road": (-86.71978674745053, 30.725715282880415),
+    "Shady Lane": (-86.65617799702191, 30.408272596592763),
+    "Wolftrack Ridge": (-86.41402598765126, 30.831446232182337),
+    "Karick Lake Lower Road": (-86.64456176882896, 30.893894505404802),
+    "Bob Brooks Road": (-86.74114994132403, 30.78508705657251),
+    "Central Avenue": (-86.62934534102365, 30.453925370565134),
+    "Greenwood Lane": (-86.4127625, 30.471079999999997),
+    "Windlake Drive": (-86.42522002631891, 30.47117113982419),
+    "Foster Drive": (-86.54034222913918, 30.46639123162879),
+    "Rue Dianne": (-86.77831899567282, 30.411990740929365),
+    "Nanas Road": (-86.63916405419506, 30.91924427561914),
+    "Henderson Drive": (-86.5501853926779, 30.761124279931337),
+    "Sixteenth Green Cove": (-86.4519215, 30.5201285),
+    "Oak Shores Drive": (-86.4432936536017, 30.498736872984587),
+    "Bermuda Circle": (-86.42676688973604, 30.487783582996453),
+    "West Casa Loma Drive": (-86.75252887675772, 30.41331604208393),
+    "Brian Drive": (-86.5786741563284, 30.704730477094312),
+    "Windward Cove East": (-86.4375737750082, 30.484146993218573),
+    "Ruth Lane": (-86.50945418103105, 30.695562185512763),
+    "Amie's Lane": (-86.76057956141388, 30.77123102240826),
+    "Gladys Street": (-86.60307853285623, 30.441566712449703),
+    "Staff Drive Northeast": (-86.6021682810504, 30.415485937256683),
+    "Top Flight Drive": (-86.55926968958663, 30.70684118971379),
+    "Bayou View Drive": (-86.64071894347049, 30.436015510170925),
+    "Hood Avenue Southeast": (-86.59288710048388, 30.40591198413586),
+    "Winter Park Court": (-86.626428, 30.441582500000003),
+    "Canterbury Cove West": (-86.43629884846175, 30.485282603050933),
+    "Windy Lane": (-86.66452648460665, 30.40919658503284),
+    "Jace Drive": (-86.46249738836804, 30.7524346708157),
+    "Wright Drive": (-86.41142077873478, 30.47877699206407),
+    "Possum Ridge Road": (-86.50284251083792, 30.833037615455936),
+    "Lark Lane": (-86.53021625178954, 30.754409122194062),
+    "Mulberry Court": (-86.46091378536445, 30.492266074649642),
+    "Yellow River Lane": (-86.7513225, 30.6747335),
+    "Thames Place Northwest": (-86.62371999999999, 30.422018),
+    "Hilary Street": (-86.53736924127362, 30.795501036550533),
+    "Swift Fox Run": (-86.61965629102274, 30.720303636228667),
+    "Dove Road": (-86.62880524263163, 30.46226560734869),
+    "Springcreek Drive": (-86.51323348725863, 30.88633977570055),
+    "Kelly Mill Road": (-86.77493175573085, 30.729771664483277),
+    "Register Lane": (-86.52311365446427, 30.756285626429207),
+    "East Bunting Way": (-86.39381249693602, 30.740709520964163),
+    "Friendship Road": (-86.737063449966, 30.413923545394756),
+    "Crosslake Cove": (-86.63214874108965, 30.438858225070852),
+    "Country Club Drive": (-86.4909463656966, 30.522434133266522),
+    "Spanish Moss Trail": (-86.48128835844331, 30.39881039326499),
+    "Carr Drive": (-86.44671168417099, 30.532462014518753),
+    "Maxwell Drive": (-86.69061486683323, 30.739987301224367),
+    "Meadow Court": (-86.65150582887868, 30.457880879545815),
+    "Cottonwood Drive": (-86.5299551589146, 30.81640656015127),
+    "Splinter Lane": (-86.71125907599381, 30.81153837372784),
+    "Keyser Mill Road": (-86.68171764497535, 30.750651262250148),
+    "Amellia Place": (-86.55589693383997, 30.76482199217541),
+    "Phillips Court": (-86.4990458122168, 30.505997115235143),
+    "Aqua Drive": (-86.5891474372824, 30.7098584884568),
+    "Windward Cove North": (-86.43983850000001, 30.4847),
+    "Papaya Park": (-86.40409069174855, 30.385264684363037),
+    "Galway Drive": (-86.44409958664502, 30.51597099153792),
+    "Prestwick Cove Road": (-86.42637024942749, 30.484982094408693),
+    "Patch Avenue": (-86.54997890041085, 30.772009253247887),
+    "Juniper Avenue": (-86.46868478964109, 30.52199380574647),
+    "Winton Court": (-86.500876, 30.4037715),
+    "Smith Street": (-86.56108289185453, 30.767529673843963),
+    "Ultra Lane": (-86.55966708079114, 30.70690145537385),
+    "Stephanie Road": (-86.4600046230211, 30.805768121001545),
+    "Hawkins Road": (-86.64198715748795, 30.447782826601262),
+    "Cape Drive Northwest": (-86.64026157475332, 30.417375427260616),
+    "Old Place Road": (-86.5239197261545, 30.98188271225863),
+    "Little Silver Road": (-86.5189472118932, 30.696055744826825),
+    "Colonel Greg Malloy Road": (-86.51299620359922, 30.694644393778542),
+    "Karen Court": (-86.47540891150744, 30.510707932474514),
+    "Skymaster Court": (-86.5116828823299, 30.768282158640833),
+    "Lincolnshire Drive": (-86.46963081990967, 30.520842926377256),
+    "Cardinal Court": (-86.54130603941823, 30.784835092758648),
+    "Saddle Creek Drive": (-86.64798448259482, 30.463289439855128),
+    "Sand Hill Road": (-86.45991774059048, 30.80977714406101),
+    "Indian Hills Drive": (-86.48843294644882, 30.396091572813717),
+    "Kensington Lane": (-86.54055305084277, 30.716880887895904),
+    "Gallant Fox Lane": (-86.55189230693384, 30.73147200709467),
+    "Ella Ruth Drive": (-86.66431900036783, 30.43088047769219),
+    "Allen Drive": (-86.62470350252993, 30.441269955663525),
+    "Louise Circle": (-86.46566144866098, 30.404884453697967),
+    "Windward Cove South": (-86.43916100686324, 30.483415662903422),
+    "Forrest Parkway": (-86.54501953393554, 30.7848474657101),
+    "Melvin Street": (-86.49930512208718, 30.394595308756323),
+    "Beaver Creek Tower Road": (-86.76033435609783, 30.840855851083795),
+    "Log Place": (-86.48019746282313, 30.406998869919278),
+    "Papa Lawrence Drive": (-86.48701894664012, 30.912487082924542),
+    "Burdeshaw Drive": (-86.47459104767047, 30.516143651140023),
+    "Wexford Drive": (-86.44268894914738, 30.518203477190806),
+    "May Fair": (-86.60903334410015, 30.433720960750694),
+    "Weaver Avenue": (-86.70563765480242, 30.412597746135827),
+    "Dunn Court": (-86.44426118828386, 30.508432664825385),
+    "North Drive": (-86.58547994467116, 30.470133843723755),
+    "Pamela Ann Drive": (-86.60505245981936, 30.468156885316),
+    "Desota Circle": (-86.47963795373614, 30.481368293219525),
+    "Siebert Drive": (-86.59687713925888, 30.39941435520203),
+    "Sharon Point Circle": (-86.60812449256204, 30.450002519596122),
+    "Laffitte Crescent": (-86.62440248345227, 30.434084443514816),
+    "Evans Street": (-86.49826852487004, 30.524894025049903),
+    "Drewson Drive": (-86.5792130556413, 30.706674996825466),
+    "Holly Road": (-86.55559667079652, 30.7349532069556),
+    "Asa Marie Court": (-86.7615202, 30.413405200000003),
+    "Windward Cove West": (-86.4400521601838, 30.483173291540723),
+    "Candy Lane": (-86.59081392451522, 30.70354311690996),
+    "Parkwood Court West": (-86.4160535, 30.4887225),
+    "North Lloyd Street": (-86.57596547693254, 30.781268578754034),
+    "South Street Northeast": (-86.60108253672844, 30.434318445675313),
+    "Marleborough Road": (-86.59143498509756, 30.458881521332863),
+    "G I Trail": (-86.5261944849302, 30.79549376127365),
+    "Kelly Plantation Drive": (-86.43504579002534, 30.38811106469603),
+    "Gipson Place Northeast": (-86.60694648249209, 30.41323499949033),
+    "Legion Drive": (-86.49293412875753, 30.39723753253047),
+    "Hathaway Street North": (-86.56368850428159, 30.76225889172494),
+    "Oak Avenue": (-86.4043018279399, 30.739312778919313),
+    "Green Acres Road": (-86.64577859701213, 30.456037404454104),
+    "Silver Creek Cove": (-86.454881, 30.526564),
+    "Byrne Street": (-86.47949441612597, 30.511593552060553),
+    "Skywagon Drive": (-86.51119254188528, 30.766976260327194),
+    "Pocahontas Drive": (-86.61894500720202, 30.432197610728178),
+    "Chipola Cove": (-86.4005761820073, 30.392195290076423),
+    "Nautical Court": (-86.40975066452603, 30.398430347758598),
+    "Sherwood Drive": (-86.5899865086206, 30.458698379269073),
+    " King Street": (-86.55349912619235, 30.750764283212323),
+    "4th Avenue Southwest": (-86.6169990216313, 30.407041000646785),
+    "Avenue de la Dauphine": (-86.78116243700397, 30.414412983296153),
+    "Kingslynn Road": (-86.42092033810454, 30.510001194008183),
+    "Edna Drive": (-86.57939223359394, 30.707642052268092),
+    "Ridge Wood Circle": (-86.50403492865043, 30.398943271127095),
+    "Butler Road North": (-86.53492147640516, 30.822525723799853),
+    "Destiny Way": (-86.41029196483566, 30.381543303030146),
+    "Chippewa Trail": (-86.60877967932468, 30.770774158519686),
+    "Jessie Jones Road": (-86.74673175469832, 30.69047772610875),
+    "Newman Avenue North": (-86.52727497918927, 30.75816738432202),
+    "Maurice Avenue Northwest": (-86.62942787300172, 30.422174624386482),
+    "Sherman Kennedy Road North": (-86.72409116567073, 30.84512946448429),
+    "Hathaway Street South": (-86.56395575902592, 30.758990342749627),
+    "Heartland Drive": (-86.65404497477907, 30.46072115835609),
+    "Ashley Drive": (-86.58290161152797, 30.709518601527396),
+    "Bobolink Loop": (-86.39417401884387, 30.74501129551377),
+    "Eglin Parkway Southeast": (-86.60403665004881, 30.41136065518519),
+    "Bayshore Street Northeast": (-86.60013205708171, 30.420422077129388),
+    "Irene Court": (-86.44697350000001, 30.533237),
+    "Hurlburt Road": (-86.64917635370185, 30.449465268524346),
+    "Iva Place Southwest": (-86.6345756008457, 30.410137349383202),
+    "Palamino Trail": (-86.57374699423383, 30.804004519931656),
+    "Crystal Lane": (-86.47117613318066, 30.499176832824624),
+    "Terra Cotta Way": (-86.40003774794181, 30.381860928227038),
+    "Ashford Court": (-86.66284505610659, 30.418440082971077),
+    "Park Place Southeast": (-86.611468, 30.411441),
+    "Bear Branch Road": (-86.46168896811652, 30.774427714049814),
+    "Hickory Avenue": (-86.47007638241675, 30.532762429239376),
+    "Hardy Adams Road": (-86.7694006081272, 30.72277921195709),
+    "Dana Court": (-86.58271508973375, 30.445165156879828),
+    "Olivia Court": (-86.6643375, 30.432007),
+    "Ernest Hemingway Drive": (-86.43194471967642, 30.49035172182122),
+    "Jefferson Avenue": (-86.5359199380823, 30.760050756697392),
+    "Sherman Kennedy Road South": (-86.69515974730236, 30.89554316897656),
+    "Oglesby Avenue": (-86.58240203509814, 30.75256284880779),
+    "Industrial Street Northwest": (-86.6164885436438, 30.41591262345412),
+    "Stokes Avenue Northwest": (-86.67175846383091, 30.42548348264921),
+    "Craig Terrace": (-86.53740909549587, 30.776285884705274),
+    "Doodle Avenue": (-86.60330928784302, 30.446073428424942),
+    "Dove Way": (-86.3955753658564, 30.746908004262256),
+    "Saint John Cove": (-86.42028703231982, 30.485137279137934),
+    "Forest Glen Place": (-86.73126518455906, 30.413947462563552),
+    "Sherman Kennedy Road West": (-86.69646825140492, 30.898271814003344),
+    "Twin Oak Drive": (-86.56427271472968, 30.798524240861727),
+    "Arabian Court": (-86.56784175017584, 30.806819493033892),
+    "Rockport Court": (-86.6383268, 30.4314983),
+    "Coventry Court": (-86.608707975412, 30.444810058799217),
+    "Regan Drive": (-86.63435308796517, 30.682227859971107),
+    "Medcrest Drive": (-86.56951624346566, 30.73646946757605),
+    "Port Drive": (-86.58323098521328, 30.43493553690249),
+    "Woodland Park Circle": (-86.71670555941604, 30.413405592635915),
+    "Rosewood Way": (-86.41376882013286, 30.477508074024957),
+    "Bay Circle": (-86.468862, 30.4978115),
+    "Hollow Cove": (-86.55815661973539, 30.7228756551276),
+    "Bowen Road": (-86.63272007731834, 30.973011317375693),
+    "Rasberry Road": (-86.59164423048736, 30.723953574370007),
+    "Willow Court": (-86.65332600324456, 30.435852499915597),
+    "Minger Street": (-86.4883228485809, 30.520578249401325),
+    "Kazmira Court": (-86.46029626502737, 30.511732973415967),
+    "Carlton Court Northwest": (-86.62237096252261, 30.416925844281543),
+    "Cinco Terrace Lane": (-86.6303155272288, 30.433301227791993),
+    "Francis Street": (-86.74081636060744, 30.413346396125323),
+    "Birmingham Street": (-86.6855987771973, 30.796621675884133),
+    "Martisa Road Northwest": (-86.6270624117351, 30.41930478177911),
+    "Currie Road": (-86.57118785262251, 30.813103455219167),
+    "Colonial Court": (-86.52014556322332, 30.8121934947906),
+    "Tyner Street": (-86.62172195010344, 30.443510895670446),
+    "Bay Oaks Drive": (-86.77775640965088, 30.41124024544837),
+    "Barbara Lane Northwest": (-86.63800943703679, 30.422674343784095),
+    "Fairoaks Drive": (-86.55916557872975, 30.759303799812297),
+    "Kelly Way": (-86.509306560296, 30.530008380187816),
+    "Citation Drive": (-86.579002, 30.439927499999996),
+    "Sandprint Drive": (-86.47628436437365, 30.386096339968084),
+    "Roberts Boulevard": (-86.62475793734049, 30.47210851398783),
+    "Edwards Lane Northeast": (-86.59137779578937, 30.42249969579979),
+    "Laurie Drive Northeast": (-86.59484891295823, 30.416248139538677),
+    "Kokomo Row": (-86.41411536070075, 30.3828317319495),
+    "Saratoga Drive": (-86.57378462421448, 30.802541899998406),
+    "Virginia Street": (-86.63259801540832, 30.433725696218723),
+    "Jamescross Court": (-86.63235869473151, 30.462641911955494),
+    "Scarlet Drive East": (-86.5620363592961, 30.705836821126404),
+    "Eden Square": (-86.48252149518933, 30.813533903366633),
+    "Morgan Lane": (-86.78472550000001, 30.412781500000005),
+    "Olde Plantation Place": (-86.44790822077678, 30.403838789839273),
+    "State Line Road": (-86.68109932602415, 30.993049767591618),
+    "Cowrie Street Southwest": (-86.62195041132418, 30.40872687161578),
+    "L Ombre Court Northeast": (-86.61197694336302, 30.453604629068245),
+    "Maritime Court": (-86.40735581163723, 30.398052842748925),
+    "Brian Way": (-86.47412549996395, 30.751994518615916),
+    "Sugarman Road": (-86.75259197349597, 30.686282170501247),
+    "Fers Road": (-86.39912461420157, 30.761317408538062),
+    "Southfolk Road": (-86.75378891301224, 30.69444399275402),
+    "Saint Barts Bay": (-86.40095758136758, 30.381212220517693),
+    "Ellis Road": (-86.63045048449476, 30.7488189470366),
+    "Point Comfort Road": (-86.65511818022784, 30.408341446973854),
+    "Meadowlark Road Northwest": (-86.619583, 30.422698),
+    "Arena Road": (-86.59704636620036, 30.736225003206215),
+    "Waterford Ridge Road": (-86.63093682338456, 30.46308232117712),
+    "Troon Drive East": (-86.42746132226259, 30.477616081610428),
+    "Pineview Boulevard": (-86.64618491172651, 30.452165823883927),
+    "Beacons Bend Road": (-86.5810100239722, 30.799336757440233),
+    "Vaughn Street Northwest": (-86.63147699408765, 30.428245963159217),
+    "Andrew Drive": (-86.5054465649326, 30.507473669135585),
+    "Carousel Lane": (-86.46911540046551, 30.755527362760393),
+    "Edney Avenue East": (-86.56276448088224, 30.751237127101636),
+    "Williams Way": (-86.61360513281306, 30.72989214119592),
+    "Preserve Place": (-86.44056738273501, 30.40131191508583),
+    "Purl Jr Run": (-86.5260179283129, 30.73926125070113),
+    "Sandalwood Drive": (-86.49236295175318, 30.395651597672085),
+    "Hathaway Johnson Road": (-86.63599990941445, 30.763244032170203),
+    "McLain Drive": (-86.51021644089865, 30.822671481089134),
+    "Camp Pinchot Road": (-86.5959082804463, 30.473662252691632),
+    "Horseshoe Lane": (-86.68805691945987, 30.696044424829953),
+    "Mastel Lane": (-86.52710769576512, 30.820450766873755),
+    "Denton Boulevard Northwest": (-86.62394362714141, 30.44150664034245),
+    "Judith Avenue": (-86.48003545712373, 30.507637075843988),
+    "Marysa Drive": (-86.4401414306517, 30.520073002206423),
+    "La Salle Court": (-86.53576728896101, 30.723834907187214),
+    "Golf Villa": (-86.4308676673654, 30.48179836574259),
+    "Diamond Cove": (-86.4523096711724, 30.392477446597788),
+    "Harbor Wind Court": (-86.47605330037322, 30.40043951105352),
+    "Berringer Drive": (-86.41698457949038, 30.462155158757675),
+    "Field Avenue East": (-86.56167157705852, 30.755024372791233),
+    "East Field Avenue": (-86.56447471477499, 30.753118240464804),
+    "Mike Circle": (-86.603696, 30.4405765),
+    "Woodland Drive": (-86.549865737677, 30.780826107849787),
+    "Ken's Cove Road": (-86.75635, 30.674987),
+    "Northwood Road": (-86.43596314999999, 30.766146949999996),
+    "Cloverview Drive": (-86.5881045, 30.717205),
+    "Bay Court Northeast": (-86.58929409045327, 30.41320245592336),
+    "Primrose Place": (-86.50195550004541, 30.39932301631641),
+    "Rosewood Avenue": (-86.5662725, 30.801098500000002),
+    "Rosemont Street": (-86.61871166750134, 30.44457305029539),
+    "Biscayne Lane": (-86.471293, 30.5029805),
+    "Sardinia Cove": (-86.42643228378662, 30.48965649926459),
+    "Gil Ava Avenue": (-86.56871655306979, 30.78098621686553),
+    "Grady Lane": (-86.5024242185533, 30.823330964482928),
+    "West Ridgewood Cove": (-86.41433514820498, 30.470102440428175),
+    "Osceola Court": (-86.46874918247558, 30.491701335858423),
+    "Fisherman Lane": (-86.53914990050225, 30.85206638897039),
+    "Cypress Drive": (-86.47995884521167, 30.522018933145784),
+    "Manring Drive": (-86.64147310390372, 30.433498871879067),
+    "Misty Way": (-86.47574373491129, 30.39992728554359),
+    "Shannon Sound": (-86.4025035, 30.398511),
+    "Dogwood Court": (-86.65244150000001, 30.4358635),
+    "Katherine Place Northwest": (-86.62813700000001, 30.4225085),
+    "Charles Street Northwest": (-86.63549294493387, 30.42374827037657),
+    "Troon Drive West": (-86.42852278342131, 30.477353683899093),
+    "Peaden Drive": (-86.510752, 30.8214205),
+    "Crest Place": (-86.47826744843174, 30.404694163227937),
+    "Alford Street": (-86.58223887694841, 30.75258902704162),
+    "Leitemann Road": (-86.68056315491778, 30.743880311569047),
+    "Dominica Circle East": (-86.42307949144319, 30.47042325850972),
+    "Donald Guy Road": (-86.47294128895723, 30.813408778433345),
+    "Edney Avenue West": (-86.5824006906004, 30.751607097547634),
+    "Collinsworth Cutoff Road": (-86.69479676975963, 30.96566933965654),
+    "Grandmas Place": (-86.70903597015233, 30.75985038263252),
+    "War Eagle Drive": (-86.54780256216829, 30.75014824134189),
+    "Creekwood Road": (-86.735609647087, 30.413919888938864),
+    "Walthall Road": (-86.48860580249965, 30.80131885190354),
+    "Jr's Way": (-86.76831417122257, 30.707180412864822),
+    "Jeremy Court": (-86.55275749845751, 30.772029203228556),
+    "Beasley Road": (-86.55229639396742, 30.818227627362223),
+    "Nelson Point Road": (-86.44305349602979, 30.499895267282923),
+    "Sunset Drive": (-86.58204271061547, 30.792887563300983),
+    "Shadow Lane": (-86.62718434120947, 30.46112338128272),
+    "West Campbell Drive": (-86.65911553953455, 30.458954566676795),
+    "White Oak Avenue": (-86.5662895376441, 30.800074096570725),
+    "Robinwood Court": (-86.5889894623789, 30.789609182526256),
+    "Bass Avenue Southwest": (-86.61401359208978, 30.40892948749227),
+    "Dewitt Lane": (-86.41746474591785, 30.845951615831527),
+    "Lang Road": (-86.63465253346482, 30.43618456639285),
+    "Eglin Boulevard": (-86.56486051856405, 30.461110140354776),
+    "Robbins Road": (-86.47183758667055, 30.979328805500852),
+    "Claire Drive": (-86.57877893147321, 30.70569485999851),
+    "Turpentine Steel Road": (-86.51940950545233, 30.89051118404249),
+    "East College Boulevard": (-86.45678905037946, 30.534412216962114),
+    "Sailmaker Lane": (-86.40871156503678, 30.392776632129497),
+    "Bluefish Drive": (-86.60496702497456, 30.397775229294133),
+    "Walton Drive Northeast": (-86.59815755978482, 30.421810585149917),
+    "Field Avenue West": (-86.56597038186044, 30.752107569991058),
+    "Sicily Cove": (-86.42580352117689, 30.489734142883282),
+    "Cahaba Lane": (-86.44960741621188, 30.395152621287046),
+    "Alligator Point": (-86.43731662739346, 30.491679615544072),
+    "Terry Lane": (-86.53257785108286, 30.80923482449461),
+    "Ester Terrace": (-86.53057704163041, 30.79640906140417),
+    "Apopka Cove": (-86.40251653205118, 30.3896419974797),
+    "Range Rd 207": (-86.4082054036385, 30.70653174559561),
+    "Armstead Road": (-86.74742434130802, 30.69456687698388),
+    "Pinecone Court": (-86.74425465067837, 30.41339323512768),
+    "John King Road": (-86.55159506670753, 30.72068278407368),
+    "Joy Drive": (-86.63801255303794, 30.44550298963113),
+    "Burgundy Lane": (-86.64501897212679, 30.43648612560177),
+    "Watson Drive Northwest": (-86.63253022967167, 30.421914955832655),
+    "John Wayne Circle": (-86.64518464055105, 30.44533800216662),
+    "Brookhaven Way": (-86.41920684755391, 30.46992021234715),
+    "Whits Manor Road": (-86.61384094971561, 30.44961802179683),
+    "West Beech Street": (-86.57394049999999, 30.759107999999998),
+    "Shamrock Drive": (-86.67492379999999, 30.4105896),
+    "Nancy Ward Lane": (-86.41603491645186, 30.50109728352378),
+    "Cunnard Avenue": (-86.495195, 30.500238500000002),
+    "Richbourg Lane": (-86.55696306702124, 30.78009730410091),
+    "Linda Court": (-86.44772536500824, 30.510407279296953),
+    "Astor Court": (-86.57530241492746, 30.458442183913572),
+    "Kidd Street Northeast": (-86.61139074918067, 30.425275205451616),
+    "Liberty Road": (-86.74583095426854, 30.719731144102706),
+    "Flora Cove": (-86.55417779933946, 30.743126803591633),
+    "Maples Street Northwest": (-86.61649804762162, 30.417644771514574),
+    "Honeysuckle Lane": (-86.45618747898935, 30.930556619883514),
+    "Sky Lane": (-86.74761830425109, 30.685472787239934),
+    "Dominica Circle South": (-86.42357975781321, 30.46895848398256),
+    "Anchors Drive": (-86.50874052059147, 30.821200699895893),
+    "Parlange Court": (-86.5022845582059, 30.38518845019331),
+    "Linda Cove": (-86.6569755564014, 30.432732142056857),
+    "Del Cerro Camino": (-86.54708510978037, 30.755681542205465),
+    "Woolmac Drive": (-86.45408560008657, 30.77537121492236),
+    "Winding Waters Way": (-86.45658116565411, 30.52843349454169),
+    "Long Drive": (-86.56308774888227, 30.769391256994957),
+    "Beal Parkway Northwest": (-86.61889535211277, 30.422936027719338),
+    "Cone Drive": (-86.54575858362563, 30.773715534348717),
+    "Valley Road": (-86.54905064343419, 30.76640700392856),
+    "Barrow Street": (-86.60867838183687, 30.448080904482524),
+    "Perry Avenue Southeast": (-86.60309442442872, 30.40946042905838),
+    "Coach Lane": (-86.44177396922623, 30.39161444494167),
+    "Combs Manor Court Northwest": (-86.66394249974161, 30.425590009818556),
+    "Randi Road": (-86.45229312287097, 30.754813199859512),
+    "Gilda Place Northwest": (-86.6281515, 30.421686),
+    "Bay Oaks": (-86.5053740956904, 30.404588758169826),
+    "Finck Road": (-86.47696821515224, 30.50415172298901),
+    "Pilgrim Avenue": (-86.61850903491424, 30.432810288137215),
+    "Devmor Court": (-86.62728819360173, 30.397960483192197),
+    "Dominica Circle West": (-86.4240883603725, 30.47026903956841),
+    "Willwall Street Northeast": (-86.61211267149204, 30.4694422083977),
+    "Parkside Cove West": (-86.41763550310054, 30.497937494912414),
+    "Dale Place": (-86.6496985, 30.439586499999997),
+    "Riley Road": (-86.47308332594704, 30.50583711126262),
+    "Nordberg Avenue": (-86.50233162901237, 30.50820430975284),
+    "Tasha Street": (-86.76245687540413, 30.41349081886147),
+    "Scrub Oak Lane": (-86.46820070807522, 30.768547557293648),
+    "Lake Court": (-86.47362300062781, 30.51379498196624),
+    "Lake Shore Drive": (-86.5582585902444, 30.436927070891684),
+    "J B Lane": (-86.68074770801842, 30.691826980019453),
+    "Dove Lane": (-86.63100894403964, 30.773715247397014),
+    "Manning Creek Cove": (-86.45615039957106, 30.525278564671723),
+    "Kelly Mill Lane": (-86.77508936242221, 30.717370616794977),
+    "Grassy Cove": (-86.43950719766758, 30.40185966400204),
+    "Nautica Way": (-86.4877857776164, 30.396265485662994),
+    "Massachusetts Avenue": (-86.6483675, 30.436887),
+    "Venus Court": (-86.62868465614639, 30.398081532875658),
+    "Melissa Court": (-86.6512178359422, 30.434334092289667),
+    "Wynnehaven Beach Road": (-86.7866350612095, 30.40867847962122),
+    "Friendship Lane": (-86.55786423046673, 30.796761208405538),
+    "Junior Drive": (-86.56404864440265, 30.44342654653056),
+    "East Choctawhatchee Drive": (-86.40048575300716, 30.455037203636945),
+    "Houston Lane": (-86.55083337584219, 30.801005180279923),
+    "John Road": (-86.7591202800617, 30.71367920450804),
+    "East Road": (-86.67755022142467, 30.423805396788342),
+    "Spruce Court": (-86.65320835711191, 30.458274819880632),
+    "Hope Drive": (-86.5834425486657, 30.708776112521395),
+    "Windward Lane Cove": (-86.43878271116996, 30.479362406159684),
+    "Melissa Cove": (-86.54026179833072, 30.720188755212217),
+    "Working Horse Lane": (-86.68803140144696, 30.75957549402907),
+    "Branum Circle": (-86.69610743813041, 30.988763870464158),
+    "Jonquil Avenue Northwest": (-86.64702952280588, 30.418798991868144),
+    "Kohler Drive": (-86.67755507285847, 30.41254115657504),
+    "Live Oak Street": (-86.40610397671429, 30.47862977292008),
+    "Adkinson Drive": (-86.58087700498791, 30.772357203442255),
+    "Stahlman Avenue": (-86.49656034362457, 30.40532747382712),
+    "Bear Head Road": (-86.46725263474373, 30.768119733938224),
+    "T E Rogers Road": (-86.48078761121343, 30.985177588126994),
+    "Skinner Circle": (-86.6083803319718, 30.43554296581642),
+    "Harvest Hills Lane": (-86.5160925, 30.811813),
+    "Cabela Lane": (-86.53108, 30.825666),
+    "Terrace Lane": (-86.55231436909031, 30.81539444343437),
+    "Lucy Lane": (-86.54558349635134, 30.74952537306138),
+    "Old Pass Court": (-86.50382627949033, 30.388064136781725),
+    "Cox Lane": (-86.52926538078843, 30.762103263702457),
+    "Van Buren Street": (-86.63106260528816, 30.431653029725208),
+    "Trawick Creek Road": (-86.72294645654117, 30.69745882052253),
+    "Lancaster Circle": (-86.53995303905498, 30.796974759158772),
+    "Walton Avenue": (-86.49954207944637, 30.52715256516189),
+    "Martin Drive": (-86.4338934703227, 30.50990998565622),
+    "Juniper Drive": (-86.58777234749644, 30.713570478566826),
+    "Washington Street": (-86.56957539576331, 30.750133617722415),
+    "Arrow Point Cove": (-86.48581807980632, 30.485322801438656),
+    "Summertime Drive": (-86.7410308170505, 30.711975656034635),
+    "Chickasaw Circle": (-86.64675286481909, 30.433060144826776),
+    "Honeysuckle Way": (-86.46940486006828, 30.52320712959916),
+    "Hilton Lane South": (-86.67337944243269, 30.758767166611623),
+    "Towery Court": (-86.607388, 30.447516999999998),
+    "Crossland Street": (-86.55762127467077, 30.748885421537295),
+    "Sundance Way South": (-86.74076335282562, 30.68921862044104),
+    "Wilderness Path": (-86.65502323107125, 30.464055750370225),
+    "Harris Boulevard": (-86.60325217699786, 30.44787631214565),
+    "Loosa Drive": (-86.39919286011775, 30.71212662768977),
+    "Greystone Lane": (-86.641536, 30.4475755),
+    "Holly Lane": (-86.44355918853753, 30.7601345766322),
+    "Reeves Street": (-86.46293762197766, 30.510623570168864),
+    "Lake Circle": (-86.75154726092646, 30.412147158945206),
+    "East Plympton Road": (-86.48800481045905, 30.90996039889915),
+    "Pine Ridge Lane": (-86.46235, 30.817161),
+    "Kolima Court": (-86.55303847591351, 30.70568278577614),
+    "Four Lake Drive": (-86.49208780876437, 30.756927688187645),
+    "Surrey Street": (-86.60725599968197, 30.439395518772578),
+    "Bear Spring Lane": (-86.46077925629818, 30.77248802939282),
+    "Twisted Oak Trail": (-86.56422620498415, 30.43742187791118),
+    "Leisure Avenue": (-86.73675408134147, 30.682050639945587),
+    "Calypso Cay": (-86.4028635, 30.380591500000005),
+    "Caswell Circle": (-86.65367816537936, 30.41192860039341),
+    "Sam Carver Road": (-86.61574066329202, 30.776888390983828),
+    "Thomas Court Northwest": (-86.63769031502878, 30.42556392178015),
+    "Manor Court Northwest": (-86.6212975, 30.4538965),
+    "Patton Street": (-86.56375062017477, 30.771222857193298),
+    "Cypressus Lane Northwest": (-86.63896384445626, 30.417984095702025),
+    "Woodham Avenue": (-86.6049544015522, 30.434804639829373),
+    "Dory Avenue": (-86.61298091504369, 30.39810881663584),
+    "Wisteria Avenue": (-86.5509328981226, 30.77786071040476),
+    "Hill Avenue Northwest": (-86.66742729561837, 30.421114661162363),
+    "June Court": (-86.5547415, 30.766575999999997),
+    "Carolyn Street": (-86.50417824020393, 30.52082067722916),
+    "Kell Aire Drive": (-86.47859697066292, 30.39983029686075),
+    "Madelons Path": (-86.65272332105167, 30.462405694387428),
+    "Whitehurst Lane": (-86.61634085926423, 30.71333934063136),
+    "Gilly Lane": (-86.5224216671504, 30.87030776082377),
+    "1st Street Southeast": (-86.61153168919473, 30.405326648947174),
+    "Parkview Road Northwest": (-86.62454088953072, 30.45663610180472),
+    "Starboard Drive": (-86.58503990142934, 30.43443547210458),
+    "West Mariah Way": (-86.63658467076232, 30.460801028659063),
+    " B Street": (-86.59511147405367, 30.761287638374426),
+    "Primrose Lane": (-86.5019623060627, 30.400690069232528),
+    "Osage Court": (-86.448021, 30.3935205),
+    "Mistral Lane": (-86.6345797959081, 30.463464358780417),
+    "North Beal Extended": (-86.63828258190385, 30.46375852502346),
+    "Gulf Terrace Drive": (-86.46799076459865, 30.38885509353469),
+    "Hacienda Lane": (-86.56634964197818, 30.810154413413862),
+    "Moss Oak Lane": (-86.46452463679954, 30.492219196148227),
+    "West Glen Avenue": (-86.49559813081285, 30.505267554171272),
+    "Clifford Drive": (-86.58522444565983, 30.439152402248773),
+    "Hurricane Lake South Entrance Road": (-86.7494948844694, 30.93582943580262),
+    "R30": (-86.7577396896561, 30.93392028146378),
+    "Deermont Drive": (-86.50654055468495, 30.797815823236757),
+    "Fairwind Court": (-86.41718043541469, 30.401831740927317),
+    "Buchanan Court Southwest": (-86.61750310804108, 30.409804002458703),
+    "Curacro Way": (-86.41963123772953, 30.47422031911893),
+    "Wakulla Road": (-86.53562154539127, 30.46228835736573),
+    "Underwood Lane": (-86.48013992546836, 30.531207885718732),
+    "Rockhill Road": (-86.60403195250255, 30.97576276021506),
+    "Hemphill Road": (-86.53782090888512, 30.822733575026405),
+    "Aloma Court": (-86.4408885, 30.507993),
+    "Olde Cypress Circle Northwest": (-86.63848492071902, 30.417981132687782),
+    "Capri Court": (-86.55315534993102, 30.706499318423603),
+    "Heritage Court": (-86.6498, 30.460395),
+    "12th Street": (-86.56327580316106, 30.44163372142019),
+    "Eley Road": (-86.54598490703484, 30.464620452762055),
+    "Stephens Lane": (-86.51524515038888, 30.812669792188885),
+    "Lois Street": (-86.60802029137069, 30.44803724223455),
+    "Savannah Lane": (-86.56393001251949, 30.70360137180742),
+    "Anzui Lane": (-86.62677938161178, 30.45114410493825),
+    "Shell Avenue Southeast": (-86.61223314901818, 30.4089225979339),
+    "Griffith Cemetery Road": (-86.6420865077033, 30.789569497072257),
+    "Campbell Drive": (-86.47527795049615, 30.526117073135147),
+    "Grimm Lane": (-86.70563135, 30.4126395),
+    "Poquito Road": (-86.5826887161737, 30.455510680675218),
+    "Connor Drive": (-86.54679576431187, 30.718021136771107),
+    "Ridgelake Drive": (-86.66318116881781, 30.415817890774868),
+    "Colonial Circle": (-86.53693080063772, 30.769949995536248),
+    "Sunburst Drive West": (-86.41976192234529, 30.81962587292683),
+    "M A Couch Way": (-86.5582315, 30.774456),
+    "37th Street": (-86.46976123745293, 30.522214176606713),
+    "Magnolia Lane": (-86.48513650000001, 30.491539000000007),
+    "Koon Street": (-86.6365383971809, 30.445507018129053),
+    "Marcia Circle": (-86.64650350042147, 30.411491479329236),
+    "Pauls Way": (-86.60502447257228, 30.701533296789865),
+    "Aza Place": (-86.5537915, 30.765068499999998),
+    "Opp Boulevard Northeast": (-86.6065239611338, 30.42140105992146),
+    "Winthrop Street": (-86.6059023012034, 30.439837507366256),
+    "Duval Street": (-86.60639776317345, 30.444468154105127),
+    "West James Lee Boulevard": (-86.57363761669481, 30.76180965355094),
+    "Robby Lane": (-86.50848927677723, 30.815017088786064),
+    "Patti Cove": (-86.46312412696675, 30.50250603466731),
+    "Monarch Circle": (-86.47643935279466, 30.503098556554413),
+    "Range Road": (-86.39881919714318, 30.49133099840214),
+    "Jackson Street Northeast": (-86.6117964772106, 30.417413835470157),
+    "Waynel Circle Southeast": (-86.5950704015384, 30.409167222533068),
+    "Otahite Trail": (-86.731454806323, 30.883606492803295),
+    "Ellis Avenue": (-86.47899217487058, 30.517751125303988),
+    "East Fern Dell Avenue": (-86.48967830336304, 30.49469530678614),
+    "Born Road": (-86.63689549423255, 30.684063927889714),
+    "Miracle Strip Parkway Southeast": (-86.61243440777936, 30.40405466395225),
+    "Country Club Avenue Northeast": (-86.61258217253656, 30.460544989396627),
+    "Port Dixie Boulevard": (-86.573971, 30.443046000000002),
+    "Misty Water Lane": (-86.65048507215225, 30.408019994163382),
+    "Brook Court": (-86.41852034280183, 30.467440255859945),
+    "Abalone Court": (-86.60964972140798, 30.396510552220924),
+    "Tiffany Court Southeast": (-86.5977005, 30.407494499999995),
+    "Bluebird Lane": (-86.50226126265305, 30.813984490571773),
+    "Specialty Farms Road": (-86.54532577603865, 30.84892246446716),
+    "1st Street Southwest": (-86.61566725744137, 30.40541854155835),
+    "Mary Esther Boulevard": (-86.65521866129691, 30.41159851295452),
+    "Sudduth Court Northeast": (-86.59489418743455, 30.419569088596578),
+    "Lombard Circle": (-86.64813699114758, 30.439348720917174),
+    "Cunningham Court": (-86.47155595120242, 30.515320296821656),
+    "Lido Road": (-86.48713543725562, 30.479005916265876),
+    "Pine Court": (-86.47357399997803, 30.51479848537739),
+    "Harrelson Drive": (-86.59858745607217, 30.44306433773314),
+    "Crewilla Drive Northwest": (-86.61529661547974, 30.426243966567498),
+    "Swan Avenue": (-86.50398138293758, 30.81667382181201),
+    "Suzanne Circle": (-86.68401791869051, 30.71728509028336),
+    "Hillview Circle": (-86.57346271963203, 30.701372770678635),
+    "Ashley Maria Court": (-86.56121481600628, 30.71337533430564),
+    "Choctaw Court": (-86.541998360105, 30.72314604396387),
+    "Plantation Point": (-86.44854722494875, 30.404354057068517),
+    "Dock's Place": (-86.63463501740831, 30.458087925124012),
+    "Garrett Mill Road": (-86.65082483179708, 30.762911170031213),
+    "Ferry Road Southeast": (-86.6013429811485, 30.409947977497968),
+    "South Whitewood Way": (-86.4158309535963, 30.47504830338046),
+    "Lee Trevino Court": (-86.56170434897489, 30.434020984664528),
+    "Lakeside Court": (-86.59288072242512, 30.418758234118155),
+    "Shumpert Street Northwest": (-86.62961901471142, 30.417434330467334),
+    "Richard Road": (-86.66382929084058, 30.761659648449868),
+    "Jefferyscot Court": (-86.58193102363794, 30.720703392946188),
+    "Horsecreek Road": (-86.61914420828361, 30.964190436592098),
+    "Samana Way": (-86.41496168416727, 30.479181896575415),
+    "Glen Lake Circle": (-86.4271767283209, 30.482383349130686),
+    "Bent Arrow Circle": (-86.48626347593931, 30.39536390945578),
+    "Hazel Drive": (-86.63445505, 30.44284665),
+    "13th Street": (-86.46077364859389, 30.497806830557366),
+    "Choctaw Cove": (-86.48740919746402, 30.4862631516115),
+    "Ping Lane": (-86.5597515, 30.708297999999996),
+    "Pentecost Lane": (-86.623194, 30.4402955),
+    "Jamestown Avenue": (-86.61945126544212, 30.43357187656389),
+    "Jerry Lane": (-86.62347142490363, 30.733626230070023),
+    "Villacrest Drive": (-86.58351262861221, 30.716465761224544),
+    "Vernon Jeffers Road": (-86.71185959568643, 30.974107811879012),
+    "Azalea Circle": (-86.4871686783918, 30.491144414265865),
+    "Dodo Way": (-86.39411143909166, 30.738870578240867),
+    "Jupiter Street": (-86.48313928754067, 30.41080815501944),
+    "James Avenue": (-86.50535197005358, 30.508675636384954),
+    "Noble Circle": (-86.5575383863281, 30.740907587654412),
+    "Ardmore Court": (-86.42511367190107, 30.461136043525805),
+    "Sharon Drive": (-86.44166849603852, 30.5228772002379),
+    "Bradley Road": (-86.5264748226762, 30.852211478450478),
+    "Jeni Mae Court": (-86.6440978, 30.45939295),
+    "Ocean View Drive": (-86.42581349968667, 30.383520006231613),
+    "Choctaw Circle": (-86.59639899855134, 30.783834460779396),
+    "Julia Avenue": (-86.47499301038667, 30.514643646993253),
+    "Elzie Road": (-86.69104929033931, 30.777484263417207),
+    "Indian Mound Road": (-86.46044998350851, 30.811701700825537),
+    "Safe Harbor Cove": (-86.48491301410492, 30.48417868277412),
+    "Woodlawn Drive": (-86.56445960467543, 30.77659922803772),
+    "Louisiana Avenue": (-86.49565850755585, 30.49072857154195),
+    "Edrehi Avenue": (-86.45600254686804, 30.510951603242606),
+    "Regatta Circle": (-86.49203813521453, 30.52046678352644),
+    "Atwell Road": (-86.53898308232537, 30.74769657886335),
+    "Gulf Winds Court": (-86.50402951617055, 30.38750791327654),
+    "Stewart Circle": (-86.60321953402423, 30.44036951257202),
+    "Paradise Isles": (-86.41157037616514, 30.383814484345315),
+    "Marcel Street": (-86.64738250018982, 30.457847477489963),
+    "Eglin Air Force Base": (-86.79687256957267, 30.54267489461262),
+    "Bennetts End": (-86.65216975376458, 30.463835542934447),
+    "Southminister Circle": (-86.42560265608155, 30.462701475959168),
+    "Pleasant Street Northwest": (-86.62864253153516, 30.42584214164981),
+    "Zion Boulevard": (-86.64674325093823, 30.454179071329914),
+    "Concord Court": (-86.62051241676393, 30.438540664315333),
+    "Softwood Drive": (-86.6534301969168, 30.429054073657753),
+    "Carlos Drive": (-86.62608540281404, 30.451370987220916),
+    "Bayberry Drive": (-86.44473254479229, 30.51324133560389),
+    "Tarpon Street": (-86.41693589823728, 30.383363830579558),
+    "Troy Circle Northeast": (-86.60313421020265, 30.45343947078385),
+    "Chappie James Street": (-86.58483043478206, 30.752485309287433),
+    "Oak Place": (-86.561722, 30.724175000000002),
+    "Fox Lane": (-86.74131436616466, 30.685069779671473),
+    "Lauderhill Lane": (-86.64529735233141, 30.448771549986933),
+    "Dolphin Estates Court": (-86.49921752050874, 30.39729350000567),
+    "Lightwood Court": (-86.44027249999999, 30.496277999999997),
+    "Park Circle Southeast": (-86.61093731377741, 30.41097483470713),
+    "Muirfield Drive": (-86.42532017235544, 30.47476153312583),
+    "Sleepy Hollow Road": (-86.65292452693272, 30.408425114819533),
+    "Greenway Cove": (-86.4520299583423, 30.52482496519289),
+    "Parrish Cove": (-86.76070767069321, 30.40831498910445),
+    "Reinke Drive": (-86.54548092353274, 30.789687043319454),
+    "Ossippee Way": (-86.533768, 30.4625545),
+    "Ludlum Road": (-86.43474048540571, 30.948195093342324),
+    "14th Street": (-86.6812572894547, 30.793608530790276),
+    "Knots Place": (-86.48034241796326, 30.405346027551957),
+    "Gabrielle Drive": (-86.58510759482036, 30.72316385923704),
+    "Jenee Court": (-86.54213243626646, 30.769542999546534),
+    "South Bristol Court": (-86.41937200000001, 30.461498500000005),
+    "Walnut Avenue West": (-86.57186759871179, 30.753790699626123),
+    "Burton Avenue Northeast": (-86.60501846591498, 30.460783624094937),
+    "Bedford Place Northeast": (-86.60325836320551, 30.45968165245417),
+    "Windjammer Court": (-86.40863969381269, 30.397739689651953),
+    "Ocean Boulevard": (-86.40395364219667, 30.380268377809927),
+    "Big Buck Trail": (-86.45900984065214, 30.762783780818925),
+    "Niceville Avenue": (-86.49514811501054, 30.52793037352784),
+    "Fulmer Way": (-86.3948635789352, 30.737126726648007),
+    "Destin Drive Northwest": (-86.63385131359613, 30.421865549927592),
+    "Illinois Avenue": (-86.49903683293024, 30.513875087756023),
+    "Island Lane": (-86.47076973565551, 30.4997568807622),
+    "Yancey Street": (-86.63540876271263, 30.44358854785791),
+    "Lynn Bridge East": (-86.552614, 30.703927),
+    "Pennington Road": (-86.47109075070705, 30.782961870716647),
+    "Tipperary Way": (-86.44473661434229, 30.517111281215296),
+    "Bluewater Boulevard": (-86.43089355597934, 30.4824122078711),
+    "Macgregor Lane": (-86.55979458338678, 30.709018187936707),
+    "Bay Ridge Drive": (-86.53084351567693, 30.812809639803255),
+    "Sherman Kennedy Road": (-86.70960994215483, 30.83747475792586),
+    "Dogwood Acres": (-86.55652915316695, 30.80011630863579),
+    "Kimberly Lane": (-86.45142524378413, 30.818786932486347),
+    "Boatner Road": (-86.54954074450973, 30.457549243005257),
+    "Creek Circle": (-86.64909909356768, 30.434357632443408),
+    "Grimes Avenue": (-86.58618432134769, 30.753370459868762),
+    "Tiger Pointe Drive": (-86.45527865191441, 30.50588711263375),
+    "Royal Palm Court": (-86.6456747964272, 30.409110249882982),
+    "Saw Mill Road": (-86.63500338258322, 30.747494906866237),
+    "Ratliff Street": (-86.56886972455305, 30.748900798545773),
+    "Janet Lane": (-86.66278100196968, 30.432381885534667),
+    "Hanover Port Lane": (-86.64535852384398, 30.439871000399226),
+    "Henry Road": (-86.4041860161253, 30.764951966058877),
+    "Old Milligan Road": (-86.59082822193818, 30.765588660710076),
+    "Wildcat Court": (-86.48777147712326, 30.39468899843728),
+    "Al Hammett Road": (-86.73414992202129, 30.41379086446755),
+    "Saddle Horse Lane": (-86.570614, 30.807520000000004),
+    "Wittmer Ranch Road": (-86.50625848780257, 30.91136997508463),
+    "Greyfox Circle": (-86.61824748454279, 30.723549999725684),
+    "Elizabeth Court": (-86.62956249975372, 30.439846024565465),
+    "Marcia Drive": (-86.64665218666411, 30.411240675022913),
+    "Dana Pointe": (-86.46477307435107, 30.489109591064533),
+    "Marie Circle Northwest": (-86.63688136632233, 30.41784493546996),
+    "Meggs Drive Northeast": (-86.59540379859182, 30.421468161678305),
+    "Huntington Road": (-86.42241260522204, 30.51024180629734),
+    "Chavis Avenue": (-86.57713018262248, 30.768078558948876),
+    "Rush Road": (-86.71958923828001, 30.411942049592284),
+    "Wren Way": (-86.44379678887819, 30.492015806538365),
+    "Pelham Street": (-86.60723649979502, 30.44031901286245),
+    "Drakes Landing": (-86.71689699999999, 30.4137395),
+    "Rocky Shores Drive": (-86.43874512115964, 30.511742391128248),
+    "Canyon Trail": (-86.68621960208975, 30.750045735969188),
+    "Laurel Oaks Court": (-86.64227150154309, 30.449174435443613),
+    "Camp Nebo Road": (-86.76448391695966, 30.778114723594026),
+    "Sierra Drive": (-86.55672530904488, 30.44546596432202),
+    "Pearl Sand Drive": (-86.75031036887239, 30.40751432899409),
+    "Palermo Street": (-86.6277405, 30.4527465),
+    "Magnolia Plantation Boulevard": (-86.4307241642865, 30.49227045215724),
+    "Hughes Road": (-86.70838844882105, 30.966893367839095),
+    "Briarwood Circle Northwest": (-86.62715673578029, 30.42942183381185),
+    "15th Street": (-86.45685650657714, 30.49966247911559),
+    "Harmony Lane": (-86.65376608230366, 30.758943691992876),
+    "Travers Court": (-86.42984880623841, 30.481086885685343),
+    "Sea Hills Drive": (-86.49636060776778, 30.394542444795015),
+    "Mimosa Street": (-86.55005159619834, 30.774743334618837),
+    "Canary Way": (-86.40643555553999, 30.746516013734546),
+    "Happiness Road": (-86.73634999591819, 30.413325274953774),
+    "Division Street": (-86.61276595679774, 30.445416225957974),
+    "Elba Cove": (-86.4272575, 30.489926999999998),
+    "John Givens Road": (-86.52574332896917, 30.770574475770236),
+    "Greenleaf Place": (-86.61857585682458, 30.753748718520026),
+    "Pinecrest Road": (-86.51794754645832, 30.796121382846348),
+    "Blackberry Road": (-86.54324640752567, 30.80966109303072),
+    "Walther Street": (-86.67846419020994, 30.795534666435593),
+    "Harbor Boulevard": (-86.46199339109457, 30.385176769848176),
+    "Plew Avenue": (-86.58205395845741, 30.44334443242178),
+    "Liberty Lane": (-86.53659552451138, 30.771654935341385),
+    "Revell Street": (-86.4588380600395, 30.515117107163036),
+    "John Melvin Road": (-86.7553302133336, 30.748538214906716),
+    "Espanola Road": (-86.48269980690053, 30.479600686253846),
+    "Victorious Life Place": (-86.55283785, 30.80672435),
+    "Gray Place": (-86.56645574133636, 30.77271468626806),
+    "Balsam Drive": (-86.47971063745513, 30.533433468429394),
+    "Scott Street": (-86.66108080901576, 30.434238509776616),
+    "Hudson Street": (-86.5865124311174, 30.763770174125444),
+    "Pinewood Terrace": (-86.64962619756291, 30.430203965985356),
+    "Hidden Lakes Drive": (-86.43090739463238, 30.489084230774292),
+    "Flatwoods Drive": (-86.59012551618315, 30.7774203503088),
+    "Lynn Bridge West": (-86.5544853172515, 30.704201245992856),
+    "Weeks Road": (-86.62865700112079, 30.450191256243556),
+    "Retta Lane": (-86.58534595848481, 30.729907438887974),
+    "Prestwick Drive": (-86.4266179632198, 30.485198235907436),
+    "Cotton Tree Court": (-86.6415515507365, 30.4483540002754),
+    "Clover Street": (-86.51580297077115, 30.81812180690966),
+    "Mohawk Trail": (-86.6087871078809, 30.771604121194645),
+    "Bill Lundy Road": (-86.5558409419595, 30.861182283371836),
+    "Moores Mill Creek Road": (-86.56425368030831, 30.98633799254878),
+    "Clipper Cove": (-86.42423735732557, 30.384840278056036),
+    "Maple Road": (-86.5237382253663, 30.840578347718385),
+    "Corinthian Place": (-86.42312250522531, 30.395332690951204),
+    "Burning Tree Drive": (-86.4587737752258, 30.404432844550122),
+    "18th Street": (-86.4656515, 30.503791999999997),
+    "Big O's Green Acres Drive": (-86.53167683462266, 30.838159587440312),
+    "Mare Creek Drive": (-86.42535851986247, 30.7516229998976),
+    "Green Palm Circle": (-86.47277945, 30.498121500000003),
+    "Quail Ridge Street": (-86.53819274134145, 30.790503979424674),
+    "Pointer Lane": (-86.56220996545697, 30.801440072024334),
+    "Hannah Branch Road": (-86.41146588583985, 30.764998864008952),
+    "Tecumseh Lane": (-86.74197134763278, 30.40747656862978),
+    "Celeste Street": (-86.75472054110263, 30.412715685780576),
+    "Austin Court": (-86.78382719079838, 30.415520664213997),
+    "Windstarr Drive": (-86.41133454261933, 30.38610520464079),
+    "Catamaran Lane": (-86.57550362135332, 30.447113493304887),
+    "Rainbow Lane": (-86.54257421716333, 30.774903473678673),
+    "Snellgrove Road": (-86.41525388015079, 30.966824597254615),
+    "Marten Lane": (-86.75642836653225, 30.685007793453284),
+    "2nd Street Southeast": (-86.60823801358138, 30.406859165896513),
+    "Scenic Hwy 98": (-86.45938369910212, 30.38453200893911),
+    "Hunting Meadows Drive": (-86.57342286666783, 30.801268060783283),
+    "Mc Clean Street": (-86.6964932818757, 30.416315285685922),
+    "16th Street": (-86.68022082970693, 30.79569972227306),
+    "Timber Court": (-86.4803344635476, 30.405829620247815),
+    "Holloway Road": (-86.64972278412017, 30.843817985085604),
+    "Daniel Johnson Road": (-86.7817250881772, 30.871828914793472),
+    "Lee Avenue": (-86.55702246669611, 30.7505434463499),
+    "Hunt Drive": (-86.54462486289894, 30.466041419395715),
+    "R J Stabler Road": (-86.5913285396365, 30.947134527966284),
+    "Fairview Avenue": (-86.5192765, 30.795551999999997),
+    "Bill's Road": (-86.601444676321, 30.92192743072906),
+    "Kirkley Court": (-86.60635350000001, 30.446979),
+    "Cobb Road": (-86.65333200217141, 30.824924216651496),
+    "Calvin Green Road": (-86.68059571741514, 30.687826733799618),
+    "Pinecone Trail": (-86.45616189733902, 30.767324054609695),
+    "Alan A Dale Drive": (-86.47066468609867, 30.52119547074035),
+    "Sweetwater Run": (-86.4585014660357, 30.52502035585074),
+    "Pinoak Circle": (-86.46446881591777, 30.491152465115672),
+    "Ingrid Court": (-86.44346550949834, 30.49637124455322),
+    "Dowdell Street Southwest": (-86.61795654339699, 30.40933551840981),
+    "Natures Trail Court Northwest": (-86.62881380170386, 30.42843953641952),
+    "McNair Drive": (-86.55639803453722, 30.772592217762714),
+    "Huckleberry Lane": (-86.49688846905264, 30.814388690084208),
+    "Pecan Lane": (-86.74705001210386, 30.707509418786728),
+    "Sudduth Circle Northeast": (-86.59187591118369, 30.422254281122335),
+    "Brentom Court": (-86.6269317, 30.4650093),
+    "Mullet Creek Run": (-86.45520192255506, 30.53046784410456),
+    "Laurel Oak Terrace": (-86.57620009621073, 30.75969756995588),
+    "Vinson Ray Road": (-86.65743706300465, 30.85356377699566),
+    "Cedar Avenue": (-86.47817818840885, 30.51748851517444),
+    "Sandmore Shores Drive": (-86.776825, 30.411782),
+    "Beverly Drive": (-86.47618543691061, 30.508770862123626),
+    "New Ebenezer Road": (-86.49053701902757, 30.977515491520954),
+    "Bay Drive": (-86.4452365, 30.493217),
+    "Fliva Avenue Northwest": (-86.62479326383645, 30.425638502724947),
+    "Laramie Boulevard": (-86.58339590411589, 30.70462647889746),
+    "30th Street": (-86.46688154375316, 30.515216387148005),
+    "Eglin Street": (-86.60264671356255, 30.43794012326387),
+    "Quail Drive": (-86.75911310410993, 30.681774623054817),
+    "19th Street": (-86.45955356140038, 30.50503588763792),
+    "Baywind Drive": (-86.43333604615516, 30.473070440339733),
+    "Detroit Avenue": (-86.50951843028389, 30.515907549497815),
+    "Pinto Lane": (-86.57376761265157, 30.80297281263632),
+    "Appaloosa Way": (-86.5714725044223, 30.806902995151045),
+    "Clinton Court": (-86.47755045191829, 30.508688853002106),
+    "Loblolly Drive": (-86.5736711714601, 30.458537538041274),
+    "Oleander Parkway": (-86.65131742002882, 30.409379037631144),
+    "Norma Court": (-86.756208, 30.407559499999998),
+    "Guan Way": (-86.39812277153042, 30.737030897722605),
+    "New York Street": (-86.68698476161585, 30.797090239229675),
+    "Courington Court": (-86.47575973364447, 30.511498991215447),
+    "Josie Road": (-86.72098092169064, 30.41313444301967),
+    "Buckeye Court": (-86.46224950000001, 30.496008999999997),
+    "Knoll Road": (-86.50006351990466, 30.750876191249386),
+    "Tine Court": (-86.64169829820784, 30.44919348848776),
+    "Longleaf Court": (-86.47757048926965, 30.53165588078178),
+    "Samos Cove": (-86.427145, 30.490593),
+    "Jet Court Northwest": (-86.62656298758257, 30.4177031382467),
+    "West Old Mill Way": (-86.55791710266229, 30.72340729106019),
+    "Grand Oaks Way": (-86.50349498997261, 30.403062509734642),
+    "Hammock Lane": (-86.56129706250248, 30.782222188794037),
+    "Carter Lane": (-86.50223661339706, 30.404841373781615),
+    "17th Street": (-86.45571311473425, 30.50160075394435),
+    "2nd Street Southwest": (-86.61359148237261, 30.4070964665953),
+    "Garden Lane": (-86.47647999921882, 30.533729534651386),
+    "Oak Lane": (-86.56497212965435, 30.783142275338847),
+    "Mande Court": (-86.58349062584509, 30.441293372762),
+    "Pasco Broxson Circle": (-86.72491948282205, 30.745200258484033),
+    "3rd Street Southeast": (-86.60529774065333, 30.408632924598376),
+    "Carson Drive Northeast": (-86.6088906515514, 30.416168504540458),
+    "Mc Farr Street": (-86.47753478362404, 30.503475461137608),
+    "Wright Circle": (-86.41191286041023, 30.477274503848367),
+    "Coleman Point": (-86.4414682444429, 30.407494100035695),
+    "Rosewood Drive": (-86.79786732927057, 30.417979119413342),
+    "Country Club Drive East": (-86.45174026171696, 30.396000820869425),
+    "Okeechoee Court": (-86.46135100000001, 30.4010165),
+    "Shady Oaks Lane": (-86.57229719839559, 30.435745690291174),
+    "Kelly Street": (-86.49437573458466, 30.402584035625384),
+    "Lariat Court": (-86.6475102, 30.463552499999995),
+    "Bay Drive Northeast": (-86.5890658896639, 30.41524420616422),
+    "Villa Avenue": (-86.4609371, 30.96098355),
+    "Oakview Place": (-86.56471913836751, 30.767536948526086),
+    "Sunshine Lane": (-86.47830200006375, 30.529763496429716),
+    "Bent Arrow Drive": (-86.48875315177465, 30.39489763511377),
+    "Montana Avenue": (-86.49315386847695, 30.498791739981357),
+    "Grant's Pass": (-86.612664, 30.775922000000005),
+    "Commodore Point": (-86.41324183994087, 30.399174707523343),
+    "Aloma Faye Lane": (-86.66005654702977, 30.43397358257652),
+    "Yow Road": (-86.77868078277335, 30.76046780117265),
+    "Londonderry Cove": (-86.646453, 30.439914999999996),
+    "Crowder Court": (-86.63605678277055, 30.433914142873096),
+    "Golf Villa Court": (-86.41118326141174, 30.395557355312565),
+    "Weekewatchee Circle": (-86.46001667940172, 30.400088410508847),
+    "Howell Road": (-86.50296730212459, 30.51973271947377),
+    "Upper Karrick Lake Road": (-86.64122803326235, 30.896932104077468),
+    "Riverside Drive": (-86.64492513456791, 30.435134032749264),
+    "O Hara Court": (-86.56156948729257, 30.70703842581668),
+    "Holly Drive": (-86.5556336420622, 30.81001918984814),
+    "Fox Den Court": (-86.45962349999999, 30.404235999999997),
+    "Maracel Loop": (-86.61546688942754, 30.72073573503255),
+    "Cedar Springs Farm Road": (-86.78798092835534, 30.70441531407044),
+    "Log Lake Road": (-86.75059734340512, 30.70594531751547),
+    "Indian Bayou Drive": (-86.45120526363802, 30.39842960807527),
+    "Aunt Polly Place": (-86.58815335, 30.707340899999995),
+    "Buckhorn Drive": (-86.51054938406689, 30.804820758111415),
+    "East F Sanford Road": (-86.6691346349012, 30.883651905938862),
+    "Ashnick Lane": (-86.48533200634445, 30.94812887599815),
+    "Florida Avenue": (-86.48966422055258, 30.4966982576982),
+    "Tom Hanks Drive": (-86.41155202907453, 30.480396656512553),
+    "Bobolink Way": (-86.40436948702656, 30.745521765065575),
+    "Justice Johnson Road": (-86.69403944646359, 30.832339289944475),
+    "Park Avenue": (-86.4620023961308, 30.962224000137443),
+    "Caicos Cay": (-86.40217247962585, 30.380502825274764),
+    "Chelsea Drive Northwest": (-86.61602084562732, 30.450361838603925),
+    "Esmond Court": (-86.47760700524263, 30.526139865501136),
+    "Jones Road": (-86.56528116740886, 30.783959697774076),
+    "John Steinbeck Drive": (-86.4284708526035, 30.490948808011513),
+    "Hawthorne Circle": (-86.6111818701609, 30.433749741677417),
+    "Timberline Drive": (-86.55567453058869, 30.707657250012087),
+    "Windsor Court": (-86.5424731480493, 30.717400378888765),
+    "Terry Circle": (-86.66950800092474, 30.41043436756521),
+    "Joe Martin Circle": (-86.57559330171102, 30.448891810003484),
+    "Ajax Drive Northwest": (-86.66812328872179, 30.426019727495564),
+    "Bob White Court": (-86.76042770461356, 30.41242293474933),
+    "Van Matre Avenue": (-86.50581654165453, 30.483130644258647),
+    "Patmos Cove": (-86.42672483919303, 30.49038141370303),
+    "Spring Brook Lane": (-86.73220831649547, 30.41411825158126),
+    "Limestone Creek Cove": (-86.4606583948412, 30.526515208925318),
+    "Carl Place": (-86.56142700000001, 30.759522),
+    "Markella Road Northwest": (-86.62194007445675, 30.41759012312763),
+    "Grand Prix Drive": (-86.58095961778128, 30.709295178381012),
+    "Spring Lake Drive": (-86.48854883428491, 30.39982799729234),
+    "Charles Booker Road": (-86.73867059047372, 30.989185723617478),
+    "Misty Lane": (-86.50214967075388, 30.829052394694415),
+    "Lawson Lane": (-86.66333672971227, 30.97222103865117),
+    "Warren Bridge Road": (-86.5521032, 30.795924699999997),
+    "Howard Road": (-86.64119282370021, 30.68420573678754),
+    "Smokey Branch Road": (-86.47596329219897, 30.783665172035384),
+    "Glenwood Court": (-86.45903663413416, 30.50016653610318),
+    "Cartier Place": (-86.64410545000001, 30.4398375),
+    "Redman Court": (-86.47102809347273, 30.513533005023213),
+    "Tonass Way": (-86.60715115807392, 30.43212712742882),
+    "Evans Court": (-86.44025767476691, 30.501640763784298),
+    "3rd Street Southwest": (-86.61353854291802, 30.408902262022107),
+    "Village Court": (-86.64266849955611, 30.41742952114194),
+    "Lacy Lane": (-86.6273955, 30.440651499999998),
+    "Kotsa Lane": (-86.40401498433167, 30.3965115030105),
+    "Sycamore Avenue": (-86.45851194025036, 30.4997723748416),
+    "McCaskill Street": (-86.5709543961076, 30.764642488230468),
+    "1st Avenue East": (-86.56074347736356, 30.765536335814836),
+    "Ccs Street": (-86.63645168612032, 30.435298821437442),
+    "Whispering Oaks Lane": (-86.64479506319186, 30.459354119778205),
+    "Country Club Drive West": (-86.45630404286912, 30.40053668928936),
+    "Covell Road": (-86.55798440836554, 30.734985778359253),
+    "Duncan Drive": (-86.44454676074089, 30.509137812610287),
+    "Tranquility Lane": (-86.40543664872084, 30.38513599711653),
+    "Edge Perry Road": (-86.43557927927694, 30.815854006296984),
+    "Ridge Lane": (-86.41205609729444, 30.48453731200555),
+    "Ray Avenue": (-86.57368306628408, 30.70322386263886),
+    "Carolina Avenue": (-86.49498291139777, 30.491468348388715),
+    "Chardee Road": (-86.45653052527727, 30.80690430915868),
+    "Bayview Street": (-86.48474955026747, 30.40485231004802),
+    "Miracle Drive": (-86.72746099334304, 30.41339578192098),
+    "Knollwood Road": (-86.41606893539645, 30.49364308789417),
+    "Old Jones Road": (-86.56745537043537, 30.78777799843353),
+    "Willow Bend Court": (-86.56500151545829, 30.70601090299751),
+    "East Bowers Avenue": (-86.56277733867863, 30.75568438307278),
+    "Frances Street": (-86.5392157905546, 30.795898962199285),
+    "Stacy Lane": (-86.59874036267786, 30.79764658354873),
+    "Magnolia Drive": (-86.73615739547694, 30.683023529461448),
+    "Riverwood Drive": (-86.57220354497717, 30.71533433094358),
+    "Greenwood Way": (-86.41284033761495, 30.473244579839573),
+    "Michael Court": (-86.78604381628543, 30.4152691182583),
+    "Livingston Street": (-86.56051257009177, 30.7772924808046),
+    "Hillbrook Court": (-86.56876049696261, 30.438662113252338),
+    "West Folk Drive": (-86.70897442358104, 30.731171488557706),
+    "Springwood Way": (-86.47849992655226, 30.530624722171876),
+    "Southwind Court": (-86.4286005110261, 30.473854695899252),
+    "Sheldon Court": (-86.56156344915478, 30.708311961094402),
+    "Leroy Martin Lane": (-86.63380472340434, 30.7946344456272),
+    "Landfall Court": (-86.41208044704346, 30.401342435663082),
+    "Dusty Trail": (-86.77620060402843, 30.873562949438163),
+    "Carver Lane": (-86.65161398873676, 30.748092679598166),
+    "Valastics Avenue": (-86.50843551313402, 30.51079750331744),
+    "Gerald Brooks Road": (-86.7407508527522, 30.792213349852855),
+    "Nomad Way": (-86.56219354999999, 30.483307099999998),
+    "Paddle Wheel Cove": (-86.58918001432201, 30.704103659993496),
+    "Tapoco Drive": (-86.53342345894949, 30.457231163525265),
+    "23rd Street": (-86.4637368763493, 30.508524893870362),
+    "Homewood Drive": (-86.64550430713733, 30.430529836582103),
+    "Wildhorse Drive": (-86.5902725, 30.708800000000004),
+    "Charles Drive": (-86.50445825392707, 30.507737144811813),
+    "Whitrock Lane": (-86.6138081033156, 30.43647452570856),
+    "West Redstone Avenue": (-86.56744437357392, 30.73564370196355),
+    "Lexie Drive": (-86.58626624956423, 30.72301078409969),
+    "Harley Lane": (-86.74967944715992, 30.705131819647775),
+    "West Washington Avenue": (-86.49611664508686, 30.507579824607635),
+    "Sutton Place": (-86.66422299686897, 30.431649190536668),
+    "Liberator Lane": (-86.77393531368185, 30.84266899858927),
+    "Canterbury Court Northwest": (-86.64267900029809, 30.416809483597007),
+    "Woodfern Path": (-86.65458627087935, 30.462796197393754),
+    "Scarlet Drive": (-86.56522584959272, 30.70502002275545),
+    "Reed Avenue": (-86.5567979624314, 30.751908413138086),
+    "Northampton Circle": (-86.64327, 30.453816),
+    "Joellen Lane": (-86.65448349151745, 30.46153250098609),
+    "Forest Street": (-86.50747358495033, 30.399987310685454),
+    "Adam Thomas Lane": (-86.70376530240738, 30.755696400337868),
+    "Finch Avenue": (-86.50625526423357, 30.81274897582103),
+    "Patricia Lane": (-86.65683447687775, 30.432016999325256),
+    "Shoalwood Drive": (-86.54996250179617, 30.719350000019674),
+    "Willsey Trail": (-86.491077, 30.8111845),
+    "Dahlquist Drive": (-86.55632986269218, 30.772243114579055),
+    "11th Avenue": (-86.57097730014965, 30.447028343375678),
+    "1st Avenue West": (-86.58132060079443, 30.766020049502693),
+    "Castlewood Lane": (-86.41621667088013, 30.491553534716644),
+    "Thornhill Road": (-86.61139750000001, 30.434693),
+    "Columbus Street": (-86.4989921783537, 30.51646735334709),
+    "Nechako Court": (-86.55331977455036, 30.707312704157232),
+    "Steel Mill Creek Road": (-86.410033492365, 30.91660812358401),
+    "Van Dyke Drive": (-86.57901667618613, 30.4384097731873),
+    "Ashland Court": (-86.5724030063324, 30.439774189643796),
+    "Lillie Street": (-86.54123156050163, 30.797567729710156),
+    "James Lee Road": (-86.61763022473549, 30.439516631355932),
+    "Birch Avenue": (-86.58282549631087, 30.456532816975045),
+    "Garden Oaks Cove": (-86.426774, 30.488719),
+    "Westlake Court": (-86.43248096010828, 30.48793884655177),
+    "Basin Creek Cove": (-86.45926769578512, 30.527152749758447),
+    "Jamaica Cove": (-86.42144213193703, 30.48209259677114),
+    "Wenona Way": (-86.53820949743027, 30.455147755483413),
+    "Binnacle Lane": (-86.56890234607395, 30.446974538222417),
+    "Astro Drive": (-86.53621655471916, 30.777228449472986),
+    "Tooke Street": (-86.60710248086772, 30.43616248338866),
+    "David Trimm Drive": (-86.41604355573115, 30.483884755538526),
+    "Curacro Cove": (-86.42104235653359, 30.47382670692011),
+    "Timpoochee Lane": (-86.39476516524833, 30.456479927108184),
+    "Lake Lorraine Circle": (-86.55790626780211, 30.44336299560914),
+    "Atwater Court": (-86.78285614272534, 30.40973539105881),
+    "Clary Road": (-86.52361318985933, 30.93420966682262),
+    "Defiance Drive": (-86.47354888899025, 30.392120341110267),
+    "Dolphin Avenue": (-86.61561617207441, 30.39826688070625),
+    "Anglin Lane": (-86.48302933398803, 30.80571195403525),
+    "Ryan Road": (-86.46278464621486, 30.78712902778654),
+    "Tansey Lane": (-86.5142744235197, 30.8179480367698),
+    "Lola Circle": (-86.48955897677911, 30.392950288146945),
+    "Commerce Avenue Southwest": (-86.62741251551483, 30.41127700046265),
+    "Lajolla Lane": (-86.74788586064759, 30.409215674901287),
+    "Frontier Drive": (-86.58866160209534, 30.77741682434274),
+    "Crossen Street": (-86.57094759997771, 30.72992692151048),
+    "Sandbur Court": (-86.57464520118369, 30.460077557855254),
+    "Scenic Oak Lane": (-86.64655481774547, 30.4487844622382),
+    "Dove Run Road": (-86.75895415853647, 30.67455342147474),
+    "Catawba Road": (-86.53600466774996, 30.459826771986542),
+    "Kenneth Avenue": (-86.57479369602653, 30.775149448951336),
+    "Winstead Cove": (-86.53119622192425, 30.823058946578254),
+    "Rosebud Avenue South": (-86.40034953139482, 30.738640355839028),
+    "West Cahaw Way": (-86.40789875084509, 30.740586075398827),
+    "Seventeenth Tee Cove": (-86.45304823132173, 30.52040640735702),
+    "Colony Court": (-86.62362250000001, 30.436499499999996),
+    "Shore Drive Southeast": (-86.5890765, 30.4096635),
+    "Charlotte Court": (-86.62960580981124, 30.43898194185371),
+    "Brand Road": (-86.64688203714044, 30.787591839998445),
+    "Lea Place": (-86.554843, 30.765073500000003),
+    "Cahokia Run": (-86.5588052245897, 30.71638209832221),
+    "Cobia Avenue": (-86.60831016900447, 30.397773416239186),
+    "Hatchee Road": (-86.54467456280857, 30.462836438132403),
+    "Romana Lane": (-86.75722760602612, 30.414500448425873),
+    "Otterlake Cove": (-86.4363979235156, 30.489960375280695),
+    "Midland Court": (-86.41174775929089, 30.486095144777313),
+    "Evergreen Street": (-86.582536010148, 30.456535000025546),
+    "Broxson Road": (-86.7395417543321, 30.698213614723606),
+    "Maple Avenue": (-86.46519560333209, 30.49940591813477),
+    "Liriope Loop": (-86.47471671824965, 30.39309003808608),
+    "Pinecrest Lane": (-86.634862, 30.448017999999998),
+    "Stonegate Court": (-86.60643116387307, 30.435832637594007),
+    "Sunrise Drive": (-86.55714952745787, 30.437568627946245),
+    "Krivik Court": (-86.61038690000001, 30.46804785),
+    "Indian Bayou Trail": (-86.45998053891208, 30.39087793781358),
+    "Kilcrease Road": (-86.697507997777, 30.83396422885431),
+    "Wildwood Road": (-86.59056740914652, 30.792037926998958),
+    "Ray Lawson Drive": (-86.73021349999999, 30.881735999999997),
+    "Doolittle Boulevard": (-86.66475853287541, 30.411509154879028),
+    "Jim Strickland Road": (-86.45561598905279, 30.953904453131667),
+    "Pine Cone Drive": (-86.65040336938767, 30.42940170356469),
+    "Bess Avenue": (-86.57187831340235, 30.7454916617454),
+    "Walker Road": (-86.52124207900518, 30.99066675023211),
+    "Zerbe Street": (-86.51127810536897, 30.396510315857093),
+    "Camden Pass Lane": (-86.64618275208632, 30.439904004166884),
+    "Kelvin Court": (-86.57339738963304, 30.744916889365125),
+    "Malta Cove": (-86.42773349999999, 30.4899345),
+    "Sherry Circle Northwest": (-86.63966398257952, 30.42465624173408),
+    "Marshall Drive": (-86.76065970780375, 30.70836965302476),
+    "Winoka Way": (-86.55651885087161, 30.7163412490373),
+    "Everglade Drive": (-86.4676441108753, 30.497533111255827),
+    "Island Drive": (-86.58703856639454, 30.71265612617117),
+    "Snapper Drive": (-86.49641350445, 30.397221000004276),
+    "Berwick Circle": (-86.56574106242131, 30.44261166407279),
+    "Garnett Avenue Northeast": (-86.61178367848639, 30.421313055976512),
+    "Wright Parkway Northwest": (-86.63914980971393, 30.423811470133913),
+    "Willard Road Northwest": (-86.62427692322235, 30.419174699239836),
+    "Pine Lake Court": (-86.54130649999999, 30.7783955),
+    "Glenlake Circle": (-86.429026, 30.483464),
+    "Poplar Avenue Northwest": (-86.65595160843372, 30.425762848500142),
+    "Saint Thomas Cove": (-86.41943606248734, 30.48448277174442),
+    "Barley Port Lane": (-86.64446601719789, 30.439352454055253),
+    "Flamenco Street": (-86.72554203521581, 30.41368317008115),
+    "Palmetto Drive": (-86.54644408067367, 30.76204064567901),
+    "Westwood Drive": (-86.64961203414737, 30.437947304294802),
+    "William Gary Johnson Road": (-86.68578564597662, 30.836239899037746),
+    "Bambi Road": (-86.45739562383137, 30.80424987107522),
+    "Clint Mason Road": (-86.48765015264284, 30.760827152962303),
+    "Terrance Lane": (-86.76185549057126, 30.41396754964466),
+    "Christy Drive": (-86.48031606180997, 30.50764335792554),
+    "Commercial Drive": (-86.41232055040267, 30.481455254251316),
+    "Titan Court": (-86.63302919899547, 30.45053202814835),
+    "Arnold Palmer Court": (-86.56167266541189, 30.437023448729104),
+    "Willow Bend Boulevard": (-86.65289997640012, 30.465839020217732),
+    "Mill Brook Lane": (-86.54433100667649, 30.79529700010289),
+    "Brett Street": (-86.56792866783407, 30.759694188068952),
+    "Parsonage Road": (-86.68332308384262, 30.781650575076064),
+    "Sunset Beach Drive": (-86.43135160624306, 30.4675385792013),
+    "Canoe Lake Road": (-86.75365776573746, 30.673887429262916),
+    "Windward Way": (-86.43909918077463, 30.484061618737154),
+    "Brunson Street": (-86.61367193554872, 30.719011986027123),
+    "Old Mill Way": (-86.54935102125424, 30.723922325316664),
+    "McCallum Avenue": (-86.57749805001276, 30.760288799978156),
+    "Panther Court": (-86.48850149185708, 30.394849497903863),
+    "Shalimar Court": (-86.552603, 30.4410895),
+    "Brookwood Boulevard": (-86.75828719187598, 30.409386640308288),
+    "Playground Road": (-86.62170821534067, 30.447427188555885),
+    "Poplar Head Church Road": (-86.7496861123163, 30.722803822581803),
+    "Kent Court": (-86.43439396101029, 30.510327408833035),
+    "Cornbread Lane": (-86.53692746954682, 30.85599340769304),
+    "10th Street": (-86.56657172617908, 30.441728235200166),
+    "Cadle Drive": (-86.59660710348851, 30.711107563305486),
+    "South Main Street": (-86.56661385833296, 30.754821946160884),
+    "Chicago Avenue": (-86.46120946619322, 30.95687131802492),
+    "Currant Trace": (-86.7494795, 30.405953),
+    "Islandview Drive": (-86.64833741329629, 30.408186672466908),
+    "Egret Court": (-86.50267233310649, 30.395385474400577),
+    "Shalimar Cove": (-86.5524545, 30.4409155),
+    "Clear Creek Road": (-86.46258196333056, 30.814203352030386),
+    "Sleepy Oaks Road Northwest": (-86.61366537847289, 30.4250654611291),
+    "Gingers Place": (-86.69678074522535, 30.717815139440695),
+    "North Campbell Drive": (-86.65729825339216, 30.4604116968595),
+    "Parkwood Place": (-86.41468200471067, 30.48595767722849),
+    "Hart Street": (-86.49664322676215, 30.53139501217604),
+    "Landview Drive": (-86.64901898230684, 30.462037384587326),
+    "Cardinal Avenue": (-86.61099852805194, 30.397978922010246),
+    "Quasar Drive": (-86.5375496786441, 30.778092748142793),
+    "Woodlow Road": (-86.46566553935152, 30.522546768299158),
+    "Waldo Road": (-86.4082249773801, 30.776975805873434),
+    "Annabelle Drive": (-86.66984755023903, 30.412335353981227),
+    "Adams Road": (-86.397332652978, 30.938033057198695),
+    "Hannah Circle": (-86.49504850036703, 30.40717001191538),
+    "Turley Lane": (-86.44803777032335, 30.757805283107874),
+    "Haney Drive": (-86.61433, 30.446479),
+    "Martinique Cove": (-86.42302084807756, 30.483951049268256),
+    "West Kelly Road": (-86.60212749860038, 30.955922647485085),
+    "West Cat Mar Road": (-86.40884148197947, 30.483417101737803),
+    "Charrington Place": (-86.6422052103914, 30.453053016003967),
+    "Truman Street": (-86.60633399044968, 30.446842140021793),
+    "Dyer Lane": (-86.50280699999999, 30.753860500000005),
+    "Ferretti Avenue": (-86.62795038135089, 30.4375890077438),
+    "Trout Creek Cove": (-86.45815344293784, 30.52796159571713),
+    "Ewing Court Northwest": (-86.63559789778175, 30.42808710330957),
+    "Desota Road": (-86.48252763824792, 30.47929755222234),
+    "Als Drive": (-86.47787114636677, 30.50255525826147),
+    "F I M Boulevard": (-86.6452704237623, 30.466470499704037),
+    "East Greenwood Cove": (-86.4118307159677, 30.47231989117305),
+    "Shantina Avenue": (-86.44118002922102, 30.815899623339643),
+    "Haburn Street": (-86.55102434269963, 30.771094914237736),
+    "Williams Street": (-86.63093549999999, 30.432965000000003),
+    "Judson Street": (-86.650402506729, 30.451444790336687),
+    "Fairfield Drive": (-86.60564022535755, 30.75991944886389),
+    "Chadwick Lane": (-86.41586793424227, 30.4896338492245),
+    "La Porte Road": (-86.52878214986505, 30.795760616171098),
+    "Peter Kuth Drive": (-86.4188719336139, 30.486035864524307),
+    "Sasser Street": (-86.4665594114507, 30.510494594928566),
+    "Lewis Street": (-86.63442706606972, 30.4393665773896),
+    "Home at Last Lane": (-86.43194220693829, 30.829492980563007),
+    "Carie Way": (-86.50905574345691, 30.528414015863266),
+    "Calypso Street": (-86.7250672298668, 30.41265482542258),
+    "Regency Park Drive": (-86.64472608810738, 30.40900804989818),
+    "Galaxy Drive": (-86.53610295744787, 30.77698684747523),
+    "Taylor Road": (-86.58367853034164, 30.820880774700328),
+    "Oddfellow Road": (-86.6298179134684, 30.46292535659443),
+    "Southminister Court": (-86.42774538972607, 30.463010937435783),
+    "Deluna Road Southwest": (-86.62922660553416, 30.410928837725855),
+    "Fairwood Drive": (-86.47224245191, 30.509539511738456),
+    "Egan Street": (-86.61274549999999, 30.7183865),
+    "Ramonde Court": (-86.4371561109713, 30.511178374785853),
+    "Martin Luther King Jr Boulevard": (-86.66058639443371, 30.441352578742467),
+    "Twin Cities Boulevard": (-86.49392696839257, 30.5332907530295),
+    "Ewing Street": (-86.75138555298854, 30.716475530624304),
+    "Hydac Road": (-86.63065049562292, 30.44729841040407),
+    "Davenport Avenue": (-86.5046871282953, 30.515438905177795),
+    "Old Mill Court": (-86.54794964865484, 30.722732246928558),
+    "Kelley Road": (-86.50669333015942, 30.523365943294134),
+    "McKinney Street": (-86.48104540886001, 30.51779915219102),
+    "Ariel Lane": (-86.6351235708442, 30.460361447602953),
+    "Elliott Road Southeast": (-86.59303974876916, 30.407172863115097),
+    "Tommie Steele Road": (-86.70455769159237, 30.967763862300618),
+    "Sea View Circle": (-86.49381842366493, 30.393067872057834),
+    "Oregon Court Northeast": (-86.60171087580962, 30.42059430430806),
+    "Letourneau Circle": (-86.70401465944657, 30.41652152825575),
+    "Cody Avenue": (-86.69410545070912, 30.423540598495105),
+    "21st Street": (-86.47450587931532, 30.506835492647348),
+    "Alonzo Drive": (-86.592584, 30.715741),
+    "11th Street": (-86.45669068509578, 30.495813742202913),
+    "Looney Road": (-86.71995905697277, 30.974063363980544),
+    "Charleston Circle": (-86.65266385836041, 30.465818971086094),
+    "Plymouth Avenue": (-86.61913124259051, 30.43215887384651),
+    "Marty Lane": (-86.64546131555967, 30.45402690479702),
+    "Hickory Avenue West": (-86.5759120070282, 30.7612295859157),
+    "Club Place Northeast": (-86.61184100003366, 30.461678998169443),
+    "Managua Way": (-86.72323896389327, 30.413641885361784),
+    "Woods Road": (-86.50283080387507, 30.970649859315294),
+    "McKinley Street": (-86.47732250001806, 30.52806049575361),
+    "Birch Street Southeast": (-86.61144858696977, 30.407954523248513),
+    "Bens Lane": (-86.54218608514945, 30.456741939046687),
+    "Mary Avenue": (-86.61384498957975, 30.443856516782414),
+    "Wynoka Way": (-86.55775443784715, 30.716891455292235),
+    "Par Court": (-86.61585492815392, 30.728951031217175),
+    "Fairway Place": (-86.5191309772482, 30.79653601408308),
+    "Farmers Street": (-86.55297657191825, 30.780463699790406),
+    "Anthony Drive": (-86.62758448132882, 30.452119484965664),
+    "Woodbine Circle": (-86.64476384834177, 30.42936782563074),
+    "Center Street": (-86.63668932825615, 30.435811374869317),
+    "Erwin Fleet Road": (-86.58184194435202, 30.44499513685459),
+    "Jenny Lane": (-86.54921126083838, 30.809933673432525),
+    "Whittle Lane": (-86.51851070675639, 30.875068633404467),
+    "Messick Road": (-86.6645802766872, 30.82547852540627),
+    "Sarah Drive": (-86.70843553729956, 30.801191024038662),
+    "Yaupon Court": (-86.57431000933616, 30.45537349751061),
+    "Blossom Drive": (-86.64943400000001, 30.437856),
+    "Freeport Court": (-86.74541853127121, 30.409958299061557),
+    "Vera Cruz Drive": (-86.49650943248886, 30.385654934992314),
+    "Constitution Road": (-86.53515779528493, 30.762574814625648),
+    "Romi Circle": (-86.40221711556092, 30.85232566157743),
+    "Hard Knock Road": (-86.4687234109911, 30.960780960578422),
+    "Noblat Drive": (-86.789089, 30.415376000000006),
+    "Cougar Circle": (-86.44075439823226, 30.48997359551594),
+    "Austin Avenue": (-86.78348738983323, 30.413557970550926),
+    "Lovers Lane": (-86.64728080124459, 30.45386597633569),
+    "Panagra Lane": (-86.57905928291201, 30.77474315937085),
+    "Bermuda Way": (-86.42764516059721, 30.48698080363439),
+    "Silver Oaks Lane": (-86.56597145857258, 30.80781216010217),
+    "Live Oak Court": (-86.56550155469917, 30.70240817758435),
+    "T W Drive": (-86.63354644884295, 30.806944617942616),
+    "Grady Johnson Road": (-86.48890447852335, 30.75349633481031),
+    "East Dogwood Drive": (-86.50255865102919, 30.79520525429928),
+    "Jack Road": (-86.53053417044315, 30.894833488719545),
+    "Gregory Drive": (-86.67069225037406, 30.41235996852931),
+    "Jack Stokes Road": (-86.69053008688999, 30.80914069994396),
+    "Davenport Road": (-86.6070253997727, 30.43618221997591),
+    "Bush Road": (-86.69506743337699, 30.802235611815153),
+    "Riverview Drive": (-86.6339640965338, 30.686811707664642),
+    "Dads Road": (-86.65102640006492, 30.748571882606974),
+    "Andros Street": (-86.74954799787217, 30.685002956008802),
+    "Meadow Lake Drive": (-86.56675259374929, 30.71222843643428),
+    "Chris Lane": (-86.78606204503929, 30.412307573666332),
+    "Montrose Drive": (-86.45695334032995, 30.509923151756897),
+    "Thomason Drive": (-86.65578863818824, 30.45894491623318),
+    "Oakdale Avenue": (-86.78836940056345, 30.412993211017547),
+    "Goodwin Avenue": (-86.56208957918722, 30.74048024974644),
+    "Osprey Landing": (-86.417984, 30.500645),
+    "Oelschlager Street": (-86.70727504999999, 30.412299400000002),
+    "Kenneth Street": (-86.63266997886284, 30.445077999756876),
+    "Sugarmill Lane": (-86.49356267664231, 30.993930183403975),
+    "Grebe Way": (-86.40455514184106, 30.738282629487838),
+    "Edwards Circle": (-86.50377095704361, 30.50736523967725),
+    "Opa-Locka Lane": (-86.40073307285493, 30.386870041771633),
+    "Bluewater Boulevard North": (-86.41699041618189, 30.496271017305183),
+    "Strawbridge Drive": (-86.55434233504387, 30.768513789616474),
+    "Tobago Court": (-86.59666902200763, 30.775230912471205),
+    "Birch Street Southwest": (-86.6135659999866, 30.40800950042969),
+    "Anzio Lane": (-86.62658910698345, 30.45184216345158),
+    "Graham Court Northeast": (-86.60270447283052, 30.42043913764328),
+    "Normandy Road": (-86.57574543493986, 30.79291015598224),
+    "4th Avenue": (-86.57153505539084, 30.43895545275318),
+    "Buckingham Way": (-86.590145, 30.4609696),
+    "Kanuha Drive": (-86.65854077080445, 30.4413296083445),
+    "Tree Point Drive": (-86.60206700720272, 30.455430599655916),
+    "Mid-Bay Bridge Road": (-86.42685114916084, 30.391232406533604),
+    "S141": (-86.7876961971934, 30.897703145245256),
+    "Calle De Castelar": (-86.80111724413648, 30.41353636966254),
+    "Johnny Parker Road": (-86.81153934040971, 30.692142042083763),
+    "Garner Landing Road": (-86.7989285576433, 30.653690817397962),
+    "West Highway 98": (-86.799087, 30.409832799999997),
+    "Shammah Road": (-86.79510167376306, 30.719850450323232),
+    "Indigo Loop": (-86.39283746047919, 30.388735986016094),
+    "Rosebud": (-86.39009361845606, 30.742159624625227),
+    "County Line Road 17": (-86.39437592198509, 30.456196696588375),
+    "Bob Sikes Road": (-86.39011471156621, 30.662237158648846),
+    "Anice Lane": (-86.38780001235126, 30.942290990429456),
+    "Miracle Strip Parkway": (-86.60146585105173, 30.402242163693725),
+    "Roger J Clary Highway": (-86.52939402061482, 30.561928830042863),
+    "Booker Street": (-86.56843041550141, 30.758585199594805),
+    "Freedom way": (-86.671046793986, 30.428623652415826),
+    "Blossom Creek Run": (-86.45699892137836, 30.522256865031405),
+    "Timber Lake Trails": (-86.60454078559611, 30.484859037273594),
+    "Timber Lake Trail": (-86.6112246917102, 30.483692713982126),
+    "Wal-Mart Road": (-86.5676819, 30.729064100000002),
+    "Mid-Bay Bridge": (-86.42491871771499, 30.404988886578707),
+    "White Point Road": (-86.41756401148741, 30.46227919743192),
+    "Emerald Coast Parkway": (-86.41656942896536, 30.388985263450717),
+    "Eglin Parkway North": (-86.58073133894504, 30.442507474484078),
+    "Eglin Parkway Northeast": (-86.6078597, 30.4265917),
+    "Florida Trail": (-86.55949253804047, 30.68780226054468),
+    "Walter Francis Spence Parkway": (-86.41501306861791, 30.46238106789715),
+    "State Highway 85": (-86.37978934225296, 30.970948764913846),
+    "State Highway 189": (-86.66510779246987, 30.86915097661494),
+    "77th Special Forces Way": (-86.56969677694967, 30.63754371466868),
+    "Crown Creek Circle": (-86.54423417716903, 30.800640898067154),
+    "2nd Avenue Northeast": (-86.5493811680679, 30.776561161508617),
+    "January Court": (-86.55406958090781, 30.766959207644756),
+    "Wild Egret Lane": (-86.62201983617888, 30.718482344636342),
+    "Red Fern Road": (-86.62048852122393, 30.717127632340564),
+    "Traverse Lane": (-86.62420048183834, 30.715692412600074),
+    "Terrier Trail": (-86.63045840004564, 30.72137511031749),
+    "Leonine Hollow": (-86.62721775964935, 30.72129794327387),
+    "Silver Tip Trail": (-86.62568374891033, 30.722704777891483),
+    "Pinque Coat Court": (-86.62575567567185, 30.722209780790077),
+    "Vale Loop": (-86.62875524080974, 30.72242480895569),
+    "Scenic Highway 98 Trail": (-86.38791109387296, 30.37865474897169),
+    "Tooksolong Lane": (-86.7790366513068, 30.71395438587016),
+    "Galiver Cutoff": (-86.69658007887915, 30.75433714831093),
+    "Frazier Street": (-86.6951664850249, 30.426269812347357),
+    "Ladue Drive": (-86.5636850517452, 30.731061672003204),
+    "Mirage Avenue": (-86.57178078611348, 30.728735175719148),
+    "Creve Cove Drive": (-86.56299985950834, 30.731495617680807),
+    "Price-Gregory Way": (-86.5700612754529, 30.731488053216697),
+    "Ruby Lane": (-86.5623638626791, 30.729589149229064),
+    "Pheasant Trail": (-86.62042576872336, 30.716582197429087),
+    "Solimar Way": (-86.74155209109367, 30.410784996780016),
+    "Miranda Court": (-86.7408741, 30.41012225),
+    "Gen Robert W. Bond Boulevard": (-86.56248466207965, 30.48827907766513),
+    "Range Rd 643": (-86.60785101499502, 30.482228798421435),
+    "Eleases Crossing": (-86.54640671598332, 30.770502447848344),
+    "Lear Court": (-86.55620185000001, 30.771089099999998),
+    "Serene Court": (-86.545559, 30.771255049999997),
+    "Split Creek Drive": (-86.55493830449896, 30.770330551924),
+    "Haislip Drive": (-86.5575939, 30.769225499999997),
+    "Eisenhower Drive": (-86.55672630213502, 30.770341178486913),
+    "Bolte Court": (-86.55691239632284, 30.76852001801986),
+    "Grand Ridge Drive": (-86.5458576328268, 30.771558751397837),
+    "Trailwood Lane": (-86.54705854620576, 30.77170440376504),
+    "Wainwright Drive": (-86.55687509442, 30.768776738780716),
+    "Mayflower Avenue": (-86.62400766908297, 30.438327599306415),
+    "Roosevelt Avenue": (-86.68573163046328, 30.797073144393927),
+    "Range Rd 221": (-86.5859175141176, 30.60845426168661),
+    "Military Road 257": (-86.73593838093238, 30.583475319067304),
+    "Winddrift Court": (-86.58307209461968, 30.75736238367766),
+    "Songbird Way": (-86.5805695, 30.7583475),
+    "Wych Circle": (-86.59951334650775, 30.718165773346655),
+    "Amanda Court": (-86.53583717974487, 30.842812125654664),
+    "Chanteuse Parkway": (-86.54488997519304, 30.712809563774357),
+    "Barbaree Drive": (-86.59392868296877, 30.828190067976326),
+    "Lime Lane": (-86.59529331379947, 30.719783047851138),
+    "Scotch Pine Lane": (-86.59854313963875, 30.71587722234927),
+    "Crooked Pine Trail": (-86.5475333569489, 30.734856463431342),
+    "Zach Avenue": (-86.5357015691002, 30.844734521196727),
+    "Lee Farm Boulevard": (-86.60263222567612, 30.76767052357624),
+    "Swaying Pine Court": (-86.54787491394248, 30.73393235005858),
+    "Moore Loop": (-86.6028613490596, 30.770345854839302),
+    "Airmen's Memorial Road": (-86.55151570827178, 30.714147261278836),
+    "Sidewinder Loop": (-86.57971399725182, 30.72156346398238),
+    "Bronze Circle": (-86.55275795863598, 30.738414019424987),
+    "Chancery Lane": (-86.5521552030893, 30.711996308283837),
+    "Antigone Circle": (-86.53995585880661, 30.843584651521827),
+    "Chanson Crossing": (-86.54923291993333, 30.713787702706917),
+    "Alicia Drive": (-86.57849624503176, 30.718373869630103),
+    "Evan Circle": (-86.5894628461214, 30.826083807143437),
+    "Equine Drive": (-86.57039135, 30.8264572),
+    "Sessile Circle": (-86.59795120000001, 30.71856135),
+    "Marlea Court": (-86.60186, 30.7653472),
+    "Arthur Boulevard": (-86.53115460395342, 30.844500743750633),
+    "Rowan Circle": (-86.597001, 30.7190338),
+    "Forge Drive": (-86.54992665000002, 30.7389277),
+    "Ana Noel Drive": (-86.59099795, 30.826286449999998),
+    "Hummingbird Lane": (-86.57816758020671, 30.8226116997488),
+    "Shield Drive": (-86.54783785000001, 30.738141249999998),
+    "Secretariat Drive": (-86.55329579980082, 30.734387917422293),
+    "Bullet Drive": (-86.57222395, 30.82659765),
+    "Agerton Street": (-86.59365685, 30.828195100000002),
+    "Dragonfly Way": (-86.57979150013624, 30.82262940000235),
+    "Magik Drive": (-86.56855085, 30.82568175),
+    "Yew Circle": (-86.59484309999999, 30.720154850000004),
+    "Gauntlet Drive": (-86.5542441, 30.738066499999995),
+    "Conquest Avenue": (-86.59458260841251, 30.777288441010256),
+    "Hagood Loop": (-86.60171122714063, 30.767271110028613),
+    "Crab Apple Avenue": (-86.59876624964853, 30.716274488044323),
+    "Citadel Lane": (-86.54922137626168, 30.738336753525427),
+    "Limestone Circle": (-86.54993471164165, 30.73486237366121),
+    "Chanan Drive": (-86.54912216084715, 30.71203333878093),
+    "Plate Drive": (-86.54694273302114, 30.738369203944092),
+    "Chantry Circle": (-86.54955411545824, 30.711993973938633),
+    "Chantey Street": (-86.55114741618696, 30.71134090422321),
+    "Sunesta Court": (-86.5959217516471, 30.779857216785548),
+    "Chancel Avenue": (-86.5503988643236, 30.711744137618563),
+    "Chancellor Court": (-86.54873781987467, 30.71216637115376),
+    "Iron Horse Drive East": (-86.54737725883585, 30.73714243985414),
+    "Rapto Drive": (-86.57887084868706, 30.721749933307837),
+    "Genevieve Way": (-86.59625596219507, 30.830271526243003),
+    "Corner Creek Road": (-86.57057197126768, 30.82604324751179),
+    "Butterfly Alley": (-86.5789230500315, 30.82115389650547),
+    "Chantrelle Cove": (-86.55269713831156, 30.710802179187652),
+    "Conrad Court": (-86.53355872896448, 30.846089739543974),
+    "Flash Lane": (-86.57409965644594, 30.8273928983592),
+    "Triton Street": (-86.5942309479516, 30.777783837132876),
+    "Sandstone Trail": (-86.5511741461605, 30.735277484591645),
+    "Doris Street": (-86.53656901128443, 30.84371307769814),
+    "Silverton Loop": (-86.59468501017813, 30.777403026525594),
+    "Adora Teal Way": (-86.52995971767443, 30.78331501229104),
+    "Destin Jet Way": (-86.47112309758373, 30.39591023764268),
+    "Howie Walters Road": (-86.6804362546176, 30.416720161371796),
+    "Kerwood Road": (-86.68224175586234, 30.413255226567337),
+    "Hermosa Road": (-86.56746883724136, 30.704570381901636),
+    "Mirada Way": (-86.5676908426766, 30.703871342406305),
+    "Beth Circle": (-86.56922212718527, 30.699107281180133),
+    "Annabelle Lane": (-86.56684404813085, 30.701576380994762),
+    "Phil Dirt Road": (-86.57648280000001, 30.79806225),
+    "Cameo Circle": (-86.50914563021522, 30.88362915268639),
+    "Lexington Court": (-86.5540392, 30.8075234),
+    "Wingspan Way": (-86.59290678016885, 30.70802624750492),
+    "Majestic Drive": (-86.594016177416, 30.706873316497916),
+    "Button Bush Way": (-86.4607975, 30.496107950000003),
+    "1 Mile Foot Path": (-86.59884296145874, 30.418626811191693),
+    "Apple Blossom Court": (-86.577103, 30.438626499999998),
+    "Red Plum Court": (-86.57711975000001, 30.438001900000003),
+    "Five Oaks Lane": (-86.57714535, 30.437403649999997),
+    "Sugar Plum Lane": (-86.57747131293637, 30.437926650277564),
+    "Carter Oaks Circle": (-86.63682761462076, 30.45816838527481),
+    "Cumberland Way": (-86.57564929932606, 30.81496444367248),
+    "Halfmoon Lane": (-86.57740545, 30.814946499999994),
+    "Plum Orchard Way": (-86.58090944998389, 30.814980453114273),
+    "Burbank Court": (-86.58194833615083, 30.813983163218722),
+    "Brickhill Court": (-86.58191423550146, 30.815989608156322),
+    "Aubrey Lee Lane": (-86.48514781941786, 30.81082289049978),
+    "Autumn Woods Drive": (-86.50098875482377, 30.8184535106047),
+    "Carina Road": (-86.49338111893232, 30.807436547800442),
+    "Fiori Drive": (-86.49298727301316, 30.806539098916595),
+    "Hidden Valley Road": (-86.48823725312167, 30.811272315367628),
+    "Kittrel Lane": (-86.4844514847451, 30.812492292964205),
+    "Ranch Drive": (-86.48804849481638, 30.810818711122163),
+    "Shirey Court": (-86.49862826884635, 30.811118460314944),
+    "Spence trail": (-86.5152982826503, 30.564229059241335),
+    "Addison Place": (-86.60749180756521, 30.715782103856345),
+    "Desoto Road": (-86.5446202, 30.7572135),
+    "Brown Stone Road": (-86.51307425294205, 30.82679960389551),
+    "Citrine Circle": (-86.51338016145982, 30.824711808920746),
+    "Lapis Lane": (-86.51121529949666, 30.825353343117214),
+    "Sparco Drive": (-86.50529631845583, 30.82754937798456),
+    "Maloy Drive": (-86.50636816719796, 30.826974095495213),
+    "R29": (-86.76859673603754, 30.93161741451373),
+    "R27": (-86.77499477978976, 30.933590207696177),
+    "R25": (-86.77522220320931, 30.939679835986798),
+    "R81": (-86.74743270350712, 30.854297542925515),
+    "R78": (-86.74272216332966, 30.866154215577154),
+    "R84": (-86.73796768957111, 30.857019101340406),
+    "R85": (-86.73409700596189, 30.85816447375805),
+    "R83": (-86.73854476655042, 30.84970255154129),
+    "R74": (-86.74894926833824, 30.86892213371021),
+    "B28": (-86.75299824584333, 30.828536679738516),
+    "B35": (-86.75650824999998, 30.829903),
+    "B31": (-86.75434498497357, 30.824468750679024),
+    "B32": (-86.7471945965091, 30.820751168965387),
+    "B33": (-86.75799576326744, 30.818129618947026),
+    "R57": (-86.72554598426925, 30.89269855403145),
+    "R59": (-86.73413737367679, 30.904147889066234),
+    "R58": (-86.73311586892505, 30.89946976097305),
+    "R47": (-86.76907756243757, 30.903716089703998),
+    "R51": (-86.7766583997067, 30.901024641883815),
+    "R48": (-86.77116604836, 30.904886857539164),
+    "S166": (-86.77425449127422, 30.86108750576095),
+    "B38": (-86.77765608894384, 30.802765248650804),
+    "B39": (-86.78248567771254, 30.798517943896297),
+    "B40": (-86.78567608843392, 30.795032094088036),
+    "B42": (-86.78400513069236, 30.78914881752932),
+    "B41": (-86.78938201422862, 30.790248844482914),
+    "B43": (-86.79265499474482, 30.78370850337931),
+    "R87": (-86.70457540742107, 30.84807599639457),
+    "R89": (-86.70678943553341, 30.847657314540843),
+    "R88": (-86.71217831770365, 30.8501107339041),
+    "R97": (-86.71202367598917, 30.855013214316884),
+    "R96": (-86.7158808124274, 30.85531433248415),
+    "R98": (-86.71273304617145, 30.859240004582826),
+    "R104": (-86.69697263317276, 30.87044283089388),
+    "R106": (-86.69317729498229, 30.87610869707825),
+    "R107": (-86.68265100102565, 30.88427007581749),
+    "R121": (-86.67325724850377, 30.8921406541245),
+    "R122": (-86.66466736205402, 30.893229640517763),
+    "R120": (-86.6741733357704, 30.894930149786898),
+    "R124": (-86.66442485769576, 30.908715785798293),
+    "R115": (-86.70443426713528, 30.908005335371385),
+    "R116": (-86.70250313986553, 30.9117284815617),
+    "R117": (-86.7057295568959, 30.913682437761924),
+    "R118": (-86.70174129237198, 30.91972760503075),
+    "R137": (-86.68616432406937, 30.917549349015953),
+    "R138": (-86.6899415089826, 30.91895840817304),
+    "R139": (-86.6889960282144, 30.92328573492175),
+    "R143": (-86.6947243625676, 30.930375372028024),
+    "R144": (-86.69222743659667, 30.930744260438644),
+    "R146": (-86.70038073770013, 30.931879047812398),
+    "R169": (-86.70562911682407, 30.936605473974826),
+    "R150": (-86.71581869021107, 30.937198003111),
+    "R151": (-86.71153232804333, 30.936384763958355),
+    "R147": (-86.70848365453142, 30.934164612849216),
+    "R141": (-86.67342203016443, 30.92001359360289),
+    "R140": (-86.67565531498529, 30.920419138381874),
+    "R142": (-86.66661643516963, 30.921178077262454),
+    "R128": (-86.6614502583484, 30.91185611942228),
+    "R127": (-86.6569533619332, 30.908606386769556),
+    "H30": (-86.6477764297096, 30.908414085327525),
+    "H32": (-86.6505367455771, 30.900154424634277),
+    "H33": (-86.65508569608343, 30.900140463881456),
+    "H34": (-86.65764170316123, 30.89347465893137),
+    "H35": (-86.65401464260225, 30.89556824482324),
+    "H39": (-86.64837772990646, 30.886335714815726),
+    "H41": (-86.6502126003084, 30.87762397979941),
+    "H38": (-86.65643655746554, 30.882151237637313),
+    "H43": (-86.66251291119885, 30.86494843452675),
+    "H52": (-86.63566189625702, 30.860637935111754),
+    "H50": (-86.63690255, 30.86482),
+    "H49": (-86.63752103642892, 30.86868837303959),
+    "H48": (-86.63070492213006, 30.8708148063768),
+    "H54": (-86.62584765736715, 30.858282786440473),
+    "R93": (-86.69029480184899, 30.85792829814804),
+    "R94": (-86.68227609302225, 30.860442978430918),
+    "R95": (-86.68386435056202, 30.86345421257675),
+    "S140": (-86.79105406230342, 30.91509131300994),
+    "S132": (-86.78875471627818, 30.938581831788827),
+    "R23": (-86.78030188830441, 30.94685791069219),
+    "R24": (-86.77733123278924, 30.944819597421134),
+    "R28": (-86.77749057703546, 30.9261248370301),
+    "R25A": (-86.77243202524375, 30.941728325938552),
+    "F60": (-86.79358148541803, 30.806646083061352),
+    "Penny Creek Road": (-86.76918573776577, 30.771021589865157),
+    "Red Oak Court": (-86.56393768065898, 30.45354613833891),
+    "Water Oak Court": (-86.56406681636255, 30.454893819725502),
+    "Chapman Oak Court": (-86.56554115353144, 30.45412590456742),
+    "Bluf Oak Court": (-86.5653599, 30.45385465),
+    "Shumard Oak Court": (-86.56596189795071, 30.45501773112076),
+    "Pin Oak Court": (-86.56611055, 30.455316799999995),
+    "Turkey Oak Court": (-86.56438418839225, 30.456666075561962),
+    "Laurel Oak Court": (-86.56594568005008, 30.456917237487428),
+    "Lone Oak Court": (-86.56608410000001, 30.456646250000002),
+    "Champions Court": (-86.43932735238182, 30.39827522474046),
+    "Champions court": (-86.43863395651492, 30.396711679441992),
+    "Biscaynne Bay": (-86.41985445169463, 30.38688618420622),
+    "Tahitian Way": (-86.42063235208892, 30.387000756870336),
+    "grand Key East Loop": (-86.41978917207192, 30.38711594419544),
+    "Kono Way": (-86.41908454732855, 30.387259670566785),
+    "Emerald Coast Dragway": (-86.7879752, 30.687156700000003),
+    "Alaqua Creek Cove": (-86.4627442721817, 30.52439959714329),
+    "Big Creek Cove": (-86.46435608279405, 30.52743779175671),
+    "Birdsong Creek Circle": (-86.45456067448501, 30.523140532144474),
+    "Canopy Creek Cove": (-86.45605187426835, 30.52236685309452),
+    "Echo Creek Cove": (-86.46173834938129, 30.522944195857427),
+    "Fox Head Brach Trail": (-86.45797798690329, 30.52019668049216),
+    "Gum Creek Cove": (-86.46337907644433, 30.526221031343933),
+    "Harvest Creek Trail": (-86.45881095499348, 30.52288610741641),
+    "Narrow Creek Cove": (-86.46345678382896, 30.52515453195002),
+    "Rushing River Way": (-86.45642820985294, 30.519111079741485),
+    "Sterling River Way": (-86.45558806148377, 30.522436750692552),
+    "Stony Creek Cove": (-86.46011584238641, 30.522281122566884),
+    "Sugarcane Creek Run": (-86.45933413877795, 30.52359780718077),
+    "Town Center Boulevard": (-86.4184595732654, 30.522446718168123),
+    "Falcon Trail": (-86.5023222341635, 30.53273784499186),
+    "Zephyr Drive": (-86.3988985744349, 30.381456554422705),
+    "Marquette Alternate": (-86.50571236145457, 30.519700363048113),
+    "Berkshireplace Street": (-86.40011820935729, 30.390937735385936),
+    "Hayley Marie Court": (-86.64298919999999, 30.437489550000002),
+    "Sago Palm Way": (-86.59822299999999, 30.774124999999998),
+    "Paradise Palm Circle": (-86.59976201470553, 30.77508477623181),
+    "Pendo Place": (-86.5998692, 30.775656849999997),
+    "Sabal Drive": (-86.59896789999999, 30.776398399999998),
+    "Windmill Way": (-86.5997367, 30.77477845),
+    "Peoria Boulevard": (-86.5831839300099, 30.706318076621088),
+    "Anniston Court": (-86.611954, 30.422464849999997),
+    "Kailyn Court": (-86.47763560019186, 30.509684686301124),
+    "Arrowhead Way": (-86.49409199100195, 30.529451737808206),
+    "Big Oaks Lane": (-86.50049947014807, 30.52707339905425),
+    "Key Lime Place": (-86.57741320926401, 30.71002696340157),
+    "Bel Aire Drive": (-86.60949878961408, 30.71794986641701),
+    "Petal Place": (-86.62186238093648, 30.73460350737428),
+    "Soundview Court": (-86.64736249984763, 30.407937267549553),
+    "Soundside Cove": (-86.65094050601212, 30.40834045021526),
+    "Mitchell Road": (-86.69999939855651, 30.416110454829134),
+    "Lovejoy Road": (-86.67419006210109, 30.42453310369632),
+    "Bentley Circle": (-86.66894056576913, 30.430144310727577),
+    "Mc Carthy Avenue": (-86.49456545572096, 30.48930591587997),
+    "Biltmore Way": (-86.4643110702882, 30.528672981159573),
+    "Maggie Valley Cove": (-86.46467707132157, 30.52925710982426),
+    "Grove Park Drive": (-86.46428437396494, 30.531014031188487),
+    "Chimney Rock Circle": (-86.46290793507812, 30.532187366861724),
+    "Black Bear Circle": (-86.45943695074031, 30.532845649919476),
+    "Marvis Way": (-86.4082933815763, 30.474061278223893),
+    "Town Lane": (-86.64929196670148, 30.41039696816567),
+    "2nd Southwest Avenue": (-86.61420824039517, 30.404764882163793),
+    "Derby Downs Circle": (-86.43927922637232, 30.51820472785448),
+    "Front Porch Circle": (-86.46097139750347, 30.529470103378404),
+    "Tadpole Avenue": (-86.47369699799154, 30.50036206973311),
+    "Fallin Branch Court": (-86.47529381105709, 30.49815098248852),
+    "Woods Drive": (-86.47555971202719, 30.49791194273654),
+    "Flowering Path": (-86.47591012006005, 30.49722303233413),
+    "Heritage Plantation Boulevard": (-86.53053009608743, 30.870359519869577),
+    "Arcadia Bluffs Avenue": (-86.53141707139649, 30.87055200274572),
+    "Brandon Dunes Lane": (-86.53041946211171, 30.86752812379586),
+    "Finnegan Way": (-86.47050524876039, 30.4944198136331),
+    "Patfore Lane": (-86.46976636900584, 30.494713450209087),
+    "Bass Angler Lane": (-86.54348806230178, 30.82558241926149),
+    "Okaloosa County Rest Area Westbound": (-86.50805067557907, 30.72805830400571),
+    "Okaloosa County Rest Area Eastbound": (-86.50681047930527, 30.725968037217037),
+    "Majestic Oaks Vineyard Boulevard": (-86.53625838125335, 30.834691955153744),
+    "Pinot Way": (-86.5368157088617, 30.835361888240993),
+    "Lielmanis Avenue": (-86.68131558250252, 30.418774248116613),
+    "Farmer Street": (-86.5529186029975, 30.79141369027285),
+    "Champaign Street": (-86.70211602383574, 30.40986133706293),
+    "Foy Shaw Parkway": (-86.52198795000001, 30.754905199999996),
+    "Blue Bell Lane": (-86.5033913999718, 30.790959361792215),
+    "Begonia Avenue": (-86.50432817429795, 30.79121090004206),
+    "Marigold Loop": (-86.50264112875018, 30.793017640252557),
+    "Periwinkle Lane": (-86.504079110089, 30.7932144568697),
+    "Wayne Rogers Road": (-86.51049164158658, 30.792138953540174),
+    "Seven Ducks Lanes": (-86.5317572, 30.7967872),
+    "Edelstein Drive": (-86.53130669999999, 30.797961100000002),
+    "Tulip Tree Way": (-86.47530473726215, 30.495200119391626),
+    "Longsword Drive": (-86.55365797350157, 30.737483050606297),
+    "Mossy Cove Court": (-86.44320812817476, 30.49399207802982),
+    "Skipjack Cove": (-86.4414991028839, 30.494367207081126),
+    "Observatory Access Road": (-86.48030566768125, 30.541616148172753),
+    "Deer Moss Loop": (-86.42292409668268, 30.512779644448823),
+    "Elderflower Drive": (-86.42050430075602, 30.51341797846574),
+    "Cassia Cove": (-86.41951496365307, 30.51334044320748),
+    "Coriander Lane": (-86.42086629430374, 30.513785854943688),
+    "Clarysage Lane": (-86.42109369671206, 30.513634402963504),
+    "Angelica Place": (-86.42198369617564, 30.513372534513138),
+    "Verbena Place": (-86.42007277836383, 30.514193921873034),
+    "Oak Drive": (-86.55458788716133, 30.45322643269395),
+    "Twisted Oak Drive": (-86.55288196507306, 30.450684133118482),
+    "River Oak Drive": (-86.55347957931872, 30.451096406056212),
+    "Maple Drive": (-86.55479445607791, 30.45331791073696),
+    "Splash Drive": (-86.55444556204762, 30.452617027904232),
+    "Mangrove Drive": (-86.55981706058871, 30.451803663072585),
+    "Cortese Road": (-86.4989510949127, 30.47914342609038),
+    "Chapelwood Drive": (-86.5233930360031, 30.819196238670834),
+    "Trestle Street": (-86.56024222932332, 30.810715934276434),
+    "Claybourne Cove": (-86.56542555, 30.8084578),
+    "Wild Hare Lane": (-86.53137232714339, 30.747287576740984),
+    "Rabbit Run": (-86.53186007860226, 30.748169660664797),
+    "Blackfoot Trail": (-86.61087375331002, 30.76794678519074),
+    "Onida Trail": (-86.6118107136838, 30.77030396169527),
+    "Huron Trail": (-86.60528916089618, 30.768658809783165),
+    "Plover Drive": (-86.53701363359804, 30.711011924395024),
+    "Partidge Drive": (-86.53791945050128, 30.71359735421212),
+    "Raven Lane": (-86.538422, 30.7133413),
+    "Kingbird Lane": (-86.54069086864357, 30.7360074747512),
+    "Merlin Court": (-86.53588899839818, 30.73307098925808),
+    "Chickadee Street": (-86.53854578674948, 30.734116593158184),
+    "Merganser Way": (-86.53774797381243, 30.73055915971399),
+    "Gadwell Street": (-86.5387793704848, 30.733170986937253),
+    "Teal Street": (-86.53971532768233, 30.73132957041226),
+    "Widgen Way": (-86.53875520839773, 30.730915631777613),
+    "Brims Road": (-86.67935180079105, 30.425299558162056),
+    "Wyatt Way": (-86.6269289177598, 30.463874964739762),
+    "Vaccari Court": (-86.52792985, 30.8385741),
+    "Henderson Beach Nature Trail": (-86.4498594000186, 30.38565744203877),
+    "South Street": (-86.42506966838255, 30.390361947436293),
+    "Pier Road": (-86.59294025, 30.395555549999997),
+    "Colleen Cove": (-86.42616854447093, 30.509105846213426),
+    "Gianna Way": (-86.42582393125585, 30.508342304467696),
+    "Spanish Trail": (-86.56197989756024, 30.77464676759704),
+    "Wind Trace Road": (-86.57013939652886, 30.797703389735688),
+    "Squall Lane": (-86.56783974999999, 30.79819265),
+    "Chinook Drive": (-86.57003999674973, 30.79756668003798),
+    "Williwaw Court": (-86.5702173, 30.79734305),
+    "Walter Martin Road Northeast": (-86.61085838474298, 30.41638173502773),
+    "Hampton Drive": (-86.54811772573089, 30.762678436465805),
+    "Judge Maney Way": (-86.61906621126401, 30.46611365955265),
+    "Michigan Avenue": (-86.49526304212354, 30.498964152119523),
+    "Ellison Way": (-86.60988334985869, 30.44570695909657),
+    "Cummings Drive": (-86.61029789950052, 30.445352474478682),
+    "Brooker Street": (-86.57166787586766, 30.756282871671775),
+    "Mapoles Street": (-86.57670143832998, 30.766101345662435),
+    "Premier Drive": (-86.56872326308188, 30.76138458894644),
+    "Strike Eagle Drive": (-86.58039242580348, 30.721698664603064),
+    "Bur Oak Circle": (-86.60007922810698, 30.715211588085516),
+    "Broadsword Lane": (-86.54844833695255, 30.737312916433137),
+    "Patriot Lane": (-86.55686145264004, 30.742230200052962),
+    "Machinery Circle": (-86.746785929833, 30.69843685014676),
+    "Woodpecker Lane": (-86.75476701827019, 30.682870598937374),
+    "Ashton Circle": (-86.6015948309668, 30.709089701986084),
+    "Kls Ranch Road": (-86.43045659322907, 30.773211445204474),
+    "Avery Drive": (-86.5068130145086, 30.52844804679248),
+    "Sunset Beach Place": (-86.43294431766358, 30.469705842846064),
+    "Beaver Run Road": (-86.47708295000001, 30.502979600000003),
+    "Palmetto Street": (-86.50735238427393, 30.39632226465871),
+    "Dolphin St. Beach Access Path": (-86.41609996139384, 30.382797771036337),
+    "Raihope Drive": (-86.47765392574584, 30.497947390815554),
+    "Belcourt Drive": (-86.45374755, 30.405420550000002),
+    "Filly Lane": (-86.44055856390882, 30.39335597273817),
+    "Turnberry Harbour Drive": (-86.42606380000001, 30.39598085),
+    "Moonlit Way": (-86.40652719705861, 30.396211388235347),
+    "Lantern Lane": (-86.40614086576437, 30.396836544455528),
+    "Walk Along way": (-86.56245551567508, 30.80972417325636),
+    "Walk along way": (-86.56270306793175, 30.809699476589433),
+    "Pomegranate Court": (-86.6275141, 30.46285945),
+    "Chimera Lane": (-86.62636115000001, 30.4656519),
+    "Lukes Way": (-86.64763755, 30.4490594),
+    "Kenzie Lane": (-86.6465561, 30.442657600000004),
+    "Joyner Drive": (-86.65310480209244, 30.44559470968384),
+    "Patriots' Trail": (-86.60310083977886, 30.416717560733826),
+    "Methodist Avenue Southeast": (-86.60872657111446, 30.406079901759295),
+    "Ridgon Court Northwest": (-86.62602013730832, 30.42787991273791),
+    "Expedition Trail": (-86.5945000002517, 30.394459150032155),
+    "Little Gem Court": (-86.4752572, 30.4947024),
+    "Ella Lane": (-86.44280300134284, 30.491869565957057),
+    "Mill Creek Drive": (-86.67494396237487, 30.775077288792012),
+    "Blackberry Circle": (-86.70463833893746, 30.740111951665508),
+    "Cleo Lane": (-86.60259780000001, 30.7667288),
+    "Cassidy Lane": (-86.56270701868056, 30.716424371874933),
+    "Scooter Cove": (-86.5634941252145, 30.715601174709956),
+    "Pintail Way": (-86.53884381363753, 30.73444456458909),
+    "Moorhen Way": (-86.53870497979975, 30.73012663746569),
+    "Dottie Street": (-86.66710320000001, 30.7651629),
+    "Lena Street": (-86.66473407278737, 30.76664651386978),
+    "Kais Street": (-86.66328718361721, 30.76453565558041),
+    "Timberland Ridge Drive": (-86.50395558409038, 30.83313830386522),
+    "Malus Court": (-86.50209189411005, 30.832426723947567),
+    "Export Road": (-86.56877009244582, 30.717314831849205),
+    "Pine Crest Heights": (-86.4747579, 30.510250900000003),
+    "Brannon Court": (-86.5598586940502, 30.770881262400803),
+    "Price Plantation Road": (-86.67366825047277, 30.787464412825926),
+    "Grandson's Way": (-86.67288923510186, 30.788122656412053),
+    "Arbor Lake Drive": (-86.57626148935505, 30.770677184081944),
+    "Trotter Way": (-86.65856278933259, 30.753543376505615),
+    "Lady Lane": (-86.65816985000001, 30.757916400000003),
+    "Dunford Place": (-86.65818851663326, 30.754643717891856),
+    "Candleglow Lane": (-86.66056047274908, 30.754443855327278),
+    "Long Needle Court": (-86.6770779, 30.788212700000003),
+    "Ruby Ridge": (-86.5738709747407, 30.821248072877168),
+    "Nanterre Cove": (-86.5951924, 30.8309062),
+    "Oakdale Court": (-86.55374775, 30.78000415),
+    "Pedestrian walkway": (-86.67118092183266, 30.767949452637975),
+    "Access Road": (-86.67145609336364, 30.767663866441172),
+    "Firefighter Lane": (-86.583789, 30.73367085),
+    "Sanford Place": (-86.57661655466049, 30.746065511443213),
+    "Virginia Court": (-86.57830578618898, 30.760471607925226),
+    "Capocci Court": (-86.53987190000001, 30.728347049999996),
+    "Muscovy Court": (-86.53591700000001, 30.7283885),
+    "Limpkin Street": (-86.53815701169155, 30.72855549225868),
+    "Cedar Avenue East": (-86.5693385541489, 30.764063543562493),
+    "Soles Lane": (-86.5537923, 30.778894949999998),
+    "Peaches Lane": (-86.54372076756617, 30.81035921769395),
+    "Deer Moss Trail": (-86.42127557375161, 30.51513644595582),
+    "Portagul Cove": (-86.48593558012647, 30.48777698316184),
+    "Medfords Way": (-86.44681776402152, 30.809269267252994),
+    "Cazadores Street": (-86.60786935835722, 30.65833195080085),
+    "el Salvadore Way": (-86.61174483530677, 30.653466019359477),
+    "Skull Lane": (-86.61071164981675, 30.654862158646413),
+    "Lancero Loop": (-86.60758929351594, 30.653793992381534),
+    "Just Cause Loop": (-86.60508417656712, 30.650848729217163),
+    "Soto Cano Loop": (-86.60499830921584, 30.64750615105797),
+    "Cottage Court": (-86.46343920509197, 30.51222048015227),
+    "Raiders Trail": (-86.50864306640096, 30.521700699777746),
+    "Hornet Lane": (-86.50837857108078, 30.521741515086745),
+    "Doolittle Circle": (-86.50830284087799, 30.521948616706545),
+    "Chamomile Court": (-86.42371773893458, 30.51665800961784),
+    "Sweet Basil Lane": (-86.42290657582012, 30.517053477917685),
+    "Red Cedar Trail": (-86.43321358927048, 30.498578066904404),
+    "Family Track": (-86.46317683284565, 30.385805965539),
+    "Rookie Track": (-86.46303397435479, 30.38577772410909),
+    "Kiddie Karts": (-86.46236945638478, 30.385925854813166),
+    "The Wild Woody": (-86.46081523014047, 30.3862784199017),
+    "Slick Track": (-86.46082796026243, 30.38588823620219),
+    "Lemongrass Lane": (-86.4221538979592, 30.517874946813137),
+    "Sweetgrass Lane": (-86.42173719268126, 30.517383979331385),
+    "Caraway Drive": (-86.42289633553018, 30.51710627607011),
+    "Safflower Lane": (-86.42101067201126, 30.518231564435816),
+    "Abner Way": (-86.47000318053726, 30.519273654654942),
+    "Reindeer Road": (-86.43762490689721, 30.531572777112327),
+    "Yearling Court": (-86.43834422445659, 30.53346972052428),
+    "Red Deer Run": (-86.43742959314311, 30.533034913374006),
+    "Gazelle Court": (-86.4375148606502, 30.53226315739729),
+    "Marsh Deer Run": (-86.43663856908532, 30.531923398322544),
+    "Caribou Court": (-86.43681178401945, 30.53075251519537),
+    "Mule Deer Run": (-86.43645865644228, 30.529986119432703),
+    "Patriots Rdg Drive": (-86.55025905948789, 30.708377746235172),
+    "Honor Guard Way": (-86.55055351180575, 30.709510414167255),
+    "Reveille Way": (-86.55002495, 30.70951685),
+    "Alley Lane": (-86.46934294856466, 30.518440944496298),
+    "Southcrest Drive": (-86.56700754541367, 30.723414990894245),
+    "Rochelle Lane": (-86.45563937339595, 30.81795082621414),
+    "Luke Lane": (-86.51693265802004, 30.874498853894064),
+    "Jackson Red Ground Trail": (-86.76953080735946, 30.856646877481104),
+    "Wiregrass Trail": (-86.71858581605167, 30.91622269073322),
+    "Southwest Crestview Bypass": (-86.60183523563461, 30.73210361696669),
+    "Navarre Parkway": (-86.80550675038957, 30.40967917571339),
+    "Ivy Louise Lane": (-86.46362902932674, 30.509088115031854),
+    "Hudson Boyd Court": (-86.4639837548759, 30.509476759483167),
+    "Addie Drive": (-86.4337272644092, 30.481712272652143),
+    "Valor Walk": (-86.55401103097265, 30.709022592157027),
+    "P J Adams Parkway": (-86.59352314943119, 30.711993615851195),
+    "Fallen Heroes Way": (-86.56908574327151, 30.733205969431506),
+    "Driveway": (-86.6046076242487, 30.464326815446533),
+    "McLaren Circle": (-86.64586799289489, 30.455608666609862),
+    "Chisk Road": (-86.48398276236442, 30.47746614830033),
+    "Crestlake drive": (-86.56029850038797, 30.807938431599307),
+    "Prominence lane": (-86.56098464232244, 30.80660271488887),
+    "Rocky Bayou Trail": (-86.42347478830318, 30.49898364770068),
+    "Sand Pine Trail": (-86.42546636397158, 30.494535166076336),
+    "Mattie Kelley Visual Arts Gallery": (-86.4721111,30.5373342),
+    "Jr. Walton Pond": (-86.4709963,30.6945083),
+    "Pearl Creek": (-86.5593322,30.6874883),
+    "Ramada Plaza": (-86.58881,30.3944782),
+    "Dockside Watersports": (-86.5022005,30.3927614),
+    "ZPU23-4": (-86.6814889,30.4203386),
+    "Red Horse Statue": (-86.6765819,30.4236964),
+    "823d Bulldozer": (-86.675754,30.4236681),
+    "Shoreline Theater": (-86.5943243,30.3941713),
+    "Pinguin Preserve": (-86.5939225,30.3940103),
+    "Tortoise Hideaway": (-86.5945759,30.3945098),
+    "The Fishin’ Hole": (-86.5943401,30.3939888),
+    "Bird & Reptile Sanctuary": (-86.5944264,30.3941894),
+    "Shark Moat": (-86.5940943,30.3940053),
+    "Fort Gator": (-86.5946443,30.3945319),
+    "Otter Den": (-86.5941858,30.3942208),
+    "The Bayou": (-86.5945626,30.3946838),
+    "Tide Pool": (-86.5944642,30.3940485),
+    "the track recreation center": (-86.4634112,30.3856486),
+    "Grater RV Hideaway Cove": (-86.7569197,30.4131753),
+    "Lake Clyde": (-86.5811232,30.4358136),
+    "Martin Lakes": (-86.5885643,30.7590772),
+    "Metts Bluff": (-86.7277338,30.6682472),
+    "Rattlesnake Bluff": (-86.6435653,30.6849132),
+    "Tucker Bluff": (-86.583564,30.8690737),
+    "Lake Vivian": (-86.5757433,30.4341869),
+    "Wilkinson Bluff": (-86.6743992,30.6885242),
+    "Yellow Bluff": (-86.4207823,30.8271304),
+    "Boggy Bayou": (-86.4805053,30.492698),
+    "Cinco Bayou": (-86.6102307,30.4288102),
+    "Copeland Bay": (-86.4688392,30.8160196),
+    "Destin Harbor": (-86.5007835,30.3902005),
+    "Dons Bayou": (-86.6080085,30.4510319),
+    "East Bay Swamp": (-86.7535676,30.4438092),
+    "Garmier Bayou": (-86.5975941,30.4586327),
+    "Hand Cove": (-86.5885635,30.4551986),
+    "Joes Bayou": (-86.48995,30.4113111),
+    "Jones Bayou": (-86.4393931,30.4076998),
+    "McCloud Bay": (-86.4193934,30.8196306),
+    "Marler Bayou": (-86.5007835,30.4063112),
+    "Pennywinkle Bay": (-86.3968928,30.8149086),
+    "Rocky Bayou": (-86.4377264,30.5051974),
+    "Pirate Cove": (-86.6582874,30.3999218),
+    "Poquito Bayou": (-86.5766188,30.4538098),
+    "Shirk Bayou": (-86.4694859,30.4894336),
+    "Weekley Bayou": (-86.484672,30.4821427),
+    "Watson Bay": (-86.4402269,30.9810142),
+    "Ward Cove": (-86.4455044,30.4963088),
+    "Tyner Bay": (-86.4646721,30.9318492),
+    "Toms Bayou": (-86.4970791,30.5025869),
+    "Sunset Cove": (-86.4674193,30.4872496),
+    "Eglin Blue Spring": (-86.4518429,30.6460597),
+    "Princess Beach": (-86.5393626,30.3899317),
+    "Crab Island": (-86.5209859840899,30.395755008062256), 
+    "Mid Bay Bridge Toll Plaza":( -86.4156057673287,30.456815297870968),
+    "Coast Guard Station":( -86.52607517977414,30.391345171947215),
+    "Destin on the Gulf":( -86.49449234492674,30.383902979245455),
+    "Sea Glass Apartments":(-86.44504776683148,30.38925620279096 ),
+    "azure condos": (-86.60210010114103,30.395438368872057 ),
+    "Eglin Beach Park": (-86.5257739876467,30.388836510866735),
+    "McGuire": (-86.51189082448172,30.396056056469405 ),
+    "Blue Water Behavioral Health":(-86.42115010387094,30.487898175118293),
+    "Coyote Ugly Saloon": (-86.50984272686519,30.39458736745443),
+    "Big Kahuna":( -86.47200456285017,30.387768408781497),
+    "Destin Elementary School":(-86.49184144514672, 30.40140392148354),
+    "Dustin Elementary School":(-86.49184144514672, 30.40140392148354),
+    "Harry T":(-86.51245228303975,30.394144163573223),
+    "Crystal Sands":(-86.4178259850826,30.381498563800307),
+    "Mid Bay Bridge":( -86.41893095457297,30.42967356165132),
+    " Highway 20 ":(-86.40660992886313,30.476287503522773),
+    " Eglin's East Gate":( -86.49425266202644,30.48946599897436),
+    " Eglin's West Gate":(-86.55459907466198,30.465607080539147),
+    " Beasley Park": (-86.58400046279559,30.393902078101902),
+    " emerald grand": ( -86.51197665672073,30.39486377581226),
+    " Duke Field": ( -86.530612110942,30.648930241887317),
+    " Henderson Park Inn": (-86.43229089550299,30.382769036500626),
+    " Oceans Church":(-86.48028450516664,30.387454640299282),
+    " Island Princess":( -86.61116652446158,30.39645973185496),
+    "Henderson Beach State Park": (-86.44331714661716,30.384248636439548),
+    " Destin Bridge":(-86.51803761808124,30.393625586182093)
+}
+
@@ -0,0 +1,132 @@
+"""
+    Publishes the flagger's output files. Each file is written to a temporary file next to it and
+    only renamed over the old one once the whole cycle has been written, so the map tool or any
+    other reader sees either the last complete version of a file or the new one, never an empty or
+    half-written file.
+
+    Each file is atomic, the set is not. The files are renamed one after the other, so a reader
+    opening several of them during a publish can get some from the new cycle and some from the
+    last. The manifest, outputs.json, is the commit point. It is replaced after the files and
+    records the generation number of the publish and, per file, the generation it last changed in,
+    its size and its hash. A consumer polls the small manifest and only re-reads the files whose
+    generation moved. One that needs files of the same cycle compares their hashes with the
+    manifest and reads them again when one doesn't match.
+"""
+import hashlib
+import json
+import os
+import time
+
+MANIFEST_NAME = "outputs.json"
+REPLACE_ATTEMPTS = 5  # A reader holding the file open on Windows blocks the rename for a moment
+REPLACE_RETRY_SECONDS = 0.2
+
+def read_manifest(manifest_file):
+    """Returns the manifest as {"generation": int, "published": str, "files": {name: entry}}, generation 0 when none was published yet."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as infile:
+            return json.load(infile)
+    except (OSError, ValueError):
+        return {"generation": 0, "published": None, "files": {}}
+
+def changed_files(manifest, generation):
+    """Returns the names of the files in the manifest that changed after the given generation."""
+    return [name for name, entry in manifest["files"].items() if entry["generation"] > generation]
+
+def replace_file(temp_file, target_file):
+    """Renames temp_file over target_file, retrying while a reader has it open. Returns False when it never got through."""
+    for attempt in range(REPLACE_ATTEMPTS):
+        try:
+            os.replace(temp_file, target_file)
+            return True
+        except PermissionError:
+            if attempt + 1 < REPLACE_ATTEMPTS:
+                time.sleep(REPLACE_RETRY_SECONDS)
+    return False
+
+class HashingWriter:
+    """A text file opened for writing that hashes what goes into it, so publishing needs no re-read."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'wb')
+        self.digest = hashlib.sha1()
+        self.size = 0
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.digest.update(data)
+        self.size += len(data)
+        self.file.write(data)
+        return len(text)
+
+    def close(self):
+        self.file.close()
+
+class OutputPublisher:
+    """Collects the output files of one cycle and publishes them, each file atomically and the manifest last.
+
+    Used as a context manager, the files are published when the block finishes and thrown away
+    when it raises, leaving the previous versions in place.
+    """
+
+    def __init__(self, directory):
+        self.manifest_file = os.path.join(directory, MANIFEST_NAME)
+        self.writers = {}  # Output path -> HashingWriter of its temporary file
+
+    def open(self, path):
+        """Returns a text file for the new version of path. Line endings are written untranslated, as with newline=''."""
+        writer = HashingWriter(path + ".tmp")
+        self.writers[path] = writer
+        return writer
+
+    def publish(self):
+        """Renames the changed files into place one by one, then the manifest. Returns the generation now published."""
+        manifest = read_manifest(self.manifest_file)
+        generation = manifest["generation"] + 1
+        changed = False
+        for path, writer in self.writers.items():
+            writer.close()
+            name = os.path.basename(path)
+            entry = {"generation": generation, "size": writer.size, "sha1": writer.digest.hexdigest()}
+            previous = manifest["files"].get(name)
+            if previous is not None and previous["sha1"] == entry["sha1"] and os.path.exists(path):
+                # Unchanged, so readers keep the file they have
+                os.remove(writer.path)
+                continue
+            if replace_file(writer.path, path):
+                manifest["files"][name] = entry
+                changed = True
+            else:
+                print(f"Could not replace {path}, it stays at its last published version")
+                os.remove(writer.path)
+        self.writers = {}
+        if not changed:
+            return manifest["generation"]
+
+        manifest["generation"] = generation
+        manifest["published"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        temp_file = self.manifest_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as outfile:
+            json.dump(manifest, outfile, indent=1)
+        if not replace_file(temp_file, self.manifest_file):
+            print(f"Could not replace {self.manifest_file}, readers see generation {generation} next cycle")
+            os.remove(temp_file)
+        return generation
+
+    def discard(self):
+        """Throws the temporary files away, the published versions stay as they were."""
+        for writer in self.writers.values():
+            writer.close()
+            os.remove(writer.path)
+        self.writers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.publish()
+        else:
+            self.discard()
+        return False
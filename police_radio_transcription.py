@@ -1,126 +1,268 @@
-import whisper
-import os
-import csv
-import time
-import wave
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-from datetime import datetime
-from queue import Queue
-
-class NewFileHandler(FileSystemEventHandler):
-    """Handles new .wav files created in the watched directory."""
-
-    def __init__(self, medium_model, directory_to_watch):
-        """Initializes the file handler with the Whisper model and the directory to watch."""
-        self.medium_model = medium_model
-        self.directory_to_watch = directory_to_watch
-        self.csv_file = os.path.join(directory_to_watch, "transcriptions.csv")
-        self.file_queue = Queue()
-        self.processed_files = self.load_processed_files()
-
-    def load_processed_files(self):
-        """Loads the set of already processed files from the CSV file."""
-        processed_files = set()
-        if os.path.exists(self.csv_file):
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                next(reader, None)  # Skip header
-                for row in reader:
-                    if len(row) >= 2:
-                        processed_files.add(row[1])  # Assuming the second column is the file name
-        return processed_files
-
-    def create_csv_file(self):
-        """Creates the CSV file if it does not exist and writes the header."""
-        if not os.path.exists(self.csv_file):
-            with open(self.csv_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Timestamp", "File", "Transcription", "Model", "Last End Time", "File Length"])
-
-    def on_created(self, event):
-        """Handles the event when a new file is created in the directory."""
-        if event.is_directory:
-            return
-        if event.src_path.endswith('.wav'):
-            time.sleep(0.3)  # Wait to ensure the file is fully written
-            self.file_queue.put(event.src_path)
-            self.process_files()
-
-    def process_files(self):
-        """Processes all files in the queue."""
-        while not self.file_queue.empty():
-            file_path = self.file_queue.get()
-            self.process_new_file(file_path)
-
-    def process_new_file(self, file_path):
-        """Processes a new .wav file: transcribes it, and writes the result to the CSV."""
-        file_name = os.path.basename(file_path)
-        if file_name not in self.processed_files:
-            print(f"Processing new file: {file_path}")
-            try:
-                # Transcribe with timestamps
-                result = self.medium_model.transcribe(file_path, without_timestamps=False, fp16=False)
-                segments = [segment['text'] for segment in result['segments']]
-                concatenated_text = ' / '.join(segments)
-
-                # Get the last end time
-                last_end_time = result['segments'][-1]['end'] if result['segments'] else 0
-
-                # Get the length of the .wav file
-                wav_length = self.get_wav_length(file_path)
-
-                # Write to CSV
-                self.write_to_csv(file_path, concatenated_text, "medium.en", last_end_time, wav_length)
-
-                self.processed_files.add(file_name)
-
-            except Exception as e:
-                print(f"Error processing file {file_path}: {e}")
-
-    def get_wav_length(self, file_path):
-        """Calculates the length of the .wav file in seconds."""
-        with wave.open(file_path, 'r') as wav_file:
-            frames = wav_file.getnframes()
-            rate = wav_file.getframerate()
-            duration = frames / float(rate)
-        return duration
-
-    def write_to_csv(self, file_path, text, model_name, last_end_time, wav_length):
-        """Writes the transcription data to the CSV file."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.csv_file, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow([timestamp, os.path.basename(file_path), text, model_name, last_end_time, wav_length])
-        os.system('cls')
-        print(f"Transcription written to CSV for file: {file_path}")
-
-    def process_existing_files(self):
-        """Processes existing .wav files in the directory that haven't been processed yet."""
-        for filename in os.listdir(self.directory_to_watch):
-            if filename.endswith('.wav') and filename not in self.processed_files:
-                file_path = os.path.join(self.directory_to_watch, filename)
-                self.process_new_file(file_path)
-
-def main(directory_to_watch):
-    """Main function that sets up the file watcher and processes files."""
-    medium_model = whisper.load_model("medium.en")
-    event_handler = NewFileHandler(medium_model, directory_to_watch)
-    event_handler.create_csv_file()
-    # Process existing .wav files that are not in the CSV
-    event_handler.process_existing_files()
-    observer = Observer()
-    observer.schedule(event_handler, directory_to_watch, recursive=False)
-    print(f"Watching directory: {directory_to_watch}")
-    print(f"CSV file: {event_handler.csv_file}")
-    observer.start()
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        observer.stop()
-    observer.join()
-
-if __name__ == "__main__":
-    directory_to_watch = r"D:\Police_audio_recordings"  # Change this to your directory
-    main(directory_to_watch)
+import whisper
+import dataclasses
+import os
+import csv
+import time
+import wave
+import threading
+import torch
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+from datetime import datetime
+from queue import Queue
+from recording_paths import active_partition, iter_clip_directories
+from segment_store import SegmentStore
+from transcription_log import TranscriptionWriter, read_committed_lines, row_status
+from transcript_index import TranscriptIndex
+from clip_tracing import ClipTracer
+from process_metrics import Metrics
+
+# Streaming settings, clips longer than one window are transcribed in overlapping windows
+STREAM_WINDOW_SECONDS = 30  # Length of each transcription window
+STREAM_OVERLAP_SECONDS = 5  # Overlap between consecutive windows so words on the cut are not lost
+
+# Model settings
+MODEL_NAME = "medium.en"
+MODEL_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "police_radio_transcription")
+
+METRICS_PORT = 9102  # Serves http://127.0.0.1:9102/metrics besides metrics/transcriber.prom, None for the file only
+
+CSV_HEADER = ["Timestamp", "File", "Transcription", "Model", "Last End Time", "File Length", "Status"]
+
+def load_cached_model(model_name, cache_directory=MODEL_CACHE_DIRECTORY, device=None):
+    """Loads a Whisper model from a memory-mapped, already fp32-converted cache, creating the cache on first use.
+
+    whisper.load_model reads the fp16 checkpoint and converts every weight on each start. The
+    cache holds the model dimensions and the fp32 weights, plain tensors loaded with
+    weights_only, so a restart maps them into the model instead. device defaults to CUDA when
+    available, like whisper.load_model.
+    """
+    if device is None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    legacy_path = os.path.join(cache_directory, f"{model_name}.fp32.pt")
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)  # A pickled model from an earlier version of the cache
+    cache_path = os.path.join(cache_directory, f"{model_name}.fp32.weights.pt")
+    if os.path.exists(cache_path):
+        try:
+            checkpoint = torch.load(cache_path, map_location="cpu", mmap=True, weights_only=True)
+            model = whisper.model.Whisper(whisper.model.ModelDimensions(**checkpoint["dims"]))
+            model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+            alignment_heads = whisper._ALIGNMENT_HEADS.get(model_name)
+            if alignment_heads is not None:
+                model.set_alignment_heads(alignment_heads)
+            return model.to(device)
+        except Exception as e:
+            print(f"Could not load cached model {cache_path}, rebuilding it: {e}")
+    model = whisper.load_model(model_name, device="cpu")
+    os.makedirs(cache_directory, exist_ok=True)
+    temp_path = cache_path + ".tmp"
+    torch.save({"dims": dataclasses.asdict(model.dims), "model_state_dict": model.state_dict()}, temp_path)
+    os.replace(temp_path, cache_path)
+    return model.to(device)
+
+class NewFileHandler(FileSystemEventHandler):
+    """Handles new .wav files created in the watched directory."""
+
+    def __init__(self, directory_to_watch):
+        """Initializes the file handler with the directory to watch. The Whisper model is loaded later by load_model."""
+        self.medium_model = None
+        self.model_ready = threading.Event()
+        self.model_error = None
+        self.directory_to_watch = directory_to_watch
+        self.csv_file = os.path.join(directory_to_watch, "transcriptions.csv")
+        self.segment_store = SegmentStore(os.path.join(directory_to_watch, "segments.db"))
+        self.tracer = ClipTracer(directory_to_watch, "transcriber")
+        self.csv_writer = TranscriptionWriter(self.csv_file, CSV_HEADER, index=TranscriptIndex(os.path.join(directory_to_watch, "transcripts.db")), tracer=self.tracer)
+        self.file_queue = Queue()
+        self.processed_files = self.load_processed_files()
+        self.metrics = Metrics("transcriber")
+        self.metrics.gauge_function("queue_depth", self.file_queue.qsize, "Clips waiting to be transcribed")
+        self.metrics.gauge_function("csv_queue_depth", self.csv_writer.queue.qsize, "Rows waiting for the next CSV flush")
+
+    def load_processed_files(self):
+        """Loads the set of already processed files from the CSV file."""
+        processed_files = set()
+        reader = csv.reader(read_committed_lines(self.csv_file))
+        next(reader, None)  # Skip header
+        for row in reader:
+            # Provisional rows come from an unfinished streaming transcription and error rows from a failed one, neither counts
+            if len(row) >= 2 and row_status(row) == "final":
+                processed_files.add(row[1])  # Assuming the second column is the file name
+        return processed_files
+
+    def load_model(self, model_name):
+        """Loads the Whisper model and releases the worker once it is ready. Meant to run on a background thread."""
+        try:
+            start_time = time.time()
+            self.medium_model = load_cached_model(model_name)
+            print(f"Model {model_name} loaded in {time.time() - start_time:.1f} seconds")
+            self.metrics.set_gauge("model_load_seconds", time.time() - start_time, "Seconds to load the Whisper model")
+            self.model_ready.set()
+        except Exception as e:
+            print(f"Error loading model {model_name}: {e}")
+            self.model_error = e
+
+    def on_created(self, event):
+        """Handles the event when a new file is created in the directory by queueing it for the worker."""
+        if event.is_directory:
+            return
+        if event.src_path.endswith('.wav'):
+            time.sleep(0.3)  # Wait to ensure the file is fully written
+            self.file_queue.put(event.src_path)
+
+    def process_files(self):
+        """Processes files from the queue as they arrive, waiting for the model to finish loading first."""
+        self.model_ready.wait()
+        while True:
+            file_path = self.file_queue.get()
+            self.process_new_file(file_path)
+
+    def process_new_file(self, file_path):
+        """Processes a new .wav file: transcribes it, and writes the result to the CSV."""
+        file_name = os.path.basename(file_path)
+        if file_name not in self.processed_files:
+            print(f"Processing new file: {file_path}")
+            self.tracer.record(file_name, "transcription_start")
+            streaming = False  # Provisional rows were written that nothing supersedes yet
+            try:
+                # Get the length of the .wav file
+                wav_length = self.get_wav_length(file_path)
+
+                # Transcribe with timestamps, long clips are streamed window by window
+                whisper_start = time.perf_counter()
+                if wav_length > STREAM_WINDOW_SECONDS:
+                    streaming = True
+                    result_segments = self.transcribe_streaming(file_path, wav_length)
+                else:
+                    result = self.medium_model.transcribe(file_path, without_timestamps=False, fp16=False)
+                    result_segments = result['segments']
+                self.tracer.record(file_name, "transcription_end")
+                whisper_seconds = time.perf_counter() - whisper_start
+                self.metrics.observe("whisper_seconds", whisper_seconds, "Seconds Whisper took per clip")
+                if wav_length:
+                    self.metrics.observe("real_time_factor", whisper_seconds / wav_length, "Whisper seconds per second of audio, per clip")
+                self.metrics.count("audio_seconds_total", wav_length, "Seconds of audio transcribed")
+                segments = [segment['text'] for segment in result_segments]
+                concatenated_text = ' / '.join(segments)
+
+                # Get the last end time
+                last_end_time = result_segments[-1]['end'] if result_segments else 0
+
+                # Write to CSV
+                self.write_to_csv(file_path, concatenated_text, MODEL_NAME, last_end_time, wav_length)
+                streaming = False
+
+                # Keep every segment with its offsets and confidence values
+                self.segment_store.add_segments(file_name, result_segments)
+
+                self.processed_files.add(file_name)
+                self.metrics.count("clips_transcribed_total", help_text="Clips transcribed and written to the CSV")
+
+            except Exception as e:
+                print(f"Error processing file {file_path}: {e}")
+                self.metrics.count("transcription_errors_total", help_text="Clips that failed to transcribe")
+                if streaming:
+                    # Supersedes the provisional rows, the clip is tried again on the next start
+                    self.write_to_csv(file_path, "", MODEL_NAME, 0, wav_length, status="error")
+
+    def transcribe_streaming(self, file_path, wav_length):
+        """Transcribes a long clip in overlapping windows, writing a provisional row as each window completes.
+
+        Segment times are shifted to be relative to the start of the clip. Segments that end inside
+        the overlap already covered by the previous window are dropped. Returns all kept segments.
+        """
+        audio = whisper.load_audio(file_path)
+        window = STREAM_WINDOW_SECONDS * whisper.audio.SAMPLE_RATE
+        step = (STREAM_WINDOW_SECONDS - STREAM_OVERLAP_SECONDS) * whisper.audio.SAMPLE_RATE
+        segments = []
+        committed_end = 0.0
+        for start in range(0, len(audio), step):
+            offset = start / whisper.audio.SAMPLE_RATE
+            result = self.medium_model.transcribe(
+                audio[start:start + window],
+                without_timestamps=False,
+                fp16=False,
+                initial_prompt=segments[-1]['text'] if segments else None,
+            )
+            new_segments = []
+            for segment in result['segments']:
+                segment = dict(segment, start=segment['start'] + offset, end=segment['end'] + offset)
+                if segment['end'] <= committed_end:
+                    continue
+                new_segments.append(segment)
+            if new_segments:
+                segments.extend(new_segments)
+                committed_end = new_segments[-1]['end']
+                partial_text = ' / '.join(segment['text'] for segment in new_segments)
+                self.write_to_csv(file_path, partial_text, MODEL_NAME, committed_end, wav_length, status="provisional")
+            if start + window >= len(audio):
+                break
+        return segments
+
+    def get_wav_length(self, file_path):
+        """Calculates the length of the .wav file in seconds."""
+        with wave.open(file_path, 'r') as wav_file:
+            frames = wav_file.getnframes()
+            rate = wav_file.getframerate()
+            duration = frames / float(rate)
+        return duration
+
+    def write_to_csv(self, file_path, text, model_name, last_end_time, wav_length, status="final"):
+        """Hands the transcription data to the CSV writer. Status is "provisional" for partial streaming rows and "error" after a failed streaming transcription."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.csv_writer.write_row([timestamp, os.path.basename(file_path), text, model_name, last_end_time, wav_length, status])
+        print(f"Transcription queued for CSV for file: {file_path}")
+
+    def process_existing_files(self):
+        """Queues existing .wav files in the directory and its date partitions that haven't been processed yet."""
+        for directory in iter_clip_directories(self.directory_to_watch):
+            for filename in os.listdir(directory):
+                if filename.endswith('.wav') and filename not in self.processed_files:
+                    self.file_queue.put(os.path.join(directory, filename))
+
+def follow_active_partition(observer, event_handler, directory_to_watch, watches):
+    """Schedules a watch on the recorder's current YYYY/MM/DD partition.
+
+    The previous partition stays watched as well so a clip that starts before midnight
+    and is saved after it is still picked up. Older watches are dropped.
+    """
+    partition = active_partition(directory_to_watch)
+    if partition in watches:
+        return
+    os.makedirs(partition, exist_ok=True)
+    watches[partition] = observer.schedule(event_handler, partition, recursive=False)
+    print(f"Watching partition: {partition}")
+    while len(watches) > 2:
+        oldest = next(iter(watches))
+        observer.unschedule(watches.pop(oldest))
+
+def main(directory_to_watch):
+    """Main function that sets up the file watcher and processes files."""
+    event_handler = NewFileHandler(directory_to_watch)
+    event_handler.metrics.start(directory_to_watch, METRICS_PORT)
+    observer = Observer()
+    watches = {}
+    follow_active_partition(observer, event_handler, directory_to_watch, watches)
+    print(f"Watching directory: {directory_to_watch}")
+    print(f"CSV file: {event_handler.csv_file}")
+    observer.start()
+    # Load the model in the background, clips that arrive meanwhile wait in the queue
+    threading.Thread(target=event_handler.load_model, args=(MODEL_NAME,), daemon=True).start()
+    # Queue existing .wav files that are not in the CSV
+    event_handler.process_existing_files()
+    threading.Thread(target=event_handler.process_files, daemon=True).start()
+    try:
+        while event_handler.model_error is None:
+            time.sleep(1)
+            follow_active_partition(observer, event_handler, directory_to_watch, watches)
+    except KeyboardInterrupt:
+        pass
+    observer.stop()
+    observer.join()
+    event_handler.csv_writer.close()
+    event_handler.tracer.close()
+
+if __name__ == "__main__":
+    directory_to_watch = r"D:\Police_audio_recordings"  # Change this to your directory
+    main(directory_to_watch)
@@ -0,0 +1,170 @@
+"""
+    Counters, gauges and timings of the recorder, the transcriber and the flagger, in place of
+    reading them off the console. Each process keeps a Metrics and updates it where things happen,
+    which is a dict update under a lock. Values that only need reading when asked, like queue
+    depths and memory, are registered as functions and cost nothing until then.
+
+    Every METRICS_INTERVAL_SECONDS a background thread publishes metrics/<process>.prom in the
+    recordings directory in the Prometheus text format, and with a port the same text is served
+    on http://127.0.0.1:<port>/metrics for a Prometheus scrape or a quick curl.
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from output_publisher import replace_file
+
+METRICS_DIRECTORY_NAME = "metrics"
+METRICS_INTERVAL_SECONDS = 15
+METRIC_PREFIX = "radio_"
+
+def memory_bytes():
+    """Returns the resident memory of this process in bytes, the peak where only that is available, or None."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows without psutil
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class Metrics:
+    """The metrics of one process, rendered in the Prometheus text format with a process label."""
+
+    def __init__(self, process_name):
+        self.process_name = process_name
+        self.lock = threading.Lock()
+        self.counters = {}  # Name -> running total
+        self.gauges = {}  # Name -> last value set
+        self.gauge_functions = {}  # Name -> function returning the value when rendered
+        self.timings = {}  # Name -> [count, sum, last]
+        self.help = {}  # Name -> description
+        self.gauge_function("memory_bytes", memory_bytes, "Resident memory of the process")
+        self.gauge_function("uptime_seconds", lambda start=time.time(): time.time() - start, "Seconds since the process started")
+
+    def count(self, name, value=1, help_text=None):
+        """Adds to a counter. Counter names end in _total."""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            if help_text:
+                self.help[name] = help_text
+
+    def set_gauge(self, name, value, help_text=None):
+        with self.lock:
+            self.gauges[name] = value
+            if help_text:
+                self.help[name] = help_text
+
+    def gauge_function(self, name, function, help_text=None):
+        """Registers a gauge read by calling function whenever the metrics are rendered."""
+        with self.lock:
+            self.gauge_functions[name] = function
+            if help_text:
+                self.help[name] = help_text
+
+    def observe(self, name, value, help_text=None):
+        """Records one timing or ratio, rendered as a summary with its count, sum and last value."""
+        with self.lock:
+            timing = self.timings.get(name)
+            if timing is None:
+                self.timings[name] = [1, value, value]
+            else:
+                timing[0] += 1
+                timing[1] += value
+                timing[2] = value
+            if help_text:
+                self.help[name] = help_text
+
+    def render(self):
+        """Returns all metrics in the Prometheus text format."""
+        with self.lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            gauge_functions = dict(self.gauge_functions)
+            timings = {name: list(timing) for name, timing in self.timings.items()}
+            help_texts = dict(self.help)
+        for name, function in gauge_functions.items():
+            try:
+                gauges[name] = function()
+            except Exception as e:
+                print(f"Could not read metric {name}: {e}")
+        label = f'{{process="{self.process_name}"}}'
+        lines = []
+        for kind, values in (("counter", counters), ("gauge", gauges)):
+            for name, value in sorted(values.items()):
+                if value is None:
+                    continue
+                metric = METRIC_PREFIX + name
+                if name in help_texts:
+                    lines.append(f"# HELP {metric} {help_texts[name]}")
+                lines.append(f"# TYPE {metric} {kind}")
+                lines.append(f"{metric}{label} {value}")
+        for name, (count, total, last) in sorted(timings.items()):
+            metric = METRIC_PREFIX + name
+            if name in help_texts:
+                lines.append(f"# HELP {metric} {help_texts[name]}")
+            lines.append(f"# TYPE {metric} summary")
+            lines.append(f"{metric}_count{label} {count}")
+            lines.append(f"{metric}_sum{label} {total}")
+            lines.append(f"# TYPE {metric}_last gauge")
+            lines.append(f"{metric}_last{label} {last}")
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, path):
+        """Atomically replaces path with the rendered metrics."""
+        temp_file = path + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as outfile:
+            outfile.write(self.render())
+        if not replace_file(temp_file, path):
+            os.remove(temp_file)  # A reader has it open, the next interval tries again
+
+    def serve(self, port, host="127.0.0.1"):
+        """Serves the metrics on http://host:port/metrics from a daemon thread. Returns the server, None when the port is taken."""
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes every few seconds would bury the console
+
+        try:
+            server = ThreadingHTTPServer((host, port), MetricsHandler)
+        except OSError as e:
+            print(f"Could not serve metrics on {host}:{port}: {e}")
+            return None
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Serving metrics on http://{host}:{port}/metrics")
+        return server
+
+    def start(self, base_directory, port=None, interval=METRICS_INTERVAL_SECONDS):
+        """Publishes metrics/<process>.prom every interval seconds from a daemon thread, and serves them when a port is given."""
+        directory = os.path.join(base_directory, METRICS_DIRECTORY_NAME)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.process_name}.prom")
+
+        def publish():
+            while True:
+                try:
+                    self.write_file(path)
+                except OSError as e:
+                    print(f"Could not write metrics to {path}: {e}")
+                time.sleep(interval)
+
+        threading.Thread(target=publish, daemon=True).start()
+        if port is not None:
+            self.serve(port)
@@ -0,0 +1,101 @@
+"""
+    Helpers for the date-partitioned recording layout. Clips are stored as
+    OUTPUT_DIRECTORY/YYYY/MM/DD/recording_YYYYmmdd_HHMMSS.wav so no single directory
+    grows without bound. Because the partition is encoded in the file name, a clip can be
+    located from its name alone without listing any directory.
+"""
+import calendar
+import os
+from datetime import datetime, timedelta
+from functools import lru_cache
+import pytz
+
+RECORDING_TIMEZONE = pytz.timezone('US/Central')  # Timezone used for clip names and partitions
+CLIP_PREFIX = "recording_"
+EPOCH = datetime(1970, 1, 1)
+
+def partition_directory(base_directory, when):
+    """Returns the YYYY/MM/DD partition directory for the given datetime."""
+    return os.path.join(base_directory, when.strftime("%Y"), when.strftime("%m"), when.strftime("%d"))
+
+def active_partition(base_directory):
+    """Returns the partition directory that the recorder is currently writing into."""
+    return partition_directory(base_directory, datetime.now(RECORDING_TIMEZONE))
+
+def clip_partition(filename):
+    """Returns the (YYYY, MM, DD) partition of a clip name like recording_YYYYmmdd_HHMMSS.wav, or None."""
+    parts = os.path.basename(filename).split('_')
+    if len(parts) < 3 or len(parts[1]) != 8 or not parts[1].isdigit():
+        return None
+    date_str = parts[1]
+    return date_str[:4], date_str[4:6], date_str[6:8]
+
+@lru_cache(maxsize=4096)
+def date_epoch(date_str):
+    """Returns the seconds at the start of a YYYYmmdd date, or None when it isn't a valid date."""
+    year, month, day = int(date_str[:4]), int(date_str[4:6]), int(date_str[6:])
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return calendar.timegm((year, month, day, 0, 0, 0))
+
+def clip_start_epoch(filename):
+    """Returns the wall-clock start of a clip like recording_YYYYmmdd_HHMMSS.wav as seconds, or None.
+
+    The clip names carry local time with no offset, so the seconds are that wall-clock time read as
+    UTC. They order and subtract correctly and compare with wall_clock_epoch().
+
+    The usual bare recording_YYYYmmdd_HHMMSS name is read by position with the date looked up in
+    a cache, anything else goes through strptime.
+    """
+    if filename.startswith(CLIP_PREFIX) and len(filename) >= 25 and filename[18] == "_":
+        digits = filename[10:18] + filename[19:25]
+        if digits.isascii() and digits.isdigit():
+            day_start = date_epoch(digits[:8])
+            hour, minute, second = int(digits[8:10]), int(digits[10:12]), int(digits[12:])
+            if day_start is None or hour > 23 or minute > 59 or second > 59:
+                return None
+            return day_start + hour * 3600 + minute * 60 + second
+    try:
+        parts = os.path.basename(filename).split('_')
+        start_time = datetime.strptime(f"{parts[1]}_{parts[2][:6]}", "%Y%m%d_%H%M%S")
+    except (IndexError, ValueError):
+        return None
+    return calendar.timegm(start_time.timetuple())
+
+def format_clip_time(epoch):
+    """Formats clip start seconds as YYYYmmdd_HHMMSS, the way the clip names write them."""
+    return (EPOCH + timedelta(seconds=epoch)).strftime("%Y%m%d_%H%M%S")
+
+def wall_clock_epoch(when=None):
+    """Returns the recorder's local wall-clock time in the same seconds as clip_start_epoch."""
+    when = when or datetime.now(RECORDING_TIMEZONE)
+    return calendar.timegm(when.timetuple())
+
+def resolve_clip_path(base_directory, filename):
+    """Locates a clip by file name, falling back to the legacy flat layout. Returns None if it is missing."""
+    filename = os.path.basename(filename)
+    partition = clip_partition(filename)
+    if partition is not None:
+        file_path = os.path.join(base_directory, *partition, filename)
+        if os.path.exists(file_path):
+            return file_path
+    file_path = os.path.join(base_directory, filename)
+    if os.path.exists(file_path):
+        return file_path
+    return None
+
+def iter_clip_directories(base_directory):
+    """Yields the legacy flat directory followed by every YYYY/MM/DD partition in date order."""
+    yield base_directory
+    for year in sorted(os.listdir(base_directory)):
+        year_dir = os.path.join(base_directory, year)
+        if not (len(year) == 4 and year.isdigit() and os.path.isdir(year_dir)):
+            continue
+        for month in sorted(os.listdir(year_dir)):
+            month_dir = os.path.join(year_dir, month)
+            if not (len(month) == 2 and month.isdigit() and os.path.isdir(month_dir)):
+                continue
+            for day in sorted(os.listdir(month_dir)):
+                day_dir = os.path.join(month_dir, day)
+                if len(day) == 2 and day.isdigit() and os.path.isdir(day_dir):
+                    yield day_dir
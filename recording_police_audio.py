@@ -1,73 +1,94 @@
-import pyaudio
-import wave
-import numpy as np
-from datetime import datetime
-import os
-import pytz
-
-# Audio settings
-FORMAT = pyaudio.paInt16
-CHANNELS = 1
-RATE = 46000
-CHUNK = 1024
-THRESHOLD = 500  # Adjust this value to set the audio detection threshold
-SILENCE_LIMIT = 2  # Number of seconds of silence before stopping
-
-# File settings
-OUTPUT_DIRECTORY = r"D:\Police_audio_recordings"  # Specify your desired output directory here
-
-def record_audio():
-    p = pyaudio.PyAudio()
-    stream = p.open(format=FORMAT, channels=CHANNELS, rate=RATE, input=True, frames_per_buffer=CHUNK)
-
-    print("Listening for audio...")
-    
-    while True:
-        data = stream.read(CHUNK)
-        audio_data = np.frombuffer(data, dtype=np.int16)
-        
-        if np.abs(audio_data).mean() > THRESHOLD:
-            print("Audio detected! Recording...")
-            
-            frames = []
-            silence_counter = 0
-            recording_start_time = datetime.now(pytz.timezone('US/Central'))
-            
-            while True:
-                data = stream.read(CHUNK)
-                frames.append(data)
-                
-                audio_data = np.frombuffer(data, dtype=np.int16)
-                if np.abs(audio_data).mean() < THRESHOLD:
-                    silence_counter += 1
-                else:
-                    silence_counter = 0
-                
-                if silence_counter > SILENCE_LIMIT * (RATE / CHUNK):
-                    break
-            
-            # Generate filename with date and CST time stamp of when recording started
-            timestamp = recording_start_time.strftime("%Y%m%d_%H%M%S")
-            filename = f"recording_{timestamp}.wav"
-            filepath = os.path.join(OUTPUT_DIRECTORY, filename)
-            
-            # Save the recorded audio
-            wf = wave.open(filepath, 'wb')
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(p.get_sample_size(FORMAT))
-            wf.setframerate(RATE)
-            wf.writeframes(b''.join(frames))
-            wf.close()
-            
-            os.system('cls')
-            print(f"Recording saved: {filepath}")
-            print("Listening for audio...")
-
-    stream.stop_stream()
-    stream.close()
-    p.terminate()
-
-if __name__ == "__main__":
-    # Create output directory if it doesn't exist
-    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
+import pyaudio
+import wave
+import numpy as np
+from datetime import datetime
+import os
+import time
+from recording_paths import RECORDING_TIMEZONE, partition_directory
+from clip_tracing import ClipTracer
+from process_metrics import Metrics
+
+# Audio settings
+FORMAT = pyaudio.paInt16
+CHANNELS = 1
+RATE = 46000
+CHUNK = 1024
+THRESHOLD = 500  # Adjust this value to set the audio detection threshold
+SILENCE_LIMIT = 2  # Number of seconds of silence before stopping
+
+# File settings
+OUTPUT_DIRECTORY = r"D:\Police_audio_recordings"  # Specify your desired output directory here, clips go into YYYY/MM/DD subfolders
+METRICS_PORT = 9101  # Serves http://127.0.0.1:9101/metrics besides metrics/recorder.prom, None for the file only
+
+def record_audio():
+    p = pyaudio.PyAudio()
+    stream = p.open(format=FORMAT, channels=CHANNELS, rate=RATE, input=True, frames_per_buffer=CHUNK)
+    tracer = ClipTracer(OUTPUT_DIRECTORY, "recorder")
+    metrics = Metrics("recorder")
+    metrics.start(OUTPUT_DIRECTORY, METRICS_PORT)
+
+    print("Listening for audio...")
+    
+    while True:
+        data = stream.read(CHUNK)
+        audio_data = np.frombuffer(data, dtype=np.int16)
+        
+        if np.abs(audio_data).mean() > THRESHOLD:
+            print("Audio detected! Recording...")
+            metrics.count("vad_triggers_total", help_text="Times the level crossed THRESHOLD and a recording started")
+            
+            frames = []
+            silence_counter = 0
+            recording_start_time = datetime.now(RECORDING_TIMEZONE)
+            
+            while True:
+                data = stream.read(CHUNK)
+                frames.append(data)
+                
+                audio_data = np.frombuffer(data, dtype=np.int16)
+                if np.abs(audio_data).mean() < THRESHOLD:
+                    silence_counter += 1
+                else:
+                    silence_counter = 0
+                
+                if silence_counter > SILENCE_LIMIT * (RATE / CHUNK):
+                    break
+            capture_end_time = time.time()
+            
+            # Generate filename with date and CST time stamp of when recording started
+            timestamp = recording_start_time.strftime("%Y%m%d_%H%M%S")
+            filename = f"recording_{timestamp}.wav"
+            partition = partition_directory(OUTPUT_DIRECTORY, recording_start_time)
+            os.makedirs(partition, exist_ok=True)
+            filepath = os.path.join(partition, filename)
+            
+            # Save the recorded audio
+            wf = wave.open(filepath, 'wb')
+            wf.setnchannels(CHANNELS)
+            wf.setsampwidth(p.get_sample_size(FORMAT))
+            wf.setframerate(RATE)
+            wf.writeframes(b''.join(frames))
+            wf.close()
+            
+            # Traced once the file exists, a line per stage is cheap next to writing the .wav
+            tracer.record(filename, "capture_start", recording_start_time.timestamp())
+            tracer.record(filename, "capture_end", capture_end_time)
+            tracer.record(filename, "file_written")
+            clip_seconds = len(frames) * CHUNK / RATE
+            metrics.count("clips_recorded_total", help_text="Clips saved")
+            metrics.count("recorded_audio_seconds_total", clip_seconds, "Seconds of audio saved")
+            metrics.observe("clip_seconds", clip_seconds, "Length of each saved clip")
+            
+            os.system('cls')
+            print(f"Recording saved: {filepath}")
+            print("Listening for audio...")
+
+    stream.stop_stream()
+    stream.close()
+    p.terminate()
+    tracer.close()
+
+if __name__ == "__main__":
+    # Create output directory if it doesn't exist
+    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
     record_audio()
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+    SQLite store with one row per Whisper segment. The transcription CSV only keeps the
+    segment texts joined with ' / ', this keeps the offsets and confidence values as well
+    so a keyword can be placed at the second of the clip it was said in.
+"""
+import sqlite3
+from keyword_matcher import PhraseTrie, tokenize
+from recording_paths import clip_start_epoch
+
+class SegmentStore:
+    """Stores and queries transcription segments by clip and by absolute time."""
+
+    def __init__(self, db_path):
+        """Opens (and creates if needed) the segment database."""
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS segments (
+                clip_id TEXT NOT NULL,
+                segment_index INTEGER NOT NULL,
+                start REAL NOT NULL,
+                end REAL NOT NULL,
+                absolute_start REAL,
+                text TEXT NOT NULL,
+                avg_logprob REAL,
+                no_speech_prob REAL,
+                PRIMARY KEY (clip_id, segment_index)
+            )""")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS segments_absolute_start ON segments(absolute_start)")
+        self.connection.commit()
+
+    def add_segments(self, clip_id, segments):
+        """Replaces the stored segments of a clip with the given Whisper segment dicts."""
+        clip_epoch = clip_start_epoch(clip_id)
+        rows = [
+            (
+                clip_id,
+                index,
+                segment['start'],
+                segment['end'],
+                clip_epoch + segment['start'] if clip_epoch is not None else None,
+                segment['text'],
+                segment.get('avg_logprob'),
+                segment.get('no_speech_prob'),
+            )
+            for index, segment in enumerate(segments)
+        ]
+        with self.connection:
+            self.connection.execute("DELETE FROM segments WHERE clip_id = ?", (clip_id,))
+            self.connection.executemany("INSERT INTO segments VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def segments_for_clip(self, clip_id):
+        """Returns (start, end, text, avg_logprob, no_speech_prob) tuples of a clip in order."""
+        return self.connection.execute(
+            "SELECT start, end, text, avg_logprob, no_speech_prob FROM segments WHERE clip_id = ? ORDER BY segment_index",
+            (clip_id,),
+        ).fetchall()
+
+    def segments_between(self, start_epoch, end_epoch):
+        """Returns (clip_id, start, end, text) tuples for segments starting within the given time range."""
+        return self.connection.execute(
+            "SELECT clip_id, start, end, text FROM segments WHERE absolute_start BETWEEN ? AND ? ORDER BY absolute_start",
+            (start_epoch, end_epoch),
+        ).fetchall()
+
+    def keyword_offsets(self, clip_id, keywords, clarify=None):
+        """Maps each keyword to the start in seconds of the first segment of the clip containing it.
+
+        Keywords are matched the way CompiledKeywords.scan matches them, so "arrested" places
+        "arrest". A keyword no segment says, like one only found in the clarified text, is looked
+        for in the clarified segments when clarify, CompiledKeywords.clarify, is given.
+        """
+        trie = PhraseTrie()
+        for keyword in keywords:
+            trie.add(keyword, keyword)
+        segments = [(start, text) for start, _, text, _, _ in self.segments_for_clip(clip_id)]
+        offsets = {}
+        for rewrite in (None, clarify) if clarify is not None else (None,):
+            for start, text in segments:
+                if len(offsets) == len(keywords):
+                    return offsets
+                for _, _, found in trie.find(tokenize(text if rewrite is None else rewrite(text))):
+                    for keyword in found:
+                        offsets.setdefault(keyword, start)
+        return offsets
+
+    def close(self):
+        self.connection.close()
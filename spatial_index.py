@@ -0,0 +1,75 @@
+"""
+    KD-tree over the street_data coordinates. Points are projected to meters around the mean
+    latitude of the data, which is accurate enough at county scale, so radius queries don't need
+    to scan every street. Also used to pick between streets with the same or similar names by
+    how close they are to the other streets mentioned in the same transmission.
+"""
+import math
+
+class StreetSpatialIndex:
+    """Answers "which streets and places are near this point" over street_data."""
+
+    def __init__(self, street_data):
+        coordinates = list(street_data.values())
+        mean_lat = sum(lat for _, lat in coordinates) / len(coordinates) if coordinates else 0.0
+        self.meters_per_degree_lat = 110540.0
+        self.meters_per_degree_lon = 111320.0 * math.cos(math.radians(mean_lat))
+        points = [(*self.project(lon, lat), street_name, (lon, lat)) for street_name, (lon, lat) in street_data.items()]
+        self.tree = self.build(points, 0)
+
+    def project(self, lon, lat):
+        """Returns the point in meters on the local plane."""
+        return lon * self.meters_per_degree_lon, lat * self.meters_per_degree_lat
+
+    def build(self, points, axis):
+        """Builds a node as (point, axis, left, right), splitting on the median of the axis."""
+        if not points:
+            return None
+        points.sort(key=lambda point: point[axis])
+        median = len(points) // 2
+        return (points[median], axis, self.build(points[:median], 1 - axis), self.build(points[median + 1:], 1 - axis))
+
+    def distance(self, first, second):
+        """Returns the distance in meters between two (lon, lat) coordinates."""
+        x1, y1 = self.project(*first)
+        x2, y2 = self.project(*second)
+        return math.hypot(x1 - x2, y1 - y2)
+
+    def within(self, lon, lat, radius_meters):
+        """Returns (street_name, coordinates, distance) for every entry within the radius, nearest first."""
+        x, y = self.project(lon, lat)
+        target = (x, y)
+        found = []
+        stack = [self.tree]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            point, axis, left, right = node
+            distance = math.hypot(point[0] - x, point[1] - y)
+            if distance <= radius_meters:
+                found.append((point[2], point[3], distance))
+            offset = target[axis] - point[axis]
+            near, far = (left, right) if offset < 0 else (right, left)
+            stack.append(near)
+            if abs(offset) <= radius_meters:
+                stack.append(far)
+        found.sort(key=lambda match: match[2])
+        return found
+
+    def resolve_mentions(self, mentions):
+        """Picks one street for each ambiguous mention in a transmission, by proximity to the other mentions.
+
+        mentions is a list of candidate lists of (street_name, coordinates), one list per place in the
+        transcription a street was heard. When a mention has several candidates, such as "Mooney Road"
+        matching both Mooney Road Northeast and Northwest, the candidate closest to any candidate of
+        another mention is kept. Without other mentions there is no evidence, so all candidates stay.
+        Returns the chosen (street_name, coordinates) pairs in mention order.
+        """
+        streets = []
+        for index, candidates in enumerate(mentions):
+            others = [street for other_index, other in enumerate(mentions) if other_index != index for street in other]
+            if len(candidates) > 1 and others:
+                candidates = [min(candidates, key=lambda street: min(self.distance(street[1], other[1]) for other in others))]
+            streets.extend(candidates)
+        return streets
@@ -0,0 +1,175 @@
+"""
+    Fuzzy street name lookup for Whisper near-misses like "Mooney Rd", "Eglin Pkwy" or "Muni Road".
+    Street names and transcriptions are tokenized the same way, common abbreviations are expanded,
+    and candidates are only compared when their first word has the same Metaphone key, so a lookup
+    touches a handful of streets instead of all of street_data.
+"""
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from keyword_matcher import tokenize
+
+ABBREVIATIONS = {
+    "rd": "road", "st": "street", "str": "street", "ave": "avenue", "av": "avenue", "blvd": "boulevard",
+    "pkwy": "parkway", "pky": "parkway", "hwy": "highway", "dr": "drive", "ln": "lane", "ct": "court",
+    "cir": "circle", "pl": "place", "ter": "terrace", "trl": "trail", "cv": "cove", "lp": "loop",
+    "sq": "square", "pt": "point", "xing": "crossing", "expy": "expressway", "fwy": "freeway",
+    "n": "north", "s": "south", "e": "east", "w": "west",
+    "ne": "northeast", "nw": "northwest", "se": "southeast", "sw": "southwest",
+}
+
+DIRECTIONS = {"north", "south", "east", "west", "northeast", "northwest", "southeast", "southwest"}
+
+VOWELS = set("aeiou")
+
+@lru_cache(maxsize=65536)
+def metaphone(word):
+    """Returns a simplified Metaphone key of the word. Tokens without letters are their own key."""
+    word = ''.join(c for c in word.lower() if c.isalpha())
+    if not word:
+        return ""
+    if word[:2] in ("kn", "gn", "pn", "ae", "wr"):
+        word = word[1:]
+    if word[0] == "x":
+        word = "s" + word[1:]
+    if word[:2] == "wh":
+        word = "w" + word[2:]
+    key = []
+    for i, c in enumerate(word):
+        prev = word[i - 1] if i > 0 else ""
+        nxt = word[i + 1] if i + 1 < len(word) else ""
+        after = word[i + 2] if i + 2 < len(word) else ""
+        if c == prev and c != "c":
+            continue
+        if c in VOWELS:
+            if i == 0:
+                key.append("A")
+        elif c == "b":
+            if not (prev == "m" and not nxt):
+                key.append("B")
+        elif c == "c":
+            if nxt == "i" and after == "a" or nxt == "h":
+                key.append("K" if prev == "s" else "X")
+            elif nxt in ("i", "e", "y"):
+                if prev != "s":
+                    key.append("S")
+            else:
+                key.append("K")
+        elif c == "d":
+            key.append("J" if nxt == "g" and after in ("e", "i", "y") else "T")
+        elif c == "g":
+            if nxt == "h" and after and after not in VOWELS:
+                continue
+            if nxt == "n" and (not after or word[i + 2:] == "ed"):
+                continue
+            key.append("J" if nxt in ("i", "e", "y") and prev != "g" else "K")
+        elif c == "h":
+            if nxt in VOWELS and prev not in ("c", "s", "p", "t", "g"):
+                key.append("H")
+        elif c == "k":
+            if prev != "c":
+                key.append("K")
+        elif c == "p":
+            key.append("F" if nxt == "h" else "P")
+        elif c == "q":
+            key.append("K")
+        elif c == "s":
+            key.append("X" if nxt == "h" or (nxt == "i" and after in ("o", "a")) else "S")
+        elif c == "t":
+            if nxt == "i" and after in ("o", "a"):
+                key.append("X")
+            elif nxt == "h":
+                key.append("0")
+            elif not (nxt == "c" and after == "h"):
+                key.append("T")
+        elif c == "v":
+            key.append("F")
+        elif c in ("w", "y"):
+            if nxt in VOWELS:
+                key.append(c.upper())
+        elif c == "x":
+            key.append("KS")
+        elif c == "z":
+            key.append("S")
+        else:
+            key.append(c.upper())
+    return ''.join(key)
+
+def expand_abbreviations(tokens):
+    """Expands street abbreviations like "rd" or "pkwy" in a token list."""
+    return [ABBREVIATIONS.get(token, token) for token in tokens]
+
+def token_key(token):
+    """Returns the blocking key of a token, its Metaphone key or the token itself when it has digits."""
+    return metaphone(token) if token.isalpha() else token
+
+@lru_cache(maxsize=65536)
+def token_similarity(heard, street_token):
+    """Scores how likely a heard token is a rendering of a street token, from 0 to 1."""
+    if heard == street_token:
+        return 1.0
+    # Short words share keys too easily ("red" and "road" are both RT), so only trust the key for longer ones
+    if min(len(heard), len(street_token)) >= 4 and heard[0] == street_token[0] and token_key(heard) == token_key(street_token):
+        return 0.95
+    return SequenceMatcher(None, heard, street_token).ratio()
+
+class StreetGazetteer:
+    """Phonetically blocked index over the street_data names."""
+
+    def __init__(self, street_data, min_score=0.85, min_token_score=0.6):
+        self.min_score = min_score  # Average token similarity needed to accept a match
+        self.min_token_score = min_token_score  # Every token needs at least this similarity
+        self.entries = []  # (street_name, coordinates, tokens)
+        self.blocks = defaultdict(list)  # Key of the first token -> entry indexes
+        names = set()
+        for street_name, coordinates in street_data.items():
+            tokens = tuple(expand_abbreviations(tokenize(street_name)))
+            # Single-word names like "Prairie" are too ambiguous to match loosely, the exact matcher handles them
+            if len(tokens) >= 2:
+                self.add_entry(street_name, coordinates, tokens)
+                names.add(tokens)
+        # "Mooney Road" is only in street_data as "Mooney Road Northeast/Northwest", index the base name too
+        for street_name, coordinates in street_data.items():
+            tokens = tuple(expand_abbreviations(tokenize(street_name)))
+            if len(tokens) >= 3 and tokens[-1] in DIRECTIONS and tokens[:-1] not in names:
+                self.add_entry(street_name, coordinates, tokens[:-1])
+
+    def add_entry(self, street_name, coordinates, tokens):
+        self.blocks[token_key(tokens[0])].append(len(self.entries))
+        self.entries.append((street_name, coordinates, tokens))
+
+    def lookup(self, tokens):
+        """Returns (street_name, coordinates, score, start, end) matches over spans of the tokenized transcription.
+
+        A match contained in a longer match is dropped, so "Mooney Road Northeast" doesn't also
+        report the bare "Mooney Road" variants.
+        """
+        tokens = expand_abbreviations(tokens)
+        candidates = []
+        for start, token in enumerate(tokens):
+            for entry_index in self.blocks.get(token_key(token), ()):
+                street_name, coordinates, street_tokens = self.entries[entry_index]
+                end = start + len(street_tokens)
+                if end > len(tokens):
+                    continue
+                total = 0.0
+                for heard, street_token in zip(tokens[start:end], street_tokens):
+                    similarity = token_similarity(heard, street_token)
+                    if similarity < self.min_token_score:
+                        break
+                    total += similarity
+                else:
+                    score = total / len(street_tokens)
+                    if score >= self.min_score:
+                        candidates.append((street_name, coordinates, score, start, end))
+        # Keep the best scoring streets of each span, ties are left for the caller to disambiguate
+        best_scores = {}
+        for _, _, score, start, end in candidates:
+            best_scores[start, end] = max(score, best_scores.get((start, end), 0.0))
+        candidates = [match for match in candidates if match[2] == best_scores[match[3], match[4]]]
+        candidates.sort(key=lambda match: match[3] - match[4])
+        matches = []
+        for match in candidates:
+            if not any(kept[3] <= match[3] and match[4] <= kept[4] and (kept[4] - kept[3]) > (match[4] - match[3]) for kept in matches):
+                matches.append(match)
+        return matches
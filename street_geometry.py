@@ -0,0 +1,144 @@
+"""
+    Compact binary store for simplified street geometries and the street intersection table built
+    from them by tool_kit/overpass_play.py. The flagger only reads the intersection table, so a
+    transmission naming two streets can be placed at the point where they cross instead of at two
+    far-apart street centroids.
+
+    Layout, all little-endian:
+        header        b"SGEO", version (B), street count (I), intersection count (I), intersection offset (Q)
+        street        name length (H), name (utf-8), line count (H), then per line a point count (I)
+                      followed by lon/lat float32 pairs
+        intersection  name a length (H), name a, name b length (H), name b, lon/lat float64
+"""
+import hashlib
+import math
+import os
+import struct
+from keyword_matcher import tokenize
+
+MAGIC = b"SGEO"
+VERSION = 1
+HEADER = struct.Struct("<4sBIIQ")
+
+# Where tool_kit/overpass_play.py writes the file and the flagger reads it, next to the scripts
+GEOMETRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "street_geometries.bin")
+
+def street_key(street_name):
+    """Normalizes a street name so OSM names and street_data keys compare equal."""
+    return ' '.join(tokenize(street_name))
+
+def write_name(outfile, name):
+    encoded = name.encode('utf-8')
+    outfile.write(struct.pack("<H", len(encoded)))
+    outfile.write(encoded)
+
+def read_name(data, offset):
+    (length,) = struct.unpack_from("<H", data, offset)
+    offset += 2
+    return data[offset:offset + length].decode('utf-8'), offset + length
+
+def write_street_geometries(filename, geometries, intersections):
+    """Writes {street_name: [[(lon, lat), ...], ...]} geometries and [(name_a, name_b, lon, lat)] intersections."""
+    with open(filename, 'wb') as outfile:
+        outfile.write(HEADER.pack(MAGIC, VERSION, len(geometries), len(intersections), 0))
+        for street_name, lines in geometries.items():
+            write_name(outfile, street_name)
+            outfile.write(struct.pack("<H", len(lines)))
+            for line in lines:
+                outfile.write(struct.pack("<I", len(line)))
+                outfile.write(struct.pack(f"<{len(line) * 2}f", *(value for point in line for value in point)))
+        intersection_offset = outfile.tell()
+        for name_a, name_b, lon, lat in intersections:
+            write_name(outfile, name_a)
+            write_name(outfile, name_b)
+            outfile.write(struct.pack("<dd", lon, lat))
+        outfile.seek(0)
+        outfile.write(HEADER.pack(MAGIC, VERSION, len(geometries), len(intersections), intersection_offset))
+
+def read_header(data, filename):
+    magic, version, street_count, intersection_count, intersection_offset = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{filename} is not a version {VERSION} street geometry file")
+    return street_count, intersection_count, intersection_offset
+
+def load_street_geometries(filename):
+    """Returns {street_name: [[(lon, lat), ...], ...]} from a street geometry file."""
+    with open(filename, 'rb') as infile:
+        data = infile.read()
+    street_count, _, _ = read_header(data, filename)
+    offset = HEADER.size
+    geometries = {}
+    for _ in range(street_count):
+        street_name, offset = read_name(data, offset)
+        (line_count,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        lines = []
+        for _ in range(line_count):
+            (point_count,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            values = struct.unpack_from(f"<{point_count * 2}f", data, offset)
+            offset += point_count * 8
+            lines.append(list(zip(values[0::2], values[1::2])))
+        geometries[street_name] = lines
+    return geometries
+
+class IntersectionTable:
+    """Looks up where two named streets cross."""
+
+    def __init__(self, intersections):
+        self.points = {}  # frozenset of two street keys -> [(lon, lat), ...]
+        for name_a, name_b, lon, lat in intersections:
+            self.points.setdefault(frozenset((street_key(name_a), street_key(name_b))), []).append((lon, lat))
+
+    @classmethod
+    def load(cls, filename):
+        """Reads only the header and the intersection section of a street geometry file, not the street geometries."""
+        with open(filename, 'rb') as infile:
+            _, intersection_count, intersection_offset = read_header(infile.read(HEADER.size), filename)
+            infile.seek(intersection_offset)
+            data = infile.read()
+        offset = 0
+        intersections = []
+        for _ in range(intersection_count):
+            name_a, offset = read_name(data, offset)
+            name_b, offset = read_name(data, offset)
+            lon, lat = struct.unpack_from("<dd", data, offset)
+            offset += 16
+            intersections.append((name_a, name_b, lon, lat))
+        return cls(intersections)
+
+    def fingerprint(self):
+        """Returns a hash of the table, so cached scans can tell when it changed."""
+        entries = sorted((sorted(names), sorted(points)) for names, points in self.points.items())
+        return hashlib.sha1(repr(entries).encode('utf-8')).hexdigest()
+
+    def lookup(self, street_a, street_b):
+        """Returns the (lon, lat) points where the two streets cross, empty when they don't."""
+        return self.points.get(frozenset((street_key(street_a), street_key(street_b))), [])
+
+    def resolve(self, streets):
+        """Replaces pairs of crossing streets in a transmission's (street_name, coordinates) list by their intersection.
+
+        Pairs are taken in mention order and each street joins at most one pair. When two streets
+        cross more than once, the crossing closest to the midpoint of their centroids is used.
+        The intersection is named "Street A & Street B".
+        """
+        resolved = []
+        paired = set()
+        for index, (name_a, coordinates_a) in enumerate(streets):
+            if index in paired:
+                continue
+            for other_index in range(index + 1, len(streets)):
+                if other_index in paired:
+                    continue
+                name_b, coordinates_b = streets[other_index]
+                points = self.lookup(name_a, name_b)
+                if points:
+                    midpoint = ((coordinates_a[0] + coordinates_b[0]) / 2, (coordinates_a[1] + coordinates_b[1]) / 2)
+                    point = min(points, key=lambda point: math.hypot(point[0] - midpoint[0], point[1] - midpoint[1]))
+                    resolved.append((f"{name_a.strip()} & {name_b.strip()}", point))
+                    paired.update((index, other_index))
+                    break
+            else:
+                resolved.append((name_a, coordinates_a))
+        return resolved
@@ -1,49 +1,83 @@
-"""
-    This is a script that takes any coordinates found in flagged_date and plots them onto a 
-    map. mostly there for interesting viusal
-"""
-import csv
-import folium
-
-def read_coordinates_from_csv(csv_filename):
-    coordinates = []
-    with open(csv_filename, mode='r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-        next(reader)  # Skip header row if there is one
-        for row in reader:
-            if len(row) >= 7:
-                coord_str = row[6]
-                if coord_str != "NULL":
-                    coord_pairs = coord_str.split(';')
-                    for pair in coord_pairs:
-                        street, coord = pair.split(': ')
-                        lon, lat = map(float, coord.split(','))
-                        coordinates.append((lat, lon, street))
-    return coordinates
-
-def plot_coordinates_on_map(coordinates, output_html):
-    # Create a map centered around the first coordinate
-    if coordinates:
-        first_coord = coordinates[0]
-        m = folium.Map(location=[first_coord[0], first_coord[1]], zoom_start=12)
-
-        # Add markers for each coordinate
-        for lat, lon, street in coordinates:
-            folium.Marker(
-                location=[lat, lon],
-                popup=f"{street}: ({lat}, {lon})",
-                icon=folium.Icon(color='blue', icon='info-sign')
-            ).add_to(m)
-
-        # Save the map to an HTML file
-        m.save(output_html)
-        print(f"Map has been saved to {output_html}")
-    else:
-        print("No coordinates to plot.")
-
-if __name__ == "__main__":
-    csv_filename = r'D:\Police_audio_recordings\flagged_data.csv'
-    output_html = r'D:\Police_audio_recordings\map.html'
-
-    coordinates = read_coordinates_from_csv(csv_filename)
-    plot_coordinates_on_map(coordinates, output_html)
+"""
+    This is a script that takes any coordinates found in flagged_date and plots them onto a 
+    map. mostly there for interesting viusal
+"""
+import csv
+import os
+import sys
+import folium
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from recording_paths import resolve_clip_path
+from spatial_index import StreetSpatialIndex
+from event_store import EventStore
+import keywords
+
+NEARBY_RADIUS_METERS = 300  # Streets and places within this distance are listed in each marker's popup
+
+def read_coordinates_from_csv(csv_filename, recordings_directory=None):
+    coordinates = []
+    with open(csv_filename, mode='r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader)  # Skip header row if there is one
+        for row in reader:
+            if len(row) >= 7:
+                coord_str = row[6]
+                if coord_str != "NULL":
+                    clip_path = resolve_clip_path(recordings_directory, row[1]) if recordings_directory else None
+                    coord_pairs = coord_str.split(';')
+                    for pair in coord_pairs:
+                        street, coord = pair.split(': ')
+                        lon, lat = map(float, coord.strip('()').split(','))
+                        coordinates.append((lat, lon, street, clip_path))
+    return coordinates
+
+def read_coordinates_from_store(db_path, recordings_directory=None, categories=None, since=None):
+    """Reads typed event locations from the event store instead of parsing flagged_data.csv."""
+    store = EventStore(db_path)
+    coordinates = []
+    for clip_id, _, _, _, _, locations in store.query_events(categories, since):
+        clip_path = resolve_clip_path(recordings_directory, clip_id) if recordings_directory else None
+        for street, lon, lat in locations:
+            coordinates.append((lat, lon, street, clip_path))
+    store.close()
+    return coordinates
+
+def plot_coordinates_on_map(coordinates, output_html, spatial_index=None):
+    # Create a map centered around the first coordinate
+    if coordinates:
+        first_coord = coordinates[0]
+        m = folium.Map(location=[first_coord[0], first_coord[1]], zoom_start=12)
+
+        # Add markers for each coordinate
+        for lat, lon, street, clip_path in coordinates:
+            popup = f"{street}: ({lat}, {lon})"
+            if clip_path:
+                popup += f'<br><a href="file:///{clip_path}">{os.path.basename(clip_path)}</a>'
+            if spatial_index is not None:
+                nearby = [name.strip() for name, _, _ in spatial_index.within(lon, lat, NEARBY_RADIUS_METERS) if name != street]
+                if nearby:
+                    popup += "<br>Nearby: " + ", ".join(nearby[:5])
+            folium.Marker(
+                location=[lat, lon],
+                popup=popup,
+                icon=folium.Icon(color='blue', icon='info-sign')
+            ).add_to(m)
+
+        # Save the map to an HTML file
+        m.save(output_html)
+        print(f"Map has been saved to {output_html}")
+    else:
+        print("No coordinates to plot.")
+
+if __name__ == "__main__":
+    recordings_directory = r'D:\Police_audio_recordings'
+    csv_filename = os.path.join(recordings_directory, 'flagged_data.csv')
+    events_db = os.path.join(recordings_directory, 'events.db')
+    output_html = os.path.join(recordings_directory, 'map.html')
+
+    if os.path.exists(events_db):
+        coordinates = read_coordinates_from_store(events_db, recordings_directory)
+    else:
+        coordinates = read_coordinates_from_csv(csv_filename, recordings_directory)
+    plot_coordinates_on_map(coordinates, output_html, StreetSpatialIndex(keywords.street_data))
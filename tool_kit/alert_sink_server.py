@@ -0,0 +1,42 @@
+"""
+    Local HTTP stand-in for an alert webhook. Prints every alert the flagger POSTs to it, so the
+    webhook sink can be tested without a real service. --delay makes it answer slowly, to check
+    that a slow sink doesn't hold up flagging.
+
+    python tool_kit/alert_sink_server.py --port 8765 --delay 10
+    then set ALERT_WEBHOOK_URL = "http://127.0.0.1:8765/alert" in Keyword_flaging_and_alert_push.py
+"""
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+def make_handler(delay):
+    class AlertHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(delay)
+            try:
+                alert = json.loads(body)
+                streets = ", ".join(street["name"] for street in alert.get("streets", [])) or "no street"
+                print(f"{alert.get('clip_id')} | {', '.join(alert.get('reasons', []))} | {streets} | {alert.get('transcription', '').strip()}")
+            except ValueError:
+                print(f"Not JSON: {body[:200]!r}")
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass  # The alerts themselves are printed instead
+    return AlertHandler
+
+def main():
+    parser = argparse.ArgumentParser(description="Print alerts POSTed by the flagger.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before answering each alert")
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.delay))
+    print(f"Listening for alerts on http://127.0.0.1:{args.port}/alert")
+    server.serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+    Benchmarks the flagger's keyword matching. Compares the tokenized trie matcher against the
+    old approach of checking every keyword with `in transcription.lower()`, for precision and
+    recall on a small hand-labeled sample and for throughput on the sample or on a real
+    transcriptions.csv passed as the first argument. Also measures how many Whisper-style street
+    misspellings the fuzzy gazetteer recovers and how long a gazetteer lookup takes, and compares
+    the single-pass ten-code rewrite against chained str.replace calls, for speed and on
+    CLARIFY_SAMPLE.
+
+    With --batch-rows N it also writes N synthetic transcription rows and compares rows/sec of the
+    row-by-row flagger against batch_flagging.py. The row-by-row run is capped at 100,000 rows.
+
+    With --memory-rows N [N ...] it flags synthetic CSVs of each size in a fresh process, with a
+    scan cache as in the live loop, and prints the peak RSS. The row-by-row flagger streams the CSV
+    through a fixed window of rows, so it should come out the same for every size, e.g.
+    `--memory-rows 100000 1000000 10000000` goes up to a 1.2 GB CSV.
+
+    --memory-test does that for MEMORY_TEST_SMALL_ROWS rows and for a CSV of more than 1 GB, and
+    exits with an error when the large file's peak RSS is more than MEMORY_TEST_TOLERANCE_MB
+    above the small one's. The large run takes about a quarter of an hour.
+"""
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import keywords
+from keyword_matcher import compile_keywords, tokenize
+import Keyword_flaging_and_alert_push as flagger
+from batch_flagging import flag_transcriptions_batch
+from event_store import EventStore
+
+MEMORY_TEST_SMALL_ROWS = 100000
+MEMORY_TEST_LARGE_ROWS = 10000000  # About 1.2 GB of CSV
+MEMORY_TEST_TOLERANCE_MB = 32
+
+# (transcription, expected categories, expected streets)
+LABELED_SAMPLE = [
+    (" Unit 12, I've got one in custody on Eglin Parkway.", {"arrests"}, {"Eglin Parkway"}),
+    (" Subject was arrested near Main Street.", {"arrests"}, {"Main Street"}),
+    (" Thornton is clear, en route.", {"en route"}, set()),
+    (" Firefighters on scene of the structure fire.", set(), set()),
+    (" Caller states a fight in progress at the bar.", {"disturbances"}, set()),
+    (" Possible overdose, Narcan administered, EMS en route.", {"overdoses", "en route"}, set()),
+    (" Reported stolen vehicle, tag verification.", {"theft", "verification"}, set()),
+    (" Subject is unresponsive, starting CPR.", {"medical_emergencies"}, set()),
+    (" Copy, show me 10-8.", set(), set()),
+    (" Respond to a loud music complaint on Hollywood Boulevard.", {"Noise Complaints", "neighbor_altercations"}, {"Hollywood Boulevard"}),
+    (" The driver was speeding and swerving.", {"traffic_violations"}, set()),
+    (" Strong odor, possible DUI.", {"traffic_violations", "alcohol_violation"}, set()),
+    (" Welfare check at the Residence Inn.", {"wellness_checks"}, set()),
+    (" Stroke patient, transporting.", {"medical_emergencies"}, set()),
+    (" Show me en route to Racetrack Road Northwest.", {"en route"}, {"Racetrack Road Northwest"}),
+    (" Vehicle was damaged in a collision.", {"destruction_of_property", "car_crashes_or_damage"}, set()),
+    (" The horns are going off, possible car alarm.", {"Noise Complaints"}, set()),
+    (" Caller is threatening suicide.", {"suicides"}, set()),
+    (" Partying at the beach all night.", {"Noise Complaints"}, set()),
+    (" Got him handcuffed.", {"arrests"}, set()),
+    (" There's a hornet nest by the porch.", set(), set()),
+    (" Street racing on Main Street.", {"racing"}, {"Main Street"}),
+    (" Disabled vehicle on Sandy Lane.", {"disabled_vehicles"}, {"Sandy Lane"}),
+    (" Traffic stop on Highland Avenue, 10-50.", {"traffic_stops"}, {"Highland Avenue"}),
+    (" Haylee Lane, good evening.", set(), {"Haylee Lane"}),
+    # keywords.py spells these several ways, one mention is one street
+    (" Subject walking on Santa Rosa Boulevard.", set(), {"Santa Rosa Boulevard"}),
+    (" Alarm at Champions Court.", set(), {"Champions Court"}),
+    (" Meet me on Walk Along Way.", set(), {"Walk Along way"}),
+]
+
+# (transcription with a misheard or abbreviated street, streets any of which is a correct match)
+FUZZY_SAMPLE = [
+    (" Show me en route to Mooney Rd.", {"Mooney Road Northeast", "Mooney Road Northwest"}),
+    (" Shots fired on Eglin Pkwy.", {"Eglin Parkway"}),
+    (" Traffic stop at Muni Road Northeast.", {"Mooney Road Northeast"}),
+    (" Vehicle heading south on Racetrak Road.", {"Racetrack Road Northeast", "Racetrack Road Northwest"}),
+    (" Disabled vehicle on Hollywood Blvd NE.", {"Hollywood Boulevard Northeast"}),
+    (" Caller is at Beel Parkway and the mall.", {"Beal Parkway Southwest", "Beal Parkway Northwest"}),
+    (" Subject walking on Santa Rosa Blvd.", {"Santa Rosa Boulevard"}),
+    (" Unit 12 is clear, heading back.", set()),
+    (" White male in a red truck heading north on the highway.", set()),
+]
+
+# (transcription, clarified transcription), keys must not match inside longer codes or words
+CLARIFY_SAMPLE = [
+    (" Traffic stop on Highland Avenue, 10-50.", " Traffic stop on Highland Avenue, 10-50(Traffic Stop*)."),
+    (" Go 10-18X to the school.", " Go 10-18X(do not use Lights & Siren*) to the school."),
+    (" Show me 10-18.", " Show me 10-18(Respond w/Lights & Siren*)."),
+    (" Copy, 10-100.", " Copy, 10-100."),
+    (" Two 10-50s on the parkway.", " Two 10-50s on the parkway."),
+    (" Meet at FHPS headquarters, ETOHX.", " Meet at FHPS headquarters, ETOHX."),
+    (" Unit A1033 clear.", " Unit A1033 clear."),
+    (" FHP is on scene.", " FHP(Florida Highway Patrol) is on scene."),
+]
+
+def substring_scan(transcription, keyword_categories, street_data):
+    """The flagger's original matching, kept here as the baseline."""
+    categories = set()
+    streets = []
+    for street_name in street_data:
+        if street_name.lower() in transcription.lower():
+            streets.append(street_name)
+    for category, category_keywords in keyword_categories.items():
+        if category.lower() == "locations":
+            continue
+        for keyword in category_keywords:
+            if keyword.lower() in transcription.lower():
+                categories.add(category)
+    return categories, streets
+
+def trie_scan(transcription, compiled_keywords):
+    category_mask, _, streets, _ = compiled_keywords.scan(transcription)
+    return set(compiled_keywords.categories_of(category_mask)), [street_name for street_name, _ in streets]
+
+def score(scan):
+    """Returns (precision, recall) of the scan function over the labeled sample."""
+    true_positives = found = expected = 0
+    for transcription, expected_categories, expected_streets in LABELED_SAMPLE:
+        categories, streets = scan(transcription)
+        hits = {("category", name) for name in categories} | {("street", name) for name in streets}
+        truth = {("category", name) for name in expected_categories} | {("street", name) for name in expected_streets}
+        true_positives += len(hits & truth)
+        found += len(hits)
+        expected += len(truth)
+    return true_positives / max(found, 1), true_positives / max(expected, 1)
+
+def throughput(scan, transcriptions):
+    """Returns transcriptions per second for the scan function."""
+    start_time = time.perf_counter()
+    for transcription in transcriptions:
+        scan(transcription)
+    return len(transcriptions) / (time.perf_counter() - start_time)
+
+def fuzzy_recall(scan):
+    """Returns the share of FUZZY_SAMPLE transcriptions whose streets were all found correctly."""
+    correct = 0
+    for transcription, expected_streets in FUZZY_SAMPLE:
+        _, streets = scan(transcription)
+        if set(streets) == expected_streets or (expected_streets and set(streets) and set(streets) <= expected_streets):
+            correct += 1
+    return correct / len(FUZZY_SAMPLE)
+
+def gazetteer_latency(compiled_keywords, transcriptions):
+    """Returns the mean gazetteer lookup time per transcription in milliseconds."""
+    token_lists = [tokenize(transcription) for transcription in transcriptions]
+    start_time = time.perf_counter()
+    for tokens in token_lists:
+        compiled_keywords.gazetteer.lookup(tokens)
+    return (time.perf_counter() - start_time) * 1000 / len(token_lists)
+
+def replace_clarify(transcription, clarifications):
+    """Ten-code expansion with one str.replace per key, kept here as the baseline."""
+    for key, replacement in clarifications.items():
+        transcription = transcription.replace(key, replacement)
+    return transcription
+
+def clarify_accuracy(clarify):
+    """Returns the share of CLARIFY_SAMPLE transcriptions the clarify function rewrites as expected."""
+    return sum(clarify(transcription) == expected for transcription, expected in CLARIFY_SAMPLE) / len(CLARIFY_SAMPLE)
+
+def load_transcriptions(csv_file, limit=2000):
+    with open(csv_file, 'r', newline='', encoding='utf-8') as infile:
+        reader = csv.reader(infile)
+        next(reader, None)
+        return [row[2] for row, _ in zip(reader, range(limit)) if len(row) > 2]
+
+def write_synthetic_transcriptions(csv_file, row_count):
+    """Writes row_count transcription rows built from the samples, a clip every 20 seconds.
+
+    A unit number is added to each sample so there are tens of thousands of distinct texts,
+    like a real archive, rather than a few dozen repeated ones.
+    """
+    samples = [row[0] for row in LABELED_SAMPLE] + [row[0] for row in FUZZY_SAMPLE]
+    clip_time = datetime(2024, 1, 1)
+    with open(csv_file, 'w', newline='', encoding='utf-8') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(["Timestamp", "File", "Transcription", "Model", "Last End Time", "File Length", "Status"])
+        for index in range(row_count):
+            clip_time += timedelta(seconds=20)
+            transcription = f"{samples[index % len(samples)]} Unit {index * 7919 % 1000}."
+            writer.writerow([clip_time.strftime("%Y-%m-%d %H:%M:%S"), f"recording_{clip_time:%Y%m%d_%H%M%S}.wav", transcription, "medium.en", 4.0, 4.0, "final"])
+
+def row_by_row_flagging(directory, compiled_keywords, event_store=None):
+    flagger.process_transcription_csv(os.path.join(directory, "transcriptions.csv"), os.path.join(directory, "flagged_data.csv"), os.path.join(directory, "annotated.csv"), os.path.join(directory, "annotated2.csv"), compiled_keywords, event_store=event_store)
+
+def batch_flagging(directory, compiled_keywords):
+    flag_transcriptions_batch(os.path.join(directory, "transcriptions.csv"), os.path.join(directory, "flagged_data.csv"), os.path.join(directory, "annotated.csv"), os.path.join(directory, "annotated2.csv"), compiled_keywords)
+
+def flagging_rows_per_second(compiled_keywords, row_count):
+    """Prints rows/sec of the row-by-row and batch flaggers over synthetic transcriptions."""
+    for name, flag, rows in (("row-by-row", row_by_row_flagging, min(row_count, 100000)), ("batch", batch_flagging, row_count)):
+        with tempfile.TemporaryDirectory() as directory:
+            write_synthetic_transcriptions(os.path.join(directory, "transcriptions.csv"), rows)
+            start_time = time.perf_counter()
+            flag(directory, compiled_keywords)
+            elapsed = time.perf_counter() - start_time
+        print(f"{name:>12}: {rows:,} rows in {elapsed:.1f} s, {rows / elapsed:,.0f} rows/sec")
+
+def peak_rss_mb():
+    """Returns the peak resident memory of this process in MB, or None where it can't be read."""
+    try:
+        import resource
+    except ImportError:
+        # Windows, where psutil is optional
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / 2**20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+def flag_once(directory):
+    """Flags the directory's transcriptions.csv once with a scan cache and prints the peak RSS as the last line."""
+    compiled_keywords = compile_keywords(keywords.clarifications, keywords.keyword_categories, keywords.street_data)
+    event_store = EventStore(os.path.join(directory, "events.db"), migrate=True)
+    row_by_row_flagging(directory, compiled_keywords, event_store)
+    event_store.close()
+    peak = peak_rss_mb()
+    print(f"{peak:.0f}" if peak is not None else "unknown")
+
+def flagging_peak_memory(row_counts):
+    """Prints the peak RSS of one flagging cycle over synthetic CSVs of each size, each in its own process.
+
+    Returns [(rows, CSV bytes, peak RSS in MB or None)].
+    """
+    results = []
+    for rows in row_counts:
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "transcriptions.csv")
+            write_synthetic_transcriptions(csv_file, rows)
+            start_time = time.perf_counter()
+            result = subprocess.run([sys.executable, os.path.abspath(__file__), "--flag-once", directory], capture_output=True, text=True, check=True)
+            elapsed = time.perf_counter() - start_time
+            peak = result.stdout.strip().splitlines()[-1]
+            print(f"{rows:>12,} rows, {os.path.getsize(csv_file) / 2**20:,.0f} MB CSV: peak RSS {peak} MB, {rows / elapsed:,.0f} rows/sec")
+            results.append((rows, os.path.getsize(csv_file), float(peak) if peak != "unknown" else None))
+    return results
+
+def memory_test():
+    """Checks that flagging a CSV of more than 1 GB peaks at about the same RSS as a small one. Returns True when it does."""
+    (_, _, small_peak), (_, large_size, large_peak) = flagging_peak_memory([MEMORY_TEST_SMALL_ROWS, MEMORY_TEST_LARGE_ROWS])
+    if large_size <= 2**30:
+        print(f"The large CSV is only {large_size / 2**20:,.0f} MB, raise MEMORY_TEST_LARGE_ROWS")
+        return False
+    if small_peak is None or large_peak is None:
+        print("Peak RSS can't be read here (pip install psutil)")
+        return False
+    passed = large_peak <= small_peak + MEMORY_TEST_TOLERANCE_MB
+    print(f"Memory test {'passed' if passed else 'FAILED'}: {large_peak:.0f} MB for {large_size / 2**30:.2f} GB against {small_peak:.0f} MB, allowed {small_peak + MEMORY_TEST_TOLERANCE_MB:.0f} MB")
+    return passed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the flagger's keyword matching.")
+    parser.add_argument("transcriptions", nargs="?", help="A transcriptions.csv to measure throughput on")
+    parser.add_argument("--batch-rows", type=int, help="Also compare row-by-row and batch flagging over this many synthetic rows")
+    parser.add_argument("--memory-rows", type=int, nargs="+", help="Also measure the flagger's peak RSS over synthetic CSVs of these sizes")
+    parser.add_argument("--memory-test", action="store_true", help="Check that peak RSS stays flat from a small CSV to one of more than 1 GB, and exit")
+    parser.add_argument("--flag-once", help=argparse.SUPPRESS)  # Used by --memory-rows to flag in a fresh process
+    args = parser.parse_args()
+    if args.flag_once:
+        flag_once(args.flag_once)
+        return
+    if args.memory_test:
+        sys.exit(0 if memory_test() else 1)
+
+    start_time = time.perf_counter()
+    compiled_keywords = compile_keywords(keywords.clarifications, keywords.keyword_categories, keywords.street_data)
+    print(f"Compiled {compiled_keywords.trie.phrase_count} phrases in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    scans = {
+        "substring": lambda text: substring_scan(text, keywords.keyword_categories, keywords.street_data),
+        "token trie": lambda text: trie_scan(text, compiled_keywords),
+    }
+    transcriptions = load_transcriptions(args.transcriptions) if args.transcriptions else [row[0] for row in LABELED_SAMPLE] * 20
+    for name, scan in scans.items():
+        precision, recall = score(scan)
+        rate = throughput(scan, transcriptions)
+        print(f"{name:>12}: precision {precision:.2f}, recall {recall:.2f}, misspelled streets {fuzzy_recall(scan):.2f}, {rate:,.0f} transcriptions/sec")
+    for name, clarify in (("str.replace", lambda text: replace_clarify(text, keywords.clarifications)), ("trie rewrite", compiled_keywords.clarify)):
+        print(f"{name:>12}: {throughput(clarify, transcriptions):,.0f} ten-code rewrites/sec, {clarify_accuracy(clarify):.2f} of the clarify sample right")
+    print(f"Gazetteer lookup: {gazetteer_latency(compiled_keywords, transcriptions):.3f} ms per transcription over {len(compiled_keywords.gazetteer.entries)} street entries")
+    if args.batch_rows:
+        flagging_rows_per_second(compiled_keywords, args.batch_rows)
+    if args.memory_rows:
+        flagging_peak_memory(args.memory_rows)
+
+if __name__ == "__main__":
+    main()
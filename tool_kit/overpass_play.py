@@ -1,111 +1,182 @@
-"""
-this script is designed to get all the coordinates for the streets and points of interest in whatever place 
-you enter, can be a city,state,or county. recomended that to keep it either on the city or county level.
-set up to find the centriod of a road but the script can be modified to get indivual addresses.
-coordiates that dont have names will not get outputted. the coordinate will always be put inside a road.
-
-"""
-import requests
-from shapely.geometry import LineString
-from shapely.ops import nearest_points
-
-def get_osm_data(area_name, feature):
-    overpass_url = "http://overpass-api.de/api/interpreter"
-    overpass_query = f"""
-    [out:json];
-    area["name"="{area_name}"]->.searchArea;
-    (
-      way["{feature}"](area.searchArea);
-      node["tourism"]["name"](area.searchArea);
-      node["natural"]["name"](area.searchArea);
-      node["amenity"="fuel"]["name"](area.searchArea);
-    );
-    out body geom;
-    """
-    print(f"Sending request to Overpass API for {area_name}...")
-    response = requests.get(overpass_url, params={'data': overpass_query})
-    print(f"Response status code: {response.status_code}")
-    response.raise_for_status()
-    data = response.json()
-    print(f"Received {len(data.get('elements', []))} elements from API")
-    return data
-
-def parse_osm_data(osm_data):
-    streets = {}
-    pois = []
-    natural_features = []
-    fuel_stations = []
-
-    for element in osm_data.get('elements', []):
-        name = element['tags'].get('name')
-        if name and name != 'Unnamed':
-            # Add a space at the beginning of the name
-            name = " " + name
-
-            if element['type'] == 'way' and 'highway' in element['tags']:
-                if name not in streets:
-                    geometry = LineString([(point['lon'], point['lat']) for point in element['geometry']])
-                    centroid = geometry.centroid
-                    
-                    # Ensure the centroid is inside the geometry
-                    if not geometry.contains(centroid):
-                        # Find the nearest point on the geometry to the centroid
-                        nearest_point = nearest_points(geometry, centroid)[0]
-                        centroid = nearest_point  # Move centroid to the nearest point inside
-
-                    streets[name] = (centroid.x, centroid.y)
-
-            elif element['type'] == 'node':
-                item = {
-                    'name': name,
-                    'lon': element['lon'],
-                    'lat': element['lat']
-                }
-
-                if 'tourism' in element['tags']:
-                    pois.append(item)
-                elif 'natural' in element['tags']:
-                    natural_features.append(item)
-                elif element['tags'].get('amenity') == 'fuel':
-                    fuel_stations.append(item)
-
-    unique_streets = [{
-        'name': name,
-        'lon': lon,
-        'lat': lat
-    } for name, (lon, lat) in streets.items()]
-
-    print(f"Parsed {len(unique_streets)} unique streets, {len(pois)} POIs, {len(natural_features)} natural features, and {len(fuel_stations)} fuel stations from OSM data")
-    return unique_streets, pois, natural_features, fuel_stations
-
-def save_to_txt(streets, pois, natural_features, fuel_stations, filename):
-    with open(filename, 'w') as file:
-        for street in streets:
-            file.write(f'"{street["name"]}",({street["lon"]}, {street["lat"]})\n')
-        for poi in pois:
-            file.write(f'"{poi["name"]}",({poi["lon"]}, {poi["lat"]})\n')
-        for natural_feature in natural_features:
-            file.write(f'"{natural_feature["name"]}",({natural_feature["lon"]}, {natural_feature["lat"]})\n')
-        for fuel_station in fuel_stations:
-            file.write(f'"{fuel_station["name"]}",({fuel_station["lon"]}, {fuel_station["lat"]})\n')
-
-    print(f"TXT file '{filename}' has been created.")
-
-def main():
-    area_name = "Okaloosa County"  # Change this to the city, state, or county that you want to fetch data from
-    feature = "highway"
-    filename = "Street_POI_coordinate_data.txt"
-    try:
-        print(f"Fetching OSM data for {area_name}...")
-        osm_data = get_osm_data(area_name, feature)
-        print("Parsing OSM data...")
-        streets, pois, natural_features, fuel_stations = parse_osm_data(osm_data)
-        print(f"Saving data to {filename}...")
-        save_to_txt(streets, pois, natural_features, fuel_stations, filename)
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data from Overpass API: {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-
-if __name__ == "__main__":
-    main()
+"""
+this script is designed to get all the coordinates for the streets and points of interest in whatever place 
+you enter, can be a city,state,or county. recomended that to keep it either on the city or county level.
+set up to find the centriod of a road but the script can be modified to get indivual addresses.
+coordiates that dont have names will not get outputted. the coordinate will always be put inside a road.
+the simplified road geometries and the points where named roads cross are also saved to a binary file
+that the flagger uses to place "road a and road b" at the intersection instead of at two centroids.
+
+"""
+import os
+import sys
+import time
+import requests
+from shapely.geometry import LineString
+from shapely.ops import nearest_points
+from shapely.strtree import STRtree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from street_geometry import GEOMETRY_FILE, write_street_geometries, IntersectionTable
+
+SIMPLIFY_TOLERANCE = 0.00005  # Degrees, roughly 5 meters
+INTERSECTION_MERGE_DISTANCE = 0.0003  # Degrees, crossings of the same two roads closer than ~30 meters are one intersection
+
+def get_osm_data(area_name, feature):
+    overpass_url = "http://overpass-api.de/api/interpreter"
+    overpass_query = f"""
+    [out:json];
+    area["name"="{area_name}"]->.searchArea;
+    (
+      way["{feature}"](area.searchArea);
+      node["tourism"]["name"](area.searchArea);
+      node["natural"]["name"](area.searchArea);
+      node["amenity"="fuel"]["name"](area.searchArea);
+    );
+    out body geom;
+    """
+    print(f"Sending request to Overpass API for {area_name}...")
+    response = requests.get(overpass_url, params={'data': overpass_query})
+    print(f"Response status code: {response.status_code}")
+    response.raise_for_status()
+    data = response.json()
+    print(f"Received {len(data.get('elements', []))} elements from API")
+    return data
+
+def parse_osm_data(osm_data):
+    streets = {}
+    geometries = {}
+    pois = []
+    natural_features = []
+    fuel_stations = []
+
+    for element in osm_data.get('elements', []):
+        name = element['tags'].get('name')
+        if name and name != 'Unnamed':
+            # Add a space at the beginning of the name
+            name = " " + name
+
+            if element['type'] == 'way' and 'highway' in element['tags']:
+                # Roads are split into many ways in OSM, keep every way's geometry for the intersections
+                way = LineString([(point['lon'], point['lat']) for point in element['geometry']])
+                geometries.setdefault(name, []).append(way)
+                if name not in streets:
+                    geometry = way
+                    centroid = geometry.centroid
+                    
+                    # Ensure the centroid is inside the geometry
+                    if not geometry.contains(centroid):
+                        # Find the nearest point on the geometry to the centroid
+                        nearest_point = nearest_points(geometry, centroid)[0]
+                        centroid = nearest_point  # Move centroid to the nearest point inside
+
+                    streets[name] = (centroid.x, centroid.y)
+
+            elif element['type'] == 'node':
+                item = {
+                    'name': name,
+                    'lon': element['lon'],
+                    'lat': element['lat']
+                }
+
+                if 'tourism' in element['tags']:
+                    pois.append(item)
+                elif 'natural' in element['tags']:
+                    natural_features.append(item)
+                elif element['tags'].get('amenity') == 'fuel':
+                    fuel_stations.append(item)
+
+    unique_streets = [{
+        'name': name,
+        'lon': lon,
+        'lat': lat
+    } for name, (lon, lat) in streets.items()]
+
+    print(f"Parsed {len(unique_streets)} unique streets, {len(pois)} POIs, {len(natural_features)} natural features, and {len(fuel_stations)} fuel stations from OSM data")
+    return unique_streets, pois, natural_features, fuel_stations, geometries
+
+def find_intersections(geometries):
+    """Returns (name_a, name_b, lon, lat) for every point where two differently named roads meet.
+
+    An STRtree over all ways prunes the candidate pairs to ways whose bounding boxes overlap. The
+    full ways are used so roads that share a node still touch after simplification would move it.
+    """
+    names = []
+    lines = []
+    for name, ways in geometries.items():
+        for way in ways:
+            names.append(name)
+            lines.append(way)
+    tree = STRtree(lines)
+    points = {}
+    for index, line in enumerate(lines):
+        for other_index in tree.query(line, predicate='intersects'):
+            if other_index <= index or names[other_index] == names[index]:
+                continue
+            pair = tuple(sorted((names[index], names[other_index])))
+            crossing = line.intersection(lines[other_index])
+            for point in getattr(crossing, 'geoms', [crossing]):
+                if point.is_empty:
+                    continue
+                point = point.centroid  # Overlapping segments intersect as lines
+                known = points.setdefault(pair, [])
+                if all(point.distance(other) > INTERSECTION_MERGE_DISTANCE for other in known):
+                    known.append(point)
+    return [(name_a, name_b, point.x, point.y) for (name_a, name_b), pair_points in points.items() for point in pair_points]
+
+def report_intersection_accuracy(streets, intersections):
+    """Prints how far the old centroid-based location was from the real intersections, and the lookup time."""
+    centroids = {street['name']: (street['lon'], street['lat']) for street in streets}
+    errors = []
+    for name_a, name_b, lon, lat in intersections:
+        if name_a in centroids and name_b in centroids:
+            mid_lon = (centroids[name_a][0] + centroids[name_b][0]) / 2
+            mid_lat = (centroids[name_a][1] + centroids[name_b][1]) / 2
+            errors.append(LineString([(mid_lon, mid_lat), (lon, lat)]).length * 111000)  # Rough meters at this scale
+    if errors:
+        errors.sort()
+        print(f"Centroid midpoint error vs real intersection: median {errors[len(errors) // 2]:.0f} m, 95th percentile {errors[int(len(errors) * 0.95)]:.0f} m")
+    table = IntersectionTable(intersections)
+    pairs = [(name_a, name_b) for name_a, name_b, _, _ in intersections[:10000]]
+    if pairs:
+        start_time = time.perf_counter()
+        for name_a, name_b in pairs:
+            table.lookup(name_a, name_b)
+        print(f"Intersection lookup: {(time.perf_counter() - start_time) * 1e6 / len(pairs):.1f} us per street pair")
+
+def save_to_txt(streets, pois, natural_features, fuel_stations, filename):
+    with open(filename, 'w') as file:
+        for street in streets:
+            file.write(f'"{street["name"]}",({street["lon"]}, {street["lat"]})\n')
+        for poi in pois:
+            file.write(f'"{poi["name"]}",({poi["lon"]}, {poi["lat"]})\n')
+        for natural_feature in natural_features:
+            file.write(f'"{natural_feature["name"]}",({natural_feature["lon"]}, {natural_feature["lat"]})\n')
+        for fuel_station in fuel_stations:
+            file.write(f'"{fuel_station["name"]}",({fuel_station["lon"]}, {fuel_station["lat"]})\n')
+
+    print(f"TXT file '{filename}' has been created.")
+
+def main():
+    area_name = "Okaloosa County"  # Change this to the city, state, or county that you want to fetch data from
+    feature = "highway"
+    filename = "Street_POI_coordinate_data.txt"
+    geometry_filename = GEOMETRY_FILE  # Next to keywords.py, where the flagger reads it
+    try:
+        print(f"Fetching OSM data for {area_name}...")
+        osm_data = get_osm_data(area_name, feature)
+        print("Parsing OSM data...")
+        streets, pois, natural_features, fuel_stations, geometries = parse_osm_data(osm_data)
+        print(f"Saving data to {filename}...")
+        save_to_txt(streets, pois, natural_features, fuel_stations, filename)
+        print("Finding intersections...")
+        intersections = find_intersections(geometries)
+        print(f"Found {len(intersections)} intersections, saving geometries to {geometry_filename}...")
+        write_street_geometries(geometry_filename, {name: [list(way.simplify(SIMPLIFY_TOLERANCE).coords) for way in ways] for name, ways in geometries.items()}, intersections)
+        report_intersection_accuracy(streets, intersections)
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching data from Overpass API: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+    SQLite FTS5 full-text index over transcriptions.csv, so names, plates and unit numbers can be
+    searched without scanning the whole CSV. The TranscriptionWriter adds each flushed batch of
+    final rows, and on startup indexes whatever the CSV gained since the last indexed byte offset.
+
+    Run directly to search it, e.g.
+        python transcript_index.py --phrase "shots fired" --since 2024-03-01
+        python transcript_index.py --prefix ABC12 --hours 24
+        python transcript_index.py "unit 12" eglin
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import time
+from datetime import datetime
+from transcription_log import read_committed_lines, parse_transcription_row
+from recording_paths import wall_clock_epoch
+
+class TranscriptIndex:
+    """Full-text index of final transcription rows with their clip times."""
+
+    def __init__(self, db_path):
+        """Opens (and creates if needed) the index database. The writer thread adds rows, so it isn't bound to one thread."""
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS transcripts (
+                id INTEGER PRIMARY KEY,
+                clip_id TEXT NOT NULL,
+                epoch INTEGER,
+                transcription TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS transcripts_epoch ON transcripts(epoch);
+            CREATE VIRTUAL TABLE IF NOT EXISTS transcript_text USING fts5(
+                transcription, content='transcripts', content_rowid='id', tokenize="unicode61 tokenchars '-'"
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self.connection.commit()
+
+    def indexed_offset(self):
+        """Returns the byte offset of transcriptions.csv up to which rows are indexed."""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'indexed_offset'").fetchone()
+        return int(row[0]) if row else 0
+
+    def move_offset(self, shift):
+        """Moves the indexed offset after the rows of the CSV moved by shift bytes, see TranscriptionWriter.migrate_header."""
+        with self.connection:
+            self.connection.execute("UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'indexed_offset'", (shift,))
+
+    def add_rows(self, rows, offset):
+        """Indexes CSV rows ending at the given byte offset of the CSV. Provisional rows are skipped.
+
+        Returns how many rows were indexed.
+        """
+        count = 0
+        with self.connection:
+            for record in map(parse_transcription_row, rows):
+                if not record.valid or record.timestamp == "Timestamp" or record.provisional:
+                    continue
+                cursor = self.connection.execute(
+                    "INSERT INTO transcripts (clip_id, epoch, transcription) VALUES (?, ?, ?)",
+                    (record.clip_id, record.epoch, record.transcription),
+                )
+                self.connection.execute("INSERT INTO transcript_text (rowid, transcription) VALUES (?, ?)", (cursor.lastrowid, record.transcription))
+                count += 1
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('indexed_offset', ?)", (str(offset),))
+        return count
+
+    def catch_up(self, csv_file, batch_rows=5000):
+        """Indexes the committed rows the CSV gained since the indexed offset. Returns how many rows were indexed."""
+        offset = self.indexed_offset()
+        if not os.path.exists(csv_file) or os.path.getsize(csv_file) < offset:
+            return 0
+        lines = []
+        count = 0
+        for line in read_committed_lines(csv_file, offset):
+            lines.append(line)
+            offset += len(line.encode('utf-8'))
+            if len(lines) >= batch_rows:
+                count += self.add_rows(csv.reader(lines), offset)
+                lines = []
+        return count + self.add_rows(csv.reader(lines), offset)
+
+    def search(self, query, since=None, until=None, limit=50):
+        """Returns (clip_id, epoch, transcription) of rows matching an FTS5 query, latest indexed first.
+
+        since and until limit the clip start epochs, see recording_paths.clip_start_epoch. Rows are
+        indexed in the order they are transcribed, which is close to clip order, and walking the
+        full-text index in that order lets a common word stop at the limit instead of sorting
+        every match.
+        """
+        since = since if since is not None else -2**63
+        until = until if until is not None else 2**63 - 1
+        return self.connection.execute("""
+            SELECT transcripts.clip_id, transcripts.epoch, transcripts.transcription
+            FROM transcript_text JOIN transcripts ON transcripts.id = transcript_text.rowid
+            WHERE transcript_text MATCH ? AND transcripts.epoch BETWEEN ? AND ?
+            ORDER BY transcript_text.rowid DESC LIMIT ?""", (query, since, until, limit)).fetchall()
+
+    def close(self):
+        self.connection.close()
+
+def quote_term(term):
+    """Quotes a term for an FTS5 query so characters like "-" are taken literally."""
+    return '"' + term.replace('"', '""') + '"'
+
+def build_query(words=(), phrases=(), prefixes=()):
+    """Builds an FTS5 query that needs every word, every phrase and a token starting with every prefix."""
+    terms = [quote_term(word) for word in words]
+    terms += [quote_term(phrase) for phrase in phrases]
+    terms += [quote_term(prefix) + "*" for prefix in prefixes]
+    return " AND ".join(terms)
+
+def parse_time(value):
+    """Parses "YYYY-mm-dd" or "YYYY-mm-dd HH:MM" into the clip start epoch seconds."""
+    for time_format in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return wall_clock_epoch(datetime.strptime(value, time_format))
+        except ValueError:
+            continue
+    raise argparse.ArgumentTypeError(f"Expected YYYY-mm-dd or YYYY-mm-dd HH:MM, got {value!r}")
+
+def main():
+    input_directory = r"D:\Police_audio_recordings"
+    parser = argparse.ArgumentParser(description="Search the transcriptions.")
+    parser.add_argument("words", nargs="*", help="Words that must all appear")
+    parser.add_argument("--phrase", action="append", default=[], help="Exact phrase, can be given more than once")
+    parser.add_argument("--prefix", action="append", default=[], help="Word prefix such as part of a plate, can be given more than once")
+    parser.add_argument("--since", type=parse_time, help="YYYY-mm-dd[ HH:MM]")
+    parser.add_argument("--until", type=parse_time, help="YYYY-mm-dd[ HH:MM]")
+    parser.add_argument("--hours", type=float, help="Only the last N hours")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--db", default=os.path.join(input_directory, "transcripts.db"))
+    args = parser.parse_args()
+
+    query = build_query(args.words, args.phrase, args.prefix)
+    if not query:
+        parser.error("Give at least one word, --phrase or --prefix")
+    since = wall_clock_epoch() - args.hours * 3600 if args.hours else args.since
+    index = TranscriptIndex(args.db)
+    start_time = time.perf_counter()
+    results = index.search(query, since, args.until, args.limit)
+    elapsed = (time.perf_counter() - start_time) * 1000
+    for clip_id, _, transcription in results:
+        print(f"{clip_id} | {transcription.strip()}")
+    print(f"{len(results)} results in {elapsed:.1f} ms")
+    index.close()
+
+if __name__ == "__main__":
+    main()
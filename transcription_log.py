@@ -0,0 +1,271 @@
+"""
+    Single writer and committed-offset reader for transcriptions.csv. The transcriber hands
+    rows to a TranscriptionWriter which batches them and, after each flush, publishes the byte
+    offset of the last complete row in a small marker file next to the CSV. Readers stop at
+    that offset so they never see a half-written last line.
+
+    Readers get each row parsed once into a TranscriptionRow, clip start included, so no later
+    stage splits fields or parses the clip name again.
+
+    The Status column says whether a row is final, provisional (a window of a long clip still
+    being transcribed) or error (the transcription failed after provisional rows were written).
+    A final or error row supersedes the clip's provisional rows. Files from before the column have
+    their header brought up to date once, by the writer on start.
+"""
+import csv
+import io
+import os
+import shutil
+import threading
+import time
+from collections import namedtuple
+from queue import Queue, Empty
+from recording_paths import clip_start_epoch
+from output_publisher import replace_file
+
+# A transcriptions.csv row. epoch is the clip start, see recording_paths.clip_start_epoch. Rows with
+# fewer than four fields are kept with valid False because the flagger's nearby-row windows count them,
+# error rows are valid False as well
+TranscriptionRow = namedtuple("TranscriptionRow", ["timestamp", "clip_id", "transcription", "model", "epoch", "provisional", "valid"])
+INVALID_ROW = TranscriptionRow("", "", "", "", None, False, False)
+
+def committed_marker_path(csv_file):
+    """Returns the path of the marker file holding the committed byte offset of the CSV."""
+    return csv_file + ".committed"
+
+def read_committed_offset(csv_file):
+    """Returns the committed byte offset of the CSV, or None when no marker has been published."""
+    try:
+        with open(committed_marker_path(csv_file), 'r', encoding='utf-8') as marker:
+            return int(marker.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def read_committed_lines(csv_file, start_offset=0, end_offset=None):
+    """Yields the decoded lines of the CSV up to the committed offset, for use with csv.reader.
+
+    Files written before the marker existed have no marker and are read to the end. end_offset
+    reads up to an offset published earlier instead, so two passes see the same rows.
+    """
+    if end_offset is None:
+        end_offset = read_committed_offset(csv_file)
+    with open(csv_file, 'rb') as infile:
+        infile.seek(start_offset)
+        position = start_offset
+        for line in infile:
+            position += len(line)
+            if end_offset is not None and position > end_offset:
+                break
+            yield line.decode('utf-8')
+
+def complete_rows_end(infile, start, end):
+    """Returns the offset just past the last complete CSV row between start and end of a binary file.
+
+    A row cut short by a crash has no line ending yet, or stops inside a quoted field, so the cut
+    is moved back a line at a time until everything before it parses.
+    """
+    infile.seek(start)
+    data = infile.read(end - start)
+    cut = data.rfind(b'\n') + 1
+    while cut > 0:
+        try:
+            for _ in csv.reader(io.StringIO(data[:cut].decode('utf-8'), newline=''), strict=True):
+                pass
+            break
+        except (csv.Error, UnicodeDecodeError):
+            cut = data.rfind(b'\n', 0, cut - 1) + 1
+    return start + cut
+
+def row_status(row):
+    """Returns the Status of a CSV row, "final" for rows from before the column existed."""
+    return row[6] if len(row) > 6 else "final"
+
+def parse_transcription_row(row):
+    """Parses a CSV row of transcriptions.csv into a TranscriptionRow."""
+    if len(row) < 4:
+        return INVALID_ROW
+    status = row_status(row)
+    return TranscriptionRow(row[0], row[1], row[2], row[3], clip_start_epoch(row[1]), status == "provisional", status != "error")
+
+def read_transcription_rows(csv_file, start_offset=0, end_offset=None):
+    """Yields the committed rows of the CSV as TranscriptionRows, skipping the header when reading from the start."""
+    reader = csv.reader(read_committed_lines(csv_file, start_offset, end_offset))
+    if start_offset == 0:
+        next(reader, None)
+    for row in reader:
+        yield parse_transcription_row(row)
+
+def read_current_rows(csv_file):
+    """Yields the committed TranscriptionRows, leaving out error rows and provisional rows superseded by a final or error row.
+
+    The transcriber writes a clip's final row after its provisional rows, so a first pass that only
+    remembers clips with provisional rows finds the superseded ones without holding the whole CSV.
+    """
+    end_offset = read_committed_offset(csv_file)
+    provisional_clips = set()
+    superseded_clips = set()
+    reader = csv.reader(read_committed_lines(csv_file, 0, end_offset))
+    next(reader, None)
+    for row in reader:
+        if row_status(row) == "provisional":
+            provisional_clips.add(row[1])
+        elif len(row) >= 4 and row[1] in provisional_clips:
+            superseded_clips.add(row[1])
+    for record in read_transcription_rows(csv_file, 0, end_offset):
+        if not record.valid and record.clip_id:
+            continue  # An error row, it only supersedes
+        if not (record.provisional and record.clip_id in superseded_clips):
+            yield record
+
+class TranscriptionWriter:
+    """Owns all writes to the transcription CSV, batching rows on a background thread."""
+
+    def __init__(self, csv_file, header, flush_rows=20, flush_seconds=2.0, index=None, tracer=None):
+        """Opens the CSV for appending, writing the header when the file is new.
+
+        index is an optional transcript_index.TranscriptIndex kept up to date with the committed rows,
+        tracer an optional clip_tracing.ClipTracer told when each final row is committed.
+        """
+        self.csv_file = csv_file
+        self.index = index
+        self.tracer = tracer
+        self.flush_rows = flush_rows  # Flush once this many rows are waiting
+        self.flush_seconds = flush_seconds  # Or once the oldest waiting row is this old
+        self.queue = Queue()
+        self.outfile = self.open_csv(header)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def open_csv(self, header):
+        """Opens the CSV, dropping a half-written last row left over from a crash.
+
+        The marker may lag behind rows that were already synced, when a reader kept it from being
+        replaced, so only what follows the last complete row is dropped, never whole rows.
+        """
+        if not os.path.exists(self.csv_file):
+            outfile = open(self.csv_file, 'wb')
+            self.write_rows(outfile, [header])
+            self.publish_offset(outfile.tell())
+            return outfile
+        outfile = open(self.csv_file, 'r+b')
+        committed = read_committed_offset(self.csv_file)
+        size = outfile.seek(0, os.SEEK_END)
+        if committed is not None and committed < size:
+            complete = complete_rows_end(outfile, min(committed, size), size)
+            if complete < size:
+                print(f"Dropping {size - complete} bytes of a half-written row from {self.csv_file}")
+                outfile.truncate(complete)
+        elif committed is None and size:
+            # A file from before the marker existed, make sure the next row starts on a new line
+            outfile.seek(size - 1)
+            if outfile.read(1) not in (b'\n', b'\r'):
+                outfile.write(b'\r\n')
+        outfile = self.migrate_header(outfile, header)
+        outfile.seek(0, os.SEEK_END)
+        self.publish_offset(outfile.tell())
+        return outfile
+
+    def migrate_header(self, outfile, header):
+        """Rewrites the header of a CSV from before the last columns were added, once. Returns the file to append to.
+
+        Every reader takes fields by position, but a tool reading by column name would miss the
+        Status of the new rows. All rows move by the same number of bytes, so the transcript index
+        offset is moved with them. While a reader holds the CSV open the old header stays until
+        the next start.
+        """
+        outfile.seek(0)
+        header_line = outfile.readline()
+        old_header = next(csv.reader([header_line.decode('utf-8')]), [])
+        if not old_header or len(old_header) >= len(header) or old_header != header[:len(old_header)]:
+            return outfile
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(header)
+        new_header_line = buffer.getvalue().encode('utf-8')
+        temp_file = self.csv_file + ".tmp"
+        with open(temp_file, 'wb') as temp:
+            temp.write(new_header_line)
+            shutil.copyfileobj(outfile, temp)
+            temp.flush()
+            os.fsync(temp.fileno())
+        outfile.close()
+        if not replace_file(temp_file, self.csv_file):
+            os.remove(temp_file)
+            print(f"Could not rewrite the header of {self.csv_file}, trying again on the next start")
+            return open(self.csv_file, 'r+b')
+        if self.index is not None and self.index.indexed_offset():
+            self.index.move_offset(len(new_header_line) - len(header_line))
+        print(f"Added the {', '.join(header[len(old_header):])} column to the header of {self.csv_file}")
+        return open(self.csv_file, 'r+b')
+
+    def write_row(self, row):
+        """Queues a row for the next flush. Never blocks on disk."""
+        self.queue.put(row)
+
+    def run(self):
+        """Collects queued rows and flushes them when either threshold is reached."""
+        if self.index is not None:
+            caught_up = self.index.catch_up(self.csv_file)
+            if caught_up:
+                print(f"Indexed {caught_up} earlier rows of {self.csv_file}")
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                row = self.queue.get(timeout=timeout)
+            except Empty:
+                row = False
+            if row is None:
+                break
+            if row is not False:
+                batch.append(row)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_seconds
+            if batch and (len(batch) >= self.flush_rows or time.monotonic() >= deadline):
+                self.flush(batch)
+                batch = []
+                deadline = None
+        if batch:
+            self.flush(batch)
+
+    def flush(self, batch):
+        """Appends a batch of rows, syncs it to disk and then publishes the new committed offset."""
+        self.write_rows(self.outfile, batch)
+        self.publish_offset(self.outfile.tell())
+        if self.index is not None:
+            self.index.add_rows(batch, self.outfile.tell())
+        if self.tracer is not None:
+            self.tracer.record_many([row[1] for row in batch if row_status(row) == "final"], "csv_commit")
+
+    def write_rows(self, outfile, rows):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        outfile.write(buffer.getvalue().encode('utf-8'))
+        outfile.flush()
+        os.fsync(outfile.fileno())
+
+    def publish_offset(self, offset):
+        """Atomically replaces the marker file with the new committed offset.
+
+        While a reader holds the marker open on Windows the rename is retried for a moment, and
+        after that the marker is rewritten in place, so it never stays behind the synced rows.
+        """
+        marker_file = committed_marker_path(self.csv_file)
+        temp_file = marker_file + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as marker:
+            marker.write(str(offset))
+        if replace_file(temp_file, marker_file):
+            return
+        os.remove(temp_file)
+        with open(marker_file, 'r+', encoding='utf-8') as marker:
+            # Written before truncating, a reader never finds the marker empty
+            marker.write(str(offset))
+            marker.truncate()
+            marker.flush()
+            os.fsync(marker.fileno())
+
+    def close(self):
+        """Flushes the remaining rows and closes the CSV."""
+        self.queue.put(None)
+        self.thread.join()
+        self.outfile.close()